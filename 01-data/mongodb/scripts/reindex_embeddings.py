@@ -18,6 +18,8 @@ Environment Variables:
     MONGODB_URI - MongoDB connection string
     EMBEDDING_MODEL - Embedding model to use (default: qwen3-embedding:4b)
     EMBEDDING_BASE_URL - Embedding API base URL (default: http://localhost:11434/v1)
+    EMBEDDING_STORAGE - Chunk embedding storage: float, float32, int8 or binary (default: float)
+    EMBEDDING_KEEP_FULL_PRECISION - Keep a float32 copy for quantized storage (default: true)
 """
 
 import argparse
@@ -27,9 +29,10 @@ import os
 import sys
 from pathlib import Path
 
-# Add project root to path
+# Add project root and lambda server to path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "04-lambda"))
 
 # Load environment
 try:
@@ -43,6 +46,10 @@ except ImportError:
 
 from datetime import datetime
 
+from app.capabilities.retrieval.mongo_rag.quantization import (
+    FULL_PRECISION_FIELD,
+    encode_embedding,
+)
 from openai import AsyncOpenAI
 from pymongo import MongoClient
 
@@ -54,6 +61,8 @@ MONGODB_URI = os.getenv("MONGODB_URI") or os.getenv(
 DATABASE_NAME = os.getenv("MONGODB_DATABASE", "rag_db")
 EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "qwen3-embedding:4b")
 EMBEDDING_BASE_URL = os.getenv("EMBEDDING_BASE_URL", "http://localhost:11434/v1")
+EMBEDDING_STORAGE = os.getenv("EMBEDDING_STORAGE", "float")
+EMBEDDING_KEEP_FULL_PRECISION = os.getenv("EMBEDDING_KEEP_FULL_PRECISION", "true").lower() == "true"
 BATCH_SIZE = 10  # Process in batches to avoid memory issues
 
 logging.basicConfig(
@@ -101,6 +110,7 @@ async def reindex_chunks(
     logger.info(f"Database: {DATABASE_NAME}")
     logger.info(f"Embedding Model: {EMBEDDING_MODEL}")
     logger.info(f"Embedding URL: {EMBEDDING_BASE_URL}")
+    logger.info(f"Embedding Storage: {EMBEDDING_STORAGE}")
     logger.info(f"Batch Size: {batch_size}")
     if dry_run:
         logger.info("DRY RUN MODE - No updates will be made")
@@ -207,18 +217,21 @@ async def process_batch(
                 logger.debug(f"Would update chunk {chunk_id} with {len(embedding)}-dim embedding")
                 results["updated"] += 1
             else:
-                # Update chunk with new embedding
-                collection.update_one(
-                    {"_id": chunk_id},
-                    {
-                        "$set": {
-                            "embedding": embedding,
-                            "metadata.embedding_model": EMBEDDING_MODEL,
-                            "metadata.embedding_generated_at": datetime.now().isoformat(),
-                            "metadata.embedding_dimensions": len(embedding),
-                        }
-                    },
+                # Update chunk with new embedding (in the configured storage format)
+                embedding_fields = encode_embedding(
+                    embedding, EMBEDDING_STORAGE, EMBEDDING_KEEP_FULL_PRECISION
                 )
+                update = {
+                    "$set": {
+                        **embedding_fields,
+                        "metadata.embedding_model": EMBEDDING_MODEL,
+                        "metadata.embedding_generated_at": datetime.now().isoformat(),
+                        "metadata.embedding_dimensions": len(embedding),
+                    }
+                }
+                if FULL_PRECISION_FIELD not in embedding_fields:
+                    update["$unset"] = {FULL_PRECISION_FIELD: ""}
+                collection.update_one({"_id": chunk_id}, update)
                 results["updated"] += 1
 
         except Exception as e:
@@ -18,6 +18,10 @@
 // Configuration
 const DATABASE_NAME = "rag_db";
 const EMBEDDING_DIMENSIONS = 2560;  // Qwen3-Embedding-4B uses 2560 dimensions
+// Must match EMBEDDING_STORAGE on the lambda server (float, float32, int8 or binary).
+// Packed-bit (binary) vectors only support euclidean similarity.
+const EMBEDDING_STORAGE = "float";
+const CHUNK_VECTOR_SIMILARITY = EMBEDDING_STORAGE === "binary" ? "euclidean" : "cosine";
 
 // Index definitions
 const INDEXES = [
@@ -30,7 +34,7 @@ const INDEXES = [
                 type: "vector",
                 path: "embedding",
                 numDimensions: EMBEDDING_DIMENSIONS,
-                similarity: "cosine"
+                similarity: CHUNK_VECTOR_SIMILARITY
             }]
         }
     },
@@ -39,12 +43,58 @@ const INDEXES = [
         name: "text_index",
         type: "search",
         definition: {
+            analyzers: [
+                {
+                    // Keeps snake_case, dotted.names and $operators as single tokens
+                    name: "code_tokens",
+                    tokenizer: {
+                        type: "regexSplit",
+                        pattern: "[^\\w$.]+"
+                    },
+                    tokenFilters: [
+                        {
+                            type: "regex",
+                            pattern: "^\\.+|\\.+$",
+                            replacement: "",
+                            matches: "all"
+                        },
+                        {
+                            type: "lowercase"
+                        }
+                    ]
+                }
+            ],
             mappings: {
                 dynamic: false,
                 fields: {
                     content: {
                         type: "string",
-                        analyzer: "lucene.standard"
+                        analyzer: "lucene.standard",
+                        multi: {
+                            code: {
+                                type: "string",
+                                analyzer: "code_tokens"
+                            }
+                        }
+                    },
+                    metadata: {
+                        type: "document",
+                        dynamic: false,
+                        fields: {
+                            title: [
+                                {
+                                    type: "string",
+                                    analyzer: "lucene.standard"
+                                },
+                                {
+                                    type: "autocomplete",
+                                    tokenization: "edgeGram",
+                                    minGrams: 2,
+                                    maxGrams: 15,
+                                    foldDiacritics: true
+                                }
+                            ]
+                        }
                     }
                 }
             }
@@ -20,6 +20,7 @@ Environment Variables:
     MONGODB_URI - MongoDB connection string (default: from .env or localhost)
     MONGODB_DATABASE - Target database (default: rag_db)
     EMBEDDING_DIMENSIONS - Embedding vector dimensions (default: 768 for qwen3-embedding:4b)
+    EMBEDDING_STORAGE - Chunk embedding storage: float, float32, int8 or binary (default: float)
 """
 
 import logging
@@ -65,6 +66,12 @@ DATABASE_NAME = os.getenv("MONGODB_DATABASE", "rag_db")
 #   - qwen3-embedding:4b = 768 dimensions
 # IMPORTANT: If you change embedding models, you must re-index all data
 EMBEDDING_DIMENSIONS = int(os.getenv("EMBEDDING_DIMENSIONS", "2560"))
+# Chunk embedding storage MUST match EMBEDDING_STORAGE on the lambda server.
+# float, float32 and int8 vectors use cosine similarity; packed-bit (binary)
+# vectors only support euclidean (Hamming) similarity, and numDimensions counts bits.
+# Convert existing chunks with quantize_embeddings.py when changing it.
+EMBEDDING_STORAGE = os.getenv("EMBEDDING_STORAGE", "float")
+CHUNK_VECTOR_SIMILARITY = "euclidean" if EMBEDDING_STORAGE == "binary" else "cosine"
 
 # Index definitions
 INDEX_DEFINITIONS = [
@@ -78,7 +85,7 @@ INDEX_DEFINITIONS = [
                     "type": "vector",
                     "path": "embedding",
                     "numDimensions": EMBEDDING_DIMENSIONS,
-                    "similarity": "cosine",
+                    "similarity": CHUNK_VECTOR_SIMILARITY,
                 }
             ]
         },
@@ -88,10 +95,48 @@ INDEX_DEFINITIONS = [
         "name": "text_index",
         "type": "search",
         "definition": {
+            "analyzers": [
+                {
+                    # Keeps snake_case, dotted.names and $operators as single tokens
+                    "name": "code_tokens",
+                    "tokenizer": {"type": "regexSplit", "pattern": "[^\\w$.]+"},
+                    "tokenFilters": [
+                        {
+                            "type": "regex",
+                            "pattern": "^\\.+|\\.+$",
+                            "replacement": "",
+                            "matches": "all",
+                        },
+                        {"type": "lowercase"},
+                    ],
+                }
+            ],
             "mappings": {
                 "dynamic": False,
-                "fields": {"content": {"type": "string", "analyzer": "lucene.standard"}},
-            }
+                "fields": {
+                    "content": {
+                        "type": "string",
+                        "analyzer": "lucene.standard",
+                        "multi": {"code": {"type": "string", "analyzer": "code_tokens"}},
+                    },
+                    "metadata": {
+                        "type": "document",
+                        "dynamic": False,
+                        "fields": {
+                            "title": [
+                                {"type": "string", "analyzer": "lucene.standard"},
+                                {
+                                    "type": "autocomplete",
+                                    "tokenization": "edgeGram",
+                                    "minGrams": 2,
+                                    "maxGrams": 15,
+                                    "foldDiacritics": True,
+                                },
+                            ]
+                        },
+                    },
+                },
+            },
         },
     },
     {
@@ -149,6 +194,29 @@ def get_search_indexes(collection) -> list[dict]:
         return []
 
 
+def get_index_definition(collection, index_name: str) -> dict | None:
+    """Get the latest definition of a search index."""
+    for idx in get_search_indexes(collection):
+        if idx.get("name") == index_name:
+            return idx.get("latestDefinition")
+    return None
+
+
+def definition_matches(desired, existing) -> bool:
+    """Check that every setting in the desired definition is present in the existing one."""
+    if isinstance(desired, dict):
+        return isinstance(existing, dict) and all(
+            definition_matches(value, existing.get(key)) for key, value in desired.items()
+        )
+    if isinstance(desired, list):
+        return (
+            isinstance(existing, list)
+            and len(desired) == len(existing)
+            and all(definition_matches(d, e) for d, e in zip(desired, existing, strict=True))
+        )
+    return desired == existing
+
+
 def index_exists(collection, index_name: str) -> bool:
     """Check if a search index exists."""
     indexes = get_search_indexes(collection)
@@ -200,6 +268,7 @@ def setup_search_indexes(
     uri: str = MONGODB_URI,
     database: str = DATABASE_NAME,
     wait_for_ready: bool = True,
+    update_existing: bool = False,
 ) -> dict:
     """
     Set up all required search indexes.
@@ -208,17 +277,20 @@ def setup_search_indexes(
         uri: MongoDB connection string
         database: Target database name
         wait_for_ready: Whether to wait for indexes to be READY
+        update_existing: Update existing indexes whose definition differs
+                        (e.g. after changing EMBEDDING_STORAGE); they rebuild in place
 
     Returns:
         Dict with counts of created, skipped, and failed indexes
     """
-    results = {"created": 0, "skipped": 0, "errors": 0, "indexes": []}
+    results = {"created": 0, "updated": 0, "skipped": 0, "errors": 0, "indexes": []}
 
     logger.info("=" * 60)
     logger.info("MongoDB Atlas Search Index Setup")
     logger.info("=" * 60)
     logger.info(f"Database: {database}")
     logger.info(f"Embedding dimensions: {EMBEDDING_DIMENSIONS}")
+    logger.info(f"Embedding storage: {EMBEDDING_STORAGE} ({CHUNK_VECTOR_SIMILARITY} similarity)")
 
     # Connect to MongoDB
     try:
@@ -245,6 +317,24 @@ def setup_search_indexes(
 
         # Check if index already exists
         if index_exists(collection, index_name):
+            existing = get_index_definition(collection, index_name)
+            if update_existing and not definition_matches(index_def["definition"], existing):
+                logger.info("  Definition changed, updating index (it rebuilds in place)")
+                try:
+                    collection.update_search_index(index_name, index_def["definition"])
+                except OperationFailure as e:
+                    logger.error(f"  ✗ Failed to update index: {e}")
+                    results["errors"] += 1
+                    results["indexes"].append(
+                        {"name": index_name, "collection": collection_name, "status": "error"}
+                    )
+                    continue
+                results["updated"] += 1
+                results["indexes"].append(
+                    {"name": index_name, "collection": collection_name, "status": "updated"}
+                )
+                continue
+
             logger.info("  ✓ Index already exists, skipping")
             results["skipped"] += 1
             results["indexes"].append(
@@ -295,6 +385,7 @@ def setup_search_indexes(
     logger.info("Summary")
     logger.info("=" * 60)
     logger.info(f"Created: {results['created']}")
+    logger.info(f"Updated: {results['updated']}")
     logger.info(f"Skipped (already exist): {results['skipped']}")
     logger.info(f"Errors: {results['errors']}")
 
@@ -376,6 +467,11 @@ if __name__ == "__main__":
         action="store_true",
         help="Don't wait for indexes to be ready",
     )
+    parser.add_argument(
+        "--update-existing",
+        action="store_true",
+        help="Update existing indexes whose definition changed (e.g. EMBEDDING_STORAGE)",
+    )
     args = parser.parse_args()
 
     if args.verify_only:
@@ -392,5 +488,7 @@ if __name__ == "__main__":
             print("\n✗ Some indexes are not ready")
             sys.exit(1)
     else:
-        results = setup_search_indexes(wait_for_ready=not args.no_wait)
+        results = setup_search_indexes(
+            wait_for_ready=not args.no_wait, update_existing=args.update_existing
+        )
         sys.exit(0 if results["errors"] == 0 else 1)
@@ -0,0 +1,52 @@
+-- ============================================================================
+-- Migration: 013_preference_change_notify
+-- Description: NOTIFY preferences_changed on preference writes, so every Lambda
+--              worker can invalidate its cached resolved preferences
+-- Created: 2026-10-18
+-- ============================================================================
+
+-- Payloads: 'user:<user_id>', 'organization:<organization_id>' or 'system'
+-- (a definition changed, which affects every user)
+CREATE OR REPLACE FUNCTION notify_preference_change()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_row RECORD;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        v_row := OLD;
+    ELSE
+        v_row := NEW;
+    END IF;
+
+    IF TG_TABLE_NAME = 'user_preferences' THEN
+        PERFORM pg_notify('preferences_changed', 'user:' || v_row.user_id);
+    ELSIF TG_TABLE_NAME = 'organization_preferences' THEN
+        PERFORM pg_notify('preferences_changed', 'organization:' || v_row.organization_id);
+    ELSE
+        PERFORM pg_notify('preferences_changed', 'system');
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION notify_preference_change IS 'Announce preference writes on the preferences_changed channel (cache invalidation)';
+
+DROP TRIGGER IF EXISTS notify_user_preferences_change ON user_preferences;
+CREATE TRIGGER notify_user_preferences_change
+AFTER INSERT OR UPDATE OR DELETE ON user_preferences
+FOR EACH ROW
+EXECUTE FUNCTION notify_preference_change();
+
+DROP TRIGGER IF EXISTS notify_organization_preferences_change ON organization_preferences;
+CREATE TRIGGER notify_organization_preferences_change
+AFTER INSERT OR UPDATE OR DELETE ON organization_preferences
+FOR EACH ROW
+EXECUTE FUNCTION notify_preference_change();
+
+-- Statement-level: a bulk definition update sends one notification
+DROP TRIGGER IF EXISTS notify_preference_definitions_change ON preference_definitions;
+CREATE TRIGGER notify_preference_definitions_change
+AFTER INSERT OR UPDATE OR DELETE ON preference_definitions
+FOR EACH STATEMENT
+EXECUTE FUNCTION notify_preference_change();
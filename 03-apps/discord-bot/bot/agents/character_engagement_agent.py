@@ -9,6 +9,7 @@ import discord
 from bot.agents.base import BaseAgent
 from bot.api_client import APIClient
 from bot.config import config
+from bot.roster_cache import CharacterRosterCache
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,7 @@ class CharacterEngagementAgent(BaseAgent):
         api_client: APIClient,
         discord_channel_id: str | None = None,
         check_interval: int | None = None,
+        roster_cache: CharacterRosterCache | None = None,
     ):
         """
         Initialize the character engagement agent.
@@ -40,6 +42,7 @@ class CharacterEngagementAgent(BaseAgent):
             api_client: The Lambda API client for checking engagement
             discord_channel_id: Optional Discord channel for status messages
             check_interval: Interval in seconds between engagement checks (default: 60)
+            roster_cache: Shared channel roster cache (created if not provided)
         """
         super().__init__(
             agent_id="character-engagement",
@@ -48,6 +51,7 @@ class CharacterEngagementAgent(BaseAgent):
             discord_channel_id=discord_channel_id,
         )
         self.api_client = api_client
+        self.roster_cache = roster_cache or CharacterRosterCache(api_client)
         self.check_interval = check_interval or int(
             getattr(config, "ENGAGEMENT_CHECK_INTERVAL", 60)
         )
@@ -156,7 +160,7 @@ class CharacterEngagementAgent(BaseAgent):
 
         try:
             # Get active characters in channel
-            characters = await self.api_client.list_characters(channel_id)
+            characters = await self.roster_cache.get(channel_id)
             if not characters:
                 return False
 
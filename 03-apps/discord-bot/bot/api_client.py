@@ -126,6 +126,20 @@ class APIClient:
             "GET", f"/api/v1/discord/characters/list?channel_id={channel_id}"
         )
 
+    async def poll_roster_events(
+        self, since: int = 0, epoch: str | None = None, timeout: float = 25
+    ) -> dict[str, Any]:
+        """
+        Long-poll for channel roster changes newer than `since`.
+
+        Returns:
+            Dictionary with epoch, version, events and reset flag
+        """
+        endpoint = f"/api/v1/discord/characters/events?since={since}&timeout={timeout}"
+        if epoch:
+            endpoint += f"&epoch={epoch}"
+        return await self._request("GET", endpoint)
+
     async def clear_history(
         self, channel_id: str, character_id: str | None = None
     ) -> dict[str, Any]:
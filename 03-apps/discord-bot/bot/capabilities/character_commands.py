@@ -7,6 +7,7 @@ from discord import app_commands
 
 from bot.api_client import APIClient
 from bot.capabilities.base import BaseCapability
+from bot.roster_cache import CharacterRosterCache
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,7 @@ class CharacterCommandsCapability(BaseCapability):
         client: discord.Client,
         api_client: APIClient,
         settings: dict | None = None,
+        roster_cache: CharacterRosterCache | None = None,
     ):
         """
         Initialize the character commands capability.
@@ -41,9 +43,11 @@ class CharacterCommandsCapability(BaseCapability):
             api_client: The Lambda API client for character management
             settings: Optional capability-specific settings from Lambda API
                 - default_persona_id: Default persona to use when adding characters
+            roster_cache: Optional shared roster cache to invalidate on changes
         """
         super().__init__(client, settings=settings)
         self.api_client = api_client
+        self.roster_cache = roster_cache
 
         # Extract settings
         self.default_persona_id = self.settings.get("default_persona_id")
@@ -103,6 +107,8 @@ class CharacterCommandsCapability(BaseCapability):
             result = await self.api_client.add_character(channel_id, name.lower(), name.lower())
 
             if result.get("success"):
+                if self.roster_cache:
+                    self.roster_cache.invalidate(channel_id)
                 character = result.get("character", {})
                 embed = discord.Embed(
                     title="Character Added",
@@ -132,6 +138,8 @@ class CharacterCommandsCapability(BaseCapability):
             result = await self.api_client.remove_character(channel_id, name.lower())
 
             if result.get("success"):
+                if self.roster_cache:
+                    self.roster_cache.invalidate(channel_id)
                 await interaction.followup.send(
                     f"Character '{name}' removed from channel.", ephemeral=True
                 )
@@ -8,6 +8,7 @@ from discord import app_commands
 
 from bot.api_client import APIClient
 from bot.capabilities.base import BaseCapability
+from bot.roster_cache import CharacterRosterCache
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,7 @@ class CharacterMentionCapability(BaseCapability):
         client: discord.Client,
         api_client: APIClient,
         settings: dict | None = None,
+        roster_cache: CharacterRosterCache | None = None,
     ):
         """
         Initialize the character mention capability.
@@ -41,9 +43,11 @@ class CharacterMentionCapability(BaseCapability):
             client: The Discord client instance
             api_client: The Lambda API client for chat
             settings: Optional capability-specific settings from Lambda API
+            roster_cache: Shared channel roster cache (created if not provided)
         """
         super().__init__(client, settings=settings)
         self.api_client = api_client
+        self.roster_cache = roster_cache or CharacterRosterCache(api_client)
 
     async def on_ready(self, tree: app_commands.CommandTree) -> None:
         """
@@ -67,13 +71,8 @@ class CharacterMentionCapability(BaseCapability):
             channel_id = str(message.channel.id)
             user_id = str(message.author.id)
 
-            # Get active characters in channel
-            try:
-                characters = await self.api_client.list_characters(channel_id)
-            except Exception as e:
-                logger.debug(f"Error listing characters for channel {channel_id}: {e}")
-                return False
-
+            # Get active characters in channel (cached; refreshed in the background)
+            characters = await self.roster_cache.get(channel_id)
             if not characters:
                 return False
 
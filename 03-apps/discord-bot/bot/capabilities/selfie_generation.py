@@ -2,6 +2,7 @@
 
 import asyncio
 import io
+import json
 import logging
 import re
 from uuid import UUID
@@ -353,6 +354,70 @@ class SelfieGenerationCapability(BaseCapability):
         run_id: str,
         max_wait: float = 300.0,
         poll_interval: float = 3.0,
+    ) -> dict | None:
+        """
+        Wait for generation to finish.
+
+        Follows the run's server-sent event stream (pushed as ComfyUI progresses)
+        and falls back to polling the run status if the stream is unavailable.
+
+        Args:
+            run_id: Workflow run UUID
+            max_wait: Maximum time to wait in seconds
+            poll_interval: Seconds between polls (fallback only)
+
+        Returns:
+            Final status dict or None if timeout/error
+        """
+        start_time = asyncio.get_event_loop().time()
+        try:
+            return await asyncio.wait_for(self._stream_generation_status(run_id), max_wait)
+        except asyncio.TimeoutError:
+            logger.warning(f"Status stream timeout for run {run_id}")
+            return None
+        except Exception as e:
+            logger.info(f"Status stream unavailable for run {run_id}, polling instead: {e}")
+
+        remaining = max_wait - (asyncio.get_event_loop().time() - start_time)
+        return await self._poll_run_status(run_id, remaining, poll_interval)
+
+    async def _stream_generation_status(self, run_id: str) -> dict:
+        """
+        Read the run's SSE stream until it reaches a terminal state.
+
+        Raises:
+            RuntimeError: If the stream cannot be opened or ends early
+        """
+        url = f"{self.api_client.base_url}/api/v1/comfyui/runs/{run_id}/stream"
+        session = await self.api_client._get_session()
+        headers = self.api_client._get_headers()
+
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=60)
+        async with session.get(url, headers=headers, timeout=timeout) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Stream API returned {response.status}")
+
+            event = None
+            async for raw_line in response.content:
+                line = raw_line.decode("utf-8").rstrip("\r\n")
+                if line.startswith("event:"):
+                    event = line[6:].strip()
+                elif line.startswith("data:"):
+                    if event is None:
+                        # Unnamed events carry the run; named ones are node progress
+                        status_data = json.loads(line[5:])
+                        if status_data.get("status") in ("completed", "failed"):
+                            return status_data
+                elif not line:
+                    event = None
+
+        raise RuntimeError("Stream ended before the run finished")
+
+    async def _poll_run_status(
+        self,
+        run_id: str,
+        max_wait: float,
+        poll_interval: float,
     ) -> dict | None:
         """
         Poll generation status until completion.
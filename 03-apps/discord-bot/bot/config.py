@@ -69,6 +69,10 @@ class Config:
     MAX_CHARACTERS_PER_CHANNEL: int = int(os.getenv("MAX_CHARACTERS_PER_CHANNEL", "5"))
     ENGAGEMENT_PROBABILITY: float = float(os.getenv("ENGAGEMENT_PROBABILITY", "0.15"))
     ENGAGEMENT_CHECK_INTERVAL: int = int(os.getenv("ENGAGEMENT_CHECK_INTERVAL", "60"))
+    # Channel roster cache: seconds before refresh, and push invalidation via long-poll
+    ROSTER_CACHE_TTL: float = float(os.getenv("ROSTER_CACHE_TTL", "300"))
+    ROSTER_EVENTS_ENABLED: bool = os.getenv("ROSTER_EVENTS_ENABLED", "true").lower() == "true"
+    ROSTER_EVENTS_POLL_TIMEOUT: float = float(os.getenv("ROSTER_EVENTS_POLL_TIMEOUT", "25"))
 
     # Bluesky configuration
     BLUESKY_HANDLE: str | None = os.getenv("BLUESKY_HANDLE")
@@ -64,9 +64,37 @@ def get_shared_api_client():
     return _shared_api_client
 
 
+_shared_roster_cache = None
+
+
+def get_shared_roster_cache():
+    """
+    Get or create the shared channel character roster cache.
+
+    Returns:
+        CharacterRosterCache instance or None if Lambda API is not configured
+    """
+    global _shared_roster_cache
+
+    api_client = get_shared_api_client()
+    if api_client is None:
+        return None
+
+    if _shared_roster_cache is None:
+        from bot.roster_cache import CharacterRosterCache
+
+        _shared_roster_cache = CharacterRosterCache(api_client)
+        logger.info("Shared roster cache created")
+
+    return _shared_roster_cache
+
+
 async def cleanup_shared_api_client():
-    """Close the shared API client if it exists."""
-    global _shared_api_client
+    """Close the shared API client (and the roster cache that uses it) if it exists."""
+    global _shared_api_client, _shared_roster_cache
+    if _shared_roster_cache is not None:
+        await _shared_roster_cache.stop()
+        _shared_roster_cache = None
     if _shared_api_client is not None:
         await _shared_api_client.close()
         _shared_api_client = None
@@ -154,15 +182,20 @@ def load_capabilities(
         api_client = get_shared_api_client()
         if api_client:
             character_settings = capability_settings.get("character", {})
+            roster_cache = get_shared_roster_cache()
 
             # Register character commands capability (slash commands)
             capability_registry.register(
-                CharacterCommandsCapability(client, api_client, settings=character_settings)
+                CharacterCommandsCapability(
+                    client, api_client, settings=character_settings, roster_cache=roster_cache
+                )
             )
 
             # Register character mention capability (message handling)
             capability_registry.register(
-                CharacterMentionCapability(client, api_client, settings=character_settings)
+                CharacterMentionCapability(
+                    client, api_client, settings=character_settings, roster_cache=roster_cache
+                )
             )
         else:
             logger.warning("Character capability enabled but LAMBDA_API_URL not configured")
@@ -224,6 +257,10 @@ async def on_ready():
     # Initialize capabilities (let them register commands including /claim_face)
     await capability_registry.on_ready(tree)
 
+    # Keep channel character rosters fresh from the Lambda event feed
+    if _shared_roster_cache is not None:
+        await _shared_roster_cache.start()
+
     # Sync command tree
     try:
         synced = await tree.sync()
@@ -297,6 +334,7 @@ async def on_ready():
             engagement_agent = CharacterEngagementAgent(
                 api_client=api_client,
                 discord_channel_id=config.DISCORD_UPLOAD_CHANNEL_ID,
+                roster_cache=get_shared_roster_cache(),
             )
             engagement_agent.set_discord_client(client)
             agent_manager.register_agent(engagement_agent)
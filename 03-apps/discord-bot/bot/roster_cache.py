@@ -0,0 +1,169 @@
+"""In-bot cache of the AI characters active in each Discord channel.
+
+Character capabilities look up a channel's roster on every message. Instead of
+asking the Lambda API each time, rosters are cached for ROSTER_CACHE_TTL
+seconds and kept fresh by long-polling the Lambda roster event feed, which
+publishes a change whenever a character is added to or removed from a channel.
+
+Only the first lookup for a channel waits on the network. Expired entries are
+served while a background refresh runs, and change events are applied to the
+cache directly.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+import aiohttp
+
+from bot.api_client import APIClient
+from bot.config import config
+
+logger = logging.getLogger(__name__)
+
+
+class CharacterRosterCache:
+    """TTL cache of channel character rosters with push invalidation."""
+
+    def __init__(
+        self,
+        api_client: APIClient,
+        ttl: float | None = None,
+        poll_timeout: float | None = None,
+    ):
+        """
+        Initialize the roster cache.
+
+        Args:
+            api_client: The Lambda API client used to fetch rosters and events
+            ttl: Seconds before a cached roster is refreshed (default: ROSTER_CACHE_TTL)
+            poll_timeout: Seconds each event long-poll waits on the server
+        """
+        self.api_client = api_client
+        self.ttl = ttl if ttl is not None else config.ROSTER_CACHE_TTL
+        self.poll_timeout = poll_timeout or config.ROSTER_EVENTS_POLL_TIMEOUT
+
+        self._rosters: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self._listener_task: asyncio.Task | None = None
+        self._epoch: str | None = None
+        self._version = 0
+
+    async def get(self, channel_id: str) -> list[dict[str, Any]]:
+        """
+        Get the characters active in a channel.
+
+        Args:
+            channel_id: The Discord channel ID
+
+        Returns:
+            List of character dictionaries (empty if none or on first-fetch failure)
+        """
+        entry = self._rosters.get(channel_id)
+        if entry is None:
+            # Cold miss: wait for the (shared) first fetch
+            return await self._schedule_refresh(channel_id) or []
+
+        expires_at, characters = entry
+        if time.monotonic() >= expires_at:
+            self._schedule_refresh(channel_id)
+        return characters
+
+    def invalidate(self, channel_id: str | None = None) -> None:
+        """Drop one channel's roster, or every roster when channel_id is None."""
+        if channel_id is None:
+            self._rosters.clear()
+        else:
+            self._rosters.pop(channel_id, None)
+
+    def apply_event(self, event: dict[str, Any]) -> None:
+        """
+        Apply a roster change event from the Lambda API.
+
+        Removals are applied in place. Additions carrying the character's
+        details are inserted directly; otherwise the roster is refetched.
+        """
+        channel_id = event.get("channel_id")
+        entry = self._rosters.get(channel_id)
+        if entry is None:
+            # Not cached here, nothing to update
+            return
+
+        expires_at, characters = entry
+        character_id = event.get("character_id")
+        remaining = [c for c in characters if c.get("character_id") != character_id]
+
+        if event.get("action") == "remove":
+            self._rosters[channel_id] = (expires_at, remaining)
+        elif event.get("action") == "add" and event.get("character"):
+            self._rosters[channel_id] = (expires_at, [*remaining, event["character"]])
+        else:
+            self._rosters[channel_id] = (0.0, characters)
+            self._schedule_refresh(channel_id)
+
+    def _schedule_refresh(self, channel_id: str) -> asyncio.Task:
+        """Start a roster fetch for a channel unless one is already running."""
+        task = self._refreshing.get(channel_id)
+        if task is None:
+            task = asyncio.create_task(self._refresh(channel_id))
+            self._refreshing[channel_id] = task
+        return task
+
+    async def _refresh(self, channel_id: str) -> list[dict[str, Any]] | None:
+        try:
+            characters = await self.api_client.list_characters(channel_id) or []
+        except Exception as e:
+            # Keep serving the stale roster; retry on a later lookup
+            logger.debug(f"Error listing characters for channel {channel_id}: {e}")
+            return None
+        else:
+            self._rosters[channel_id] = (time.monotonic() + self.ttl, characters)
+            return characters
+        finally:
+            self._refreshing.pop(channel_id, None)
+
+    async def start(self) -> None:
+        """Start listening for roster change events."""
+        if config.ROSTER_EVENTS_ENABLED and self._listener_task is None:
+            self._listener_task = asyncio.create_task(self._listen())
+            logger.info(f"Character roster cache started (TTL: {self.ttl}s)")
+
+    async def stop(self) -> None:
+        """Stop the event listener and any in-flight refreshes."""
+        tasks = [*self._refreshing.values()]
+        if self._listener_task:
+            tasks.append(self._listener_task)
+            self._listener_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _listen(self) -> None:
+        """Long-poll the Lambda roster event feed until stopped."""
+        backoff = 1.0
+        while True:
+            try:
+                result = await self.api_client.poll_roster_events(
+                    since=self._version, epoch=self._epoch, timeout=self.poll_timeout
+                )
+            except Exception as e:
+                if isinstance(e, aiohttp.ClientResponseError) and e.status == 404:
+                    logger.warning("Roster event feed not available; relying on TTL expiry only")
+                    return
+                logger.debug(f"Roster event poll failed: {e}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 60.0)
+                continue
+
+            backoff = 1.0
+            if result.get("reset"):
+                # Server restarted or we fell too far behind: events were missed
+                if self._epoch is not None:
+                    logger.info("Roster event feed reset; clearing cached rosters")
+                self.invalidate()
+            else:
+                for event in result.get("events", []):
+                    self.apply_event(event)
+            self._epoch = result.get("epoch")
+            self._version = result.get("version", self._version)
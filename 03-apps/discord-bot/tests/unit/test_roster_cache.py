@@ -0,0 +1,92 @@
+"""Tests for the channel character roster cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from bot.roster_cache import CharacterRosterCache
+
+LUNA = {"channel_id": "c1", "character_id": "luna", "name": "Luna"}
+NOVA = {"channel_id": "c1", "character_id": "nova", "name": "Nova"}
+
+
+@pytest.fixture
+def api_client():
+    client = Mock()
+    client.list_characters = AsyncMock(return_value=[LUNA])
+    return client
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_roster_is_fetched_once_while_fresh(api_client):
+    cache = CharacterRosterCache(api_client, ttl=60)
+
+    results = await asyncio.gather(*(cache.get("c1") for _ in range(5)))
+    results.append(await cache.get("c1"))
+
+    assert all(result == [LUNA] for result in results)
+    api_client.list_characters.assert_awaited_once_with("c1")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_expired_roster_is_served_while_refreshing(api_client):
+    cache = CharacterRosterCache(api_client, ttl=0)
+    await cache.get("c1")
+    api_client.list_characters.return_value = [LUNA, NOVA]
+
+    # Stale value comes back immediately; the refresh lands in the background
+    assert await cache.get("c1") == [LUNA]
+    await asyncio.sleep(0)
+    assert await cache.get("c1") == [LUNA, NOVA]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_events_update_cached_roster_without_fetching(api_client):
+    cache = CharacterRosterCache(api_client, ttl=60)
+    await cache.get("c1")
+
+    cache.apply_event(
+        {"channel_id": "c1", "action": "add", "character_id": "nova", "character": NOVA}
+    )
+    assert await cache.get("c1") == [LUNA, NOVA]
+
+    cache.apply_event({"channel_id": "c1", "action": "remove", "character_id": "luna"})
+    assert await cache.get("c1") == [NOVA]
+    api_client.list_characters.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_listener_resets_cache_and_applies_events(api_client):
+    polls = [
+        {"epoch": "e1", "version": 3, "events": [], "reset": True},
+        {
+            "epoch": "e1",
+            "version": 4,
+            "events": [{"channel_id": "c1", "action": "remove", "character_id": "luna"}],
+            "reset": False,
+        },
+    ]
+
+    async def poll_roster_events(since, epoch, timeout):
+        if polls:
+            return polls.pop(0)
+        await asyncio.sleep(3600)
+
+    api_client.poll_roster_events = AsyncMock(side_effect=poll_roster_events)
+    cache = CharacterRosterCache(api_client, ttl=60)
+    await cache.get("c1")
+
+    listener = asyncio.create_task(cache._listen())
+    for _ in range(5):
+        await asyncio.sleep(0)
+    listener.cancel()
+
+    assert api_client.poll_roster_events.await_args_list[1].kwargs["since"] == 3
+    assert api_client.poll_roster_events.await_args_list[1].kwargs["epoch"] == "e1"
+    # Reset dropped the cached roster, so the removal had nothing to apply to
+    assert "c1" not in cache._rosters
+    assert cache._version == 4
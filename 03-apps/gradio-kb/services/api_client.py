@@ -145,26 +145,30 @@ class KnowledgeBaseClient:
 
     async def list_articles(
         self,
-        page: int = 1,
         per_page: int = 20,
+        cursor: str | None = None,
         source_type: str | None = None,
         tags: list[str] | None = None,
+        count: str = "none",
     ) -> dict[str, Any]:
         """
-        List articles with pagination and filtering.
+        List articles with cursor pagination and filtering.
 
         Args:
-            page: Page number (1-indexed)
             per_page: Items per page
+            cursor: 'next_cursor' of the previous page (None for the first page)
             source_type: Filter by source type
             tags: Filter by tags
+            count: Total to include: "none", "estimated" or "exact"
 
         Returns:
-            Dict with 'articles', 'total', 'page', 'per_page'
+            Dict with 'articles', 'per_page', 'next_cursor', 'total', 'total_estimated'
         """
         client = await self._get_client()
 
-        params = {"page": page, "per_page": per_page}
+        params = {"per_page": per_page, "count": count}
+        if cursor:
+            params["cursor"] = cursor
         if source_type:
             params["source_type"] = source_type
         if tags:
@@ -9,18 +9,21 @@ Example usage:
 """
 
 # Export main components (lazy imports to avoid circular dependencies)
-from .services import GoogleCalendarSyncService
+from .services import CalendarSyncEngine, EventChange, GoogleCalendarSyncService
 from .stores import MongoDBCalendarStore, SyncState
 from .tools import (
     create_calendar_event,
     delete_calendar_event,
     list_calendar_events,
+    sync_calendar_changes,
     update_calendar_event,
 )
 
 __all__ = [
     # Services
     "GoogleCalendarSyncService",
+    "CalendarSyncEngine",
+    "EventChange",
     # Stores
     "MongoDBCalendarStore",
     "SyncState",
@@ -29,4 +32,5 @@ __all__ = [
     "update_calendar_event",
     "delete_calendar_event",
     "list_calendar_events",
+    "sync_calendar_changes",
 ]
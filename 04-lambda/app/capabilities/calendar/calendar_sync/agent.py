@@ -5,6 +5,7 @@ from app.capabilities.calendar.calendar_sync.tools import (
     create_calendar_event,
     delete_calendar_event,
     list_calendar_events,
+    sync_calendar_changes,
     update_calendar_event,
 )
 from pydantic import BaseModel, Field
@@ -26,6 +27,7 @@ You can:
 - Update existing calendar events
 - Delete calendar events
 - List calendar events in a time range
+- Sync changes from Google Calendar into the local event mirror
 
 When creating or updating events, make sure to:
 - Provide clear, descriptive summaries/titles
@@ -152,3 +154,17 @@ async def list_calendar_events_tool(
     return await list_calendar_events(
         deps_ctx, user_id, calendar_id, start_time, end_time, timezone
     )
+
+
+@calendar_agent.tool
+async def sync_calendar_changes_tool(
+    ctx: RunContext[CalendarDeps],
+    user_id: str = Field(..., description="User ID"),
+    calendar_id: str | None = Field("primary", description="Google Calendar ID"),
+) -> str:
+    """Pull changes since the last sync from Google Calendar."""
+    # Access dependencies from context - they are already initialized
+    deps = ctx.deps
+
+    deps_ctx = DepsWrapper(deps)
+    return await sync_calendar_changes(deps_ctx, user_id, calendar_id)
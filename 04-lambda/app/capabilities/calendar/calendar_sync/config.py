@@ -12,6 +12,7 @@ class CalendarConfig:
     google_calendar_credentials_path: str | None = global_settings.google_calendar_credentials_path
     google_calendar_token_path: str | None = global_settings.google_calendar_token_path
     google_calendar_id: str = global_settings.google_calendar_id
+    google_calendar_sync_page_size: int = global_settings.google_calendar_sync_page_size
 
     # MongoDB for sync state
     mongodb_uri = global_settings.mongodb_uri
@@ -1,5 +1,12 @@
 """Calendar sync services."""
 
+from .sync_engine import CalendarSyncEngine, EventChange, PullResult, PushResult
 from .sync_service import GoogleCalendarSyncService
 
-__all__ = ["GoogleCalendarSyncService"]
+__all__ = [
+    "CalendarSyncEngine",
+    "EventChange",
+    "GoogleCalendarSyncService",
+    "PullResult",
+    "PushResult",
+]
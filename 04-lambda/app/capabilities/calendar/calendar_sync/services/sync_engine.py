@@ -0,0 +1,339 @@
+"""Incremental Google Calendar sync engine.
+
+Pull: fetches only the events changed since the stored sync token (every page),
+applies them to the event mirror in MongoDB with one bulk write and stores the
+next token. An expired token (HTTP 410) resets the calendar's mirror and runs
+a full sync.
+
+Push: plans a set of external event changes against their stored sync states
+(one query), skips unchanged events by hash and sends the inserts, patches and
+deletes as Calendar batch requests instead of one HTTP round trip per event.
+Sync states are written back in one bulk write.
+
+All Calendar API I/O runs on the GoogleCalendarService's API thread, off the
+event loop.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.capabilities.calendar.calendar_sync.config import config
+from app.capabilities.calendar.calendar_sync.stores.mongodb_store import (
+    MongoDBCalendarStore,
+    SyncState,
+)
+from app.services.external.google_calendar import (
+    BatchOperation,
+    CalendarEvent,
+    CalendarEventData,
+    GoogleCalendar,
+    GoogleCalendarService,
+)
+from app.services.external.google_calendar.classes.exceptions import (
+    GoogleCalendarException,
+    GoogleCalendarNotFoundError,
+    GoogleCalendarSyncTokenExpiredError,
+)
+
+from .sync_service import compute_event_hash
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EventChange:
+    """An external event to push: event data to create or update, None to delete."""
+
+    external_id: str
+    event_data: CalendarEventData | None
+
+
+@dataclass
+class PullResult:
+    """Outcome of pulling changes from Google Calendar."""
+
+    calendar_id: str
+    full_sync: bool
+    upserted: int = 0
+    deleted: int = 0
+
+
+@dataclass
+class PushResult:
+    """Outcome of pushing event changes to Google Calendar."""
+
+    results: list[dict[str, Any]] = field(default_factory=list)
+    api_operations: int = 0
+
+    def count(self, action: str) -> int:
+        """Number of changes that ended with the given action."""
+        return sum(result["action"] == action for result in self.results)
+
+
+@dataclass
+class _Planned:
+    change: EventChange
+    state: SyncState | None
+    event_hash: str | None
+    operation: BatchOperation
+
+
+class CalendarSyncEngine:
+    """Pulls and pushes Google Calendar changes for one user's calendars."""
+
+    def __init__(
+        self,
+        calendar_service: GoogleCalendarService,
+        store: MongoDBCalendarStore,
+        page_size: int | None = None,
+    ):
+        """
+        Initialize the sync engine.
+
+        Args:
+            calendar_service: Google Calendar service (API calls run on its thread)
+            store: MongoDB store for sync tokens, event mirror and sync states
+            page_size: Events per page when pulling (default: GOOGLE_CALENDAR_SYNC_PAGE_SIZE)
+        """
+        self.calendar = calendar_service
+        self.store = store
+        self.page_size = page_size or config.google_calendar_sync_page_size
+
+    async def pull(
+        self,
+        user_id: str,
+        calendar_id: str | None = None,
+        time_min: str | None = None,
+    ) -> PullResult:
+        """
+        Pull changes since the last sync into the event mirror.
+
+        Args:
+            user_id: User who owns the calendar
+            calendar_id: Google Calendar ID (uses the service default if not provided)
+            time_min: Lower bound for a full sync (ISO format, optional)
+
+        Returns:
+            PullResult with the number of events upserted and deleted
+        """
+        cal_id = calendar_id or self.calendar.default_calendar_id
+        sync_token = await self.store.get_sync_token(user_id, cal_id)
+
+        try:
+            events, next_token = await self.calendar.list_event_changes(
+                cal_id, sync_token=sync_token, time_min=time_min, page_size=self.page_size
+            )
+        except GoogleCalendarSyncTokenExpiredError:
+            logger.warning(
+                "calendar_sync_token_expired", extra={"user_id": user_id, "calendar_id": cal_id}
+            )
+            await self.store.reset_calendar(user_id, cal_id)
+            sync_token = None
+            events, next_token = await self.calendar.list_event_changes(
+                cal_id, time_min=time_min, page_size=self.page_size
+            )
+
+        upserted, deleted = await self.store.apply_event_changes(user_id, cal_id, events)
+        if next_token:
+            await self.store.save_sync_token(user_id, cal_id, next_token)
+
+        result = PullResult(
+            calendar_id=cal_id, full_sync=sync_token is None, upserted=upserted, deleted=deleted
+        )
+        logger.info(
+            "calendar_changes_pulled",
+            extra={
+                "user_id": user_id,
+                "calendar_id": cal_id,
+                "full_sync": result.full_sync,
+                "upserted": upserted,
+                "deleted": deleted,
+            },
+        )
+        return result
+
+    async def push(
+        self,
+        user_id: str,
+        persona_id: str | None,
+        changes: list[EventChange],
+        calendar_id: str | None = None,
+        source_system: str = "manual",
+    ) -> PushResult:
+        """
+        Push external event changes to Google Calendar with batch requests.
+
+        Args:
+            user_id: User who owns the events
+            persona_id: Persona ID (for multi-persona support)
+            changes: Events to create/update (event_data) or delete (None); the last
+                change per external ID wins
+            calendar_id: Google Calendar ID (uses the service default if not provided)
+            source_system: Name of the source system, stored on new sync states
+
+        Returns:
+            PushResult with one result per external ID, in the shape returned by
+            GoogleCalendarSyncService ("created", "updated", "unchanged", "deleted",
+            "already_deleted", "not_found" or "failed")
+        """
+        cal_id = calendar_id or self.calendar.default_calendar_id
+        latest = {change.external_id: change for change in changes}
+        states = await self.store.get_many_by_external_ids(user_id, persona_id, latest)
+
+        outcome = PushResult()
+        by_id: dict[str, dict[str, Any]] = {}
+        planned: list[_Planned] = []
+        for external_id, change in latest.items():
+            state = states.get(external_id)
+            if change.event_data is None:
+                if state is None:
+                    by_id[external_id] = {"action": "not_found", "external_id": external_id}
+                else:
+                    planned.append(
+                        _Planned(
+                            change, state, None, BatchOperation("delete", state.google_event_id)
+                        )
+                    )
+                continue
+
+            event_hash = compute_event_hash(change.event_data)
+            if state is not None and state.event_hash == event_hash:
+                by_id[external_id] = {
+                    "action": "unchanged",
+                    "google_event_id": state.google_event_id,
+                    "external_id": external_id,
+                }
+                continue
+            body = _event_body(change.event_data)
+            operation = (
+                BatchOperation("patch", state.google_event_id, body)
+                if state is not None
+                else BatchOperation("insert", body=body)
+            )
+            planned.append(_Planned(change, state, event_hash, operation))
+
+        saved: list[SyncState] = []
+        removed: list[str] = []
+        mirrored: list[dict[str, Any]] = []
+        retry: list[_Planned] = []
+        for attempt in range(2):
+            if not planned:
+                break
+            outcome.api_operations += len(planned)
+            responses = await self.calendar.batch_execute(
+                [plan.operation for plan in planned], cal_id
+            )
+            for plan, response in zip(planned, responses, strict=True):
+                external_id = plan.change.external_id
+                method = plan.operation.method
+                if isinstance(response, GoogleCalendarNotFoundError) and attempt == 0:
+                    if method == "patch":
+                        # Deleted in Google Calendar: create it again
+                        logger.warning(
+                            "event_not_found_recreating",
+                            extra={
+                                "external_id": external_id,
+                                "google_event_id": plan.operation.event_id,
+                            },
+                        )
+                        retry.append(
+                            _Planned(
+                                plan.change,
+                                plan.state,
+                                plan.event_hash,
+                                BatchOperation("insert", body=plan.operation.body),
+                            )
+                        )
+                        continue
+                    if method == "delete":
+                        removed.append(external_id)
+                        mirrored.append({"id": plan.operation.event_id, "status": "cancelled"})
+                        by_id[external_id] = {
+                            "action": "already_deleted",
+                            "google_event_id": plan.operation.event_id,
+                            "external_id": external_id,
+                        }
+                        continue
+                if isinstance(response, GoogleCalendarException):
+                    logger.error(
+                        "event_push_failed",
+                        extra={
+                            "external_id": external_id,
+                            "method": method,
+                            "error": str(response),
+                        },
+                    )
+                    by_id[external_id] = {
+                        "action": "failed",
+                        "google_event_id": plan.operation.event_id,
+                        "external_id": external_id,
+                        "message": str(response),
+                    }
+                    continue
+
+                if method == "delete":
+                    removed.append(external_id)
+                    mirrored.append({"id": plan.operation.event_id, "status": "cancelled"})
+                    by_id[external_id] = {
+                        "action": "deleted",
+                        "google_event_id": plan.operation.event_id,
+                        "external_id": external_id,
+                    }
+                    continue
+
+                event = CalendarEvent.from_google_event(response)
+                mirrored.append(response)
+                saved.append(
+                    SyncState(
+                        external_id=external_id,
+                        google_event_id=event.id,
+                        user_id=user_id,
+                        persona_id=persona_id,
+                        calendar_id=cal_id,
+                        source_system=plan.state.source_system if plan.state else source_system,
+                        event_hash=plan.event_hash,
+                        metadata=plan.state.metadata if plan.state else {},
+                    )
+                )
+                by_id[external_id] = {
+                    "action": "updated" if method == "patch" else "created",
+                    "google_event_id": event.id,
+                    "external_id": external_id,
+                    "event": event.model_dump(),
+                }
+            planned, retry = retry, []
+
+        await self.store.delete_sync_states(user_id, persona_id, removed)
+        await self.store.save_sync_states(saved)
+        # Our own writes come back with the next pull as well; applying them now keeps
+        # the mirror current in between
+        await self.store.apply_event_changes(user_id, cal_id, mirrored)
+
+        outcome.results = [by_id[external_id] for external_id in latest]
+        logger.info(
+            "calendar_changes_pushed",
+            extra={
+                "user_id": user_id,
+                "calendar_id": cal_id,
+                "changes": len(latest),
+                "api_operations": outcome.api_operations,
+                "failed": outcome.count("failed"),
+            },
+        )
+        return outcome
+
+
+def _event_body(event_data: CalendarEventData) -> dict[str, Any]:
+    return GoogleCalendar.event_body(
+        summary=event_data.summary,
+        start=event_data.start,
+        end=event_data.end,
+        description=event_data.description,
+        location=event_data.location,
+        timezone=event_data.timezone,
+        attendees=event_data.attendees,
+    )
+
+
+__all__ = ["CalendarSyncEngine", "EventChange", "PullResult", "PushResult"]
@@ -21,6 +21,18 @@ from app.services.external.google_calendar.classes.exceptions import (
 logger = logging.getLogger(__name__)
 
 
+def compute_event_hash(event_data: CalendarEventData) -> str:
+    """Compute a hash of event data for change detection."""
+    data = {
+        "summary": event_data.summary,
+        "start": event_data.start,
+        "end": event_data.end,
+        "description": event_data.description,
+        "location": event_data.location,
+    }
+    return hashlib.md5(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
 class GoogleCalendarSyncService:
     """Service for synchronizing events with Google Calendar.
 
@@ -45,18 +57,21 @@ class GoogleCalendarSyncService:
         self.calendar = calendar_service
         self.sync_store = sync_store
         self.default_calendar_id = default_calendar_id
+        self._engine = None
+
+    @property
+    def engine(self):
+        """Incremental sync engine (CalendarSyncEngine) over the same service and store."""
+        if self._engine is None:
+            from .sync_engine import CalendarSyncEngine
+
+            self._engine = CalendarSyncEngine(self.calendar, self.sync_store)
+        return self._engine
 
     @staticmethod
     def _compute_event_hash(event_data: CalendarEventData) -> str:
         """Compute a hash of event data for change detection."""
-        data = {
-            "summary": event_data.summary,
-            "start": event_data.start,
-            "end": event_data.end,
-            "description": event_data.description,
-            "location": event_data.location,
-        }
-        return hashlib.md5(json.dumps(data, sort_keys=True).encode()).hexdigest()
+        return compute_event_hash(event_data)
 
     async def create_or_update_event(
         self,
@@ -327,4 +342,4 @@ class GoogleCalendarSyncService:
         return [s.model_dump() for s in states]
 
 
-__all__ = ["GoogleCalendarSyncService"]
+__all__ = ["GoogleCalendarSyncService", "compute_event_hash"]
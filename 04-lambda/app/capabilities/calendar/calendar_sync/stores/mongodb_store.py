@@ -1,15 +1,19 @@
 """MongoDB store for calendar sync state.
 
 This module provides MongoDB persistence for calendar synchronization state,
-tracking the mapping between external event IDs and Google Calendar event IDs.
+tracking the mapping between external event IDs and Google Calendar event IDs,
+plus the state of incremental sync: the latest sync token per user and calendar
+(calendar_sync_tokens) and a mirror of the calendar's events (calendar_events).
 """
 
 import logging
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from pydantic import BaseModel, Field
+from pymongo import DeleteOne, UpdateOne
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +43,8 @@ class MongoDBCalendarStore:
     """
 
     COLLECTION_NAME = "calendar_sync_state"
+    TOKENS_COLLECTION_NAME = "calendar_sync_tokens"
+    EVENTS_COLLECTION_NAME = "calendar_events"
 
     def __init__(self, db: AsyncIOMotorDatabase):
         """
@@ -49,6 +55,8 @@ class MongoDBCalendarStore:
         """
         self.db = db
         self.collection = db[self.COLLECTION_NAME]
+        self.tokens = db[self.TOKENS_COLLECTION_NAME]
+        self.events = db[self.EVENTS_COLLECTION_NAME]
         self._indexes_created = False
 
     async def ensure_indexes(self) -> None:
@@ -75,9 +83,31 @@ class MongoDBCalendarStore:
             name="user_synced_at_idx",
         )
 
+        # Sync token per user and calendar
+        await self.tokens.create_index(
+            [("user_id", 1), ("calendar_id", 1)],
+            unique=True,
+            name="user_calendar_unique",
+        )
+
+        # Mirrored events, listed by start time
+        await self.events.create_index(
+            [("user_id", 1), ("calendar_id", 1), ("google_event_id", 1)],
+            unique=True,
+            name="user_calendar_event_unique",
+        )
+        await self.events.create_index(
+            [("user_id", 1), ("calendar_id", 1), ("start", 1)],
+            name="user_calendar_start_idx",
+        )
+
         self._indexes_created = True
         logger.info("calendar_sync_indexes_created")
 
+    @staticmethod
+    def _state_query(user_id: str, persona_id: str | None, external_id: Any) -> dict[str, Any]:
+        return {"user_id": user_id, "persona_id": persona_id or None, "external_id": external_id}
+
     async def get_by_external_id(
         self,
         user_id: str,
@@ -337,5 +367,214 @@ class MongoDBCalendarStore:
 
         return await self.collection.count_documents(query)
 
+    async def get_many_by_external_ids(
+        self,
+        user_id: str,
+        persona_id: str | None,
+        external_ids: Iterable[str],
+    ) -> dict[str, SyncState]:
+        """
+        Get the sync states of several external IDs in one query.
+
+        Args:
+            user_id: User who owns the sync states
+            persona_id: Persona ID (can be None)
+            external_ids: External system's event identifiers
+
+        Returns:
+            SyncState by external ID; IDs without one are absent
+        """
+        await self.ensure_indexes()
+
+        query = self._state_query(user_id, persona_id, {"$in": list(external_ids)})
+        states = {}
+        async for doc in self.collection.find(query):
+            doc.pop("_id", None)
+            states[doc["external_id"]] = SyncState(**doc)
+        return states
+
+    async def save_sync_states(self, states: list[SyncState]) -> None:
+        """
+        Insert or replace several sync states in one bulk write.
+
+        Args:
+            states: Sync states, keyed by user, persona and external ID
+        """
+        if not states:
+            return
+        await self.ensure_indexes()
+
+        await self.collection.bulk_write(
+            [
+                UpdateOne(
+                    self._state_query(state.user_id, state.persona_id, state.external_id),
+                    {"$set": state.model_dump()},
+                    upsert=True,
+                )
+                for state in states
+            ],
+            ordered=False,
+        )
+        logger.info("sync_states_saved", extra={"count": len(states)})
+
+    async def delete_sync_states(
+        self,
+        user_id: str,
+        persona_id: str | None,
+        external_ids: Iterable[str],
+    ) -> int:
+        """
+        Delete the sync states of several external IDs.
+
+        Returns:
+            Number of sync states deleted
+        """
+        external_ids = list(external_ids)
+        if not external_ids:
+            return 0
+        await self.ensure_indexes()
+
+        result = await self.collection.delete_many(
+            self._state_query(user_id, persona_id, {"$in": external_ids})
+        )
+        return result.deleted_count
+
+    async def get_sync_token(self, user_id: str, calendar_id: str) -> str | None:
+        """
+        Get the sync token of the last incremental sync.
+
+        Args:
+            user_id: User who owns the calendar
+            calendar_id: Google Calendar ID
+
+        Returns:
+            Sync token, or None if the calendar has not been synced
+        """
+        await self.ensure_indexes()
+
+        doc = await self.tokens.find_one({"user_id": user_id, "calendar_id": calendar_id})
+        return doc["sync_token"] if doc else None
+
+    async def save_sync_token(self, user_id: str, calendar_id: str, sync_token: str) -> None:
+        """
+        Store the sync token for the next incremental sync.
+
+        Args:
+            user_id: User who owns the calendar
+            calendar_id: Google Calendar ID
+            sync_token: nextSyncToken from the last page of the sync
+        """
+        await self.ensure_indexes()
+
+        await self.tokens.update_one(
+            {"user_id": user_id, "calendar_id": calendar_id},
+            {"$set": {"sync_token": sync_token, "synced_at": datetime.utcnow()}},
+            upsert=True,
+        )
+
+    async def reset_calendar(self, user_id: str, calendar_id: str) -> None:
+        """
+        Drop the sync token and mirrored events of a calendar before a full resync.
+
+        Args:
+            user_id: User who owns the calendar
+            calendar_id: Google Calendar ID
+        """
+        await self.ensure_indexes()
+
+        query = {"user_id": user_id, "calendar_id": calendar_id}
+        await self.tokens.delete_one(query)
+        await self.events.delete_many(query)
+        logger.info("calendar_sync_reset", extra={"user_id": user_id, "calendar_id": calendar_id})
+
+    async def apply_event_changes(
+        self,
+        user_id: str,
+        calendar_id: str,
+        events: list[dict[str, Any]],
+    ) -> tuple[int, int]:
+        """
+        Apply changed events from Google Calendar to the event mirror in one bulk write.
+
+        Cancelled events are removed from the mirror, and their sync states are
+        dropped so the next push recreates them instead of reporting them unchanged.
+
+        Args:
+            user_id: User who owns the calendar
+            calendar_id: Google Calendar ID
+            events: Raw events from events.list (deleted ones with status "cancelled")
+
+        Returns:
+            Number of events upserted and deleted
+        """
+        if not events:
+            return 0, 0
+        await self.ensure_indexes()
+
+        now = datetime.utcnow()
+        operations = []
+        cancelled = []
+        for event in events:
+            key = {"user_id": user_id, "calendar_id": calendar_id, "google_event_id": event["id"]}
+            if event.get("status") == "cancelled":
+                cancelled.append(event["id"])
+                operations.append(DeleteOne(key))
+                continue
+            start = event.get("start", {})
+            operations.append(
+                UpdateOne(
+                    key,
+                    {
+                        "$set": {
+                            "event": event,
+                            "start": start.get("dateTime") or start.get("date"),
+                            "updated": event.get("updated"),
+                            "synced_at": now,
+                        }
+                    },
+                    upsert=True,
+                )
+            )
+
+        await self.events.bulk_write(operations, ordered=False)
+        if cancelled:
+            await self.collection.delete_many(
+                {"user_id": user_id, "google_event_id": {"$in": cancelled}}
+            )
+        return len(operations) - len(cancelled), len(cancelled)
+
+    async def list_mirrored_events(
+        self,
+        user_id: str,
+        calendar_id: str,
+        time_min: str | None = None,
+        time_max: str | None = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """
+        List mirrored events by start time, without calling the Calendar API.
+
+        Args:
+            user_id: User who owns the calendar
+            calendar_id: Google Calendar ID
+            time_min: Earliest start (ISO format, optional)
+            time_max: Start before (ISO format, optional)
+            limit: Maximum number of events
+
+        Returns:
+            Raw Google Calendar events
+        """
+        await self.ensure_indexes()
+
+        query: dict[str, Any] = {"user_id": user_id, "calendar_id": calendar_id}
+        if time_min or time_max:
+            query["start"] = {}
+            if time_min:
+                query["start"]["$gte"] = time_min
+            if time_max:
+                query["start"]["$lt"] = time_max
+        cursor = self.events.find(query, {"event": 1}).sort("start", 1).limit(limit)
+        return [doc["event"] async for doc in cursor]
+
 
 __all__ = ["MongoDBCalendarStore", "SyncState"]
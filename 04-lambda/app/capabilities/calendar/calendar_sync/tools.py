@@ -354,9 +354,56 @@ async def list_calendar_events(
         return f"[Error] Unexpected error: {e}"
 
 
+async def sync_calendar_changes(
+    ctx: Any,
+    user_id: str,
+    calendar_id: str | None = "primary",
+) -> str:
+    """
+    Pull changes from Google Calendar into the local event mirror.
+
+    Uses the stored sync token so only events changed since the last sync are
+    fetched; the first sync (or one after the token expired) reads every event.
+
+    Args:
+        ctx: Pydantic AI context with dependencies
+        user_id: User who owns the calendar
+        calendar_id: Google Calendar ID
+
+    Returns:
+        String describing the changes applied
+    """
+    sync_service = _get_sync_service(ctx)
+
+    if not sync_service:
+        return (
+            "[Not Configured] Google Calendar integration is not configured. "
+            "Set GOOGLE_CALENDAR_TOKEN and related environment variables."
+        )
+
+    try:
+        result = await sync_service.engine.pull(user_id, calendar_id or "primary")
+        kind = "Full" if result.full_sync else "Incremental"
+        return (
+            f"{kind} sync of calendar '{result.calendar_id}': {result.upserted} event(s) "
+            f"added or changed, {result.deleted} removed"
+        )
+
+    except GoogleCalendarAuthError as e:
+        logger.error(f"Calendar auth error: {e}")
+        return f"[Auth Error] Failed to authenticate with Google Calendar: {e}"
+    except GoogleCalendarException as e:
+        logger.error(f"Calendar error: {e}")
+        return f"[Error] Failed to sync calendar: {e}"
+    except Exception as e:
+        logger.exception(f"Unexpected error syncing calendar: {e}")
+        return f"[Error] Unexpected error: {e}"
+
+
 __all__ = [
     "create_calendar_event",
     "delete_calendar_event",
     "list_calendar_events",
+    "sync_calendar_changes",
     "update_calendar_event",
 ]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
@@ -14,8 +15,13 @@ class EntityExtractor(ABC):
 
     Implementations must provide async `extract` returning an
     `EntityExtractionResult` and a list of supported entity types.
+    `extract_many` runs `extract` concurrently; extractors that can batch
+    inference override it.
     """
 
+    # Texts extracted at once by the default extract_many
+    max_concurrency: int = 4
+
     @abstractmethod
     async def extract(self, text: str) -> EntityExtractionResult:
         """Extract entities and relationships from text.
@@ -27,6 +33,23 @@ class EntityExtractor(ABC):
             Structured extraction result
         """
 
+    async def extract_many(self, texts: list[str]) -> list[EntityExtractionResult]:
+        """Extract entities from many texts.
+
+        Args:
+            texts: Text contents to analyze
+
+        Returns:
+            One extraction result per text, in order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def extract_one(text: str) -> EntityExtractionResult:
+            async with semaphore:
+                return await self.extract(text)
+
+        return list(await asyncio.gather(*(extract_one(text) for text in texts)))
+
     @abstractmethod
     def get_supported_types(self) -> list[EntityType]:
         """Return the entity types supported by this extractor."""
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from datetime import datetime
 
 from fuzzywuzzy import fuzz
@@ -11,22 +13,29 @@ from .llm import LLMExtractor
 from .models import Entity, EntityExtractionResult, EntityType
 from .ner import NERExtractor
 
+logger = logging.getLogger(__name__)
+
 
 class HybridExtractor(EntityExtractor):
     """Two-stage extraction: NER first, LLM when needed, with deduplication."""
 
     def __init__(
-        self, llm_threshold: float = 0.7, ner_model: str = "Jean-Baptiste/roberta-large-ner-english"
+        self,
+        llm_threshold: float = 0.7,
+        ner_model: str = "Jean-Baptiste/roberta-large-ner-english",
+        llm_concurrency: int = 4,
     ) -> None:
         """Initialize hybrid extractor.
 
         Args:
             llm_threshold: Confidence threshold below which LLM extraction is triggered
             ner_model: Hugging Face model name for NER (default: Jean-Baptiste/roberta-large-ner-english)
+            llm_concurrency: LLM extractions running at once in extract_many
         """
         self._ner = NERExtractor(model_name=ner_model)
         self._llm = LLMExtractor()
         self._threshold = llm_threshold
+        self.max_concurrency = llm_concurrency
 
     async def extract(self, text: str) -> EntityExtractionResult:
         start = datetime.now()
@@ -44,8 +53,61 @@ class HybridExtractor(EntityExtractor):
             or self._has_complex_context(text)
         )
 
-        if needs_llm:
-            llm_result = await self._llm.extract(text)
+        llm_result = await self._llm.extract(text) if needs_llm else None
+        elapsed_ms = (datetime.now() - start).total_seconds() * 1000.0
+        return self._combine(ner_result, llm_result, elapsed_ms)
+
+    async def extract_many(self, texts: list[str]) -> list[EntityExtractionResult]:
+        """Extract entities from many texts: batched NER, then concurrent LLM escalation.
+
+        NER runs over all texts in one batched pass. Unlike extract(), only texts
+        with complex context (see _has_complex_context) are escalated to the LLM,
+        so bulk ingestion doesn't make an LLM call per low-confidence snippet.
+        Those calls run concurrently, at most llm_concurrency at a time; a failed
+        LLM call leaves that text with its NER entities.
+
+        Args:
+            texts: Text contents to analyze
+
+        Returns:
+            One extraction result per text, in order
+        """
+        if not texts:
+            return []
+        start = datetime.now()
+
+        ner_results = await self._ner.extract_many(texts)
+        escalate = [i for i, text in enumerate(texts) if self._has_complex_context(text)]
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def extract_llm(text: str) -> EntityExtractionResult:
+            async with semaphore:
+                return await self._llm.extract(text)
+
+        llm_outputs = await asyncio.gather(
+            *(extract_llm(texts[i]) for i in escalate), return_exceptions=True
+        )
+        llm_results: dict[int, EntityExtractionResult] = {}
+        for i, output in zip(escalate, llm_outputs, strict=True):
+            if isinstance(output, BaseException):
+                logger.warning(f"LLM entity extraction failed for text {i}: {output}")
+            else:
+                llm_results[i] = output
+
+        elapsed_ms = (datetime.now() - start).total_seconds() * 1000.0 / len(texts)
+        return [
+            self._combine(ner_result, llm_results.get(i), elapsed_ms)
+            for i, ner_result in enumerate(ner_results)
+        ]
+
+    def _combine(
+        self,
+        ner_result: EntityExtractionResult,
+        llm_result: EntityExtractionResult | None,
+        elapsed_ms: float,
+    ) -> EntityExtractionResult:
+        if llm_result is not None:
             merged_entities = self._merge_entities(ner_result.entities, llm_result.entities)
             relationships = llm_result.relationships
             extractor_type = "hybrid"
@@ -54,8 +116,6 @@ class HybridExtractor(EntityExtractor):
             relationships = []
             extractor_type = "ner"
 
-        elapsed_ms = (datetime.now() - start).total_seconds() * 1000.0
-
         return EntityExtractionResult(
             entities=merged_entities,
             relationships=relationships,
@@ -6,14 +6,11 @@ and extraction results to integrate with Neo4j/Graphiti-style schemas.
 
 from __future__ import annotations
 
+from datetime import datetime  # noqa: TC003 - pydantic resolves field types at runtime
 from enum import Enum
-from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
 
-if TYPE_CHECKING:
-    from datetime import datetime
-
 
 class EntityType(str, Enum):
     """Enumeration of supported entity types.
@@ -1,56 +1,95 @@
 """Transformers-based NER extractor using Hugging Face models.
 
 Modern alternative to spaCy that is fully compatible with Pydantic v2.
-Uses pre-trained BERT models for Named Entity Recognition.
+Uses pre-trained BERT models for Named Entity Recognition. Pipelines are loaded
+once per process and shared through the model registry (app/core/model_registry.py).
+
+extract_many() batches many texts through the pipeline at once. Long texts are
+split into overlapping model-length windows instead of being truncated.
 """
 
 from __future__ import annotations
 
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from app.core.model_registry import get_model_registry, model_key
+
 from .base import EntityExtractor
 from .models import Entity, EntityExtractionResult, EntityType
 
+# Tokens per window (capped by the model's limit) and overlap between windows, so
+# entities cut at one window's edge are found whole in the next
+MAX_WINDOW_TOKENS = 512
+WINDOW_STRIDE = 64
+
+
+def merge_window_entities(results: list[dict]) -> list[dict]:
+    """
+    Merge entities found in overlapping windows of one text.
+
+    Offsets are relative to the full text. Of overlapping spans the longest is
+    kept (an entity cut at a window edge is shorter than the whole one found in
+    the next window); identical spans keep the higher score.
+    """
+    merged: list[dict] = []
+    for result in sorted(results, key=lambda r: (r["start"], r["start"] - r["end"], -r["score"])):
+        if merged and result["start"] < merged[-1]["end"]:
+            last = merged[-1]
+            longer = result["end"] - result["start"] > last["end"] - last["start"]
+            if longer:
+                merged[-1] = result
+            continue
+        merged.append(result)
+    return merged
+
+
+def text_windows(tokenizer, text: str) -> list[tuple[int, int]]:
+    """Character spans of model-length windows over ``text``, overlapping by WINDOW_STRIDE tokens."""
+    if not text.strip():
+        return []
+    max_tokens = min(getattr(tokenizer, "model_max_length", 512), MAX_WINDOW_TOKENS)
+    # Room for [CLS]/[SEP] (or <s>/</s>)
+    window = max(16, max_tokens - tokenizer.num_special_tokens_to_add(pair=False))
+    stride = min(WINDOW_STRIDE, window // 4)
+
+    if getattr(tokenizer, "is_fast", False):
+        offsets = tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)[
+            "offset_mapping"
+        ]
+    else:
+        # No offset mapping: pseudo-tokens of ~4 characters
+        offsets = [(i, min(len(text), i + 4)) for i in range(0, len(text), 4)]
+    if len(offsets) <= window:
+        return [(0, len(text))]
+
+    spans = []
+    for first in range(0, len(offsets), window - stride):
+        last = min(first + window, len(offsets)) - 1
+        spans.append((offsets[first][0], offsets[last][1]))
+        if last == len(offsets) - 1:
+            break
+    return spans
+
 
 class NERExtractor(EntityExtractor):
     """Transformers-based NER using Hugging Face models.
 
-    Uses a thread pool to avoid blocking the event loop since inference is CPU-bound.
-    Default model: dslim/bert-base-NER (fine-tuned BERT for NER tasks).
+    Inference runs in the model registry's shared thread pool to avoid blocking
+    the event loop since it is CPU-bound. Extractors using the same model share
+    one pipeline (aggregation strategy "simple").
+    Default model: Jean-Baptiste/roberta-large-ner-english (NER_MODEL).
     """
 
-    def __init__(
-        self,
-        model_name: str = "Jean-Baptiste/roberta-large-ner-english",
-        max_workers: int = 4,
-        aggregation_strategy: str = "simple",
-    ) -> None:
-        """Initialize the NER extractor.
+    def __init__(self, model_name: str | None = None, batch_size: int = 16) -> None:
+        """Initialize the NER extractor (the pipeline loads on first use).
 
         Args:
-            model_name: Hugging Face model identifier (default: Jean-Baptiste/roberta-large-ner-english)
-            max_workers: Number of threads for async execution
-            aggregation_strategy: How to aggregate sub-word tokens ("simple", "first", "average", "max")
+            model_name: Hugging Face model identifier (default: NER_MODEL)
+            batch_size: Windows per forward pass in extract_many()
         """
-        self._model_name = model_name
-        self._executor = ThreadPoolExecutor(max_workers=max_workers)
-        self._aggregation_strategy = aggregation_strategy
-        # Lazy-load model in executor to avoid import-time failure
-        self._pipeline = None
-
-    def _ensure_model(self):
-        """Lazy-load the transformers pipeline."""
-        from transformers import pipeline
-
-        if self._pipeline is None:
-            self._pipeline = pipeline(
-                "ner",
-                model=self._model_name,
-                aggregation_strategy=self._aggregation_strategy,
-            )
-        return self._pipeline
+        self._key = model_key("ner", model_name)
+        self._model_name = self._key.split(":", 1)[1]
+        self._batch_size = batch_size
 
     def _map_label(self, label: str) -> EntityType:
         """Map Hugging Face NER labels to our EntityType enum.
@@ -76,14 +115,49 @@ class NERExtractor(EntityExtractor):
         }
         return mapping.get(label_clean.upper(), EntityType.CONCEPT)
 
-    def _run_inference(self, text: str) -> list[dict]:
-        """Run NER inference in the thread pool."""
-        pipeline = self._ensure_model()
-        # Truncate long texts to avoid model limits (512 tokens for BERT)
-        max_chars = 2000
-        if len(text) > max_chars:
-            text = text[:max_chars]
-        return pipeline(text)
+    def _run_batch(self, pipeline, texts: list[str]) -> list[list[dict]]:
+        """
+        Run NER over all texts in one batched pipeline call (in the registry's thread pool).
+
+        Long texts are split into overlapping model-length windows; the windows
+        of every text go through the pipeline together, and entity offsets are
+        mapped back to the source text.
+        """
+        windows = [
+            (i, span)
+            for i, text in enumerate(texts)
+            for span in text_windows(pipeline.tokenizer, text)
+        ]
+        per_text: list[list[dict]] = [[] for _ in texts]
+        if not windows:
+            return per_text
+
+        outputs = pipeline([texts[i][s:e] for i, (s, e) in windows], batch_size=self._batch_size)
+        for (i, (offset, _)), results in zip(windows, outputs, strict=True):
+            for result in results:
+                per_text[i].append(
+                    {**result, "start": result["start"] + offset, "end": result["end"] + offset}
+                )
+        return [merge_window_entities(results) for results in per_text]
+
+    def _to_result(self, ner_results: list[dict], elapsed_ms: float) -> EntityExtractionResult:
+        entities = [
+            Entity(
+                name=result["word"],
+                type=self._map_label(result["entity_group"]),
+                span=(result["start"], result["end"]),
+                confidence=float(result["score"]),
+                source="transformers",
+            )
+            for result in ner_results
+        ]
+        return EntityExtractionResult(
+            entities=entities,
+            relationships=[],
+            chunk_id="",
+            extraction_time_ms=elapsed_ms,
+            extractor_type="ner",
+        )
 
     async def extract(self, text: str) -> EntityExtractionResult:
         """Extract entities from text using transformers NER.
@@ -94,32 +168,30 @@ class NERExtractor(EntityExtractor):
         Returns:
             EntityExtractionResult with detected entities
         """
-        start = datetime.now()
+        return (await self.extract_many([text]))[0]
 
-        loop = asyncio.get_event_loop()
-        ner_results = await loop.run_in_executor(self._executor, self._run_inference, text)
-
-        entities: list[Entity] = []
-        for result in ner_results:
-            entities.append(
-                Entity(
-                    name=result["word"],
-                    type=self._map_label(result["entity_group"]),
-                    span=(result["start"], result["end"]),
-                    confidence=float(result["score"]),
-                    source="transformers",
-                )
-            )
+    async def extract_many(self, texts: list[str]) -> list[EntityExtractionResult]:
+        """Extract entities from many texts with batched inference.
 
-        elapsed_ms = (datetime.now() - start).total_seconds() * 1000.0
+        Texts of any length are covered completely: each is split into
+        model-length windows with overlap, windows from all texts are batched
+        through the pipeline, and entities found twice in an overlap are merged.
 
-        return EntityExtractionResult(
-            entities=entities,
-            relationships=[],
-            chunk_id="",
-            extraction_time_ms=elapsed_ms,
-            extractor_type="ner",
-        )
+        Args:
+            texts: Input texts (documents or chunks)
+
+        Returns:
+            One EntityExtractionResult per text, in order; extraction_time_ms is
+            the batch time divided evenly across texts
+        """
+        if not texts:
+            return []
+        start = datetime.now()
+
+        ner_results = await get_model_registry().run(self._key, self._run_batch, texts)
+
+        elapsed_ms = (datetime.now() - start).total_seconds() * 1000.0 / len(texts)
+        return [self._to_result(results, elapsed_ms) for results in ner_results]
 
     def get_supported_types(self) -> list[EntityType]:
         """Return list of entity types this extractor can detect."""
@@ -13,6 +13,10 @@ class KnowledgeBaseConfig:
     mongodb_database: str = os.getenv("MONGODB_DATABASE", "knowledge_base")
     articles_collection: str = os.getenv("KB_ARTICLES_COLLECTION", "articles")
     proposals_collection: str = os.getenv("KB_PROPOSALS_COLLECTION", "proposals")
+    versions_collection: str = os.getenv("KB_VERSIONS_COLLECTION", "article_versions")
+
+    # Article history: every Nth version stores full content, the rest a diff
+    version_snapshot_interval: int = int(os.getenv("KB_VERSION_SNAPSHOT_INTERVAL", "10"))
 
     # Embedding settings (same as mongo_rag)
     embedding_model: str = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
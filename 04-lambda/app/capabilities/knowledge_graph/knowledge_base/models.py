@@ -29,8 +29,16 @@ class SourceType(str, Enum):
     IMPORT = "import"
 
 
+class ArticleCount(str, Enum):
+    """How an article listing counts its total."""
+
+    NONE = "none"
+    ESTIMATED = "estimated"
+    EXACT = "exact"
+
+
 class ArticleVersion(BaseModel):
-    """A historical version of an article."""
+    """A version of an article (stored in the versions collection, see ``versions``)."""
 
     version: int
     content: str
@@ -52,7 +60,6 @@ class Article(BaseModel):
     source_type: SourceType = Field(default=SourceType.MANUAL)
     tags: list[str] = Field(default_factory=list)
     version: int = Field(default=1)
-    version_history: list[ArticleVersion] = Field(default_factory=list)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     reliability_score: float | None = Field(None, ge=0.0, le=1.0)
@@ -152,9 +159,10 @@ class ArticleListResponse(BaseModel):
     """Response for article list."""
 
     articles: list[Article]
-    total: int
-    page: int
     per_page: int
+    next_cursor: str | None = Field(None, description="Pass as cursor for the next page")
+    total: int | None = Field(None, description="Total matching articles, if counted")
+    total_estimated: bool = Field(False, description="Whether total is an estimate")
 
 
 class ArticleSearchRequest(BaseModel):
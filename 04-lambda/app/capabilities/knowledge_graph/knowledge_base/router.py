@@ -8,6 +8,7 @@ import openai
 from app.capabilities.knowledge_graph.knowledge_base.config import config
 from app.capabilities.knowledge_graph.knowledge_base.models import (
     Article,
+    ArticleCount,
     ArticleCreateRequest,
     ArticleEditProposal,
     ArticleListResponse,
@@ -20,7 +21,10 @@ from app.capabilities.knowledge_graph.knowledge_base.models import (
     ProposalReviewRequest,
     ProposalStatus,
 )
-from app.capabilities.knowledge_graph.knowledge_base.services.article_service import ArticleService
+from app.capabilities.knowledge_graph.knowledge_base.services.article_service import (
+    ArticleEditConflictError,
+    ArticleService,
+)
 from app.capabilities.knowledge_graph.knowledge_base.services.chat_service import ChatService
 from app.capabilities.knowledge_graph.knowledge_base.services.notification_service import (
     NotificationService,
@@ -81,35 +85,45 @@ async def get_services(
 @router.get("/articles", response_model=ArticleListResponse)
 async def list_articles(
     services: Annotated[dict, Depends(get_services)],
-    page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
     source_type: str | None = None,
     tags: str | None = None,
+    count: ArticleCount = ArticleCount.NONE,
 ):
     """
-    List articles with pagination and filtering.
+    List articles, most recently updated first, with cursor pagination and filtering.
+
+    Articles are returned without embeddings or version history.
 
     **Parameters:**
-    - `page`: Page number (1-indexed)
     - `per_page`: Items per page (1-100)
+    - `cursor`: `next_cursor` from the previous page (omit for the first page)
     - `source_type`: Filter by source (circle_so, dev_to, manual, etc.)
     - `tags`: Comma-separated list of tags to filter by
+    - `count`: `none` (default), `estimated` (from collection metadata; exact
+      when filtering) or `exact` total
     """
     article_service = services["article_service"]
 
     tags_list = tags.split(",") if tags else None
-    articles, total = await article_service.list_articles(
-        page=page,
-        per_page=per_page,
-        source_type=source_type,
-        tags=tags_list,
-    )
+    try:
+        articles, next_cursor, total, estimated = await article_service.list_articles(
+            per_page=per_page,
+            cursor=cursor,
+            source_type=source_type,
+            tags=tags_list,
+            count=count,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
     return ArticleListResponse(
         articles=articles,
-        total=total,
-        page=page,
         per_page=per_page,
+        next_cursor=next_cursor,
+        total=total,
+        total_estimated=estimated,
     )
 
 
@@ -185,7 +199,10 @@ async def update_article(
             detail="Only the article owner can directly edit. Use the proposal system instead.",
         )
 
-    updated = await article_service.update_article(article_id, request, user.email)
+    try:
+        updated = await article_service.update_article(article_id, request, user.email)
+    except ArticleEditConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
     return updated
 
 
@@ -214,12 +231,28 @@ async def get_article_history(
     article_id: str,
     services: Annotated[dict, Depends(get_services)],
 ):
-    """Get version history for an article."""
+    """Get version history for an article, oldest first (the last is the current version)."""
     article_service = services["article_service"]
     history = await article_service.get_article_history(article_id)
     return {"history": [h.model_dump() for h in history]}
 
 
+@router.get("/articles/{article_id}/history/{version}")
+async def get_article_version(
+    article_id: str,
+    version: int,
+    services: Annotated[dict, Depends(get_services)],
+):
+    """Get one version of an article."""
+    article_service = services["article_service"]
+    article_version = await article_service.get_article_version(article_id, version)
+
+    if not article_version:
+        raise HTTPException(status_code=404, detail="Version not found")
+
+    return article_version.model_dump()
+
+
 @router.post("/search")
 async def search_articles(
     request: ArticleSearchRequest,
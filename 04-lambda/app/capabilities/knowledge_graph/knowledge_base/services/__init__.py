@@ -6,5 +6,14 @@ from app.capabilities.knowledge_graph.knowledge_base.services.notification_servi
     NotificationService,
 )
 from app.capabilities.knowledge_graph.knowledge_base.services.proposal_service import ProposalService
+from app.capabilities.knowledge_graph.knowledge_base.services.version_service import (
+    VersionService,
+)
 
-__all__ = ["ArticleService", "ChatService", "NotificationService", "ProposalService"]
+__all__ = [
+    "ArticleService",
+    "ChatService",
+    "NotificationService",
+    "ProposalService",
+    "VersionService",
+]
@@ -1,26 +1,62 @@
 """Article CRUD and management service."""
 
+import base64
 import logging
 import re
 from datetime import datetime
 from typing import Any
 
 import openai
-from bson import ObjectId
+from bson import ObjectId, json_util
 from app.capabilities.knowledge_graph.knowledge_base.config import config
 from app.capabilities.knowledge_graph.knowledge_base.models import (
     Article,
+    ArticleCount,
     ArticleCreateRequest,
     ArticleUpdateRequest,
     ArticleVersion,
     SourceType,
 )
+from app.capabilities.knowledge_graph.knowledge_base.services.version_service import (
+    VersionService,
+)
 from pymongo import AsyncMongoClient
 
 from app.core.embedding_service import EmbeddingService
 
 logger = logging.getLogger(__name__)
 
+# Reads skip the version_history array left on articles not yet migrated to the
+# versions collection; listings also skip embeddings
+ARTICLE_PROJECTION = {"version_history": 0}
+LIST_PROJECTION = {"version_history": 0, "content_embedding": 0}
+
+# Attempts at an edit whose base version was taken by a concurrent edit
+UPDATE_ATTEMPTS = 5
+
+
+class ArticleEditConflictError(Exception):
+    """Concurrent edits kept superseding an article update."""
+
+
+def encode_list_cursor(article: Article) -> str:
+    """Opaque cursor continuing an article listing after ``article``."""
+    position = json_util.dumps([article.updated_at, ObjectId(article.id)])
+    return base64.urlsafe_b64encode(position.encode()).decode().rstrip("=")
+
+
+def decode_list_cursor(cursor: str) -> tuple[datetime, ObjectId]:
+    """(updated_at, _id) of the last article of the previous page; raises ValueError."""
+    try:
+        updated_at, article_id = json_util.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(updated_at, datetime) or not isinstance(article_id, ObjectId):
+        raise ValueError("Invalid cursor")
+    return updated_at, article_id
+
 
 class ArticleService:
     """Service for managing Knowledge Base articles."""
@@ -42,6 +78,7 @@ class ArticleService:
         self.mongo_client = mongo_client
         self.db = mongo_client[config.mongodb_database]
         self.collection = self.db[config.articles_collection]
+        self.versions = VersionService(mongo_client)
         self.openai_client = openai_client
         self.embedding_service = embedding_service or EmbeddingService(client=openai_client)
 
@@ -104,7 +141,6 @@ class ArticleService:
             "source_type": request.source_type.value,
             "tags": request.tags,
             "version": 1,
-            "version_history": [],
             "created_at": now,
             "updated_at": now,
             "reliability_score": None,
@@ -114,14 +150,16 @@ class ArticleService:
 
         result = await self.collection.insert_one(article_data)
         article_data["_id"] = str(result.inserted_id)
+        article = Article(**article_data)
+        await self.versions.record_created(article)
 
         logger.info(f"Created article: {slug} by {author_email}")
-        return Article(**article_data)
+        return article
 
     async def get_article(self, article_id: str) -> Article | None:
         """Get article by ID."""
         try:
-            doc = await self.collection.find_one({"_id": ObjectId(article_id)})
+            doc = await self.collection.find_one({"_id": ObjectId(article_id)}, ARTICLE_PROJECTION)
             if doc:
                 doc["_id"] = str(doc["_id"])
                 return Article(**doc)
@@ -131,7 +169,7 @@ class ArticleService:
 
     async def get_article_by_slug(self, slug: str) -> Article | None:
         """Get article by slug."""
-        doc = await self.collection.find_one({"slug": slug})
+        doc = await self.collection.find_one({"slug": slug}, ARTICLE_PROJECTION)
         if doc:
             doc["_id"] = str(doc["_id"])
             return Article(**doc)
@@ -144,7 +182,7 @@ class ArticleService:
         editor_email: str,
     ) -> Article | None:
         """
-        Update an article, creating a version history entry.
+        Update an article, recording a new version if the content changed.
 
         Args:
             article_id: ID of article to update
@@ -153,67 +191,95 @@ class ArticleService:
 
         Returns:
             Updated article or None if not found
+
+        Raises:
+            ArticleEditConflictError: If concurrent edits won every attempt
         """
-        article = await self.get_article(article_id)
-        if not article:
-            return None
-
-        # Build update dict
-        update_data: dict[str, Any] = {"updated_at": datetime.utcnow()}
-
-        # Create version history entry if content changed
-        if request.content and request.content != article.content:
-            version_entry = ArticleVersion(
-                version=article.version,
-                content=article.content,
-                changed_at=article.updated_at,
-                changed_by=editor_email,
-                change_reason=request.change_reason,
+        embedding: list[float] | None = None
+        for _attempt in range(UPDATE_ATTEMPTS):
+            article = await self.get_article(article_id)
+            if not article:
+                return None
+
+            # Build update dict
+            now = datetime.utcnow()
+            update_data: dict[str, Any] = {"updated_at": now}
+            query: dict[str, Any] = {"_id": ObjectId(article_id)}
+            content_changed = bool(request.content) and request.content != article.content
+
+            if content_changed:
+                # The next version is claimed by bumping the version the edit was
+                # based on: of two concurrent edits only one matches, the other
+                # re-reads the article and diffs against the winner's content
+                query["version"] = article.version
+                update_data["content"] = request.content
+                update_data["version"] = article.version + 1
+
+                # Regenerate embedding
+                if self.openai_client and embedding is None:
+                    try:
+                        embedding = await self.generate_embedding(request.content)
+                    except Exception as e:
+                        logger.warning(f"Failed to regenerate embedding: {e}")
+                if embedding is not None:
+                    update_data["content_embedding"] = embedding
+
+            if request.title:
+                update_data["title"] = request.title
+
+            if request.tags is not None:
+                update_data["tags"] = request.tags
+
+            result = await self.collection.update_one(query, {"$set": update_data})
+            if result.matched_count:
+                break
+            logger.info(f"Article {article_id} changed during an edit, retrying")
+        else:
+            raise ArticleEditConflictError(
+                f"Article {article_id} kept changing during the edit, try again"
             )
 
-            update_data["content"] = request.content
-            update_data["version"] = article.version + 1
-            update_data["$push"] = {"version_history": version_entry.model_dump()}
-
-            # Regenerate embedding
-            if self.openai_client:
-                try:
-                    update_data["content_embedding"] = await self.generate_embedding(
-                        request.content
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to regenerate embedding: {e}")
-
-        if request.title:
-            update_data["title"] = request.title
-
-        if request.tags is not None:
-            update_data["tags"] = request.tags
-
-        # Separate $push operation
-        push_op = update_data.pop("$push", None)
-
-        await self.collection.update_one(
-            {"_id": ObjectId(article_id)},
-            {"$set": update_data, **({"$push": push_op} if push_op else {})},
-        )
+        # Recorded after the article is saved: a version missing after a failure
+        # here is stored as a snapshot by the next edit
+        if content_changed:
+            await self.versions.record_update(
+                article, request.content, now, editor_email, request.change_reason
+            )
 
         logger.info(f"Updated article {article_id} by {editor_email}")
         return await self.get_article(article_id)
 
     async def list_articles(
         self,
-        page: int = 1,
         per_page: int = 20,
+        cursor: str | None = None,
         source_type: str | None = None,
         tags: list[str] | None = None,
         author_email: str | None = None,
-    ) -> tuple[list[Article], int]:
+        *,
+        count: ArticleCount = ArticleCount.NONE,
+    ) -> tuple[list[Article], str | None, int | None, bool]:
         """
-        List articles with pagination and filtering.
+        List articles, most recently updated first, one page at a time.
+
+        Pages continue after the last article of the previous page (keyset on
+        updated_at, _id) instead of skipping, and articles are returned
+        without their embeddings.
+
+        Args:
+            per_page: Articles per page
+            cursor: Cursor returned with the previous page
+            source_type: Filter by source type
+            tags: Filter by any of these tags
+            author_email: Filter by owner
+            count: Whether to count the total: not at all, estimated from
+                collection metadata (exact count when filtering), or exactly
 
         Returns:
-            Tuple of (articles, total_count)
+            Tuple of (articles, next_cursor, total, total_estimated)
+
+        Raises:
+            ValueError: If the cursor is invalid
         """
         filter_dict: dict[str, Any] = {}
 
@@ -224,19 +290,37 @@ class ArticleService:
         if author_email:
             filter_dict["author_email"] = author_email
 
-        # Get total count
-        total = await self.collection.count_documents(filter_dict)
-
-        # Get paginated results
-        skip = (page - 1) * per_page
-        cursor = self.collection.find(filter_dict).sort("updated_at", -1).skip(skip).limit(per_page)
-
+        page_filter = filter_dict
+        if cursor:
+            updated_at, last_id = decode_list_cursor(cursor)
+            keyset = {
+                "$or": [
+                    {"updated_at": {"$lt": updated_at}},
+                    {"updated_at": updated_at, "_id": {"$lt": last_id}},
+                ]
+            }
+            page_filter = {"$and": [filter_dict, keyset]} if filter_dict else keyset
+
+        # One extra article tells whether there is a next page
+        docs = await (
+            self.collection.find(page_filter, LIST_PROJECTION)
+            .sort([("updated_at", -1), ("_id", -1)])
+            .limit(per_page + 1)
+            .to_list()
+        )
         articles = []
-        async for doc in cursor:
+        for doc in docs[:per_page]:
             doc["_id"] = str(doc["_id"])
             articles.append(Article(**doc))
+        next_cursor = encode_list_cursor(articles[-1]) if len(docs) > per_page else None
+
+        total, estimated = None, False
+        if count == ArticleCount.ESTIMATED and not filter_dict:
+            total, estimated = await self.collection.estimated_document_count(), True
+        elif count != ArticleCount.NONE:
+            total = await self.collection.count_documents(filter_dict)
 
-        return articles, total
+        return articles, next_cursor, total, estimated
 
     async def search_articles(
         self,
@@ -296,14 +380,17 @@ class ArticleService:
     async def delete_article(self, article_id: str) -> bool:
         """Delete an article by ID."""
         result = await self.collection.delete_one({"_id": ObjectId(article_id)})
+        if result.deleted_count:
+            await self.versions.delete_history(article_id)
         return result.deleted_count > 0
 
     async def get_article_history(self, article_id: str) -> list[ArticleVersion]:
-        """Get version history for an article."""
-        article = await self.get_article(article_id)
-        if not article:
-            return []
-        return article.version_history
+        """Get the recorded versions of an article, oldest first."""
+        return await self.versions.get_history(article_id)
+
+    async def get_article_version(self, article_id: str, version: int) -> ArticleVersion | None:
+        """Get one recorded version of an article."""
+        return await self.versions.get_version(article_id, version)
 
     async def import_from_markdown(
         self,
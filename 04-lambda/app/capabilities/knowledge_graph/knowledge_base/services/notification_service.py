@@ -4,37 +4,41 @@ import logging
 from datetime import datetime
 from typing import Any
 
-import httpx
 from bson import ObjectId
 from app.capabilities.knowledge_graph.knowledge_base.config import config
 from app.capabilities.knowledge_graph.knowledge_base.models import ArticleEditProposal
 from pymongo import AsyncMongoClient
 
+from app.services.notifications import NotificationDispatcher, get_notification_dispatcher
+
 logger = logging.getLogger(__name__)
 
 
 class NotificationService:
-    """Service for sending notifications about proposal activity."""
+    """
+    Service for sending notifications about proposal activity.
+
+    In-app notifications are written directly; Discord and n8n (email) messages
+    are only enqueued on the outbound notification dispatcher, which delivers
+    them in the background to whichever of the two is configured.
+    """
 
     def __init__(
         self,
         mongo_client: AsyncMongoClient,
-        n8n_webhook_url: str | None = None,
-        discord_webhook_url: str | None = None,
+        dispatcher: NotificationDispatcher | None = None,
     ):
         """
         Initialize the notification service.
 
         Args:
             mongo_client: MongoDB async client
-            n8n_webhook_url: Optional n8n webhook for email notifications
-            discord_webhook_url: Optional Discord webhook for notifications
+            dispatcher: Outbound dispatcher (defaults to the process-wide one)
         """
         self.mongo_client = mongo_client
         self.db = mongo_client[config.mongodb_database]
         self.notifications_collection = self.db["notifications"]
-        self.n8n_webhook_url = n8n_webhook_url
-        self.discord_webhook_url = discord_webhook_url
+        self.dispatcher = dispatcher or get_notification_dispatcher()
 
     async def create_notification(
         self,
@@ -144,29 +148,27 @@ class NotificationService:
             },
         )
 
-        # Send Discord notification if configured
-        if self.discord_webhook_url:
-            await self._send_discord_notification(
-                title="New Edit Proposal",
-                description=(
-                    f"**{proposal.proposer_email}** has proposed edits to "
-                    f"**{article_title}**\n\nReason: {proposal.change_reason[:200]}..."
-                ),
-                color=0x3498DB,  # Blue
-            )
+        # Discord
+        await self._send_discord_notification(
+            title="New Edit Proposal",
+            description=(
+                f"**{proposal.proposer_email}** has proposed edits to "
+                f"**{article_title}**\n\nReason: {proposal.change_reason[:200]}..."
+            ),
+            color=0x3498DB,  # Blue
+        )
 
-        # Send email via n8n if configured
-        if self.n8n_webhook_url:
-            await self._send_n8n_webhook(
-                event="proposal_submitted",
-                data={
-                    "owner_email": owner_email,
-                    "proposer_email": proposal.proposer_email,
-                    "article_title": article_title,
-                    "change_reason": proposal.change_reason,
-                    "proposal_id": proposal.id,
-                },
-            )
+        # Email via n8n
+        await self._send_n8n_webhook(
+            event="proposal_submitted",
+            data={
+                "owner_email": owner_email,
+                "proposer_email": proposal.proposer_email,
+                "article_title": article_title,
+                "change_reason": proposal.change_reason,
+                "proposal_id": proposal.id,
+            },
+        )
 
         logger.info(f"Sent proposal notification to {owner_email}")
 
@@ -213,27 +215,25 @@ class NotificationService:
             },
         )
 
-        # Send Discord notification if configured
-        if self.discord_webhook_url:
-            await self._send_discord_notification(
-                title=title,
-                description=f"Proposal by **{proposal.proposer_email}**\n\n{message}",
-                color=color,
-            )
+        # Discord
+        await self._send_discord_notification(
+            title=title,
+            description=f"Proposal by **{proposal.proposer_email}**\n\n{message}",
+            color=color,
+        )
 
-        # Send email via n8n if configured
-        if self.n8n_webhook_url:
-            await self._send_n8n_webhook(
-                event=f"proposal_{action}",
-                data={
-                    "proposer_email": proposal.proposer_email,
-                    "reviewer_email": proposal.reviewer_email,
-                    "article_title": proposal.article_title,
-                    "action": action,
-                    "reviewer_notes": reviewer_notes,
-                    "proposal_id": proposal.id,
-                },
-            )
+        # Email via n8n
+        await self._send_n8n_webhook(
+            event=f"proposal_{action}",
+            data={
+                "proposer_email": proposal.proposer_email,
+                "reviewer_email": proposal.reviewer_email,
+                "article_title": proposal.article_title,
+                "action": action,
+                "reviewer_notes": reviewer_notes,
+                "proposal_id": proposal.id,
+            },
+        )
 
         logger.info(f"Sent review notification to {proposal.proposer_email}: {action}")
 
@@ -243,47 +243,35 @@ class NotificationService:
         description: str,
         color: int = 0x3498DB,
     ) -> None:
-        """Send notification to Discord webhook."""
-        if not self.discord_webhook_url:
-            return
-
+        """Queue a Discord notification (dropped if no Discord webhook is configured)."""
         try:
-            async with httpx.AsyncClient() as client:
-                await client.post(
-                    self.discord_webhook_url,
-                    json={
-                        "embeds": [
-                            {
-                                "title": title,
-                                "description": description,
-                                "color": color,
-                                "footer": {"text": "Knowledge Base"},
-                                "timestamp": datetime.utcnow().isoformat(),
-                            }
-                        ]
-                    },
-                )
+            await self.dispatcher.enqueue(
+                "discord",
+                {
+                    "title": title,
+                    "description": description,
+                    "color": color,
+                    "footer": {"text": "Knowledge Base"},
+                    "timestamp": datetime.utcnow().isoformat(),
+                },
+            )
         except Exception as e:
-            logger.warning(f"Failed to send Discord notification: {e}")
+            logger.warning(f"Failed to queue Discord notification: {e}")
 
     async def _send_n8n_webhook(
         self,
         event: str,
         data: dict[str, Any],
     ) -> None:
-        """Send notification via n8n webhook."""
-        if not self.n8n_webhook_url:
-            return
-
+        """Queue an n8n webhook event (dropped if no n8n webhook is configured)."""
         try:
-            async with httpx.AsyncClient() as client:
-                await client.post(
-                    self.n8n_webhook_url,
-                    json={
-                        "event": event,
-                        "timestamp": datetime.utcnow().isoformat(),
-                        **data,
-                    },
-                )
+            await self.dispatcher.enqueue(
+                "n8n",
+                {
+                    "event": event,
+                    "timestamp": datetime.utcnow().isoformat(),
+                    **data,
+                },
+            )
         except Exception as e:
-            logger.warning(f"Failed to send n8n webhook: {e}")
+            logger.warning(f"Failed to queue n8n webhook: {e}")
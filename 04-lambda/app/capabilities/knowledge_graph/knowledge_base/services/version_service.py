@@ -0,0 +1,162 @@
+"""Article version history service."""
+
+import logging
+from datetime import datetime
+
+from app.capabilities.knowledge_graph.knowledge_base.config import config
+from app.capabilities.knowledge_graph.knowledge_base.models import Article, ArticleVersion
+from app.capabilities.knowledge_graph.knowledge_base.versions import (
+    rebuild_contents,
+    version_document,
+)
+from pymongo import AsyncMongoClient
+from pymongo.errors import DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+
+def _to_version(document: dict, content: str) -> ArticleVersion:
+    return ArticleVersion(
+        version=document["version"],
+        content=content,
+        changed_at=document["changed_at"],
+        changed_by=document["changed_by"],
+        change_reason=document.get("change_reason"),
+    )
+
+
+class VersionService:
+    """Service for storing and rebuilding article versions (see ``versions``)."""
+
+    def __init__(self, mongo_client: AsyncMongoClient):
+        """
+        Initialize the version service.
+
+        Args:
+            mongo_client: MongoDB async client
+        """
+        self.db = mongo_client[config.mongodb_database]
+        self.collection = self.db[config.versions_collection]
+        self.snapshot_interval = config.version_snapshot_interval
+
+    async def record_created(self, article: Article) -> None:
+        """Store the first version of a new article."""
+        await self.collection.insert_one(
+            version_document(
+                article.id,
+                article.version,
+                article.content,
+                None,
+                self.snapshot_interval,
+                changed_at=article.created_at,
+                changed_by=article.author_email,
+                change_reason=None,
+            )
+        )
+
+    async def record_update(
+        self,
+        article: Article,
+        new_content: str,
+        changed_at: datetime,
+        changed_by: str,
+        change_reason: str | None = None,
+    ) -> int:
+        """
+        Store the version an edit creates, as a diff against the article's current content.
+
+        Articles whose current version was never recorded (created before
+        versions were kept separately and not migrated) get it stored first
+        as a snapshot, so the new diff has a base.
+
+        Args:
+            article: Article before the edit
+            new_content: Content after the edit
+            changed_at: Time of the edit
+            changed_by: Email of the editor
+            change_reason: Reason given for the edit
+
+        Returns:
+            The new version number
+        """
+        recorded = await self.collection.find_one(
+            {"article_id": article.id, "version": article.version}, {"_id": 1}
+        )
+        if recorded is None:
+            await self._insert(
+                version_document(
+                    article.id,
+                    article.version,
+                    article.content,
+                    None,
+                    self.snapshot_interval,
+                    changed_at=article.updated_at,
+                    changed_by=article.author_email,
+                    change_reason=None,
+                )
+            )
+
+        version = article.version + 1
+        await self._insert(
+            version_document(
+                article.id,
+                version,
+                new_content,
+                article.content,
+                self.snapshot_interval,
+                changed_at=changed_at,
+                changed_by=changed_by,
+                change_reason=change_reason,
+            )
+        )
+        return version
+
+    async def _insert(self, document: dict) -> None:
+        # The article update claimed this version, so a document already stored
+        # for it holds the same content: the next edit recorded it as its base
+        # snapshot before this edit got here
+        try:
+            await self.collection.insert_one(document)
+        except DuplicateKeyError:
+            logger.debug(
+                f"Version {document['version']} of article {document['article_id']} "
+                "already recorded"
+            )
+
+    async def get_history(self, article_id: str) -> list[ArticleVersion]:
+        """All recorded versions of an article, oldest first (the last is the current one)."""
+        documents = self.collection.find({"article_id": article_id}).sort("version", 1)
+        return [
+            _to_version(document, content)
+            for document, content in rebuild_contents(await documents.to_list())
+        ]
+
+    async def get_version(self, article_id: str, version: int) -> ArticleVersion | None:
+        """
+        Rebuild one version of an article.
+
+        Reads the nearest snapshot at or before the version and the diffs after it.
+        """
+        snapshot = await self.collection.find_one(
+            {"article_id": article_id, "version": {"$lte": version}, "snapshot": {"$exists": True}},
+            sort=[("version", -1)],
+        )
+        if snapshot is None:
+            return None
+        diffs = await (
+            self.collection.find(
+                {"article_id": article_id, "version": {"$gt": snapshot["version"], "$lte": version}}
+            )
+            .sort("version", 1)
+            .to_list()
+        )
+        document, content = rebuild_contents([snapshot, *diffs])[-1]
+        if document["version"] != version:
+            return None
+        return _to_version(document, content)
+
+    async def delete_history(self, article_id: str) -> int:
+        """Delete every stored version of an article."""
+        result = await self.collection.delete_many({"article_id": article_id})
+        logger.info(f"Deleted {result.deleted_count} versions of article {article_id}")
+        return result.deleted_count
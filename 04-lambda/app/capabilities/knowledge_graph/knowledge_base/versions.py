@@ -0,0 +1,103 @@
+"""Article version encoding.
+
+Article versions live in their own collection (KB_VERSIONS_COLLECTION), one
+document per version, rather than inside the article:
+
+    {article_id, version, changed_at, changed_by, change_reason,
+     snapshot: <full content>}  or  {..., diff: <ops>}
+
+The first version of an article, and every ``snapshot_interval``-th one after
+it, stores its full content. The others store a line diff against the version
+stored before them, so any version is rebuilt from its nearest snapshot plus
+fewer than ``snapshot_interval`` diffs.
+
+A diff is a list of ops over the previous version's lines (line endings kept):
+``[start, end]`` copies lines ``start:end`` and a string inserts that text.
+"""
+
+from collections.abc import Iterable
+from difflib import SequenceMatcher
+from typing import Any
+
+DiffOp = list[int] | str
+
+
+def make_diff(old: str, new: str) -> list[DiffOp]:
+    """Ops that turn ``old`` into ``new``."""
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    matcher = SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    ops: list[DiffOp] = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append("".join(new_lines[j1:j2]))
+    return ops
+
+
+def apply_diff(old: str, ops: list[DiffOp]) -> str:
+    """Rebuild the content a diff was made for from the content it was made against."""
+    old_lines = old.splitlines(keepends=True)
+    return "".join(op if isinstance(op, str) else "".join(old_lines[op[0] : op[1]]) for op in ops)
+
+
+def is_snapshot(version: int, snapshot_interval: int) -> bool:
+    """Whether ``version`` stores full content (versions 1, 1 + interval, ...)."""
+    return snapshot_interval <= 1 or version % snapshot_interval == 1
+
+
+def version_document(
+    article_id: str,
+    version: int,
+    content: str,
+    previous_content: str | None,
+    snapshot_interval: int,
+    **fields: Any,
+) -> dict[str, Any]:
+    """
+    Versions collection document for one article version.
+
+    Args:
+        article_id: Article ID
+        version: Version number
+        content: Content of this version
+        previous_content: Content of the version stored before it, or None to
+            store a snapshot (there is none, or it was not recorded)
+        snapshot_interval: Store full content every this many versions
+        **fields: changed_at, changed_by and change_reason
+
+    Returns:
+        Document to insert
+    """
+    document = {"article_id": article_id, "version": version, **fields}
+    if previous_content is None or is_snapshot(version, snapshot_interval):
+        document["snapshot"] = content
+    else:
+        document["diff"] = make_diff(previous_content, content)
+    return document
+
+
+def rebuild_contents(documents: Iterable[dict[str, Any]]) -> list[tuple[dict[str, Any], str]]:
+    """
+    Content of each version from version documents in ascending version order.
+
+    The first document must be a snapshot.
+
+    Raises:
+        ValueError: If a diff comes before any snapshot
+    """
+    rebuilt = []
+    content: str | None = None
+    for document in documents:
+        if "snapshot" in document:
+            content = document["snapshot"]
+        elif content is None:
+            raise ValueError(
+                f"Version {document['version']} of article {document['article_id']} "
+                "has no snapshot to apply its diff to"
+            )
+        else:
+            content = apply_diff(content, document["diff"])
+        rebuilt.append((document, content))
+    return rebuilt
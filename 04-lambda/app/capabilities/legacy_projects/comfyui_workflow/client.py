@@ -1,7 +1,9 @@
 """ComfyUI API client for workflow execution."""
 
 import asyncio
+import contextlib
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 import aiohttp
@@ -17,12 +19,16 @@ class ComfyUIClient:
     def __init__(self, config: ComfyUIConfig | None = None):
         self.config = config or ComfyUIConfig()
         self._session: aiohttp.ClientSession | None = None
+        self._ws_session: aiohttp.ClientSession | None = None
+
+    def _auth_headers(self) -> dict[str, str]:
+        if self.config.is_remote and self.config.comfyui_access_token:
+            return {"CF-Access-Token": self.config.comfyui_access_token}
+        return {}
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
-            headers = {"Content-Type": "application/json"}
-            if self.config.is_remote and self.config.comfyui_access_token:
-                headers["CF-Access-Token"] = self.config.comfyui_access_token
+            headers = {"Content-Type": "application/json", **self._auth_headers()}
             self._session = aiohttp.ClientSession(
                 headers=headers,
                 timeout=aiohttp.ClientTimeout(total=self.config.submit_timeout),
@@ -33,12 +39,33 @@ class ComfyUIClient:
         if self._session and not self._session.closed:
             await self._session.close()
             self._session = None
+        if self._ws_session and not self._ws_session.closed:
+            await self._ws_session.close()
+            self._ws_session = None
+
+    async def connect_websocket(self, client_id: str) -> aiohttp.ClientWebSocketResponse:
+        """Open ComfyUI's /ws event stream for client_id (the caller closes it).
 
-    async def submit_workflow(self, workflow_json: dict[str, Any]) -> str | None:
+        Uses its own session: the API session's total timeout would end the stream.
+        """
+        if self._ws_session is None or self._ws_session.closed:
+            self._ws_session = aiohttp.ClientSession(headers=self._auth_headers())
+        return await self._ws_session.ws_connect(
+            self.config.ws_url,
+            params={"clientId": client_id},
+            heartbeat=30,
+            timeout=aiohttp.ClientWSTimeout(ws_close=10),
+        )
+
+    async def submit_workflow(
+        self, workflow_json: dict[str, Any], client_id: str | None = None
+    ) -> str | None:
         """Submit a workflow to ComfyUI using standard /prompt endpoint.
 
         Args:
             workflow_json: ComfyUI workflow in API format
+            client_id: Websocket client that receives the execution events
+                (a new one per submission if not provided)
 
         Returns:
             Prompt ID if successful, None otherwise
@@ -48,8 +75,8 @@ class ComfyUIClient:
         session = await self._get_session()
         url = f"{self.config.comfyui_url.rstrip('/')}{self.config.submit_endpoint}"
 
-        # Generate a unique client_id for this submission
-        client_id = str(uuid.uuid4())
+        # ComfyUI sends execution events only to the submitting client_id
+        client_id = client_id or str(uuid.uuid4())
 
         # Standard ComfyUI /prompt payload format
         payload = {
@@ -163,6 +190,28 @@ class ComfyUIClient:
             logger.warning(f"Error getting image: {e}")
             return None
 
+    @contextlib.asynccontextmanager
+    async def open_image(
+        self, filename: str, subfolder: str = "", folder_type: str = "output"
+    ) -> AsyncIterator[AsyncIterator[bytes]]:
+        """Stream an output image from /view in view_chunk_size chunks.
+
+        Usage:
+            async with client.open_image(filename) as chunks:
+                async for chunk in chunks:
+                    ...
+
+        Raises:
+            aiohttp.ClientError: If the image cannot be fetched
+        """
+        session = await self._get_session()
+        params = {"filename": filename, "subfolder": subfolder, "type": folder_type}
+        url = f"{self.config.comfyui_url.rstrip('/')}{self.config.view_endpoint}"
+
+        async with session.get(url, params=params) as response:
+            response.raise_for_status()
+            yield response.content.iter_chunked(self.config.view_chunk_size)
+
     def extract_output_images(self, result: dict[str, Any]) -> list[dict[str, str]]:
         images = []
         outputs = result.get("outputs", {})
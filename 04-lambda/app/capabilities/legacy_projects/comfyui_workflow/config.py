@@ -19,9 +19,24 @@ class ComfyUIConfig:
     history_endpoint: str = "/history"
     view_endpoint: str = "/view"
     queue_endpoint: str = "/queue"
+    ws_endpoint: str = "/ws"
     submit_timeout: int = 30
     poll_timeout: int = 600
     poll_interval: int = 5
+    # Track runs over ComfyUI's websocket instead of polling /history
+    use_websocket: bool = field(
+        default_factory=lambda: os.getenv("COMFYUI_USE_WEBSOCKET", "true").lower() == "true"
+    )
+    # Seconds to wait for the websocket before submitting; minimum seconds between
+    # node progress writes to a run record
+    ws_connect_timeout: float = 5.0
+    progress_update_interval: float = 1.0
+    # Output images stored (MinIO, Immich) at once when a run completes
+    output_concurrency: int = field(
+        default_factory=lambda: int(os.getenv("COMFYUI_OUTPUT_CONCURRENCY", "4"))
+    )
+    # Bytes per chunk when streaming images from /view
+    view_chunk_size: int = 256 * 1024
     minio_bucket: str = "comfyui-outputs"
     minio_prefix: str = "images"
 
@@ -32,6 +47,15 @@ class ComfyUIConfig:
     # Prefix for database-managed workflows in the file system
     managed_workflow_prefix: str = "db_"
 
+    @property
+    def ws_url(self) -> str:
+        base = self.comfyui_url.rstrip("/")
+        if base.startswith("https://"):
+            base = "wss://" + base.removeprefix("https://")
+        elif base.startswith("http://"):
+            base = "ws://" + base.removeprefix("http://")
+        return f"{base}{self.ws_endpoint}"
+
     @property
     def is_remote(self) -> bool:
         return any(domain in self.comfyui_url for domain in ["datacrew.space", "https://"])
@@ -0,0 +1,242 @@
+"""Local stand-in for a ComfyUI server, for offline tests and benchmarks.
+
+FakeComfyUI serves the endpoints ComfyUIClient and ComfyUIRunTracker use on a
+random localhost port: POST /prompt, GET /history/{prompt_id}, GET /view (image
+bytes, streamed in chunks) and the /ws event websocket. Submitted prompts are
+"executed" node by node in the background with the real event sequence, sent
+only to the websocket of the submitting client_id:
+
+    execution_start, executing (per node), progress (per step of sampler nodes),
+    executed (SaveImage nodes, with their images), execution_success or
+    execution_error, executing with node None
+
+History entries appear once a prompt has finished, as in ComfyUI.
+
+Usage:
+    async with FakeComfyUI(steps=4) as comfyui:
+        client = ComfyUIClient(ComfyUIConfig(comfyui_url=comfyui.url))
+"""
+
+import asyncio
+import itertools
+from typing import Any
+from uuid import uuid4
+
+from aiohttp import WSMsgType, web
+
+# Node types that report per-step progress / produce output images
+SAMPLER_NODES = {"KSampler", "KSamplerAdvanced", "SamplerCustom", "SamplerCustomAdvanced"}
+OUTPUT_NODES = {"SaveImage"}
+
+VIEW_CHUNK_SIZE = 64 * 1024
+
+
+def image_bytes(filename: str, size: int) -> bytes:
+    """Deterministic fake image content for ``filename``."""
+    seed = filename.encode() or b"image"
+    return (b"\x89PNG\r\n\x1a\n" + seed * (size // len(seed) + 1))[:size]
+
+
+class FakeComfyUI:
+    """aiohttp server emulating ComfyUI's prompt, history, view and websocket API."""
+
+    def __init__(
+        self,
+        steps: int = 4,
+        step_delay: float = 0.0,
+        images_per_prompt: int = 1,
+        image_size: int = 256 * 1024,
+        fail: bool = False,
+    ):
+        """
+        Configure the fake (call start() or use ``async with`` to serve).
+
+        Args:
+            steps: Progress steps reported per sampler node
+            step_delay: Seconds per step (and per node), i.e. simulated generation time
+            images_per_prompt: Images each SaveImage node produces
+            image_size: Bytes served by /view per image
+            fail: Fail every prompt with execution_error at its first sampler node
+        """
+        self.steps = steps
+        self.step_delay = step_delay
+        self.images_per_prompt = images_per_prompt
+        self.image_size = image_size
+        self.fail = fail
+        self.history: dict[str, dict[str, Any]] = {}
+        self.prompt_requests = 0
+        self.history_requests = 0
+        self.view_requests = 0
+        self.ws_connections = 0
+        self._clients: dict[str, set[web.WebSocketResponse]] = {}
+        self._executions: set[asyncio.Task] = set()
+        self._counter = itertools.count(1)
+        self._runner: web.AppRunner | None = None
+        self._port: int | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._port}"
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/prompt", self._prompt)
+        app.router.add_get("/history/{prompt_id}", self._history)
+        app.router.add_get("/view", self._view)
+        app.router.add_get("/ws", self._ws)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", self._port or 0)
+        await site.start()
+        # Keep the port across stop()/start() so clients can reconnect
+        self._port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        for task in list(self._executions):
+            task.cancel()
+        await self.disconnect_clients()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "FakeComfyUI":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def disconnect_clients(self) -> None:
+        """Close every websocket (clients are expected to reconnect)."""
+        for sockets in list(self._clients.values()):
+            for ws in list(sockets):
+                await ws.close()
+
+    async def wait_idle(self) -> None:
+        """Wait until every submitted prompt has finished executing."""
+        while self._executions:
+            await asyncio.gather(*self._executions, return_exceptions=True)
+
+    async def _prompt(self, request: web.Request) -> web.Response:
+        self.prompt_requests += 1
+        body = await request.json()
+        workflow = body.get("prompt")
+        if not isinstance(workflow, dict) or not workflow:
+            return web.json_response(
+                {"error": {"type": "prompt_no_outputs", "message": "Prompt has no outputs"}},
+                status=400,
+            )
+        prompt_id = str(uuid4())
+        task = asyncio.create_task(self._execute(prompt_id, body.get("client_id") or "", workflow))
+        self._executions.add(task)
+        task.add_done_callback(self._executions.discard)
+        return web.json_response({"prompt_id": prompt_id, "number": next(self._counter)})
+
+    async def _history(self, request: web.Request) -> web.Response:
+        self.history_requests += 1
+        prompt_id = request.match_info["prompt_id"]
+        entry = self.history.get(prompt_id)
+        return web.json_response({prompt_id: entry} if entry else {})
+
+    async def _view(self, request: web.Request) -> web.StreamResponse:
+        self.view_requests += 1
+        filename = request.query.get("filename", "")
+        data = image_bytes(filename, self.image_size)
+        response = web.StreamResponse(headers={"Content-Type": "image/png"})
+        response.content_length = len(data)
+        await response.prepare(request)
+        for offset in range(0, len(data), VIEW_CHUNK_SIZE):
+            await response.write(data[offset : offset + VIEW_CHUNK_SIZE])
+        await response.write_eof()
+        return response
+
+    async def _ws(self, request: web.Request) -> web.WebSocketResponse:
+        client_id = request.query.get("clientId") or str(uuid4())
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.ws_connections += 1
+        self._clients.setdefault(client_id, set()).add(ws)
+        try:
+            await ws.send_json(
+                {
+                    "type": "status",
+                    "data": {"status": {"exec_info": {"queue_remaining": 0}}, "sid": client_id},
+                }
+            )
+            async for message in ws:
+                if message.type == WSMsgType.ERROR:
+                    break
+        finally:
+            self._clients.get(client_id, set()).discard(ws)
+        return ws
+
+    async def _send(self, client_id: str, kind: str, data: dict[str, Any]) -> None:
+        for ws in list(self._clients.get(client_id, ())):
+            if not ws.closed:
+                await ws.send_json({"type": kind, "data": data})
+
+    async def _execute(self, prompt_id: str, client_id: str, workflow: dict[str, Any]) -> None:
+        outputs: dict[str, Any] = {}
+        error: dict[str, Any] | None = None
+        await asyncio.sleep(0)  # the /prompt response goes out first
+        await self._send(client_id, "execution_start", {"prompt_id": prompt_id})
+
+        for node_id, node in workflow.items():
+            class_type = node.get("class_type", "") if isinstance(node, dict) else ""
+            await self._send(client_id, "executing", {"node": node_id, "prompt_id": prompt_id})
+            if class_type in SAMPLER_NODES:
+                if self.fail:
+                    error = {
+                        "prompt_id": prompt_id,
+                        "node_id": node_id,
+                        "node_type": class_type,
+                        "exception_type": "RuntimeError",
+                        "exception_message": "Fake ComfyUI failure",
+                    }
+                    break
+                for step in range(1, self.steps + 1):
+                    await asyncio.sleep(self.step_delay)
+                    await self._send(
+                        client_id,
+                        "progress",
+                        {"value": step, "max": self.steps, "prompt_id": prompt_id, "node": node_id},
+                    )
+            elif class_type in OUTPUT_NODES:
+                images = [
+                    {
+                        "filename": f"ComfyUI_{prompt_id[:8]}_{node_id}_{i:05d}_.png",
+                        "subfolder": "",
+                        "type": "output",
+                    }
+                    for i in range(1, self.images_per_prompt + 1)
+                ]
+                outputs[node_id] = {"images": images}
+                await self._send(
+                    client_id,
+                    "executed",
+                    {"node": node_id, "output": outputs[node_id], "prompt_id": prompt_id},
+                )
+            await asyncio.sleep(self.step_delay)
+
+        if error is not None:
+            self.history[prompt_id] = {
+                "prompt": workflow,
+                "outputs": outputs,
+                "status": {
+                    "status_str": "error",
+                    "completed": False,
+                    "messages": [["execution_error", error]],
+                },
+            }
+            await self._send(client_id, "execution_error", error)
+        else:
+            self.history[prompt_id] = {
+                "prompt": workflow,
+                "outputs": outputs,
+                "status": {"status_str": "success", "completed": True, "messages": []},
+            }
+            await self._send(client_id, "execution_success", {"prompt_id": prompt_id})
+        await self._send(client_id, "executing", {"node": None, "prompt_id": prompt_id})
+
+
+__all__ = ["FakeComfyUI", "image_bytes"]
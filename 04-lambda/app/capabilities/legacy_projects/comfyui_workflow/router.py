@@ -1,6 +1,7 @@
 """FastAPI router for ComfyUI Workflow endpoints."""
 
 import asyncio
+import json
 import logging
 import os
 from uuid import UUID
@@ -40,6 +41,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Seconds between run record re-reads in /runs/{run_id}/stream when no event arrives
+STREAM_REFRESH_SECONDS = 5.0
+
 # Cached singleton instances
 _minio_client: MinIOClient | None = None
 _immich_service: ImmichService | None = None
@@ -112,6 +116,14 @@ async def get_service() -> ComfyUIWorkflowService:
     return _service
 
 
+async def shutdown_comfyui_service() -> None:
+    """Stop run tracking and close the ComfyUI client of the shared service."""
+    global _service
+    if _service is not None:
+        await _service.close()
+        _service = None
+
+
 @router.post("/workflows", response_model=WorkflowResponse)
 async def create_workflow(
     workflow_data: WorkflowCreate,
@@ -483,6 +495,10 @@ async def stream_run_status(
     This endpoint provides real-time status updates without polling.
     The stream ends when the run reaches a terminal state (completed or failed).
 
+    Unnamed events carry the full run (WorkflowRunResponse) whenever it changes.
+    While ComfyUI is generating, named ``progress`` events carry node progress
+    from the ComfyUI websocket: ``{"node", "node_name", "value", "max"}``.
+
     Example client usage (JavaScript):
     ```javascript
     const eventSource = new EventSource('/api/v1/comfyui/runs/{run_id}/stream');
@@ -509,42 +525,59 @@ async def stream_run_status(
     """
 
     async def event_generator():
-        """Generate SSE events with status updates."""
+        """Generate SSE events: run snapshots as they change, node progress as it happens."""
+        queue = service.events.subscribe(run_id)
         last_status = None
-        poll_interval = 1  # Check every second
-
-        while True:
-            try:
-                # Get current status (don't trigger ComfyUI check - background task handles that)
-                run = await service.get_run_status(
-                    run_id, user.uid, check_comfyui=False, upload_to_immich=False
-                )
-
-                if not run:
-                    yield "data: {'error': 'Run not found'}\n\n"
-                    break
-
-                # Only send update if status changed or progress changed
-                current_status = (
-                    run.status,
-                    run.progress_message,
-                    run.images_completed,
-                    len(run.immich_asset_ids),
-                )
-                if current_status != last_status:
-                    last_status = current_status
-                    yield f"data: {run.model_dump_json()}\n\n"
-
-                # Check for terminal state
-                if run.status in (RunStatus.COMPLETED, RunStatus.FAILED):
+        try:
+            while True:
+                try:
+                    # Get current status (don't trigger ComfyUI check - background task handles that)
+                    run = await service.get_run_status(
+                        run_id, user.uid, check_comfyui=False, upload_to_immich=False
+                    )
+
+                    if not run:
+                        yield "data: {'error': 'Run not found'}\n\n"
+                        break
+
+                    # Only send update if status changed or progress changed
+                    current_status = (
+                        run.status,
+                        run.progress_message,
+                        run.images_completed,
+                        len(run.immich_asset_ids),
+                    )
+                    if current_status != last_status:
+                        last_status = current_status
+                        yield f"data: {run.model_dump_json()}\n\n"
+
+                    # Check for terminal state
+                    if run.status in (RunStatus.COMPLETED, RunStatus.FAILED):
+                        break
+
+                    # Wait for the next event; node progress is forwarded as is, anything
+                    # else means the run record changed. The timeout re-reads the record
+                    # for runs driven by another worker and keeps the connection alive.
+                    while True:
+                        try:
+                            event = await asyncio.wait_for(
+                                queue.get(), timeout=STREAM_REFRESH_SECONDS
+                            )
+                        except asyncio.TimeoutError:
+                            yield ": keep-alive\n\n"
+                            break
+                        if event.get("type") == "closed":
+                            return  # the service is shutting down
+                        if event.get("type") != "progress":
+                            break
+                        yield f"event: progress\ndata: {json.dumps(event)}\n\n"
+
+                except Exception:
+                    logger.exception("Error streaming run status")
+                    yield "data: {'error': 'Internal error'}\n\n"
                     break
-
-                await asyncio.sleep(poll_interval)
-
-            except Exception:
-                logger.exception("Error streaming run status")
-                yield "data: {'error': 'Internal error'}\n\n"
-                break
+        finally:
+            service.events.unsubscribe(run_id, queue)
 
     return StreamingResponse(
         event_generator(),
@@ -605,7 +638,9 @@ async def generate_from_reference(
         logger.info(f"Vision analysis: {vision_analysis.description[:100]}...")
 
         # Step 2: Generate optimized prompt
-        from app.capabilities.legacy_projects.controlnet_skeleton.vision_service import VisionAnalysisService
+        from app.capabilities.legacy_projects.controlnet_skeleton.vision_service import (
+            VisionAnalysisService,
+        )
 
         vision_service_instance = VisionAnalysisService()
         optimized_prompt = await vision_service_instance.generate_prompt_from_analysis(
@@ -616,7 +651,9 @@ async def generate_from_reference(
         # Step 3: Find matching skeleton if requested
         skeleton = None
         if use_controlnet and auto_select_skeleton:
-            from app.capabilities.legacy_projects.controlnet_skeleton.models import SkeletonSearchRequest
+            from app.capabilities.legacy_projects.controlnet_skeleton.models import (
+                SkeletonSearchRequest,
+            )
 
             search_query = skeleton_search_query or prompt_description
             logger.info(f"Searching for skeleton: {search_query}")
@@ -27,10 +27,22 @@ from .models import (
     WorkflowVersionListResponse,
     WorkflowVersionSummary,
 )
+from .tracker import ComfyUIRunTracker, RunEventHub
 
 logger = logging.getLogger(__name__)
 
 
+def _content_type(filename: str) -> str:
+    lower_filename = filename.lower()
+    if lower_filename.endswith((".jpg", ".jpeg")):
+        return "image/jpeg"
+    if lower_filename.endswith(".webp"):
+        return "image/webp"
+    if lower_filename.endswith(".gif"):
+        return "image/gif"
+    return "image/png"
+
+
 def _row_to_workflow(row: asyncpg.Record) -> WorkflowResponse:
     """Convert a database row to WorkflowResponse."""
     return WorkflowResponse(
@@ -113,18 +125,129 @@ def _row_to_lora(row: asyncpg.Record) -> LoRAModelResponse:
 
 
 class ComfyUIWorkflowService:
-    """Service for managing ComfyUI workflows and execution."""
+    """Service for managing ComfyUI workflows and execution.
+
+    Runs are tracked over ComfyUI's websocket (ComfyUIRunTracker) when
+    COMFYUI_USE_WEBSOCKET is enabled: completion is processed as soon as ComfyUI
+    reports it and node progress is written to the run record. Otherwise runs are
+    polled via /history. Every run record write is published on ``events`` for
+    SSE subscribers.
+    """
 
     def __init__(
         self,
         pool: asyncpg.Pool,
         minio_client: MinIOClient | None = None,
         immich_service: ImmichService | None = None,
+        client: ComfyUIClient | None = None,
+        tracker: ComfyUIRunTracker | None = None,
     ):
         self.pool = pool
-        self.client = ComfyUIClient()
+        self.client = client or ComfyUIClient()
         self.minio_client = minio_client
         self.immich_service = immich_service
+        self.events = tracker.events if tracker else RunEventHub()
+        if tracker is None and self.client.config.use_websocket:
+            tracker = ComfyUIRunTracker(
+                self.client, self.events, on_progress=self._on_generation_progress
+            )
+        self.tracker = tracker
+        self._background: set[asyncio.Task] = set()
+
+    async def close(self) -> None:
+        """
+        Cancel background run work, stop run tracking and close the ComfyUI client.
+
+        Runs interrupted here keep their status; get_run_status picks them up
+        from /history once they are no longer tracked.
+        """
+        for task in self._background:
+            task.cancel()
+        await asyncio.gather(*self._background, return_exceptions=True)
+        if self.tracker:
+            await self.tracker.stop()
+        self.events.close()
+        await self.client.close()
+
+    # ========== Run Tracking ==========
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _submit(self, workflow: dict[str, Any], run_id: UUID) -> str | None:
+        """Submit a workflow and start tracking it under run_id."""
+        if self.tracker:
+            # Events for a prompt go only to the websocket it was submitted under
+            await self.tracker.ensure_started()
+        prompt_id = await self.client.submit_workflow(
+            workflow, client_id=self.tracker.client_id if self.tracker else None
+        )
+        if prompt_id and self.tracker:
+            node_names = {
+                str(node_id): (node.get("_meta") or {}).get("title") or node.get("class_type")
+                for node_id, node in workflow.items()
+                if isinstance(node, dict)
+            }
+            self.tracker.track(prompt_id, run_id, node_names)
+        return prompt_id
+
+    async def _wait_for_result(self, run_id: UUID, prompt_id: str) -> dict[str, Any] | None:
+        """Wait for a submitted prompt to finish (websocket events, or /history polling)."""
+        if self.tracker:
+            return await self.tracker.wait_for_result(prompt_id, run_id)
+        return await self.client.poll_for_completion(prompt_id)
+
+    async def _on_generation_progress(self, run_id: UUID, message: str) -> None:
+        try:
+            await self._update_run_progress(
+                run_id, RunStatus.GENERATING.value, progress_message=message
+            )
+        except Exception:
+            logger.exception(f"Failed to record progress for run {run_id}")
+
+    async def _complete_when_done(
+        self,
+        run_id: UUID,
+        user_id: UUID,
+        prompt_id: str,
+        upload_to_immich: bool,
+        immich_api_key: str | None,
+    ) -> None:
+        """Background task: process a tracked run's completion as soon as it finishes."""
+        try:
+            result = await self._wait_for_result(run_id, prompt_id)
+            if not result:
+                await self._update_run_status(
+                    run_id,
+                    RunStatus.FAILED.value,
+                    "Generation timed out",
+                    error_message="ComfyUI workflow timed out",
+                )
+                return
+            if result.get("status") == "failed":
+                await self._update_run_status(
+                    run_id,
+                    RunStatus.FAILED.value,
+                    "Generation failed",
+                    error_message=result.get("error", "Unknown error"),
+                )
+                return
+            async with self.pool.acquire() as conn:
+                await self._process_completion(
+                    conn,
+                    run_id,
+                    user_id,
+                    result,
+                    upload_to_immich=upload_to_immich,
+                    immich_api_key=immich_api_key,
+                )
+        except Exception as e:
+            logger.exception(f"Completion processing failed for run {run_id}")
+            await self._update_run_status(
+                run_id, RunStatus.FAILED.value, "Generation failed", error_message=str(e)
+            )
 
     # ========== Progress Tracking Helpers ==========
 
@@ -175,22 +298,28 @@ class ComfyUIWorkflowService:
                     status,
                     progress_message,
                 )
+        self.events.publish(run_id, {"type": "run"})
 
     async def _update_run_progress(
         self,
         run_id: UUID,
         status: str,
-        images_completed: int,
-        images_total: int,
+        images_completed: int | None = None,
+        images_total: int | None = None,
         progress_message: str | None = None,
     ) -> None:
-        """Update run progress for image uploads."""
+        """Update run progress: image uploads, or node progress while generating.
+
+        Image counts left as None keep their current values.
+        """
         msg = progress_message or f"Uploading images ({images_completed}/{images_total})"
         async with self.pool.acquire() as conn:
             await conn.execute(
                 """
                 UPDATE comfyui_workflow_runs
-                SET status = $2, progress_message = $3, images_completed = $4, images_total = $5
+                SET status = $2, progress_message = $3,
+                    images_completed = COALESCE($4, images_completed),
+                    images_total = COALESCE($5, images_total)
                 WHERE id = $1
                 """,
                 run_id,
@@ -199,44 +328,25 @@ class ComfyUIWorkflowService:
                 images_completed,
                 images_total,
             )
-
-    async def _add_immich_asset(self, run_id: UUID, asset_id: str) -> None:
-        """Add a single Immich asset ID to the run's immich_asset_ids array."""
-        async with self.pool.acquire() as conn:
-            await conn.execute(
-                """
-                UPDATE comfyui_workflow_runs
-                SET immich_asset_ids = array_append(immich_asset_ids, $2)
-                WHERE id = $1
-                """,
-                run_id,
-                asset_id,
-            )
-
-    async def _add_minio_path(self, run_id: UUID, minio_path: str) -> None:
-        """Add a single MinIO path to the run's minio_paths array."""
-        async with self.pool.acquire() as conn:
-            await conn.execute(
-                """
-                UPDATE comfyui_workflow_runs
-                SET minio_paths = array_append(minio_paths, $2)
-                WHERE id = $1
-                """,
-                run_id,
-                minio_path,
-            )
+        self.events.publish(run_id, {"type": "run"})
 
     async def _mark_run_completed(
         self,
         run_id: UUID,
         output_images: list[str],
+        minio_paths: list[str] | None = None,
+        immich_asset_ids: list[str] | None = None,
+        images_completed: int | None = None,
     ) -> None:
-        """Mark a run as completed with final output images list."""
+        """Mark a run as completed, recording its outputs in the same statement."""
         async with self.pool.acquire() as conn:
             await conn.execute(
                 """
                 UPDATE comfyui_workflow_runs
-                SET status = $2, progress_message = $3, output_images = $4, completed_at = $5
+                SET status = $2, progress_message = $3, output_images = $4, completed_at = $5,
+                    minio_paths = COALESCE($6, minio_paths),
+                    immich_asset_ids = COALESCE($7, immich_asset_ids),
+                    images_completed = COALESCE($8, images_completed)
                 WHERE id = $1
                 """,
                 run_id,
@@ -244,7 +354,11 @@ class ComfyUIWorkflowService:
                 "Completed successfully",
                 output_images,
                 datetime.now(timezone.utc),
+                minio_paths,
+                immich_asset_ids,
+                images_completed,
             )
+        self.events.publish(run_id, {"type": "run"})
 
     async def create_workflow(
         self, user_id: UUID, workflow_data: WorkflowCreate
@@ -436,7 +550,7 @@ class ComfyUIWorkflowService:
                 now,
             )
 
-            comfyui_request_id = await self.client.submit_workflow(modified_workflow)
+            comfyui_request_id = await self._submit(modified_workflow, run_id)
 
             if comfyui_request_id:
                 await conn.execute(
@@ -449,6 +563,13 @@ class ComfyUIWorkflowService:
                     comfyui_request_id,
                     RunStatus.RUNNING.value,
                 )
+                if self.tracker:
+                    # Completion is processed when ComfyUI reports it, not when polled
+                    self._spawn(
+                        self._complete_when_done(
+                            run_id, user_id, comfyui_request_id, upload_to_immich, immich_api_key
+                        )
+                    )
             else:
                 await conn.execute(
                     """
@@ -484,9 +605,15 @@ class ComfyUIWorkflowService:
 
             run = _row_to_run(row)
 
-            # Check ComfyUI for both legacy RUNNING and new GENERATING status
+            # Check ComfyUI for both legacy RUNNING and new GENERATING status, unless
+            # the run is tracked over the websocket (its completion is processed there)
             is_generating = run.status in (RunStatus.RUNNING, RunStatus.GENERATING)
-            if check_comfyui and is_generating and run.comfyui_request_id:
+            is_tracked = bool(
+                self.tracker
+                and run.comfyui_request_id
+                and self.tracker.is_tracking(run.comfyui_request_id)
+            )
+            if check_comfyui and is_generating and run.comfyui_request_id and not is_tracked:
                 result = await self.client.get_result(run.comfyui_request_id)
                 if result:
                     status = result.get("status")
@@ -528,15 +655,17 @@ class ComfyUIWorkflowService:
         immich_api_key: str | None = None,
     ) -> WorkflowRunResponse:
         """
-        Process workflow completion: download images from ComfyUI and upload to user storage.
+        Process workflow completion: stream images from ComfyUI into user storage.
 
-        Images are uploaded progressively - each image is uploaded and the database
-        is updated immediately, so clients can see images appear in Immich as they complete.
+        Up to COMFYUI_OUTPUT_CONCURRENCY images are processed at once. Each image is
+        streamed from ComfyUI straight into MinIO and, when requested, uploaded to
+        Immich. Upload progress is published to run subscribers as it happens; the
+        run record gets all MinIO paths and Immich asset IDs in one final update.
 
         Images are always uploaded to MinIO (user-isolated storage).
         Optionally uploaded to Immich if upload_to_immich=True and user has API key.
         """
-        images = self.client.extract_output_images(result)
+        images = [img for img in self.client.extract_output_images(result) if img.get("filename")]
         output_images = [img["filename"] for img in images]
         total_images = len(images)
 
@@ -545,88 +674,121 @@ class ComfyUIWorkflowService:
             run_id, RunStatus.UPLOADING.value, 0, total_images, "Downloading images from ComfyUI..."
         )
 
-        # Download and upload each image progressively
-        for i, img_info in enumerate(images):
-            filename = img_info.get("filename")
-            subfolder = img_info.get("subfolder", "")
-            folder_type = img_info.get("type", "output")
-
-            if not filename:
-                continue
-
-            try:
-                # Download image from ComfyUI
-                image_data = await self.client.get_image(filename, subfolder, folder_type)
-                if not image_data:
-                    logger.warning(f"Failed to download image {filename} from ComfyUI")
-                    continue
-
-                # Upload to MinIO (always, for user-isolated storage)
-                if self.minio_client:
-                    try:
-                        # Determine content type
-                        content_type = "image/png"
-                        lower_filename = filename.lower()
-                        if lower_filename.endswith((".jpg", ".jpeg")):
-                            content_type = "image/jpeg"
-                        elif lower_filename.endswith(".webp"):
-                            content_type = "image/webp"
-                        elif lower_filename.endswith(".gif"):
-                            content_type = "image/gif"
-
-                        # Store in user's comfyui folder with run_id for organization
-                        object_key = f"comfyui/{run_id}/{filename}"
-                        minio_path = await self.minio_client.upload_file(
-                            user_id=user_id,
-                            file_data=image_data,
-                            object_key=object_key,
-                            content_type=content_type,
-                            metadata={
-                                "run_id": str(run_id),
-                                "source": "comfyui",
-                            },
-                        )
-                        # Progressively update MinIO paths
-                        await self._add_minio_path(run_id, minio_path)
-                        logger.info(f"Uploaded {filename} to MinIO: {minio_path}")
-                    except Exception:
-                        logger.exception(f"Failed to upload {filename} to MinIO")
-
-                # Upload to Immich (optional, if user requested and has API key)
-                # Progressive: upload immediately and update DB so image appears in Immich
-                if upload_to_immich and immich_api_key and self.immich_service:
-                    try:
-                        asset_id = await self.immich_service.upload_asset(
-                            user_api_key=immich_api_key,
-                            file_data=image_data,
-                            filename=filename,
-                            device_asset_id=f"comfyui-{run_id}-{filename}",
-                        )
-                        if asset_id:
-                            # Progressively update Immich asset IDs
-                            await self._add_immich_asset(run_id, asset_id)
-                            logger.info(f"Uploaded {filename} to Immich: {asset_id}")
-                    except Exception:
-                        logger.exception(f"Failed to upload {filename} to Immich")
-
-                # Update progress after each image
-                await self._update_run_progress(
+        if not (upload_to_immich and immich_api_key and self.immich_service):
+            immich_api_key = None
+        semaphore = asyncio.Semaphore(max(1, self.client.config.output_concurrency))
+        completed = 0
+
+        async def process(img_info: dict[str, str]) -> tuple[str | None, str | None, bool]:
+            nonlocal completed
+            async with semaphore:
+                stored = await self._store_output_image(run_id, user_id, img_info, immich_api_key)
+            if stored[2]:
+                completed += 1
+                self.events.publish(
                     run_id,
-                    RunStatus.UPLOADING.value,
-                    i + 1,
-                    total_images,
-                    f"Uploading images ({i + 1}/{total_images})",
+                    {
+                        "type": "progress",
+                        "node": None,
+                        "node_name": "Uploading images",
+                        "value": completed,
+                        "max": total_images,
+                    },
                 )
+            return stored
 
-            except Exception:
-                logger.exception(f"Error processing image {filename}")
+        stored = await asyncio.gather(*(process(img_info) for img_info in images))
 
         # Mark as completed
-        await self._mark_run_completed(run_id, output_images)
+        await self._mark_run_completed(
+            run_id,
+            output_images,
+            minio_paths=[minio_path for minio_path, _, _ in stored if minio_path],
+            immich_asset_ids=[asset_id for _, asset_id, _ in stored if asset_id],
+            images_completed=completed,
+        )
 
         row = await conn.fetchrow("SELECT * FROM comfyui_workflow_runs WHERE id = $1", run_id)
         return _row_to_run(row)
 
+    async def _store_output_image(
+        self,
+        run_id: UUID,
+        user_id: UUID,
+        img_info: dict[str, str],
+        immich_api_key: str | None,
+    ) -> tuple[str | None, str | None, bool]:
+        """
+        Copy one output image from ComfyUI to MinIO and (with an API key) Immich.
+
+        Returns:
+            (MinIO path, Immich asset ID, whether the image was processed)
+        """
+        filename = img_info["filename"]
+        subfolder = img_info.get("subfolder", "")
+        folder_type = img_info.get("type", "output")
+        content_type = _content_type(filename)
+        # Immich takes the whole file, so its copy is kept while streaming to MinIO
+        chunks: list[bytes] | None = [] if immich_api_key else None
+
+        minio_path = None
+        try:
+            async with self.client.open_image(filename, subfolder, folder_type) as stream:
+
+                async def tee():
+                    async for chunk in stream:
+                        if chunks is not None:
+                            chunks.append(chunk)
+                        yield chunk
+
+                if self.minio_client:
+                    # Store in user's comfyui folder with run_id for organization
+                    minio_path = await self.minio_client.upload_stream(
+                        user_id=user_id,
+                        chunks=tee(),
+                        object_key=f"comfyui/{run_id}/{filename}",
+                        content_type=content_type,
+                        metadata={
+                            "run_id": str(run_id),
+                            "source": "comfyui",
+                        },
+                    )
+                    logger.info(f"Uploaded {filename} to MinIO: {minio_path}")
+                elif chunks is not None:
+                    async for _ in tee():
+                        pass
+        except Exception:
+            if minio_path is None and self.minio_client:
+                logger.exception(f"Failed to stream {filename} from ComfyUI to MinIO")
+            else:
+                logger.exception(f"Failed to download image {filename} from ComfyUI")
+            if chunks is None:
+                return None, None, False
+            # The Immich copy may be partial: download the image again for it
+            chunks = None
+            image_data = await self.client.get_image(filename, subfolder, folder_type)
+            if not image_data:
+                return None, None, False
+        else:
+            image_data = b"".join(chunks) if chunks is not None else None
+
+        # Upload to Immich (optional, if user requested and has API key)
+        asset_id = None
+        if image_data is not None and immich_api_key:
+            try:
+                asset_id = await self.immich_service.upload_asset(
+                    user_api_key=immich_api_key,
+                    file_data=image_data,
+                    filename=filename,
+                    device_asset_id=f"comfyui-{run_id}-{filename}",
+                )
+                if asset_id:
+                    logger.info(f"Uploaded {filename} to Immich: {asset_id}")
+            except Exception:
+                logger.exception(f"Failed to upload {filename} to Immich")
+
+        return minio_path, asset_id, True
+
     def _convert_ui_to_api_format(self, workflow_json: dict[str, Any]) -> dict[str, Any]:
         """
         Convert ComfyUI UI workflow format to API format.
@@ -1313,7 +1475,7 @@ class ComfyUIWorkflowService:
             )
 
         # 4. Start background task for the actual generation
-        asyncio.create_task(
+        self._spawn(
             self._execute_generate_with_lora_background(
                 run_id=run_id,
                 workflow_id=workflow_id,
@@ -1456,7 +1618,7 @@ class ComfyUIWorkflowService:
                 run_id, RunStatus.SUBMITTING.value, "Submitting to ComfyUI..."
             )
 
-            comfyui_request_id = await self.client.submit_workflow(modified_workflow)
+            comfyui_request_id = await self._submit(modified_workflow, run_id)
 
             if not comfyui_request_id:
                 await self._update_run_status(
@@ -1482,14 +1644,15 @@ class ComfyUIWorkflowService:
                     "Generating images...",
                     json.dumps(input_params),
                 )
+            self.events.publish(run_id, {"type": "run"})
 
             logger.info(
                 f"Workflow {workflow_id} submitted with LoRA {character_lora}, "
                 f"prompt: '{final_positive_prompt[:50]}...', request_id: {comfyui_request_id}"
             )
 
-            # Step 6: Poll for completion
-            result = await self.client.poll_for_completion(comfyui_request_id)
+            # Step 6: Wait for completion (websocket events, or polling without the tracker)
+            result = await self._wait_for_result(run_id, comfyui_request_id)
 
             if not result:
                 await self._update_run_status(
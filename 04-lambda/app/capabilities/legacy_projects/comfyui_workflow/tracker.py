@@ -0,0 +1,383 @@
+"""Event-driven tracking of ComfyUI runs over the /ws websocket.
+
+ComfyUI sends execution events (execution_start, executing, progress, executed,
+execution_success, execution_error, ...) only to the websocket whose clientId
+submitted the prompt. ComfyUIRunTracker holds one connection under its own
+client_id, which the service passes to ComfyUIClient.submit_workflow, and:
+
+- resolves wait_for_result() as soon as a prompt finishes (outputs are read
+  once from /history, which also covers cached output nodes)
+- forwards node-level progress to the on_progress callback (throttled to one
+  call per progress_update_interval per prompt) and to RunEventHub subscribers
+- after every (re)connect, checks /history for tracked prompts that finished
+  while the connection was down; while disconnected, waiters fall back to
+  checking /history every poll_interval
+
+RunEventHub fans run events out to SSE streams; the service publishes a "run"
+event whenever it writes a run record. On shutdown, stop() fails pending waiters
+with TrackerStoppedError and RunEventHub.close() sends subscribers a "closed"
+event.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections import OrderedDict, defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID, uuid4
+
+import aiohttp
+
+from .client import ComfyUIClient
+
+logger = logging.getLogger(__name__)
+
+# Results kept for prompts that finished before (or without) anyone waiting on them
+FINISHED_PROMPTS_KEPT = 256
+
+# Reconnect backoff bounds in seconds
+RECONNECT_MIN_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+
+# Last event a subscriber gets when the hub shuts down
+CLOSED_EVENT = {"type": "closed"}
+
+ProgressCallback = Callable[[UUID, str], Awaitable[None]]
+
+
+class TrackerStoppedError(RuntimeError):
+    """The tracker stopped while a prompt was still being waited on."""
+
+
+class RunEventHub:
+    """Fan-out of run events to subscribers, one bounded queue per subscriber."""
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self.closed = False
+        self._subscribers: dict[UUID, set[asyncio.Queue]] = defaultdict(set)
+
+    def subscribe(self, run_id: UUID) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        if self.closed:
+            queue.put_nowait(CLOSED_EVENT)
+        self._subscribers[run_id].add(queue)
+        return queue
+
+    def unsubscribe(self, run_id: UUID, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(run_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[run_id]
+
+    def publish(self, run_id: UUID, event: dict[str, Any]) -> None:
+        for queue in self._subscribers.get(run_id, ()):
+            self._put(queue, event)
+
+    def close(self) -> None:
+        """Send every subscriber, current and future, a final "closed" event."""
+        self.closed = True
+        for queues in self._subscribers.values():
+            for queue in queues:
+                self._put(queue, CLOSED_EVENT)
+
+    @staticmethod
+    def _put(queue: asyncio.Queue, event: dict[str, Any]) -> None:
+        if queue.full():
+            # A slow subscriber loses its oldest event rather than blocking ComfyUI events
+            queue.get_nowait()
+        queue.put_nowait(event)
+
+
+@dataclass
+class _TrackedPrompt:
+    run_id: UUID | None
+    future: asyncio.Future
+    node_names: dict[str, str] = field(default_factory=dict)
+    last_progress_at: float = 0.0
+    progress_tasks: set[asyncio.Task] = field(default_factory=set)
+
+
+class ComfyUIRunTracker:
+    """One websocket to ComfyUI, mapping prompt_ids to runs."""
+
+    def __init__(
+        self,
+        client: ComfyUIClient,
+        events: RunEventHub | None = None,
+        on_progress: ProgressCallback | None = None,
+        client_id: str | None = None,
+    ):
+        """
+        Initialize the tracker (call start() from the event loop to connect).
+
+        Args:
+            client: ComfyUI client (websocket and /history access)
+            events: Hub that receives node progress events per run
+            on_progress: Called with (run_id, progress message) as nodes progress
+            client_id: Websocket client ID to submit prompts under (random if not provided)
+        """
+        self.client = client
+        self.config = client.config
+        self.client_id = client_id or str(uuid4())
+        self.events = events or RunEventHub()
+        self.on_progress = on_progress
+        self._prompts: dict[str, _TrackedPrompt] = {}
+        self._finished: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._outputs: dict[str, dict[str, Any]] = defaultdict(dict)
+        self._completing: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._connected = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.connections = 0
+        self.messages = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    def start(self) -> None:
+        """Start the connection loop (reconnects until stop())."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def ensure_started(self, timeout: float | None = None) -> bool:
+        """Start and wait up to ``timeout`` seconds for the websocket; returns whether connected."""
+        self.start()
+        if not self.connected:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    self._connected.wait(), timeout or self.config.ws_connect_timeout
+                )
+        return self.connected
+
+    async def stop(self) -> None:
+        """Close the websocket, cancel pending work and fail prompts still being waited on."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        tasks = [*self._tasks, *(t for p in self._prompts.values() for t in p.progress_tasks)]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._connected.clear()
+        for prompt in self._prompts.values():
+            if not prompt.future.done():
+                prompt.future.set_exception(TrackerStoppedError("ComfyUI run tracker stopped"))
+                # Waiters still get the error; a prompt nobody waits on logs nothing
+                prompt.future.exception()
+
+    def is_tracking(self, prompt_id: str) -> bool:
+        return prompt_id in self._prompts
+
+    def track(
+        self,
+        prompt_id: str,
+        run_id: UUID | None = None,
+        node_names: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Start tracking a submitted prompt. Call right after submission, before any other await.
+
+        Args:
+            prompt_id: ComfyUI prompt ID
+            run_id: Run the prompt belongs to (progress and events are reported for it)
+            node_names: Display names by node ID, for progress messages
+        """
+        if prompt_id in self._prompts:
+            return
+        prompt = _TrackedPrompt(
+            run_id=run_id,
+            future=asyncio.get_running_loop().create_future(),
+            node_names=node_names or {},
+        )
+        self._prompts[prompt_id] = prompt
+        finished = self._finished.get(prompt_id)
+        if finished is not None:
+            prompt.future.set_result(finished)
+
+    async def wait_for_result(
+        self,
+        prompt_id: str,
+        run_id: UUID | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Wait until a prompt finishes.
+
+        Returns:
+            The ComfyUIClient.get_result shape ({"status": "completed", "outputs": ...}
+            or {"status": "failed", "error": ...}), or None on timeout
+
+        Raises:
+            TrackerStoppedError: If the tracker stops before the prompt finishes
+        """
+        self.track(prompt_id, run_id)
+        prompt = self._prompts[prompt_id]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (timeout or self.config.poll_timeout)
+        try:
+            while not prompt.future.done():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return None
+                try:
+                    await asyncio.wait_for(
+                        asyncio.shield(prompt.future), min(remaining, self.config.poll_interval)
+                    )
+                except asyncio.TimeoutError:
+                    if not self.connected:
+                        # No events while disconnected: fall back to /history
+                        await self._check_history(prompt_id)
+            # Progress written after the result would overwrite the next status
+            if prompt.progress_tasks:
+                await asyncio.gather(*prompt.progress_tasks, return_exceptions=True)
+            return prompt.future.result()
+        finally:
+            self._prompts.pop(prompt_id, None)
+
+    async def _run(self) -> None:
+        delay = RECONNECT_MIN_DELAY
+        while True:
+            try:
+                ws = await self.client.connect_websocket(self.client_id)
+            except (aiohttp.ClientError, OSError, asyncio.TimeoutError) as e:
+                logger.warning(f"ComfyUI websocket unavailable ({e}), retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+                continue
+
+            delay = RECONNECT_MIN_DELAY
+            self.connections += 1
+            self._connected.set()
+            logger.info(f"ComfyUI websocket connected (client_id: {self.client_id})")
+            try:
+                # Catch up on prompts that finished while we were not listening
+                for prompt_id in list(self._prompts):
+                    self._spawn(self._check_history(prompt_id))
+                async for message in ws:
+                    if message.type == aiohttp.WSMsgType.TEXT:
+                        self.messages += 1
+                        try:
+                            self._handle(json.loads(message.data))
+                        except Exception:
+                            logger.exception("Error handling ComfyUI websocket message")
+                    elif message.type == aiohttp.WSMsgType.ERROR:
+                        break
+                    # Binary messages are latent previews
+            except (aiohttp.ClientError, OSError) as e:
+                logger.warning(f"ComfyUI websocket error: {e}")
+            finally:
+                self._connected.clear()
+                await ws.close()
+            logger.warning("ComfyUI websocket disconnected, reconnecting")
+
+    def _handle(self, message: dict[str, Any]) -> None:
+        kind = message.get("type")
+        data = message.get("data") or {}
+        prompt_id = data.get("prompt_id")
+        if not prompt_id:
+            return  # queue status
+
+        if kind == "executing":
+            node = data.get("node")
+            if node is None:
+                # Older ComfyUI signals completion this way (no execution_success)
+                self._spawn(self._complete(prompt_id))
+            else:
+                self._progress(prompt_id, node)
+        elif kind == "progress":
+            self._progress(prompt_id, data.get("node"), data.get("value"), data.get("max"))
+        elif kind == "executed":
+            if data.get("node") is not None:
+                self._outputs[prompt_id][data["node"]] = data.get("output") or {}
+        elif kind == "execution_success":
+            self._spawn(self._complete(prompt_id))
+        elif kind == "execution_error":
+            error = f"{data.get('exception_type', 'Error')}: {data.get('exception_message', '')}"
+            if data.get("node_id") is not None:
+                error += f" (node {data['node_id']})"
+            self._finish(prompt_id, {"status": "failed", "error": error.strip()})
+        elif kind == "execution_interrupted":
+            self._finish(prompt_id, {"status": "failed", "error": "Execution interrupted"})
+
+    def _progress(
+        self, prompt_id: str, node: str | None, value: int | None = None, total: int | None = None
+    ) -> None:
+        prompt = self._prompts.get(prompt_id)
+        if prompt is None or prompt.run_id is None:
+            return
+        node_name = prompt.node_names.get(str(node), f"node {node}")
+        self.events.publish(
+            prompt.run_id,
+            {
+                "type": "progress",
+                "node": node,
+                "node_name": node_name,
+                "value": value,
+                "max": total,
+            },
+        )
+
+        now = asyncio.get_running_loop().time()
+        if (
+            self.on_progress is None
+            or now - prompt.last_progress_at < self.config.progress_update_interval
+        ):
+            return
+        prompt.last_progress_at = now
+        message = f"Generating: {node_name}"
+        if value is not None and total:
+            message += f" ({value}/{total})"
+        task = asyncio.create_task(self.on_progress(prompt.run_id, message))
+        prompt.progress_tasks.add(task)
+        task.add_done_callback(prompt.progress_tasks.discard)
+
+    async def _complete(self, prompt_id: str) -> None:
+        if prompt_id in self._completing or prompt_id in self._finished:
+            return
+        self._completing.add(prompt_id)
+        try:
+            result = await self.client.get_result(prompt_id)
+            if not result or result.get("status") != "completed":
+                # History not readable: use the outputs reported over the websocket
+                result = {"status": "completed", "outputs": dict(self._outputs.get(prompt_id, {}))}
+            self._finish(prompt_id, result)
+        finally:
+            self._completing.discard(prompt_id)
+
+    async def _check_history(self, prompt_id: str) -> None:
+        result = await self.client.get_result(prompt_id)
+        if result and result.get("status") in ("completed", "failed"):
+            self._finish(prompt_id, result)
+
+    def _finish(self, prompt_id: str, result: dict[str, Any]) -> None:
+        if prompt_id in self._finished:
+            return
+        self._finished[prompt_id] = result
+        while len(self._finished) > FINISHED_PROMPTS_KEPT:
+            self._finished.popitem(last=False)
+        self._outputs.pop(prompt_id, None)
+
+        prompt = self._prompts.get(prompt_id)
+        if prompt is not None:
+            if not prompt.future.done():
+                prompt.future.set_result(result)
+            if prompt.run_id is not None:
+                self.events.publish(
+                    prompt.run_id, {"type": "generation_finished", "status": result["status"]}
+                )
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+__all__ = ["ComfyUIRunTracker", "RunEventHub", "TrackerStoppedError"]
@@ -5,6 +5,7 @@ from collections.abc import AsyncGenerator
 from typing import Annotated
 
 from app.capabilities.persona.discord_characters.dependencies import DiscordCharactersDeps
+from app.capabilities.persona.discord_characters.events import roster_events
 from app.capabilities.persona.discord_characters.models import (
     AddCharacterRequest,
     CharacterResponse,
@@ -14,9 +15,10 @@ from app.capabilities.persona.discord_characters.models import (
     EngageRequest,
     EngageResponse,
     RemoveCharacterRequest,
+    RosterEventsResponse,
 )
 from app.capabilities.persona.persona_state.dependencies import PersonaDeps
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -62,18 +64,17 @@ async def add_character_endpoint(
             if not success:
                 raise HTTPException(status_code=400, detail=message)
 
-            return {
-                "success": True,
-                "message": message,
-                "character": {
-                    "channel_id": request.channel_id,
-                    "character_id": request.character_id,
-                    "persona_id": request.persona_id or request.character_id,
-                    "name": personality.name,
-                    "byline": personality.byline,
-                    "profile_image": personality.profile_image,
-                },
+            character = {
+                "channel_id": request.channel_id,
+                "character_id": request.character_id,
+                "persona_id": request.persona_id or request.character_id,
+                "name": personality.name,
+                "byline": personality.byline,
+                "profile_image": personality.profile_image,
             }
+            roster_events.publish(request.channel_id, "add", request.character_id, character)
+
+            return {"success": True, "message": message, "character": character}
         finally:
             await persona_deps.cleanup()
 
@@ -98,6 +99,7 @@ async def remove_character_endpoint(
         if not success:
             raise HTTPException(status_code=404, detail=message)
 
+        roster_events.publish(request.channel_id, "remove", request.character_id)
         return {"success": True, "message": message}
 
     except HTTPException:
@@ -145,6 +147,22 @@ async def list_characters_endpoint(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.get("/events", response_model=RosterEventsResponse)
+async def roster_events_endpoint(
+    since: int = 0,
+    epoch: str | None = None,
+    timeout: Annotated[float, Query(ge=0, le=60)] = 25,
+):
+    """
+    Long-poll for channel roster changes (characters added or removed).
+
+    Returns as soon as there are events newer than `since`, or after `timeout`
+    seconds with an empty list. Clients pass back the returned epoch and
+    version; `reset` tells them to drop their whole cache.
+    """
+    return await roster_events.wait_for_events(since, epoch, timeout)
+
+
 @router.post("/clear-history", response_model=dict)
 async def clear_history_endpoint(
     request: ClearHistoryRequest,
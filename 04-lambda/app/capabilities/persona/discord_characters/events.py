@@ -0,0 +1,99 @@
+"""Channel roster change events for Discord bot cache invalidation.
+
+The Discord bot caches which characters are active in each channel. Whenever
+the roster changes here, an event is published to an in-process feed that the
+bot long-polls (GET /api/v1/discord/characters/events) to update its cache.
+
+Events carry a monotonically increasing version. The feed keeps only the most
+recent events and is identified by a per-process epoch, so a client that
+reconnects after a restart, or falls further behind than the retained history,
+is told to reset its whole cache instead of silently missing changes.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import deque
+from typing import Any
+
+# Events retained for clients that are catching up
+_HISTORY_SIZE = 1000
+
+
+class RosterEventFeed:
+    """In-process roster change feed with long-poll support."""
+
+    def __init__(self, history_size: int = _HISTORY_SIZE):
+        self.epoch = uuid.uuid4().hex
+        self.version = 0
+        self._events: deque[dict[str, Any]] = deque(maxlen=history_size)
+        self._changed = asyncio.Event()
+
+    def publish(
+        self,
+        channel_id: str,
+        action: str,
+        character_id: str,
+        character: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Record a roster change and wake waiting clients.
+
+        Args:
+            channel_id: Discord channel ID
+            action: "add" or "remove"
+            character_id: Character identifier
+            character: Optional character details (as returned by /list) for additions
+
+        Returns:
+            The published event
+        """
+        self.version += 1
+        event = {
+            "version": self.version,
+            "channel_id": channel_id,
+            "action": action,
+            "character_id": character_id,
+            "character": character,
+            "timestamp": time.time(),
+        }
+        self._events.append(event)
+        self._changed.set()
+        self._changed = asyncio.Event()
+        return event
+
+    def events_since(self, since: int, epoch: str | None = None) -> dict[str, Any]:
+        """
+        Get events newer than a version without waiting.
+
+        Returns:
+            Dictionary with epoch, version, events and reset flag
+        """
+        oldest = self._events[0]["version"] if self._events else self.version + 1
+        reset = (epoch is not None and epoch != self.epoch) or since < oldest - 1
+        if epoch is None or reset:
+            # New or out-of-sync client: it must drop its cache and start from now
+            return {"epoch": self.epoch, "version": self.version, "events": [], "reset": True}
+        events = [event for event in self._events if event["version"] > since]
+        return {"epoch": self.epoch, "version": self.version, "events": events, "reset": False}
+
+    async def wait_for_events(
+        self, since: int, epoch: str | None = None, timeout: float = 25
+    ) -> dict[str, Any]:
+        """
+        Long-poll for events newer than a version.
+
+        Returns immediately if there are events (or the client must reset),
+        otherwise waits up to `timeout` seconds for the next change.
+        """
+        result = self.events_since(since, epoch)
+        if result["events"] or result["reset"]:
+            return result
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return result
+        return self.events_since(since, epoch)
+
+
+roster_events = RosterEventFeed()
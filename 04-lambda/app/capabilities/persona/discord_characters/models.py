@@ -1,5 +1,7 @@
 """Request/response models for Discord character API."""
 
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 
@@ -77,3 +79,12 @@ class EngageResponse(BaseModel):
     should_engage: bool
     response: str | None = None
     character_id: str
+
+
+class RosterEventsResponse(BaseModel):
+    """Channel roster changes since a client's last seen version."""
+
+    epoch: str = Field(..., description="Feed identity; changes when the server restarts")
+    version: int = Field(..., description="Latest event version")
+    events: list[dict[str, Any]] = Field(default_factory=list)
+    reset: bool = Field(False, description="Client missed events and must clear its cache")
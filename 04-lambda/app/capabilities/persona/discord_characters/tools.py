@@ -8,6 +8,7 @@ import logging
 from typing import Any
 
 from app.capabilities.persona.discord_characters.config import config
+from app.capabilities.persona.discord_characters.events import roster_events
 from app.capabilities.persona.discord_characters.services_legacy import DiscordCharacterManager
 from app.capabilities.persona.discord_characters.services_legacy.store import DiscordCharacterStore
 
@@ -36,7 +37,12 @@ async def add_discord_character_tool(
     """
     try:
         manager = await _get_manager()
-        await manager.add_character(channel_id, character_id, persona_id or character_id)
+        success, message = await manager.add_character(
+            channel_id, character_id, persona_id or character_id
+        )
+        if not success:
+            return {"success": False, "error": message}
+        roster_events.publish(channel_id, "add", character_id)
         return {
             "success": True,
             "message": f"Added character {character_id} to channel {channel_id}",
@@ -59,7 +65,10 @@ async def remove_discord_character_tool(channel_id: str, character_id: str) -> d
     """
     try:
         manager = await _get_manager()
-        await manager.remove_character(channel_id, character_id)
+        success, message = await manager.remove_character(channel_id, character_id)
+        if not success:
+            return {"success": False, "error": message}
+        roster_events.publish(channel_id, "remove", character_id)
         return {
             "success": True,
             "message": f"Removed character {character_id} from channel {channel_id}",
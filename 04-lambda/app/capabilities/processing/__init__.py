@@ -6,7 +6,11 @@ from .ai import (
     classify_conversation_topics,
     topic_classification_agent,
 )
-from .processing_workflow import classify_topics_workflow
+from .processing_workflow import (
+    backfill_topics_workflow,
+    classify_topics_batch_workflow,
+    classify_topics_workflow,
+)
 from .router import get_processing_deps, router
 from .schemas import TopicClassificationRequest, TopicClassificationResponse
 
@@ -16,6 +20,8 @@ __all__ = [
     "get_processing_deps",
     # Workflow
     "classify_topics_workflow",
+    "classify_topics_batch_workflow",
+    "backfill_topics_workflow",
     # AI
     "ProcessingDeps",
     "ProcessingState",
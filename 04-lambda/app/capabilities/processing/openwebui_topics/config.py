@@ -18,6 +18,15 @@ class OpenWebUITopicsConfig:
     # Topic settings
     max_topics = 5
 
+    # Batch classification (services/pipeline.py)
+    topic_centroid_threshold = global_settings.topic_centroid_threshold
+    topic_centroid_min_examples = global_settings.topic_centroid_min_examples
+    topic_llm_batch_size = global_settings.topic_llm_batch_size
+    topic_llm_concurrency = global_settings.topic_llm_concurrency
+    topic_text_max_chars = global_settings.topic_text_max_chars
+    topic_cache_collection = "topic_classifications"
+    topic_centroids_collection = "topic_centroids"
+
 
 config = OpenWebUITopicsConfig()
 
@@ -2,8 +2,10 @@
 
 Import the classifier directly from its module:
     from capabilities.processing.openwebui_topics.services.classifier import TopicClassifier
+    from capabilities.processing.openwebui_topics.services.pipeline import TopicPipeline
 """
 
 from app.capabilities.processing.openwebui_topics.services.classifier import TopicClassifier
+from app.capabilities.processing.openwebui_topics.services.pipeline import TopicPipeline
 
-__all__ = ["TopicClassifier"]
+__all__ = ["TopicClassifier", "TopicPipeline"]
@@ -0,0 +1,629 @@
+"""Batched, cached topic classification for many conversations.
+
+TopicPipeline classifies conversations in bulk (the batch endpoint, or a
+backfill of the synced Open WebUI conversations) with as few LLM calls as
+possible:
+
+- Cache: results are stored in the topic_classifications collection keyed by a
+  hash of the model, title and conversation text, so an unchanged conversation
+  is never classified twice.
+- Centroids: each conversation is embedded and compared to the centroids of the
+  topic vocabulary (topic_centroids collection: per topic, the sum of the unit
+  embeddings of the conversations labelled with it). Topics at least
+  TOPIC_CENTROID_THRESHOLD similar are assigned without an LLM call.
+- Batches: the remaining, ambiguous conversations go to the LLM
+  TOPIC_LLM_BATCH_SIZE to a JSON prompt (TOPIC_LLM_CONCURRENCY prompts in
+  flight); conversations missing from a batch answer are retried alone. LLM
+  labels feed the centroids, so later conversations are pre-assigned more often.
+
+backfill() walks the documents with source_type "openwebui_conversation" and
+writes ``metadata.topics`` (what the conversation search filters on) to them and
+their chunks with one bulk write per collection and page. Documents that already
+carry topics from elsewhere keep them and seed the vocabulary instead.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any
+
+from app.capabilities.processing.ai.dependencies import ProcessingDeps
+from app.capabilities.processing.openwebui_topics.config import config
+from app.capabilities.processing.openwebui_topics.tools import _format_conversation
+from app.capabilities.processing.schemas import (
+    TopicClassificationRequest,
+    TopicClassificationResponse,
+)
+from app.capabilities.retrieval.mongo_rag.config import config as rag_config
+from app.capabilities.retrieval.mongo_rag.ingestion.embedder import create_embedder
+from pymongo import ASCENDING, UpdateMany, UpdateOne
+
+logger = logging.getLogger(__name__)
+
+CONVERSATION_SOURCE_TYPE = "openwebui_conversation"
+FALLBACK_TOPICS = ["general"]
+# Known topics listed in the LLM prompt as preferred labels
+PROMPT_VOCABULARY_SIZE = 50
+
+_SYSTEM_PROMPT = "You are a topic classification assistant. Always respond with valid JSON."
+
+
+def topic_cache_key(model: str, title: str | None, text: str) -> str:
+    """Hash of everything that determines a classification."""
+    payload = "\x00".join((model, title or "", text))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _unit(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else list(vector)
+
+
+def _clean_topics(topics: Any, limit: int) -> list[str]:
+    if not isinstance(topics, list):
+        return []
+    cleaned: list[str] = []
+    for topic in topics:
+        if isinstance(topic, str) and (topic := " ".join(topic.split())) and topic not in cleaned:
+            cleaned.append(topic)
+    return cleaned[:limit]
+
+
+@dataclass
+class Conversation:
+    """A conversation to classify; ``text`` is its formatted, trimmed transcript."""
+
+    id: str
+    title: str | None
+    text: str
+    existing_topics: list[str] = field(default_factory=list)
+
+
+@dataclass
+class TopicAssignment:
+    """Topics of one conversation and how they were found (centroid or llm)."""
+
+    topics: list[str]
+    confidence: float
+    reasoning: str
+    method: str
+
+
+@dataclass
+class TopicStats:
+    """Work done by one classification run."""
+
+    conversations: int = 0
+    unchanged: int = 0
+    seeded: int = 0
+    cache_hits: int = 0
+    centroid_assigned: int = 0
+    llm_classified: int = 0
+    llm_calls: int = 0
+    failures: int = 0
+    documents_updated: int = 0
+    chunks_updated: int = 0
+
+    @property
+    def llm_calls_saved(self) -> int:
+        """Calls avoided compared to one call per classified conversation."""
+        classified = self.cache_hits + self.centroid_assigned + self.llm_classified
+        # A failed batch is retried conversation by conversation, so calls can exceed them
+        return max(0, classified + self.failures - self.llm_calls)
+
+    def as_dict(self) -> dict[str, int]:
+        return {**asdict(self), "llm_calls_saved": self.llm_calls_saved}
+
+
+class TopicVocabulary:
+    """
+    Known topics and their centroids.
+
+    A centroid is kept as the sum of the unit embeddings of the conversations
+    labelled with the topic; only topics with at least ``min_examples`` of them
+    are used for pre-assignment.
+    """
+
+    def __init__(self, min_examples: int = 1):
+        self.min_examples = max(1, min_examples)
+        self.sums: dict[str, list[float]] = {}
+        self.counts: dict[str, int] = {}
+        self._changed: set[str] = set()
+
+    @property
+    def topics(self) -> list[str]:
+        """Known topics, most used first."""
+        return sorted(self.counts, key=lambda topic: -self.counts[topic])
+
+    def add(self, topics: list[str], embedding: list[float]) -> None:
+        """Count a conversation with these topics and unit embedding."""
+        for topic in topics:
+            total = self.sums.get(topic)
+            if total is None or len(total) != len(embedding):
+                self.sums[topic] = list(embedding)
+                self.counts[topic] = 1
+            else:
+                self.sums[topic] = [a + b for a, b in zip(total, embedding, strict=True)]
+                self.counts[topic] += 1
+            self._changed.add(topic)
+
+    def nearest(self, embedding: list[float]) -> list[tuple[str, float]]:
+        """Cosine similarity of a unit embedding to each usable centroid, highest first."""
+        scores = []
+        for topic, total in self.sums.items():
+            if self.counts[topic] < self.min_examples or len(total) != len(embedding):
+                continue
+            norm = math.sqrt(sum(x * x for x in total))
+            if norm:
+                scores.append(
+                    (topic, sum(a * b for a, b in zip(total, embedding, strict=True)) / norm)
+                )
+        return sorted(scores, key=lambda score: -score[1])
+
+    async def load(self, collection: Any) -> None:
+        for doc in await collection.find({}).to_list():
+            self.sums[doc["_id"]] = doc["sum"]
+            self.counts[doc["_id"]] = doc["count"]
+        self._changed.clear()
+
+    async def save(self, collection: Any) -> None:
+        """Write the centroids changed since load (last writer wins across processes)."""
+        if not self._changed:
+            return
+        now = datetime.now()
+        await collection.bulk_write(
+            [
+                UpdateOne(
+                    {"_id": topic},
+                    {
+                        "$set": {
+                            "sum": self.sums[topic],
+                            "count": self.counts[topic],
+                            "updated_at": now,
+                        }
+                    },
+                    upsert=True,
+                )
+                for topic in self._changed
+            ],
+            ordered=False,
+        )
+        self._changed.clear()
+
+
+class TopicPipeline:
+    """Classifies many conversations with caching, centroid pre-assignment and LLM batching."""
+
+    def __init__(
+        self,
+        deps: ProcessingDeps,
+        db: Any,
+        *,
+        embedder: Any | None = None,
+        threshold: float | None = None,
+        min_examples: int | None = None,
+        batch_size: int | None = None,
+        concurrency: int | None = None,
+        max_chars: int | None = None,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            deps: Processing dependencies (LLM client, model and max_topics)
+            db: MongoDB database with the RAG collections, the cache and the centroids
+            embedder: Embedding generator (default: create_embedder())
+            threshold: Centroid similarity that assigns a topic
+                (default: TOPIC_CENTROID_THRESHOLD)
+            min_examples: Labelled conversations a centroid needs
+                (default: TOPIC_CENTROID_MIN_EXAMPLES)
+            batch_size: Conversations per LLM prompt (default: TOPIC_LLM_BATCH_SIZE)
+            concurrency: LLM prompts in flight (default: TOPIC_LLM_CONCURRENCY)
+            max_chars: Characters of each conversation embedded and prompted
+                (default: TOPIC_TEXT_MAX_CHARS)
+        """
+        self.deps = deps
+        self.embedder = embedder or create_embedder()
+        self.threshold = config.topic_centroid_threshold if threshold is None else threshold
+        self.batch_size = max(1, batch_size or config.topic_llm_batch_size)
+        self.max_chars = max_chars or config.topic_text_max_chars
+        self.vocabulary = TopicVocabulary(min_examples or config.topic_centroid_min_examples)
+        self.documents = db[rag_config.mongodb_collection_documents]
+        self.chunks = db[rag_config.mongodb_collection_chunks]
+        self.cache = db[config.topic_cache_collection]
+        self.centroids = db[config.topic_centroids_collection]
+        self._semaphore = asyncio.Semaphore(max(1, concurrency or config.topic_llm_concurrency))
+        self._vocabulary_loaded = False
+
+    def cache_key(self, conversation: Conversation) -> str:
+        return topic_cache_key(self.deps.llm_model, conversation.title, conversation.text)
+
+    async def classify(
+        self, requests: list[TopicClassificationRequest]
+    ) -> tuple[list[TopicClassificationResponse], TopicStats]:
+        """
+        Classify conversations given in full.
+
+        Args:
+            requests: Conversations to classify
+
+        Returns:
+            One response per request (topics ["general"] with confidence 0 where
+            classification failed) and the run's statistics
+        """
+        stats = TopicStats(conversations=len(requests))
+        conversations = [
+            Conversation(
+                id=request.conversation_id,
+                title=request.title,
+                text=_format_conversation(request.messages)[: self.max_chars],
+                existing_topics=request.existing_topics or [],
+            )
+            for request in requests
+        ]
+        assignments = await self._assign(conversations, stats)
+        await self._save_vocabulary()
+
+        responses = []
+        for conversation, assignment in zip(conversations, assignments, strict=True):
+            if assignment is None:
+                responses.append(
+                    TopicClassificationResponse(
+                        conversation_id=conversation.id,
+                        topics=FALLBACK_TOPICS,
+                        confidence=0.0,
+                        reasoning="Classification failed",
+                    )
+                )
+            else:
+                responses.append(
+                    TopicClassificationResponse(
+                        conversation_id=conversation.id,
+                        topics=assignment.topics,
+                        confidence=assignment.confidence,
+                        reasoning=assignment.reasoning,
+                    )
+                )
+        return responses, stats
+
+    async def backfill(
+        self, *, limit: int | None = None, force: bool = False, page_size: int = 500
+    ) -> TopicStats:
+        """
+        Classify the stored Open WebUI conversations and write their topics back.
+
+        A document is skipped when its ``metadata.topics_hash`` matches its current
+        content (unless ``force``); conversations whose classification failed are
+        left for the next run.
+
+        Args:
+            limit: Maximum number of documents to look at (None: all)
+            force: Reclassify every document, including ones with topics from elsewhere
+            page_size: Documents read and written back per round
+
+        Returns:
+            The run's statistics
+        """
+        stats = TopicStats()
+        last_id = None
+        while limit is None or stats.conversations < limit:
+            query: dict[str, Any] = {"source_type": CONVERSATION_SOURCE_TYPE}
+            if last_id is not None:
+                query["_id"] = {"$gt": last_id}
+            size = page_size if limit is None else min(page_size, limit - stats.conversations)
+            page = (
+                await self.documents.find(
+                    query,
+                    {"title": 1, "content": 1, "metadata.topics": 1, "metadata.topics_hash": 1},
+                )
+                .sort("_id", ASCENDING)
+                .limit(size)
+                .to_list()
+            )
+            if not page:
+                break
+            last_id = page[-1]["_id"]
+            stats.conversations += len(page)
+            await self._backfill_page(page, force, stats)
+        await self._save_vocabulary()
+        return stats
+
+    async def _backfill_page(
+        self, page: list[dict[str, Any]], force: bool, stats: TopicStats
+    ) -> None:
+        seeds: list[tuple[Any, Conversation, str]] = []
+        todo: list[tuple[Any, Conversation, str]] = []
+        for doc in page:
+            metadata = doc.get("metadata") or {}
+            conversation = Conversation(
+                id=str(doc["_id"]),
+                title=doc.get("title"),
+                text=(doc.get("content") or "")[: self.max_chars],
+                existing_topics=metadata.get("topics") or [],
+            )
+            key = self.cache_key(conversation)
+            if force:
+                todo.append((doc["_id"], conversation, key))
+            elif metadata.get("topics_hash") == key:
+                stats.unchanged += 1
+            elif conversation.existing_topics and "topics_hash" not in metadata:
+                seeds.append((doc["_id"], conversation, key))
+            else:
+                todo.append((doc["_id"], conversation, key))
+
+        updates: list[tuple[Any, list[str], str]] = []
+        if seeds:
+            await self._load_vocabulary()
+            embeddings = await self._embed([conversation for _, conversation, _ in seeds])
+            for (doc_id, conversation, key), embedding in zip(seeds, embeddings, strict=True):
+                if embedding is not None:
+                    self.vocabulary.add(conversation.existing_topics, embedding)
+                updates.append((doc_id, conversation.existing_topics, key))
+            stats.seeded += len(seeds)
+
+        assignments = await self._assign([conversation for _, conversation, _ in todo], stats)
+        for (doc_id, _, key), assignment in zip(todo, assignments, strict=True):
+            if assignment is not None:
+                updates.append((doc_id, assignment.topics, key))
+        await self._write_topics(updates, stats)
+
+    async def _assign(
+        self, conversations: list[Conversation], stats: TopicStats
+    ) -> list[TopicAssignment | None]:
+        """Topics per conversation from the cache, the centroids or the LLM (None: failed)."""
+        if not conversations:
+            return []
+        await self._load_vocabulary()
+        keys = [self.cache_key(conversation) for conversation in conversations]
+        results = await self._cache_get(set(keys))
+        stats.cache_hits += sum(key in results for key in keys)
+
+        # Conversations sharing a key are classified once
+        pending: dict[str, Conversation] = {}
+        for conversation, key in zip(conversations, keys, strict=True):
+            if key not in results:
+                pending.setdefault(key, conversation)
+        embeddings = dict(zip(pending, await self._embed(list(pending.values())), strict=True))
+
+        ambiguous: list[tuple[str, Conversation]] = []
+        for key, conversation in pending.items():
+            assignment = self._nearest(embeddings[key])
+            if assignment is None:
+                ambiguous.append((key, conversation))
+            else:
+                results[key] = assignment
+                stats.centroid_assigned += 1
+
+        for key, assignment in (await self._classify_with_llm(ambiguous, stats)).items():
+            results[key] = assignment
+            stats.llm_classified += 1
+            if embeddings[key] is not None:
+                self.vocabulary.add(assignment.topics, embeddings[key])
+
+        await self._cache_put({key: results[key] for key in pending if key in results})
+        assignments = [results.get(key) for key in keys]
+        stats.failures += assignments.count(None)
+        return assignments
+
+    def _nearest(self, embedding: list[float] | None) -> TopicAssignment | None:
+        if embedding is None:
+            return None
+        close = [(t, s) for t, s in self.vocabulary.nearest(embedding) if s >= self.threshold]
+        if not close:
+            return None
+        close = close[: self.deps.max_topics]
+        return TopicAssignment(
+            topics=[topic for topic, _ in close],
+            confidence=round(close[0][1], 4),
+            reasoning=f"Nearest topic centroids (similarity {close[0][1]:.2f})",
+            method="centroid",
+        )
+
+    async def _embed(self, conversations: list[Conversation]) -> list[list[float] | None]:
+        """Unit embeddings of the conversations (None for all if embedding fails)."""
+        if not conversations:
+            return []
+        texts = [
+            f"{conversation.title}\n\n{conversation.text}"
+            if conversation.title
+            else conversation.text
+            for conversation in conversations
+        ]
+        try:
+            embeddings = await self.embedder.generate_embeddings_batch(texts)
+        except Exception:
+            logger.warning("Embedding conversations failed, sending them to the LLM", exc_info=True)
+            return [None] * len(conversations)
+        return [_unit(embedding) for embedding in embeddings]
+
+    # ========== LLM ==========
+
+    async def _classify_with_llm(
+        self, items: list[tuple[str, Conversation]], stats: TopicStats
+    ) -> dict[str, TopicAssignment]:
+        results: dict[str, TopicAssignment] = {}
+
+        async def run(batch: list[tuple[str, Conversation]]) -> None:
+            answered = await self._classify_batch(
+                [conversation for _, conversation in batch], stats
+            )
+            retry = []
+            for item, assignment in zip(batch, answered, strict=True):
+                if assignment is not None:
+                    results[item[0]] = assignment
+                elif len(batch) > 1:
+                    retry.append(item)
+            await asyncio.gather(*(run([item]) for item in retry))
+
+        batches = [
+            items[start : start + self.batch_size]
+            for start in range(0, len(items), self.batch_size)
+        ]
+        await asyncio.gather(*map(run, batches))
+        return results
+
+    def _batch_prompt(self, conversations: list[Conversation]) -> str:
+        blocks = []
+        for n, conversation in enumerate(conversations):
+            header = f"Title: {conversation.title}\n" if conversation.title else ""
+            if conversation.existing_topics:
+                header += f"Existing topics: {', '.join(conversation.existing_topics)}\n"
+            blocks.append(f'<conversation id="{n}">\n{header}{conversation.text}\n</conversation>')
+        known = self.vocabulary.topics[:PROMPT_VOCABULARY_SIZE]
+        known_part = (
+            f"Prefer these known topics where they fit: {', '.join(known)}.\n" if known else ""
+        )
+        return (
+            "\n\n".join(blocks) + "\n\nFor each conversation above, identify 3-5 main topics. "
+            "Topics should be concise (1-3 words each) and descriptive of the conversation's "
+            f"main themes.\n{known_part}"
+            'Return a JSON object {"results": [{"id": <conversation id>, "topics": ["..."], '
+            '"reasoning": "..."}]} with one entry per conversation.'
+        )
+
+    async def _classify_batch(
+        self, conversations: list[Conversation], stats: TopicStats
+    ) -> list[TopicAssignment | None]:
+        """Topics for several conversations from one prompt; None where the answer lacks them."""
+        if not self.deps.http_client:
+            await self.deps.initialize()
+        payload = {
+            "model": self.deps.llm_model,
+            "messages": [
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": self._batch_prompt(conversations)},
+            ],
+            "temperature": 0.3,
+            "response_format": {"type": "json_object"},
+        }
+        try:
+            async with self._semaphore:
+                stats.llm_calls += 1
+                response = await self.deps.http_client.post(self.deps.llm_url, json=payload)
+            response.raise_for_status()
+            content = response.json()["choices"][0]["message"]["content"]
+            entries = json.loads(content).get("results", [])
+        except Exception:
+            logger.warning(
+                f"Topic classification of {len(conversations)} conversation(s) failed",
+                exc_info=True,
+            )
+            return [None] * len(conversations)
+
+        answered: list[TopicAssignment | None] = [None] * len(conversations)
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict):
+                continue
+            n = entry.get("id")
+            if isinstance(n, str) and n.isdigit():
+                n = int(n)
+            topics = _clean_topics(entry.get("topics"), self.deps.max_topics)
+            if isinstance(n, int) and 0 <= n < len(conversations) and topics:
+                reasoning = entry.get("reasoning")
+                answered[n] = TopicAssignment(
+                    topics=topics,
+                    confidence=0.8,
+                    reasoning=reasoning if isinstance(reasoning, str) else "",
+                    method="llm",
+                )
+        return answered
+
+    # ========== Storage ==========
+
+    async def _load_vocabulary(self) -> None:
+        if self._vocabulary_loaded:
+            return
+        self._vocabulary_loaded = True
+        try:
+            await self.vocabulary.load(self.centroids)
+        except Exception:
+            logger.warning("Loading topic centroids failed", exc_info=True)
+
+    async def _save_vocabulary(self) -> None:
+        try:
+            await self.vocabulary.save(self.centroids)
+        except Exception:
+            logger.warning("Saving topic centroids failed", exc_info=True)
+
+    async def _cache_get(self, keys: set[str]) -> dict[str, TopicAssignment]:
+        if not keys:
+            return {}
+        try:
+            docs = await self.cache.find({"_id": {"$in": list(keys)}}).to_list()
+        except Exception:
+            logger.warning("Topic cache lookup failed", exc_info=True)
+            return {}
+        return {
+            doc["_id"]: TopicAssignment(
+                topics=doc["topics"],
+                confidence=doc.get("confidence", 0.8),
+                reasoning=doc.get("reasoning") or "",
+                method=doc.get("method", "llm"),
+            )
+            for doc in docs
+        }
+
+    async def _cache_put(self, assignments: dict[str, TopicAssignment]) -> None:
+        if not assignments:
+            return
+        now = datetime.now()
+        try:
+            await self.cache.bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": key},
+                        {
+                            "$set": {
+                                **asdict(assignment),
+                                "model": self.deps.llm_model,
+                                "updated_at": now,
+                            }
+                        },
+                        upsert=True,
+                    )
+                    for key, assignment in assignments.items()
+                ],
+                ordered=False,
+            )
+        except Exception:
+            logger.warning("Topic cache write failed", exc_info=True)
+
+    async def _write_topics(
+        self, updates: list[tuple[Any, list[str], str]], stats: TopicStats
+    ) -> None:
+        """Set metadata.topics on documents and their chunks, one bulk write per collection."""
+        if not updates:
+            return
+        await self.documents.bulk_write(
+            [
+                UpdateOne(
+                    {"_id": doc_id},
+                    {"$set": {"metadata.topics": topics, "metadata.topics_hash": key}},
+                )
+                for doc_id, topics, key in updates
+            ],
+            ordered=False,
+        )
+        result = await self.chunks.bulk_write(
+            [
+                UpdateMany({"document_id": doc_id}, {"$set": {"metadata.topics": topics}})
+                for doc_id, topics, _ in updates
+            ],
+            ordered=False,
+        )
+        stats.documents_updated += len(updates)
+        stats.chunks_updated += result.modified_count
+
+
+__all__ = [
+    "CONVERSATION_SOURCE_TYPE",
+    "TopicAssignment",
+    "TopicPipeline",
+    "TopicStats",
+    "TopicVocabulary",
+    "topic_cache_key",
+]
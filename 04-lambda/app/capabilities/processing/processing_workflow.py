@@ -1,12 +1,18 @@
 """Processing workflow - orchestration logic for content processing."""
 
 from app.capabilities.processing.ai import ProcessingDeps
+from app.capabilities.processing.openwebui_topics.config import config
+from app.capabilities.processing.openwebui_topics.services.pipeline import (
+    TopicPipeline,
+    TopicStats,
+)
 from app.capabilities.processing.openwebui_topics.tools import classify_topics
 from app.capabilities.processing.schemas import (
     TopicClassificationRequest,
     TopicClassificationResponse,
 )
 from pydantic_ai import RunContext
+from pymongo import AsyncMongoClient
 
 
 async def classify_topics_workflow(
@@ -36,6 +42,64 @@ async def classify_topics_workflow(
         await deps.cleanup()
 
 
+async def classify_topics_batch_workflow(
+    requests: list[TopicClassificationRequest],
+    deps: ProcessingDeps | None = None,
+) -> tuple[list[TopicClassificationResponse], TopicStats]:
+    """
+    Execute batch topic classification (cached, centroid pre-assignment, batched LLM).
+
+    Args:
+        requests: Conversations to classify
+        deps: Optional dependencies. If None, creates from settings
+
+    Returns:
+        One response per request and the run's statistics
+    """
+    if deps is None:
+        deps = ProcessingDeps.from_settings()
+
+    await deps.initialize()
+    mongo_client = AsyncMongoClient(config.mongodb_uri)
+    try:
+        pipeline = TopicPipeline(deps, mongo_client[config.mongodb_database])
+        return await pipeline.classify(requests)
+    finally:
+        await mongo_client.close()
+        await deps.cleanup()
+
+
+async def backfill_topics_workflow(
+    limit: int | None = None,
+    force: bool = False,
+    deps: ProcessingDeps | None = None,
+) -> TopicStats:
+    """
+    Classify stored Open WebUI conversations and write their topics to documents and chunks.
+
+    Args:
+        limit: Maximum documents to look at (None: all)
+        force: Reclassify conversations whose topics are current
+        deps: Optional dependencies. If None, creates from settings
+
+    Returns:
+        The backfill's statistics
+    """
+    if deps is None:
+        deps = ProcessingDeps.from_settings()
+
+    await deps.initialize()
+    mongo_client = AsyncMongoClient(config.mongodb_uri)
+    try:
+        pipeline = TopicPipeline(deps, mongo_client[config.mongodb_database])
+        return await pipeline.backfill(limit=limit, force=force)
+    finally:
+        await mongo_client.close()
+        await deps.cleanup()
+
+
 __all__ = [
+    "backfill_topics_workflow",
+    "classify_topics_batch_workflow",
     "classify_topics_workflow",
 ]
@@ -4,8 +4,16 @@ import logging
 from typing import Annotated
 
 from app.capabilities.processing.ai import ProcessingDeps
-from app.capabilities.processing.processing_workflow import classify_topics_workflow
+from app.capabilities.processing.processing_workflow import (
+    backfill_topics_workflow,
+    classify_topics_batch_workflow,
+    classify_topics_workflow,
+)
 from app.capabilities.processing.schemas import (
+    TopicBackfillRequest,
+    TopicBackfillResponse,
+    TopicBatchClassificationRequest,
+    TopicBatchClassificationResponse,
     TopicClassificationRequest,
     TopicClassificationResponse,
 )
@@ -68,6 +76,64 @@ async def classify_topics_endpoint(
         raise HTTPException(status_code=500, detail=f"Classification failed: {e!s}") from e
 
 
+@router.post("/processing/classify-topics/batch", response_model=TopicBatchClassificationResponse)
+async def classify_topics_batch_endpoint(
+    request: TopicBatchClassificationRequest,
+    deps: Annotated[ProcessingDeps, Depends(get_processing_deps)],
+) -> TopicBatchClassificationResponse:
+    """
+    Classify topics for many conversations with as few LLM calls as possible.
+
+    Results are cached by conversation content, conversations close to the centroid
+    of a known topic are assigned it without the LLM, and the rest are classified
+    several to a prompt. Failed conversations get ["general"] with confidence 0.
+
+    **Request Body:**
+    ```json
+    {"conversations": [{"conversation_id": "conv_123", "title": "...", "messages": [...]}]}
+    ```
+
+    **Response:**
+    ```json
+    {
+        "results": [{"conversation_id": "conv_123", "topics": ["authentication"], "confidence": 0.86}],
+        "stats": {"cache_hits": 0, "centroid_assigned": 1, "llm_calls": 0, ...}
+    }
+    ```
+    """
+    try:
+        results, stats = await classify_topics_batch_workflow(request.conversations, deps)
+        return TopicBatchClassificationResponse(results=results, stats=stats.as_dict())
+    except Exception as e:
+        logger.exception("Failed to classify topics")
+        raise HTTPException(status_code=500, detail=f"Classification failed: {e!s}") from e
+
+
+@router.post("/processing/classify-topics/backfill", response_model=TopicBackfillResponse)
+async def backfill_topics_endpoint(
+    request: TopicBackfillRequest,
+    deps: Annotated[ProcessingDeps, Depends(get_processing_deps)],
+) -> TopicBackfillResponse:
+    """
+    Classify the stored Open WebUI conversations (source_type "openwebui_conversation").
+
+    Conversations whose content changed since they were classified, or that have no
+    topics yet, are classified; their topics are written to the documents and their
+    chunks (``metadata.topics``, which conversation search filters on) in bulk.
+
+    **Request Body:**
+    ```json
+    {"limit": 1000, "force": false}
+    ```
+    """
+    try:
+        stats = await backfill_topics_workflow(request.limit, request.force, deps)
+        return TopicBackfillResponse(stats=stats.as_dict())
+    except Exception as e:
+        logger.exception("Failed to backfill topics")
+        raise HTTPException(status_code=500, detail=f"Backfill failed: {e!s}") from e
+
+
 __all__ = [
     "get_processing_deps",
     "router",
@@ -24,7 +24,39 @@ class TopicClassificationResponse(BaseModel):
     reasoning: str | None = None
 
 
+class TopicBatchClassificationRequest(BaseModel):
+    """Request to classify many conversations at once."""
+
+    conversations: list[TopicClassificationRequest] = Field(
+        ..., description="Conversations to classify", min_length=1, max_length=1000
+    )
+
+
+class TopicBatchClassificationResponse(BaseModel):
+    """Topics per conversation, in request order, and the work the run took."""
+
+    results: list[TopicClassificationResponse]
+    stats: dict[str, int]
+
+
+class TopicBackfillRequest(BaseModel):
+    """Request to classify the stored Open WebUI conversations."""
+
+    limit: int | None = Field(None, ge=1, description="Maximum documents to look at")
+    force: bool = Field(False, description="Reclassify conversations whose topics are current")
+
+
+class TopicBackfillResponse(BaseModel):
+    """Work done by a topic backfill."""
+
+    stats: dict[str, int]
+
+
 __all__ = [
+    "TopicBackfillRequest",
+    "TopicBackfillResponse",
+    "TopicBatchClassificationRequest",
+    "TopicBatchClassificationResponse",
     "TopicClassificationRequest",
     "TopicClassificationResponse",
 ]
@@ -16,6 +16,20 @@ class GraphitiRAGConfig:
     use_graphiti = global_settings.use_graphiti
     use_knowledge_graph = global_settings.use_knowledge_graph
 
+    # Repository parser
+    repo_parser_batch_size = global_settings.repo_parser_batch_size
+    repo_parser_workers = global_settings.repo_parser_workers
+    repo_parser_clone_cache_dir = global_settings.repo_parser_clone_cache_dir
+    kg_validator_in_memory = global_settings.kg_validator_in_memory
+
+    # Graphiti ingestion
+    graphiti_ingestion_background = global_settings.graphiti_ingestion_background
+    graphiti_ingestion_workers = global_settings.graphiti_ingestion_workers
+    graphiti_ingestion_queue_size = global_settings.graphiti_ingestion_queue_size
+    graphiti_ingestion_dedup_cache_size = global_settings.graphiti_ingestion_dedup_cache_size
+    graphiti_episode_concurrency = global_settings.graphiti_episode_concurrency
+    graphiti_bulk_episodes = global_settings.graphiti_bulk_episodes
+
     # LLM for Graphiti entity extraction (uses same as main LLM)
     llm_provider = global_settings.llm_provider
     llm_model = global_settings.llm_model
@@ -6,7 +6,7 @@ supporting both episode creation (for temporal context) and fact extraction.
 
 import logging
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -21,6 +21,7 @@ else:
     except ImportError:
         GraphitiType = Any  # type: ignore
 
+from app.capabilities.retrieval.graphiti_rag.config import config
 from app.capabilities.retrieval.graphiti_rag.ingestion.graph_builder import (
     create_document_episode,
     ingest_to_graphiti,
@@ -139,6 +140,7 @@ class GraphitiIngestionAdapter:
                 metadata,
                 title,
                 source,
+                concurrency=config.graphiti_episode_concurrency,
             )
             result["facts_added"] = facts_result.get("facts_added", 0)
             result["chunks_processed"] = facts_result.get("chunks_processed", 0)
@@ -174,7 +176,6 @@ class GraphitiIngestionAdapter:
         Returns:
             Dictionary with episodes_created count and errors
         """
-        episodes_created = 0
         errors: list[str] = []
 
         # Determine reference time
@@ -193,44 +194,110 @@ class GraphitiIngestionAdapter:
             else:
                 reference_time = datetime.now()
 
+        # Graphiti resolves each episode against the ones already in its group,
+        # so episodes of one document are added in order, never concurrently.
+        # Documents still run in parallel on the ingestion queue's workers.
+        episodes_created = 0
+
+        async def run_episode(label: str, coro, count: int = 1) -> None:
+            nonlocal episodes_created
+            try:
+                await coro
+                episodes_created += count
+            except Exception as e:
+                error_msg = f"Error creating {label}: {e!s}"
+                logger.warning(error_msg)
+                errors.append(error_msg)
+
         # Create overview episode
         if options.episode_type in ("overview", "both"):
-            try:
-                await create_document_episode(
-                    graphiti=self.graphiti,
+            await run_episode(
+                "overview episode",
+                self._create_overview_episode(
                     document_id=document_id,
                     title=title,
                     source=source,
-                    source_type=metadata.get("source_type", "document"),
                     metadata=metadata,
                     reference_time=reference_time,
                     chunks=chunks,
-                )
-                episodes_created += 1
-                logger.info(f"Created overview episode for document {document_id}")
-            except Exception as e:
-                error_msg = f"Error creating overview episode: {e!s}"
-                logger.exception(error_msg)
-                errors.append(error_msg)
+                ),
+            )
 
         # Create chapter episodes if available
-        if options.episode_type in ("chapters", "both") and options.chapters:
-            for chapter in options.chapters:
-                try:
-                    await self._create_chapter_episode(
+        chapters = [chapter for chapter in options.chapters or [] if chapter.content]
+        if options.episode_type in ("chapters", "both") and chapters:
+            if config.graphiti_bulk_episodes and hasattr(self.graphiti, "add_episode_bulk"):
+                await run_episode(
+                    "chapter episodes",
+                    self._create_chapter_episodes_bulk(
                         document_id=document_id,
-                        chapter=chapter,
-                        source=source,
+                        chapters=chapters,
                         base_reference_time=reference_time,
+                    ),
+                    count=len(chapters),
+                )
+            else:
+                for chapter in chapters:
+                    await run_episode(
+                        f"chapter episode '{chapter.title}'",
+                        self._create_chapter_episode(
+                            document_id=document_id,
+                            chapter=chapter,
+                            source=source,
+                            base_reference_time=reference_time,
+                        ),
                     )
-                    episodes_created += 1
-                except Exception as e:
-                    error_msg = f"Error creating chapter episode '{chapter.title}': {e!s}"
-                    logger.warning(error_msg)
-                    errors.append(error_msg)
 
         return {"episodes_created": episodes_created, "errors": errors}
 
+    async def _create_overview_episode(
+        self,
+        document_id: str,
+        title: str,
+        source: str,
+        metadata: dict[str, Any],
+        reference_time: datetime,
+        chunks: list[DocumentChunk],
+    ) -> None:
+        """Create the document overview episode, raising on failure."""
+        result = await create_document_episode(
+            graphiti=self.graphiti,
+            document_id=document_id,
+            title=title,
+            source=source,
+            source_type=metadata.get("source_type", "document"),
+            metadata=metadata,
+            reference_time=reference_time,
+            chunks=chunks,
+        )
+        if not result.get("success"):
+            raise RuntimeError(result.get("error", "unknown error"))
+        logger.info(f"Created overview episode for document {document_id}")
+
+    async def _create_chapter_episodes_bulk(
+        self,
+        document_id: str,
+        chapters: list[ChapterInfo],
+        base_reference_time: datetime,
+    ) -> None:
+        """Submit all chapter episodes in a single add_episode_bulk call."""
+        from graphiti_core.nodes import EpisodeType
+        from graphiti_core.utils.bulk_utils import RawEpisode
+
+        await self.graphiti.add_episode_bulk(
+            [
+                RawEpisode(
+                    name=f"doc:{document_id}:chapter:{chapter.title[:50]}",
+                    content=chapter.content,
+                    source=EpisodeType.text,
+                    source_description=f"Chapter: {chapter.title}",
+                    reference_time=base_reference_time + timedelta(seconds=chapter.start_time),
+                )
+                for chapter in chapters
+            ]
+        )
+        logger.info(f"Created {len(chapters)} chapter episodes for document {document_id}")
+
     async def _create_chapter_episode(
         self,
         document_id: str,
@@ -240,9 +307,7 @@ class GraphitiIngestionAdapter:
     ) -> None:
         """Create an episode for a specific chapter."""
         try:
-            from datetime import timedelta
-
-            from graphiti_core import EpisodeType
+            from graphiti_core.nodes import EpisodeType
         except ImportError:
             logger.warning("graphiti_core not installed, skipping chapter episode")
             return
@@ -4,6 +4,7 @@ This module provides functions for creating Graphiti episodes and extracting fac
 from document content.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
@@ -116,7 +117,7 @@ async def create_document_episode(
     try:
         # Import EpisodeType here to handle cases where graphiti isn't installed
         try:
-            from graphiti_core import EpisodeType
+            from graphiti_core.nodes import EpisodeType
 
             episode_type = EpisodeType.text
         except ImportError:
@@ -161,6 +162,7 @@ async def ingest_to_graphiti(
     metadata: dict[str, Any],
     title: str | None = None,
     source: str | None = None,
+    concurrency: int = 1,
 ) -> dict[str, Any]:
     """
     Ingest document chunks into Graphiti knowledge graph as facts.
@@ -179,6 +181,7 @@ async def ingest_to_graphiti(
         metadata: Document metadata
         title: Document title (optional)
         source: Document source path (optional)
+        concurrency: Maximum chunks extracted at the same time
 
     Returns:
         Dictionary with ingestion statistics
@@ -190,47 +193,53 @@ async def ingest_to_graphiti(
     facts_added = 0
     chunks_processed = 0
     errors = []
-
-    for chunk in chunks:
-        try:
-            # Prepare metadata for Graphiti
-            # Graphiti will extract entities and relationships automatically
-            fact_metadata = {
-                "chunk_id": str(chunk.index),  # Use chunk index as identifier
-                "document_id": document_id,
-                "chunk_index": chunk.index,
-                "source": source or metadata.get("source", "unknown"),
-                "title": title or metadata.get("title", "Untitled"),
-            }
-
-            # Add any additional metadata
-            if chunk.metadata:
-                fact_metadata.update(chunk.metadata)
-
-            # Add facts to Graphiti
-            # Graphiti's add_facts automatically:
-            # - Extracts entities from text
-            # - Infers relationships
-            # - Creates temporal facts
-            # - Links to source nodes
-            facts = await graphiti.add_facts(text=chunk.content, metadata=fact_metadata)
-
-            if facts:
-                facts_added += len(facts)
-                chunks_processed += 1
-                logger.debug(
-                    f"Added {len(facts)} facts from chunk {chunk.index} of document {document_id}"
-                )
-            else:
-                logger.warning(
-                    f"No facts extracted from chunk {chunk.index} of document {document_id}"
-                )
-                chunks_processed += 1
-
-        except Exception as e:
-            error_msg = f"Error ingesting chunk {chunk.index}: {e!s}"
-            logger.exception(error_msg)
-            errors.append(error_msg)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def ingest_chunk(chunk: DocumentChunk) -> None:
+        nonlocal facts_added, chunks_processed
+        async with semaphore:
+            try:
+                # Prepare metadata for Graphiti
+                # Graphiti will extract entities and relationships automatically
+                fact_metadata = {
+                    "chunk_id": str(chunk.index),  # Use chunk index as identifier
+                    "document_id": document_id,
+                    "chunk_index": chunk.index,
+                    "source": source or metadata.get("source", "unknown"),
+                    "title": title or metadata.get("title", "Untitled"),
+                }
+
+                # Add any additional metadata
+                if chunk.metadata:
+                    fact_metadata.update(chunk.metadata)
+
+                # Add facts to Graphiti
+                # Graphiti's add_facts automatically:
+                # - Extracts entities from text
+                # - Infers relationships
+                # - Creates temporal facts
+                # - Links to source nodes
+                facts = await graphiti.add_facts(text=chunk.content, metadata=fact_metadata)
+
+                if facts:
+                    facts_added += len(facts)
+                    chunks_processed += 1
+                    logger.debug(
+                        f"Added {len(facts)} facts from chunk {chunk.index} "
+                        f"of document {document_id}"
+                    )
+                else:
+                    logger.warning(
+                        f"No facts extracted from chunk {chunk.index} of document {document_id}"
+                    )
+                    chunks_processed += 1
+
+            except Exception as e:
+                error_msg = f"Error ingesting chunk {chunk.index}: {e!s}"
+                logger.exception(error_msg)
+                errors.append(error_msg)
+
+    await asyncio.gather(*(ingest_chunk(chunk) for chunk in chunks))
 
     result = {
         "facts_added": facts_added,
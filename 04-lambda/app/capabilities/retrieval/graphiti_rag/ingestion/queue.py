@@ -0,0 +1,355 @@
+"""Background Graphiti ingestion stage.
+
+Graphiti episode creation and fact extraction are LLM-bound and much slower
+than chunking, embedding and the MongoDB write. This module decouples them:
+ingestion services store content in MongoDB, submit a job here and return, and
+a bounded pool of workers enriches the knowledge graph behind them.
+
+- The queue is bounded, so producers wait (backpressure) instead of piling up
+  unbounded work when Graphiti falls behind.
+- Jobs are keyed by source. A job whose content hash matches the last
+  successfully ingested version is skipped, and a queued job is dropped when a
+  newer version of the same source is submitted after it.
+- stats() reports queue depth, in-flight jobs, lag and outcome counters.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.capabilities.retrieval.graphiti_rag.config import config
+from app.capabilities.retrieval.graphiti_rag.ingestion.adapter import (
+    GraphitiIngestionAdapter,
+    GraphitiIngestionOptions,
+)
+from app.capabilities.retrieval.mongo_rag.ingestion.chunker import DocumentChunk
+
+logger = logging.getLogger(__name__)
+
+
+def graphiti_content_hash(
+    chunks: list[DocumentChunk],
+    title: str | None,
+    options: GraphitiIngestionOptions | None,
+) -> str:
+    """
+    Hash everything that determines the episodes and facts produced for a document.
+
+    Volatile metadata such as ``ingested_at`` is deliberately excluded so that
+    re-ingesting unchanged content yields the same hash.
+    """
+    options = options or GraphitiIngestionOptions()
+    digest = hashlib.sha256()
+    parts = [
+        title or "",
+        str(options.create_episode),
+        options.episode_type,
+        str(options.extract_facts),
+    ]
+    parts.extend(chunk.content for chunk in chunks)
+    for chapter in options.chapters or []:
+        parts.extend([chapter.title, str(chapter.start_time), chapter.content or ""])
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+@dataclass
+class GraphitiIngestionJob:
+    """A document waiting for Graphiti enrichment."""
+
+    document_id: str
+    chunks: list[DocumentChunk]
+    metadata: dict[str, Any]
+    title: str | None = None
+    source: str | None = None
+    options: GraphitiIngestionOptions | None = None
+    content_hash: str = ""
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def key(self) -> str:
+        """Dedup key: the document source, falling back to the MongoDB ID."""
+        return self.source or self.metadata.get("source") or self.document_id
+
+
+class GraphitiIngestionQueue:
+    """
+    Bounded worker pool that runs GraphitiIngestionAdapter.ingest_document jobs.
+
+    Usage:
+        queue = GraphitiIngestionQueue(adapter)
+        await queue.start()
+        await queue.submit(document_id, chunks, metadata, title=title, source=source)
+        ...
+        await queue.drain()
+        await queue.stop()
+    """
+
+    def __init__(
+        self,
+        adapter: GraphitiIngestionAdapter | None = None,
+        workers: int | None = None,
+        max_size: int | None = None,
+        dedup_cache_size: int | None = None,
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            adapter: Adapter to run jobs with. When omitted, start() creates a
+                Graphiti client owned by the queue.
+            workers: Concurrent jobs (defaults to GRAPHITI_INGESTION_WORKERS)
+            max_size: Queued jobs before submit() blocks (defaults to GRAPHITI_INGESTION_QUEUE_SIZE)
+            dedup_cache_size: Sources whose last ingested hash is remembered
+        """
+        self.adapter = adapter
+        self.workers = max(1, workers or config.graphiti_ingestion_workers)
+        self.max_size = max(1, max_size or config.graphiti_ingestion_queue_size)
+        self.dedup_cache_size = dedup_cache_size or config.graphiti_ingestion_dedup_cache_size
+
+        self._queue: asyncio.Queue[GraphitiIngestionJob] | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._deps: Any | None = None
+        # Last successfully ingested hash per source, and latest submitted hash per source
+        self._ingested: OrderedDict[str, str] = OrderedDict()
+        self._latest: dict[str, str] = {}
+        self._in_flight: dict[str, GraphitiIngestionJob] = {}
+        self._counters = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "skipped_unchanged": 0,
+            "superseded": 0,
+            "backpressure_waits": 0,
+        }
+        self._busy_seconds = 0.0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> bool:
+        """
+        Start the worker pool.
+
+        Returns:
+            True if the queue is running, False if no Graphiti client is available
+        """
+        if self.running:
+            return True
+
+        if self.adapter is None:
+            from app.capabilities.retrieval.graphiti_rag.dependencies import GraphitiRAGDeps
+
+            try:
+                self._deps = GraphitiRAGDeps.from_settings()
+                await self._deps.initialize()
+            except Exception as e:
+                logger.warning(f"Failed to initialize Graphiti for background ingestion: {e}")
+                self._deps = None
+                return False
+            if not self._deps.graphiti:
+                await self._deps.cleanup()
+                self._deps = None
+                return False
+            self.adapter = GraphitiIngestionAdapter(self._deps.graphiti)
+
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"graphiti-ingestion-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(
+            f"Graphiti ingestion queue started: {self.workers} workers, max size {self.max_size}"
+        )
+        return True
+
+    async def submit(
+        self,
+        document_id: str,
+        chunks: list[DocumentChunk],
+        metadata: dict[str, Any],
+        title: str | None = None,
+        source: str | None = None,
+        options: GraphitiIngestionOptions | None = None,
+    ) -> dict[str, Any]:
+        """
+        Queue a document for Graphiti ingestion.
+
+        Waits for a free slot when the queue is full.
+
+        Returns:
+            Dictionary with status ("queued" or "unchanged"), content_hash and queue_depth
+        """
+        if not self.running:
+            raise RuntimeError("Graphiti ingestion queue is not running")
+
+        job = GraphitiIngestionJob(
+            document_id=document_id,
+            chunks=chunks,
+            metadata=metadata,
+            title=title,
+            source=source,
+            options=options,
+            content_hash=graphiti_content_hash(chunks, title, options),
+        )
+
+        # Already ingested, or the same version is already queued or in flight
+        if job.content_hash in (self._ingested.get(job.key), self._latest.get(job.key)):
+            self._counters["skipped_unchanged"] += 1
+            logger.info(f"Graphiti content unchanged for {job.key}, skipping")
+            return {
+                "status": "unchanged",
+                "content_hash": job.content_hash,
+                "queue_depth": self.depth,
+            }
+
+        self._latest[job.key] = job.content_hash
+        if self._queue.full():
+            self._counters["backpressure_waits"] += 1
+        await self._queue.put(job)
+        self._counters["submitted"] += 1
+        return {"status": "queued", "content_hash": job.content_hash, "queue_depth": self.depth}
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of queue health for logging and the stats endpoint."""
+        now = time.monotonic()
+        waiting = list(self._queue._queue) if self._queue else []  # noqa: SLF001
+        oldest = min((job.enqueued_at for job in waiting), default=None)
+        finished = self._counters["completed"] + self._counters["failed"]
+        return {
+            "running": self.running,
+            "workers": self.workers,
+            "max_size": self.max_size,
+            "depth": self.depth,
+            "in_flight": len(self._in_flight),
+            "lag_seconds": round(now - oldest, 3) if oldest is not None else 0.0,
+            "avg_job_seconds": round(self._busy_seconds / finished, 3) if finished else 0.0,
+            **self._counters,
+        }
+
+    async def drain(self) -> None:
+        """Wait until every queued job has been processed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self, drain: bool = True) -> None:
+        """
+        Stop the workers and release the queue's own Graphiti client.
+
+        Args:
+            drain: Finish queued jobs first; otherwise pending jobs are dropped
+        """
+        if drain:
+            await self.drain()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        if self._deps is not None:
+            await self._deps.cleanup()
+            self._deps = None
+            self.adapter = None
+        logger.info(f"Graphiti ingestion queue stopped: {self.stats()}")
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: GraphitiIngestionJob) -> None:
+        if self._latest.get(job.key) != job.content_hash:
+            self._counters["superseded"] += 1
+            logger.info(f"Skipping superseded Graphiti job for {job.key}")
+            return
+
+        self._in_flight[job.key] = job
+        start = time.monotonic()
+        try:
+            result = await self.adapter.ingest_document(
+                document_id=job.document_id,
+                chunks=job.chunks,
+                metadata=job.metadata,
+                title=job.title,
+                source=job.source,
+                options=job.options,
+            )
+        except Exception:
+            self._counters["failed"] += 1
+            logger.exception(f"Background Graphiti ingestion failed for {job.key}")
+        else:
+            if result.get("errors"):
+                self._counters["failed"] += 1
+                logger.warning(
+                    f"Background Graphiti ingestion for {job.key} finished with errors: "
+                    f"{result['errors']}"
+                )
+            else:
+                self._counters["completed"] += 1
+                self._remember(job.key, job.content_hash)
+            logger.info(
+                f"Background Graphiti ingestion for {job.key}: "
+                f"{result.get('episodes_created', 0)} episodes, "
+                f"{result.get('facts_added', 0)} facts "
+                f"(waited {start - job.enqueued_at:.1f}s, depth {self.depth})"
+            )
+        finally:
+            self._busy_seconds += time.monotonic() - start
+            self._in_flight.pop(job.key, None)
+            if self._latest.get(job.key) == job.content_hash:
+                del self._latest[job.key]
+
+    def _remember(self, key: str, content_hash: str) -> None:
+        self._ingested[key] = content_hash
+        self._ingested.move_to_end(key)
+        while len(self._ingested) > self.dedup_cache_size:
+            self._ingested.popitem(last=False)
+
+
+_queue: GraphitiIngestionQueue | None = None
+_queue_lock = asyncio.Lock()
+
+
+async def get_graphiti_ingestion_queue() -> GraphitiIngestionQueue | None:
+    """
+    Return the process-wide ingestion queue, starting it on first use.
+
+    Returns None when Graphiti is disabled or unavailable.
+    """
+    global _queue
+    if not config.use_graphiti:
+        return None
+    async with _queue_lock:
+        if _queue is None:
+            queue = GraphitiIngestionQueue()
+            if not await queue.start():
+                return None
+            _queue = queue
+    return _queue
+
+
+def get_graphiti_ingestion_stats() -> dict[str, Any] | None:
+    """Stats for the process-wide queue, or None if it has not been started."""
+    return _queue.stats() if _queue else None
+
+
+async def shutdown_graphiti_ingestion_queue(drain: bool = True) -> None:
+    """Stop the process-wide queue (called on application shutdown)."""
+    global _queue
+    if _queue is not None:
+        await _queue.stop(drain=drain)
+        _queue = None
@@ -8,15 +8,20 @@ Creates nodes and relationships directly in Neo4j without Graphiti:
 - Function nodes
 - Import relationships
 
-Bypasses all LLM processing for maximum speed.
+Bypasses all LLM processing for maximum speed. Files are parsed in a process
+pool and graph writes are batched with UNWIND in chunked transactions.
 """
 
 import ast
 import asyncio
+import hashlib
 import logging
 import os
 import shutil
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -173,8 +178,8 @@ class Neo4jCodeAnalyzer:
     ) -> dict[str, Any]:
         """Extract structure for direct Neo4j insertion"""
         try:
-            with file_path.open(encoding="utf-8") as f:
-                content = f.read()
+            raw = file_path.read_bytes()
+            content = raw.decode("utf-8")
 
             tree = ast.parse(content)
             relative_path = str(file_path.relative_to(repo_root))
@@ -310,6 +315,7 @@ class Neo4jCodeAnalyzer:
                 "functions": functions,
                 "imports": list(set(imports)),  # Remove duplicates
                 "line_count": len(content.splitlines()),
+                "content_hash": hashlib.sha256(raw).hexdigest(),
             }
 
         except Exception as e:
@@ -536,6 +542,238 @@ class Neo4jCodeAnalyzer:
             return "Any"
 
 
+_FILE_ROWS_QUERY = """
+    MATCH (r:Repository {name: $repo_name})
+    UNWIND $rows AS row
+    CREATE (f:File {
+        name: row.name,
+        path: row.path,
+        module_name: row.module_name,
+        line_count: row.line_count,
+        content_hash: row.content_hash,
+        imports: row.imports,
+        created_at: datetime()
+    })
+    CREATE (r)-[:CONTAINS]->(f)
+"""
+
+_CLASS_ROWS_QUERY = """
+    UNWIND $rows AS row
+    MATCH (f:File {path: row.file_path})
+    MERGE (c:Class {full_name: row.full_name})
+    ON CREATE SET c.name = row.name, c.created_at = datetime()
+    MERGE (f)-[:DEFINES]->(c)
+"""
+
+_METHOD_ROWS_QUERY = """
+    UNWIND $rows AS row
+    MATCH (c:Class {full_name: row.class_full_name})
+    MERGE (m:Method {method_id: row.method_id})
+    ON CREATE SET m.name = row.name,
+                 m.full_name = row.full_name,
+                 m.args = row.args,
+                 m.params_list = row.params_list,
+                 m.params_detailed = row.params_detailed,
+                 m.return_type = row.return_type,
+                 m.created_at = datetime()
+    MERGE (c)-[:HAS_METHOD]->(m)
+"""
+
+_ATTRIBUTE_ROWS_QUERY = """
+    UNWIND $rows AS row
+    MATCH (c:Class {full_name: row.class_full_name})
+    MERGE (a:Attribute {attr_id: row.attr_id})
+    ON CREATE SET a.name = row.name,
+                 a.full_name = row.full_name,
+                 a.type = row.type,
+                 a.created_at = datetime()
+    MERGE (c)-[:HAS_ATTRIBUTE]->(a)
+"""
+
+_FUNCTION_ROWS_QUERY = """
+    UNWIND $rows AS row
+    MATCH (file:File {path: row.file_path})
+    MERGE (func:Function {func_id: row.func_id})
+    ON CREATE SET func.name = row.name,
+                 func.full_name = row.full_name,
+                 func.args = row.args,
+                 func.params_list = row.params_list,
+                 func.params_detailed = row.params_detailed,
+                 func.return_type = row.return_type,
+                 func.created_at = datetime()
+    MERGE (file)-[:DEFINES]->(func)
+"""
+
+_IMPORT_ROWS_QUERY = """
+    UNWIND $rows AS row
+    MATCH (source:File {path: row.source_path})
+    MATCH (target:File)
+    WHERE target.module_name = row.import_name OR target.module_name STARTS WITH row.import_name
+    MERGE (source)-[:IMPORTS]->(target)
+"""
+
+# Incremental re-index: remove a file's members, then its definitions and the file itself
+_DELETE_FILE_MEMBERS_QUERY = """
+    UNWIND $rows AS path
+    MATCH (:Repository {name: $repo_name})-[:CONTAINS]->(f:File {path: path})-[:DEFINES]->(c:Class)
+    OPTIONAL MATCH (c)-[:HAS_METHOD|HAS_ATTRIBUTE]->(member)
+    DETACH DELETE member
+"""
+
+_DELETE_FILE_DEFINITIONS_QUERY = """
+    UNWIND $rows AS path
+    MATCH (:Repository {name: $repo_name})-[:CONTAINS]->(f:File {path: path})
+    OPTIONAL MATCH (f)-[:DEFINES]->(definition)
+    DETACH DELETE definition, f
+"""
+
+_RELINK_IMPORTS_QUERY = """
+    UNWIND $rows AS path
+    MATCH (r:Repository {name: $repo_name})-[:CONTAINS]->(target:File {path: path})
+    MATCH (r)-[:CONTAINS]->(source:File)
+    UNWIND coalesce(source.imports, []) AS import_name
+    WITH source, target, import_name
+    WHERE target.module_name = import_name OR target.module_name STARTS WITH import_name
+    MERGE (source)-[:IMPORTS]->(target)
+"""
+
+# Write order matters: each statement MATCHes nodes created by the ones before it
+_GRAPH_WRITE_QUERIES = [
+    ("files", _FILE_ROWS_QUERY),
+    ("classes", _CLASS_ROWS_QUERY),
+    ("methods", _METHOD_ROWS_QUERY),
+    ("attributes", _ATTRIBUTE_ROWS_QUERY),
+    ("functions", _FUNCTION_ROWS_QUERY),
+    ("imports", _IMPORT_ROWS_QUERY),
+]
+
+
+def build_graph_rows(modules_data: list[dict]) -> dict[str, list[dict]]:
+    """Flatten analyzed modules into UNWIND parameter rows, keyed by statement"""
+    rows: dict[str, list[dict]] = {key: [] for key, _ in _GRAPH_WRITE_QUERIES}
+
+    for mod in modules_data:
+        rows["files"].append(
+            {
+                "name": mod["file_path"].split("/")[-1],
+                "path": mod["file_path"],
+                "module_name": mod["module_name"],
+                "line_count": mod["line_count"],
+                "content_hash": mod.get("content_hash"),
+                "imports": mod["imports"],
+            }
+        )
+
+        for cls in mod["classes"]:
+            rows["classes"].append(
+                {"file_path": mod["file_path"], "name": cls["name"], "full_name": cls["full_name"]}
+            )
+
+            for method in cls["methods"]:
+                rows["methods"].append(
+                    {
+                        "class_full_name": cls["full_name"],
+                        "method_id": f"{cls['full_name']}::{method['name']}",
+                        "name": method["name"],
+                        "full_name": f"{cls['full_name']}.{method['name']}",
+                        "args": method["args"],
+                        "params_list": [f"{p['name']}:{p['type']}" for p in method["params"]],
+                        "params_detailed": method.get("params_detailed", []),
+                        "return_type": method["return_type"],
+                    }
+                )
+
+            for attr in cls["attributes"]:
+                rows["attributes"].append(
+                    {
+                        "class_full_name": cls["full_name"],
+                        "attr_id": f"{cls['full_name']}::{attr['name']}",
+                        "name": attr["name"],
+                        "full_name": f"{cls['full_name']}.{attr['name']}",
+                        "type": attr["type"],
+                    }
+                )
+
+        for func in mod["functions"]:
+            rows["functions"].append(
+                {
+                    "file_path": mod["file_path"],
+                    "func_id": f"{mod['file_path']}::{func['name']}",
+                    "name": func["name"],
+                    "full_name": func["full_name"],
+                    "args": func["args"],
+                    "params_list": func.get("params_list", []),
+                    "params_detailed": func.get("params_detailed", []),
+                    "return_type": func["return_type"],
+                }
+            )
+
+        rows["imports"].extend(
+            {"source_path": mod["file_path"], "import_name": import_name}
+            for import_name in mod["imports"]
+        )
+
+    return rows
+
+
+def file_content_hash(file_path: Path) -> str:
+    """SHA-256 of a file's bytes, matching the content_hash stored on File nodes"""
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+def _summarize_modules(modules_data: list[dict]) -> dict[str, Any]:
+    """Count what a batch of analyzed modules contributes to the graph"""
+    return {
+        "files_parsed": len(modules_data),
+        "classes": sum(len(mod["classes"]) for mod in modules_data),
+        "methods": sum(len(cls["methods"]) for mod in modules_data for cls in mod["classes"]),
+        "functions": sum(len(mod["functions"]) for mod in modules_data),
+        "imports": sum(len(mod["imports"]) for mod in modules_data),
+    }
+
+
+async def _run_unwind(tx, query: str, rows: list[dict], params: dict):
+    """Transaction function for a single UNWIND chunk"""
+    result = await tx.run(query, rows=rows, **params)
+    await result.consume()
+
+
+# Per-process analyzer, created lazily inside pool workers
+_worker_analyzer: Neo4jCodeAnalyzer | None = None
+
+
+def _analyze_file(file_path: Path, repo_root: Path, project_modules: set[str]) -> dict | None:
+    """Analyze a single file with this process's analyzer (picklable pool entry point)"""
+    global _worker_analyzer  # noqa: PLW0603
+    if _worker_analyzer is None:
+        _worker_analyzer = Neo4jCodeAnalyzer()
+    return _worker_analyzer.analyze_python_file(file_path, repo_root, project_modules)
+
+
+def _analyze_files(
+    python_files: list[Path], repo_root: Path, project_modules: set[str]
+) -> list[dict | None]:
+    """Analyze files sequentially in the current process"""
+    return [_analyze_file(file_path, repo_root, project_modules) for file_path in python_files]
+
+
+def _analyze_files_in_pool(
+    python_files: list[Path], repo_root: Path, project_modules: set[str], workers: int
+) -> list[dict | None]:
+    """Analyze files across a process pool, chunked to keep IPC overhead low"""
+    chunksize = max(1, len(python_files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(
+            pool.map(
+                _analyze_file,
+                python_files,
+                repeat(repo_root),
+                repeat(project_modules),
+                chunksize=chunksize,
+            )
+        )
+
+
 class DirectNeo4jExtractor:
     """Creates nodes and relationships directly in Neo4j"""
 
@@ -670,6 +908,23 @@ class DirectNeo4jExtractor:
         logger.info("Repository cloned successfully")
         return target_dir
 
+    def sync_repo(self, repo_url: str, target_dir: str) -> str:
+        """Refresh a cached clone with a shallow fetch, cloning on first use"""
+        if not (Path(target_dir) / ".git").is_dir():
+            return self.clone_repo(repo_url, target_dir)
+
+        logger.info(f"Fetching latest commit into cached clone: {target_dir}")
+        try:
+            subprocess.run(
+                ["git", "-C", target_dir, "fetch", "--depth", "1", repo_url, "HEAD"], check=True
+            )
+            subprocess.run(["git", "-C", target_dir, "reset", "--hard", "FETCH_HEAD"], check=True)
+            subprocess.run(["git", "-C", target_dir, "clean", "-fdx"], check=True)
+        except subprocess.CalledProcessError as e:
+            logger.warning(f"Could not refresh cached clone ({e}), re-cloning")
+            return self.clone_repo(repo_url, target_dir)
+        return target_dir
+
     def get_python_files(self, repo_path: str) -> list[Path]:
         """Get Python files, focusing on main source directories"""
         python_files = []
@@ -705,21 +960,81 @@ class DirectNeo4jExtractor:
 
         return python_files
 
-    async def analyze_repository(self, repo_url: str, temp_dir: str | None = None):
-        """Analyze repository and create nodes/relationships in Neo4j"""
+    def identify_project_modules(self, python_files: list[Path], repo_path: Path) -> set[str]:
+        """Collect top-level module names so imports can be classified as internal"""
+        project_modules = set()
+        for file_path in python_files:
+            relative_path = str(file_path.relative_to(repo_path))
+            module_parts = relative_path.replace("/", ".").replace(".py", "").split(".")
+            if len(module_parts) > 0 and not module_parts[0].startswith("."):
+                project_modules.add(module_parts[0])
+        return project_modules
+
+    async def parse_python_files(
+        self, python_files: list[Path], repo_path: Path, project_modules: set[str]
+    ) -> list[dict]:
+        """Parse files in a process pool so AST work neither blocks the loop nor holds the GIL"""
+        if not python_files:
+            return []
+
+        workers = config.repo_parser_workers or os.cpu_count() or 1
+        workers = min(workers, len(python_files))
+        if workers <= 1:
+            results = await asyncio.to_thread(
+                _analyze_files, python_files, repo_path, project_modules
+            )
+        else:
+            try:
+                results = await asyncio.to_thread(
+                    _analyze_files_in_pool, python_files, repo_path, project_modules, workers
+                )
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"Process pool unavailable ({e}), parsing files in a thread")
+                results = await asyncio.to_thread(
+                    _analyze_files, python_files, repo_path, project_modules
+                )
+
+        return [analysis for analysis in results if analysis]
+
+    async def analyze_repository(
+        self,
+        repo_url: str,
+        temp_dir: str | None = None,
+        incremental: bool = False,
+        use_clone_cache: bool | None = None,
+    ) -> dict[str, Any]:
+        """Analyze repository and create nodes/relationships in Neo4j
+
+        With incremental=True, only files whose content hash differs from the
+        stored File node are re-parsed; removed files are deleted. Falls back to
+        a full rebuild when the repository has not been indexed before.
+        """
         repo_name = repo_url.split("/")[-1].replace(".git", "")
         logger.info(f"Analyzing repository: {repo_name}")
 
-        # Clear existing data for this repository before re-processing
-        await self.clear_repository_data(repo_name)
+        if use_clone_cache is None:
+            use_clone_cache = bool(config.repo_parser_clone_cache_dir)
+
+        stored_hashes = await self.get_stored_file_hashes(repo_name) if incremental else {}
+        if incremental and not stored_hashes:
+            logger.info(f"No indexed files for {repo_name}, running a full index")
+            incremental = False
+
+        if not incremental:
+            # Clear existing data for this repository before re-processing
+            await self.clear_repository_data(repo_name)
 
-        # Set default temp_dir to repos folder at script level
+        # Set default temp_dir to the clone cache or the repos folder at script level
         if temp_dir is None:
-            script_dir = Path(__file__).parent
-            temp_dir = str(script_dir / "repos" / repo_name)
+            if use_clone_cache:
+                temp_dir = str(Path(config.repo_parser_clone_cache_dir) / repo_name)
+            else:
+                script_dir = Path(__file__).parent
+                temp_dir = str(script_dir / "repos" / repo_name)
 
-        # Clone and analyze
-        repo_path = Path(self.clone_repo(repo_url, temp_dir))
+        # Clone (or refresh the cached clone) and analyze
+        fetch_repo = self.sync_repo if use_clone_cache else self.clone_repo
+        repo_path = Path(await asyncio.to_thread(fetch_repo, repo_url, temp_dir))
 
         try:
             logger.info("Getting Python files...")
@@ -728,25 +1043,17 @@ class DirectNeo4jExtractor:
 
             # First pass: identify project modules
             logger.info("Identifying project modules...")
-            project_modules = set()
-            for file_path in python_files:
-                relative_path = str(file_path.relative_to(repo_path))
-                module_parts = relative_path.replace("/", ".").replace(".py", "").split(".")
-                if len(module_parts) > 0 and not module_parts[0].startswith("."):
-                    project_modules.add(module_parts[0])
-
+            project_modules = self.identify_project_modules(python_files, repo_path)
             logger.info(f"Identified project modules: {sorted(project_modules)}")
 
-            # Second pass: analyze files and collect data
-            logger.info("Analyzing Python files...")
-            modules_data = []
-            for i, file_path in enumerate(python_files):
-                if i % 20 == 0:
-                    logger.info(f"Analyzing file {i + 1}/{len(python_files)}: {file_path.name}")
+            if incremental:
+                return await self._reindex_changed_files(
+                    repo_name, python_files, repo_path, project_modules, stored_hashes
+                )
 
-                analysis = self.analyzer.analyze_python_file(file_path, repo_path, project_modules)
-                if analysis:
-                    modules_data.append(analysis)
+            # Second pass: analyze files off the event loop and collect data
+            logger.info("Analyzing Python files...")
+            modules_data = await self.parse_python_files(python_files, repo_path, project_modules)
 
             logger.info(f"Found {len(modules_data)} files with content")
 
@@ -754,25 +1061,21 @@ class DirectNeo4jExtractor:
             logger.info("Creating nodes and relationships in Neo4j...")
             await self._create_graph(repo_name, modules_data)
 
-            # Print summary
-            total_classes = sum(len(mod["classes"]) for mod in modules_data)
-            total_methods = sum(
-                len(cls["methods"]) for mod in modules_data for cls in mod["classes"]
-            )
-            total_functions = sum(len(mod["functions"]) for mod in modules_data)
-            total_imports = sum(len(mod["imports"]) for mod in modules_data)
+            stats = _summarize_modules(modules_data)
+            stats.update(mode="full", files_unchanged=0, files_removed=0)
 
             print(f"\\n=== Direct Neo4j Repository Analysis for {repo_name} ===")
-            print(f"Files processed: {len(modules_data)}")
-            print(f"Classes created: {total_classes}")
-            print(f"Methods created: {total_methods}")
-            print(f"Functions created: {total_functions}")
-            print(f"Import relationships: {total_imports}")
+            print(f"Files processed: {stats['files_parsed']}")
+            print(f"Classes created: {stats['classes']}")
+            print(f"Methods created: {stats['methods']}")
+            print(f"Functions created: {stats['functions']}")
+            print(f"Import relationships: {stats['imports']}")
 
             logger.info(f"Successfully created Neo4j graph for {repo_name}")
+            return stats
 
         finally:
-            if os.path.exists(temp_dir):
+            if not use_clone_cache and os.path.exists(temp_dir):
                 logger.info(f"Cleaning up temporary directory: {temp_dir}")
                 try:
 
@@ -790,207 +1093,116 @@ class DirectNeo4jExtractor:
                     logger.warning(f"Cleanup failed: {e}. Directory may remain at {temp_dir}")
                     # Don't fail the whole process due to cleanup issues
 
-    async def _create_graph(self, repo_name: str, modules_data: list[dict]):
-        """Create all nodes and relationships in Neo4j"""
+    async def get_stored_file_hashes(self, repo_name: str) -> dict[str, str | None]:
+        """Return {file path: content hash} for files already indexed for a repository"""
+        async with self.driver.session() as session:
+            result = await session.run(
+                """
+                MATCH (:Repository {name: $repo_name})-[:CONTAINS]->(f:File)
+                RETURN f.path AS path, f.content_hash AS content_hash
+            """,
+                repo_name=repo_name,
+            )
+            return {record["path"]: record["content_hash"] async for record in result}
+
+    async def _reindex_changed_files(
+        self,
+        repo_name: str,
+        python_files: list[Path],
+        repo_path: Path,
+        project_modules: set[str],
+        stored_hashes: dict[str, str | None],
+    ) -> dict[str, Any]:
+        """Replace the subgraphs of changed files and delete removed ones"""
+        current_hashes = await asyncio.to_thread(
+            lambda: {
+                str(file_path.relative_to(repo_path)): file_content_hash(file_path)
+                for file_path in python_files
+            }
+        )
+        changed_files = [
+            file_path
+            for file_path in python_files
+            if stored_hashes.get(str(file_path.relative_to(repo_path)))
+            != current_hashes[str(file_path.relative_to(repo_path))]
+        ]
+        changed_paths = [str(file_path.relative_to(repo_path)) for file_path in changed_files]
+        removed_paths = [path for path in stored_hashes if path not in current_hashes]
+        logger.info(
+            f"Incremental re-index of {repo_name}: {len(changed_paths)} changed, "
+            f"{len(removed_paths)} removed, "
+            f"{len(python_files) - len(changed_paths)} unchanged"
+        )
+
+        modules_data = await self.parse_python_files(changed_files, repo_path, project_modules)
+        rows = build_graph_rows(modules_data)
 
         async with self.driver.session() as session:
-            # Create Repository node
+            # Bump the version so cached symbol indexes for this repository are reloaded
             await session.run(
-                "CREATE (r:Repository {name: $repo_name, created_at: datetime()})",
+                "MATCH (r:Repository {name: $repo_name}) SET r.indexed_at = datetime()",
                 repo_name=repo_name,
             )
 
-            nodes_created = 0
-            relationships_created = 0
+            stale_paths = changed_paths + removed_paths
+            for query in (_DELETE_FILE_MEMBERS_QUERY, _DELETE_FILE_DEFINITIONS_QUERY):
+                await self._write_rows(session, query, stale_paths, repo_name=repo_name)
 
-            for i, mod in enumerate(modules_data):
-                # 1. Create File node
-                await session.run(
-                    """
-                    CREATE (f:File {
-                        name: $name,
-                        path: $path,
-                        module_name: $module_name,
-                        line_count: $line_count,
-                        created_at: datetime()
-                    })
-                """,
-                    name=mod["file_path"].split("/")[-1],
-                    path=mod["file_path"],
-                    module_name=mod["module_name"],
-                    line_count=mod["line_count"],
-                )
-                nodes_created += 1
+            await self._write_graph_rows(session, repo_name, rows)
 
-                # 2. Connect File to Repository
-                await session.run(
-                    """
-                    MATCH (r:Repository {name: $repo_name})
-                    MATCH (f:File {path: $file_path})
-                    CREATE (r)-[:CONTAINS]->(f)
-                """,
-                    repo_name=repo_name,
-                    file_path=mod["file_path"],
-                )
-                relationships_created += 1
-
-                # 3. Create Class nodes and relationships
-                for cls in mod["classes"]:
-                    # Create Class node using MERGE to avoid duplicates
-                    await session.run(
-                        """
-                        MERGE (c:Class {full_name: $full_name})
-                        ON CREATE SET c.name = $name, c.created_at = datetime()
-                    """,
-                        name=cls["name"],
-                        full_name=cls["full_name"],
-                    )
-                    nodes_created += 1
-
-                    # Connect File to Class
-                    await session.run(
-                        """
-                        MATCH (f:File {path: $file_path})
-                        MATCH (c:Class {full_name: $class_full_name})
-                        MERGE (f)-[:DEFINES]->(c)
-                    """,
-                        file_path=mod["file_path"],
-                        class_full_name=cls["full_name"],
-                    )
-                    relationships_created += 1
-
-                    # 4. Create Method nodes - use MERGE to avoid duplicates
-                    for method in cls["methods"]:
-                        method_full_name = f"{cls['full_name']}.{method['name']}"
-                        # Create method with unique ID to avoid conflicts
-                        method_id = f"{cls['full_name']}::{method['name']}"
-
-                        await session.run(
-                            """
-                            MERGE (m:Method {method_id: $method_id})
-                            ON CREATE SET m.name = $name,
-                                         m.full_name = $full_name,
-                                         m.args = $args,
-                                         m.params_list = $params_list,
-                                         m.params_detailed = $params_detailed,
-                                         m.return_type = $return_type,
-                                         m.created_at = datetime()
-                        """,
-                            name=method["name"],
-                            full_name=method_full_name,
-                            method_id=method_id,
-                            args=method["args"],
-                            params_list=[
-                                f"{p['name']}:{p['type']}" for p in method["params"]
-                            ],  # Simple format
-                            params_detailed=method.get("params_detailed", []),  # Detailed format
-                            return_type=method["return_type"],
-                        )
-                        nodes_created += 1
-
-                        # Connect Class to Method
-                        await session.run(
-                            """
-                            MATCH (c:Class {full_name: $class_full_name})
-                            MATCH (m:Method {method_id: $method_id})
-                            MERGE (c)-[:HAS_METHOD]->(m)
-                        """,
-                            class_full_name=cls["full_name"],
-                            method_id=method_id,
-                        )
-                        relationships_created += 1
-
-                    # 5. Create Attribute nodes - use MERGE to avoid duplicates
-                    for attr in cls["attributes"]:
-                        attr_full_name = f"{cls['full_name']}.{attr['name']}"
-                        # Create attribute with unique ID to avoid conflicts
-                        attr_id = f"{cls['full_name']}::{attr['name']}"
-                        await session.run(
-                            """
-                            MERGE (a:Attribute {attr_id: $attr_id})
-                            ON CREATE SET a.name = $name,
-                                         a.full_name = $full_name,
-                                         a.type = $type,
-                                         a.created_at = datetime()
-                        """,
-                            name=attr["name"],
-                            full_name=attr_full_name,
-                            attr_id=attr_id,
-                            type=attr["type"],
-                        )
-                        nodes_created += 1
-
-                        # Connect Class to Attribute
-                        await session.run(
-                            """
-                            MATCH (c:Class {full_name: $class_full_name})
-                            MATCH (a:Attribute {attr_id: $attr_id})
-                            MERGE (c)-[:HAS_ATTRIBUTE]->(a)
-                        """,
-                            class_full_name=cls["full_name"],
-                            attr_id=attr_id,
-                        )
-                        relationships_created += 1
-
-                # 6. Create Function nodes (top-level) - use MERGE to avoid duplicates
-                for func in mod["functions"]:
-                    func_id = f"{mod['file_path']}::{func['name']}"
-                    await session.run(
-                        """
-                        MERGE (f:Function {func_id: $func_id})
-                        ON CREATE SET f.name = $name,
-                                     f.full_name = $full_name,
-                                     f.args = $args,
-                                     f.params_list = $params_list,
-                                     f.params_detailed = $params_detailed,
-                                     f.return_type = $return_type,
-                                     f.created_at = datetime()
-                    """,
-                        name=func["name"],
-                        full_name=func["full_name"],
-                        func_id=func_id,
-                        args=func["args"],
-                        params_list=func.get(
-                            "params_list", []
-                        ),  # Simple format for backwards compatibility
-                        params_detailed=func.get("params_detailed", []),  # Detailed format
-                        return_type=func["return_type"],
-                    )
-                    nodes_created += 1
-
-                    # Connect File to Function
-                    await session.run(
-                        """
-                        MATCH (file:File {path: $file_path})
-                        MATCH (func:Function {func_id: $func_id})
-                        MERGE (file)-[:DEFINES]->(func)
-                    """,
-                        file_path=mod["file_path"],
-                        func_id=func_id,
-                    )
-                    relationships_created += 1
-
-                # 7. Create Import relationships
-                for import_name in mod["imports"]:
-                    # Try to find the target file
-                    await session.run(
-                        """
-                        MATCH (source:File {path: $source_path})
-                        OPTIONAL MATCH (target:File)
-                        WHERE target.module_name = $import_name OR target.module_name STARTS WITH $import_name
-                        WITH source, target
-                        WHERE target IS NOT NULL
-                        MERGE (source)-[:IMPORTS]->(target)
-                    """,
-                        source_path=mod["file_path"],
-                        import_name=import_name,
-                    )
-                    relationships_created += 1
+            # Unchanged files lost their IMPORTS edges into replaced files; restore them
+            await self._write_rows(
+                session,
+                _RELINK_IMPORTS_QUERY,
+                [row["path"] for row in rows["files"]],
+                repo_name=repo_name,
+            )
 
-                if (i + 1) % 10 == 0:
-                    logger.info(f"Processed {i + 1}/{len(modules_data)} files...")
+        stats = _summarize_modules(modules_data)
+        stats.update(
+            mode="incremental",
+            files_unchanged=len(python_files) - len(changed_paths),
+            files_removed=len(removed_paths),
+        )
+        logger.info(f"Incremental re-index complete for {repo_name}: {stats}")
+        return stats
 
-            logger.info(f"Created {nodes_created} nodes and {relationships_created} relationships")
+    async def _create_graph(self, repo_name: str, modules_data: list[dict]):
+        """Create all nodes and relationships in Neo4j using batched UNWIND writes"""
+        rows = build_graph_rows(modules_data)
+
+        async with self.driver.session() as session:
+            # Create Repository node
+            await session.run(
+                "CREATE (r:Repository {name: $repo_name, created_at: datetime()})",
+                repo_name=repo_name,
+            )
+            await self._write_graph_rows(session, repo_name, rows)
+
+        nodes_created = (
+            len(rows["files"])
+            + len(rows["classes"])
+            + len(rows["methods"])
+            + len(rows["attributes"])
+            + len(rows["functions"])
+        )
+        relationships_created = sum(len(batch) for batch in rows.values())
+        logger.info(f"Created {nodes_created} nodes and {relationships_created} relationships")
+
+    async def _write_graph_rows(self, session, repo_name: str, rows: dict[str, list[dict]]):
+        """Write File/Class/Method/Attribute/Function/Import rows under an existing Repository"""
+        # Files first so every later statement can MATCH its parent by path
+        for key, query in _GRAPH_WRITE_QUERIES:
+            await self._write_rows(session, query, rows[key], repo_name=repo_name)
+            logger.info(f"Wrote {len(rows[key])} {key} rows")
+
+    async def _write_rows(self, session, query: str, rows: list[dict], **params):
+        """Run an UNWIND query over rows, one write transaction per chunk"""
+        batch_size = max(1, config.repo_parser_batch_size)
+        for start in range(0, len(rows), batch_size):
+            await session.execute_write(
+                _run_unwind, query, rows[start : start + batch_size], params
+            )
 
     async def search_graph(self, query_type: str, **kwargs):
         """Search the Neo4j graph directly"""
@@ -0,0 +1,372 @@
+"""
+In-Memory Repository Symbol Index
+
+Loads the symbol tables (files, classes with methods and attributes, functions)
+of the repositories a script touches in a few bulk Cypher queries, caches them
+per repository version, and answers the validator's lookups without further
+Neo4j round trips.
+"""
+
+import difflib
+import logging
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+
+from .ai_script_analyzer import AnalysisResult
+from .hallucination_validator import KnowledgeGraphValidator, ScriptValidationResult
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of repository symbol tables kept per process
+SYMBOL_INDEX_CACHE_SIZE = 16
+
+_CATALOG_QUERY = """
+MATCH (r:Repository)
+OPTIONAL MATCH (r)-[:CONTAINS]->(f:File)
+RETURN r.name AS repo_name,
+       toString(coalesce(r.indexed_at, r.created_at)) AS version,
+       collect(DISTINCT split(f.module_name, '.')[0]) AS module_roots
+"""
+
+_FILES_QUERY = """
+MATCH (r:Repository)-[:CONTAINS]->(f:File)
+WHERE r.name IN $repo_names
+RETURN r.name AS repo_name, f.path AS path, f.module_name AS module_name
+"""
+
+_CLASSES_QUERY = """
+MATCH (r:Repository)-[:CONTAINS]->(:File)-[:DEFINES]->(c:Class)
+WHERE r.name IN $repo_names
+OPTIONAL MATCH (c)-[:HAS_METHOD]->(m:Method)
+WITH r, c, collect(m {.name, .params_list, .params_detailed, .return_type, .args}) AS methods
+OPTIONAL MATCH (c)-[:HAS_ATTRIBUTE]->(a:Attribute)
+RETURN r.name AS repo_name, c.name AS name, c.full_name AS full_name,
+       methods, collect(a {.name, .type}) AS attributes
+"""
+
+_FUNCTIONS_QUERY = """
+MATCH (r:Repository)-[:CONTAINS]->(:File)-[:DEFINES]->(func:Function)
+WHERE r.name IN $repo_names
+RETURN r.name AS repo_name, func.name AS name, func.full_name AS full_name,
+       func.params_list AS params_list, func.params_detailed AS params_detailed,
+       func.return_type AS return_type, func.args AS args
+"""
+
+
+def _callable_info(record: dict[str, Any]) -> dict[str, Any]:
+    """Shape a method/function record the way the validator expects"""
+    return {
+        "name": record["name"],
+        # Use detailed params if available, fall back to simple params
+        "params_list": record.get("params_detailed") or record.get("params_list") or [],
+        "return_type": record.get("return_type"),
+        "args": record.get("args") or [],
+    }
+
+
+def _repo_name_matches(repo_name: str, module_name: str, loose: bool = False) -> int | None:
+    """Rank a repository name against a module name (lower is better, None = no match)"""
+    repo = repo_name.lower()
+    module = module_name.lower()
+    if repo == module:
+        return 1
+    if repo.replace("-", "_") == module:
+        return 2
+    if repo.replace("_", "-") == module:
+        return 3
+    if loose and (module in repo or repo.replace("-", "_") in module):
+        return 4
+    return None
+
+
+@dataclass
+class ClassSymbols:
+    """A class with its public methods and annotated attributes"""
+
+    name: str
+    full_name: str
+    methods: dict[str, dict[str, Any]] = field(default_factory=dict)
+    attributes: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+@dataclass
+class RepositorySymbols:
+    """Symbol table for one indexed repository version"""
+
+    name: str
+    version: str
+    files: list[tuple[str, str]] = field(default_factory=list)  # (path, module_name)
+    classes: list[ClassSymbols] = field(default_factory=list)
+    functions: list[dict[str, Any]] = field(default_factory=list)
+
+    def __post_init__(self):
+        self._classes_by_name: dict[str, list[ClassSymbols]] = defaultdict(list)
+        self._functions_by_name: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self.reindex()
+
+    def reindex(self):
+        """Rebuild name lookups after classes/functions change"""
+        self._classes_by_name.clear()
+        self._functions_by_name.clear()
+        for cls in self.classes:
+            self._classes_by_name[cls.name].append(cls)
+        for func in self.functions:
+            self._functions_by_name[func["name"]].append(func)
+
+    def classes_named(self, name: str) -> list[ClassSymbols]:
+        return self._classes_by_name.get(name, [])
+
+    def functions_named(self, name: str) -> list[dict[str, Any]]:
+        return self._functions_by_name.get(name, [])
+
+    def count_module_files(self, module_name: str) -> int:
+        """Count files matching a module the way the Cypher module lookup does"""
+        prefix = module_name + "."
+        return sum(
+            1
+            for _, file_module in self.files
+            if file_module == module_name
+            or file_module.startswith(prefix)
+            or file_module.split(".")[0] == module_name
+        )
+
+
+class RepositorySymbolIndex:
+    """Lookups across the symbol tables of several repositories"""
+
+    def __init__(self, repositories: list[RepositorySymbols]):
+        self.repositories = {repo.name: repo for repo in repositories}
+        self._classes: dict[str, list[ClassSymbols]] = defaultdict(list)
+        self._functions: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for repo in repositories:
+            for cls in repo.classes:
+                self._classes[cls.name].append(cls)
+                self._classes[cls.full_name].append(cls)
+            for func in repo.functions:
+                self._functions[func["name"]].append(func)
+                if func.get("full_name"):
+                    self._functions[func["full_name"]].append(func)
+
+    def repositories_for_module(self, module_name: str) -> list[str]:
+        """Repositories matching a module: by file modules (most files first), then by name"""
+        by_modules = sorted(
+            (
+                (count, repo.name)
+                for repo in self.repositories.values()
+                if (count := repo.count_module_files(module_name))
+            ),
+            key=lambda item: -item[0],
+        )
+        matched = [name for _, name in by_modules]
+        by_names = sorted(
+            (rank, repo_name)
+            for repo_name in self.repositories
+            if (rank := _repo_name_matches(repo_name, module_name)) is not None
+        )
+        return matched + [name for _, name in by_names if name not in matched]
+
+    def repository_for_module(self, module_name: str) -> str | None:
+        """Best repository for a module, with loose name matching as the last resort"""
+        candidates = self.repositories_for_module(module_name)
+        if candidates:
+            return candidates[0]
+        loose = sorted(
+            (rank, repo_name)
+            for repo_name in self.repositories
+            if (rank := _repo_name_matches(repo_name, module_name, loose=True)) is not None
+        )
+        return loose[0][1] if loose else None
+
+    def module_files(self, module_name: str, limit: int = 50) -> list[str]:
+        candidates = self.repositories_for_module(module_name)
+        if not candidates:
+            return []
+        return [path for path, _ in self.repositories[candidates[0]].files[:limit]]
+
+    def module_contents(self, module_name: str) -> tuple[list[str], list[str]]:
+        candidates = self.repositories_for_module(module_name)
+        if not candidates:
+            return [], []
+        repo = self.repositories[candidates[0]]
+        classes = list(dict.fromkeys(cls.name for cls in repo.classes))
+        functions = list(dict.fromkeys(func["name"] for func in repo.functions))
+        return classes, functions
+
+    def _scoped_classes(self, class_name: str) -> list[ClassSymbols]:
+        """Classes by exact name/full name, else by short name inside the module's repository"""
+        found = self._classes.get(class_name)
+        if found:
+            return found
+        if "." in class_name:
+            module_part, class_part = class_name.rsplit(".", 1)
+            repo_name = self.repository_for_module(module_part)
+            if repo_name:
+                return self.repositories[repo_name].classes_named(class_part)
+        return []
+
+    def find_class(self, class_name: str) -> dict[str, Any] | None:
+        classes = self._scoped_classes(class_name)
+        if not classes:
+            return None
+        return {"name": classes[0].name, "full_name": classes[0].full_name}
+
+    def find_method(self, class_name: str, method_name: str) -> dict[str, Any] | None:
+        for cls in self._scoped_classes(class_name):
+            if method_name in cls.methods:
+                return cls.methods[method_name]
+        return None
+
+    def find_attribute(self, class_name: str, attr_name: str) -> dict[str, Any] | None:
+        for cls in self._scoped_classes(class_name):
+            if attr_name in cls.attributes:
+                return cls.attributes[attr_name]
+        return None
+
+    def find_function(self, func_name: str) -> dict[str, Any] | None:
+        found = self._functions.get(func_name)
+        if found:
+            return found[0]
+        if "." in func_name:
+            module_part, func_part = func_name.rsplit(".", 1)
+            repo_name = self.repository_for_module(module_part)
+            if repo_name:
+                functions = self.repositories[repo_name].functions_named(func_part)
+                if functions:
+                    return functions[0]
+        return None
+
+    def find_similar_methods(self, class_name: str, method_name: str, limit: int = 5) -> list[str]:
+        """Suggest method names sharing a prefix, then close fuzzy matches"""
+        names = list(
+            dict.fromkeys(name for cls in self._scoped_classes(class_name) for name in cls.methods)
+        )
+        partial = method_name[:3]
+        suggestions = [name for name in names if partial in name]
+        for name in difflib.get_close_matches(method_name, names, n=limit, cutoff=0.6):
+            if name not in suggestions:
+                suggestions.append(name)
+        return suggestions[:limit]
+
+
+# (repo_name, version) -> RepositorySymbols, least recently used first
+_symbol_cache: "OrderedDict[tuple[str, str], RepositorySymbols]" = OrderedDict()
+
+
+def clear_symbol_cache():
+    """Drop all cached repository symbol tables"""
+    _symbol_cache.clear()
+
+
+def _script_module_roots(analysis: AnalysisResult) -> set[str]:
+    """Top-level module names a script refers to"""
+    names = [imp.module if imp.is_from_import else imp.name for imp in analysis.imports]
+    names += [inst.full_class_name for inst in analysis.class_instantiations]
+    names += [call.object_type for call in analysis.method_calls]
+    names += [access.object_type for access in analysis.attribute_accesses]
+    names += [call.full_name for call in analysis.function_calls]
+    return {name.split(".")[0] for name in names if name}
+
+
+async def load_symbol_index(driver, analysis: AnalysisResult) -> RepositorySymbolIndex:
+    """Load (or reuse cached) symbol tables for the repositories a script may reference"""
+    roots = _script_module_roots(analysis)
+
+    async with driver.session() as session:
+        result = await session.run(_CATALOG_QUERY)
+        catalog = [record.data() async for record in result]
+
+        versions: dict[str, str] = {}
+        for entry in catalog:
+            name = entry["repo_name"]
+            module_roots = set(entry["module_roots"] or [])
+            if module_roots & roots or any(
+                _repo_name_matches(name, root) is not None for root in roots
+            ):
+                versions[name] = entry["version"] or ""
+
+        repositories: list[RepositorySymbols] = []
+        missing: list[str] = []
+        for name, version in versions.items():
+            cached = _symbol_cache.get((name, version))
+            if cached is not None:
+                _symbol_cache.move_to_end((name, version))
+                repositories.append(cached)
+            else:
+                missing.append(name)
+
+        if missing:
+            loaded = {
+                name: RepositorySymbols(name=name, version=versions[name]) for name in missing
+            }
+
+            result = await session.run(_FILES_QUERY, repo_names=missing)
+            async for record in result:
+                loaded[record["repo_name"]].files.append((record["path"], record["module_name"]))
+
+            result = await session.run(_CLASSES_QUERY, repo_names=missing)
+            async for record in result:
+                cls = ClassSymbols(name=record["name"], full_name=record["full_name"])
+                for method in record["methods"]:
+                    cls.methods.setdefault(method["name"], _callable_info(method))
+                for attr in record["attributes"]:
+                    cls.attributes.setdefault(
+                        attr["name"], {"name": attr["name"], "type": attr["type"]}
+                    )
+                loaded[record["repo_name"]].classes.append(cls)
+
+            result = await session.run(_FUNCTIONS_QUERY, repo_names=missing)
+            async for record in result:
+                func = _callable_info(record.data())
+                func["full_name"] = record["full_name"]
+                loaded[record["repo_name"]].functions.append(func)
+
+            for repo in loaded.values():
+                repo.reindex()
+                _symbol_cache[(repo.name, repo.version)] = repo
+                repositories.append(repo)
+            while len(_symbol_cache) > SYMBOL_INDEX_CACHE_SIZE:
+                _symbol_cache.popitem(last=False)
+
+    logger.info(
+        f"Symbol index ready for {len(repositories)} repositories "
+        f"({len(missing)} loaded, {len(repositories) - len(missing)} cached)"
+    )
+    return RepositorySymbolIndex(repositories)
+
+
+class IndexedKnowledgeGraphValidator(KnowledgeGraphValidator):
+    """KnowledgeGraphValidator that resolves every lookup from an in-memory symbol index"""
+
+    def __init__(self, neo4j_uri: str, neo4j_user: str, neo4j_password: str):
+        super().__init__(neo4j_uri, neo4j_user, neo4j_password)
+        self.symbol_index: RepositorySymbolIndex | None = None
+
+    async def validate_script(self, analysis_result: AnalysisResult) -> ScriptValidationResult:
+        """Load the relevant symbol tables once, then validate entirely in memory"""
+        self.symbol_index = await load_symbol_index(self.driver, analysis_result)
+        return await super().validate_script(analysis_result)
+
+    async def _find_modules(self, module_name: str) -> list[str]:
+        return self.symbol_index.module_files(module_name)
+
+    async def _get_module_contents(self, module_name: str) -> tuple[list[str], list[str]]:
+        return self.symbol_index.module_contents(module_name)
+
+    async def _find_repository_for_module(self, module_name: str) -> str | None:
+        return self.symbol_index.repository_for_module(module_name)
+
+    async def _find_class(self, class_name: str) -> dict[str, Any] | None:
+        return self.symbol_index.find_class(class_name)
+
+    async def _find_method(self, class_name: str, method_name: str) -> dict[str, Any] | None:
+        return self.symbol_index.find_method(class_name, method_name)
+
+    async def _find_attribute(self, class_name: str, attr_name: str) -> dict[str, Any] | None:
+        return self.symbol_index.find_attribute(class_name, attr_name)
+
+    async def _find_function(self, func_name: str) -> dict[str, Any] | None:
+        return self.symbol_index.find_function(func_name)
+
+    async def _find_similar_methods(self, class_name: str, method_name: str) -> list[str]:
+        return self.symbol_index.find_similar_methods(class_name, method_name)
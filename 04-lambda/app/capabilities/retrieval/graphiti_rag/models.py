@@ -25,6 +25,9 @@ class ParseRepositoryRequest(BaseModel):
     """Request model for parsing a GitHub repository."""
 
     repo_url: str = Field(..., description="GitHub repository URL (must end with .git)")
+    incremental: bool = Field(
+        False, description="Only re-parse files whose content changed since the last index"
+    )
 
 
 class ParseRepositoryResponse(BaseModel):
@@ -33,6 +36,7 @@ class ParseRepositoryResponse(BaseModel):
     success: bool
     message: str
     repo_url: str
+    stats: dict[str, Any] | None = None
 
 
 class ValidateScriptRequest(BaseModel):
@@ -65,3 +69,21 @@ class QueryKnowledgeGraphResponse(BaseModel):
     success: bool
     data: dict[str, Any] | None = None
     error: str | None = None
+
+
+class GraphitiIngestionStatsResponse(BaseModel):
+    """Response model for background Graphiti ingestion queue health."""
+
+    running: bool = False
+    workers: int = 0
+    max_size: int = 0
+    depth: int = Field(0, description="Documents waiting for a worker")
+    in_flight: int = Field(0, description="Documents currently being ingested")
+    lag_seconds: float = Field(0.0, description="Age of the oldest waiting document")
+    avg_job_seconds: float = 0.0
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    skipped_unchanged: int = 0
+    superseded: int = 0
+    backpressure_waits: int = Field(0, description="Submissions that found the queue full")
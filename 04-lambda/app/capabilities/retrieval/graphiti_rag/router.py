@@ -5,7 +5,9 @@ from typing import Annotated
 
 from app.capabilities.retrieval.graphiti_rag.config import config as graphiti_config
 from app.capabilities.retrieval.graphiti_rag.dependencies import GraphitiRAGDeps
+from app.capabilities.retrieval.graphiti_rag.ingestion.queue import get_graphiti_ingestion_stats
 from app.capabilities.retrieval.graphiti_rag.models import (
+    GraphitiIngestionStatsResponse,
     GraphitiSearchRequest,
     GraphitiSearchResponse,
     ParseRepositoryRequest,
@@ -69,6 +71,17 @@ async def search_graphiti_endpoint(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.get("/ingestion/stats", response_model=GraphitiIngestionStatsResponse)
+async def graphiti_ingestion_stats_endpoint():
+    """
+    Report backlog and throughput of the background Graphiti ingestion queue.
+
+    A growing depth or lag_seconds means graph enrichment is falling behind
+    MongoDB ingestion; backpressure_waits counts producers that had to wait.
+    """
+    return GraphitiIngestionStatsResponse(**(get_graphiti_ingestion_stats() or {}))
+
+
 @router.post("/knowledge-graph/repositories", response_model=ParseRepositoryResponse)
 async def parse_github_repository_endpoint(
     request: ParseRepositoryRequest,
@@ -88,7 +101,9 @@ async def parse_github_repository_endpoint(
 
     try:
         tool_ctx = RunContext(deps=deps, state={}, agent=None, run_id="")
-        result = await parse_github_repository(tool_ctx, request.repo_url)
+        result = await parse_github_repository(
+            tool_ctx, request.repo_url, incremental=request.incremental
+        )
 
         if not result.get("success"):
             raise HTTPException(
@@ -96,7 +111,10 @@ async def parse_github_repository_endpoint(
             )
 
         return ParseRepositoryResponse(
-            success=result["success"], message=result["message"], repo_url=result["repo_url"]
+            success=result["success"],
+            message=result["message"],
+            repo_url=result["repo_url"],
+            stats=result.get("stats"),
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -15,6 +15,9 @@ from app.capabilities.retrieval.graphiti_rag.knowledge_graphs.hallucination_vali
 from app.capabilities.retrieval.graphiti_rag.knowledge_graphs.repository_parser import (
     DirectNeo4jExtractor,
 )
+from app.capabilities.retrieval.graphiti_rag.knowledge_graphs.symbol_index import (
+    IndexedKnowledgeGraphValidator,
+)
 from app.capabilities.retrieval.graphiti_rag.search.graph_search import graphiti_search
 from pydantic_ai import RunContext
 
@@ -66,7 +69,7 @@ async def search_graphiti_knowledge_graph(
 
 
 async def parse_github_repository(
-    ctx: RunContext[GraphitiRAGDeps], repo_url: str
+    ctx: RunContext[GraphitiRAGDeps], repo_url: str, incremental: bool = False
 ) -> dict[str, Any]:
     """
     Parse a GitHub repository into the Neo4j knowledge graph.
@@ -77,9 +80,10 @@ async def parse_github_repository(
     Args:
         ctx: Runtime context with Graphiti dependencies
         repo_url: GitHub repository URL (must end with .git)
+        incremental: Only re-parse files whose content hash changed since the last index
 
     Returns:
-        Dictionary with success status and message
+        Dictionary with success status, message and parse statistics
     """
     if not config.use_knowledge_graph:
         raise ValueError("Knowledge graph is not enabled. Set USE_KNOWLEDGE_GRAPH=true.")
@@ -91,12 +95,13 @@ async def parse_github_repository(
 
     try:
         await extractor.initialize()
-        await extractor.analyze_repository(repo_url)
+        stats = await extractor.analyze_repository(repo_url, incremental=incremental)
 
         return {
             "success": True,
             "message": f"Repository {repo_url} parsed successfully",
             "repo_url": repo_url,
+            "stats": stats,
         }
     except Exception as e:
         logger.exception("Error parsing repository")
@@ -127,7 +132,10 @@ async def validate_ai_script(ctx: RunContext[GraphitiRAGDeps], script_path: str)
     if not config.use_knowledge_graph:
         raise ValueError("Knowledge graph is not enabled. Set USE_KNOWLEDGE_GRAPH=true.")
 
-    validator = KnowledgeGraphValidator(config.neo4j_uri, config.neo4j_user, config.neo4j_password)
+    validator_class = (
+        IndexedKnowledgeGraphValidator if config.kg_validator_in_memory else KnowledgeGraphValidator
+    )
+    validator = validator_class(config.neo4j_uri, config.neo4j_user, config.neo4j_password)
 
     try:
         await validator.initialize()
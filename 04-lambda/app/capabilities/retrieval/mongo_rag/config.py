@@ -26,11 +26,46 @@ class RAGConfig:
     embedding_base_url = global_settings.embedding_base_url
     embedding_api_key = global_settings.embedding_api_key
     embedding_dimension = global_settings.embedding_dimension
+    embedding_storage = global_settings.embedding_storage
+    embedding_keep_full_precision = global_settings.embedding_keep_full_precision
+    embedding_rescore_factor = global_settings.embedding_rescore_factor
+
+    # Vector search backend (atlas, or a local exact/hnsw index)
+    vector_search_backend = global_settings.vector_search_backend
+    vector_index_path = global_settings.vector_index_path
+    vector_index_watch_changes = global_settings.vector_index_watch_changes
+    vector_index_hnsw_m = global_settings.vector_index_hnsw_m
+    vector_index_hnsw_ef_construction = global_settings.vector_index_hnsw_ef_construction
+    vector_index_hnsw_ef_search = global_settings.vector_index_hnsw_ef_search
+
+    # Text search query planning
+    text_search_planner = global_settings.text_search_planner
+    text_search_fuzzy_fallback = global_settings.text_search_fuzzy_fallback
+    text_search_fuzzy_max_edits = global_settings.text_search_fuzzy_max_edits
 
     # Search
     default_match_count = 10
     max_match_count = 50
-    default_text_weight = 0.3
+    default_text_weight = global_settings.hybrid_text_weight
+
+    # Hybrid search fusion and per-source deadlines
+    hybrid_fusion = global_settings.hybrid_fusion
+    hybrid_graphiti_weight = global_settings.hybrid_graphiti_weight
+    hybrid_search_timeout_ms = global_settings.hybrid_search_timeout_ms
+    hybrid_graphiti_timeout_ms = global_settings.hybrid_graphiti_timeout_ms
+
+    # Document header cache (title, source and RLS fields for search results)
+    document_header_cache_size = global_settings.document_header_cache_size
+    document_header_cache_ttl_seconds = global_settings.document_header_cache_ttl_seconds
+
+    # Ingestion chunking without a DoclingDocument ("markdown" or "simple")
+    fallback_chunker = global_settings.fallback_chunker
+
+    # Code example summaries (concurrency, cache, batching of small blocks)
+    code_summary_concurrency = global_settings.code_summary_concurrency
+    code_summary_cache = global_settings.code_summary_cache
+    code_summary_batch_size = global_settings.code_summary_batch_size
+    code_summary_batch_max_chars = global_settings.code_summary_batch_max_chars
 
     # Advanced RAG Strategies
     use_contextual_embeddings = global_settings.use_contextual_embeddings
@@ -224,6 +224,37 @@ class AgentDependencies(BaseDependencies):
             logger.exception(f"Embedding generation failed: {e}")
             raise
 
+    async def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings for several texts in a single API call.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors in the same order as texts
+
+        Raises:
+            Exception: If embedding generation fails
+        """
+        if not texts:
+            return []
+        if not self.openai_client:
+            await self.initialize()
+
+        try:
+            response = await self.openai_client.embeddings.create(
+                model=self.settings.embedding_model,
+                input=texts,
+            )
+            # Providers may return items out of order; each carries its input index
+            data = sorted(response.data, key=lambda item: item.index)
+            logger.debug(f"Generated {len(data)} embeddings in one request")
+            return [item.embedding for item in data]
+        except Exception as e:
+            logger.exception(f"Batch embedding generation failed: {e}")
+            raise
+
     def set_user_preference(self, key: str, value: Any) -> None:
         """
         Set a user preference for the session.
@@ -0,0 +1,154 @@
+"""Document headers for search results: title, source and RLS fields.
+
+Search pipelines used to $lookup every hit's parent document, which reads the
+whole document (including its full ``content``) just for title, source and the
+RLS check. Chunks now carry ``document_title``/``document_source`` from
+ingestion, and the remaining needs (RLS, chunks ingested before
+denormalization) are served from a process-level LRU of document headers. A
+header miss reads only HEADER_PROJECTION from the documents collection.
+
+Cached headers expire after DOCUMENT_HEADER_CACHE_TTL_SECONDS, which bounds how
+long a sharing change made elsewhere takes to apply to search results.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+from app.capabilities.retrieval.mongo_rag.config import config
+from app.capabilities.retrieval.mongo_rag.vector_index.filters import matches_filter
+
+logger = logging.getLogger(__name__)
+
+HEADER_FIELDS = (
+    "title",
+    "source",
+    "user_id",
+    "user_email",
+    "is_public",
+    "shared_with",
+    "group_ids",
+)
+HEADER_PROJECTION = dict.fromkeys(HEADER_FIELDS, 1)
+
+
+class DocumentHeaderCache:
+    """LRU of document headers keyed by document _id, with a time-to-live."""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Any, tuple[float, dict[str, Any]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_many(self, documents: Any, ids: Iterable[Any]) -> dict[Any, dict[str, Any]]:
+        """
+        Headers for the given document ids, fetching misses in one query.
+
+        Args:
+            documents: Documents collection
+            ids: Document _ids
+
+        Returns:
+            Headers by _id; documents that don't exist are absent
+        """
+        now = time.monotonic()
+        found: dict[Any, dict[str, Any]] = {}
+        missing = []
+        for document_id in dict.fromkeys(ids):
+            entry = self._entries.get(document_id)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(document_id)
+                found[document_id] = entry[1]
+            else:
+                missing.append(document_id)
+        self.hits += len(found)
+        self.misses += len(missing)
+
+        if missing:
+            cursor = documents.find({"_id": {"$in": missing}}, HEADER_PROJECTION)
+            async for header in cursor:
+                found[header["_id"]] = header
+                self._put(header["_id"], header, now)
+        return found
+
+    def _put(self, document_id: Any, header: dict[str, Any], now: float) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[document_id] = (now + self.ttl_seconds, header)
+        self._entries.move_to_end(document_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_header_cache: DocumentHeaderCache | None = None
+
+
+def get_document_header_cache() -> DocumentHeaderCache:
+    """Return the process-wide document header cache."""
+    global _header_cache
+    if _header_cache is None:
+        _header_cache = DocumentHeaderCache(
+            config.document_header_cache_size, config.document_header_cache_ttl_seconds
+        )
+    return _header_cache
+
+
+async def attach_document_headers(
+    db: Any,
+    settings: Any,
+    results: list[dict[str, Any]],
+    access_filter: dict[str, Any] | None,
+) -> list[dict[str, Any]]:
+    """
+    Fill in document title/source and drop results the user cannot read.
+
+    Equivalent to the former ``$lookup`` of the parent document with the RLS
+    filter followed by ``$unwind``: results whose document is missing or fails
+    ``access_filter`` are dropped. Admins (empty filter) on denormalized chunks
+    need no document reads at all.
+
+    Args:
+        db: Database (the caller's connection)
+        settings: RAG settings (collection names)
+        results: Pipeline results with document_id and, when denormalized,
+            document_title/document_source
+        access_filter: Document RLS filter from build_access_filter ({} for admins)
+
+    Returns:
+        The readable results, in order, with document_title and document_source set
+    """
+
+    def needs_header(result: dict[str, Any]) -> bool:
+        return bool(access_filter) or (
+            result.get("document_title") is None or result.get("document_source") is None
+        )
+
+    needed = [r["document_id"] for r in results if needs_header(r)]
+    if not needed:
+        return results
+
+    headers = await get_document_header_cache().get_many(
+        db[settings.mongodb_collection_documents], needed
+    )
+    readable = []
+    for result in results:
+        if needs_header(result):
+            header = headers.get(result["document_id"])
+            if header is None or (access_filter and not matches_filter(header, access_filter)):
+                continue  # parent document missing or not readable
+            if result.get("document_title") is None:
+                result["document_title"] = header.get("title", "")
+            if result.get("document_source") is None:
+                result["document_source"] = header.get("source", "")
+        readable.append(result)
+    return readable
@@ -1,6 +1,5 @@
 """Ingest code examples into MongoDB."""
 
-import asyncio
 import logging
 from datetime import datetime
 from typing import Any
@@ -9,7 +8,9 @@ from bson import ObjectId
 from app.capabilities.retrieval.mongo_rag.config import config
 from app.capabilities.retrieval.mongo_rag.extraction.code_extractor import extract_code_blocks
 from app.capabilities.retrieval.mongo_rag.extraction.code_summarizer import (
-    generate_code_example_summary,
+    SUMMARY_CACHE_COLLECTION,
+    CodeSummarizer,
+    SummaryStats,
 )
 from app.capabilities.retrieval.mongo_rag.ingestion.chunker import DocumentChunk
 from app.capabilities.retrieval.mongo_rag.ingestion.embedder import create_embedder
@@ -38,7 +39,8 @@ async def ingest_code_examples(
         min_code_length: Minimum length of code blocks to extract
 
     Returns:
-        Dictionary with ingestion statistics
+        Dictionary with ingestion statistics, including summary LLM calls made,
+        cache hits and calls saved
     """
     db = mongo_client[config.mongodb_database]
     code_examples_collection = db["code_examples"]
@@ -47,34 +49,26 @@ async def ingest_code_examples(
     code_blocks = extract_code_blocks(markdown_content, min_length=min_code_length)
 
     if not code_blocks:
-        return {"code_examples_extracted": 0, "code_examples_stored": 0, "errors": []}
+        return {
+            "code_examples_extracted": 0,
+            "code_examples_stored": 0,
+            "errors": [],
+            **SummaryStats().as_dict(),
+        }
 
     logger.info(f"Extracted {len(code_blocks)} code blocks from document {document_id}")
 
-    # Generate summaries in parallel
     embedder = create_embedder()
-    summaries = []
     errors = []
 
-    # Process summaries concurrently
-    summary_tasks = [
-        generate_code_example_summary(
-            block["code"], block["context_before"], block["context_after"]
-        )
-        for block in code_blocks
-    ]
-
-    try:
-        summaries = await asyncio.gather(*summary_tasks, return_exceptions=True)
-    except Exception:
-        logger.exception("Error generating summaries")
-        summaries = ["Code example for demonstration purposes."] * len(code_blocks)
-
-    # Fix any exceptions in summaries
-    for i, summary in enumerate(summaries):
-        if isinstance(summary, Exception):
-            logger.warning(f"Summary generation failed for block {i}: {summary}")
-            summaries[i] = "Code example for demonstration purposes."
+    summarizer = CodeSummarizer(
+        cache_collection=db[SUMMARY_CACHE_COLLECTION] if config.code_summary_cache else None
+    )
+    summaries, summary_stats = await summarizer.summarize(code_blocks)
+    logger.info(
+        f"Summarized {len(code_blocks)} code blocks with {summary_stats.llm_calls} LLM calls "
+        f"({summary_stats.cache_hits} cached, {summary_stats.llm_calls_saved} calls saved)"
+    )
 
     # Generate embeddings for code examples (code + summary)
     # Create DocumentChunk objects for embedder
@@ -141,4 +135,5 @@ async def ingest_code_examples(
         "code_examples_extracted": len(code_blocks),
         "code_examples_stored": stored_count,
         "errors": errors,
+        **summary_stats.as_dict(),
     }
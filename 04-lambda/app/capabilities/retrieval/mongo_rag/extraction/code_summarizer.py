@@ -1,12 +1,73 @@
-"""Generate summaries for code examples using LLM."""
+"""Generate summaries for code examples using LLM.
 
+Summaries go through CodeSummarizer, which bounds the number of LLM calls in
+flight (CODE_SUMMARY_CONCURRENCY), reuses one OpenAI client per process, and
+keeps a persistent cache of summaries in MongoDB keyed by a hash of the model,
+code and context, so re-crawling an unchanged page does not summarize it again.
+Small code blocks can be summarized several to a prompt with JSON output
+(CODE_SUMMARY_BATCH_SIZE); blocks missing from a batch answer are retried alone.
+"""
+
+import asyncio
+import hashlib
+import json
 import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
 
 import openai
 from app.capabilities.retrieval.mongo_rag.config import config
+from pymongo import UpdateOne
 
 logger = logging.getLogger(__name__)
 
+FALLBACK_SUMMARY = "Code example for demonstration purposes."
+SUMMARY_CACHE_COLLECTION = "code_summaries"
+
+_SYSTEM_PROMPT = "You are a helpful assistant that provides concise code example summaries."
+_INSTRUCTIONS = (
+    "provide a concise summary (2-3 sentences) that describes what this code example "
+    "demonstrates and its purpose. Focus on the practical application and key concepts "
+    "illustrated."
+)
+
+_client: openai.AsyncOpenAI | None = None
+
+
+def get_llm_client() -> openai.AsyncOpenAI:
+    """Process-wide client for the configured LLM endpoint."""
+    global _client
+    if _client is None:
+        _client = openai.AsyncOpenAI(api_key=config.llm_api_key, base_url=config.llm_base_url)
+    return _client
+
+
+def _trim(code: str, context_before: str, context_after: str) -> tuple[str, str, str]:
+    """The parts of a block that go into the prompt."""
+    return code[:1500], context_before[-500:], context_after[:500]
+
+
+def summary_cache_key(model: str, code: str, context_before: str, context_after: str) -> str:
+    """Hash of everything that determines a summary."""
+    payload = "\x00".join((model, *_trim(code, context_before, context_after)))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _block_prompt(code: str, context_before: str, context_after: str) -> str:
+    code, context_before, context_after = _trim(code, context_before, context_after)
+    return f"""<context_before>
+{context_before}
+</context_before>
+
+<code_example>
+{code}
+</code_example>
+
+<context_after>
+{context_after}
+</context_after>"""
+
 
 async def generate_code_example_summary(code: str, context_before: str, context_after: str) -> str:
     """
@@ -20,36 +81,16 @@ async def generate_code_example_summary(code: str, context_before: str, context_
     Returns:
         A summary of what the code example demonstrates
     """
-    # Use LLM model from config
-    model_choice = config.llm_model
-
-    # Create the prompt
-    prompt = f"""<context_before>
-{context_before[-500:] if len(context_before) > 500 else context_before}
-</context_before>
-
-<code_example>
-{code[:1500] if len(code) > 1500 else code}
-</code_example>
-
-<context_after>
-{context_after[:500] if len(context_after) > 500 else context_after}
-</context_after>
-
-Based on the code example and its surrounding context, provide a concise summary (2-3 sentences) that describes what this code example demonstrates and its purpose. Focus on the practical application and key concepts illustrated.
-"""
+    prompt = (
+        f"{_block_prompt(code, context_before, context_after)}\n\n"
+        f"Based on the code example and its surrounding context, {_INSTRUCTIONS}\n"
+    )
 
     try:
-        # Initialize OpenAI client
-        client = openai.AsyncOpenAI(api_key=config.llm_api_key, base_url=config.llm_base_url)
-
-        response = await client.chat.completions.create(
-            model=model_choice,
+        response = await get_llm_client().chat.completions.create(
+            model=config.llm_model,
             messages=[
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant that provides concise code example summaries.",
-                },
+                {"role": "system", "content": _SYSTEM_PROMPT},
                 {"role": "user", "content": prompt},
             ],
             temperature=0.3,
@@ -60,4 +101,225 @@ Based on the code example and its surrounding context, provide a concise summary
 
     except Exception:
         logger.exception("Error generating code example summary")
-        return "Code example for demonstration purposes."
+        return FALLBACK_SUMMARY
+
+
+@dataclass
+class SummaryStats:
+    """LLM usage of one summarization run."""
+
+    blocks: int = 0
+    cache_hits: int = 0
+    llm_calls: int = 0
+    batched_blocks: int = 0
+    failures: int = 0
+
+    @property
+    def llm_calls_saved(self) -> int:
+        """Calls avoided compared to one call per block."""
+        # A failed batch is retried block by block, so calls can exceed blocks
+        return max(0, self.blocks - self.llm_calls)
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "summary_cache_hits": self.cache_hits,
+            "summary_llm_calls": self.llm_calls,
+            "summary_llm_calls_saved": self.llm_calls_saved,
+            "summary_failures": self.failures,
+        }
+
+
+class CodeSummarizer:
+    """Summarizes code blocks with bounded concurrency, caching and batching."""
+
+    def __init__(
+        self,
+        *,
+        client: openai.AsyncOpenAI | None = None,
+        model: str | None = None,
+        cache_collection: Any | None = None,
+        concurrency: int | None = None,
+        batch_size: int | None = None,
+        batch_max_chars: int | None = None,
+    ):
+        """
+        Initialize the summarizer.
+
+        Args:
+            client: OpenAI-compatible client (default: the shared LLM client)
+            model: LLM model (default: LLM_MODEL)
+            cache_collection: MongoDB collection for cached summaries (None: no cache)
+            concurrency: LLM calls in flight (default: CODE_SUMMARY_CONCURRENCY)
+            batch_size: Small blocks per prompt, 1 disables batching
+                (default: CODE_SUMMARY_BATCH_SIZE)
+            batch_max_chars: Largest block that is batched
+                (default: CODE_SUMMARY_BATCH_MAX_CHARS)
+        """
+        self.client = client or get_llm_client()
+        self.model = model or config.llm_model
+        self.cache_collection = cache_collection
+        self.batch_size = max(1, batch_size or config.code_summary_batch_size)
+        self.batch_max_chars = batch_max_chars or config.code_summary_batch_max_chars
+        self._semaphore = asyncio.Semaphore(max(1, concurrency or config.code_summary_concurrency))
+
+    async def summarize(self, blocks: list[dict[str, Any]]) -> tuple[list[str], SummaryStats]:
+        """
+        Summarize code blocks as returned by extract_code_blocks.
+
+        Args:
+            blocks: Dicts with code, context_before and context_after
+
+        Returns:
+            One summary per block (FALLBACK_SUMMARY where the LLM failed) and the
+            run's statistics
+        """
+        stats = SummaryStats(blocks=len(blocks))
+        keys = [
+            summary_cache_key(self.model, b["code"], b["context_before"], b["context_after"])
+            for b in blocks
+        ]
+        summaries: list[str | None] = [None] * len(blocks)
+
+        cached = await self._cache_get(set(keys))
+        for i, key in enumerate(keys):
+            if key in cached:
+                summaries[i] = cached[key]
+                stats.cache_hits += 1
+
+        # Blocks sharing a key (the same snippet repeated on a page) are summarized once
+        pending: dict[str, int] = {}
+        for i, key in enumerate(keys):
+            if summaries[i] is None:
+                pending.setdefault(key, i)
+
+        small = [i for i in pending.values() if len(blocks[i]["code"]) <= self.batch_max_chars]
+        batches = []
+        if self.batch_size > 1:
+            batches = [
+                small[start : start + self.batch_size]
+                for start in range(0, len(small), self.batch_size)
+            ]
+            batches = [batch for batch in batches if len(batch) > 1]
+        batched = {i for batch in batches for i in batch}
+        singles = [i for i in pending.values() if i not in batched]
+
+        results: dict[int, str] = {}
+
+        async def run_batch(batch: list[int]) -> None:
+            answered = await self._summarize_batch([blocks[i] for i in batch], stats)
+            for i, summary in zip(batch, answered, strict=True):
+                if summary:
+                    results[i] = summary
+                    stats.batched_blocks += 1
+                else:
+                    await run_single(i)
+
+        async def run_single(i: int) -> None:
+            summary = await self._summarize_one(blocks[i], stats)
+            if summary:
+                results[i] = summary
+
+        await asyncio.gather(*map(run_batch, batches), *map(run_single, singles))
+
+        fresh = {keys[i]: summary for i, summary in results.items()}
+        for i, key in enumerate(keys):
+            if summaries[i] is None:
+                summaries[i] = fresh.get(key)
+                if summaries[i] is None:
+                    stats.failures += 1
+                    summaries[i] = FALLBACK_SUMMARY
+        await self._cache_put(fresh)
+        return summaries, stats
+
+    async def _complete(self, prompt: str, stats: SummaryStats, **kwargs: Any) -> str:
+        async with self._semaphore:
+            stats.llm_calls += 1
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": _SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=0.3,
+                **kwargs,
+            )
+        return (response.choices[0].message.content or "").strip()
+
+    async def _summarize_one(self, block: dict[str, Any], stats: SummaryStats) -> str | None:
+        prompt = (
+            f"{_block_prompt(block['code'], block['context_before'], block['context_after'])}"
+            f"\n\nBased on the code example and its surrounding context, {_INSTRUCTIONS}\n"
+        )
+        try:
+            return await self._complete(prompt, stats, max_tokens=100) or None
+        except Exception:
+            logger.exception("Error generating code example summary")
+            return None
+
+    async def _summarize_batch(
+        self, blocks: list[dict[str, Any]], stats: SummaryStats
+    ) -> list[str | None]:
+        """Summaries for several blocks from one prompt; None where the answer lacks one."""
+        examples = "\n\n".join(
+            f'<example id="{n}">\n'
+            f"{_block_prompt(b['code'], b['context_before'], b['context_after'])}\n"
+            "</example>"
+            for n, b in enumerate(blocks)
+        )
+        prompt = (
+            f"{examples}\n\nFor each example above, based on its code and surrounding "
+            f"context, {_INSTRUCTIONS}\n"
+            'Return a JSON object {"summaries": [{"id": <example id>, "summary": "..."}]} '
+            "with one entry per example."
+        )
+        try:
+            content = await self._complete(
+                prompt,
+                stats,
+                max_tokens=120 * len(blocks),
+                response_format={"type": "json_object"},
+            )
+            entries = json.loads(content).get("summaries", [])
+        except Exception:
+            logger.warning("Batched code summary failed, summarizing blocks one by one")
+            return [None] * len(blocks)
+
+        answered: list[str | None] = [None] * len(blocks)
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict):
+                continue
+            n, summary = entry.get("id"), entry.get("summary")
+            if isinstance(n, str) and n.isdigit():
+                n = int(n)
+            if isinstance(n, int) and 0 <= n < len(blocks) and isinstance(summary, str):
+                answered[n] = summary.strip() or None
+        return answered
+
+    async def _cache_get(self, keys: set[str]) -> dict[str, str]:
+        if self.cache_collection is None or not keys:
+            return {}
+        try:
+            cursor = self.cache_collection.find({"_id": {"$in": list(keys)}}, {"summary": 1})
+            return {doc["_id"]: doc["summary"] async for doc in cursor}
+        except Exception:
+            logger.warning("Code summary cache lookup failed", exc_info=True)
+            return {}
+
+    async def _cache_put(self, summaries: dict[str, str]) -> None:
+        if self.cache_collection is None or not summaries:
+            return
+        now = datetime.now()
+        try:
+            await self.cache_collection.bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": key},
+                        {"$set": {"summary": summary, "model": self.model, "updated_at": now}},
+                        upsert=True,
+                    )
+                    for key, summary in summaries.items()
+                ],
+                ordered=False,
+            )
+        except Exception:
+            logger.warning("Code summary cache write failed", exc_info=True)
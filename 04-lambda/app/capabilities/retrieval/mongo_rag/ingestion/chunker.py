@@ -12,17 +12,23 @@ Benefits over custom chunking:
 - Token-precise (not character-based estimates)
 - Better for RAG (chunks include document context)
 - Battle-tested (maintained by Docling team)
+
+Content without a DoclingDocument (crawled pages, scraped markdown) goes
+through the markdown structure-aware chunker in markdown_chunker.py, which
+packs sections to the same token budget and adds the same heading context.
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from app.capabilities.retrieval.mongo_rag.config import config as rag_config
+from app.capabilities.retrieval.mongo_rag.ingestion.markdown_chunker import MarkdownChunker
+from app.core.model_registry import get_model_registry, model_key
 from docling.chunking import HybridChunker
 from docling_core.types.doc import DoclingDocument
 from dotenv import load_dotenv
-from transformers import AutoTokenizer
 
 # Load environment variables from project root (works from any directory)
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent.parent.parent
@@ -34,6 +40,8 @@ else:
 
 logger = logging.getLogger(__name__)
 
+FALLBACK_CHUNKERS = ("markdown", "simple")
+
 
 @dataclass
 class ChunkingConfig:
@@ -44,9 +52,13 @@ class ChunkingConfig:
     max_chunk_size: int = 2000  # Maximum chunk size (used in fallback)
     min_chunk_size: int = 100  # Minimum chunk size (used in fallback)
     max_tokens: int = 512  # Maximum tokens for embedding models
+    # Chunker for content without a DoclingDocument: "markdown" or "simple"
+    fallback_chunker: str = field(default_factory=lambda: rag_config.fallback_chunker)
 
     def __post_init__(self):
         """Validate configuration."""
+        if self.fallback_chunker not in FALLBACK_CHUNKERS:
+            raise ValueError(f"Fallback chunker must be one of {FALLBACK_CHUNKERS}")
         if self.chunk_overlap >= self.chunk_size:
             raise ValueError("Chunk overlap must be less than chunk size")
         if self.min_chunk_size <= 0:
@@ -92,10 +104,8 @@ class DoclingHybridChunker:
         """
         self.config = config
 
-        # Initialize tokenizer for token-aware chunking
-        model_id = "sentence-transformers/all-MiniLM-L6-v2"
-        logger.info(f"Initializing tokenizer: {model_id}")
-        self.tokenizer = AutoTokenizer.from_pretrained(model_id)
+        # Tokenizer for token-aware chunking, shared across chunkers (TOKENIZER_MODEL)
+        self.tokenizer = get_model_registry().get(model_key("tokenizer"))
 
         # Create HybridChunker
         self.chunker = HybridChunker(
@@ -103,6 +113,7 @@ class DoclingHybridChunker:
             max_tokens=config.max_tokens,
             merge_peers=True,  # Merge small adjacent chunks
         )
+        self.markdown_chunker = MarkdownChunker(self.tokenizer, max_tokens=config.max_tokens)
 
         logger.info(f"HybridChunker initialized (max_tokens={config.max_tokens})")
 
@@ -137,13 +148,10 @@ class DoclingHybridChunker:
             **(metadata or {}),
         }
 
-        # If we don't have a DoclingDocument, we need to create one from markdown
+        # Without a DoclingDocument (crawled/scraped markdown), chunk the markdown directly
         if docling_doc is None:
-            # For markdown content, we need to convert it to DoclingDocument
-            # This is a simplified version - in practice, content comes from
-            # Docling's document converter in the ingestion pipeline
-            logger.warning("No DoclingDocument provided, using simple chunking fallback")
-            return self._simple_fallback_chunk(content, base_metadata)
+            logger.debug("No DoclingDocument provided, using fallback chunker")
+            return self._fallback_chunk(content, base_metadata)
 
         try:
             # Use HybridChunker to chunk the DoclingDocument
@@ -190,8 +198,58 @@ class DoclingHybridChunker:
             return document_chunks
 
         except Exception as e:
-            logger.exception(f"HybridChunker failed: {e}, falling back to simple chunking")
-            return self._simple_fallback_chunk(content, base_metadata)
+            logger.exception(f"HybridChunker failed: {e}, falling back to markdown chunking")
+            return self._fallback_chunk(content, base_metadata)
+
+    def _fallback_chunk(self, content: str, base_metadata: dict[str, Any]) -> list[DocumentChunk]:
+        """Chunk content without a DoclingDocument using the configured fallback."""
+        if self.config.fallback_chunker == "markdown":
+            try:
+                chunks = self._markdown_chunk(content, base_metadata)
+                if chunks:
+                    return chunks
+            except Exception:
+                logger.exception("Markdown chunking failed, falling back to simple chunking")
+        return self._simple_fallback_chunk(content, base_metadata)
+
+    def _markdown_chunk(self, content: str, base_metadata: dict[str, Any]) -> list[DocumentChunk]:
+        """
+        Chunk markdown by its structure (headings, fences, lists, tables).
+
+        Chunks are packed to max_tokens with batched tokenization and prefixed
+        with their heading hierarchy, like HybridChunker's contextualized text.
+        Returns no chunks for content without text outside headings.
+
+        Args:
+            content: Markdown content
+            base_metadata: Base metadata for chunks
+
+        Returns:
+            List of document chunks
+        """
+        markdown_chunks = self.markdown_chunker.chunk(content)
+
+        document_chunks = [
+            DocumentChunk(
+                content=chunk.text,
+                index=i,
+                start_char=chunk.start_char,
+                end_char=chunk.end_char,
+                metadata={
+                    **base_metadata,
+                    "chunk_method": "markdown",
+                    "total_chunks": len(markdown_chunks),
+                    "token_count": chunk.token_count,
+                    "headings": list(chunk.headings),
+                    "has_context": bool(chunk.headings),
+                },
+                token_count=chunk.token_count,
+            )
+            for i, chunk in enumerate(markdown_chunks)
+        ]
+
+        logger.info(f"Created {len(document_chunks)} chunks using markdown chunker")
+        return document_chunks
 
     def _simple_fallback_chunk(
         self, content: str, base_metadata: dict[str, Any]
@@ -200,8 +258,8 @@ class DoclingHybridChunker:
         Simple fallback chunking when HybridChunker can't be used.
 
         This is used when:
-        - No DoclingDocument is provided
-        - HybridChunker fails
+        - No DoclingDocument is provided and FALLBACK_CHUNKER=simple
+        - The markdown chunker fails or finds no text
 
         Args:
             content: Content to chunk
@@ -29,6 +29,10 @@ if TYPE_CHECKING:
 from app.capabilities.retrieval.graphiti_rag.config import config as graphiti_config
 from app.capabilities.retrieval.graphiti_rag.dependencies import GraphitiRAGDeps
 from app.capabilities.retrieval.graphiti_rag.ingestion.adapter import GraphitiIngestionAdapter
+from app.capabilities.retrieval.graphiti_rag.ingestion.queue import (
+    GraphitiIngestionQueue,
+    get_graphiti_ingestion_queue,
+)
 from app.capabilities.retrieval.mongo_rag.config import config as rag_config
 from app.capabilities.retrieval.mongo_rag.extraction.code_ingestion import ingest_code_examples
 from app.capabilities.retrieval.mongo_rag.ingestion.chunker import (
@@ -37,6 +41,11 @@ from app.capabilities.retrieval.mongo_rag.ingestion.chunker import (
     create_chunker,
 )
 from app.capabilities.retrieval.mongo_rag.ingestion.embedder import create_embedder
+from app.capabilities.retrieval.mongo_rag.quantization import encode_embedding
+from app.capabilities.retrieval.mongo_rag.vector_index.service import (
+    notify_chunks_inserted,
+    notify_documents_deleted,
+)
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
 
 logger = logging.getLogger(__name__)
@@ -112,9 +121,11 @@ class ContentIngestionService:
         self.chunker = create_chunker(self.chunker_config)
         self.embedder = create_embedder()
 
-        # Graphiti adapter (optional)
+        # Graphiti adapter (optional). In background mode jobs go to the shared
+        # ingestion queue instead, which owns its own Graphiti client.
         self.graphiti_adapter: GraphitiIngestionAdapter | None = None
         self.graphiti_deps: GraphitiRAGDeps | None = None
+        self.graphiti_queue: GraphitiIngestionQueue | None = None
 
         self._initialized = False
 
@@ -143,7 +154,13 @@ class ContentIngestionService:
             logger.info(f"Connected to MongoDB database: {self.settings.mongodb_database}")
 
             # Initialize Graphiti if enabled
-            if graphiti_config.use_graphiti:
+            if graphiti_config.use_graphiti and graphiti_config.graphiti_ingestion_background:
+                self.graphiti_queue = await get_graphiti_ingestion_queue()
+                if self.graphiti_queue:
+                    logger.info("Graphiti ingestion will run on the background queue")
+                else:
+                    logger.info("Continuing without Graphiti ingestion")
+            elif graphiti_config.use_graphiti:
                 try:
                     self.graphiti_deps = GraphitiRAGDeps.from_settings()
                     await self.graphiti_deps.initialize()
@@ -177,6 +194,7 @@ class ContentIngestionService:
                 self.graphiti_adapter = None
                 self.graphiti_deps = None
 
+            self.graphiti_queue = None
             self._initialized = False
 
     def _convert_markdown_to_docling(self, content: str) -> Any:
@@ -322,8 +340,15 @@ class ContentIngestionService:
 
             chunk_dict = {
                 "document_id": document_id,
+                # Denormalized so search results need no documents lookup
+                "document_title": title,
+                "document_source": source,
                 "content": chunk.content,
-                "embedding": chunk.embedding,
+                **encode_embedding(
+                    chunk.embedding,
+                    rag_config.embedding_storage,
+                    rag_config.embedding_keep_full_precision,
+                ),
                 "chunk_index": chunk.index,
                 "metadata": chunk_metadata,
                 "token_count": chunk.token_count,
@@ -338,9 +363,66 @@ class ContentIngestionService:
         if chunk_dicts:
             await chunks_collection.insert_many(chunk_dicts, ordered=False)
             logger.info(f"Inserted {len(chunk_dicts)} chunks")
+            notify_chunks_inserted(chunk_dicts)
 
         return str(document_id)
 
+    async def _ingest_graphiti(
+        self,
+        document_id: str,
+        chunks: list[DocumentChunk],
+        metadata: dict[str, Any],
+        title: str,
+        source: str,
+        options: "GraphitiIngestionOptions | None" = None,
+    ) -> dict[str, Any]:
+        """
+        Send a stored document to Graphiti.
+
+        In background mode the document is queued and this returns as soon as
+        there is room in the queue; otherwise ingestion runs inline.
+
+        Returns:
+            Dictionary with "status" (queued, unchanged, completed or skipped) and "errors"
+        """
+        try:
+            if self.graphiti_queue:
+                result = await self.graphiti_queue.submit(
+                    document_id=document_id,
+                    chunks=chunks,
+                    metadata=metadata,
+                    title=title,
+                    source=source,
+                    options=options,
+                )
+                logger.info(
+                    f"Graphiti ingestion {result['status']} for {source} "
+                    f"(queue depth {result['queue_depth']})"
+                )
+                return {"status": result["status"], "errors": []}
+
+            if self.graphiti_adapter:
+                result = await self.graphiti_adapter.ingest_document(
+                    document_id=document_id,
+                    chunks=chunks,
+                    metadata=metadata,
+                    title=title,
+                    source=source,
+                    options=options,
+                )
+                logger.info(
+                    f"Graphiti ingestion: {result.get('episodes_created', 0)} episodes, "
+                    f"{result.get('facts_added', 0)} facts "
+                    f"from {result.get('chunks_processed', 0)} chunks"
+                )
+                return {"status": "completed", "errors": result.get("errors", [])}
+        except Exception as e:
+            error_msg = f"Graphiti ingestion failed: {e!s}"
+            logger.exception(error_msg)
+            return {"status": "failed", "errors": [error_msg]}
+
+        return {"status": "skipped", "errors": []}
+
     async def ingest_content(
         self,
         content: str,
@@ -451,25 +533,14 @@ class ContentIngestionService:
         logger.info(f"Saved document to MongoDB with ID: {document_id}")
 
         # Ingest into Graphiti if enabled
-        if self.graphiti_adapter:
-            try:
-                graphiti_result = await self.graphiti_adapter.ingest_document(
-                    document_id=document_id,
-                    chunks=embedded_chunks,
-                    metadata=base_metadata,
-                    title=final_title,
-                    source=source,
-                )
-                if graphiti_result.get("errors"):
-                    errors.extend(graphiti_result["errors"])
-                logger.info(
-                    f"Graphiti ingestion: {graphiti_result.get('facts_added', 0)} facts "
-                    f"from {graphiti_result.get('chunks_processed', 0)} chunks"
-                )
-            except Exception as e:
-                error_msg = f"Graphiti ingestion failed: {e!s}"
-                logger.exception(error_msg)
-                errors.append(error_msg)
+        graphiti_result = await self._ingest_graphiti(
+            document_id=document_id,
+            chunks=embedded_chunks,
+            metadata=base_metadata,
+            title=final_title,
+            source=source,
+        )
+        errors.extend(graphiti_result["errors"])
 
         # Extract code examples if enabled
         if extract_code_examples and self.settings.use_agentic_rag:
@@ -485,7 +556,8 @@ class ContentIngestionService:
                     errors.extend(code_result["errors"])
                 logger.info(
                     f"Code examples: {code_result.get('code_examples_stored', 0)} stored "
-                    f"from {code_result.get('code_examples_extracted', 0)} extracted"
+                    f"from {code_result.get('code_examples_extracted', 0)} extracted, "
+                    f"{code_result.get('summary_llm_calls_saved', 0)} summary LLM calls saved"
                 )
             except Exception as e:
                 error_msg = f"Code example extraction failed: {e!s}"
@@ -597,6 +669,7 @@ class ContentIngestionService:
 
         # Delete chunks first
         chunks_result = await chunks_collection.delete_many({"document_id": document_id})
+        notify_documents_deleted([document_id])
 
         # Delete document
         await documents_collection.delete_one({"_id": document_id})
@@ -632,6 +705,7 @@ class ContentIngestionService:
 
         # Delete chunks first
         await chunks_collection.delete_many({"document_id": document_id})
+        notify_documents_deleted([document_id])
 
         # Delete document
         await documents_collection.delete_one({"_id": document_id})
@@ -793,30 +867,16 @@ class ContentIngestionService:
             logger.info("MongoDB storage skipped per options")
 
         # Ingest into Graphiti if enabled
-        episodes_created = 0
-        facts_added = 0
-        if self.graphiti_adapter and not options.skip_graphiti:
-            try:
-                graphiti_result = await self.graphiti_adapter.ingest_document(
-                    document_id=document_id or "no-mongo-id",
-                    chunks=embedded_chunks,
-                    metadata=base_metadata,
-                    title=scraped.title,
-                    source=scraped.source,
-                    options=graphiti_options,
-                )
-                episodes_created = graphiti_result.get("episodes_created", 0)
-                facts_added = graphiti_result.get("facts_added", 0)
-                if graphiti_result.get("errors"):
-                    errors.extend(graphiti_result["errors"])
-                logger.info(
-                    f"Graphiti ingestion: {episodes_created} episodes, {facts_added} facts "
-                    f"from {graphiti_result.get('chunks_processed', 0)} chunks"
-                )
-            except Exception as e:
-                error_msg = f"Graphiti ingestion failed: {e!s}"
-                logger.exception(error_msg)
-                errors.append(error_msg)
+        if not options.skip_graphiti:
+            graphiti_result = await self._ingest_graphiti(
+                document_id=document_id or "no-mongo-id",
+                chunks=embedded_chunks,
+                metadata=base_metadata,
+                title=scraped.title,
+                source=scraped.source,
+                options=graphiti_options,
+            )
+            errors.extend(graphiti_result["errors"])
 
         # Extract code examples if enabled
         if (
@@ -837,7 +897,8 @@ class ContentIngestionService:
                     errors.extend(code_result["errors"])
                 logger.info(
                     f"Code examples: {code_result.get('code_examples_stored', 0)} stored "
-                    f"from {code_result.get('code_examples_extracted', 0)} extracted"
+                    f"from {code_result.get('code_examples_extracted', 0)} extracted, "
+                    f"{code_result.get('summary_llm_calls_saved', 0)} summary LLM calls saved"
                 )
             except Exception as e:
                 error_msg = f"Code example extraction failed: {e!s}"
@@ -933,26 +994,16 @@ class ContentIngestionService:
             logger.info(f"Saved document to MongoDB with ID: {document_id}")
 
         # Ingest into Graphiti
-        episodes_created = 0
-        facts_added = 0
-        if self.graphiti_adapter and not options.skip_graphiti:
-            try:
-                graphiti_result = await self.graphiti_adapter.ingest_document(
-                    document_id=document_id or "no-mongo-id",
-                    chunks=embedded_chunks,
-                    metadata=base_metadata,
-                    title=scraped.title,
-                    source=scraped.source,
-                    options=graphiti_options,
-                )
-                episodes_created = graphiti_result.get("episodes_created", 0)
-                facts_added = graphiti_result.get("facts_added", 0)
-                if graphiti_result.get("errors"):
-                    errors.extend(graphiti_result["errors"])
-            except Exception as e:
-                error_msg = f"Graphiti ingestion failed: {e!s}"
-                logger.exception(error_msg)
-                errors.append(error_msg)
+        if not options.skip_graphiti:
+            graphiti_result = await self._ingest_graphiti(
+                document_id=document_id or "no-mongo-id",
+                chunks=embedded_chunks,
+                metadata=base_metadata,
+                title=scraped.title,
+                source=scraped.source,
+                options=graphiti_options,
+            )
+            errors.extend(graphiti_result["errors"])
 
         processing_time = (datetime.now() - start_time).total_seconds() * 1000
 
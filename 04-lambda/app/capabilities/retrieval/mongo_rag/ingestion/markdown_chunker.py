@@ -0,0 +1,406 @@
+"""
+Markdown structure-aware chunker for content without a DoclingDocument.
+
+Crawled pages, scraped content and plain markdown reach the chunker without a
+DoclingDocument, so Docling's HybridChunker can't be used. This chunker gets
+close to its output without one:
+
+- One pass over the lines splits the markdown into blocks (paragraphs, lists,
+  tables, fenced code) and tracks the heading hierarchy each block sits under
+- All blocks are tokenized in one batch call of the (fast) tokenizer
+- Adjacent blocks under the same headings are packed up to the token budget;
+  blocks that don't fit alone are split on lines (code, tables) or sentences,
+  with code fences and table headers repeated in every piece
+- Each chunk is prefixed with its heading hierarchy, like
+  ``HybridChunker.contextualize``
+
+There is no character overlap between chunks: the heading prefix carries the
+section context instead.
+
+The tokenizer is any Hugging Face tokenizer (``AutoTokenizer``); the module
+itself doesn't import transformers.
+"""
+
+import re
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+_FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+_HEADING = re.compile(r"^ {0,3}(#{1,6})(?:[ \t]+(.*?))?[ \t#]*$")
+_LIST_ITEM = re.compile(r"^[ \t]*(?:[-*+]|\d{1,9}[.)])(?:[ \t]+|$)")
+_TABLE_DELIMITER = re.compile(r"^[ \t]*\|?[ \t]*:?-+:?[ \t]*(?:\|[ \t]*:?-+:?[ \t]*)*\|?[ \t]*$")
+_SENTENCE_END = re.compile(r"[.!?]+[\"')\]]*\s+|\n")
+
+# Heading context may use at most this share of the token budget; deeper
+# hierarchies keep only the innermost heading.
+MAX_CONTEXT_SHARE = 0.25
+
+
+@dataclass
+class MarkdownBlock:
+    """A paragraph, list, table or code block and the headings above it."""
+
+    kind: str  # "paragraph", "list", "table" or "code"
+    start: int
+    end: int
+    headings: tuple[str, ...]
+    fence: str = ""  # Opening fence line of a code block
+
+
+@dataclass
+class MarkdownChunk:
+    """A packed chunk: heading context plus a span (or piece) of the content."""
+
+    text: str
+    start_char: int
+    end_char: int
+    headings: tuple[str, ...]
+    token_count: int = 0
+
+
+@dataclass
+class _Segment:
+    start: int
+    end: int
+    tokens: int
+    prefix: str = ""
+    suffix: str = ""
+    mergeable: bool = True
+    headings: tuple[str, ...] = field(default_factory=tuple)
+
+
+def parse_markdown_blocks(content: str) -> list[MarkdownBlock]:
+    """
+    Split markdown into blocks in one pass over its lines.
+
+    Headings are not blocks of their own; they update the heading hierarchy
+    recorded on the blocks that follow. Blank lines end paragraphs and tables;
+    a list continues across blank lines while the next line is a list item or
+    indented.
+
+    Args:
+        content: Markdown text
+
+    Returns:
+        Blocks in document order with character offsets into ``content``
+    """
+    blocks: list[MarkdownBlock] = []
+    stack: list[tuple[int, str]] = []
+    headings: tuple[str, ...] = ()
+
+    kind: str | None = None
+    start = end = 0
+    fence = ""
+    fence_char, fence_len = "", 0
+    blank_in_list = False
+
+    def close() -> None:
+        nonlocal kind, blank_in_list
+        if kind is not None:
+            blocks.append(
+                MarkdownBlock(kind, start, end, headings, fence if kind == "code" else "")
+            )
+        kind = None
+        blank_in_list = False
+
+    pos = 0
+    for line in content.splitlines(keepends=True):
+        line_start, pos = pos, pos + len(line)
+        text = line.rstrip("\r\n")
+        line_end = line_start + len(text)
+
+        if kind == "code":
+            end = line_end
+            stripped = text.strip()
+            if (
+                stripped.startswith(fence_char * fence_len)
+                and not stripped.strip(fence_char)
+                and len(text) - len(text.lstrip(" ")) <= 3
+            ):
+                close()
+            continue
+
+        if not text.strip():
+            if kind == "list":
+                blank_in_list = True
+            else:
+                close()
+            continue
+
+        fence_match = _FENCE.match(text)
+        if fence_match:
+            close()
+            marker = fence_match.group(1)
+            kind, start, end = "code", line_start, line_end
+            fence, fence_char, fence_len = text.strip(), marker[0], len(marker)
+            continue
+
+        heading_match = _HEADING.match(text)
+        if heading_match:
+            close()
+            level = len(heading_match.group(1))
+            while stack and stack[-1][0] >= level:
+                stack.pop()
+            title = (heading_match.group(2) or "").strip()
+            if title:
+                stack.append((level, title))
+            headings = tuple(title for _, title in stack)
+            continue
+
+        stripped = text.lstrip()
+        if stripped.startswith("|") or (kind == "table" and "|" in text):
+            line_kind = "table"
+        elif _LIST_ITEM.match(text):
+            line_kind = "list"
+        else:
+            line_kind = "paragraph"
+
+        if kind == "list":
+            # Items, indented continuations and (before any blank line) lazy
+            # continuation lines stay in the list
+            indented = text[:1] in (" ", "\t")
+            if line_kind == "list" or indented or (line_kind == "paragraph" and not blank_in_list):
+                end, blank_in_list = line_end, False
+                continue
+        elif kind == line_kind:
+            end = line_end
+            continue
+
+        close()
+        kind, start, end = line_kind, line_start, line_end
+
+    close()
+    return blocks
+
+
+def _lengths(tokenizer: Any, texts: list[str]) -> list[int]:
+    """Token counts of ``texts`` without special tokens, in one batch call."""
+    if not texts:
+        return []
+    encoded = tokenizer(texts, add_special_tokens=False)
+    return [len(ids) for ids in encoded["input_ids"]]
+
+
+def _line_spans(content: str, start: int, end: int) -> list[tuple[int, int]]:
+    spans, pos = [], start
+    for line in content[start:end].splitlines(keepends=True):
+        spans.append((pos, pos + len(line.rstrip("\r\n"))))
+        pos += len(line)
+    return spans
+
+
+def _sentence_spans(content: str, start: int, end: int) -> list[tuple[int, int]]:
+    cuts = [m.end() for m in _SENTENCE_END.finditer(content, start, end)] + [end]
+    spans, pos = [], start
+    for cut in cuts:
+        text = content[pos:cut]
+        if text.strip():
+            left = pos + len(text) - len(text.lstrip())
+            spans.append((left, pos + len(text.rstrip())))
+        pos = cut
+    return spans
+
+
+class MarkdownChunker:
+    """
+    Packs markdown blocks into token-bounded chunks with heading context.
+
+    Token counts include the special tokens the embedding model adds, so
+    ``token_count`` matches ``len(tokenizer.encode(chunk.text))``.
+    """
+
+    def __init__(self, tokenizer: Any, max_tokens: int = 512):
+        """
+        Initialize chunker.
+
+        Args:
+            tokenizer: Hugging Face tokenizer (fast tokenizers batch in Rust)
+            max_tokens: Maximum tokens per chunk, special tokens included
+        """
+        self.tokenizer = tokenizer
+        self.max_tokens = max_tokens
+        self._special_tokens = tokenizer.num_special_tokens_to_add(pair=False)
+
+    def chunk(self, content: str) -> list[MarkdownChunk]:
+        """
+        Chunk markdown content.
+
+        Args:
+            content: Markdown text
+
+        Returns:
+            Chunks in document order
+        """
+        blocks = [b for b in parse_markdown_blocks(content) if content[b.start : b.end].strip()]
+        if not blocks:
+            return []
+
+        contexts = self._contexts({b.headings for b in blocks})
+        block_tokens = _lengths(self.tokenizer, [content[b.start : b.end] for b in blocks])
+
+        segments: list[_Segment] = []
+        oversized: list[tuple[int, MarkdownBlock]] = []
+        for block, tokens in zip(blocks, block_tokens, strict=True):
+            if tokens > self._budget(contexts[block.headings][1]):
+                oversized.append((len(segments), block))
+            segments.append(_Segment(block.start, block.end, tokens, headings=block.headings))
+
+        # Split oversized blocks; insert from the back so indexes stay valid
+        for index, block in reversed(self._split_blocks(content, oversized, contexts)):
+            segments[index : index + 1] = block
+
+        chunks: list[MarkdownChunk] = []
+        current: _Segment | None = None
+        for segment in segments:
+            budget = self._budget(contexts[segment.headings][1])
+            if (
+                current is not None
+                and current.mergeable
+                and segment.mergeable
+                and current.headings == segment.headings
+                and current.tokens + segment.tokens <= budget
+            ):
+                current.end = segment.end
+                current.tokens += segment.tokens
+                continue
+            if current is not None:
+                chunks.append(self._to_chunk(content, current, contexts))
+            current = replace(segment)
+        if current is not None:
+            chunks.append(self._to_chunk(content, current, contexts))
+
+        encoded = self.tokenizer([c.text for c in chunks])
+        for chunk, ids in zip(chunks, encoded["input_ids"], strict=True):
+            chunk.token_count = len(ids)
+        return chunks
+
+    def _budget(self, context_tokens: int) -> int:
+        return max(1, self.max_tokens - self._special_tokens - context_tokens)
+
+    def _contexts(
+        self, heading_sets: set[tuple[str, ...]]
+    ) -> dict[tuple[str, ...], tuple[str, int]]:
+        """Heading prefix text and its token count for every heading hierarchy."""
+        paths = sorted(heading_sets)
+        prefixes = ["\n".join(h) + "\n" if h else "" for h in paths]
+        lengths = _lengths(self.tokenizer, prefixes)
+        limit = int(self.max_tokens * MAX_CONTEXT_SHARE)
+
+        contexts: dict[tuple[str, ...], tuple[str, int]] = {}
+        innermost: list[tuple[tuple[str, ...], str]] = []
+        for path, prefix, tokens in zip(paths, prefixes, lengths, strict=True):
+            if tokens > limit:
+                innermost.append((path, path[-1] + "\n"))
+            else:
+                contexts[path] = (prefix, tokens)
+        inner_lengths = _lengths(self.tokenizer, [prefix for _, prefix in innermost])
+        for (path, prefix), tokens in zip(innermost, inner_lengths, strict=True):
+            contexts[path] = (prefix, tokens) if tokens <= limit else ("", 0)
+        return contexts
+
+    def _split_blocks(
+        self,
+        content: str,
+        oversized: list[tuple[int, MarkdownBlock]],
+        contexts: dict[tuple[str, ...], tuple[str, int]],
+    ) -> list[tuple[int, list[_Segment]]]:
+        """Split blocks over the budget into pieces, tokenizing all units in one batch."""
+        plans = []
+        units: list[str] = []
+        wrappers: list[str] = []
+        for index, block in oversized:
+            prefix = suffix = ""
+            if block.kind == "code":
+                lines = _line_spans(content, block.start, block.end)
+                closed = len(lines) > 1 and content[lines[-1][0] : lines[-1][1]].strip().startswith(
+                    block.fence[:3]
+                )
+                spans = lines[1 : -1 if closed else None]
+                closing = (
+                    content[lines[-1][0] : lines[-1][1]].strip() if closed else block.fence[:3]
+                )
+                prefix, suffix = block.fence + "\n", "\n" + closing
+            elif block.kind == "table":
+                lines = _line_spans(content, block.start, block.end)
+                header = (
+                    2
+                    if len(lines) > 1 and _TABLE_DELIMITER.match(content[lines[1][0] : lines[1][1]])
+                    else 1
+                )
+                prefix = content[lines[0][0] : lines[header - 1][1]] + "\n"
+                spans = lines[header:]
+            elif block.kind == "list":
+                spans = _line_spans(content, block.start, block.end)
+            else:
+                spans = _sentence_spans(content, block.start, block.end)
+            plans.append((index, block, prefix, suffix, spans, len(units), len(wrappers)))
+            units.extend(content[s:e] for s, e in spans)
+            wrappers.append(prefix + suffix)
+
+        unit_tokens = _lengths(self.tokenizer, units)
+        wrapper_tokens = _lengths(self.tokenizer, wrappers)
+
+        result = []
+        for index, block, prefix, suffix, spans, first_unit, wrapper in plans:
+            wrapped = bool(prefix or suffix)
+            budget = self._budget(contexts[block.headings][1] + wrapper_tokens[wrapper])
+            pieces: list[_Segment] = []
+            for (start, end), tokens in zip(
+                spans, unit_tokens[first_unit : first_unit + len(spans)], strict=True
+            ):
+                if tokens > budget:
+                    for s, e, t in self._hard_split(content, start, end, budget):
+                        pieces.append(
+                            _Segment(s, e, t, prefix, suffix, not wrapped, block.headings)
+                        )
+                    continue
+                last = pieces[-1] if pieces else None
+                if last is not None and last.tokens + tokens <= budget:
+                    last.end = end
+                    last.tokens += tokens
+                else:
+                    pieces.append(
+                        _Segment(start, end, tokens, prefix, suffix, not wrapped, block.headings)
+                    )
+            if wrapped:
+                for piece in pieces:
+                    piece.tokens += wrapper_tokens[wrapper]
+            if not pieces:
+                # Code block or table with nothing besides its fences / header
+                pieces = [_Segment(block.start, block.end, budget, headings=block.headings)]
+            result.append((index, pieces))
+        return result
+
+    def _hard_split(
+        self, content: str, start: int, end: int, budget: int
+    ) -> list[tuple[int, int, int]]:
+        """Split one unit (a very long line or sentence) into token windows."""
+        text = content[start:end]
+        if getattr(self.tokenizer, "is_fast", False):
+            offsets = self.tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)[
+                "offset_mapping"
+            ]
+            windows = []
+            for i in range(0, len(offsets), budget):
+                window = offsets[i : i + budget]
+                windows.append((start + window[0][0], start + window[-1][1], len(window)))
+            return windows
+        # Slow tokenizers have no offsets: ~4 characters per token
+        width = budget * 4
+        return [
+            (start + i, min(end, start + i + width), budget) for i in range(0, len(text), width)
+        ]
+
+    def _to_chunk(
+        self,
+        content: str,
+        segment: _Segment,
+        contexts: dict[tuple[str, ...], tuple[str, int]],
+    ) -> MarkdownChunk:
+        body = segment.prefix + content[segment.start : segment.end] + segment.suffix
+        return MarkdownChunk(
+            text=contexts[segment.headings][0] + body.strip(),
+            start_char=segment.start,
+            end_char=segment.end,
+            headings=segment.headings,
+        )
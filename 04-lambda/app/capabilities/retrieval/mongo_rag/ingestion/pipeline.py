@@ -22,6 +22,11 @@ from typing import Any
 from app.capabilities.retrieval.graphiti_rag.config import config as graphiti_config
 from app.capabilities.retrieval.graphiti_rag.dependencies import GraphitiRAGDeps
 from app.capabilities.retrieval.graphiti_rag.ingestion.adapter import GraphitiIngestionAdapter
+from app.capabilities.retrieval.graphiti_rag.ingestion.queue import (
+    GraphitiIngestionQueue,
+    get_graphiti_ingestion_queue,
+    shutdown_graphiti_ingestion_queue,
+)
 from app.capabilities.retrieval.mongo_rag.extraction.code_ingestion import ingest_code_examples
 from app.capabilities.retrieval.mongo_rag.ingestion.chunker import (
     ChunkingConfig,
@@ -29,6 +34,11 @@ from app.capabilities.retrieval.mongo_rag.ingestion.chunker import (
     create_chunker,
 )
 from app.capabilities.retrieval.mongo_rag.ingestion.embedder import create_embedder
+from app.capabilities.retrieval.mongo_rag.quantization import encode_embedding
+from app.capabilities.retrieval.mongo_rag.vector_index.service import (
+    notify_chunks_inserted,
+    notify_documents_deleted,
+)
 from dotenv import load_dotenv
 from pymongo import AsyncMongoClient
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
@@ -114,6 +124,7 @@ class DocumentIngestionPipeline:
         # Graphiti ingestion adapter (optional)
         self.graphiti_adapter: GraphitiIngestionAdapter | None = None
         self.graphiti_deps: GraphitiRAGDeps | None = None
+        self.graphiti_queue: GraphitiIngestionQueue | None = None
 
         self._initialized = False
 
@@ -142,7 +153,9 @@ class DocumentIngestionPipeline:
             logger.info(f"Connected to MongoDB database: {self.settings.mongodb_database}")
 
             # Initialize Graphiti if enabled
-            if graphiti_config.use_graphiti:
+            if graphiti_config.use_graphiti and graphiti_config.graphiti_ingestion_background:
+                self.graphiti_queue = await get_graphiti_ingestion_queue()
+            elif graphiti_config.use_graphiti:
                 try:
                     self.graphiti_deps = GraphitiRAGDeps.from_settings()
                     await self.graphiti_deps.initialize()
@@ -176,6 +189,7 @@ class DocumentIngestionPipeline:
                 self.graphiti_adapter = None
                 self.graphiti_deps = None
 
+            self.graphiti_queue = None
             self._initialized = False
 
     def _find_document_files(self) -> list[str]:
@@ -445,8 +459,16 @@ class DocumentIngestionPipeline:
         for chunk in chunks:
             chunk_dict = {
                 "document_id": document_id,
+                # Denormalized so search results need no documents lookup
+                "document_title": title,
+                "document_source": source,
                 "content": chunk.content,
-                "embedding": chunk.embedding,  # Python list, NOT string!
+                # Python list (NOT string!) or BSON binary vector, per EMBEDDING_STORAGE
+                **encode_embedding(
+                    chunk.embedding,
+                    self.settings.embedding_storage,
+                    self.settings.embedding_keep_full_precision,
+                ),
                 "chunk_index": chunk.index,
                 "metadata": chunk.metadata,
                 "token_count": chunk.token_count,
@@ -458,6 +480,7 @@ class DocumentIngestionPipeline:
         if chunk_dicts:
             await chunks_collection.insert_many(chunk_dicts, ordered=False)
             logger.info(f"Inserted {len(chunk_dicts)} chunks")
+            notify_chunks_inserted(chunk_dicts)
 
         return str(document_id)
 
@@ -471,6 +494,7 @@ class DocumentIngestionPipeline:
 
         # Delete all chunks first (to respect FK relationships)
         chunks_result = await chunks_collection.delete_many({})
+        notify_documents_deleted(None)
         logger.info(f"Deleted {chunks_result.deleted_count} chunks")
 
         # Delete all documents
@@ -533,7 +557,20 @@ class DocumentIngestionPipeline:
 
         # Ingest into Graphiti if enabled
         graphiti_errors = []
-        if self.graphiti_adapter:
+        if self.graphiti_queue:
+            try:
+                await self.graphiti_queue.submit(
+                    document_id=document_id,
+                    chunks=embedded_chunks,
+                    metadata=document_metadata,
+                    title=document_title,
+                    source=document_source,
+                )
+            except Exception as e:
+                error_msg = f"Graphiti ingestion failed: {e!s}"
+                logger.exception(error_msg)
+                graphiti_errors.append(error_msg)
+        elif self.graphiti_adapter:
             try:
                 graphiti_result = await self.graphiti_adapter.ingest_document(
                     document_id=document_id,
@@ -568,7 +605,8 @@ class DocumentIngestionPipeline:
                     code_errors.extend(code_result["errors"])
                 logger.info(
                     f"Code examples: {code_result.get('code_examples_stored', 0)} stored "
-                    f"from {code_result.get('code_examples_extracted', 0)} extracted"
+                    f"from {code_result.get('code_examples_extracted', 0)} extracted, "
+                    f"{code_result.get('summary_llm_calls_saved', 0)} summary LLM calls saved"
                 )
             except Exception as e:
                 error_msg = f"Code example extraction failed: {e!s}"
@@ -745,6 +783,8 @@ async def main() -> None:
         logger.exception("Ingestion failed")
         raise
     finally:
+        # Let queued Graphiti enrichment finish before the event loop exits
+        await shutdown_graphiti_ingestion_queue()
         await pipeline.close()
 
 
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class SearchRequest(BaseModel):
@@ -50,6 +50,37 @@ class SearchResponse(BaseModel):
     results: list[dict[str, Any]]  # Will contain SearchResult dicts
     count: int
     citations: list[dict[str, Any]] | None = Field(None, description="Extracted citations")
+    metadata: dict[str, Any] | None = Field(
+        None, description="Hybrid search fusion method and per-source latency/contribution stats"
+    )
+
+
+class BatchSearchRequest(BaseModel):
+    """Batch search request model."""
+
+    queries: list[SearchRequest] = Field(
+        ..., min_length=1, max_length=20, description="Queries to run, each with its own filters"
+    )
+    dedupe: bool = Field(
+        default=False, description="Keep each chunk only in the query where it ranks highest"
+    )
+
+    @field_validator("queries")
+    @classmethod
+    def _unique_queries(cls, queries: list[SearchRequest]) -> list[SearchRequest]:
+        # Results are keyed by query text
+        texts = [q.query for q in queries]
+        if len(set(texts)) != len(texts):
+            raise ValueError("Query texts must be unique within a batch")
+        return queries
+
+
+class BatchSearchResponse(BaseModel):
+    """Batch search response model."""
+
+    results: dict[str, SearchResponse] = Field(..., description="Search response keyed by query")
+    count: int = Field(..., description="Total results across all queries")
+    deduplicated: bool = False
 
 
 class IngestResponse(BaseModel):
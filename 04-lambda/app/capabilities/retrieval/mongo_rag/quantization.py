@@ -0,0 +1,159 @@
+"""Chunk embedding storage formats.
+
+Chunk embeddings are stored as arrays of BSON doubles by default (8 bytes per
+dimension). EMBEDDING_STORAGE selects a compact BSON binary vector instead,
+which Atlas Vector Search indexes directly:
+
+- ``float``:   BSON double array (default)
+- ``float32``: binary float32 vector, 4 bytes per dimension
+- ``int8``:    binary int8 vector, 1 byte per dimension (scalar quantized)
+- ``binary``:  packed-bit vector, 1 bit per dimension (sign only); the vector
+  index must use euclidean similarity
+
+The quantized modes (int8, binary) can also keep a float32 copy of each
+embedding in ``embedding_full``. Semantic search then over-fetches candidates
+from the quantized index and rescores them by exact cosine similarity.
+"""
+
+import math
+from collections.abc import Sequence
+from typing import Any
+
+from bson.binary import VECTOR_SUBTYPE, Binary, BinaryVectorDtype
+
+EMBEDDING_STORAGE_MODES = ("float", "float32", "int8", "binary")
+QUANTIZED_STORAGE_MODES = ("int8", "binary")
+FULL_PRECISION_FIELD = "embedding_full"
+
+_VECTOR_DTYPES = {
+    "float32": BinaryVectorDtype.FLOAT32,
+    "int8": BinaryVectorDtype.INT8,
+    "binary": BinaryVectorDtype.PACKED_BIT,
+}
+
+
+def _check_storage(storage: str) -> None:
+    if storage not in EMBEDDING_STORAGE_MODES:
+        raise ValueError(
+            f"Unknown embedding storage '{storage}', expected one of {EMBEDDING_STORAGE_MODES}"
+        )
+
+
+def quantize_int8(embedding: Sequence[float]) -> list[int]:
+    """
+    Scalar-quantize an embedding to int8.
+
+    Each vector is scaled by its own largest magnitude, which keeps its
+    direction (all that cosine similarity looks at) as precise as possible.
+    """
+    scale = max((abs(x) for x in embedding), default=0.0) or 1.0
+    return [round(x / scale * 127) for x in embedding]
+
+
+def quantize_binary(embedding: Sequence[float]) -> list[int]:
+    """Quantize an embedding to sign bits, packed 8 per byte (most significant bit first)."""
+    packed = [0] * ((len(embedding) + 7) // 8)
+    for i, x in enumerate(embedding):
+        if x > 0:
+            packed[i >> 3] |= 0x80 >> (i & 7)
+    return packed
+
+
+def encode_vector(embedding: Sequence[float], storage: str) -> list[float] | Binary:
+    """
+    Encode an embedding in the representation used by a storage mode.
+
+    Also used for query vectors, which must match the indexed representation.
+    """
+    _check_storage(storage)
+    if storage == "float":
+        return list(embedding)
+    if storage == "float32":
+        return Binary.from_vector([float(x) for x in embedding], BinaryVectorDtype.FLOAT32)
+    if storage == "int8":
+        return Binary.from_vector(quantize_int8(embedding), BinaryVectorDtype.INT8)
+    return Binary.from_vector(
+        quantize_binary(embedding), BinaryVectorDtype.PACKED_BIT, padding=-len(embedding) % 8
+    )
+
+
+def encode_embedding(
+    embedding: Sequence[float], storage: str, keep_full_precision: bool = True
+) -> dict[str, Any]:
+    """
+    Build the embedding fields of a chunk document.
+
+    Args:
+        embedding: Full-precision embedding
+        storage: Storage mode (see EMBEDDING_STORAGE_MODES)
+        keep_full_precision: For quantized modes, also store a float32 copy for rescoring
+
+    Returns:
+        Fields to merge into the chunk document
+    """
+    fields: dict[str, Any] = {"embedding": encode_vector(embedding, storage)}
+    if storage in QUANTIZED_STORAGE_MODES and keep_full_precision:
+        fields[FULL_PRECISION_FIELD] = encode_vector(embedding, "float32")
+    return fields
+
+
+def decode_vector(value: Any) -> list[float]:
+    """
+    Decode a stored embedding to floats.
+
+    Packed-bit vectors decode to +1/-1 per dimension and int8 vectors to their
+    quantized values, so only float and float32 storage round-trips exactly.
+    """
+    if isinstance(value, Binary) and value.subtype == VECTOR_SUBTYPE:
+        vector = value.as_vector()
+        if vector.dtype == BinaryVectorDtype.PACKED_BIT:
+            dims = len(vector.data) * 8 - vector.padding
+            return [1.0 if vector.data[i >> 3] & (0x80 >> (i & 7)) else -1.0 for i in range(dims)]
+        return [float(x) for x in vector.data]
+    return [float(x) for x in value]
+
+
+def storage_of(value: Any) -> str:
+    """Return the storage mode a stored embedding is encoded in."""
+    if isinstance(value, Binary) and value.subtype == VECTOR_SUBTYPE:
+        dtype = value.as_vector().dtype
+        return next(mode for mode, mode_dtype in _VECTOR_DTYPES.items() if mode_dtype == dtype)
+    return "float"
+
+
+def _sumprod_fallback(a: Sequence[float], b: Sequence[float]) -> float:
+    return sum(x * y for x, y in zip(a, b, strict=False))
+
+
+# math.sumprod (Python 3.12+) is several times faster for rescoring large candidate sets
+_sumprod = getattr(math, "sumprod", _sumprod_fallback)
+
+
+def cosine_score(a: Sequence[float], b: Sequence[float]) -> float:
+    """
+    Cosine similarity mapped to [0, 1] like Atlas vectorSearchScore ((1 + cos) / 2).
+
+    Using the same scale keeps rescored results comparable with unrescored ones.
+    """
+    dot = _sumprod(a, b)
+    norm = math.sqrt(_sumprod(a, a)) * math.sqrt(_sumprod(b, b))
+    if not norm:
+        return 0.0
+    return (1.0 + dot / norm) / 2.0
+
+
+def rescore(query_embedding: Sequence[float], docs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Rescore vector search candidates against their full-precision embeddings.
+
+    Candidates without a full-precision copy keep their index score. The copy is
+    removed from each document.
+
+    Returns:
+        Candidates sorted by rescored similarity
+    """
+    for doc in docs:
+        full = doc.pop(FULL_PRECISION_FIELD, None)
+        if full is not None:
+            doc["similarity"] = cosine_score(query_embedding, decode_vector(full))
+    return sorted(docs, key=lambda doc: doc["similarity"], reverse=True)
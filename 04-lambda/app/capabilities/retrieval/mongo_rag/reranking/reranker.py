@@ -1,48 +1,78 @@
-"""Cross-encoder reranking for search results."""
+"""Cross-encoder reranking for search results.
+
+The cross-encoder is loaded and shared through the process-wide model registry
+(app/core/model_registry.py); scoring runs in its inference pool.
+"""
 
 import logging
 from typing import TYPE_CHECKING
 
+from app.core.model_registry import get_model_registry, model_key
+
 if TYPE_CHECKING:
     from capabilities.retrieval.mongo_rag.tools import SearchResult
 
-from sentence_transformers import CrossEncoder
-
 logger = logging.getLogger(__name__)
 
 
 class Reranker:
     """Cross-encoder reranker for improving search result relevance."""
 
-    def __init__(self, model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"):
+    def __init__(self, model_name: str | None = None):
         """
-        Initialize reranker.
+        Initialize reranker (the model itself loads on first use).
 
         Args:
-            model_name: Name of the cross-encoder model to use
+            model_name: Name of the cross-encoder model to use (default: RERANKER_MODEL)
         """
-        self.model_name = model_name
-        self.model: CrossEncoder | None = None
-        self._initialized = False
+        self.key = model_key("reranker", model_name)
+        self.model_name = self.key.split(":", 1)[1]
+        self._disabled = False
+
+    @property
+    def model(self):
+        """The shared cross-encoder, or None if it could not be loaded."""
+        if self._disabled:
+            return None
+        try:
+            return get_model_registry().get(self.key)
+        except Exception:
+            logger.exception("Failed to load reranking model")
+            self._disabled = True
+            return None
 
     def initialize(self) -> None:
-        """Initialize the cross-encoder model."""
-        if self._initialized:
-            return
+        """Load the cross-encoder model now instead of on the first search."""
+        if self.model is not None:
+            logger.info(f"Reranking model ready: {self.model_name}")
 
-        if CrossEncoder is None:
-            logger.warning("sentence_transformers not available - reranking will be disabled")
-            self.model = None
-            return
+    async def arerank_results(
+        self, query: str, results: list["SearchResult"], content_key: str = "content"
+    ) -> list["SearchResult"]:
+        """
+        Rerank search results without blocking the event loop.
+
+        Loads the model on first use and scores in the registry's inference pool.
+        Returns the results unchanged if the model is unavailable or scoring fails.
+        """
+        if self._disabled or not results:
+            return results
 
+        registry = get_model_registry()
         try:
-            logger.info(f"Loading reranking model: {self.model_name}")
-            self.model = CrossEncoder(self.model_name)
-            self._initialized = True
-            logger.info("Reranking model loaded successfully")
+            await registry.aget(self.key)
         except Exception:
-            logger.exception("Failed to load reranking model")
-            self.model = None
+            logger.exception("Failed to load reranking model - reranking disabled")
+            self._disabled = True
+            return results
+
+        pairs = self._pairs(query, results, content_key)
+        try:
+            scores = await registry.run(self.key, lambda model: model.predict(pairs))
+        except Exception:
+            logger.exception("Error during reranking")
+            return results
+        return self._apply_scores(results, scores)
 
     def rerank_results(
         self, query: str, results: list["SearchResult"], content_key: str = "content"
@@ -58,50 +88,52 @@ class Reranker:
         Returns:
             Reranked list of results
         """
-        # Import here to avoid circular import
-        from capabilities.retrieval.mongo_rag.tools import SearchResult
-
-        if not self.model or not results:
+        model = self.model
+        if not model or not results:
             return results
 
         try:
-            # Extract content from results
-            texts = [getattr(result, content_key, result.content) for result in results]
-
-            # Create pairs of [query, document] for the cross-encoder
-            pairs = [[query, text] for text in texts]
-
             # Get relevance scores from the cross-encoder
-            scores = self.model.predict(pairs)
-
-            # Add scores to results and sort by score (descending)
-            reranked_results = []
-            for i, result in enumerate(results):
-                # Create new result with updated similarity (rerank score)
-                reranked_result = SearchResult(
-                    chunk_id=result.chunk_id,
-                    document_id=result.document_id,
-                    content=result.content,
-                    similarity=float(scores[i]),
-                    metadata={
-                        **result.metadata,
-                        "rerank_score": float(scores[i]),
-                        "original_similarity": result.similarity,
-                    },
-                    document_title=result.document_title,
-                    document_source=result.document_source,
-                )
-                reranked_results.append(reranked_result)
-
-            # Sort by rerank score (descending)
-            reranked_results.sort(key=lambda x: x.similarity, reverse=True)
-
-            logger.info(f"Reranked {len(reranked_results)} results")
-            return reranked_results
-
+            scores = model.predict(self._pairs(query, results, content_key))
         except Exception:
             logger.exception("Error during reranking")
             return results
+        return self._apply_scores(results, scores)
+
+    @staticmethod
+    def _pairs(query: str, results: list["SearchResult"], content_key: str) -> list[list[str]]:
+        """Pairs of [query, document] for the cross-encoder."""
+        return [[query, getattr(result, content_key, result.content)] for result in results]
+
+    @staticmethod
+    def _apply_scores(results: list["SearchResult"], scores) -> list["SearchResult"]:
+        """Copy results with the rerank score as similarity, best first."""
+        # Import here to avoid circular import
+        from capabilities.retrieval.mongo_rag.tools import SearchResult
+
+        reranked_results = []
+        for i, result in enumerate(results):
+            # Create new result with updated similarity (rerank score)
+            reranked_result = SearchResult(
+                chunk_id=result.chunk_id,
+                document_id=result.document_id,
+                content=result.content,
+                similarity=float(scores[i]),
+                metadata={
+                    **result.metadata,
+                    "rerank_score": float(scores[i]),
+                    "original_similarity": result.similarity,
+                },
+                document_title=result.document_title,
+                document_source=result.document_source,
+            )
+            reranked_results.append(reranked_result)
+
+        # Sort by rerank score (descending)
+        reranked_results.sort(key=lambda x: x.similarity, reverse=True)
+
+        logger.info(f"Reranked {len(reranked_results)} results")
+        return reranked_results
 
 
 # Global reranker instance
@@ -113,17 +145,19 @@ def get_reranker() -> Reranker | None:
     return _reranker
 
 
-def initialize_reranker(model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2") -> Reranker:
+def initialize_reranker(model_name: str | None = None, load: bool = False) -> Reranker:
     """
     Initialize the global reranker instance.
 
     Args:
-        model_name: Name of the cross-encoder model
+        model_name: Name of the cross-encoder model (default: RERANKER_MODEL)
+        load: Load the model now rather than on the first rerank
 
     Returns:
-        Initialized reranker instance
+        Reranker instance
     """
     global _reranker
     _reranker = Reranker(model_name)
-    _reranker.initialize()
+    if load:
+        _reranker.initialize()
     return _reranker
@@ -15,6 +15,8 @@ from app.capabilities.retrieval.mongo_rag.ingestion.pipeline import (
 from app.capabilities.retrieval.mongo_rag.models import (
     AgentRequest,
     AgentResponse,
+    BatchSearchRequest,
+    BatchSearchResponse,
     IngestContentRequest,
     IngestContentResponse,
     IngestResponse,
@@ -22,7 +24,13 @@ from app.capabilities.retrieval.mongo_rag.models import (
     SearchResponse,
 )
 from app.capabilities.retrieval.mongo_rag.sources import get_available_sources
-from app.capabilities.retrieval.mongo_rag.tools import hybrid_search, semantic_search, text_search
+from app.capabilities.retrieval.mongo_rag.tools import (
+    BatchQuery,
+    batch_search,
+    hybrid_search,
+    semantic_search,
+    text_search,
+)
 from app.capabilities.retrieval.mongo_rag.tools_code import search_code_examples
 from fastapi import APIRouter, Depends, File, UploadFile
 from pydantic import BaseModel, Field
@@ -192,6 +200,9 @@ async def search(request: SearchRequest, deps: Annotated[Any, Depends(get_agent_
     **Returns:**
     - `SearchResponse` with query, results array, and count
     - Results include similarity scores, metadata, and document context
+    - Hybrid searches add `metadata` with the fusion method and, per source
+      (semantic, text, graphiti), its status (ok/timeout/error), latency, result
+      count, weight and how many returned results it contributed
 
     **Errors:**
     - `500`: If MongoDB connection fails
@@ -234,7 +245,8 @@ async def search(request: SearchRequest, deps: Annotated[Any, Depends(get_agent_
     **Performance Notes:**
     - Semantic search: ~100-200ms per query
     - Text search: ~50-150ms per query
-    - Hybrid search: ~150-300ms (runs both searches concurrently)
+    - Hybrid search: ~150-300ms (runs both searches concurrently, each within its
+      deadline; `metadata` reports per-source status, latency and contribution)
     - Results are cached at MongoDB level for repeated queries
     """
 
@@ -250,15 +262,84 @@ async def search(request: SearchRequest, deps: Annotated[Any, Depends(get_agent_
 
     # Execute search based on type (with filter)
     # RLS is automatically applied in the search functions
+    stats: dict[str, Any] = {}
     if request.search_type == "hybrid":
-        results = await hybrid_search(ctx, request.query, request.match_count, search_filter)
+        results = await hybrid_search(
+            ctx, request.query, request.match_count, search_filter, stats=stats
+        )
     elif request.search_type == "semantic":
         results = await semantic_search(ctx, request.query, request.match_count, search_filter)
     else:
         results = await text_search(ctx, request.query, request.match_count, search_filter)
 
     return SearchResponse(
-        query=request.query, results=[r.dict() for r in results], count=len(results)
+        query=request.query,
+        results=[r.dict() for r in results],
+        count=len(results),
+        metadata=stats or None,
+    )
+
+
+@router.post("/search/batch", response_model=BatchSearchResponse)
+async def search_batch(request: BatchSearchRequest, deps: Annotated[Any, Depends(get_agent_deps)]):
+    """
+    Run several knowledge base searches in one request.
+
+    Each query takes the same fields as `POST /search` (search_type, match_count
+    and filters). Auth and dependency setup happen once, all semantic/hybrid
+    queries are embedded in a single embedding API call, and the MongoDB searches
+    run concurrently. Hybrid queries are merged with RRF individually.
+
+    **Request Body:**
+    ```json
+    {
+        "queries": [
+            {"query": "how to configure authentication", "match_count": 5},
+            {"query": "OAuth2 token refresh", "search_type": "text"},
+            {"query": "rate limits", "project_scope": "api-docs"}
+        ],
+        "dedupe": true
+    }
+    ```
+
+    **Parameters:**
+    - `queries` (required): 1-20 search requests. Query texts must be unique.
+    - `dedupe` (optional, default: false): Return each chunk only for the query
+      where it ranks highest.
+
+    **Returns:**
+    - `BatchSearchResponse` with a `SearchResponse` per query text, keyed by query,
+      and the total result count
+
+    **Integration:**
+    - Also available as MCP tool: `batch_search_knowledge_base`
+    """
+
+    class Ctx:
+        def __init__(self, d):
+            self.deps = d
+
+    queries = [
+        BatchQuery(
+            query=q.query,
+            match_count=q.match_count,
+            search_type=q.search_type,
+            filter_dict=_build_search_filter(q),
+        )
+        for q in request.queries
+    ]
+    results_list = await batch_search(Ctx(deps), queries, dedupe=request.dedupe)
+
+    results = {
+        q.query: SearchResponse(
+            query=q.query, results=[r.dict() for r in results], count=len(results)
+        )
+        for q, results in zip(request.queries, results_list, strict=True)
+    }
+    return BatchSearchResponse(
+        results=results,
+        count=sum(response.count for response in results.values()),
+        deduplicated=request.dedupe,
     )
 
 
@@ -0,0 +1,163 @@
+"""Query planning for Atlas Search text queries.
+
+A fuzzy ``text`` query with maxEdits=2 expands every term into all indexed
+terms within two edits: the most expensive Lucene query shape, and one that
+matches ``get_embeddings`` for ``get_embedding`` or ``user_id`` for ``user_ids``.
+Most queries don't need it, so text search classifies each query and sends it
+to the cheapest operator that answers it:
+
+- ``phrase``:     quoted phrases must appear verbatim (``phrase`` operator)
+- ``identifier``: code identifiers must appear as whole tokens in the
+  code-analyzed copy of the content (``content`` multi ``code``)
+- ``short``:      1-3 keywords; exact terms plus title match and title
+  ``autocomplete`` (the user is often still typing the last word)
+- ``keywords``:   longer natural-language queries; exact terms, title boosted
+
+Fuzzy matching is kept as a fallback for queries whose strict plan finds too
+few chunks (typos). The fields these operators use are defined by the
+``text_index`` in 01-data/mongodb/scripts/setup_search_indexes.py.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any
+
+CONTENT_PATH = "content"
+CODE_PATH = {"value": "content", "multi": "code"}
+TITLE_PATH = "metadata.title"
+TITLE_BOOST = 3.0
+SHORT_QUERY_MAX_TERMS = 3
+
+_PHRASE = re.compile(r'"([^"]+)"')
+_IDENTIFIER = re.compile(
+    r"""
+    [A-Za-z_$][\w$]*(?:(?:\.|::|->)[A-Za-z_$][\w$]*)+(?:\(\))?   # qualified.name, mod::fn, a->b
+    | [A-Za-z$]*_[\w$]+                                          # snake_case, _private, CONST_NAME
+    | [a-z]+[A-Z][\w$]*                                          # camelCase
+    | [A-Z][a-z0-9]+[A-Z][\w$]*                                  # PascalCase (two or more humps)
+    | [A-Za-z_$][\w$]*\(\)                                       # call()
+    | \$[A-Za-z]\w*                                              # $operator
+    | --?[a-z][\w-]*                                             # --cli-flag
+    """,
+    re.VERBOSE,
+)
+# Punctuation around a token that is not part of it ("see `foo_bar`," -> foo_bar)
+_STRIP = "`'\",;:!?[]{}<>"
+
+
+@dataclass
+class TextQueryPlan:
+    """Atlas Search operators for one text query."""
+
+    query_class: str
+    operator: dict[str, Any]
+    fuzzy_operator: dict[str, Any] | None = None
+
+
+def _boost(value: float) -> dict[str, Any]:
+    return {"boost": {"value": value}}
+
+
+def _text(query: str, path: Any, boost: float | None = None) -> dict[str, Any]:
+    clause: dict[str, Any] = {"text": {"query": query, "path": path}}
+    if boost:
+        clause["text"]["score"] = _boost(boost)
+    return clause
+
+
+def classify_tokens(query: str) -> tuple[list[str], list[str], list[str]]:
+    """
+    Split a query into quoted phrases, code identifiers and plain words.
+
+    Returns:
+        (phrases, identifiers, words)
+    """
+    phrases = [p.strip() for p in _PHRASE.findall(query) if p.strip()]
+    identifiers, words = [], []
+    for raw in _PHRASE.sub(" ", query).split():
+        token = raw.strip(_STRIP).rstrip(".")
+        if not token:
+            continue
+        if _IDENTIFIER.fullmatch(token):
+            identifiers.append(token)
+        else:
+            words.append(token)
+    return phrases, identifiers, words
+
+
+def plan_text_query(
+    query: str, fuzzy_fallback: bool = True, fuzzy_max_edits: int = 1
+) -> TextQueryPlan:
+    """
+    Choose the Atlas Search operators for a text query.
+
+    Args:
+        query: Search query text
+        fuzzy_fallback: Build a fuzzy operator to retry with when the plan finds too few hits
+        fuzzy_max_edits: maxEdits of the fuzzy fallback (1 or 2)
+
+    Returns:
+        The query class, its operator and the optional fuzzy fallback operator
+    """
+    phrases, identifiers, words = classify_tokens(query)
+    rest = " ".join(words)
+
+    if phrases:
+        query_class = "phrase"
+        operator = {
+            "compound": {
+                "must": [{"phrase": {"query": p, "path": CONTENT_PATH}} for p in phrases],
+                "should": [
+                    {"phrase": {"query": p, "path": TITLE_PATH, "score": _boost(TITLE_BOOST)}}
+                    for p in phrases
+                ]
+                + [_text(i, CODE_PATH) for i in identifiers]
+                + ([_text(rest, CONTENT_PATH)] if rest else []),
+            }
+        }
+    elif identifiers:
+        query_class = "identifier"
+        operator = {
+            "compound": {
+                "must": [_text(i, CODE_PATH) for i in identifiers],
+                "should": [_text(rest, CONTENT_PATH)] if rest else [],
+            }
+        }
+    elif not words:
+        query_class = "keywords"
+        operator = {"compound": {"must": [_text(query, CONTENT_PATH)]}}
+    elif len(words) <= SHORT_QUERY_MAX_TERMS:
+        query_class = "short"
+        operator = {
+            "compound": {
+                "should": [
+                    _text(rest, CONTENT_PATH),
+                    _text(rest, TITLE_PATH, TITLE_BOOST),
+                    {"autocomplete": {"query": rest, "path": TITLE_PATH, "score": _boost(2.0)}},
+                ],
+                "minimumShouldMatch": 1,
+            }
+        }
+    else:
+        query_class = "keywords"
+        operator = {
+            "compound": {
+                "should": [_text(rest, CONTENT_PATH), _text(rest, TITLE_PATH, TITLE_BOOST)],
+                "minimumShouldMatch": 1,
+            }
+        }
+
+    # Atlas rejects empty compound clauses
+    operator["compound"] = {k: v for k, v in operator["compound"].items() if v != []}
+
+    fuzzy_operator = None
+    fuzzy_text = " ".join([*phrases, *identifiers, *words])
+    if fuzzy_fallback and fuzzy_text:
+        fuzzy_operator = {
+            "text": {
+                "query": fuzzy_text,
+                "path": CONTENT_PATH,
+                "fuzzy": {"maxEdits": fuzzy_max_edits, "prefixLength": 3},
+            }
+        }
+    return TextQueryPlan(query_class, operator, fuzzy_operator)
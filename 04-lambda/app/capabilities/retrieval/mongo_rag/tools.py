@@ -1,13 +1,29 @@
 """Search tools for MongoDB RAG Agent."""
 
 import asyncio
+import heapq
 import logging
+import time
+from collections.abc import Awaitable
+from operator import itemgetter
 from typing import Any
 
 from app.capabilities.retrieval.mongo_rag.config import config
 from app.capabilities.retrieval.mongo_rag.dependencies import AgentDependencies
-from app.capabilities.retrieval.mongo_rag.reranking.reranker import get_reranker, initialize_reranker
+from app.capabilities.retrieval.mongo_rag.document_headers import attach_document_headers
+from app.capabilities.retrieval.mongo_rag.quantization import (
+    FULL_PRECISION_FIELD,
+    QUANTIZED_STORAGE_MODES,
+    encode_vector,
+    rescore,
+)
+from app.capabilities.retrieval.mongo_rag.reranking.reranker import (
+    get_reranker,
+    initialize_reranker,
+)
 from app.capabilities.retrieval.mongo_rag.rls import build_access_filter
+from app.capabilities.retrieval.mongo_rag.text_query import TextQueryPlan, plan_text_query
+from app.capabilities.retrieval.mongo_rag.vector_index.service import get_local_vector_search
 from pydantic import BaseModel, Field
 from pydantic_ai import RunContext
 from pymongo.errors import OperationFailure
@@ -24,8 +40,17 @@ class SearchResult(BaseModel):
     content: str = Field(..., description="Chunk text content")
     similarity: float = Field(..., description="Relevance score (0-1)")
     metadata: dict[str, Any] = Field(default_factory=dict, description="Chunk metadata")
-    document_title: str = Field(..., description="Title from document lookup")
-    document_source: str = Field(..., description="Source from document lookup")
+    document_title: str = Field(..., description="Title of the parent document")
+    document_source: str = Field(..., description="Source of the parent document")
+
+
+class BatchQuery(BaseModel):
+    """One query of a batch search."""
+
+    query: str = Field(..., description="Search query text")
+    match_count: int | None = Field(None, description="Number of results to return")
+    search_type: str = Field("hybrid", description="semantic, text or hybrid")
+    filter_dict: dict[str, Any] | None = Field(None, description="Chunk-level MongoDB filter")
 
 
 async def semantic_search(
@@ -33,14 +58,19 @@ async def semantic_search(
     query: str,
     match_count: int | None = None,
     filter_dict: dict[str, Any] | None = None,
+    query_embedding: list[float] | None = None,
 ) -> list[SearchResult]:
     """
     Perform pure semantic search using MongoDB vector similarity.
 
+    Uses Atlas $vectorSearch, or the in-process vector index when
+    VECTOR_SEARCH_BACKEND is exact or hnsw.
+
     Args:
         ctx: Agent runtime context with dependencies
         query: Search query text
         match_count: Number of results to return (default: 10)
+        query_embedding: Precomputed embedding for query (skips the embedding call)
 
     Returns:
         List of search results ordered by similarity
@@ -59,23 +89,8 @@ async def semantic_search(
         match_count = min(match_count, deps.settings.max_match_count)
 
         # Generate embedding for query (already returns list[float])
-        query_embedding = await deps.get_embedding(query)
-
-        # Build MongoDB aggregation pipeline
-        vector_search_stage = {
-            "$vectorSearch": {
-                "index": deps.settings.mongodb_vector_index,
-                "queryVector": query_embedding,
-                "path": "embedding",
-                "numCandidates": 100,  # Search space (10x limit is good default)
-                "limit": match_count,
-            }
-        }
-
-        # Add filter to vector search if provided (chunk-level filters only)
-        # Note: RLS filtering happens at document level in $lookup
-        if filter_dict:
-            vector_search_stage["$vectorSearch"]["filter"] = filter_dict
+        if query_embedding is None:
+            query_embedding = await deps.get_embedding(query)
 
         # Build document access filter for RLS
         document_access_filter = build_access_filter(
@@ -85,43 +100,67 @@ async def semantic_search(
             is_admin=deps.is_admin,
         )
 
-        pipeline = [
-            vector_search_stage,
-            {
-                "$lookup": {
-                    "from": deps.settings.mongodb_collection_documents,
-                    "localField": "document_id",
-                    "foreignField": "_id",
-                    "as": "document_info",
-                    "pipeline": [
-                        (
-                            {"$match": document_access_filter}
-                            if document_access_filter
-                            else {"$match": {}}
-                        )
-                    ],
-                }
-            },
-            {"$unwind": "$document_info"},
-            # Filter out chunks whose documents don't match RLS (empty document_info after unwind)
-            {"$match": {"document_info": {"$exists": True, "$ne": {}}}},
-            {
-                "$project": {
-                    "chunk_id": "$_id",
-                    "document_id": 1,
-                    "content": 1,
-                    "similarity": {"$meta": "vectorSearchScore"},
-                    "metadata": 1,
-                    "document_title": "$document_info.title",
-                    "document_source": "$document_info.source",
+        local_index = await get_local_vector_search()
+        if local_index is not None:
+            # In-process index (VECTOR_SEARCH_BACKEND=exact/hnsw): same filters and RLS
+            results = await local_index.search(
+                deps.db,
+                deps.settings,
+                query_embedding,
+                match_count,
+                filter_dict=filter_dict,
+                access_filter=document_access_filter,
+            )
+        else:
+            # Quantized indexes: over-fetch, then rescore against full-precision copies
+            storage = config.embedding_storage
+            rescoring = storage in QUANTIZED_STORAGE_MODES and config.embedding_keep_full_precision
+            limit = match_count * config.embedding_rescore_factor if rescoring else match_count
+
+            # Build MongoDB aggregation pipeline
+            vector_search_stage = {
+                "$vectorSearch": {
+                    "index": deps.settings.mongodb_vector_index,
+                    # Query vector must match the indexed representation
+                    "queryVector": encode_vector(query_embedding, storage),
+                    "path": "embedding",
+                    "numCandidates": max(100, limit),  # Search space (never below limit)
+                    "limit": limit,
                 }
-            },
-        ]
+            }
 
-        # Execute aggregation
-        collection = deps.db[deps.settings.mongodb_collection_chunks]
-        cursor = await collection.aggregate(pipeline)
-        results = [doc async for doc in cursor][:match_count]
+            # Add filter to vector search if provided (chunk-level filters only)
+            # Note: RLS filtering happens at document level (attach_document_headers)
+            if filter_dict:
+                vector_search_stage["$vectorSearch"]["filter"] = filter_dict
+
+            pipeline = [
+                vector_search_stage,
+                {
+                    "$project": {
+                        "chunk_id": "$_id",
+                        "document_id": 1,
+                        "content": 1,
+                        "similarity": {"$meta": "vectorSearchScore"},
+                        "metadata": 1,
+                        # Denormalized at ingestion; RLS is applied from cached headers
+                        "document_title": 1,
+                        "document_source": 1,
+                        **({FULL_PRECISION_FIELD: 1} if rescoring else {}),
+                    }
+                },
+            ]
+
+            # Execute aggregation
+            collection = deps.db[deps.settings.mongodb_collection_chunks]
+            cursor = await collection.aggregate(pipeline)
+            results = [doc async for doc in cursor]
+            if rescoring:
+                results = rescore(query_embedding, results)
+            results = await attach_document_headers(
+                deps.db, deps.settings, results, document_access_filter
+            )
+            results = results[:match_count]
 
         # Convert to SearchResult objects (ObjectId → str conversion)
         search_results = [
@@ -153,6 +192,44 @@ async def semantic_search(
         return []
 
 
+async def _run_text_search(
+    deps: AgentDependencies,
+    operator: dict[str, Any],
+    limit: int,
+    filter_dict: dict[str, Any] | None,
+    document_access_filter: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Run one Atlas Search operator with chunk filters and RLS applied."""
+    pipeline: list[dict[str, Any]] = [
+        {"$search": {"index": deps.settings.mongodb_text_index, **operator}}
+    ]
+
+    # Chunk-level filters (the $search stage only takes Atlas Search operators)
+    if filter_dict:
+        pipeline.append({"$match": filter_dict})
+
+    pipeline += [
+        {"$limit": limit},
+        {
+            "$project": {
+                "chunk_id": "$_id",
+                "document_id": 1,
+                "content": 1,
+                "similarity": {"$meta": "searchScore"},  # Text relevance score
+                "metadata": 1,
+                # Denormalized at ingestion; RLS is applied from cached headers
+                "document_title": 1,
+                "document_source": 1,
+            }
+        },
+    ]
+
+    collection = deps.db[deps.settings.mongodb_collection_chunks]
+    cursor = await collection.aggregate(pipeline)
+    results = [doc async for doc in cursor][:limit]
+    return await attach_document_headers(deps.db, deps.settings, results, document_access_filter)
+
+
 async def text_search(
     ctx: RunContext[AgentDependencies],
     query: str,
@@ -162,7 +239,9 @@ async def text_search(
     """
     Perform full-text search using MongoDB Atlas Search.
 
-    Uses $search operator for keyword matching, fuzzy matching, and phrase matching.
+    The query is planned onto phrase, code-identifier or keyword operators
+    (see text_query.py). Fuzzy matching is only used as a fallback when the
+    strict plan finds fewer than half the requested results.
     Works on all Atlas tiers including M0 (free tier).
 
     Args:
@@ -185,6 +264,7 @@ async def text_search(
 
         # Validate match count
         match_count = min(match_count, deps.settings.max_match_count)
+        limit = match_count * 2  # Over-fetch for better RRF results
 
         # Build document access filter for RLS
         document_access_filter = build_access_filter(
@@ -194,60 +274,36 @@ async def text_search(
             is_admin=deps.is_admin,
         )
 
-        # Build MongoDB Atlas Search aggregation pipeline
-        search_stage = {
-            "$search": {
-                "index": deps.settings.mongodb_text_index,
-                "text": {
-                    "query": query,
-                    "path": "content",
-                    "fuzzy": {"maxEdits": 2, "prefixLength": 3},
+        if config.text_search_planner:
+            plan = plan_text_query(
+                query, config.text_search_fuzzy_fallback, config.text_search_fuzzy_max_edits
+            )
+        else:
+            plan = TextQueryPlan(
+                "fuzzy",
+                {
+                    "text": {
+                        "query": query,
+                        "path": "content",
+                        "fuzzy": {"maxEdits": 2, "prefixLength": 3},
+                    }
                 },
-            }
-        }
+            )
 
-        # Add filter to search if provided
-        if filter_dict:
-            search_stage["$search"]["filter"] = filter_dict
-
-        pipeline = [
-            search_stage,
-            {"$limit": match_count * 2},  # Over-fetch for better RRF results
-            {
-                "$lookup": {
-                    "from": deps.settings.mongodb_collection_documents,
-                    "localField": "document_id",
-                    "foreignField": "_id",
-                    "as": "document_info",
-                    "pipeline": [
-                        (
-                            {"$match": document_access_filter}
-                            if document_access_filter
-                            else {"$match": {}}
-                        )
-                    ],
-                }
-            },
-            {"$unwind": "$document_info"},
-            # Filter out chunks whose documents don't match RLS (empty document_info after unwind)
-            {"$match": {"document_info": {"$exists": True, "$ne": {}}}},
-            {
-                "$project": {
-                    "chunk_id": "$_id",
-                    "document_id": 1,
-                    "content": 1,
-                    "similarity": {"$meta": "searchScore"},  # Text relevance score
-                    "metadata": 1,
-                    "document_title": "$document_info.title",
-                    "document_source": "$document_info.source",
-                }
-            },
-        ]
+        results = await _run_text_search(
+            deps, plan.operator, limit, filter_dict, document_access_filter
+        )
 
-        # Execute aggregation
-        collection = deps.db[deps.settings.mongodb_collection_chunks]
-        cursor = await collection.aggregate(pipeline)
-        results = [doc async for doc in cursor][: match_count * 2]
+        # Too few exact hits (likely a typo): retry with fuzzy matching
+        used_fuzzy = False
+        if plan.fuzzy_operator and len(results) < max(1, match_count // 2):
+            used_fuzzy = True
+            seen = {doc["chunk_id"] for doc in results}
+            fuzzy_results = await _run_text_search(
+                deps, plan.fuzzy_operator, limit, filter_dict, document_access_filter
+            )
+            results += [doc for doc in fuzzy_results if doc["chunk_id"] not in seen]
+            results = results[:limit]
 
         # Convert to SearchResult objects (ObjectId → str conversion)
         search_results = [
@@ -264,7 +320,8 @@ async def text_search(
         ]
 
         logger.info(
-            f"text_search_completed: query={query}, results={len(search_results)}, match_count={match_count}"
+            f"text_search_completed: query={query}, query_class={plan.query_class}, "
+            f"fuzzy_fallback={used_fuzzy}, results={len(search_results)}, match_count={match_count}"
         )
 
         return search_results
@@ -279,11 +336,28 @@ async def text_search(
         return []
 
 
+RRF_K = 60  # Standard RRF constant
+
+
+def _rank_fused(fused: dict[str, list[Any]], limit: int | None = None) -> list[SearchResult]:
+    """Order fused [score, result] entries and set each result's similarity to its score."""
+    entries = fused.values()
+    if limit is None:
+        ranked = sorted(entries, key=itemgetter(0), reverse=True)
+    else:
+        ranked = heapq.nlargest(limit, entries, key=itemgetter(0))
+    # model_copy skips validation; the source results stay untouched
+    return [result.model_copy(update={"similarity": score}) for score, result in ranked]
+
+
 def reciprocal_rank_fusion(
-    search_results_list: list[list[SearchResult]], k: int = 60
+    search_results_list: list[list[SearchResult]],
+    k: int = RRF_K,
+    weights: list[float] | None = None,
+    limit: int | None = None,
 ) -> list[SearchResult]:
     """
-    Merge multiple ranked lists using Reciprocal Rank Fusion.
+    Merge multiple ranked lists using (weighted) Reciprocal Rank Fusion.
 
     RRF is a simple yet effective algorithm for combining results from different
     search methods. It works by scoring each document based on its rank position
@@ -292,90 +366,142 @@ def reciprocal_rank_fusion(
     Args:
         search_results_list: List of ranked result lists from different searches
         k: RRF constant (default: 60, standard in literature)
+        weights: Weight per result list (default: 1.0 each)
+        limit: Only build the top N merged results
 
     Returns:
         Unified list of results sorted by combined RRF score
 
     Algorithm:
         For each document d appearing in result lists:
-            RRF_score(d) = Σ(1 / (k + rank_i(d)))
+            RRF_score(d) = Σ(w_i / (k + rank_i(d)))
         Where rank_i(d) is the position of document d in result list i.
 
     References:
         - Cormack et al. (2009): "Reciprocal Rank Fusion outperforms the best system"
         - Standard k=60 performs well across various datasets
     """
-    # Build score dictionary by chunk_id
-    rrf_scores: dict[str, float] = {}
-    chunk_map: dict[str, SearchResult] = {}
+    # chunk_id -> [score, first result seen] (automatic deduplication)
+    fused: dict[str, list[Any]] = {}
 
-    # Process each search result list
-    for results in search_results_list:
+    for index, results in enumerate(search_results_list):
+        weight = 1.0 if weights is None else weights[index]
         for rank, result in enumerate(results):
-            chunk_id = result.chunk_id
-
-            # Calculate RRF contribution: 1 / (k + rank)
-            rrf_score = 1.0 / (k + rank)
-
-            # Accumulate score (automatic deduplication)
-            if chunk_id in rrf_scores:
-                rrf_scores[chunk_id] += rrf_score
+            contribution = weight / (k + rank)
+            entry = fused.get(result.chunk_id)
+            if entry is None:
+                fused[result.chunk_id] = [contribution, result]
             else:
-                rrf_scores[chunk_id] = rrf_score
-                chunk_map[chunk_id] = result
-
-    # Sort by combined RRF score (descending)
-    sorted_chunks = sorted(rrf_scores.items(), key=lambda x: x[1], reverse=True)
-
-    # Build final result list with updated similarity scores
-    merged_results = []
-    for chunk_id, rrf_score in sorted_chunks:
-        result = chunk_map[chunk_id]
-        # Create new result with updated similarity (RRF score)
-        merged_result = SearchResult(
-            chunk_id=result.chunk_id,
-            document_id=result.document_id,
-            content=result.content,
-            similarity=rrf_score,  # Combined RRF score
-            metadata=result.metadata,
-            document_title=result.document_title,
-            document_source=result.document_source,
-        )
-        merged_results.append(merged_result)
+                entry[0] += contribution
+
+    merged_results = _rank_fused(fused, limit)
 
     logger.info(
-        f"RRF merged {len(search_results_list)} result lists into {len(merged_results)} unique results"
+        f"RRF merged {len(search_results_list)} result lists into {len(fused)} unique results"
     )
 
     return merged_results
 
 
+def score_fusion(
+    search_results_list: list[list[SearchResult]],
+    weights: list[float] | None = None,
+    limit: int | None = None,
+) -> list[SearchResult]:
+    """
+    Merge multiple result lists by their normalized relevance scores.
+
+    Unlike RRF, how much better the top hit is than the rest carries over:
+    each list's scores are min-max normalized to 0-1 (vector similarity and
+    Atlas Search scores have different ranges) and summed per chunk with the
+    list's weight.
+
+    Args:
+        search_results_list: List of result lists from different searches
+        weights: Weight per result list (default: 1.0 each)
+        limit: Only build the top N merged results
+
+    Returns:
+        Unified list of results sorted by combined score
+    """
+    fused: dict[str, list[Any]] = {}
+
+    for index, results in enumerate(search_results_list):
+        if not results:
+            continue
+        weight = 1.0 if weights is None else weights[index]
+        scores = [result.similarity for result in results]
+        low, span = min(scores), max(scores) - min(scores)
+        for result, score in zip(results, scores, strict=True):
+            contribution = weight * ((score - low) / span if span else 1.0)
+            entry = fused.get(result.chunk_id)
+            if entry is None:
+                fused[result.chunk_id] = [contribution, result]
+            else:
+                entry[0] += contribution
+
+    return _rank_fused(fused, limit)
+
+
+async def _timed_search(
+    name: str, search: Awaitable[list[SearchResult]], timeout_ms: int, stats: dict[str, Any]
+) -> list[SearchResult]:
+    """Await one hybrid search source within its deadline, recording latency and outcome."""
+    start = time.perf_counter()
+    status = "ok"
+    try:
+        if timeout_ms > 0:
+            results = await asyncio.wait_for(search, timeout_ms / 1000)
+        else:
+            results = await search
+    except asyncio.TimeoutError:
+        logger.warning(f"{name} search timed out after {timeout_ms} ms, using other results")
+        status, results = "timeout", []
+    except Exception as e:
+        logger.warning(f"{name} search failed: {e}, using other results")
+        status, results = "error", []
+
+    stats[name] = {
+        "status": status,
+        "latency_ms": round((time.perf_counter() - start) * 1000, 1),
+        "results": len(results),
+    }
+    return results
+
+
 async def hybrid_search(
     ctx: RunContext[AgentDependencies],
     query: str,
     match_count: int | None = None,
     filter_dict: dict[str, Any] | None = None,
     text_weight: float | None = None,
+    query_embedding: list[float] | None = None,
+    stats: dict[str, Any] | None = None,
 ) -> list[SearchResult]:
     """
     Perform hybrid search combining semantic and keyword matching.
 
-    Uses manual Reciprocal Rank Fusion (RRF) to merge vector and text search results.
+    Runs semantic, text and (when available) Graphiti searches concurrently,
+    each within its own deadline, and fuses whatever finished in time with
+    weighted RRF or normalized-score fusion (HYBRID_FUSION).
     Works on all Atlas tiers including M0 (free tier) - no M10+ required!
 
     Args:
         ctx: Agent runtime context with dependencies
         query: Search query text
         match_count: Number of results to return (default: 10)
-        text_weight: Weight for text matching (0-1, not used with RRF)
+        text_weight: Weight of text vs. semantic results (0-1, default: HYBRID_TEXT_WEIGHT)
+        query_embedding: Precomputed embedding for query (skips the embedding call)
+        stats: Filled with the fusion method and per-source status, latency,
+            result count and contribution to the returned results
 
     Returns:
-        List of search results sorted by combined RRF score
+        List of search results sorted by combined score
 
     Algorithm:
         1. Run semantic search (vector similarity)
-        2. Run text search (keyword/fuzzy matching)
-        3. Merge results using Reciprocal Rank Fusion
+        2. Run text search (keyword matching)
+        3. Merge results using weighted RRF or score fusion
         4. Return top N results by combined score
     """
     try:
@@ -384,85 +510,94 @@ async def hybrid_search(
         # Use defaults if not specified
         if match_count is None:
             match_count = deps.settings.default_match_count
+        if text_weight is None:
+            text_weight = config.default_text_weight
 
-        # Validate match count
+        # Validate match count and weight
         match_count = min(match_count, deps.settings.max_match_count)
+        text_weight = min(max(text_weight, 0.0), 1.0)
 
-        # Over-fetch for better RRF results (2x requested count)
+        # Over-fetch for better fusion results (2x requested count)
         fetch_count = match_count * 2
 
         logger.info(f"hybrid_search starting: query='{query}', match_count={match_count}")
 
-        # Prepare search tasks (with filter)
-        search_tasks = [
-            semantic_search(ctx, query, fetch_count, filter_dict),
-            text_search(ctx, query, fetch_count, filter_dict),
-        ]
+        source_stats: dict[str, Any] = {}
+        searches = {
+            "semantic": (
+                semantic_search(ctx, query, fetch_count, filter_dict, query_embedding),
+                config.hybrid_search_timeout_ms,
+                1.0 - text_weight,
+            ),
+            "text": (
+                text_search(ctx, query, fetch_count, filter_dict),
+                config.hybrid_search_timeout_ms,
+                text_weight,
+            ),
+        }
 
         # Add Graphiti search if available
         # Import here to avoid circular import
-        graphiti_results = []
         if deps.graphiti_deps and deps.graphiti_deps.graphiti:
             from capabilities.retrieval.graphiti_rag.search.graph_search import graphiti_search
 
-            search_tasks.append(graphiti_search(deps.graphiti_deps.graphiti, query, fetch_count))
+            searches["graphiti"] = (
+                graphiti_search(deps.graphiti_deps.graphiti, query, fetch_count),
+                config.hybrid_graphiti_timeout_ms,
+                config.hybrid_graphiti_weight,
+            )
 
-        # Run all searches concurrently for performance
-        search_results_list = await asyncio.gather(
-            *search_tasks,
-            return_exceptions=True,  # Don't fail if one search errors
+        # Run all searches concurrently; a slow or failing source contributes nothing
+        results_list = await asyncio.gather(
+            *(
+                _timed_search(name, search, timeout_ms, source_stats)
+                for name, (search, timeout_ms, _) in searches.items()
+            )
         )
-
-        # Extract results and handle errors gracefully
-        semantic_results = search_results_list[0]
-        text_results = search_results_list[1]
-
-        if isinstance(semantic_results, Exception):
-            logger.warning(f"Semantic search failed: {semantic_results}, using other results")
-            semantic_results = []
-        if isinstance(text_results, Exception):
-            logger.warning(f"Text search failed: {text_results}, using other results")
-            text_results = []
-
-        # Extract Graphiti results if available
-        if len(search_results_list) > 2:
-            graphiti_results = search_results_list[2]
-            if isinstance(graphiti_results, Exception):
-                logger.warning(
-                    f"Graphiti search failed: {graphiti_results}, using MongoDB results only"
-                )
-                graphiti_results = []
+        results_by_source = dict(zip(searches, results_list, strict=True))
 
         # If all failed, return empty
-        if not semantic_results and not text_results and not graphiti_results:
+        if not any(results_list):
             logger.error("All search methods failed")
             return []
 
-        # Merge results using Reciprocal Rank Fusion (2 or 3 sources)
-        sources_to_merge = [semantic_results, text_results]
-        if graphiti_results:
-            sources_to_merge.append(graphiti_results)
+        # Merge the sources that returned results
+        sources = [name for name, results in results_by_source.items() if results]
+        sources_to_merge = [results_by_source[name] for name in sources]
+        weights = [searches[name][2] for name in sources]
+        # Reranking reorders the full merged list; otherwise only the top N are built
+        limit = None if config.use_reranking else match_count
 
-        merged_results = reciprocal_rank_fusion(sources_to_merge, k=60)  # Standard RRF constant
+        if config.hybrid_fusion == "score":
+            merged_results = score_fusion(sources_to_merge, weights, limit)
+        else:
+            merged_results = reciprocal_rank_fusion(sources_to_merge, RRF_K, weights, limit)
 
         # Apply reranking if enabled
         if config.use_reranking:
-            reranker = get_reranker()
-            if reranker is None:
-                # Initialize reranker on first use
-                reranker = initialize_reranker()
-
-            if reranker and reranker.model:
-                merged_results = reranker.rerank_results(query, merged_results)
+            # The model loads on first use through the shared model registry
+            reranker = get_reranker() or initialize_reranker()
+            merged_results = await reranker.arerank_results(query, merged_results)
 
         # Return top N results
         final_results = merged_results[:match_count]
 
+        returned_ids = {result.chunk_id for result in final_results}
+        for name, results in results_by_source.items():
+            source_stats[name]["weight"] = searches[name][2]
+            source_stats[name]["contributed"] = sum(
+                result.chunk_id in returned_ids for result in results
+            )
+        if stats is not None:
+            stats.update(fusion=config.hybrid_fusion, sources=source_stats)
+
         logger.info(
-            f"hybrid_search_completed: query='{query}', "
-            f"semantic={len(semantic_results)}, text={len(text_results)}, "
-            f"graphiti={len(graphiti_results) if graphiti_results else 0}, "
-            f"merged={len(merged_results)}, returned={len(final_results)}"
+            f"hybrid_search_completed: query='{query}', fusion={config.hybrid_fusion}, "
+            + ", ".join(
+                f"{name}={s['results']}/{s['status']}/{s['latency_ms']}ms"
+                for name, s in source_stats.items()
+            )
+            + f", returned={len(final_results)}"
         )
 
         return final_results
@@ -472,6 +607,90 @@ async def hybrid_search(
         # Graceful degradation: try semantic-only as last resort
         try:
             logger.info("Falling back to semantic search only")
-            return await semantic_search(ctx, query, match_count)
+            return await semantic_search(ctx, query, match_count, filter_dict, query_embedding)
         except (MongoDBException, RuntimeError, ValueError):
             return []
+
+
+def _dedupe_across_queries(results_list: list[list[SearchResult]]) -> list[list[SearchResult]]:
+    """
+    Keep each chunk only in the query where it ranks highest.
+
+    Scores from different search types are not comparable, so rank position is
+    used; ties go to the earlier query.
+    """
+    best: dict[str, tuple[int, int]] = {}
+    for query_index, results in enumerate(results_list):
+        for rank, result in enumerate(results):
+            key = (rank, query_index)
+            if result.chunk_id not in best or key < best[result.chunk_id]:
+                best[result.chunk_id] = key
+
+    return [
+        [result for result in results if best[result.chunk_id][1] == query_index]
+        for query_index, results in enumerate(results_list)
+    ]
+
+
+async def batch_search(
+    ctx: RunContext[AgentDependencies],
+    queries: list[BatchQuery],
+    dedupe: bool = False,
+) -> list[list[SearchResult]]:
+    """
+    Run several searches with a single embedding request.
+
+    Embeddings for every semantic/hybrid query are generated in one API call,
+    then all searches run concurrently. Hybrid queries are still merged with
+    RRF individually.
+
+    Args:
+        ctx: Agent runtime context with dependencies
+        queries: Queries to run, each with its own match count, type and filter
+        dedupe: Keep each chunk only in the query where it ranks highest
+
+    Returns:
+        One result list per query, in the same order as queries
+    """
+    deps = ctx.deps
+
+    # One embedding request for every distinct query text that needs a vector
+    texts = list(dict.fromkeys(q.query for q in queries if q.search_type != "text"))
+    embeddings: dict[str, list[float]] = {}
+    if texts:
+        try:
+            embeddings = dict(zip(texts, await deps.get_embeddings(texts), strict=True))
+        except Exception as e:
+            # Each search falls back to embedding its own query
+            logger.warning(f"batch_search embedding failed, embedding per query: {e}")
+
+    def _match_count(q: BatchQuery) -> int:
+        match_count = q.match_count or deps.settings.default_match_count
+        return min(match_count, deps.settings.max_match_count)
+
+    async def _run(q: BatchQuery) -> list[SearchResult]:
+        # Over-fetch when deduplicating so queries keep enough results afterwards
+        fetch_count = _match_count(q) * 2 if dedupe else _match_count(q)
+        embedding = embeddings.get(q.query)
+        if q.search_type == "semantic":
+            return await semantic_search(ctx, q.query, fetch_count, q.filter_dict, embedding)
+        if q.search_type == "text":
+            return await text_search(ctx, q.query, fetch_count, q.filter_dict)
+        return await hybrid_search(
+            ctx, q.query, fetch_count, q.filter_dict, query_embedding=embedding
+        )
+
+    results_list = await asyncio.gather(*(_run(q) for q in queries))
+
+    if dedupe:
+        results_list = [
+            results[: _match_count(q)]
+            for q, results in zip(queries, _dedupe_across_queries(results_list), strict=True)
+        ]
+
+    logger.info(
+        f"batch_search_completed: queries={len(queries)}, embedded={len(embeddings)}, "
+        f"results={sum(len(r) for r in results_list)}, dedupe={dedupe}"
+    )
+
+    return list(results_list)
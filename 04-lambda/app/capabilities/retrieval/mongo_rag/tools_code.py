@@ -3,6 +3,7 @@
 import logging
 
 from app.capabilities.retrieval.mongo_rag.dependencies import AgentDependencies
+from app.capabilities.retrieval.mongo_rag.document_headers import get_document_header_cache
 from pydantic import BaseModel, Field
 from pydantic_ai import RunContext
 from pymongo.errors import OperationFailure
@@ -61,15 +62,6 @@ async def search_code_examples(
                     "limit": match_count,
                 }
             },
-            {
-                "$lookup": {
-                    "from": deps.settings.mongodb_collection_documents,
-                    "localField": "document_id",
-                    "foreignField": "_id",
-                    "as": "document_info",
-                }
-            },
-            {"$unwind": {"path": "$document_info", "preserveNullAndEmptyArrays": True}},
             {
                 "$project": {
                     "code_example_id": "$_id",
@@ -79,7 +71,7 @@ async def search_code_examples(
                     "language": 1,
                     "similarity": {"$meta": "vectorSearchScore"},
                     "metadata": 1,
-                    "source": {"$ifNull": ["$source", "$document_info.source"]},
+                    "source": 1,
                 }
             },
         ]
@@ -89,6 +81,16 @@ async def search_code_examples(
         cursor = await collection.aggregate(pipeline)
         results = [doc async for doc in cursor][:match_count]
 
+        # Code examples without their own source fall back to the document's
+        missing = [doc["document_id"] for doc in results if doc.get("source") is None]
+        if missing:
+            headers = await get_document_header_cache().get_many(
+                deps.db[deps.settings.mongodb_collection_documents], missing
+            )
+            for doc in results:
+                if doc.get("source") is None and doc["document_id"] in headers:
+                    doc["source"] = headers[doc["document_id"]].get("source")
+
         # Convert to CodeExampleResult objects
         code_results = [
             CodeExampleResult(
@@ -0,0 +1 @@
+"""In-process vector indexes for semantic search without Atlas Vector Search."""
@@ -0,0 +1,248 @@
+"""Vector storage shared by the in-process index implementations.
+
+Vectors are kept L2-normalized in one float32 matrix, one row ("slot") per
+chunk, so cosine similarity is a dot product. Slots are append-only: removing
+or replacing a chunk tombstones its slot until the index is compacted.
+
+An index is saved as a directory of ``.npy`` files plus ``index.json``. Loading
+memory-maps the arrays read-only, so a large index starts instantly and is
+paged in by the OS as it is searched; the first mutation copies it into memory.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+_INITIAL_CAPACITY = 1024
+
+
+def save_array(path: Path, array: np.ndarray) -> None:
+    """Write an array atomically (readers may still have the old file mapped)."""
+    tmp = path.with_suffix(".tmp.npy")
+    np.save(tmp, array)
+    tmp.replace(path)
+
+
+def load_array(path: Path, mmap: bool = True) -> np.ndarray:
+    return np.load(path, mmap_mode="r" if mmap else None)
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows (zero vectors stay zero)."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+class VectorIndex(ABC):
+    """
+    Base class for in-process vector indexes.
+
+    Subclasses implement ``_search`` (and, for graph indexes, ``_on_add`` and
+    the persistence hooks). Scores are cosine similarity mapped to [0, 1] like
+    Atlas vectorSearchScore, so results are interchangeable with $vectorSearch.
+    """
+
+    kind = "base"
+
+    def __init__(self, dims: int):
+        self.dims = dims
+        self._vectors = np.zeros((_INITIAL_CAPACITY, dims), dtype=np.float32)
+        self._deleted = np.zeros(_INITIAL_CAPACITY, dtype=bool)
+        self._ids: list[str] = []
+        self._slots: dict[str, int] = {}
+
+    # ------------------------------------------------------------------ state
+
+    @property
+    def size(self) -> int:
+        """Number of slots, including tombstoned ones."""
+        return len(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, chunk_id: str) -> bool:
+        return chunk_id in self._slots
+
+    @property
+    def ids(self) -> list[str]:
+        """Ids of the live vectors."""
+        return list(self._slots)
+
+    def slot_of(self, chunk_id: str) -> int | None:
+        return self._slots.get(chunk_id)
+
+    def id_of(self, slot: int) -> str:
+        return self._ids[slot]
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Normalized vectors of every slot (tombstoned rows included)."""
+        return self._vectors[: self.size]
+
+    @property
+    def live(self) -> np.ndarray:
+        """Boolean mask of slots that have not been removed."""
+        return ~self._deleted[: self.size]
+
+    @property
+    def tombstone_ratio(self) -> float:
+        return 1 - len(self) / self.size if self.size else 0.0
+
+    def _ensure_capacity(self, extra: int) -> None:
+        needed = self.size + extra
+        writable = self._vectors.flags.writeable and self._deleted.flags.writeable
+        if needed <= len(self._vectors) and writable:
+            return
+        capacity = max(needed, 2 * len(self._vectors), _INITIAL_CAPACITY)
+        vectors = np.zeros((capacity, self.dims), dtype=np.float32)
+        vectors[: self.size] = self._vectors[: self.size]
+        deleted = np.zeros(capacity, dtype=bool)
+        deleted[: self.size] = self._deleted[: self.size]
+        self._vectors, self._deleted = vectors, deleted
+
+    # -------------------------------------------------------------- mutation
+
+    def add(self, ids: Sequence[str], vectors: Any) -> list[int]:
+        """
+        Add or replace vectors.
+
+        Args:
+            ids: Chunk ids (replacing an existing id tombstones its old slot)
+            vectors: Array-like of shape (len(ids), dims)
+
+        Returns:
+            The slot assigned to each id
+        """
+        vectors = normalize(vectors).reshape(len(ids), -1)
+        if vectors.shape[1] != self.dims:
+            raise ValueError(f"Expected {self.dims}-dimensional vectors, got {vectors.shape[1]}")
+        self.remove(ids)
+        self._ensure_capacity(len(ids))
+
+        start = self.size
+        self._vectors[start : start + len(ids)] = vectors
+        slots = list(range(start, start + len(ids)))
+        for chunk_id, slot in zip(ids, slots, strict=True):
+            self._ids.append(chunk_id)
+            self._slots[chunk_id] = slot
+        self._on_add(slots)
+        return slots
+
+    def remove(self, ids: Sequence[str]) -> int:
+        """Tombstone the slots of the given ids. Returns how many were present."""
+        slots = [self._slots.pop(chunk_id) for chunk_id in ids if chunk_id in self._slots]
+        if slots:
+            if not self._deleted.flags.writeable:
+                self._ensure_capacity(0)
+            self._deleted[slots] = True
+        return len(slots)
+
+    def compact(self) -> np.ndarray:
+        """
+        Drop tombstoned slots, renumbering the live ones in order.
+
+        Returns:
+            Old slot of each new slot (new slot i was old slot ``kept[i]``)
+        """
+        kept = np.flatnonzero(self.live)
+        vectors = np.array(self._vectors[kept])
+        ids = [self._ids[slot] for slot in kept]
+        self._reset()
+        self.add(ids, vectors)
+        return kept
+
+    def _reset(self) -> None:
+        """Empty the index, keeping its parameters."""
+        self.__init__(self.dims, **self.params())
+
+    def _on_add(self, slots: list[int]) -> None:  # noqa: B027 - optional hook
+        """Hook for indexes that maintain extra structure per slot."""
+
+    # ---------------------------------------------------------------- search
+
+    def search(
+        self, query: Sequence[float], k: int, mask: np.ndarray | None = None
+    ) -> list[tuple[int, float]]:
+        """
+        Find the k most similar live vectors.
+
+        Args:
+            query: Query embedding (need not be normalized)
+            k: Number of results
+            mask: Optional boolean array over slots; only True slots are returned
+
+        Returns:
+            (slot, score) pairs, best first, score in [0, 1]
+        """
+        allowed = self.live if mask is None else self.live & mask[: self.size]
+        if k <= 0 or not allowed.any():
+            return []
+        query = normalize(np.asarray(query, dtype=np.float32))
+        return [(slot, (1.0 + sim) / 2.0) for slot, sim in self._search(query, k, allowed)]
+
+    def exact_search(
+        self, query: np.ndarray, k: int, allowed: np.ndarray
+    ) -> list[tuple[int, float]]:
+        """Brute-force cosine top-k over the allowed slots (query normalized)."""
+        candidates = np.flatnonzero(allowed)
+        if len(candidates) * 4 > self.size:
+            # Mostly allowed: one matmul over the whole matrix beats gathering rows
+            sims = self.vectors @ query
+            sims = sims[candidates]
+        else:
+            sims = self.vectors[candidates] @ query
+        k = min(k, len(candidates))
+        top = np.argpartition(-sims, k - 1)[:k]
+        top = top[np.argsort(-sims[top], kind="stable")]
+        return [(int(candidates[i]), float(sims[i])) for i in top]
+
+    @abstractmethod
+    def _search(self, query: np.ndarray, k: int, allowed: np.ndarray) -> list[tuple[int, float]]:
+        """Return (slot, cosine) pairs among allowed slots, best first."""
+
+    # ----------------------------------------------------------- persistence
+
+    def params(self) -> dict[str, Any]:
+        """Constructor parameters stored in index.json."""
+        return {}
+
+    def save(self, path: str | Path) -> None:
+        """Write the index to a directory."""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        save_array(path / "vectors.npy", np.ascontiguousarray(self.vectors))
+        save_array(path / "deleted.npy", self._deleted[: self.size])
+        self._save_extra(path)
+        meta = {"kind": self.kind, "dims": self.dims, "params": self.params(), "ids": self._ids}
+        tmp = path / "index.json.tmp"
+        tmp.write_text(json.dumps(meta))
+        tmp.replace(path / "index.json")
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> "VectorIndex":
+        """Load an index saved by ``save``, memory-mapping its arrays."""
+        path = Path(path)
+        meta = json.loads((path / "index.json").read_text())
+        if meta["kind"] != cls.kind:
+            raise ValueError(f"{path} holds a '{meta['kind']}' index, not '{cls.kind}'")
+        index = cls(meta["dims"], **meta["params"])
+        index._vectors = load_array(path / "vectors.npy", mmap)
+        index._deleted = load_array(path / "deleted.npy", mmap)
+        index._ids = meta["ids"]
+        index._slots = {
+            chunk_id: slot for slot, chunk_id in enumerate(index._ids) if not index._deleted[slot]
+        }
+        index._load_extra(path, mmap)
+        return index
+
+    def _save_extra(self, path: Path) -> None:  # noqa: B027 - optional hook
+        """Hook for indexes with extra arrays to persist."""
+
+    def _load_extra(self, path: Path, mmap: bool) -> None:  # noqa: B027 - optional hook
+        """Hook for indexes with extra arrays to load."""
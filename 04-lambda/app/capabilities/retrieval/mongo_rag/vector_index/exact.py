@@ -0,0 +1,19 @@
+"""Exact (brute-force) in-process vector index."""
+
+import numpy as np
+from app.capabilities.retrieval.mongo_rag.vector_index.base import VectorIndex
+
+
+class ExactVectorIndex(VectorIndex):
+    """
+    Exact cosine search with one matrix-vector product per query.
+
+    Recall is always 1.0 and filters are exact. A laptop scores ~100k
+    768-dimensional vectors in a few milliseconds, so this is the default local
+    backend; switch to HNSW when the corpus outgrows it.
+    """
+
+    kind = "exact"
+
+    def _search(self, query: np.ndarray, k: int, allowed: np.ndarray) -> list[tuple[int, float]]:
+        return self.exact_search(query, k, allowed)
@@ -0,0 +1,111 @@
+"""Evaluate MongoDB query filters against in-memory chunk fields.
+
+Local vector search applies the same chunk-level ``filter_dict`` that
+$vectorSearch would, so filters must mean the same thing in both places. This
+covers the query operators a metadata filter realistically uses; anything else
+raises ValueError rather than silently matching.
+"""
+
+from collections.abc import Mapping
+from typing import Any
+
+
+def _resolve(doc: Any, path: list[str]) -> list[Any]:
+    """Values at a dotted path, descending into arrays like MongoDB does."""
+    if not path:
+        return [doc]
+    if isinstance(doc, Mapping):
+        if path[0] not in doc:
+            return []
+        return _resolve(doc[path[0]], path[1:])
+    if isinstance(doc, list):
+        if path[0].isdigit() and int(path[0]) < len(doc):
+            return _resolve(doc[int(path[0])], path[1:])
+        return [value for item in doc for value in _resolve(item, path)]
+    return []
+
+
+def _candidates(values: list[Any]) -> list[Any]:
+    """Values plus the elements of array values (equality matches either)."""
+    expanded = list(values)
+    for value in values:
+        if isinstance(value, list):
+            expanded.extend(value)
+    return expanded
+
+
+def _equals(values: list[Any], expected: Any) -> bool:
+    if expected is None:
+        return not values or any(value is None for value in _candidates(values))
+    return any(value == expected for value in _candidates(values))
+
+
+def _compare(values: list[Any], op: str, bound: Any) -> bool:
+    for value in _candidates(values):
+        try:
+            if (
+                (op == "$gt" and value > bound)
+                or (op == "$gte" and value >= bound)
+                or (op == "$lt" and value < bound)
+                or (op == "$lte" and value <= bound)
+            ):
+                return True
+        except TypeError:
+            continue  # MongoDB only compares values of the same type
+    return False
+
+
+def _match_operators(values: list[Any], operators: Mapping[str, Any]) -> bool:
+    for op, arg in operators.items():
+        if op == "$eq":
+            matched = _equals(values, arg)
+        elif op == "$ne":
+            matched = not _equals(values, arg)
+        elif op == "$in":
+            matched = any(_equals(values, expected) for expected in arg)
+        elif op == "$nin":
+            matched = not any(_equals(values, expected) for expected in arg)
+        elif op in ("$gt", "$gte", "$lt", "$lte"):
+            matched = _compare(values, op, arg)
+        elif op == "$exists":
+            matched = bool(values) == bool(arg)
+        elif op == "$all":
+            matched = all(_equals(values, expected) for expected in arg)
+        elif op == "$not":
+            matched = not _match_operators(values, arg)
+        else:
+            raise ValueError(f"Unsupported filter operator for local vector search: {op}")
+        if not matched:
+            return False
+    return True
+
+
+def matches_filter(doc: Mapping[str, Any], query: Mapping[str, Any]) -> bool:
+    """
+    Return whether a document matches a MongoDB query filter.
+
+    Supports implicit equality, $eq, $ne, $in, $nin, $gt, $gte, $lt, $lte,
+    $exists, $all, $not, $and, $or and $nor, with dotted paths into embedded
+    documents and arrays.
+
+    Raises:
+        ValueError: If the filter uses an unsupported operator
+    """
+    for key, condition in query.items():
+        if key == "$and":
+            matched = all(matches_filter(doc, sub) for sub in condition)
+        elif key == "$or":
+            matched = any(matches_filter(doc, sub) for sub in condition)
+        elif key == "$nor":
+            matched = not any(matches_filter(doc, sub) for sub in condition)
+        elif key.startswith("$"):
+            raise ValueError(f"Unsupported filter operator for local vector search: {key}")
+        else:
+            values = _resolve(doc, key.split("."))
+            if isinstance(condition, Mapping) and any(k.startswith("$") for k in condition):
+                matched = _match_operators(values, condition)
+            else:
+                matched = _equals(values, condition)
+        if not matched:
+            return False
+    return True
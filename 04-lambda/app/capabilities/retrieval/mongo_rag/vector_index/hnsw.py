@@ -0,0 +1,230 @@
+"""Approximate in-process vector index (HNSW graph)."""
+
+import heapq
+import json
+import math
+import random
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from app.capabilities.retrieval.mongo_rag.vector_index.base import (
+    VectorIndex,
+    load_array,
+    save_array,
+)
+
+
+class HNSWVectorIndex(VectorIndex):
+    """
+    Hierarchical Navigable Small World graph (Malkov & Yashunin, 2016).
+
+    Each vector is linked to up to ``m`` neighbors per layer (``2 * m`` on the
+    bottom layer, stored as a fixed-width int32 array that is memory-mapped
+    with the vectors). Search descends the sparse upper layers greedily and
+    then explores the bottom layer with a beam of ``ef_search`` candidates.
+
+    Filtered searches keep traversing through disallowed vectors but only
+    return allowed ones. When a filter allows only a small part of the index
+    (a single user's documents, say) an exact scan over the allowed vectors is
+    both faster and exact, so that is used instead.
+    """
+
+    kind = "hnsw"
+
+    # Filters allowing fewer vectors than this (or this fraction) are scanned exactly
+    exact_threshold = 2048
+    exact_selectivity = 0.05
+
+    def __init__(
+        self,
+        dims: int,
+        m: int = 16,
+        ef_construction: int = 100,
+        ef_search: int = 64,
+        seed: int = 0,
+    ):
+        super().__init__(dims)
+        self.m = m
+        self.m0 = 2 * m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self._level_mult = 1 / math.log(m)
+        self._levels: list[int] = []
+        self._links0 = np.full((0, self.m0), -1, dtype=np.int32)
+        self._degree0 = np.zeros(0, dtype=np.int32)
+        self._upper: list[dict[int, list[int]]] = []
+        self._entry: int | None = None
+        self._max_level = -1
+
+    def params(self) -> dict[str, Any]:
+        return {
+            "m": self.m,
+            "ef_construction": self.ef_construction,
+            "ef_search": self.ef_search,
+            "seed": self.seed,
+        }
+
+    # ---------------------------------------------------------------- graph
+
+    def _neighbors(self, node: int, layer: int) -> list[int]:
+        if layer == 0:
+            return self._links0[node, : self._degree0[node]].tolist()
+        return self._upper[layer - 1].get(node, [])
+
+    def _set_neighbors(self, node: int, layer: int, neighbors: list[int]) -> None:
+        if layer == 0:
+            self._links0[node, : len(neighbors)] = neighbors
+            self._degree0[node] = len(neighbors)
+        else:
+            self._upper[layer - 1][node] = list(neighbors)
+
+    def _search_layer(
+        self,
+        query: np.ndarray,
+        entry: list[int],
+        ef: int,
+        layer: int,
+        allowed: np.ndarray | None = None,
+    ) -> list[tuple[float, int]]:
+        """Beam search of one layer. Returns (cosine, slot) pairs, best first."""
+        vectors = self._vectors
+        visited = set(entry)
+        sims = (vectors[entry] @ query).tolist()
+        candidates = [(-sim, node) for sim, node in zip(sims, entry, strict=True)]
+        heapq.heapify(candidates)
+        nearest = [
+            (sim, node)
+            for sim, node in zip(sims, entry, strict=True)
+            if allowed is None or allowed[node]
+        ]
+        heapq.heapify(nearest)
+
+        while candidates:
+            neg_sim, node = heapq.heappop(candidates)
+            if len(nearest) >= ef and -neg_sim < nearest[0][0]:
+                break
+            neighbors = [n for n in self._neighbors(node, layer) if n not in visited]
+            if not neighbors:
+                continue
+            visited.update(neighbors)
+            for sim, neighbor in zip((vectors[neighbors] @ query).tolist(), neighbors, strict=True):
+                if len(nearest) < ef or sim > nearest[0][0]:
+                    heapq.heappush(candidates, (-sim, neighbor))
+                    if allowed is None or allowed[neighbor]:
+                        heapq.heappush(nearest, (sim, neighbor))
+                        if len(nearest) > ef:
+                            heapq.heappop(nearest)
+
+        return sorted(nearest, reverse=True)
+
+    def _select(self, candidates: list[tuple[float, int]], m: int) -> list[int]:
+        """
+        Neighbor selection heuristic: skip candidates closer to an already
+        selected neighbor than to the base vector, which keeps links spread
+        out across clusters instead of all pointing into the nearest one.
+        """
+        selected: list[int] = []
+        for sim, node in candidates:
+            if len(selected) >= m:
+                break
+            if selected and float(np.max(self._vectors[selected] @ self._vectors[node])) > sim:
+                continue
+            selected.append(node)
+        return selected
+
+    def _grow_links(self) -> None:
+        if len(self._links0) >= self.size and self._links0.flags.writeable:
+            return
+        capacity = max(self.size, 2 * len(self._links0), 1024)
+        links = np.full((capacity, self.m0), -1, dtype=np.int32)
+        links[: len(self._links0)] = self._links0
+        degree = np.zeros(capacity, dtype=np.int32)
+        degree[: len(self._degree0)] = self._degree0
+        self._links0, self._degree0 = links, degree
+
+    def _on_add(self, slots: list[int]) -> None:
+        self._grow_links()
+        for slot in slots:
+            self._insert(slot)
+
+    def _insert(self, node: int) -> None:
+        level = int(-math.log(1.0 - self._rng.random()) * self._level_mult)
+        self._levels.append(level)
+        while len(self._upper) < level:
+            self._upper.append({})
+        for layer in range(1, level + 1):
+            self._upper[layer - 1][node] = []
+
+        if self._entry is None:
+            self._entry, self._max_level = node, level
+            return
+
+        query = self._vectors[node]
+        entry = [self._entry]
+        for layer in range(self._max_level, level, -1):
+            entry = [self._search_layer(query, entry, 1, layer)[0][1]]
+
+        for layer in range(min(level, self._max_level), -1, -1):
+            nearest = self._search_layer(query, entry, self.ef_construction, layer)
+            neighbors = self._select(nearest, self.m)
+            self._set_neighbors(node, layer, neighbors)
+
+            capacity = self.m0 if layer == 0 else self.m
+            for other in neighbors:
+                links = [*self._neighbors(other, layer), node]
+                if len(links) > capacity:
+                    sims = (self._vectors[links] @ self._vectors[other]).tolist()
+                    links = self._select(
+                        sorted(zip(sims, links, strict=True), reverse=True), capacity
+                    )
+                self._set_neighbors(other, layer, links)
+            entry = [n for _, n in nearest]
+
+        if level > self._max_level:
+            self._entry, self._max_level = node, level
+
+    # ---------------------------------------------------------------- search
+
+    def _search(self, query: np.ndarray, k: int, allowed: np.ndarray) -> list[tuple[int, float]]:
+        allowed_count = int(allowed.sum())
+        if (
+            self._entry is None
+            or allowed_count <= max(k, self.exact_threshold)
+            or allowed_count < self.size * self.exact_selectivity
+        ):
+            return self.exact_search(query, k, allowed)
+
+        entry = [self._entry]
+        for layer in range(self._max_level, 0, -1):
+            entry = [self._search_layer(query, entry, 1, layer)[0][1]]
+        nearest = self._search_layer(query, entry, max(self.ef_search, k), 0, allowed)
+        return [(node, sim) for sim, node in nearest[:k]]
+
+    # ----------------------------------------------------------- persistence
+
+    def _save_extra(self, path: Path) -> None:
+        save_array(path / "links0.npy", np.ascontiguousarray(self._links0[: self.size]))
+        save_array(path / "degree0.npy", self._degree0[: self.size])
+        save_array(path / "levels.npy", np.array(self._levels, dtype=np.int8))
+        graph = {
+            "entry": self._entry,
+            "max_level": self._max_level,
+            "upper": [{str(node): links for node, links in layer.items()} for layer in self._upper],
+        }
+        tmp = path / "graph.json.tmp"
+        tmp.write_text(json.dumps(graph))
+        tmp.replace(path / "graph.json")
+
+    def _load_extra(self, path: Path, mmap: bool) -> None:
+        self._links0 = load_array(path / "links0.npy", mmap)
+        self._degree0 = load_array(path / "degree0.npy", mmap)
+        self._levels = load_array(path / "levels.npy", mmap=False).tolist()
+        graph = json.loads((path / "graph.json").read_text())
+        self._entry = graph["entry"]
+        self._max_level = graph["max_level"]
+        self._upper = [
+            {int(node): links for node, links in layer.items()} for layer in graph["upper"]
+        ]
@@ -0,0 +1,476 @@
+"""Local vector search over the chunks collection.
+
+With VECTOR_SEARCH_BACKEND=exact or hnsw, semantic_search answers queries from
+an in-process index instead of Atlas $vectorSearch:
+
+1. Chunk-level filters are evaluated against chunk fields cached in the index
+   (everything except content and embeddings), and RLS against the document
+   ids the user can read (the same access filter the Atlas pipelines apply,
+   queried from MongoDB on every search so sharing changes apply immediately).
+2. The index returns the top chunks among the allowed ones.
+3. Content, titles and sources are fetched from MongoDB by id (titles and
+   sources of older chunks through the document header cache).
+
+The index is kept current by ingestion hooks in this process and, when MongoDB
+runs as a replica set, by a change stream on the chunks collection (picking up
+writes from other processes and scripts). On startup it is loaded from
+VECTOR_INDEX_PATH and reconciled with the collection by id, so only chunks
+added or deleted while the server was down are processed.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import bson
+import numpy as np
+from app.capabilities.retrieval.mongo_rag.config import config
+from app.capabilities.retrieval.mongo_rag.document_headers import attach_document_headers
+from app.capabilities.retrieval.mongo_rag.quantization import FULL_PRECISION_FIELD, decode_vector
+from app.capabilities.retrieval.mongo_rag.vector_index.base import VectorIndex
+from app.capabilities.retrieval.mongo_rag.vector_index.exact import ExactVectorIndex
+from app.capabilities.retrieval.mongo_rag.vector_index.filters import matches_filter
+from app.capabilities.retrieval.mongo_rag.vector_index.hnsw import HNSWVectorIndex
+from bson import ObjectId, json_util
+from pymongo import AsyncMongoClient
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+VECTOR_SEARCH_BACKENDS = ("atlas", "exact", "hnsw")
+_INDEX_TYPES: dict[str, type[VectorIndex]] = {"exact": ExactVectorIndex, "hnsw": HNSWVectorIndex}
+
+# Chunk fields not cached for filtering
+_UNCACHED_FIELDS = ("_id", "content", "embedding", FULL_PRECISION_FIELD)
+_SYNC_BATCH_SIZE = 1000
+_FILTER_CACHE_SIZE = 64
+# Compact on save once this fraction of slots is tombstoned
+_COMPACT_RATIO = 0.25
+
+
+def chunk_vector(chunk: dict[str, Any]) -> list[float] | None:
+    """Best available embedding of a chunk (the full-precision copy if stored)."""
+    value = chunk.get(FULL_PRECISION_FIELD)
+    if value is None:
+        value = chunk.get("embedding")
+    return decode_vector(value) if value is not None else None
+
+
+def _as_object_id(chunk_id: str) -> ObjectId | str:
+    return ObjectId(chunk_id) if ObjectId.is_valid(chunk_id) else chunk_id
+
+
+class LocalVectorSearch:
+    """An in-process vector index of the chunks collection plus the chunk fields filters need."""
+
+    def __init__(self, index: VectorIndex, path: str | Path | None = None):
+        """
+        Initialize local vector search.
+
+        Args:
+            index: Empty index, or one loaded together with ``fields``
+            path: Directory the index is saved to (None: not persisted)
+        """
+        self.index = index
+        self.path = Path(path) if path else None
+        self._fields: list[dict[str, Any]] = []  # cached chunk fields, per slot
+        self._documents: list[str] = []  # parent document id, per slot
+        self._version = 0
+        self._codes_version = -1
+        self._document_codes: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._code_of: dict[str, int] = {}
+        self._masks: dict[str, np.ndarray] = {}
+        self._masks_version = -1
+        self._dirty = False
+        self._watch_task: asyncio.Task | None = None
+
+    # ------------------------------------------------------------ lifecycle
+
+    @classmethod
+    def open(
+        cls, backend: str, dims: int, path: str | Path | None = None, **params: Any
+    ) -> "LocalVectorSearch":
+        """
+        Load the index saved at ``path``, or create an empty one.
+
+        A saved index of another backend or dimension is ignored (and replaced on
+        the next save), so changing either setting rebuilds the index.
+        """
+        if backend not in _INDEX_TYPES:
+            raise ValueError(f"Unknown local vector index '{backend}', expected exact or hnsw")
+        index_type = _INDEX_TYPES[backend]
+        if path and (Path(path) / "index.json").exists():
+            try:
+                index = index_type.load(path)
+                fields = bson.decode_all((Path(path) / "fields.bson").read_bytes())
+                if index.dims == dims and len(fields) == index.size:
+                    search = cls(index, path)
+                    search._fields = fields
+                    search._documents = [str(f.get("document_id")) for f in fields]
+                    logger.info(f"vector_index_loaded: path={path}, chunks={len(index)}")
+                    return search
+                logger.warning(f"vector_index_mismatch: path={path}, rebuilding")
+            except (OSError, ValueError, KeyError, bson.errors.BSONError):
+                logger.exception(f"vector_index_load_failed: path={path}, rebuilding")
+        return cls(index_type(dims, **params), path)
+
+    def save(self) -> None:
+        """Persist the index if it changed since the last save."""
+        if self.path is None or not self._dirty:
+            return
+        if self.index.tombstone_ratio > _COMPACT_RATIO:
+            kept = self.index.compact()
+            self._fields = [self._fields[slot] for slot in kept]
+            self._documents = [self._documents[slot] for slot in kept]
+            self._version += 1
+        self.index.save(self.path)
+        tmp = self.path / "fields.bson.tmp"
+        tmp.write_bytes(b"".join(bson.encode(fields) for fields in self._fields))
+        tmp.replace(self.path / "fields.bson")
+        self._dirty = False
+        logger.info(f"vector_index_saved: path={self.path}, chunks={len(self.index)}")
+
+    async def sync(self, collection: Any) -> dict[str, int]:
+        """
+        Reconcile the index with the chunks collection by id.
+
+        Adds chunks missing from the index and removes chunks no longer in the
+        collection. Embeddings rewritten in place (reindex_embeddings.py) are
+        only picked up by the change stream; delete the index directory to
+        rebuild after re-embedding without one.
+
+        Returns:
+            Counts of added and removed chunks
+        """
+        stored: set[str] = set()
+        missing = []
+        async for chunk in collection.find({}, {"_id": 1}):
+            chunk_id = str(chunk["_id"])
+            stored.add(chunk_id)
+            if chunk_id not in self.index:
+                missing.append(chunk["_id"])
+
+        removed = self.remove_chunks([i for i in self.index.ids if i not in stored])
+        added = 0
+        for start in range(0, len(missing), _SYNC_BATCH_SIZE):
+            batch = missing[start : start + _SYNC_BATCH_SIZE]
+            chunks = [c async for c in collection.find({"_id": {"$in": batch}}, {"content": 0})]
+            added += self.add_chunks(chunks)
+            if start // _SYNC_BATCH_SIZE % 10 == 9:
+                logger.info(f"vector_index_sync_progress: added={added}/{len(missing)}")
+
+        logger.info(
+            f"vector_index_synced: added={added}, removed={removed}, total={len(self.index)}"
+        )
+        return {"added": added, "removed": removed}
+
+    def start_watching(self, collection: Any) -> None:
+        """Follow the chunks collection's change stream in the background."""
+        if self._watch_task is None or self._watch_task.done():
+            self._watch_task = asyncio.create_task(self.watch(collection))
+
+    async def stop_watching(self) -> None:
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._watch_task
+            self._watch_task = None
+
+    async def watch(self, collection: Any) -> None:
+        """Apply chunk inserts, updates and deletes from a change stream until cancelled."""
+        try:
+            stream = await collection.watch(full_document="updateLookup")
+            async with stream:
+                logger.info("vector_index_watching_changes")
+                async for change in stream:
+                    self.apply_change(change)
+        except OperationFailure as e:
+            # Change streams need a replica set; ingestion hooks still apply
+            logger.warning(f"vector_index_change_stream_unavailable: error={e!s}")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("vector_index_change_stream_failed")
+
+    def apply_change(self, change: dict[str, Any]) -> None:
+        """Apply one change stream event."""
+        operation = change["operationType"]
+        if operation == "insert":
+            self.add_chunks([change["fullDocument"]], replace=False)
+        elif operation in ("update", "replace"):
+            if change.get("fullDocument") is not None:
+                self.add_chunks([change["fullDocument"]])
+        elif operation == "delete":
+            self.remove_chunks([str(change["documentKey"]["_id"])])
+        elif operation in ("drop", "invalidate"):
+            self.clear()
+
+    # ------------------------------------------------------------- mutation
+
+    def _changed(self) -> None:
+        self._version += 1
+        self._dirty = True
+
+    def add_chunks(self, chunks: Iterable[dict[str, Any]], replace: bool = True) -> int:
+        """
+        Index chunk documents (as stored in MongoDB, with ``_id``).
+
+        Args:
+            chunks: Chunk documents; ones without an embedding are skipped
+            replace: Re-index chunks already in the index (False skips them)
+
+        Returns:
+            Number of chunks indexed
+        """
+        ids, vectors, fields = [], [], []
+        for chunk in chunks:
+            if "_id" not in chunk:
+                continue
+            chunk_id = str(chunk["_id"])
+            vector = chunk_vector(chunk)
+            if vector is None or (not replace and chunk_id in self.index):
+                continue
+            ids.append(chunk_id)
+            vectors.append(vector)
+            fields.append({k: v for k, v in chunk.items() if k not in _UNCACHED_FIELDS})
+        if not ids:
+            return 0
+
+        self.index.add(ids, vectors)
+        self._fields.extend(fields)
+        self._documents.extend(str(f.get("document_id")) for f in fields)
+        self._changed()
+        return len(ids)
+
+    def remove_chunks(self, chunk_ids: Iterable[Any]) -> int:
+        """Remove chunks by id. Returns how many were indexed."""
+        removed = self.index.remove([str(chunk_id) for chunk_id in chunk_ids])
+        if removed:
+            self._changed()
+        return removed
+
+    def remove_documents(self, document_ids: Iterable[Any]) -> int:
+        """Remove every chunk of the given documents."""
+        targets = {str(document_id) for document_id in document_ids}
+        live = self.index.live
+        return self.remove_chunks(
+            self.index.id_of(slot)
+            for slot, document_id in enumerate(self._documents)
+            if document_id in targets and live[slot]
+        )
+
+    def clear(self) -> int:
+        return self.remove_chunks(self.index.ids)
+
+    # --------------------------------------------------------------- search
+
+    def _filter_mask(self, filter_dict: dict[str, Any] | None) -> np.ndarray | None:
+        """Slots matching a chunk-level filter (cached until the index changes)."""
+        if not filter_dict:
+            return None
+        if self._masks_version != self._version:
+            self._masks.clear()
+            self._masks_version = self._version
+        key = json_util.dumps(filter_dict, sort_keys=True)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = np.fromiter(
+                (matches_filter(fields, filter_dict) for fields in self._fields),
+                dtype=bool,
+                count=len(self._fields),
+            )
+            if len(self._masks) >= _FILTER_CACHE_SIZE:
+                self._masks.pop(next(iter(self._masks)))
+            self._masks[key] = mask
+        return mask
+
+    def _document_mask(self, allowed_documents: set[str]) -> np.ndarray:
+        """Slots whose parent document is in the allowed set."""
+        if self._codes_version != self._version:
+            codes: dict[str, int] = {}
+            self._document_codes = np.array(
+                [codes.setdefault(d, len(codes)) for d in self._documents], dtype=np.int64
+            )
+            self._code_of = codes
+            self._codes_version = self._version
+        allowed = [self._code_of[d] for d in allowed_documents if d in self._code_of]
+        return np.isin(self._document_codes, np.array(allowed, dtype=np.int64))
+
+    async def search(
+        self,
+        db: Any,
+        settings: Any,
+        query_embedding: list[float],
+        match_count: int,
+        *,
+        filter_dict: dict[str, Any] | None = None,
+        access_filter: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Semantic search with the same filters and RLS as the $vectorSearch pipeline.
+
+        Args:
+            db: Database to read chunks and documents from (the caller's connection)
+            settings: RAG settings (collection names)
+            query_embedding: Query embedding
+            match_count: Number of results
+            filter_dict: Chunk-level MongoDB filter
+            access_filter: Document RLS filter from build_access_filter ({} for admins)
+
+        Returns:
+            Result documents shaped like the $vectorSearch pipeline's output
+        """
+        documents = db[settings.mongodb_collection_documents]
+        mask = self._filter_mask(filter_dict)
+        if access_filter:
+            allowed = {str(doc["_id"]) async for doc in documents.find(access_filter, {"_id": 1})}
+            document_mask = self._document_mask(allowed)
+            mask = document_mask if mask is None else mask & document_mask
+
+        results: list[dict[str, Any]] = []
+        for _ in range(2):
+            hits = self.index.search(query_embedding, match_count, mask)
+            results, stale = await self._hydrate(db, settings, hits, access_filter)
+            if not stale:
+                break
+            # Deleted behind our back (no change stream): drop and search again
+            self.remove_chunks(stale)
+        return results
+
+    async def _hydrate(
+        self,
+        db: Any,
+        settings: Any,
+        hits: list[tuple[int, float]],
+        access_filter: dict[str, Any] | None,
+    ) -> tuple[list[dict[str, Any]], list[str]]:
+        """Fetch content and document info for hits. Returns (results, stale chunk ids)."""
+        if not hits:
+            return [], []
+        chunk_ids = [self.index.id_of(slot) for slot, _ in hits]
+        cursor = db[settings.mongodb_collection_chunks].find(
+            {"_id": {"$in": [_as_object_id(i) for i in chunk_ids]}},
+            {
+                "content": 1,
+                "metadata": 1,
+                "document_id": 1,
+                "document_title": 1,
+                "document_source": 1,
+            },
+        )
+        chunks = {str(chunk["_id"]): chunk async for chunk in cursor}
+
+        results, stale = [], []
+        for chunk_id, (_, score) in zip(chunk_ids, hits, strict=True):
+            chunk = chunks.get(chunk_id)
+            if chunk is None:
+                stale.append(chunk_id)
+                continue
+            results.append(
+                {
+                    "chunk_id": chunk["_id"],
+                    "document_id": chunk["document_id"],
+                    "content": chunk["content"],
+                    "similarity": score,
+                    "metadata": chunk.get("metadata", {}),
+                    "document_title": chunk.get("document_title"),
+                    "document_source": chunk.get("document_source"),
+                }
+            )
+        # Drops results whose parent document is missing or not readable
+        results = await attach_document_headers(db, settings, results, access_filter)
+        return results, stale
+
+
+_local_search: LocalVectorSearch | None = None
+_local_client: AsyncMongoClient | None = None
+_local_lock = asyncio.Lock()
+
+
+async def get_local_vector_search() -> LocalVectorSearch | None:
+    """
+    Return the process-wide local vector index, loading and syncing it on first use.
+
+    Returns None when VECTOR_SEARCH_BACKEND is atlas or the index could not be
+    built (semantic_search then uses $vectorSearch).
+    """
+    global _local_search, _local_client
+    if config.vector_search_backend == "atlas":
+        return None
+    async with _local_lock:
+        if _local_search is None:
+            client = AsyncMongoClient(config.mongodb_uri, serverSelectionTimeoutMS=5000)
+            try:
+                collection = client[config.mongodb_database][config.mongodb_collection_chunks]
+                search = LocalVectorSearch.open(
+                    config.vector_search_backend,
+                    config.embedding_dimension,
+                    config.vector_index_path or None,
+                    **(
+                        {
+                            "m": config.vector_index_hnsw_m,
+                            "ef_construction": config.vector_index_hnsw_ef_construction,
+                            "ef_search": config.vector_index_hnsw_ef_search,
+                        }
+                        if config.vector_search_backend == "hnsw"
+                        else {}
+                    ),
+                )
+                await search.sync(collection)
+                search.save()
+                if config.vector_index_watch_changes:
+                    search.start_watching(collection)
+                _local_search, _local_client = search, client
+            except Exception:
+                logger.exception("vector_index_startup_failed")
+                return None
+            finally:
+                # Also reached when the first caller is cancelled mid-sync
+                if _local_client is not client:
+                    await client.close()
+    return _local_search
+
+
+def notify_chunks_inserted(chunks: list[dict[str, Any]]) -> None:
+    """Ingestion hook: index chunks just inserted into MongoDB (no-op without a local index)."""
+    if _local_search is None:
+        return
+    try:
+        _local_search.add_chunks(chunks, replace=False)
+    except Exception:
+        logger.exception("vector_index_add_failed")
+
+
+def notify_chunks_deleted(chunk_ids: list[Any]) -> None:
+    """Ingestion hook: drop chunks deleted from MongoDB (no-op without a local index)."""
+    if _local_search is None:
+        return
+    _local_search.remove_chunks(chunk_ids)
+
+
+def notify_documents_deleted(document_ids: list[Any] | None) -> None:
+    """Ingestion hook: drop the chunks of deleted documents (None: all chunks)."""
+    if _local_search is None:
+        return
+    if document_ids is None:
+        _local_search.clear()
+    else:
+        _local_search.remove_documents(document_ids)
+
+
+async def shutdown_local_vector_search() -> None:
+    """Stop following changes and save the index (called on application shutdown)."""
+    global _local_search, _local_client
+    if _local_search is not None:
+        await _local_search.stop_watching()
+        try:
+            _local_search.save()
+        except OSError:
+            logger.exception("vector_index_save_failed")
+        _local_search = None
+    if _local_client is not None:
+        await _local_client.close()
+        _local_client = None
@@ -70,6 +70,9 @@ class ParseRepositoryRequest(BaseModel):
     """Request model for parsing a GitHub repository."""
 
     repo_url: str = Field(..., description="GitHub repository URL (must end with .git)")
+    incremental: bool = Field(
+        False, description="Only re-parse files whose content changed since the last index"
+    )
 
 
 class ParseRepositoryResponse(BaseModel):
@@ -78,6 +81,7 @@ class ParseRepositoryResponse(BaseModel):
     success: bool
     message: str
     repo_url: str
+    stats: dict[str, Any] | None = None
 
 
 # Script Validation
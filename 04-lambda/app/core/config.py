@@ -87,6 +87,68 @@ class Settings(BaseSettings):
     embedding_base_url: str = "http://ollama:11434/v1"
     embedding_api_key: str = "not-needed"
     embedding_dimension: int = 2560
+    # Chunk embedding storage: "float" (BSON double array), "float32", "int8" or
+    # "binary" (BSON binary vectors). Quantized modes (int8, binary) keep a float32
+    # copy for rescoring unless disabled. The vector index must match; see
+    # 01-data/mongodb/scripts/setup_search_indexes.py and quantize_embeddings.py.
+    embedding_storage: str = Field("float", env="EMBEDDING_STORAGE")
+    embedding_keep_full_precision: bool = Field(True, env="EMBEDDING_KEEP_FULL_PRECISION")
+    # Candidates fetched per requested result before full-precision rescoring
+    embedding_rescore_factor: int = Field(4, env="EMBEDDING_RESCORE_FACTOR")
+    # Semantic search backend: "atlas" ($vectorSearch) or an in-process index of
+    # the chunks collection, "exact" (NumPy brute force) or "hnsw" (approximate
+    # graph). Local indexes are saved under VECTOR_INDEX_PATH (empty: memory only),
+    # memory-mapped on startup and followed via a change stream when available.
+    vector_search_backend: str = Field("atlas", env="VECTOR_SEARCH_BACKEND")
+    vector_index_path: str = Field("/app/data/vector_index", env="VECTOR_INDEX_PATH")
+    vector_index_watch_changes: bool = Field(True, env="VECTOR_INDEX_WATCH_CHANGES")
+    vector_index_hnsw_m: int = Field(16, env="VECTOR_INDEX_HNSW_M")
+    vector_index_hnsw_ef_construction: int = Field(100, env="VECTOR_INDEX_HNSW_EF_CONSTRUCTION")
+    vector_index_hnsw_ef_search: int = Field(64, env="VECTOR_INDEX_HNSW_EF_SEARCH")
+    # Text search: plan each query onto phrase/identifier/keyword operators and use
+    # fuzzy matching only when that finds too few chunks. Disable the planner to send
+    # every query as one fuzzy text query (text_index without the code/title fields).
+    text_search_planner: bool = Field(True, env="TEXT_SEARCH_PLANNER")
+    text_search_fuzzy_fallback: bool = Field(True, env="TEXT_SEARCH_FUZZY_FALLBACK")
+    text_search_fuzzy_max_edits: int = Field(1, env="TEXT_SEARCH_FUZZY_MAX_EDITS")
+    # Hybrid search: fuse semantic, text and Graphiti results with weighted "rrf"
+    # (rank based) or "score" (min-max normalized scores). Semantic results weigh
+    # 1 - text weight. Sources still running at their deadline (ms, 0: none) are
+    # left out of the fusion.
+    hybrid_fusion: str = Field("rrf", env="HYBRID_FUSION")
+    hybrid_text_weight: float = Field(0.3, env="HYBRID_TEXT_WEIGHT")
+    hybrid_graphiti_weight: float = Field(0.5, env="HYBRID_GRAPHITI_WEIGHT")
+    hybrid_search_timeout_ms: int = Field(10000, env="HYBRID_SEARCH_TIMEOUT_MS")
+    hybrid_graphiti_timeout_ms: int = Field(2000, env="HYBRID_GRAPHITI_TIMEOUT_MS")
+    # Search results take title/source from the chunk (denormalized at ingestion);
+    # RLS fields and titles of older chunks come from a per-process LRU of document
+    # headers. The TTL bounds how long sharing changes made elsewhere take to apply.
+    document_header_cache_size: int = Field(10000, env="DOCUMENT_HEADER_CACHE_SIZE")
+    document_header_cache_ttl_seconds: float = Field(60.0, env="DOCUMENT_HEADER_CACHE_TTL_SECONDS")
+    # Chunker for content ingested without a DoclingDocument (crawled pages, scraped
+    # markdown): "markdown" packs heading sections, fences, lists and tables to the
+    # token budget; "simple" is the legacy character sliding window.
+    fallback_chunker: str = Field("markdown", env="FALLBACK_CHUNKER")
+    # Code example summaries (USE_AGENTIC_RAG): LLM calls in flight per ingestion,
+    # a persistent cache keyed by model, code and context (code_summaries collection),
+    # and up to CODE_SUMMARY_BATCH_SIZE blocks of at most CODE_SUMMARY_BATCH_MAX_CHARS
+    # summarized in one JSON prompt (1: one call per block).
+    code_summary_concurrency: int = Field(4, env="CODE_SUMMARY_CONCURRENCY")
+    code_summary_cache: bool = Field(True, env="CODE_SUMMARY_CACHE")
+    code_summary_batch_size: int = Field(4, env="CODE_SUMMARY_BATCH_SIZE")
+    code_summary_batch_max_chars: int = Field(800, env="CODE_SUMMARY_BATCH_MAX_CHARS")
+    # Batch topic classification of conversations (classify-topics/batch and /backfill):
+    # results are cached by conversation content hash (topic_classifications collection).
+    # Conversations at least TOPIC_CENTROID_THRESHOLD (cosine) similar to the centroid of
+    # a known topic (topic_centroids collection, TOPIC_CENTROID_MIN_EXAMPLES labelled
+    # conversations or more) take it without an LLM call; the rest are sent to the LLM
+    # TOPIC_LLM_BATCH_SIZE to a JSON prompt. TOPIC_TEXT_MAX_CHARS of each conversation
+    # are embedded and prompted.
+    topic_centroid_threshold: float = Field(0.8, env="TOPIC_CENTROID_THRESHOLD")
+    topic_centroid_min_examples: int = Field(3, env="TOPIC_CENTROID_MIN_EXAMPLES")
+    topic_llm_batch_size: int = Field(8, env="TOPIC_LLM_BATCH_SIZE")
+    topic_llm_concurrency: int = Field(2, env="TOPIC_LLM_CONCURRENCY")
+    topic_text_max_chars: int = Field(4000, env="TOPIC_TEXT_MAX_CHARS")
 
     # Neo4j / Graphiti
     neo4j_uri: str = Field("bolt://neo4j:7687", env="NEO4J_URI")
@@ -105,12 +167,45 @@ class Settings(BaseSettings):
     use_reranking: bool = Field(False, env="USE_RERANKING")
     use_knowledge_graph: bool = Field(False, env="USE_KNOWLEDGE_GRAPH")
 
+    # Repository parser (knowledge graph ingestion)
+    # Rows per UNWIND write transaction, and AST parser processes (0 = CPU count)
+    repo_parser_batch_size: int = Field(1000, env="REPO_PARSER_BATCH_SIZE")
+    repo_parser_workers: int = Field(0, env="REPO_PARSER_WORKERS")
+    # Keep clones here between runs and refresh them with a shallow fetch
+    repo_parser_clone_cache_dir: str | None = Field(None, env="REPO_PARSER_CLONE_CACHE_DIR")
+    # Validate scripts against an in-memory symbol index instead of per-lookup Cypher
+    kg_validator_in_memory: bool = Field(True, env="KG_VALIDATOR_IN_MEMORY")
+
+    # Graphiti ingestion: run enrichment on a background worker pool after the MongoDB write
+    graphiti_ingestion_background: bool = Field(True, env="GRAPHITI_INGESTION_BACKGROUND")
+    graphiti_ingestion_workers: int = Field(2, env="GRAPHITI_INGESTION_WORKERS")
+    graphiti_ingestion_queue_size: int = Field(100, env="GRAPHITI_INGESTION_QUEUE_SIZE")
+    graphiti_ingestion_dedup_cache_size: int = Field(
+        10000, env="GRAPHITI_INGESTION_DEDUP_CACHE_SIZE"
+    )
+    # Fact-extraction chunks in flight per document (episodes are added in order);
+    # bulk-submit chapter episodes
+    graphiti_episode_concurrency: int = Field(4, env="GRAPHITI_EPISODE_CONCURRENCY")
+    graphiti_bulk_episodes: bool = Field(True, env="GRAPHITI_BULK_EPISODES")
+
     # Entity extraction configuration
     enable_entity_extraction: bool = Field(False, env="ENABLE_ENTITY_EXTRACTION")
     entity_extractor_type: str = Field("hybrid", env="ENTITY_EXTRACTOR_TYPE")
     entity_llm_threshold: float = Field(0.7, env="ENTITY_LLM_THRESHOLD")
     ner_model: str = Field("Jean-Baptiste/roberta-large-ner-english", env="NER_MODEL")
 
+    # Local models (reranker, NER, tokenizer) are loaded once per process by the model
+    # registry (app/core/model_registry.py). MODEL_WARMUP lists kinds ("reranker,ner")
+    # or kind:name entries to load at startup. Inference runs on a shared pool
+    # (0 workers: CPU count). Models idle for MODEL_IDLE_EVICT_SECONDS (0: never) or
+    # beyond MODEL_MEMORY_BUDGET_MB (0: no limit, least recently used first) are evicted.
+    reranker_model: str = Field("cross-encoder/ms-marco-MiniLM-L-6-v2", env="RERANKER_MODEL")
+    tokenizer_model: str = Field("sentence-transformers/all-MiniLM-L6-v2", env="TOKENIZER_MODEL")
+    model_warmup: str = Field("", env="MODEL_WARMUP")
+    model_inference_workers: int = Field(0, env="MODEL_INFERENCE_WORKERS")
+    model_idle_evict_seconds: float = Field(0.0, env="MODEL_IDLE_EVICT_SECONDS")
+    model_memory_budget_mb: int = Field(0, env="MODEL_MEMORY_BUDGET_MB")
+
     # Jira configuration
     jira_server: str | None = Field(None, env="JIRA_SERVER")
     jira_email: str | None = Field(None, env="JIRA_EMAIL")
@@ -133,6 +228,9 @@ class Settings(BaseSettings):
     )
     google_calendar_token_path: str | None = Field(None, env="GOOGLE_CALENDAR_TOKEN_PATH")
     google_calendar_id: str = Field("primary", env="GOOGLE_CALENDAR_ID")
+    # Incremental sync (calendar_sync/services/sync_engine.py): events per page when
+    # pulling changes with sync tokens (API maximum 2500)
+    google_calendar_sync_page_size: int = Field(250, env="GOOGLE_CALENDAR_SYNC_PAGE_SIZE")
 
     # N8n Workflow Management
     n8n_api_url: str = Field("http://n8n:5678/api/v1", env="N8N_API_URL")
@@ -151,6 +249,42 @@ class Settings(BaseSettings):
     supabase_db_url: str = Field("", env="SUPABASE_DB_URL")
     supabase_service_key: str | None = Field(None, env="SUPABASE_SERVICE_KEY")
 
+    # Resolved preferences are cached per user (app/services/preferences/cache.py) for
+    # PREFERENCES_CACHE_TTL_SECONDS (0: no cache), up to PREFERENCES_CACHE_SIZE users.
+    # PREFERENCES_LISTEN invalidates entries on writes from other workers via
+    # LISTEN preferences_changed (migration 013).
+    preferences_cache_ttl_seconds: float = Field(300.0, env="PREFERENCES_CACHE_TTL_SECONDS")
+    preferences_cache_size: int = Field(1000, env="PREFERENCES_CACHE_SIZE")
+    preferences_listen: bool = Field(True, env="PREFERENCES_LISTEN")
+
+    # Data view browsing (/api/v1/data/*, app/interfaces/http/data_browser.py): each
+    # request is cut off after DATA_VIEW_TIMEOUT_SECONDS, and Neo4j neighbourhoods
+    # expand at most DATA_VIEW_NEO4J_DEGREE_CAP neighbours/relationships per node.
+    data_view_timeout_seconds: float = Field(5.0, env="DATA_VIEW_TIMEOUT_SECONDS")
+    data_view_neo4j_degree_cap: int = Field(50, env="DATA_VIEW_NEO4J_DEGREE_CAP")
+
+    # Outbound notifications (app/services/notifications): callers enqueue into the
+    # NOTIFICATION_COLLECTION outbox and NOTIFICATION_WORKERS background workers post
+    # to each configured target (Discord, n8n webhooks) at most
+    # NOTIFICATION_RATE_PER_MINUTE times a minute. Messages wait
+    # NOTIFICATION_COALESCE_SECONDS so bursts go out as one digest of up to
+    # NOTIFICATION_MAX_BATCH messages. Failed posts are retried with exponential
+    # backoff (NOTIFICATION_RETRY_BASE_SECONDS doubling up to
+    # NOTIFICATION_RETRY_MAX_SECONDS) until NOTIFICATION_MAX_ATTEMPTS.
+    notification_discord_webhook_url: str | None = Field(
+        None, env="NOTIFICATION_DISCORD_WEBHOOK_URL"
+    )
+    notification_n8n_webhook_url: str | None = Field(None, env="NOTIFICATION_N8N_WEBHOOK_URL")
+    notification_collection: str = Field("notification_outbox", env="NOTIFICATION_COLLECTION")
+    notification_workers: int = Field(2, env="NOTIFICATION_WORKERS")
+    notification_rate_per_minute: float = Field(30.0, env="NOTIFICATION_RATE_PER_MINUTE")
+    notification_coalesce_seconds: float = Field(2.0, env="NOTIFICATION_COALESCE_SECONDS")
+    notification_max_batch: int = Field(10, env="NOTIFICATION_MAX_BATCH")
+    notification_max_attempts: int = Field(8, env="NOTIFICATION_MAX_ATTEMPTS")
+    notification_retry_base_seconds: float = Field(2.0, env="NOTIFICATION_RETRY_BASE_SECONDS")
+    notification_retry_max_seconds: float = Field(600.0, env="NOTIFICATION_RETRY_MAX_SECONDS")
+    notification_timeout_seconds: float = Field(10.0, env="NOTIFICATION_TIMEOUT_SECONDS")
+
     @property
     def effective_supabase_db_url(self) -> str:
         """Get effective Supabase DB URL, constructing from POSTGRES_PASSWORD if needed."""
@@ -0,0 +1,390 @@
+"""Process-wide registry for local ML models (reranker, NER, tokenizers).
+
+Cross-encoders, NER pipelines and tokenizers are large and slow to load. The
+registry loads each model once per process, on first use or from a warm-up
+list at startup, and shares it across capabilities:
+
+- Models are keyed ``kind:name`` (``reranker:cross-encoder/ms-marco-MiniLM-L-6-v2``);
+  loaders for each kind are registered in ``LOADERS``
+- Inference runs through one shared thread pool sized to the CPU cores, one
+  call per model at a time (torch already parallelizes a single call across
+  cores, concurrent calls on the same model only contend). Calls wait for their
+  model on the event loop, so pool threads only ever run inference and calls on
+  other models are not held up behind them
+- Models idle for ``MODEL_IDLE_EVICT_SECONDS`` are evicted, and the least
+  recently used ones are evicted while loaded models exceed
+  ``MODEL_MEMORY_BUDGET_MB``. Models in use and pinned models (tokenizers,
+  which chunkers keep references to) are never evicted
+- stats() reports load time, parameter memory and the process RSS growth
+  measured around each load; it is included in ``GET /health``
+
+Callers must not keep references to evictable models: fetch them per call with
+get()/run() so eviction actually frees the memory.
+"""
+
+import asyncio
+import functools
+import gc
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODELS = {
+    "reranker": lambda: settings.reranker_model,
+    "ner": lambda: settings.ner_model,
+    "tokenizer": lambda: settings.tokenizer_model,
+}
+# Model kinds whose instances are held by long-lived objects and can't be evicted
+PINNED_KINDS = {"tokenizer"}
+
+
+def _load_reranker(name: str) -> Any:
+    from sentence_transformers import CrossEncoder
+
+    return CrossEncoder(name)
+
+
+def _load_ner(name: str) -> Any:
+    from transformers import pipeline
+
+    return pipeline("ner", model=name, aggregation_strategy="simple")
+
+
+def _load_tokenizer(name: str) -> Any:
+    from transformers import AutoTokenizer
+
+    return AutoTokenizer.from_pretrained(name)
+
+
+LOADERS: dict[str, Callable[[str], Any]] = {
+    "reranker": _load_reranker,
+    "ner": _load_ner,
+    "tokenizer": _load_tokenizer,
+}
+
+
+def model_key(kind: str, name: str | None = None) -> str:
+    """Registry key for a model; ``name`` defaults to the configured model of ``kind``."""
+    if kind not in LOADERS:
+        raise ValueError(f"Unknown model kind: {kind}")
+    return f"{kind}:{name or DEFAULT_MODELS[kind]()}"
+
+
+def _rss_bytes() -> int | None:
+    """Current resident set size (Linux), or None where /proc is unavailable."""
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _parameter_bytes(model: Any) -> int:
+    """Bytes held by torch parameters and buffers of a model, pipeline or cross-encoder."""
+    module = getattr(model, "model", model)
+    if not hasattr(module, "parameters"):
+        return 0
+    tensors = [*module.parameters(), *module.buffers()]
+    return sum(t.numel() * t.element_size() for t in tensors)
+
+
+@dataclass
+class ModelEntry:
+    """A loaded (or loading) model and its accounting."""
+
+    key: str
+    model: Any = None
+    pinned: bool = False
+    load_seconds: float = 0.0
+    parameter_bytes: int = 0
+    rss_delta_bytes: int | None = None
+    loaded_at: float = 0.0
+    last_used: float = 0.0
+    in_use: int = 0
+    calls: int = 0
+    load_lock: threading.Lock = field(default_factory=threading.Lock)
+    # Serializes run() calls; recreated for each event loop the registry is used from
+    run_lock: asyncio.Lock | None = None
+    run_lock_loop: asyncio.AbstractEventLoop | None = None
+
+    def lock_for(self, loop: asyncio.AbstractEventLoop) -> asyncio.Lock:
+        if self.run_lock is None or self.run_lock_loop is not loop:
+            self.run_lock, self.run_lock_loop = asyncio.Lock(), loop
+        return self.run_lock
+
+    @property
+    def loaded(self) -> bool:
+        return self.model is not None
+
+    @property
+    def memory_bytes(self) -> int:
+        return max(self.parameter_bytes, self.rss_delta_bytes or 0)
+
+
+class ModelRegistry:
+    """Loads, shares, runs and evicts local models."""
+
+    def __init__(
+        self,
+        workers: int = 0,
+        idle_evict_seconds: float = 0.0,
+        memory_budget_bytes: int = 0,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            workers: Inference threads (0: CPU count)
+            idle_evict_seconds: Evict models unused for this long (0: never)
+            memory_budget_bytes: Evict least recently used models above this (0: no limit)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.idle_evict_seconds = idle_evict_seconds
+        self.memory_budget_bytes = memory_budget_bytes
+        self._entries: dict[str, ModelEntry] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="model-inference"
+        )
+        self._evictions = 0
+        self._eviction_task: asyncio.Task | None = None
+
+    def _entry(self, key: str) -> ModelEntry:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                kind = key.split(":", 1)[0]
+                entry = self._entries[key] = ModelEntry(key, pinned=kind in PINNED_KINDS)
+            return entry
+
+    def get(self, key: str) -> Any:
+        """
+        Return the model for ``key``, loading it on first use (blocking).
+
+        Raises whatever the loader raises (missing package, unknown model).
+        """
+        entry = self._entry(key)
+        entry.last_used = time.monotonic()
+        # Read the model once: evict() may reset entry.model at any time
+        model = entry.model
+        if model is not None:
+            return model
+        with entry.load_lock:
+            model = entry.model
+            if model is None:
+                model = self._load(entry)
+        self._enforce_budget(keep=key)
+        return model
+
+    def _load(self, entry: ModelEntry) -> Any:
+        kind, name = entry.key.split(":", 1)
+        logger.info(f"Loading model {entry.key}")
+        rss_before = _rss_bytes()
+        start = time.perf_counter()
+        model = LOADERS[kind](name)
+        entry.load_seconds = time.perf_counter() - start
+        rss_after = _rss_bytes()
+        entry.rss_delta_bytes = (
+            max(0, rss_after - rss_before) if rss_before is not None and rss_after else None
+        )
+        try:
+            entry.parameter_bytes = _parameter_bytes(model)
+        except Exception:
+            entry.parameter_bytes = 0
+        entry.loaded_at = entry.last_used = time.monotonic()
+        entry.model = model
+        logger.info(
+            f"Loaded model {entry.key} in {entry.load_seconds:.1f}s "
+            f"({entry.memory_bytes / 2**20:.0f} MiB)"
+        )
+        return model
+
+    async def aget(self, key: str) -> Any:
+        """Async get(): loads in the inference pool instead of blocking the event loop."""
+        entry = self._entry(key)
+        model = entry.model
+        if model is not None:
+            entry.last_used = time.monotonic()
+            return model
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.get, key)
+
+    async def run(self, key: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run ``fn(model, *args, **kwargs)`` in the shared inference pool.
+
+        Calls on the same model are serialized before they reach the pool; the
+        model can't be evicted while a call is queued or running, and the call
+        keeps the model it started with.
+        """
+        entry = self._entry(key)
+        with self._lock:
+            entry.in_use += 1
+        loop = asyncio.get_running_loop()
+        try:
+            async with entry.lock_for(loop):
+                model = await self.aget(key)
+                entry.calls += 1
+                return await loop.run_in_executor(
+                    self._executor, functools.partial(fn, model, *args, **kwargs)
+                )
+        finally:
+            with self._lock:
+                entry.in_use -= 1
+                entry.last_used = time.monotonic()
+
+    async def warm_up(self, keys: list[str]) -> None:
+        """Load models ahead of first use; failures are logged, not raised."""
+        for key in keys:
+            try:
+                await self.aget(key)
+            except Exception:
+                logger.exception(f"Model warm-up failed for {key}")
+
+    def evict(self, key: str) -> bool:
+        """Drop a loaded model unless it is pinned or in use."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.model is None or entry.pinned or entry.in_use:
+                return False
+            entry.model = None
+            self._evictions += 1
+        gc.collect()
+        logger.info(f"Evicted model {key}")
+        return True
+
+    def evict_idle(self) -> list[str]:
+        """Evict models unused for longer than idle_evict_seconds."""
+        if self.idle_evict_seconds <= 0:
+            return []
+        cutoff = time.monotonic() - self.idle_evict_seconds
+        idle = [e.key for e in list(self._entries.values()) if e.loaded and e.last_used < cutoff]
+        return [key for key in idle if self.evict(key)]
+
+    def _enforce_budget(self, keep: str) -> None:
+        if self.memory_budget_bytes <= 0:
+            return
+        loaded = sorted(
+            (e for e in list(self._entries.values()) if e.loaded and e.key != keep),
+            key=lambda e: e.last_used,
+        )
+        total = sum(e.memory_bytes for e in self._entries.values() if e.loaded)
+        for entry in loaded:
+            if total <= self.memory_budget_bytes:
+                break
+            size = entry.memory_bytes
+            if self.evict(entry.key):
+                total -= size
+        if total > self.memory_budget_bytes:
+            logger.warning(
+                f"Loaded models use {total / 2**20:.0f} MiB, over the "
+                f"{self.memory_budget_bytes / 2**20:.0f} MiB budget (pinned or in use)"
+            )
+
+    def start(self) -> None:
+        """Start the idle eviction loop (needs a running event loop)."""
+        if self.idle_evict_seconds > 0 and self._eviction_task is None:
+            self._eviction_task = asyncio.create_task(self._eviction_loop())
+
+    async def _eviction_loop(self) -> None:
+        interval = max(1.0, self.idle_evict_seconds / 4)
+        while True:
+            await asyncio.sleep(interval)
+            self.evict_idle()
+
+    async def shutdown(self) -> None:
+        """Stop the eviction loop and the inference pool."""
+        if self._eviction_task is not None:
+            self._eviction_task.cancel()
+            self._eviction_task = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, Any]:
+        """Per-model load time, memory and usage, plus totals."""
+        now = time.monotonic()
+        models = {}
+        for entry in list(self._entries.values()):
+            models[entry.key] = {
+                "loaded": entry.loaded,
+                "pinned": entry.pinned,
+                "load_seconds": round(entry.load_seconds, 3),
+                "parameter_mb": round(entry.parameter_bytes / 2**20, 1),
+                "rss_delta_mb": (
+                    round(entry.rss_delta_bytes / 2**20, 1)
+                    if entry.rss_delta_bytes is not None
+                    else None
+                ),
+                "idle_seconds": round(now - entry.last_used, 1) if entry.last_used else None,
+                "in_use": entry.in_use,
+                "calls": entry.calls,
+            }
+        loaded = [e for e in self._entries.values() if e.loaded]
+        rss = _rss_bytes()
+        return {
+            "models": models,
+            "loaded": len(loaded),
+            "memory_mb": round(sum(e.memory_bytes for e in loaded) / 2**20, 1),
+            "memory_budget_mb": round(self.memory_budget_bytes / 2**20, 1),
+            "process_rss_mb": round(rss / 2**20, 1) if rss is not None else None,
+            "inference_workers": self.workers,
+            "evictions": self._evictions,
+        }
+
+
+_registry: ModelRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Return the process-wide model registry, creating it on first use."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry(
+                workers=settings.model_inference_workers,
+                idle_evict_seconds=settings.model_idle_evict_seconds,
+                memory_budget_bytes=settings.model_memory_budget_mb * 2**20,
+            )
+    return _registry
+
+
+def warmup_keys(spec: str) -> list[str]:
+    """
+    Parse a MODEL_WARMUP list: ``kind`` (configured model) or ``kind:name`` entries.
+
+    Example: ``"reranker,tokenizer,ner:dslim/bert-base-NER"``.
+    """
+    keys = []
+    for item in (part.strip() for part in spec.split(",")):
+        if not item:
+            continue
+        kind, _, name = item.partition(":")
+        try:
+            keys.append(model_key(kind, name or None))
+        except ValueError:
+            logger.warning(f"Ignoring unknown model kind in MODEL_WARMUP: {item}")
+    return keys
+
+
+async def start_model_registry() -> None:
+    """Start idle eviction and warm up MODEL_WARMUP models (called on application startup)."""
+    registry = get_model_registry()
+    registry.start()
+    await registry.warm_up(warmup_keys(settings.model_warmup))
+
+
+async def shutdown_model_registry() -> None:
+    """Stop the process-wide registry (called on application shutdown)."""
+    global _registry
+    if _registry is not None:
+        await _registry.shutdown()
+        _registry = None
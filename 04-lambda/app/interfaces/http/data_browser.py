@@ -0,0 +1,305 @@
+"""Cursor-based browsing of MinIO, MongoDB and Neo4j for the data view endpoints.
+
+Each browse function returns one page and an opaque ``next_cursor`` (None on the
+last page) to pass back for the following page. A cursor is URL-safe base64 JSON
+holding the store's position and a digest of the listing it belongs to (store,
+user, prefix/collection/filter), so it cannot be replayed against another one:
+
+- MinIO: the ListObjectsV2 continuation token
+- MongoDB: the last ``_id`` of the page (keyset on ``_id``, newest first)
+- Neo4j: the last node's element id (keyset on ``elementId``). A user's graph is
+  their User node's neighbourhood up to two hops, expanding at most
+  ``degree_cap`` neighbours per node, and each node lists at most ``degree_cap``
+  outgoing relationships (``out_degree`` has the full count).
+
+Every call is cut off after ``timeout`` seconds: by the database where it
+supports it (maxTimeMS, Neo4j transaction timeout) and by asyncio.wait_for.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import re
+from collections.abc import Awaitable
+from typing import Any, TypeVar
+from uuid import UUID
+
+from bson import json_util
+from neo4j import Query
+from neo4j.exceptions import ClientError as Neo4jClientError
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.errors import ExecutionTimeout
+
+from app.services.storage.minio import MinIOClient, S3Object
+
+T = TypeVar("T")
+
+LABEL_PATTERN = r"^[A-Za-z_][A-Za-z0-9_]*$"
+
+
+class CursorError(ValueError):
+    """A cursor that is malformed or was issued for a different listing."""
+
+
+class BrowseTimeoutError(Exception):
+    """A browse request ran past its timeout."""
+
+
+def _scope_digest(scope: dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(scope, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def encode_cursor(scope: dict[str, Any], position: Any) -> str:
+    """Opaque cursor for ``position`` within the listing described by ``scope``."""
+    payload = json.dumps({"s": _scope_digest(scope), "p": position}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None, scope: dict[str, Any]) -> Any:
+    """Position stored in ``cursor`` (None without a cursor); raises CursorError."""
+    if not cursor:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        digest, position = payload["s"], payload["p"]
+    except (ValueError, TypeError, KeyError) as e:
+        raise CursorError("Malformed cursor") from e
+    if digest != _scope_digest(scope):
+        raise CursorError("Cursor belongs to a different listing")
+    return position
+
+
+async def _bounded(operation: Awaitable[T], timeout: float) -> T:
+    try:
+        return await asyncio.wait_for(operation, timeout)
+    except (asyncio.TimeoutError, ExecutionTimeout) as e:
+        raise BrowseTimeoutError(f"Timed out after {timeout:g}s") from e
+    except Neo4jClientError as e:
+        if "TransactionTimedOut" in (e.code or ""):
+            raise BrowseTimeoutError(f"Timed out after {timeout:g}s") from e
+        raise
+
+
+# ========== MinIO ==========
+
+
+async def browse_storage(
+    client: MinIOClient,
+    user_id: UUID | None,
+    prefix: str | None,
+    *,
+    limit: int,
+    cursor: str | None,
+    timeout: float,
+) -> tuple[list[S3Object], str | None]:
+    """
+    One page of stored files.
+
+    Args:
+        client: MinIO client
+        user_id: User whose files to list, or None for every user's files
+        prefix: Optional key prefix (within the user folder when user_id is set)
+        limit: Maximum number of objects to list for the page
+        cursor: next_cursor of the previous page
+        timeout: Seconds before the request is abandoned
+
+    Returns:
+        The page's files and the cursor for the next page
+    """
+    scope = {"store": "minio", "user": str(user_id) if user_id else None, "prefix": prefix or ""}
+    token = decode_cursor(cursor, scope)
+    files, next_token = await _bounded(
+        client.list_files_page(user_id, prefix, max_keys=limit, continuation_token=token),
+        timeout,
+    )
+    return files, encode_cursor(scope, next_token) if next_token else None
+
+
+# ========== MongoDB ==========
+
+
+async def browse_collection(
+    collection: AsyncCollection,
+    query_filter: dict[str, Any],
+    *,
+    limit: int,
+    cursor: str | None,
+    timeout: float,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """
+    One page of documents, newest ``_id`` first.
+
+    Pages continue from the last ``_id`` seen (``_id < last``) on the _id index,
+    so every page costs the same however deep it is.
+
+    Args:
+        collection: Collection to read
+        query_filter: Filter applied to every page
+        limit: Documents per page
+        cursor: next_cursor of the previous page
+        timeout: Seconds before the query is abandoned
+
+    Returns:
+        The page's documents and the cursor for the next page
+    """
+    scope = {
+        "store": "mongodb",
+        "collection": collection.name,
+        "filter": json_util.dumps(query_filter),
+    }
+    after = decode_cursor(cursor, scope)
+    page_filter = query_filter
+    if after is not None:
+        try:
+            last_id = json_util.loads(after)
+        except (ValueError, TypeError) as e:
+            raise CursorError("Malformed cursor") from e
+        keyset = {"_id": {"$lt": last_id}}
+        page_filter = {"$and": [query_filter, keyset]} if query_filter else keyset
+
+    find = (
+        collection.find(page_filter, max_time_ms=int(timeout * 1000))
+        .sort("_id", -1)
+        .limit(limit + 1)
+    )
+    documents = await _bounded(find.to_list(length=limit + 1), timeout)
+    if len(documents) <= limit:
+        return documents, None
+    documents = documents[:limit]
+    return documents, encode_cursor(scope, json_util.dumps(documents[-1]["_id"]))
+
+
+# ========== Neo4j ==========
+
+# Nodes of the page: all nodes (optionally of one label) for admins ...
+_ALL_NODES = """
+MATCH (n{label})
+WHERE $after IS NULL OR elementId(n) > $after
+WITH n ORDER BY elementId(n) LIMIT $limit
+"""
+
+# ... or the user's neighbourhood, at most degree_cap neighbours per expanded node
+_USER_NODES = """
+MATCH (u:User {email: $email})
+CALL {
+    WITH u
+    MATCH (u)--(a)
+    WITH DISTINCT a LIMIT $degree_cap
+    RETURN collect(a) AS hop1
+}
+CALL {
+    WITH hop1
+    UNWIND hop1 AS a
+    CALL {
+        WITH a
+        MATCH (a)--(b)
+        WITH DISTINCT b LIMIT $degree_cap
+        RETURN b
+    }
+    RETURN collect(DISTINCT b) AS hop2
+}
+UNWIND [u] + hop1 + hop2 AS n
+WITH DISTINCT n
+WHERE ($label IS NULL OR $label IN labels(n)) AND ($after IS NULL OR elementId(n) > $after)
+WITH n ORDER BY elementId(n) LIMIT $limit
+"""
+
+# Then up to degree_cap outgoing relationships per node
+_NODE_RELATIONSHIPS = """
+CALL {
+    WITH n
+    MATCH (n)-[r]->()
+    WITH r LIMIT $degree_cap
+    RETURN collect(r) AS relationships
+}
+RETURN n, relationships, COUNT { (n)-->() } AS out_degree
+ORDER BY elementId(n)
+"""
+
+
+def _plain(properties) -> dict[str, Any]:
+    """Properties with Neo4j temporal values as ISO strings."""
+    return {
+        key: value.iso_format() if hasattr(value, "iso_format") else value
+        for key, value in dict(properties).items()
+    }
+
+
+async def browse_graph(
+    driver,
+    *,
+    email: str | None,
+    label: str | None,
+    limit: int,
+    cursor: str | None,
+    degree_cap: int,
+    timeout: float,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], str | None]:
+    """
+    One page of graph nodes with their outgoing relationships.
+
+    Args:
+        driver: Neo4j async driver
+        email: Browse this user's neighbourhood, or the whole graph when None
+        label: Only nodes with this label (optional)
+        limit: Nodes per page
+        cursor: next_cursor of the previous page
+        degree_cap: Neighbours expanded and relationships returned per node
+        timeout: Seconds before the transaction is abandoned
+
+    Returns:
+        Node dicts (id, labels, properties, out_degree), relationship dicts
+        (id, type, start_node_id, end_node_id, properties) and the next cursor
+    """
+    if label is not None and not re.match(LABEL_PATTERN, label):
+        raise ValueError(f"Invalid label: {label!r}")
+    scope = {"store": "neo4j", "email": email, "label": label}
+    after = decode_cursor(cursor, scope)
+
+    if email is None:
+        nodes_query = _ALL_NODES.format(label=f":`{label}`" if label else "")
+    else:
+        nodes_query = _USER_NODES
+    query = Query(nodes_query + _NODE_RELATIONSHIPS, timeout=timeout)
+    parameters = {
+        "email": email,
+        "label": label,
+        "after": after,
+        "limit": limit + 1,
+        "degree_cap": degree_cap,
+    }
+
+    async def fetch() -> list:
+        async with driver.session() as session:
+            result = await session.run(query, parameters)
+            return [record async for record in result]
+
+    records = await _bounded(fetch(), timeout)
+    next_cursor = None
+    if len(records) > limit:
+        records = records[:limit]
+        next_cursor = encode_cursor(scope, records[-1]["n"].element_id)
+
+    nodes, relationships = [], []
+    for record in records:
+        node = record["n"]
+        nodes.append(
+            {
+                "id": node.element_id,
+                "labels": sorted(node.labels),
+                "properties": _plain(node),
+                "out_degree": record["out_degree"],
+            }
+        )
+        relationships.extend(
+            {
+                "id": rel.element_id,
+                "type": rel.type,
+                "start_node_id": rel.start_node.element_id,
+                "end_node_id": rel.end_node.element_id,
+                "properties": _plain(rel),
+            }
+            for rel in record["relationships"]
+        )
+    return nodes, relationships, next_cursor
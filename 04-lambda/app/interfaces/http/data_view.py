@@ -1,16 +1,26 @@
 """Data viewing API endpoints for all storage layers."""
 
+import json
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 from uuid import UUID
 
+from bson import json_util
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from pymongo import AsyncMongoClient
+from app.interfaces.http.data_browser import (
+    LABEL_PATTERN,
+    BrowseTimeoutError,
+    CursorError,
+    browse_collection,
+    browse_graph,
+    browse_storage,
+)
 from app.services.auth.config import config
 from app.services.auth.dependencies import User, get_current_user
 from app.services.auth.services.auth_service import AuthService
-from app.services.auth.services.minio_service import MinIOService
 from app.services.auth.services.supabase_service import SupabaseService
 from app.services.database.neo4j import Neo4jClient
 from app.services.database.supabase import SupabaseClient, SupabaseConfig
@@ -40,6 +50,7 @@ class StorageDataResponse(BaseModel):
     count: int
     prefix: str | None = None
     user_id: str
+    next_cursor: str | None = None
 
 
 class SupabaseItemResponse(BaseModel):
@@ -68,6 +79,7 @@ class Neo4jNodeResponse(BaseModel):
     id: str
     labels: list[str]
     properties: dict[str, Any]
+    out_degree: int | None = None
 
 
 class Neo4jRelationshipResponse(BaseModel):
@@ -88,6 +100,7 @@ class Neo4jDataResponse(BaseModel):
     node_count: int
     relationship_count: int
     node_type: str | None = None
+    next_cursor: str | None = None
 
 
 class MongoDBDocumentResponse(BaseModel):
@@ -104,8 +117,7 @@ class MongoDBDataResponse(BaseModel):
     collection: str
     documents: list[MongoDBDocumentResponse]
     count: int
-    page: int = 1
-    per_page: int = 100
+    next_cursor: str | None = None
 
 
 # Helper Functions
@@ -120,9 +132,13 @@ async def get_supabase_service() -> SupabaseClient:
     return SupabaseClient(config)
 
 
-async def get_neo4j_service() -> Neo4jClient:
-    """Get Neo4jClient instance."""
-    return Neo4jClient()
+async def get_neo4j_service() -> AsyncIterator[Neo4jClient]:
+    """Get Neo4jClient instance (closed after the request)."""
+    client = Neo4jClient()
+    try:
+        yield client
+    finally:
+        await client.close()
 
 
 async def get_minio_service() -> MinIOClient:
@@ -131,35 +147,52 @@ async def get_minio_service() -> MinIOClient:
     return MinIOClient(minio_config)
 
 
-async def get_mongodb_client() -> AsyncMongoClient:
-    """Get MongoDB client instance."""
-    return AsyncMongoClient(settings.mongodb_uri)
+async def get_mongodb_client() -> AsyncIterator[AsyncMongoClient]:
+    """Get MongoDB client instance (closed after the request)."""
+    client = AsyncMongoClient(settings.mongodb_uri)
+    try:
+        yield client
+    finally:
+        await client.close()
+
+
+def _browse_error(e: Exception) -> HTTPException:
+    """HTTP error for a rejected cursor (400) or a timed out browse request (504)."""
+    if isinstance(e, CursorError):
+        return HTTPException(status_code=400, detail=str(e))
+    return HTTPException(status_code=504, detail=f"Data view request timed out: {e!s}")
 
 
 # Endpoints
 @router.get("/storage", response_model=StorageDataResponse)
 async def view_storage_data(
     prefix: str | None = Query(None, description="Prefix to filter files (e.g., 'loras/')"),
+    limit: int = Query(100, ge=1, le=1000, description="Files per page"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
     user: User = Depends(get_current_user),
     auth_service: AuthService = Depends(get_auth_service),
-    minio_service: MinIOService = Depends(get_minio_service),
+    minio_service: MinIOClient = Depends(get_minio_service),
 ):
     """
     View MinIO/blob storage files for the authenticated user.
 
     **Query Parameters:**
     - `prefix` (optional): Filter files by prefix (e.g., "loras/" for LoRA models)
+    - `limit` (default: 100, max: 1000): Files per page
+    - `cursor` (optional): `next_cursor` from the previous page
 
     **Response:**
-    Returns list of files with metadata. Admin users see all files from all users.
+    Returns one page of files with metadata and `next_cursor` (null on the last
+    page). Admin users see all files from all users.
 
     **Example Usage:**
     ```bash
     # List all files
     curl http://localhost:8000/api/v1/data/storage
 
-    # List files with prefix
+    # List files with prefix, then the next page
     curl "http://localhost:8000/api/v1/data/storage?prefix=loras/"
+    curl "http://localhost:8000/api/v1/data/storage?prefix=loras/&cursor=<next_cursor>"
     ```
     """
     try:
@@ -170,64 +203,35 @@ async def view_storage_data(
     is_admin = await auth_service.is_admin(user.email)
 
     try:
-        if is_admin:
-            # Admin users: list all files from all user folders
-            # We need to list all objects and filter by user prefix pattern
-            s3_client = minio_service._get_s3_client()
-            bucket_name = "user-data"
-
-            import asyncio
-
-            loop = asyncio.get_event_loop()
-
-            def list_all_objects():
-                response = s3_client.list_objects_v2(
-                    Bucket=bucket_name, Prefix=prefix if prefix else "", MaxKeys=1000
-                )
-                return response.get("Contents", [])
-
-            objects = await loop.run_in_executor(None, list_all_objects)
-
-            # Filter out .keep files
-            files = []
-            for obj in objects:
-                if obj["Key"].endswith("/.keep"):
-                    continue
-
-                # Extract user_id from key (format: user-{uuid}/...)
-                key_parts = obj["Key"].split("/")
-                if len(key_parts) > 0 and key_parts[0].startswith("user-"):
-                    key_parts[0][5:]  # Remove 'user-' prefix
-                    filename = "/".join(key_parts[1:]) if len(key_parts) > 1 else key_parts[0]
-                else:
-                    continue
-
-                files.append(
-                    StorageFileResponse(
-                        key=obj["Key"],
-                        filename=filename,
-                        size=obj["Size"],
-                        last_modified=obj["LastModified"].isoformat(),
-                        etag=obj["ETag"].strip('"'),
-                    )
-                )
-        else:
-            # Regular users: list only their files
-            files_data = await minio_service.list_files(user_id=user_id, prefix=prefix)
-            files = [
-                StorageFileResponse(
-                    key=file_dict["key"],
-                    filename=file_dict["filename"],
-                    size=file_dict["size"],
-                    last_modified=file_dict["last_modified"],
-                    etag=file_dict["etag"],
-                )
-                for file_dict in files_data
-            ]
+        # Admin users: files from every user folder
+        files_data, next_cursor = await browse_storage(
+            minio_service,
+            None if is_admin else user_id,
+            prefix,
+            limit=limit,
+            cursor=cursor,
+            timeout=settings.data_view_timeout_seconds,
+        )
+        files = [
+            StorageFileResponse(
+                key=file.key,
+                filename=file.filename,
+                size=file.size,
+                last_modified=file.last_modified,
+                etag=file.etag,
+            )
+            for file in files_data
+        ]
 
         return StorageDataResponse(
-            files=files, count=len(files), prefix=prefix, user_id=str(user_id)
+            files=files,
+            count=len(files),
+            prefix=prefix,
+            user_id=str(user_id),
+            next_cursor=next_cursor,
         )
+    except (CursorError, BrowseTimeoutError) as e:
+        raise _browse_error(e) from e
     except Exception as e:
         logger.exception("Failed to list storage files")
         raise HTTPException(status_code=500, detail=f"Failed to list files: {e!s}") from e
@@ -355,7 +359,11 @@ async def view_supabase_data(
 
 @router.get("/neo4j", response_model=Neo4jDataResponse)
 async def view_neo4j_data(
-    node_type: str | None = Query(None, description="Filter by node type/label (e.g., 'Document')"),
+    node_type: str | None = Query(
+        None, pattern=LABEL_PATTERN, description="Filter by node type/label (e.g., 'Document')"
+    ),
+    limit: int = Query(100, ge=1, le=1000, description="Nodes per page"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
     user: User = Depends(get_current_user),
     auth_service: AuthService = Depends(get_auth_service),
     neo4j_service: Neo4jClient = Depends(get_neo4j_service),
@@ -365,9 +373,14 @@ async def view_neo4j_data(
 
     **Query Parameters:**
     - `node_type` (optional): Filter by node type/label (e.g., "Document", "User")
+    - `limit` (default: 100, max: 1000): Nodes per page
+    - `cursor` (optional): `next_cursor` from the previous page
 
     **Response:**
-    Returns nodes and relationships. Admin users see all nodes.
+    Returns one page of nodes with up to DATA_VIEW_NEO4J_DEGREE_CAP outgoing
+    relationships each (`out_degree` is the full count) and `next_cursor`.
+    Regular users see their User node's neighbourhood (two hops, at most
+    DATA_VIEW_NEO4J_DEGREE_CAP neighbours expanded per node). Admin users see all nodes.
 
     **Example Usage:**
     ```bash
@@ -382,89 +395,26 @@ async def view_neo4j_data(
     driver = await neo4j_service._get_driver()
 
     try:
-        async with driver.session() as session:
-            # Build query based on admin status and node type filter
-            if is_admin:
-                if node_type:
-                    query = f"""
-                        MATCH (n:{node_type})
-                        OPTIONAL MATCH (n)-[r]->(m)
-                        RETURN n, labels(n) as labels, r, startNode(r) as start_node, endNode(r) as end_node
-                        LIMIT 1000
-                    """
-                else:
-                    query = """
-                        MATCH (n)
-                        OPTIONAL MATCH (n)-[r]->(m)
-                        RETURN n, labels(n) as labels, r, startNode(r) as start_node, endNode(r) as end_node
-                        LIMIT 1000
-                    """
-            # Regular user: anchor to user node
-            elif node_type:
-                query = f"""
-                        MATCH (u:User {{email: $email}})
-                        OPTIONAL MATCH (u)-[*0..2]-(n:{node_type})
-                        OPTIONAL MATCH (n)-[r]->(m)
-                        WHERE n IS NOT NULL
-                        RETURN DISTINCT n, labels(n) as labels, r, startNode(r) as start_node, endNode(r) as end_node
-                        LIMIT 1000
-                    """
-            else:
-                query = """
-                        MATCH (u:User {email: $email})
-                        OPTIONAL MATCH (u)-[*0..2]-(n)
-                        OPTIONAL MATCH (n)-[r]->(m)
-                        WHERE n IS NOT NULL
-                        RETURN DISTINCT n, labels(n) as labels, r, startNode(r) as start_node, endNode(r) as end_node
-                        LIMIT 1000
-                    """
-
-            result = await session.run(query, email=user.email)
-            records = await result.values()
-
-            nodes = []
-            relationships = []
-            seen_node_ids = set()
-            seen_rel_ids = set()
-
-            for record in records:
-                node = record[0]
-                labels = record[1] if len(record) > 1 else []
-                rel = record[2] if len(record) > 2 else None
-                start_node = record[3] if len(record) > 3 else None
-                end_node = record[4] if len(record) > 4 else None
-
-                # Process node
-                if node and node.id not in seen_node_ids:
-                    seen_node_ids.add(node.id)
-                    nodes.append(
-                        Neo4jNodeResponse(
-                            id=str(node.id),
-                            labels=list(labels) if labels else [],
-                            properties=dict(node) if node else {},
-                        )
-                    )
-
-                # Process relationship
-                if rel and rel.id not in seen_rel_ids:
-                    seen_rel_ids.add(rel.id)
-                    relationships.append(
-                        Neo4jRelationshipResponse(
-                            id=str(rel.id),
-                            type=rel.type if hasattr(rel, "type") else "",
-                            start_node_id=str(start_node.id) if start_node else "",
-                            end_node_id=str(end_node.id) if end_node else "",
-                            properties=dict(rel) if rel else {},
-                        )
-                    )
+        nodes, relationships, next_cursor = await browse_graph(
+            driver,
+            email=None if is_admin else user.email,
+            label=node_type,
+            limit=limit,
+            cursor=cursor,
+            degree_cap=settings.data_view_neo4j_degree_cap,
+            timeout=settings.data_view_timeout_seconds,
+        )
 
-            return Neo4jDataResponse(
-                nodes=nodes,
-                relationships=relationships,
-                node_count=len(nodes),
-                relationship_count=len(relationships),
-                node_type=node_type,
-            )
+        return Neo4jDataResponse(
+            nodes=[Neo4jNodeResponse(**node) for node in nodes],
+            relationships=[Neo4jRelationshipResponse(**rel) for rel in relationships],
+            node_count=len(nodes),
+            relationship_count=len(relationships),
+            node_type=node_type,
+            next_cursor=next_cursor,
+        )
+    except (CursorError, BrowseTimeoutError) as e:
+        raise _browse_error(e) from e
     except Exception as e:
         logger.exception("Failed to fetch Neo4j data")
         raise HTTPException(status_code=500, detail=f"Failed to fetch data: {e!s}") from e
@@ -473,8 +423,8 @@ async def view_neo4j_data(
 @router.get("/mongodb", response_model=MongoDBDataResponse)
 async def view_mongodb_data(
     collection: str = Query("documents", description="Collection name to query"),
-    page: int = Query(1, ge=1, description="Page number"),
-    per_page: int = Query(100, ge=1, le=1000, description="Documents per page"),
+    limit: int = Query(100, ge=1, le=1000, description="Documents per page"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
     user: User = Depends(get_current_user),
     auth_service: AuthService = Depends(get_auth_service),
     mongo_client: AsyncMongoClient = Depends(get_mongodb_client),
@@ -484,11 +434,12 @@ async def view_mongodb_data(
 
     **Query Parameters:**
     - `collection` (default: "documents"): Collection name to query
-    - `page` (default: 1): Page number (1-indexed)
-    - `per_page` (default: 100, max: 1000): Documents per page
+    - `limit` (default: 100, max: 1000): Documents per page
+    - `cursor` (optional): `next_cursor` from the previous page
 
     **Response:**
-    Returns paginated documents from the specified collection.
+    Returns one page of documents from the specified collection, newest first,
+    and `next_cursor` (null on the last page).
     Filters by user_id or user_email fields if present. Admin users see all documents.
 
     **Example Usage:**
@@ -497,7 +448,7 @@ async def view_mongodb_data(
     curl http://localhost:8000/api/v1/data/mongodb
 
     # List documents from specific collection with pagination
-    curl "http://localhost:8000/api/v1/data/mongodb?collection=memory_messages&page=1&per_page=50"
+    curl "http://localhost:8000/api/v1/data/mongodb?collection=memory_messages&limit=50"
     ```
     """
     is_admin = await auth_service.is_admin(user.email)
@@ -520,31 +471,32 @@ async def view_mongodb_data(
                 ]
             }
 
-        # Calculate skip
-        skip = (page - 1) * per_page
-
-        # Query documents
-        cursor = coll.find(query_filter).skip(skip).limit(per_page).sort("_id", -1)
-        documents = await cursor.to_list(length=per_page)
-
-        # Get total count
-        total_count = await coll.count_documents(query_filter)
+        # Keyset pagination on _id
+        documents, next_cursor = await browse_collection(
+            coll,
+            query_filter,
+            limit=limit,
+            cursor=cursor,
+            timeout=settings.data_view_timeout_seconds,
+        )
 
-        # Format documents
+        # Format documents (BSON values such as ObjectId as extended JSON)
         formatted_docs = []
         for doc in documents:
             doc_id = str(doc.pop("_id", ""))
+            data = json.loads(json_util.dumps(doc))
             formatted_docs.append(
-                MongoDBDocumentResponse(id=doc_id, collection=collection, data=doc)
+                MongoDBDocumentResponse(id=doc_id, collection=collection, data=data)
             )
 
         return MongoDBDataResponse(
             collection=collection,
             documents=formatted_docs,
-            count=total_count,
-            page=page,
-            per_page=per_page,
+            count=len(formatted_docs),
+            next_cursor=next_cursor,
         )
+    except (CursorError, BrowseTimeoutError) as e:
+        raise _browse_error(e) from e
     except Exception as e:
         logger.exception("Failed to fetch MongoDB data")
         raise HTTPException(status_code=500, detail=f"Failed to fetch data: {e!s}") from e
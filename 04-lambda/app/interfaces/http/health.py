@@ -6,6 +6,7 @@ from fastapi import APIRouter, HTTPException
 from pymongo import AsyncMongoClient
 
 from app.core.config import settings
+from app.core.model_registry import get_model_registry
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -13,8 +14,12 @@ logger = logging.getLogger(__name__)
 
 @router.get("/health")
 async def health():
-    """Basic health check."""
-    return {"status": "healthy", "service": "lambda-server"}
+    """Basic health check, with load time and memory of local models."""
+    return {
+        "status": "healthy",
+        "service": "lambda-server",
+        "models": get_model_registry().stats(),
+    }
 
 
 @router.get("/health/mongodb")
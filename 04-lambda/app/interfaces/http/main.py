@@ -27,7 +27,7 @@ setup_logging(settings.log_level)
 logger = logging.getLogger(__name__)
 
 # Setup FastMCP server first (needed for lifespan)
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from app.interfaces.mcp.server import mcp
 
@@ -87,11 +87,87 @@ async def lifespan(app: FastAPI):
         logger.exception("Database validation error during startup")
         # Don't fail startup - let requests handle the error
 
+    # Load/sync the local vector index in the background (VECTOR_SEARCH_BACKEND=exact/hnsw)
+    import asyncio
+
+    from app.capabilities.retrieval.mongo_rag.vector_index.service import (
+        get_local_vector_search,
+        shutdown_local_vector_search,
+    )
+
+    vector_index_task = asyncio.create_task(get_local_vector_search())
+
+    # Warm up MODEL_WARMUP models in the background and start idle model eviction
+    from app.core.model_registry import shutdown_model_registry, start_model_registry
+
+    model_warmup_task = asyncio.create_task(start_model_registry())
+
+    # Deliver queued outbound notifications (Discord, n8n) in the background
+    from app.services.notifications import (
+        shutdown_notification_dispatcher,
+        start_notification_dispatcher,
+    )
+
+    notification_task = asyncio.create_task(start_notification_dispatcher())
+
+    # Sync Open WebUI chats into the RAG store periodically (OPENWEBUI_SYNC_INTERVAL_SECONDS)
+    from app.workflows.ingestion.openwebui_export.services.sync import (
+        shutdown_conversation_sync,
+        start_conversation_sync,
+    )
+
+    openwebui_sync_task = asyncio.create_task(start_conversation_sync())
+
     # Run MCP lifespan startup
     async with mcp_app.lifespan(app):
         yield
 
+    # Save the local vector index
+    vector_index_task.cancel()
+    await shutdown_local_vector_search()
+
+    # Stop model eviction and the shared inference pool
+    model_warmup_task.cancel()
+    await shutdown_model_registry()
+
+    # Close the preference change listener connection
+    from app.services.preferences.cache import shutdown_preference_listener
+
+    await shutdown_preference_listener()
+
+    # Close the ComfyUI run tracker websocket (the router is optional)
+    try:
+        from app.capabilities.legacy_projects.comfyui_workflow.router import (
+            shutdown_comfyui_service,
+        )
+
+        await shutdown_comfyui_service()
+    except ImportError:
+        pass
+
+    # Stop the Open WebUI sync; the next run resumes from the stored watermarks
+    openwebui_sync_task.cancel()
+    await shutdown_conversation_sync()
+
+    # Stop notification delivery; undelivered notifications stay in the outbox
+    notification_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await notification_task
+    await shutdown_notification_dispatcher()
+
+    # Close pooled MinIO connections
+    from app.services.storage.minio.s3 import close_http_session
+
+    await close_http_session()
+
     # Shutdown
+    # Stop background Graphiti ingestion without waiting for the backlog
+    from app.capabilities.retrieval.graphiti_rag.ingestion.queue import (
+        shutdown_graphiti_ingestion_queue,
+    )
+
+    await shutdown_graphiti_ingestion_queue(drain=False)
+
     # Cleanup database validation service
     if hasattr(app.state, "db_validation_service"):
         await app.state.db_validation_service.close()
@@ -532,6 +608,7 @@ from app.services.external.discord_bot_config.router import router as discord_bo
 
 # Preferences router
 from app.services.preferences.router import router as preferences_router
+from app.services.storage.minio.router import router as minio_router
 from app.workflows.automation.n8n_workflow.router import router as n8n_workflow_router
 from app.workflows.chat.conversation.router import router as conversation_router
 from app.workflows.ingestion.crawl4ai_rag.router import router as crawl4ai_rag_router
@@ -540,6 +617,7 @@ from app.workflows.ingestion.crawl4ai_rag.router import router as crawl4ai_rag_r
 from app.workflows.ingestion.youtube_rag.router import router as youtube_rag_router
 
 from app.interfaces.http.admin import router as admin_router
+from app.interfaces.http.data_view import router as data_view_router
 from app.interfaces.http.health import router as health_router
 from app.interfaces.http.stack_health import router as stack_health_router
 
@@ -564,6 +642,12 @@ app.include_router(preferences_router)
 # =============================================================================
 app.include_router(mongodb_router)  # prefix: /api/v1/data/mongodb
 app.include_router(neo4j_router)  # prefix: /api/v1/data/neo4j
+app.include_router(data_view_router, prefix="/api/v1/data", tags=["data"])
+
+# =============================================================================
+# Storage Routes (/api/v1/storage/*)
+# =============================================================================
+app.include_router(minio_router, prefix="/api/v1/storage")  # /api/v1/storage/minio
 
 # =============================================================================
 # Admin Routes (/api/v1/admin/*)
@@ -136,6 +136,54 @@ async def search_knowledge_base(
         raise RuntimeError(f"Database operation failed: {e}") from e
 
 
+@mcp.tool
+async def batch_search_knowledge_base(
+    queries: list[dict[str, Any]],
+    dedupe: bool = False,
+) -> dict:
+    """
+    Run several knowledge base searches in one call.
+
+    Much cheaper than calling search_knowledge_base once per query: all queries
+    are embedded in a single request and searched concurrently.
+
+    Args:
+        queries: 1-20 queries. Each is an object with 'query' (required) and
+                optional 'match_count', 'search_type' ('semantic', 'text' or
+                'hybrid'), 'project_scope', 'tags' and 'source_type' filters.
+                Query texts must be unique.
+        dedupe: If true, each chunk is returned only for the query where it
+               ranks highest. Default: False.
+
+    Returns:
+        Dictionary with results keyed by query text (each with results array and
+        count) and the total count.
+    """
+    from app.capabilities.retrieval.mongo_rag.dependencies import AgentDependencies
+    from app.capabilities.retrieval.mongo_rag.models import BatchSearchRequest
+    from app.capabilities.retrieval.mongo_rag.router import search_batch
+
+    try:
+        request = BatchSearchRequest(queries=queries, dedupe=dedupe)
+
+        deps = AgentDependencies.from_settings()
+        await deps.initialize()
+        try:
+            result = await search_batch(request, deps)
+            return result.dict()
+        finally:
+            await deps.cleanup()
+
+    except ValidationError as e:
+        logger.warning(
+            "mcp_validation_error: batch_search_knowledge_base", extra={"errors": e.errors()}
+        )
+        raise ValueError(f"Invalid parameters: {e}") from e
+    except (ConnectionFailure, OperationFailure) as e:
+        logger.exception("mcp_database_error: batch_search_knowledge_base", extra={"error": str(e)})
+        raise RuntimeError(f"Database operation failed: {e}") from e
+
+
 @mcp.tool
 async def agent_query(query: str) -> dict:
     """
@@ -293,7 +341,7 @@ async def search_graphiti(query: str, match_count: int = 10) -> dict:
 
 
 @mcp.tool
-async def parse_github_repository(repo_url: str) -> dict:
+async def parse_github_repository(repo_url: str, incremental: bool = False) -> dict:
     """
     Parse a GitHub repository into the Neo4j knowledge graph for code structure analysis.
 
@@ -303,6 +351,8 @@ async def parse_github_repository(repo_url: str) -> dict:
     Args:
         repo_url: GitHub repository URL (e.g., 'https://github.com/user/repo.git').
                  Must end with .git.
+        incremental: Only re-parse files whose content changed since the last index
+                    (default: False, full rebuild).
 
     Returns:
         Dictionary containing parse results.
@@ -311,7 +361,7 @@ async def parse_github_repository(repo_url: str) -> dict:
     from capabilities.retrieval.graphiti_rag.router import parse_github_repository_endpoint
 
     try:
-        request = ParseRepositoryRequest(repo_url=repo_url)
+        request = ParseRepositoryRequest(repo_url=repo_url, incremental=incremental)
         result = await parse_github_repository_endpoint(request)
         return result.dict()
     except ValidationError as e:
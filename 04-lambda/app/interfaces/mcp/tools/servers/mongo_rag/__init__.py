@@ -1,7 +1,13 @@
 """MCP tools for mongo_rag server."""
 
 from .agent_query import agent_query
+from .batch_search_knowledge_base import batch_search_knowledge_base
 from .ingest_documents import ingest_documents
 from .search_knowledge_base import search_knowledge_base
 
-__all__ = ["agent_query", "ingest_documents", "search_knowledge_base"]
+__all__ = [
+    "agent_query",
+    "batch_search_knowledge_base",
+    "ingest_documents",
+    "search_knowledge_base",
+]
@@ -0,0 +1,27 @@
+"""Run several knowledge base searches in one call. All queries are embedded in a single request and searched concurrently."""
+
+from typing import Any
+
+from server.mcp.servers.client import call_mcp_tool
+
+
+async def batch_search_knowledge_base(
+    queries: list[dict[str, Any]], dedupe: bool | None = False
+) -> dict:
+    """
+    Run several knowledge base searches in one call. All queries are embedded in a single request and searched concurrently.
+
+    Args:
+        queries (list): 1-20 queries. Each is an object with 'query' (required) and optional 'match_count', 'search_type', 'project_scope', 'tags' and 'source_type'. Required.
+        dedupe (bool): If true, each chunk is returned only for the query where it ranks highest. Default: False.
+
+    Returns:
+        Tool response as dictionary.
+    """
+    return await call_mcp_tool(
+        "batch_search_knowledge_base",
+        {
+            "queries": queries,
+            "dedupe": dedupe,
+        },
+    )
@@ -1,12 +1,13 @@
 """Google Calendar service module."""
 
-from .classes import GoogleAuth, GoogleCalendar
+from .classes import BatchOperation, GoogleAuth, GoogleCalendar
 from .classes.exceptions import (
     GoogleCalendarAuthError,
     GoogleCalendarConflictError,
     GoogleCalendarException,
     GoogleCalendarNotFoundError,
     GoogleCalendarQuotaError,
+    GoogleCalendarSyncTokenExpiredError,
 )
 from .models import CalendarEvent, CalendarEventData, SyncState
 from .service import GoogleCalendarService
@@ -16,6 +17,7 @@ __all__ = [
     "GoogleCalendar",
     "GoogleAuth",  # Use with scopes=GoogleAuth.CALENDAR_SCOPES for Calendar
     "GoogleCalendarService",
+    "BatchOperation",
     # Models
     "CalendarEvent",
     "CalendarEventData",
@@ -26,4 +28,5 @@ __all__ = [
     "GoogleCalendarNotFoundError",
     "GoogleCalendarConflictError",
     "GoogleCalendarQuotaError",
+    "GoogleCalendarSyncTokenExpiredError",
 ]
@@ -10,10 +10,12 @@ from .exceptions import (
     GoogleCalendarException,
     GoogleCalendarNotFoundError,
     GoogleCalendarQuotaError,
+    GoogleCalendarSyncTokenExpiredError,
 )
-from .google_calendar import GoogleCalendar
+from .google_calendar import BatchOperation, GoogleCalendar
 
 __all__ = [
+    "BatchOperation",
     "GoogleAuth",
     "GoogleCalendar",
     "GoogleCalendarAuthError",
@@ -21,4 +23,5 @@ __all__ = [
     "GoogleCalendarException",
     "GoogleCalendarNotFoundError",
     "GoogleCalendarQuotaError",
+    "GoogleCalendarSyncTokenExpiredError",
 ]
@@ -25,10 +25,15 @@ class GoogleCalendarQuotaError(GoogleCalendarException):
     """API quota exceeded."""
 
 
+class GoogleCalendarSyncTokenExpiredError(GoogleCalendarException):
+    """Sync token is no longer valid (HTTP 410); a full sync is required."""
+
+
 __all__ = [
     "GoogleCalendarAuthError",
     "GoogleCalendarConflictError",
     "GoogleCalendarException",
     "GoogleCalendarNotFoundError",
     "GoogleCalendarQuotaError",
+    "GoogleCalendarSyncTokenExpiredError",
 ]
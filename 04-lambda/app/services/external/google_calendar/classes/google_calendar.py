@@ -1,5 +1,6 @@
 """Google Calendar API low-level wrapper."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
@@ -13,8 +14,22 @@ from .exceptions import (
     GoogleCalendarException,
     GoogleCalendarNotFoundError,
     GoogleCalendarQuotaError,
+    GoogleCalendarSyncTokenExpiredError,
 )
 
+# events.list accepts at most 2500 results per page; Calendar batches are capped at 50 calls
+MAX_PAGE_SIZE = 2500
+MAX_BATCH_SIZE = 50
+
+
+@dataclass
+class BatchOperation:
+    """One write in a batch request: "insert", "patch" or "delete"."""
+
+    method: str
+    event_id: str | None = None
+    body: dict[str, Any] | None = None
+
 
 class GoogleCalendar:
     """Low-level wrapper for Google Calendar API operations.
@@ -23,15 +38,17 @@ class GoogleCalendar:
     and credential management.
     """
 
-    def __init__(self, authenticator: GoogleAuth):
+    def __init__(self, authenticator: GoogleAuth | None, service: Any | None = None):
         """
         Initialize API client with authenticated credentials.
 
         Args:
             authenticator: GoogleAuth instance (configured with CALENDAR_SCOPES)
+            service: Prebuilt Calendar API resource (e.g. FakeCalendarAPI for offline
+                tests); built from the authenticator's credentials when omitted
         """
         self.authenticator = authenticator
-        self._service = None
+        self._service = service
 
     @property
     def service(self):
@@ -44,24 +61,69 @@ class GoogleCalendar:
 
     def refresh_credentials_if_needed(self) -> None:
         """Refresh OAuth credentials if they are expired."""
-        self.authenticator.refresh_if_needed()
-
-    def _handle_http_error(self, e: HttpError, operation: str, resource_id: str | None = None):
-        """Convert HttpError to appropriate GoogleCalendarException."""
+        if self.authenticator is not None:
+            self.authenticator.refresh_if_needed()
+
+    @staticmethod
+    def _convert_http_error(
+        e: HttpError, operation: str, resource_id: str | None = None
+    ) -> GoogleCalendarException:
+        """Map an HttpError to the matching GoogleCalendarException."""
         status = e.resp.status
         if status == 401:
-            raise GoogleCalendarAuthError(f"Authentication failed: {e}", e)
+            return GoogleCalendarAuthError(f"Authentication failed: {e}", e)
         if status == 403:
             if "quotaExceeded" in str(e) or "rateLimitExceeded" in str(e):
-                raise GoogleCalendarQuotaError(f"API quota exceeded: {e}", e)
-            raise GoogleCalendarAuthError(f"Access forbidden: {e}", e)
+                return GoogleCalendarQuotaError(f"API quota exceeded: {e}", e)
+            return GoogleCalendarAuthError(f"Access forbidden: {e}", e)
         if status == 404:
-            raise GoogleCalendarNotFoundError(
+            return GoogleCalendarNotFoundError(
                 f"Resource not found{f': {resource_id}' if resource_id else ''}: {e}", e
             )
         if status == 409:
-            raise GoogleCalendarConflictError(f"Conflict error: {e}", e)
-        raise GoogleCalendarException(f"{operation} failed: {e}", e)
+            return GoogleCalendarConflictError(f"Conflict error: {e}", e)
+        if status == 410:
+            return GoogleCalendarNotFoundError(
+                f"Resource has been deleted{f': {resource_id}' if resource_id else ''}: {e}", e
+            )
+        return GoogleCalendarException(f"{operation} failed: {e}", e)
+
+    def _handle_http_error(self, e: HttpError, operation: str, resource_id: str | None = None):
+        """Convert HttpError to appropriate GoogleCalendarException."""
+        raise self._convert_http_error(e, operation, resource_id) from e
+
+    @staticmethod
+    def event_body(
+        summary: str | None = None,
+        start: str | None = None,
+        end: str | None = None,
+        description: str | None = None,
+        location: str | None = None,
+        timezone: str = "America/Los_Angeles",
+        attendees: list[str] | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        Build an event resource from the given fields, leaving out those that are None.
+
+        Returns:
+            Event body for insert, update or patch requests
+        """
+        body: dict[str, Any] = {}
+        if summary is not None:
+            body["summary"] = summary
+        if start is not None:
+            body["start"] = {"dateTime": start, "timeZone": timezone}
+        if end is not None:
+            body["end"] = {"dateTime": end, "timeZone": timezone}
+        if description is not None:
+            body["description"] = description
+        if location is not None:
+            body["location"] = location
+        if attendees is not None:
+            body["attendees"] = [{"email": email} for email in attendees]
+        body.update(kwargs)
+        return body
 
     def create_event(
         self,
@@ -97,21 +159,16 @@ class GoogleCalendar:
         """
         self.refresh_credentials_if_needed()
 
-        event_body = {
-            "summary": summary,
-            "start": {"dateTime": start, "timeZone": timezone},
-            "end": {"dateTime": end, "timeZone": timezone},
-        }
-
-        if description:
-            event_body["description"] = description
-        if location:
-            event_body["location"] = location
-        if attendees:
-            event_body["attendees"] = [{"email": email} for email in attendees]
-
-        # Merge any additional kwargs
-        event_body.update(kwargs)
+        event_body = self.event_body(
+            summary,
+            start,
+            end,
+            description=description or None,
+            location=location or None,
+            timezone=timezone,
+            attendees=attendees or None,
+            **kwargs,
+        )
 
         try:
             return self.service.events().insert(calendarId=calendar_id, body=event_body).execute()
@@ -230,22 +287,24 @@ class GoogleCalendar:
         calendar_id: str,
         time_min: str | datetime | None = None,
         time_max: str | datetime | None = None,
-        max_results: int = 10,
+        max_results: int | None = 10,
         single_events: bool = True,
         order_by: str = "startTime",
         query: str | None = None,
+        page_size: int = 250,
     ) -> list[dict[str, Any]]:
         """
-        List calendar events within a time range.
+        List calendar events within a time range, following result pages.
 
         Args:
             calendar_id: Calendar ID
             time_min: Start of time range (ISO format or datetime)
             time_max: End of time range (ISO format or datetime)
-            max_results: Maximum number of events to return
+            max_results: Maximum number of events to return (None: all)
             single_events: Whether to expand recurring events
             order_by: Order by field ("startTime" or "updated")
             query: Free text search query
+            page_size: Events requested per page
 
         Returns:
             List of event data dictionaries
@@ -264,7 +323,6 @@ class GoogleCalendar:
         try:
             kwargs = {
                 "calendarId": calendar_id,
-                "maxResults": max_results,
                 "singleEvents": single_events,
                 "orderBy": order_by,
             }
@@ -276,11 +334,139 @@ class GoogleCalendar:
             if query:
                 kwargs["q"] = query
 
-            result = self.service.events().list(**kwargs).execute()
-            return result.get("items", [])
+            events: list[dict[str, Any]] = []
+            page_token = None
+            while max_results is None or len(events) < max_results:
+                remaining = MAX_PAGE_SIZE if max_results is None else max_results - len(events)
+                result = (
+                    self.service.events()
+                    .list(
+                        **kwargs,
+                        maxResults=min(page_size, remaining, MAX_PAGE_SIZE),
+                        pageToken=page_token,
+                    )
+                    .execute()
+                )
+                events.extend(result.get("items", []))
+                page_token = result.get("nextPageToken")
+                if not page_token:
+                    break
+            return events if max_results is None else events[:max_results]
         except HttpError as e:
             self._handle_http_error(e, "Event listing")
 
+    def list_event_changes(
+        self,
+        calendar_id: str,
+        sync_token: str | None = None,
+        time_min: str | datetime | None = None,
+        page_size: int = 250,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        List events changed since a sync token, or all events for a full sync.
+
+        Incremental results include deleted events with status "cancelled". All
+        pages are read; the sync token for the next call comes with the last page.
+
+        Args:
+            calendar_id: Calendar ID
+            sync_token: Token from the previous call (None: full sync)
+            time_min: Lower bound of a full sync (ignored with a sync token, which
+                must not be combined with filters)
+            page_size: Events requested per page
+
+        Returns:
+            Changed events and the next sync token
+
+        Raises:
+            GoogleCalendarSyncTokenExpiredError: The token is invalid; clear local
+                state and run a full sync
+            GoogleCalendarException: If listing fails
+        """
+        self.refresh_credentials_if_needed()
+
+        kwargs: dict[str, Any] = {
+            "calendarId": calendar_id,
+            "maxResults": min(page_size, MAX_PAGE_SIZE),
+            "singleEvents": True,
+        }
+        if sync_token:
+            kwargs["syncToken"] = sync_token
+        elif time_min:
+            kwargs["timeMin"] = time_min.isoformat() if isinstance(time_min, datetime) else time_min
+
+        events: list[dict[str, Any]] = []
+        page_token = None
+        try:
+            while True:
+                result = self.service.events().list(**kwargs, pageToken=page_token).execute()
+                events.extend(result.get("items", []))
+                page_token = result.get("nextPageToken")
+                if not page_token:
+                    return events, result.get("nextSyncToken")
+        except HttpError as e:
+            if e.resp.status == 410:
+                raise GoogleCalendarSyncTokenExpiredError(f"Sync token expired: {e}", e) from e
+            self._handle_http_error(e, "Event sync")
+
+    def batch_execute(
+        self, calendar_id: str, operations: list[BatchOperation]
+    ) -> list[dict[str, Any] | GoogleCalendarException | None]:
+        """
+        Run event writes as batch requests of up to MAX_BATCH_SIZE calls each.
+
+        Each call in a batch succeeds or fails on its own, so failures are returned
+        in place of the result instead of raised.
+
+        Args:
+            calendar_id: Calendar ID
+            operations: Inserts, patches and deletes
+
+        Returns:
+            Per operation, in order: the event (insert, patch), None (delete) or
+            the GoogleCalendarException the call failed with
+        """
+        self.refresh_credentials_if_needed()
+
+        results: list[dict[str, Any] | GoogleCalendarException | None] = [None] * len(operations)
+        events = self.service.events()
+
+        def collect(request_id: str, response: Any, exception: Exception | None) -> None:
+            index = int(request_id)
+            if exception is None:
+                results[index] = response or None
+                return
+            op = operations[index]
+            if isinstance(exception, HttpError):
+                results[index] = self._convert_http_error(
+                    exception, f"Batch {op.method}", op.event_id
+                )
+            else:
+                results[index] = GoogleCalendarException(
+                    f"Batch {op.method} failed: {exception}", exception
+                )
+
+        for start in range(0, len(operations), MAX_BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=collect)
+            for index in range(start, min(start + MAX_BATCH_SIZE, len(operations))):
+                op = operations[index]
+                if op.method == "insert":
+                    request = events.insert(calendarId=calendar_id, body=op.body)
+                elif op.method == "patch":
+                    request = events.patch(
+                        calendarId=calendar_id, eventId=op.event_id, body=op.body
+                    )
+                elif op.method == "delete":
+                    request = events.delete(calendarId=calendar_id, eventId=op.event_id)
+                else:
+                    raise ValueError(f"Unknown batch method: {op.method}")
+                batch.add(request, request_id=str(index))
+            try:
+                batch.execute()
+            except HttpError as e:
+                self._handle_http_error(e, "Batch request")
+        return results
+
     def list_calendars(self) -> list[dict[str, Any]]:
         """
         List all calendars accessible to the user.
@@ -300,4 +486,4 @@ class GoogleCalendar:
             self._handle_http_error(e, "Calendar listing")
 
 
-__all__ = ["GoogleCalendar"]
+__all__ = ["MAX_BATCH_SIZE", "MAX_PAGE_SIZE", "BatchOperation", "GoogleCalendar"]
@@ -0,0 +1,286 @@
+"""In-memory stand-in for the Google Calendar API client, for offline tests and benchmarks.
+
+FakeCalendarAPI implements the subset of the googleapiclient Calendar v3
+resource the GoogleCalendar wrapper uses: events insert/get/update/patch/
+delete/list and calendarList.list, with the server-side behaviour that matters
+for sync: paging with nextPageToken, sync tokens whose incremental results
+include deleted ("cancelled") events, HTTP 410 for expired sync tokens, and
+batch requests in which each call succeeds or fails on its own. Errors are
+raised as googleapiclient HttpError, like the real client.
+
+Usage:
+    api = FakeCalendarAPI()
+    client = GoogleCalendar(None, service=api)
+    service = GoogleCalendarService(client=client)
+"""
+
+# Method and argument names mirror the googleapiclient resource (calendarList, calendarId)
+# ruff: noqa: N802, N803
+
+import itertools
+import json
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+# Calls accepted in one batch request by the real API
+BATCH_CALL_LIMIT = 1000
+
+
+def _http_error(status: int, message: str) -> HttpError:
+    content = json.dumps({"error": {"code": status, "message": message}}).encode()
+    return HttpError(httplib2.Response({"status": status}), content)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _start_key(event: dict[str, Any]) -> str:
+    start = event.get("start", {})
+    return start.get("dateTime") or start.get("date") or ""
+
+
+class FakeRequest:
+    """A prepared call; execute() counts one HTTP round trip."""
+
+    def __init__(self, api: "FakeCalendarAPI", fn: Callable[[], Any]):
+        self._api = api
+        self._fn = fn
+
+    def execute(self) -> Any:
+        self._api.http_requests += 1
+        return self.run()
+
+    def run(self) -> Any:
+        """Run the call without counting a round trip (as part of a batch)."""
+        return self._fn()
+
+
+class FakeBatch:
+    """Batch of calls sent in one HTTP round trip, with per-call callbacks."""
+
+    def __init__(self, api: "FakeCalendarAPI", callback: Callable | None = None):
+        self._api = api
+        self._callback = callback
+        self._requests: list[tuple[str, FakeRequest, Callable | None]] = []
+
+    def add(self, request: FakeRequest, callback: Callable | None = None, request_id=None):
+        request_id = request_id if request_id is not None else str(len(self._requests) + 1)
+        self._requests.append((request_id, request, callback))
+
+    def execute(self) -> None:
+        if len(self._requests) > BATCH_CALL_LIMIT:
+            raise _http_error(400, "Too many requests in batch")
+        self._api.http_requests += 1
+        self._api.batch_requests += 1
+        self._api.batched_calls += len(self._requests)
+        for request_id, request, callback in self._requests:
+            response, exception = None, None
+            try:
+                response = request.run()
+            except HttpError as e:
+                exception = e
+            handler = callback or self._callback
+            if handler is not None:
+                handler(request_id, response, exception)
+
+
+class FakeEvents:
+    """The events() collection."""
+
+    def __init__(self, api: "FakeCalendarAPI"):
+        self._api = api
+
+    def insert(self, calendarId: str, body: dict[str, Any], **_: Any) -> FakeRequest:
+        return FakeRequest(self._api, lambda: self._api.insert_event(calendarId, body))
+
+    def get(self, calendarId: str, eventId: str, **_: Any) -> FakeRequest:
+        return FakeRequest(self._api, lambda: dict(self._api.live_event(calendarId, eventId)))
+
+    def update(self, calendarId: str, eventId: str, body: dict[str, Any], **_: Any) -> FakeRequest:
+        return FakeRequest(
+            self._api, lambda: self._api.write_event(calendarId, eventId, body, True)
+        )
+
+    def patch(self, calendarId: str, eventId: str, body: dict[str, Any], **_: Any) -> FakeRequest:
+        return FakeRequest(
+            self._api, lambda: self._api.write_event(calendarId, eventId, body, False)
+        )
+
+    def delete(self, calendarId: str, eventId: str, **_: Any) -> FakeRequest:
+        return FakeRequest(self._api, lambda: self._api.delete_event(calendarId, eventId))
+
+    def list(self, calendarId: str, **params: Any) -> FakeRequest:
+        return FakeRequest(self._api, lambda: self._api.list_events(calendarId, **params))
+
+
+class FakeCalendarList:
+    """The calendarList() collection."""
+
+    def __init__(self, api: "FakeCalendarAPI"):
+        self._api = api
+
+    def list(self, **_: Any) -> FakeRequest:
+        return FakeRequest(
+            self._api,
+            lambda: {"items": [{"id": cid, "summary": cid} for cid in self._api.calendars]},
+        )
+
+
+class FakeCalendarAPI:
+    """Calendar v3 resource backed by dicts; counts HTTP round trips."""
+
+    def __init__(self, calendar_ids: tuple[str, ...] = ("primary",)):
+        self.calendars: dict[str, dict[str, dict[str, Any]]] = {cid: {} for cid in calendar_ids}
+        # Change sequence per event, for sync tokens
+        self._changed: dict[tuple[str, str], int] = {}
+        self._seq = 0
+        self._token_generation = 0
+        self._ids = itertools.count(1)
+        self.http_requests = 0
+        self.batch_requests = 0
+        self.batched_calls = 0
+
+    # googleapiclient resource surface
+
+    def events(self) -> FakeEvents:
+        return FakeEvents(self)
+
+    def calendarList(self) -> FakeCalendarList:
+        return FakeCalendarList(self)
+
+    def new_batch_http_request(self, callback: Callable | None = None) -> FakeBatch:
+        return FakeBatch(self, callback)
+
+    # Test helpers
+
+    def expire_sync_tokens(self) -> None:
+        """Invalidate every sync token issued so far (the next incremental sync gets 410)."""
+        self._token_generation += 1
+
+    def live_events(self, calendar_id: str = "primary") -> list[dict[str, Any]]:
+        """Events that are not cancelled."""
+        return [e for e in self._calendar(calendar_id).values() if e["status"] != "cancelled"]
+
+    # Server behaviour (called by the request objects)
+
+    def _calendar(self, calendar_id: str) -> dict[str, dict[str, Any]]:
+        if calendar_id not in self.calendars:
+            raise _http_error(404, f"Calendar not found: {calendar_id}")
+        return self.calendars[calendar_id]
+
+    def _touch(self, calendar_id: str, event: dict[str, Any]) -> dict[str, Any]:
+        self._seq += 1
+        self._changed[(calendar_id, event["id"])] = self._seq
+        event["updated"] = _now()
+        event["etag"] = f'"{self._seq}"'
+        return dict(event)
+
+    def live_event(self, calendar_id: str, event_id: str) -> dict[str, Any]:
+        event = self._calendar(calendar_id).get(event_id)
+        if event is None or event["status"] == "cancelled":
+            raise _http_error(404, f"Not Found: {event_id}")
+        return event
+
+    def insert_event(self, calendar_id: str, body: dict[str, Any]) -> dict[str, Any]:
+        events = self._calendar(calendar_id)
+        event_id = body.get("id") or f"evt{next(self._ids):06d}"
+        if event_id in events:
+            raise _http_error(409, f"The requested identifier already exists: {event_id}")
+        event = {
+            "kind": "calendar#event",
+            **body,
+            "id": event_id,
+            "status": "confirmed",
+            "created": _now(),
+            "htmlLink": f"https://calendar.google.com/event?eid={event_id}",
+        }
+        events[event_id] = event
+        return self._touch(calendar_id, event)
+
+    def write_event(self, calendar_id: str, event_id: str, body: dict[str, Any], replace: bool):
+        event = self.live_event(calendar_id, event_id)
+        if replace:
+            kept = {k: event[k] for k in ("kind", "id", "status", "created", "htmlLink")}
+            event.clear()
+            event.update({**body, **kept})
+        else:
+            event.update({k: v for k, v in body.items() if k not in ("id", "created")})
+        return self._touch(calendar_id, event)
+
+    def delete_event(self, calendar_id: str, event_id: str) -> str:
+        event = self._calendar(calendar_id).get(event_id)
+        if event is None:
+            raise _http_error(404, f"Not Found: {event_id}")
+        if event["status"] == "cancelled":
+            raise _http_error(410, "Resource has been deleted")
+        event["status"] = "cancelled"
+        self._touch(calendar_id, event)
+        return ""
+
+    def _sync_token(self, calendar_id: str, seq: int) -> str:
+        return f"{calendar_id}|{self._token_generation}|{seq}"
+
+    def list_events(
+        self,
+        calendar_id: str,
+        *,
+        maxResults: int = 250,
+        pageToken: str | None = None,
+        syncToken: str | None = None,
+        timeMin: str | None = None,
+        timeMax: str | None = None,
+        orderBy: str | None = None,
+        q: str | None = None,
+        showDeleted: bool = False,
+        **_: Any,
+    ) -> dict[str, Any]:
+        events = self._calendar(calendar_id)
+        if syncToken and (timeMin or timeMax or orderBy or q):
+            raise _http_error(400, "syncToken cannot be combined with filters")
+
+        # Page tokens pin the change sequence of the first page, so later pages
+        # and the final sync token are consistent with it
+        offset, snapshot = 0, self._seq
+        if pageToken:
+            offset, snapshot = (int(part) for part in pageToken.split(":"))
+
+        if syncToken:
+            token_calendar, generation, since = syncToken.split("|")
+            if token_calendar != calendar_id or int(generation) != self._token_generation:
+                raise _http_error(410, "Sync token is no longer valid, a full sync is required.")
+            selected = [
+                e
+                for e in events.values()
+                if int(since) < self._changed[(calendar_id, e["id"])] <= snapshot
+            ]
+        else:
+            selected = [
+                e
+                for e in events.values()
+                if (showDeleted or e["status"] != "cancelled")
+                and self._changed[(calendar_id, e["id"])] <= snapshot
+                and (not timeMin or _start_key(e) >= timeMin)
+                and (not timeMax or _start_key(e) < timeMax)
+                and (not q or q.lower() in json.dumps(e).lower())
+            ]
+
+        if orderBy == "startTime":
+            selected.sort(key=_start_key)
+        else:
+            selected.sort(key=lambda e: self._changed[(calendar_id, e["id"])])
+
+        page = selected[offset : offset + maxResults]
+        result: dict[str, Any] = {"kind": "calendar#events", "items": [dict(e) for e in page]}
+        if offset + maxResults < len(selected):
+            result["nextPageToken"] = f"{offset + maxResults}:{snapshot}"
+        else:
+            result["nextSyncToken"] = self._sync_token(calendar_id, snapshot)
+        return result
+
+
+__all__ = ["FakeCalendarAPI"]
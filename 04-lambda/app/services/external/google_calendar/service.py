@@ -1,15 +1,27 @@
-"""High-level Google Calendar service facade."""
+"""High-level Google Calendar service facade.
 
+The API client (googleapiclient over httplib2) is blocking and not thread-safe,
+so every call runs on a single worker thread owned by the service, off the
+event loop.
+"""
+
+import asyncio
+import functools
 import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
 
 from app.services.external.google_drive.classes.google_auth import GoogleAuth
 
-from .classes import GoogleCalendar
+from .classes import BatchOperation, GoogleCalendar
 from .classes.exceptions import GoogleCalendarException
 from .models import CalendarEvent, CalendarEventData
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class GoogleCalendarService:
     """High-level service for Google Calendar operations.
@@ -25,6 +37,7 @@ class GoogleCalendarService:
         client_id: str | None = None,
         client_secret: str | None = None,
         default_calendar_id: str = "primary",
+        client: GoogleCalendar | None = None,
     ):
         """
         Initialize the Google Calendar service.
@@ -35,8 +48,17 @@ class GoogleCalendarService:
             client_id: OAuth client ID (alternative to JSON)
             client_secret: OAuth client secret (alternative to JSON)
             default_calendar_id: Default calendar ID to use
+            client: Ready GoogleCalendar client (skips OAuth setup, e.g. for a client
+                over FakeCalendarAPI)
         """
         self.default_calendar_id = default_calendar_id
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gcal")
+
+        if client is not None:
+            self._auth = client.authenticator
+            self._client = client
+            self._initialized = True
+            return
 
         try:
             # Use GoogleAuth with CALENDAR_SCOPES for Calendar operations
@@ -70,6 +92,15 @@ class GoogleCalendarService:
             )
         return self._client
 
+    async def _run(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run a blocking client call on the service's API thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    def close(self) -> None:
+        """Stop the API thread."""
+        self._executor.shutdown(wait=False)
+
     async def create_event(
         self,
         event_data: CalendarEventData,
@@ -95,7 +126,8 @@ class GoogleCalendarService:
             extra={"summary": event_data.summary, "calendar_id": cal_id},
         )
 
-        result = self.client.create_event(
+        result = await self._run(
+            self.client.create_event,
             calendar_id=cal_id,
             summary=event_data.summary,
             start=event_data.start,
@@ -157,7 +189,8 @@ class GoogleCalendarService:
             )
         update_kwargs.update(kwargs)
 
-        result = self.client.update_event(
+        result = await self._run(
+            self.client.update_event,
             calendar_id=cal_id,
             event_id=event_id,
             **update_kwargs,
@@ -194,7 +227,7 @@ class GoogleCalendarService:
             extra={"event_id": event_id, "calendar_id": cal_id},
         )
 
-        self.client.delete_event(calendar_id=cal_id, event_id=event_id)
+        await self._run(self.client.delete_event, calendar_id=cal_id, event_id=event_id)
 
         logger.info("calendar_event_deleted", extra={"event_id": event_id})
 
@@ -219,7 +252,7 @@ class GoogleCalendarService:
         """
         cal_id = calendar_id or self.default_calendar_id
 
-        result = self.client.get_event(calendar_id=cal_id, event_id=event_id)
+        result = await self._run(self.client.get_event, calendar_id=cal_id, event_id=event_id)
         return CalendarEvent.from_google_event(result)
 
     async def list_events(
@@ -227,7 +260,7 @@ class GoogleCalendarService:
         calendar_id: str | None = None,
         time_min: str | None = None,
         time_max: str | None = None,
-        max_results: int = 10,
+        max_results: int | None = 10,
         query: str | None = None,
     ) -> list[CalendarEvent]:
         """
@@ -237,7 +270,7 @@ class GoogleCalendarService:
             calendar_id: Calendar ID (uses default if not provided)
             time_min: Start of time range (ISO format)
             time_max: End of time range (ISO format)
-            max_results: Maximum number of events to return
+            max_results: Maximum number of events to return, across pages (None: all)
             query: Free text search query
 
         Returns:
@@ -258,7 +291,8 @@ class GoogleCalendarService:
             },
         )
 
-        results = self.client.list_events(
+        results = await self._run(
+            self.client.list_events,
             calendar_id=cal_id,
             time_min=time_min,
             time_max=time_max,
@@ -271,5 +305,59 @@ class GoogleCalendarService:
 
         return events
 
+    async def list_event_changes(
+        self,
+        calendar_id: str | None = None,
+        sync_token: str | None = None,
+        time_min: str | None = None,
+        page_size: int = 250,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        Raw events changed since a sync token (all events without one).
+
+        Args:
+            calendar_id: Calendar ID (uses default if not provided)
+            sync_token: Token from the previous sync (None: full sync)
+            time_min: Lower bound of a full sync (ISO format)
+            page_size: Events requested per page
+
+        Returns:
+            Changed events (deleted ones with status "cancelled") and the next sync token
+
+        Raises:
+            GoogleCalendarSyncTokenExpiredError: If a full sync is required
+            GoogleCalendarException: If listing fails
+        """
+        return await self._run(
+            self.client.list_event_changes,
+            calendar_id=calendar_id or self.default_calendar_id,
+            sync_token=sync_token,
+            time_min=time_min,
+            page_size=page_size,
+        )
+
+    async def batch_execute(
+        self,
+        operations: list[BatchOperation],
+        calendar_id: str | None = None,
+    ) -> list[dict[str, Any] | GoogleCalendarException | None]:
+        """
+        Run event writes as batch requests; see GoogleCalendar.batch_execute.
+
+        Args:
+            operations: Inserts, patches and deletes
+            calendar_id: Calendar ID (uses default if not provided)
+
+        Returns:
+            Per operation: the event, None (delete) or the exception it failed with
+        """
+        if not operations:
+            return []
+        return await self._run(
+            self.client.batch_execute,
+            calendar_id or self.default_calendar_id,
+            operations,
+        )
+
 
 __all__ = ["GoogleCalendarService"]
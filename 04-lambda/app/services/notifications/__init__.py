@@ -0,0 +1,20 @@
+"""Durable outbound notifications (Discord, n8n and other webhooks)."""
+
+from app.services.notifications.dispatcher import (
+    NotificationDispatcher,
+    enqueue_notification,
+    get_notification_dispatcher,
+    shutdown_notification_dispatcher,
+    start_notification_dispatcher,
+)
+from app.services.notifications.targets import NotificationTarget, configured_targets
+
+__all__ = [
+    "NotificationDispatcher",
+    "NotificationTarget",
+    "configured_targets",
+    "enqueue_notification",
+    "get_notification_dispatcher",
+    "shutdown_notification_dispatcher",
+    "start_notification_dispatcher",
+]
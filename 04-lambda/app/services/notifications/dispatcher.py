@@ -0,0 +1,407 @@
+"""Durable outbound notification dispatcher.
+
+Callers enqueue a notification for a named target (see ``targets``) and return;
+the notification is stored in a MongoDB outbox collection and posted by
+background workers, so a slow or failing webhook never holds up the request
+that produced it, and nothing queued is lost on restart.
+
+- Per-target rate limit: at most ``rate_per_minute`` requests to a target, one
+  request in flight per target per process.
+- Digests: a new notification waits ``coalesce_seconds`` before it is due, and
+  a worker sends every due notification for the target (up to ``max_batch``)
+  in one request. Notifications that pile up behind the rate limit are merged
+  the same way.
+- Retries: a request that fails (network error, 429, 5xx) is retried with
+  exponential backoff (429 honours Retry-After) up to ``max_attempts``; other
+  4xx responses fail immediately. Failed notifications stay in the outbox
+  with ``status: "failed"`` and ``last_error``; delivered ones are deleted.
+- Claims are atomic per document with a lease, so several server processes can
+  share the outbox, and a batch claimed by a process that died is picked up
+  again once its lease expires. Results are only written while the claim is
+  still held, so a late answer never overwrites the next claimant's work.
+
+Outbox document:
+    {target, payload, status: "pending" | "sending" | "failed", attempts,
+     next_attempt_at, lease_until, claim, last_error, created_at}
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+from bson import ObjectId
+from pymongo import ASCENDING, AsyncMongoClient
+from pymongo.asynchronous.collection import AsyncCollection
+
+from app.core.config import settings
+from app.services.notifications.targets import NotificationTarget, configured_targets
+
+logger = logging.getLogger(__name__)
+
+PENDING, SENDING, FAILED = "pending", "sending", "failed"
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Seconds from a Retry-After header (delta-seconds or HTTP date), if any."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - _now()).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Spaces requests to one target at least 60 / rate_per_minute seconds apart."""
+
+    def __init__(self, rate_per_minute: float):
+        self.interval = 60.0 / rate_per_minute if rate_per_minute > 0 else 0.0
+        self._next = 0.0
+
+    def ready_in(self) -> float:
+        """Seconds until the next request may start."""
+        return max(0.0, self._next - time.monotonic())
+
+    def take(self) -> None:
+        self._next = max(self._next, time.monotonic()) + self.interval
+
+    def defer(self, seconds: float) -> None:
+        """Hold requests back for ``seconds`` (e.g. after a 429)."""
+        self._next = max(self._next, time.monotonic() + seconds)
+
+
+class NotificationDispatcher:
+    """
+    MongoDB-backed outbox with a pool of delivery workers.
+
+    Usage:
+        dispatcher = NotificationDispatcher(collection, configured_targets())
+        await dispatcher.start()
+        await dispatcher.enqueue("discord", {"title": "...", "description": "..."})
+        ...
+        await dispatcher.stop()
+
+    enqueue() works without start(): the notification is stored and delivered
+    by whichever process runs the workers.
+    """
+
+    def __init__(
+        self,
+        collection: AsyncCollection,
+        targets: dict[str, NotificationTarget] | None = None,
+        *,
+        workers: int | None = None,
+        max_attempts: int | None = None,
+        retry_base_seconds: float | None = None,
+        retry_max_seconds: float | None = None,
+        timeout: float | None = None,
+        poll_seconds: float = 1.0,
+        http_client: httpx.AsyncClient | None = None,
+    ):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            collection: Outbox collection
+            targets: Targets by name (defaults to the configured targets)
+            workers: Concurrent deliveries (defaults to NOTIFICATION_WORKERS)
+            max_attempts: Attempts before a notification fails (NOTIFICATION_MAX_ATTEMPTS)
+            retry_base_seconds: First retry delay, doubled per attempt
+                (NOTIFICATION_RETRY_BASE_SECONDS)
+            retry_max_seconds: Longest retry delay (NOTIFICATION_RETRY_MAX_SECONDS)
+            timeout: Seconds per webhook request (NOTIFICATION_TIMEOUT_SECONDS)
+            poll_seconds: Longest idle wait before checking the outbox again
+            http_client: Client to post with (one owned by the dispatcher if omitted)
+        """
+        self.collection = collection
+        self.targets = configured_targets() if targets is None else targets
+        self.workers = max(1, workers or settings.notification_workers)
+        self.max_attempts = max(1, max_attempts or settings.notification_max_attempts)
+        self.retry_base_seconds = retry_base_seconds or settings.notification_retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds or settings.notification_retry_max_seconds
+        self.timeout = timeout or settings.notification_timeout_seconds
+        self.poll_seconds = poll_seconds
+        # A claimed batch is reclaimable once its request has certainly timed out
+        self.lease = timedelta(seconds=2 * self.timeout + 5)
+
+        self._http = http_client
+        self._owns_http = http_client is None
+        self._limiters = {name: RateLimiter(t.rate_per_minute) for name, t in self.targets.items()}
+        self._sending: set[str] = set()
+        self._wake = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self._counters = {
+            "enqueued": 0,
+            "sent": 0,
+            "requests": 0,
+            "digests": 0,
+            "retried": 0,
+            "failed": 0,
+        }
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def enqueue(self, target: str, payload: dict[str, Any]) -> str | None:
+        """
+        Store a notification for delivery.
+
+        Args:
+            target: Target name (e.g. "discord", "n8n")
+            payload: Discord embed, or JSON object for webhook targets
+
+        Returns:
+            Outbox document ID, or None if the target is not configured
+        """
+        config = self.targets.get(target)
+        if config is None:
+            logger.debug(f"Notification target {target!r} is not configured, dropping")
+            return None
+        now = _now()
+        result = await self.collection.insert_one(
+            {
+                "target": target,
+                "payload": payload,
+                "status": PENDING,
+                "attempts": 0,
+                "next_attempt_at": now + timedelta(seconds=config.coalesce_seconds),
+                "created_at": now,
+            }
+        )
+        self._counters["enqueued"] += 1
+        self._wake.set()
+        return str(result.inserted_id)
+
+    async def start(self) -> None:
+        """Create the outbox indexes and start the workers."""
+        if self.running:
+            return
+        try:
+            await self.collection.create_index(
+                [("target", ASCENDING), ("status", ASCENDING), ("next_attempt_at", ASCENDING)],
+                name="target_due",
+            )
+            await self.collection.create_index("claim", name="claim", sparse=True)
+        except Exception as e:
+            # Workers keep retrying the outbox; only the queries are slower without indexes
+            logger.warning(f"Failed to create notification outbox indexes: {e}")
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=self.timeout)
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"notification-dispatcher-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(
+            f"Notification dispatcher started: {self.workers} workers, "
+            f"targets {sorted(self.targets) or 'none'}"
+        )
+
+    async def stop(self) -> None:
+        """Stop the workers; undelivered notifications stay in the outbox."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._owns_http and self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        logger.info(f"Notification dispatcher stopped: {self.stats()}")
+
+    def stats(self) -> dict[str, Any]:
+        """Delivery counters for this process."""
+        return {"running": self.running, "workers": self.workers, **self._counters}
+
+    # ========== Workers ==========
+
+    def _due(self, now: datetime) -> dict[str, Any]:
+        return {
+            "$or": [
+                {"status": PENDING, "next_attempt_at": {"$lte": now}},
+                {"status": SENDING, "lease_until": {"$lte": now}},
+            ]
+        }
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                delivered = await self._deliver_next()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Notification worker error")
+                delivered = False
+            if not delivered:
+                await self._idle()
+
+    async def _idle(self) -> None:
+        """Wait for an enqueue, a rate limit to lapse or the next poll."""
+        delay = self.poll_seconds
+        limited = [w for w in (limiter.ready_in() for limiter in self._limiters.values()) if w > 0]
+        if limited:
+            delay = min(delay, *limited)
+        self._wake.clear()
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._wake.wait(), timeout=max(delay, 0.01))
+
+    def _sending_or_limited(self) -> set[str]:
+        return self._sending | {
+            name for name, limiter in self._limiters.items() if limiter.ready_in() > 0
+        }
+
+    async def _deliver_next(self) -> bool:
+        """Claim and send one batch; False when no target has anything due."""
+        available = set(self.targets) - self._sending_or_limited()
+        if not available:
+            return False
+        now = _now()
+        first = await self.collection.find_one(
+            {"$and": [self._due(now), {"target": {"$in": sorted(available)}}]},
+            {"target": 1},
+            sort=[("next_attempt_at", ASCENDING)],
+        )
+        if first is None:
+            return False
+        name = first["target"]
+        # Another worker took the target while this one was querying
+        if name in self._sending_or_limited():
+            return True
+
+        self._sending.add(name)
+        try:
+            target = self.targets[name]
+            batch = await self._claim(target, now)
+            if batch:
+                self._limiters[name].take()
+                await self._send(target, batch)
+        finally:
+            self._sending.discard(name)
+        return True
+
+    async def _claim(self, target: NotificationTarget, now: datetime) -> list[dict[str, Any]]:
+        """Atomically mark up to max_batch due notifications of a target as sending."""
+        due = {"$and": [self._due(now), {"target": target.name}]}
+        candidates = await (
+            self.collection.find(due, {"_id": 1})
+            .sort("next_attempt_at", ASCENDING)
+            .limit(target.max_batch)
+            .to_list()
+        )
+        if not candidates:
+            return []
+        claim = ObjectId()
+        await self.collection.update_many(
+            {"$and": [due, {"_id": {"$in": [doc["_id"] for doc in candidates]}}]},
+            {"$set": {"status": SENDING, "claim": claim, "lease_until": now + self.lease}},
+        )
+        return await self.collection.find({"claim": claim}).sort("created_at", ASCENDING).to_list()
+
+    async def _send(self, target: NotificationTarget, batch: list[dict[str, Any]]) -> None:
+        body = target.render([doc["payload"] for doc in batch])
+        retry_after = None
+        try:
+            response = await self._http.post(target.url, json=body, timeout=self.timeout)
+        except httpx.HTTPError as e:
+            error, retryable = f"{type(e).__name__}: {e}", True
+        else:
+            if response.is_success:
+                # Only the documents this worker still holds; a reclaimed one is sent again
+                await self.collection.delete_many(
+                    {"_id": {"$in": [doc["_id"] for doc in batch]}, "claim": batch[0]["claim"]}
+                )
+                self._counters["requests"] += 1
+                self._counters["sent"] += len(batch)
+                if len(batch) > 1:
+                    self._counters["digests"] += 1
+                logger.debug(f"Sent {len(batch)} notifications to {target.name}")
+                return
+            error = f"HTTP {response.status_code}: {response.text[:200]}"
+            retryable = response.status_code == 429 or response.status_code >= 500
+            if response.status_code == 429:
+                retry_after = _retry_after(response)
+                self._limiters[target.name].defer(retry_after or self.retry_base_seconds)
+
+        self._counters["requests"] += 1
+        logger.warning(f"Notification delivery to {target.name} failed: {error}")
+        await self._reschedule(batch, error, retryable, retry_after)
+
+    async def _reschedule(
+        self,
+        batch: list[dict[str, Any]],
+        error: str,
+        retryable: bool,
+        retry_after: float | None,
+    ) -> None:
+        now = _now()
+        for doc in batch:
+            attempts = doc.get("attempts", 0) + 1
+            update: dict[str, Any] = {"attempts": attempts, "last_error": error}
+            if retryable and attempts < self.max_attempts:
+                delay = min(self.retry_base_seconds * 2 ** (attempts - 1), self.retry_max_seconds)
+                update |= {
+                    "status": PENDING,
+                    "next_attempt_at": now + timedelta(seconds=max(delay, retry_after or 0)),
+                }
+                self._counters["retried"] += 1
+            else:
+                update |= {"status": FAILED, "failed_at": now}
+                self._counters["failed"] += 1
+                logger.error(
+                    f"Giving up on notification {doc['_id']} to {doc['target']} "
+                    f"after {attempts} attempts: {error}"
+                )
+            await self.collection.update_one(
+                {"_id": doc["_id"], "claim": doc["claim"]},
+                {"$set": update, "$unset": {"claim": ""}},
+            )
+
+
+_mongo_client: AsyncMongoClient | None = None
+_dispatcher: NotificationDispatcher | None = None
+
+
+def get_notification_dispatcher() -> NotificationDispatcher:
+    """Process-wide dispatcher over the NOTIFICATION_COLLECTION outbox (workers not started)."""
+    global _mongo_client, _dispatcher
+    if _dispatcher is None:
+        _mongo_client = AsyncMongoClient(settings.mongodb_uri)
+        collection = _mongo_client[settings.mongodb_database][settings.notification_collection]
+        _dispatcher = NotificationDispatcher(collection)
+    return _dispatcher
+
+
+async def enqueue_notification(target: str, payload: dict[str, Any]) -> str | None:
+    """Store a notification for the process-wide dispatcher to deliver."""
+    return await get_notification_dispatcher().enqueue(target, payload)
+
+
+async def start_notification_dispatcher() -> None:
+    """Start the process-wide delivery workers if any target is configured."""
+    dispatcher = get_notification_dispatcher()
+    if dispatcher.targets:
+        await dispatcher.start()
+
+
+async def shutdown_notification_dispatcher() -> None:
+    """Stop the workers and close the outbox connection (called on application shutdown)."""
+    global _mongo_client, _dispatcher
+    if _dispatcher is not None:
+        await _dispatcher.stop()
+        _dispatcher = None
+    if _mongo_client is not None:
+        await _mongo_client.close()
+        _mongo_client = None
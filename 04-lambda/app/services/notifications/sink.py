@@ -0,0 +1,102 @@
+"""Local webhook sink for testing notification delivery offline.
+
+WebhookSink accepts POSTs on any path of a random localhost port and records
+their JSON bodies. Queued responses let it fail requests the way a real target
+would (5xx, 429 with Retry-After, slow responses).
+
+Usage:
+    async with WebhookSink() as sink:
+        sink.fail(503, times=2)
+        target = NotificationTarget("n8n", sink.url("/n8n"))
+        ...
+        await sink.wait_for(3)
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiohttp import web
+
+
+@dataclass
+class ReceivedRequest:
+    path: str
+    body: Any
+    received_at: float = field(default_factory=time.monotonic)
+
+
+class WebhookSink:
+    """aiohttp server that records webhook requests."""
+
+    def __init__(self, delay: float = 0.0):
+        """
+        Configure the sink (call start() or use ``async with`` to serve).
+
+        Args:
+            delay: Seconds before each response
+        """
+        self.delay = delay
+        self.requests: list[ReceivedRequest] = []
+        self.failures: list[ReceivedRequest] = []
+        self._responses: list[tuple[int, dict[str, str]]] = []
+        self._received = asyncio.Condition()
+        self._runner: web.AppRunner | None = None
+        self._port: int | None = None
+
+    def url(self, path: str = "/") -> str:
+        return f"http://127.0.0.1:{self._port}{path}"
+
+    def fail(self, status: int, times: int = 1, headers: dict[str, str] | None = None) -> None:
+        """Answer the next ``times`` requests with ``status`` instead of 204."""
+        self._responses.extend([(status, headers or {})] * times)
+
+    def bodies(self, path: str | None = None) -> list[Any]:
+        """Bodies of the accepted requests, optionally only those sent to ``path``."""
+        return [r.body for r in self.requests if path is None or r.path == path]
+
+    async def wait_for(self, count: int, timeout: float = 5.0) -> list[ReceivedRequest]:
+        """Wait until ``count`` requests have been accepted."""
+        async with self._received:
+            await asyncio.wait_for(
+                self._received.wait_for(lambda: len(self.requests) >= count), timeout
+            )
+        return self.requests
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_route("POST", "/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", self._port or 0)
+        await site.start()
+        self._port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "WebhookSink":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        received = ReceivedRequest(request.path, await request.json())
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self._responses:
+            status, headers = self._responses.pop(0)
+            self.failures.append(received)
+            return web.json_response({"error": "sink failure"}, status=status, headers=headers)
+        async with self._received:
+            self.requests.append(received)
+            self._received.notify_all()
+        return web.Response(status=204)
+
+
+__all__ = ["ReceivedRequest", "WebhookSink"]
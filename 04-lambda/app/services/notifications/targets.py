@@ -0,0 +1,78 @@
+"""Outbound notification targets and the request bodies sent to them."""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Literal
+
+from app.core.config import settings
+
+# Discord accepts at most 10 embeds per message
+DISCORD_MAX_EMBEDS = 10
+
+
+@dataclass(frozen=True)
+class NotificationTarget:
+    """
+    A webhook notifications are delivered to.
+
+    Attributes:
+        name: Name callers enqueue notifications for (e.g. "discord")
+        url: Webhook URL
+        kind: "discord" (payloads are embeds) or "webhook" (payloads are JSON objects)
+        rate_per_minute: Requests per minute at most
+        coalesce_seconds: How long a new notification waits for others to join its digest
+        max_batch: Notifications sent in one request at most (1: no digests)
+    """
+
+    name: str
+    url: str
+    kind: Literal["discord", "webhook"] = "webhook"
+    rate_per_minute: float = 30.0
+    coalesce_seconds: float = 2.0
+    max_batch: int = 10
+
+    def render(self, payloads: list[dict[str, Any]]) -> dict[str, Any]:
+        """Request body delivering ``payloads`` (one notification, or a digest of several)."""
+        if self.kind == "discord":
+            body: dict[str, Any] = {"embeds": payloads[:DISCORD_MAX_EMBEDS]}
+            if len(payloads) > 1:
+                body["content"] = f"{len(payloads)} notifications"
+            return body
+        if len(payloads) == 1:
+            return payloads[0]
+        return {
+            "event": "digest",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "count": len(payloads),
+            "events": payloads,
+        }
+
+
+def configured_targets() -> dict[str, NotificationTarget]:
+    """Targets whose webhook URL is set (NOTIFICATION_*_WEBHOOK_URL)."""
+    options = {
+        "rate_per_minute": settings.notification_rate_per_minute,
+        "coalesce_seconds": settings.notification_coalesce_seconds,
+    }
+    targets = []
+    if settings.notification_discord_webhook_url:
+        targets.append(
+            NotificationTarget(
+                "discord",
+                settings.notification_discord_webhook_url,
+                "discord",
+                max_batch=min(settings.notification_max_batch, DISCORD_MAX_EMBEDS),
+                **options,
+            )
+        )
+    if settings.notification_n8n_webhook_url:
+        targets.append(
+            NotificationTarget(
+                "n8n",
+                settings.notification_n8n_webhook_url,
+                "webhook",
+                max_batch=settings.notification_max_batch,
+                **options,
+            )
+        )
+    return {target.name: target for target in targets}
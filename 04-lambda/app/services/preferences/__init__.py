@@ -9,11 +9,15 @@ and system-level preferences with hierarchical resolution:
 Phase 1 (MVP): User-level preferences only (System → User hierarchy)
 Phase 2: Organization-level preferences (full System → Org → User hierarchy)
 
+Resolved preferences are loaded with one query per user and cached in-process
+(see cache.py), invalidated on writes and via Postgres LISTEN/NOTIFY.
+
 Discord Bot Configuration:
     The discord_service module provides backward-compatible API for Discord bot
     configuration, migrating from MongoDB to Supabase preferences.
 """
 
+from .cache import PreferenceCache, ResolvedPreference, get_preference_cache
 from .config import PreferenceCategories, PreferenceKeys
 from .discord_service import (
     AVAILABLE_CAPABILITIES,
@@ -39,6 +43,9 @@ from .service import PreferencesService
 __all__ = [
     # Core preferences
     "PreferencesService",
+    "PreferenceCache",
+    "ResolvedPreference",
+    "get_preference_cache",
     "PreferenceDefinition",
     "UserPreference",
     "PreferenceUpdateRequest",
@@ -0,0 +1,219 @@
+"""Per-user cache of resolved preferences, invalidated on writes.
+
+PreferencesService resolves all of a user's preferences (User → Organization →
+System) in one query and keeps the result here, so repeated reads such as
+``llm.temperature`` on every agent request cost no database round trip.
+
+Invalidation:
+- In-process: PreferencesService.set/delete (and Discord org/system writes)
+  drop the affected entries before returning.
+- Across workers: the triggers from migration 013 send
+  ``NOTIFY preferences_changed`` on every write to user_preferences,
+  organization_preferences and preference_definitions. PreferenceChangeListener
+  LISTENs on a dedicated connection and drops the matching entries. While it is
+  not connected, entries still expire after PREFERENCES_CACHE_TTL_SECONDS.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "preferences_changed"
+
+# Seconds before retrying a failed LISTEN connection
+LISTEN_RETRY_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class ResolvedPreference:
+    """A preference value after hierarchical resolution."""
+
+    key: str
+    category: str
+    value: Any
+    source: str  # 'user', 'organization' or 'system'
+    is_user_configurable: bool
+
+
+CacheKey = tuple[str, str | None]
+
+
+def _cache_key(user_id: UUID | str, organization_id: UUID | str | None) -> CacheKey:
+    return str(user_id), str(organization_id) if organization_id else None
+
+
+class PreferenceCache:
+    """LRU of resolved preferences per (user, organization), with a time-to-live."""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[CacheKey, tuple[float, dict[str, ResolvedPreference]]] = (
+            OrderedDict()
+        )
+        # Bumped by every invalidation; loads that started before it are not stored
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    def get(
+        self, user_id: UUID | str, organization_id: UUID | str | None = None
+    ) -> dict[str, ResolvedPreference] | None:
+        """Resolved preferences by key, or None if not cached (or expired)."""
+        key = _cache_key(user_id, organization_id)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(
+        self,
+        user_id: UUID | str,
+        organization_id: UUID | str | None,
+        resolved: dict[str, ResolvedPreference],
+        generation: int,
+    ) -> None:
+        """
+        Store resolved preferences loaded at ``generation``.
+
+        The entry is dropped if anything was invalidated since the load started,
+        so a read racing a write cannot cache the old value.
+        """
+        if not self.enabled or generation != self.generation:
+            return
+        key = _cache_key(user_id, organization_id)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, resolved)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: UUID | str) -> None:
+        self._drop(lambda key: key[0] == str(user_id))
+
+    def invalidate_organization(self, organization_id: UUID | str) -> None:
+        self._drop(lambda key: key[1] == str(organization_id))
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+    def _drop(self, predicate) -> None:
+        self.generation += 1
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+
+    def handle_notification(self, payload: str) -> None:
+        """
+        Apply a ``preferences_changed`` payload.
+
+        Payloads are ``user:<id>``, ``organization:<id>`` or ``system`` (a
+        definition changed, which affects everyone).
+        """
+        scope, _, target = payload.partition(":")
+        if scope == "user" and target:
+            self.invalidate_user(target)
+        elif scope == "organization" and target:
+            self.invalidate_organization(target)
+        else:
+            self.clear()
+
+
+class PreferenceChangeListener:
+    """LISTENs for preference changes made by other workers on a dedicated connection."""
+
+    def __init__(self, cache: PreferenceCache):
+        self.cache = cache
+        self._conn: asyncpg.Connection | None = None
+        self._retry_at = 0.0
+
+    @property
+    def listening(self) -> bool:
+        return self._conn is not None and not self._conn.is_closed()
+
+    async def start(self, db_url: str) -> bool:
+        """
+        Connect and LISTEN, unless already listening or a recent attempt failed.
+
+        Returns:
+            Whether the listener is connected
+        """
+        if self.listening:
+            return True
+        if time.monotonic() < self._retry_at:
+            return False
+        try:
+            conn = await asyncpg.connect(db_url)
+            await conn.add_listener(NOTIFY_CHANNEL, self._on_notification)
+            conn.add_termination_listener(self._on_termination)
+        except Exception as e:
+            self._retry_at = time.monotonic() + LISTEN_RETRY_SECONDS
+            logger.warning(f"Preference change listener unavailable, relying on TTL: {e}")
+            return False
+        self._conn = conn
+        # Changes made while we were not listening were missed
+        self.cache.clear()
+        logger.info("preference_change_listener_started")
+        return True
+
+    async def stop(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None and not conn.is_closed():
+            await conn.close()
+
+    def _on_notification(self, _connection, _pid, _channel, payload: str) -> None:
+        self.cache.handle_notification(payload)
+
+    def _on_termination(self, _connection) -> None:
+        logger.warning("Preference change listener connection lost")
+        self._conn = None
+        self.cache.clear()
+
+
+_cache: PreferenceCache | None = None
+_listener: PreferenceChangeListener | None = None
+
+
+def get_preference_cache() -> PreferenceCache:
+    """Return the process-wide preference cache."""
+    global _cache
+    if _cache is None:
+        _cache = PreferenceCache(
+            settings.preferences_cache_size, settings.preferences_cache_ttl_seconds
+        )
+    return _cache
+
+
+async def start_preference_listener(db_url: str) -> None:
+    """Start the process-wide change listener (PREFERENCES_LISTEN) if not running."""
+    global _listener
+    if not settings.preferences_listen:
+        return
+    if _listener is None:
+        _listener = PreferenceChangeListener(get_preference_cache())
+    await _listener.start(db_url)
+
+
+async def shutdown_preference_listener() -> None:
+    """Close the change listener's connection."""
+    global _listener
+    if _listener is not None:
+        await _listener.stop()
+        _listener = None
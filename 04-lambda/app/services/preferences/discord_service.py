@@ -17,6 +17,7 @@ from uuid import UUID
 from pydantic import BaseModel, Field
 from app.services.database.supabase.client import SupabaseClient
 from app.services.database.supabase.config import SupabaseConfig
+from app.services.preferences.cache import get_preference_cache
 
 logger = logging.getLogger(__name__)
 
@@ -358,6 +359,12 @@ class DiscordConfigService:
                     jsonb_value,
                 )
 
+        # Resolved user preferences include org and system values
+        if org_id:
+            get_preference_cache().invalidate_organization(org_id)
+        else:
+            get_preference_cache().clear()
+
     async def get_config(self, config_id: str = "global") -> DiscordBotConfig:
         """Get bot configuration by ID.
 
@@ -16,9 +16,15 @@ from app.services.preferences.service import PreferencesService
 router = APIRouter(prefix="/api/v1/preferences", tags=["preferences"])
 
 
+_service: PreferencesService | None = None
+
+
 def get_preferences_service() -> PreferencesService:
-    """Dependency to get preferences service."""
-    return PreferencesService(SupabaseConfig())
+    """Dependency to get the shared preferences service (one connection pool per process)."""
+    global _service
+    if _service is None:
+        _service = PreferencesService(SupabaseConfig())
+    return _service
 
 
 @router.get("/", response_model=PreferencesListResponse)
@@ -6,28 +6,113 @@ from uuid import UUID
 
 from app.services.database.supabase.client import SupabaseClient
 from app.services.database.supabase.config import SupabaseConfig
+from app.services.preferences.cache import (
+    PreferenceCache,
+    ResolvedPreference,
+    get_preference_cache,
+    start_preference_listener,
+)
 from app.services.preferences.config import FALLBACK_DEFAULTS
 from app.services.preferences.models import PreferenceDefinition
 
+# Resolves User → Organization → System for every matching definition in one statement.
+# $1 user_id, $2 organization_id (NULL: no organization); filters are appended.
+RESOLVE_QUERY = """
+    SELECT d.key, d.category, d.is_user_configurable,
+           COALESCE(u.value, o.value, d.default_value) AS value,
+           CASE
+               WHEN u.id IS NOT NULL THEN 'user'
+               WHEN o.id IS NOT NULL THEN 'organization'
+               ELSE 'system'
+           END AS source
+    FROM preference_definitions d
+    LEFT JOIN user_preferences u ON u.preference_key = d.key AND u.user_id = $1
+    LEFT JOIN organization_preferences o
+        ON o.preference_key = d.key AND o.organization_id = $2
+"""
+
 
 class PreferencesService:
     """Service for managing hierarchical user preferences.
 
     Resolution order: User → Organization → System → Fallback
 
+    Each user's resolved preferences are loaded with one query and kept in the
+    process-wide PreferenceCache until a write invalidates them (see cache.py).
+
     Examples:
         >>> prefs = PreferencesService()
         >>> folder_id = await prefs.get(user.id, "google_drive.default_folder_id")
         >>> await prefs.set(user.id, "google_drive.default_folder_id", "abc123")
     """
 
-    def __init__(self, supabase_config: SupabaseConfig | None = None):
+    def __init__(
+        self, supabase_config: SupabaseConfig | None = None, cache: PreferenceCache | None = None
+    ):
         """Initialize preferences service.
 
         Args:
             supabase_config: Supabase configuration (creates new if not provided)
+            cache: Resolved preference cache (defaults to the process-wide cache)
         """
         self.supabase = SupabaseClient(supabase_config or SupabaseConfig())
+        self.cache = cache if cache is not None else get_preference_cache()
+
+    async def _fetch_resolved(
+        self,
+        user_id: UUID,
+        organization_id: UUID | None = None,
+        key: str | None = None,
+        category: str | None = None,
+    ) -> dict[str, ResolvedPreference]:
+        """Resolve preferences in one query, optionally for a single key or category."""
+        query = RESOLVE_QUERY
+        params: list[Any] = [user_id, organization_id]
+        if key is not None:
+            params.append(key)
+            query += f" WHERE d.key = ${len(params)}"
+        elif category is not None:
+            params.append(category)
+            query += f" WHERE d.category = ${len(params)}"
+        query += " ORDER BY d.category, d.key"
+
+        pool = await self.supabase._get_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(query, *params)
+        return {
+            row["key"]: ResolvedPreference(
+                key=row["key"],
+                category=row["category"],
+                value=row["value"],
+                source=row["source"],
+                is_user_configurable=bool(row["is_user_configurable"]),
+            )
+            for row in rows
+        }
+
+    async def _resolve(
+        self,
+        user_id: UUID,
+        organization_id: UUID | None = None,
+        key: str | None = None,
+        category: str | None = None,
+    ) -> dict[str, ResolvedPreference]:
+        """Resolved preferences from the cache, loading all of the user's on a miss.
+
+        With the cache disabled only the requested key or category is queried.
+        """
+        if not self.cache.enabled:
+            return await self._fetch_resolved(user_id, organization_id, key, category)
+
+        cached = self.cache.get(user_id, organization_id)
+        if cached is not None:
+            return cached
+
+        await start_preference_listener(self.supabase.db_url)
+        generation = self.cache.generation
+        resolved = await self._fetch_resolved(user_id, organization_id)
+        self.cache.put(user_id, organization_id, resolved, generation)
+        return resolved
 
     async def get(
         self, user_id: UUID, key: str, organization_id: UUID | None = None, default: Any = None
@@ -50,38 +135,14 @@ class PreferencesService:
             >>> temperature = await prefs.get(user.id, "llm.temperature", default=0.5)
         """
         try:
-            pool = await self.supabase._get_pool()
-            async with pool.acquire() as conn:
-                # 1. Check user preferences
-                user_pref = await conn.fetchrow(
-                    "SELECT value FROM user_preferences WHERE user_id = $1 AND preference_key = $2",
-                    user_id,
-                    key,
-                )
-                if user_pref:
-                    return user_pref["value"]
-
-                # 2. Check organization preferences (if org_id provided)
-                if organization_id:
-                    org_pref = await conn.fetchrow(
-                        "SELECT value FROM organization_preferences WHERE organization_id = $1 AND preference_key = $2",
-                        organization_id,
-                        key,
-                    )
-                    if org_pref:
-                        return org_pref["value"]
-
-                # 3. Fallback to system default
-                sys_pref = await conn.fetchrow(
-                    "SELECT default_value FROM preference_definitions WHERE key = $1", key
-                )
-                if sys_pref and sys_pref["default_value"] is not None:
-                    return sys_pref["default_value"]
+            resolved = (await self._resolve(user_id, organization_id, key=key)).get(key)
+            if resolved is not None and resolved.value is not None:
+                return resolved.value
         except Exception as e:
             # Log error but don't fail - use fallback
             print(f"Error fetching preference {key}: {e}")
 
-        # 4. Return provided default or fallback
+        # Return provided default or fallback
         if default is not None:
             return default
         return FALLBACK_DEFAULTS.get(key)
@@ -133,6 +194,7 @@ class PreferencesService:
                 key,
                 jsonb_value,
             )
+        self.cache.invalidate_user(user_id)
 
     async def get_all(
         self, user_id: UUID, category: str | None = None, organization_id: UUID | None = None
@@ -151,24 +213,12 @@ class PreferencesService:
             >>> all_prefs = await prefs.get_all(user.id)
             >>> drive_prefs = await prefs.get_all(user.id, category="google_drive")
         """
-        pool = await self.supabase._get_pool()
-        async with pool.acquire() as conn:
-            # Get all preference definitions
-            query = "SELECT * FROM preference_definitions WHERE is_user_configurable = true"
-            params = []
-            if category:
-                query += " AND category = $1"
-                params.append(category)
-
-            definitions = await conn.fetch(query, *params)
-
-            # Build result with hierarchy resolution
-            result = {}
-            for defn in definitions:
-                key = defn["key"]
-                result[key] = await self.get(user_id, key, organization_id)
-
-            return result
+        resolved = await self._resolve(user_id, organization_id, category=category)
+        return {
+            key: pref.value if pref.value is not None else FALLBACK_DEFAULTS.get(key)
+            for key, pref in resolved.items()
+            if pref.is_user_configurable and (category is None or pref.category == category)
+        }
 
     async def delete(self, user_id: UUID, key: str) -> None:
         """Delete user preference (reverts to system/org default).
@@ -188,6 +238,7 @@ class PreferencesService:
                 user_id,
                 key,
             )
+        self.cache.invalidate_user(user_id)
 
     async def get_definitions(
         self, category: str | None = None, user_configurable_only: bool = True
@@ -240,25 +291,5 @@ class PreferencesService:
         Returns:
             'user', 'organization', or 'system'
         """
-        pool = await self.supabase._get_pool()
-        async with pool.acquire() as conn:
-            # Check user preference
-            user_pref = await conn.fetchrow(
-                "SELECT 1 FROM user_preferences WHERE user_id = $1 AND preference_key = $2",
-                user_id,
-                key,
-            )
-            if user_pref:
-                return "user"
-
-            # Check organization preference
-            if organization_id:
-                org_pref = await conn.fetchrow(
-                    "SELECT 1 FROM organization_preferences WHERE organization_id = $1 AND preference_key = $2",
-                    organization_id,
-                    key,
-                )
-                if org_pref:
-                    return "organization"
-
-            return "system"
+        resolved = (await self._resolve(user_id, organization_id, key=key)).get(key)
+        return resolved.source if resolved is not None else "system"
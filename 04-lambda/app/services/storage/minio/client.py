@@ -1,20 +1,32 @@
 """MinIO storage client."""
 
-import asyncio
 import logging
+from collections.abc import AsyncIterator
 from uuid import UUID
 
 import boto3
 from botocore.exceptions import ClientError
 
 from .config import MinIOConfig
+from .s3 import AsyncS3, ObjectStream
 from .schemas import S3Object
 
 logger = logging.getLogger(__name__)
 
 
+async def _slices(data: bytes, size: int) -> AsyncIterator[memoryview]:
+    view = memoryview(data)
+    for offset in range(0, len(view), size):
+        yield view[offset : offset + size]
+
+
 class MinIOClient:
-    """Client for MinIO S3-compatible object storage."""
+    """Client for MinIO S3-compatible object storage.
+
+    The async methods talk to MinIO directly over aiohttp (see ``s3.AsyncS3``)
+    and stream bodies in chunks; boto3 is only used for presigned URLs and the
+    synchronous helpers.
+    """
 
     def __init__(self, config: MinIOConfig):
         """
@@ -25,6 +37,8 @@ class MinIOClient:
         """
         self.config = config
         self._s3_client: boto3.client | None = None
+        self._s3 = AsyncS3(config.endpoint, config.access_key, config.secret_key)
+        self._bucket_ready = False
 
     def _get_s3_client(self):
         """Get or create S3 client for MinIO."""
@@ -41,10 +55,36 @@ class MinIOClient:
 
         return self._s3_client
 
+    async def _ensure_bucket(self) -> None:
+        """Create the bucket if missing (checked once per client)."""
+        if self._bucket_ready:
+            return
+        bucket_name = self.config.bucket_name
+        try:
+            await self._s3.head_bucket(bucket_name)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "403", "NoSuchBucket"):
+                await self._s3.create_bucket(bucket_name)
+                logger.info(f"Created MinIO bucket: {bucket_name}")
+            else:
+                raise
+        self._bucket_ready = True
+
     def _get_user_prefix(self, user_id: UUID) -> str:
         """Get user folder prefix."""
         return f"user-{user_id}/"
 
+    @staticmethod
+    def _object_headers(
+        content_type: str | None, metadata: dict[str, str] | None
+    ) -> dict[str, str]:
+        headers = {}
+        if content_type:
+            headers["Content-Type"] = content_type
+        for name, value in (metadata or {}).items():
+            headers[f"x-amz-meta-{name}"] = value
+        return headers
+
     async def provision_user(self, user_id: UUID, email: str) -> None:
         """
         Create user folder structure in MinIO (JIT provisioning).
@@ -53,42 +93,28 @@ class MinIOClient:
             user_id: User UUID
             email: User email address (for logging)
         """
-        s3_client = self._get_s3_client()
         bucket_name = self.config.bucket_name
         folder_prefix = self._get_user_prefix(user_id)
         placeholder_key = f"{folder_prefix}.keep"
 
-        loop = asyncio.get_event_loop()
-
-        def check_and_create():
-            try:
-                # Ensure bucket exists
-                s3_client.head_bucket(Bucket=bucket_name)
-            except ClientError as e:
-                if e.response["Error"]["Code"] in ("404", "403"):
-                    s3_client.create_bucket(Bucket=bucket_name)
-                    logger.info(f"Created MinIO bucket: {bucket_name}")
-                else:
-                    raise
+        try:
+            await self._ensure_bucket()
 
             # Create placeholder file to establish folder
             try:
-                s3_client.head_object(Bucket=bucket_name, Key=placeholder_key)
+                await self._s3.head_object(bucket_name, placeholder_key)
                 logger.debug(f"User folder already exists for {email}")
             except ClientError as e:
                 if e.response["Error"]["Code"] == "404":
-                    s3_client.put_object(
-                        Bucket=bucket_name,
-                        Key=placeholder_key,
-                        Body=b"",
-                        Metadata={"user_email": email, "user_id": str(user_id)},
+                    await self._s3.put_object(
+                        bucket_name,
+                        placeholder_key,
+                        b"",
+                        self._object_headers(None, {"user_email": email, "user_id": str(user_id)}),
                     )
                     logger.info(f"Provisioned MinIO folder for user {email} (ID: {user_id})")
                 else:
                     raise
-
-        try:
-            await loop.run_in_executor(None, check_and_create)
         except Exception:
             logger.exception(f"Failed to provision MinIO folder for {email}")
             raise
@@ -104,6 +130,8 @@ class MinIOClient:
         """
         Upload a file to MinIO for a specific user.
 
+        Files above the multipart threshold are uploaded in parallel parts.
+
         Args:
             user_id: User UUID
             file_data: File content as bytes
@@ -114,42 +142,93 @@ class MinIOClient:
         Returns:
             Full object key (user-{uuid}/{object_key})
         """
-        s3_client = self._get_s3_client()
-        bucket_name = self.config.bucket_name
-        user_prefix = self._get_user_prefix(user_id)
-        full_key = f"{user_prefix}{object_key}"
+        part_size = self.config.part_size
+        return await self.upload_stream(
+            user_id,
+            _slices(file_data, part_size),
+            object_key,
+            content_type,
+            metadata,
+            part_size=part_size,
+        )
+
+    async def upload_stream(
+        self,
+        user_id: UUID,
+        chunks: AsyncIterator[bytes],
+        object_key: str,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+        *,
+        part_size: int | None = None,
+    ) -> str:
+        """
+        Upload a file for a specific user from an async stream of chunks.
 
-        loop = asyncio.get_event_loop()
+        The stream is consumed as it is uploaded: objects larger than the
+        multipart threshold are sent as multipart uploads with up to
+        ``max_concurrency`` parts in flight, so only those parts are held in memory.
 
-        def upload():
-            # Ensure bucket exists
-            try:
-                s3_client.head_bucket(Bucket=bucket_name)
-            except ClientError as e:
-                if e.response["Error"]["Code"] in ("404", "403"):
-                    s3_client.create_bucket(Bucket=bucket_name)
-                    logger.info(f"Created MinIO bucket: {bucket_name}")
-                else:
-                    raise
+        Args:
+            user_id: User UUID
+            chunks: File content as an async iterator of byte chunks
+            object_key: Object key (filename) within user folder
+            content_type: MIME type (optional)
+            metadata: Additional metadata (optional)
+            part_size: Multipart part size in bytes (default: config part_size, minimum 5 MiB)
+
+        Returns:
+            Full object key (user-{uuid}/{object_key})
+        """
+        full_key = f"{self._get_user_prefix(user_id)}{object_key}"
+
+        await self._ensure_bucket()
+        await self._s3.upload(
+            self.config.bucket_name,
+            full_key,
+            chunks,
+            self._object_headers(content_type, metadata),
+            threshold=self.config.multipart_threshold,
+            part_size=part_size or self.config.part_size,
+            concurrency=self.config.max_concurrency,
+        )
+        logger.info(f"Uploaded file {full_key} for user {user_id}")
+        return full_key
 
-            # Prepare extra args
-            extra_args = {}
-            if content_type:
-                extra_args["ContentType"] = content_type
-            if metadata:
-                extra_args["Metadata"] = metadata
+    async def open_file(
+        self,
+        user_id: UUID,
+        object_key: str,
+        start: int | None = None,
+        end: int | None = None,
+    ) -> ObjectStream:
+        """
+        Open a file for streaming, optionally only a byte range.
 
-            # Upload file
-            s3_client.put_object(Bucket=bucket_name, Key=full_key, Body=file_data, **extra_args)
-            logger.info(f"Uploaded file {full_key} for user {user_id}")
+        Args:
+            user_id: User UUID
+            object_key: Object key (filename) within user folder
+            start: First byte to read (optional)
+            end: Last byte to read, inclusive (optional)
 
-        await loop.run_in_executor(None, upload)
-        return full_key
+        Returns:
+            ObjectStream to iterate for chunks; close it if not read to the end
+        """
+        full_key = f"{self._get_user_prefix(user_id)}{object_key}"
+        return await self._s3.get_object(
+            self.config.bucket_name,
+            full_key,
+            start=start,
+            end=end,
+            chunk_size=self.config.download_chunk_size,
+        )
 
     async def download_file(self, user_id: UUID, object_key: str) -> bytes:
         """
         Download a file from MinIO for a specific user.
 
+        Prefer open_file() for large files, which streams instead of buffering.
+
         Args:
             user_id: User UUID
             object_key: Object key (filename) within user folder
@@ -157,19 +236,9 @@ class MinIOClient:
         Returns:
             File content as bytes
         """
-        s3_client = self._get_s3_client()
-        bucket_name = self.config.bucket_name
-        user_prefix = self._get_user_prefix(user_id)
-        full_key = f"{user_prefix}{object_key}"
-
-        loop = asyncio.get_event_loop()
-
-        def download():
-            response = s3_client.get_object(Bucket=bucket_name, Key=full_key)
-            return response["Body"].read()
-
-        file_data = await loop.run_in_executor(None, download)
-        logger.debug(f"Downloaded file {full_key} for user {user_id}")
+        stream = await self.open_file(user_id, object_key)
+        file_data = await stream.read()
+        logger.debug(f"Downloaded file {object_key} for user {user_id}")
         return file_data
 
     async def list_files(
@@ -186,42 +255,64 @@ class MinIOClient:
         Returns:
             List of S3Object metadata
         """
-        s3_client = self._get_s3_client()
-        bucket_name = self.config.bucket_name
         user_prefix = self._get_user_prefix(user_id)
         search_prefix = f"{user_prefix}{prefix}" if prefix else user_prefix
 
-        loop = asyncio.get_event_loop()
-
-        def list_objects():
-            response = s3_client.list_objects_v2(
-                Bucket=bucket_name, Prefix=search_prefix, MaxKeys=max_keys
-            )
+        objects = await self._s3.list_objects(
+            self.config.bucket_name, prefix=search_prefix, max_keys=max_keys
+        )
+        files = self._to_files(objects)
+        logger.debug(f"Listed {len(files)} files for user {user_id} with prefix {prefix}")
+        return files
 
-            files = []
-            if "Contents" in response:
-                for obj in response["Contents"]:
-                    # Skip the .keep placeholder file
-                    if obj["Key"].endswith("/.keep"):
-                        continue
-
-                    # Extract filename (remove user prefix)
-                    filename = obj["Key"][len(user_prefix) :]
-
-                    files.append(
-                        S3Object(
-                            key=obj["Key"],
-                            filename=filename,
-                            size=obj["Size"],
-                            last_modified=obj["LastModified"].isoformat(),
-                            etag=obj["ETag"].strip('"'),
-                        )
-                    )
+    async def list_files_page(
+        self,
+        user_id: UUID | None,
+        prefix: str | None = None,
+        max_keys: int = 100,
+        continuation_token: str | None = None,
+    ) -> tuple[list[S3Object], str | None]:
+        """
+        List one page of files, for a user or across all users.
 
-            return files
+        Args:
+            user_id: User UUID, or None for every user's files (admin listing)
+            prefix: Optional prefix to filter files (within the user folder, or
+                the whole bucket when user_id is None)
+            max_keys: Maximum number of keys to request for the page
+            continuation_token: Token returned for the previous page
 
-        files = await loop.run_in_executor(None, list_objects)
-        logger.debug(f"Listed {len(files)} files for user {user_id} with prefix {prefix}")
+        Returns:
+            The page's S3Object metadata and the token for the next page (None
+            on the last page). Placeholder files are skipped, so a page can hold
+            fewer than max_keys files.
+        """
+        user_prefix = self._get_user_prefix(user_id) if user_id else ""
+        objects, next_token = await self._s3.list_objects_page(
+            self.config.bucket_name,
+            prefix=f"{user_prefix}{prefix or ''}",
+            max_keys=max_keys,
+            continuation_token=continuation_token,
+        )
+        return self._to_files(objects), next_token
+
+    @staticmethod
+    def _to_files(objects: list[dict]) -> list[S3Object]:
+        """S3Object for each listed object in a user folder, skipping .keep placeholders."""
+        files = []
+        for obj in objects:
+            user_folder, _, filename = obj["Key"].partition("/")
+            if not user_folder.startswith("user-") or not filename or obj["Key"].endswith("/.keep"):
+                continue
+            files.append(
+                S3Object(
+                    key=obj["Key"],
+                    filename=filename,
+                    size=obj["Size"],
+                    last_modified=obj["LastModified"],
+                    etag=obj["ETag"].strip('"'),
+                )
+            )
         return files
 
     async def delete_file(self, user_id: UUID, object_key: str) -> bool:
@@ -235,26 +326,16 @@ class MinIOClient:
         Returns:
             True if deleted, False if not found
         """
-        s3_client = self._get_s3_client()
-        bucket_name = self.config.bucket_name
-        user_prefix = self._get_user_prefix(user_id)
-        full_key = f"{user_prefix}{object_key}"
-
-        loop = asyncio.get_event_loop()
-
-        def delete():
-            try:
-                s3_client.delete_object(Bucket=bucket_name, Key=full_key)
-                logger.info(f"Deleted file {full_key} for user {user_id}")
-                return True
-            except ClientError as e:
-                if e.response["Error"]["Code"] == "NoSuchKey":
-                    logger.warning(f"File {full_key} not found for deletion")
-                    return False
-                raise
-
-        result = await loop.run_in_executor(None, delete)
-        return result
+        full_key = f"{self._get_user_prefix(user_id)}{object_key}"
+        try:
+            await self._s3.delete_object(self.config.bucket_name, full_key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "NoSuchKey":
+                logger.warning(f"File {full_key} not found for deletion")
+                return False
+            raise
+        logger.info(f"Deleted file {full_key} for user {user_id}")
+        return True
 
     async def file_exists(self, user_id: UUID, object_key: str) -> bool:
         """
@@ -267,24 +348,14 @@ class MinIOClient:
         Returns:
             True if file exists, False otherwise
         """
-        s3_client = self._get_s3_client()
-        bucket_name = self.config.bucket_name
-        user_prefix = self._get_user_prefix(user_id)
-        full_key = f"{user_prefix}{object_key}"
-
-        loop = asyncio.get_event_loop()
-
-        def check_exists():
-            try:
-                s3_client.head_object(Bucket=bucket_name, Key=full_key)
-                return True
-            except ClientError as e:
-                if e.response["Error"]["Code"] == "404":
-                    return False
-                raise
-
-        exists = await loop.run_in_executor(None, check_exists)
-        return exists
+        full_key = f"{self._get_user_prefix(user_id)}{object_key}"
+        try:
+            await self._s3.head_object(self.config.bucket_name, full_key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "404":
+                return False
+            raise
+        return True
 
     async def get_presigned_url(
         self, user_id: UUID, object_key: str, expires_in: int = 3600
@@ -300,27 +371,18 @@ class MinIOClient:
         Returns:
             Presigned URL or None if generation fails
         """
-        s3_client = self._get_s3_client()
-        bucket_name = self.config.bucket_name
-        user_prefix = self._get_user_prefix(user_id)
-        full_key = f"{user_prefix}{object_key}"
+        full_key = f"{self._get_user_prefix(user_id)}{object_key}"
 
-        loop = asyncio.get_event_loop()
-
-        def generate_url():
-            try:
-                url = s3_client.generate_presigned_url(
-                    "get_object",
-                    Params={"Bucket": bucket_name, "Key": full_key},
-                    ExpiresIn=expires_in,
-                )
-                return url
-            except Exception:
-                logger.exception(f"Failed to generate presigned URL for {full_key}")
-                return None
-
-        url = await loop.run_in_executor(None, generate_url)
-        return url
+        # Signing is local computation, no request is made
+        try:
+            return self._get_s3_client().generate_presigned_url(
+                "get_object",
+                Params={"Bucket": self.config.bucket_name, "Key": full_key},
+                ExpiresIn=expires_in,
+            )
+        except Exception:
+            logger.exception(f"Failed to generate presigned URL for {full_key}")
+            return None
 
     def user_folder_exists(self, user_id: UUID) -> bool:
         """
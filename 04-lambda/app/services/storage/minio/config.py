@@ -13,6 +13,9 @@ class MinIOConfig(BaseSettings):
         MINIO_SECRET_KEY: Secret access key (falls back to MINIO_ROOT_PASSWORD)
         MINIO_BUCKET_NAME: Bucket for user data (default: user-data)
         MINIO_USE_SSL: Use SSL for connections (default: false)
+        MINIO_MULTIPART_THRESHOLD: Uploads above this many bytes use multipart (default: 8 MiB)
+        MINIO_PART_SIZE: Multipart part size in bytes, at least 5 MiB (default: 8 MiB)
+        MINIO_MAX_CONCURRENCY: Parts uploaded at once per upload (default: 4)
     """
 
     model_config = SettingsConfigDict(
@@ -46,3 +49,23 @@ class MinIOConfig(BaseSettings):
         validation_alias="MINIO_USE_SSL",
         description="Use SSL for MinIO connections",
     )
+    multipart_threshold: int = Field(
+        default=8 * 1024 * 1024,
+        validation_alias="MINIO_MULTIPART_THRESHOLD",
+        description="Uploads larger than this (bytes) use multipart upload",
+    )
+    part_size: int = Field(
+        default=8 * 1024 * 1024,
+        validation_alias="MINIO_PART_SIZE",
+        description="Multipart upload part size in bytes (minimum 5 MiB)",
+    )
+    max_concurrency: int = Field(
+        default=4,
+        validation_alias="MINIO_MAX_CONCURRENCY",
+        description="Multipart parts uploaded in parallel per upload",
+    )
+    download_chunk_size: int = Field(
+        default=256 * 1024,
+        validation_alias="MINIO_DOWNLOAD_CHUNK_SIZE",
+        description="Chunk size in bytes when streaming downloads",
+    )
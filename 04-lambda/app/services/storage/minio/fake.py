@@ -0,0 +1,303 @@
+"""Local S3-compatible stand-in for MinIO, for offline tests and benchmarks.
+
+FakeS3 serves the S3 operations MinIOClient uses on a random localhost port,
+keeping objects in memory: bucket HEAD/PUT, object PUT/GET (with Range)/HEAD/
+DELETE, ListObjectsV2 and multipart create/upload part/complete/abort.
+Signatures are not checked.
+
+Usage:
+    async with FakeS3() as s3:
+        client = MinIOClient(MinIOConfig(MINIO_ENDPOINT=s3.url, ...))
+"""
+
+import asyncio
+import hashlib
+import itertools
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape
+
+from aiohttp import web
+
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>'
+S3_XMLNS = "http://s3.amazonaws.com/doc/2006-03-01/"
+
+
+@dataclass
+class StoredObject:
+    data: bytes
+    content_type: str
+    metadata: dict[str, str]
+    etag: str
+    last_modified: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+def _error(status: int, code: str, message: str = "") -> web.Response:
+    body = f"{XML_HEADER}<Error><Code>{code}</Code><Message>{escape(message)}</Message></Error>"
+    return web.Response(status=status, body=body.encode(), content_type="application/xml")
+
+
+def _xml(body: str) -> web.Response:
+    return web.Response(body=(XML_HEADER + body).encode(), content_type="application/xml")
+
+
+class FakeS3:
+    """aiohttp server emulating the subset of the S3 API MinIOClient uses."""
+
+    def __init__(self, part_delay: float = 0.0, fail_part: int | None = None):
+        """
+        Configure the fake (call start() or use ``async with`` to serve).
+
+        Args:
+            part_delay: Seconds each UploadPart takes (to observe parallel parts)
+            fail_part: Part number to reject with a 500 error
+        """
+        self.part_delay = part_delay
+        self.fail_part = fail_part
+        self.buckets: dict[str, dict[str, StoredObject]] = {}
+        self.uploads: dict[str, dict] = {}
+        self.aborted: list[str] = []
+        self.requests: list[tuple[str, str]] = []
+        self.parts_in_flight = 0
+        self.max_parts_in_flight = 0
+        self._ids = itertools.count(1)
+        self._runner: web.AppRunner | None = None
+        self._port: int | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._port}"
+
+    def operations(self, name: str) -> int:
+        """Number of requests served for an operation name (e.g. "UploadPart")."""
+        return sum(1 for operation, _ in self.requests if operation == name)
+
+    async def start(self) -> None:
+        app = web.Application(client_max_size=1024**3)
+        app.router.add_route("*", "/{bucket}", self._bucket)
+        app.router.add_route("*", "/{bucket}/{key:.+}", self._object)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", self._port or 0)
+        await site.start()
+        self._port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "FakeS3":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    # ========== Buckets ==========
+
+    async def _bucket(self, request: web.Request) -> web.StreamResponse:
+        bucket = request.match_info["bucket"]
+        if request.method == "PUT":
+            self.requests.append(("CreateBucket", bucket))
+            self.buckets.setdefault(bucket, {})
+            return web.Response()
+        if bucket not in self.buckets:
+            return _error(404, "NoSuchBucket", bucket)
+        if request.method == "HEAD":
+            self.requests.append(("HeadBucket", bucket))
+            return web.Response()
+        if request.method == "GET" and request.query.get("list-type") == "2":
+            self.requests.append(("ListObjectsV2", bucket))
+            return self._list(bucket, request.query)
+        return _error(405, "MethodNotAllowed")
+
+    def _list(self, bucket: str, query) -> web.Response:
+        prefix = query.get("prefix", "")
+        max_keys = int(query.get("max-keys", "1000"))
+        after = query.get("continuation-token") or query.get("start-after") or ""
+        keys = sorted(k for k in self.buckets[bucket] if k.startswith(prefix) and k > after)
+        page, truncated = keys[:max_keys], len(keys) > max_keys
+        contents = "".join(
+            f"<Contents><Key>{escape(key)}</Key>"
+            f"<LastModified>{obj.last_modified.isoformat()}</LastModified>"
+            f"<ETag>&quot;{obj.etag}&quot;</ETag><Size>{len(obj.data)}</Size></Contents>"
+            for key in page
+            for obj in [self.buckets[bucket][key]]
+        )
+        token = f"<NextContinuationToken>{escape(page[-1])}</NextContinuationToken>"
+        return _xml(
+            f'<ListBucketResult xmlns="{S3_XMLNS}"><Name>{bucket}</Name>'
+            f"<Prefix>{escape(prefix)}</Prefix><KeyCount>{len(page)}</KeyCount>"
+            f"<IsTruncated>{'true' if truncated else 'false'}</IsTruncated>"
+            f"{token if truncated else ''}{contents}</ListBucketResult>"
+        )
+
+    # ========== Objects ==========
+
+    async def _object(self, request: web.Request) -> web.StreamResponse:
+        bucket, key = request.match_info["bucket"], request.match_info["key"]
+        if bucket not in self.buckets:
+            return _error(404, "NoSuchBucket", bucket)
+        if "uploads" in request.query or "uploadId" in request.query:
+            return await self._multipart(request, bucket, key)
+        handler = {
+            "PUT": self._put,
+            "GET": self._get,
+            "HEAD": self._head,
+            "DELETE": self._delete,
+        }.get(request.method)
+        if handler is None:
+            return _error(405, "MethodNotAllowed")
+        return await handler(request, self.buckets[bucket], key)
+
+    async def _put(self, request: web.Request, objects: dict, key: str) -> web.Response:
+        self.requests.append(("PutObject", key))
+        data = await request.read()
+        objects[key] = StoredObject(
+            data, *self._object_attributes(request), hashlib.md5(data).hexdigest()
+        )
+        return web.Response(headers={"ETag": f'"{objects[key].etag}"'})
+
+    async def _delete(self, _request: web.Request, objects: dict, key: str) -> web.Response:
+        self.requests.append(("DeleteObject", key))
+        objects.pop(key, None)
+        return web.Response(status=204)
+
+    async def _head(self, _request: web.Request, objects: dict, key: str) -> web.Response:
+        self.requests.append(("HeadObject", key))
+        obj = objects.get(key)
+        if obj is None:
+            return web.Response(status=404)
+        return web.Response(headers={**self._headers(obj), "Content-Length": str(len(obj.data))})
+
+    @staticmethod
+    def _object_attributes(request: web.Request) -> tuple[str, dict[str, str]]:
+        metadata = {
+            name[len("x-amz-meta-") :]: value
+            for name, value in request.headers.items()
+            if name.lower().startswith("x-amz-meta-")
+        }
+        return request.headers.get("Content-Type", "binary/octet-stream"), metadata
+
+    @staticmethod
+    def _headers(obj: StoredObject) -> dict[str, str]:
+        headers = {
+            "Content-Type": obj.content_type,
+            "ETag": f'"{obj.etag}"',
+            "Last-Modified": obj.last_modified.strftime("%a, %d %b %Y %H:%M:%S GMT"),
+            "Accept-Ranges": "bytes",
+        }
+        headers.update({f"x-amz-meta-{name}": value for name, value in obj.metadata.items()})
+        return headers
+
+    async def _get(self, request: web.Request, objects: dict, key: str) -> web.StreamResponse:
+        self.requests.append(("GetObject", key))
+        obj = objects.get(key)
+        if obj is None:
+            return _error(404, "NoSuchKey", key)
+        size = len(obj.data)
+        start, end, status = 0, size - 1, 200
+        headers = self._headers(obj)
+        match = re.fullmatch(r"bytes=(\d*)-(\d*)", request.headers.get("Range", ""))
+        if match and (match[1] or match[2]):
+            if match[1]:
+                start, end = int(match[1]), int(match[2]) if match[2] else size - 1
+            else:
+                start = max(size - int(match[2]), 0)
+            end = min(end, size - 1)
+            if start >= size or start > end:
+                return _error(416, "InvalidRange")
+            status = 206
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response = web.StreamResponse(status=status, headers=headers)
+        response.content_length = end - start + 1
+        await response.prepare(request)
+        for offset in range(start, end + 1, 64 * 1024):
+            await response.write(obj.data[offset : min(offset + 64 * 1024, end + 1)])
+        await response.write_eof()
+        return response
+
+    # ========== Multipart ==========
+
+    async def _multipart(self, request: web.Request, bucket: str, key: str) -> web.Response:
+        query = request.query
+        if request.method == "POST" and "uploads" in query:
+            return self._create_upload(request, bucket, key)
+        upload_id = query.get("uploadId", "")
+        upload = self.uploads.get(upload_id)
+        if upload is None:
+            return _error(404, "NoSuchUpload", upload_id)
+        if request.method == "PUT":
+            return await self._upload_part(request, upload)
+        if request.method == "POST":
+            return await self._complete_upload(request, upload_id, upload)
+        if request.method == "DELETE":
+            self.requests.append(("AbortMultipartUpload", key))
+            self.aborted.append(upload_id)
+            del self.uploads[upload_id]
+            return web.Response(status=204)
+        return _error(405, "MethodNotAllowed")
+
+    def _create_upload(self, request: web.Request, bucket: str, key: str) -> web.Response:
+        self.requests.append(("CreateMultipartUpload", key))
+        upload_id = f"upload-{next(self._ids)}"
+        content_type, metadata = self._object_attributes(request)
+        self.uploads[upload_id] = {
+            "bucket": bucket,
+            "key": key,
+            "content_type": content_type,
+            "metadata": metadata,
+            "parts": {},
+        }
+        return _xml(
+            f'<InitiateMultipartUploadResult xmlns="{S3_XMLNS}"><Bucket>{bucket}</Bucket>'
+            f"<Key>{escape(key)}</Key><UploadId>{upload_id}</UploadId>"
+            "</InitiateMultipartUploadResult>"
+        )
+
+    async def _upload_part(self, request: web.Request, upload: dict) -> web.Response:
+        number = int(request.query["partNumber"])
+        self.requests.append(("UploadPart", upload["key"]))
+        self.parts_in_flight += 1
+        self.max_parts_in_flight = max(self.max_parts_in_flight, self.parts_in_flight)
+        try:
+            data = await request.read()
+            await asyncio.sleep(self.part_delay)
+        finally:
+            self.parts_in_flight -= 1
+        if number == self.fail_part:
+            return _error(500, "InternalError", f"part {number} failed")
+        etag = hashlib.md5(data).hexdigest()
+        upload["parts"][number] = (etag, data)
+        return web.Response(headers={"ETag": f'"{etag}"'})
+
+    async def _complete_upload(
+        self, request: web.Request, upload_id: str, upload: dict
+    ) -> web.Response:
+        self.requests.append(("CompleteMultipartUpload", upload["key"]))
+        body = (await request.read()).decode()
+        listed = [
+            (int(number), etag.strip('"'))
+            for number, etag in re.findall(
+                r"<PartNumber>(\d+)</PartNumber><ETag>([^<]+)</ETag>", body
+            )
+        ]
+        parts = upload["parts"]
+        if not listed or any(parts.get(n, ("",))[0] != etag for n, etag in listed):
+            return _error(400, "InvalidPart")
+        data = b"".join(parts[n][1] for n, _ in listed)
+        digests = b"".join(bytes.fromhex(parts[n][0]) for n, _ in listed)
+        etag = f"{hashlib.md5(digests).hexdigest()}-{len(listed)}"
+        self.buckets[upload["bucket"]][upload["key"]] = StoredObject(
+            data, upload["content_type"], upload["metadata"], etag
+        )
+        del self.uploads[upload_id]
+        return _xml(
+            f'<CompleteMultipartUploadResult xmlns="{S3_XMLNS}"><Key>{escape(upload["key"])}</Key>'
+            f"<ETag>&quot;{etag}&quot;</ETag></CompleteMultipartUploadResult>"
+        )
+
+
+__all__ = ["FakeS3", "StoredObject"]
@@ -1,13 +1,47 @@
 """MinIO storage router."""
 
-from fastapi import APIRouter, HTTPException
+import re
+
+from app.services.auth.dependencies import get_current_user
+from app.services.auth.models import User
+from botocore.exceptions import ClientError
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from starlette.background import BackgroundTask
 
 from .client import MinIOClient
 from .config import MinIOConfig
 
 router = APIRouter(prefix="/minio", tags=["MinIO"])
 
+_client: MinIOClient | None = None
+
+
+def get_minio_client() -> MinIOClient:
+    """Get the MinIO client for downloads (singleton)."""
+    global _client
+    if _client is None:
+        try:
+            _client = MinIOClient(MinIOConfig())
+        except Exception as e:
+            raise HTTPException(status_code=503, detail=f"MinIO not configured: {e!s}") from e
+    return _client
+
+
+def _parse_range(header: str | None) -> tuple[int | None, int | None] | None:
+    """Parse a single "bytes=start-end" range (suffix ranges are not supported)."""
+    if not header:
+        return None
+    match = re.fullmatch(r"bytes=(\d+)-(\d*)", header.strip())
+    if match is None:
+        raise HTTPException(status_code=416, detail="Unsupported Range header")
+    start = int(match[1])
+    end = int(match[2]) if match[2] else None
+    if end is not None and end < start:
+        raise HTTPException(status_code=416, detail="Invalid Range header")
+    return start, end
+
 
 class HealthResponse(BaseModel):
     """Health check response."""
@@ -32,3 +66,49 @@ async def health_check():
         return HealthResponse(status="healthy", service="minio")
     except Exception as e:
         raise HTTPException(status_code=503, detail=f"MinIO unavailable: {e!s}")
+
+
+@router.get("/files/{object_key:path}")
+async def download_file(
+    object_key: str,
+    range_header: str | None = Header(default=None, alias="Range"),
+    user: User = Depends(get_current_user),
+    client: MinIOClient = Depends(get_minio_client),
+):
+    """
+    Stream one of the current user's files.
+
+    The body is passed through from MinIO chunk by chunk, so large files are
+    never held in memory. A ``Range: bytes=start-end`` header returns 206 with
+    just that range (for seeking in video players and resuming downloads).
+    """
+    byte_range = _parse_range(range_header)
+    start, end = byte_range or (None, None)
+    try:
+        stream = await client.open_file(user.id, object_key, start=start, end=end)
+    except ClientError as e:
+        code = e.response["Error"]["Code"]
+        if code in ("NoSuchKey", "404"):
+            raise HTTPException(status_code=404, detail="File not found") from e
+        if code == "InvalidRange":
+            raise HTTPException(status_code=416, detail="Range not satisfiable") from e
+        raise
+
+    headers = {"Accept-Ranges": "bytes"}
+    if stream.content_length is not None:
+        headers["Content-Length"] = str(stream.content_length)
+    if stream.content_range:
+        headers["Content-Range"] = stream.content_range
+    if stream.etag:
+        headers["ETag"] = stream.etag
+    if stream.last_modified:
+        headers["Last-Modified"] = stream.last_modified
+
+    return StreamingResponse(
+        stream,
+        status_code=206 if stream.content_range else 200,
+        media_type=stream.content_type or "application/octet-stream",
+        headers=headers,
+        # Release the MinIO connection even if the body was not read to the end
+        background=BackgroundTask(stream.close),
+    )
@@ -0,0 +1,397 @@
+"""Async S3 requests for MinIO over aiohttp.
+
+Requests are signed with botocore's SigV4 signer (payloads are sent unsigned,
+as boto3 does for streaming uploads) and sent on a process-wide aiohttp session,
+so no call needs a thread: bodies stream from and to async chunk iterators.
+
+Errors are raised as botocore ClientError with the S3 error code, like boto3,
+so ``e.response["Error"]["Code"]`` checks keep working.
+"""
+
+import asyncio
+import contextlib
+import logging
+import xml.etree.ElementTree as ET
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import quote
+
+import aiohttp
+from botocore.auth import S3SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
+from botocore.exceptions import ClientError
+from yarl import URL
+
+logger = logging.getLogger(__name__)
+
+S3_NAMESPACE = "{http://s3.amazonaws.com/doc/2006-03-01/}"
+
+# Smallest part S3 accepts in a multipart upload (except the last one)
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the process-wide session for MinIO requests (pooled connections)."""
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=None, connect=10, sock_read=60),
+            connector=aiohttp.TCPConnector(limit=64),
+            auto_decompress=False,
+        )
+        _session_loop = loop
+    return _session
+
+
+async def close_http_session() -> None:
+    """Close the shared MinIO session (application shutdown)."""
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+
+class _UnsignedPayloadAuth(S3SigV4Auth):
+    def _should_sha256_sign_payload(self, _request):
+        return False
+
+
+@dataclass
+class ObjectStream:
+    """An open GET response; iterate it for the body and close() it when done."""
+
+    response: aiohttp.ClientResponse
+    chunk_size: int
+    content_length: int | None
+    total_size: int | None
+    content_type: str | None
+    etag: str | None
+    content_range: str | None
+    last_modified: str | None
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self.response.content.iter_chunked(self.chunk_size):
+                yield chunk
+        finally:
+            await self.close()
+
+    async def read(self) -> bytes:
+        try:
+            return await self.response.read()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        self.response.release()
+
+
+class AsyncS3:
+    """Minimal async S3 client (the operations MinIOClient uses)."""
+
+    def __init__(self, endpoint: str, access_key: str, secret_key: str, region: str = "us-east-1"):
+        self.endpoint = endpoint.rstrip("/")
+        self.region = region
+        self._credentials = Credentials(access_key, secret_key)
+
+    def _url(self, bucket: str, key: str = "", params: dict[str, str] | None = None) -> str:
+        url = f"{self.endpoint}/{bucket}"
+        if key:
+            url += "/" + quote(key, safe="/-_.~")
+        if params:
+            url += "?" + "&".join(
+                f"{quote(name, safe='-_.~')}={quote(str(value), safe='-_.~')}"
+                if value is not None
+                else quote(name, safe="-_.~")
+                for name, value in sorted(params.items())
+            )
+        return url
+
+    def _sign(self, method: str, url: str, headers: dict[str, str]) -> dict[str, str]:
+        request = AWSRequest(method=method, url=url, headers=headers)
+        _UnsignedPayloadAuth(self._credentials, "s3", self.region).add_auth(request)
+        return dict(request.headers.items())
+
+    async def send(
+        self,
+        method: str,
+        bucket: str,
+        key: str = "",
+        *,
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        data: Any = None,
+        operation: str = "Request",
+    ) -> aiohttp.ClientResponse:
+        """Send a signed request; error statuses raise ClientError. The caller releases the response."""
+        url = self._url(bucket, key, params)
+        signed = self._sign(method, url, dict(headers or {}))
+        response = await get_http_session().request(
+            method, URL(url, encoded=True), headers=signed, data=data
+        )
+        if response.status >= 300:
+            try:
+                raise await self._error(response, operation)
+            finally:
+                response.release()
+        return response
+
+    @contextlib.asynccontextmanager
+    async def request(
+        self, method: str, bucket: str, key: str = "", **kwargs
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """send() as a context manager that releases the response."""
+        response = await self.send(method, bucket, key, **kwargs)
+        try:
+            yield response
+        finally:
+            response.release()
+
+    async def _error(self, response: aiohttp.ClientResponse, operation: str) -> ClientError:
+        code, message = str(response.status), response.reason or ""
+        body = await response.read() if response.method != "HEAD" else b""
+        if body:
+            with contextlib.suppress(ET.ParseError):
+                root = ET.fromstring(body)
+                code = root.findtext("Code") or code
+                message = root.findtext("Message") or message
+        error = {
+            "Error": {"Code": code, "Message": message},
+            "ResponseMetadata": {"HTTPStatusCode": response.status},
+        }
+        return ClientError(error, operation)
+
+    # ========== Buckets ==========
+
+    async def head_bucket(self, bucket: str) -> None:
+        async with self.request("HEAD", bucket, operation="HeadBucket"):
+            pass
+
+    async def create_bucket(self, bucket: str) -> None:
+        async with self.request("PUT", bucket, operation="CreateBucket"):
+            pass
+
+    async def list_objects(
+        self, bucket: str, prefix: str = "", max_keys: int = 1000, start_after: str | None = None
+    ) -> list[dict[str, Any]]:
+        """ListObjectsV2, following continuation tokens up to max_keys objects."""
+        objects: list[dict[str, Any]] = []
+        token = None
+        while len(objects) < max_keys:
+            page, token = await self.list_objects_page(
+                bucket,
+                prefix,
+                max_keys - len(objects),
+                continuation_token=token,
+                start_after=None if token else start_after,
+            )
+            objects.extend(page)
+            if not token:
+                break
+        return objects
+
+    async def list_objects_page(
+        self,
+        bucket: str,
+        prefix: str = "",
+        max_keys: int = 1000,
+        continuation_token: str | None = None,
+        start_after: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """One ListObjectsV2 request: up to max_keys objects and the next continuation token."""
+        params = {"list-type": "2", "prefix": prefix, "max-keys": str(max_keys)}
+        if continuation_token:
+            params["continuation-token"] = continuation_token
+        elif start_after:
+            params["start-after"] = start_after
+        async with self.request("GET", bucket, params=params, operation="ListObjectsV2") as r:
+            root = ET.fromstring(await r.read())
+        objects = [
+            {
+                "Key": item.findtext(f"{S3_NAMESPACE}Key"),
+                "Size": int(item.findtext(f"{S3_NAMESPACE}Size") or 0),
+                "LastModified": item.findtext(f"{S3_NAMESPACE}LastModified"),
+                "ETag": item.findtext(f"{S3_NAMESPACE}ETag") or "",
+            }
+            for item in root.iter(f"{S3_NAMESPACE}Contents")
+        ]
+        token = root.findtext(f"{S3_NAMESPACE}NextContinuationToken")
+        if root.findtext(f"{S3_NAMESPACE}IsTruncated") != "true":
+            token = None
+        return objects, token or None
+
+    # ========== Objects ==========
+
+    async def head_object(self, bucket: str, key: str) -> dict[str, str]:
+        async with self.request("HEAD", bucket, key, operation="HeadObject") as response:
+            return dict(response.headers)
+
+    async def delete_object(self, bucket: str, key: str) -> None:
+        async with self.request("DELETE", bucket, key, operation="DeleteObject"):
+            pass
+
+    async def put_object(
+        self, bucket: str, key: str, body: bytes | memoryview, headers: dict[str, str]
+    ) -> str:
+        async with self.request(
+            "PUT", bucket, key, headers=headers, data=body, operation="PutObject"
+        ) as response:
+            return response.headers.get("ETag", "")
+
+    async def get_object(
+        self,
+        bucket: str,
+        key: str,
+        start: int | None = None,
+        end: int | None = None,
+        chunk_size: int = 256 * 1024,
+    ) -> ObjectStream:
+        """
+        Open an object for streaming, optionally a byte range (inclusive ``end``).
+
+        The caller must iterate the returned stream to the end or close() it.
+        """
+        headers = {}
+        if start is not None or end is not None:
+            headers["Range"] = f"bytes={start or 0}-{'' if end is None else end}"
+        response = await self.send("GET", bucket, key, headers=headers, operation="GetObject")
+        content_range = response.headers.get("Content-Range")
+        content_length = response.content_length
+        total_size = content_length
+        if content_range and "/" in content_range:
+            total = content_range.rsplit("/", 1)[1]
+            total_size = int(total) if total.isdigit() else None
+        return ObjectStream(
+            response=response,
+            chunk_size=chunk_size,
+            content_length=content_length,
+            total_size=total_size,
+            content_type=response.headers.get("Content-Type"),
+            etag=response.headers.get("ETag"),
+            content_range=content_range,
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    # ========== Uploads ==========
+
+    async def upload(
+        self,
+        bucket: str,
+        key: str,
+        chunks: AsyncIterator[bytes | memoryview],
+        headers: dict[str, str],
+        *,
+        threshold: int,
+        part_size: int,
+        concurrency: int,
+    ) -> None:
+        """
+        Upload a stream: one PUT up to ``threshold`` bytes, a multipart upload above.
+
+        Parts of ``part_size`` are uploaded ``concurrency`` at a time while the
+        stream is read; at most ``concurrency + 1`` parts are held in memory.
+        """
+        part_size = max(part_size, MIN_PART_SIZE)
+        buffer = bytearray()
+        iterator = chunks.__aiter__()
+        async for chunk in iterator:
+            buffer += chunk
+            if len(buffer) > threshold:
+                break
+        else:
+            await self.put_object(bucket, key, bytes(buffer), headers)
+            return
+
+        async with self.request(
+            "POST",
+            bucket,
+            key,
+            params={"uploads": None},
+            headers=headers,
+            operation="CreateMultipartUpload",
+        ) as response:
+            upload_id = ET.fromstring(await response.read()).findtext(f"{S3_NAMESPACE}UploadId")
+
+        slots = asyncio.Semaphore(concurrency)
+        etags: dict[int, str] = {}
+        tasks: list[asyncio.Task] = []
+
+        async def upload_part(number: int, body: bytes) -> None:
+            try:
+                async with self.request(
+                    "PUT",
+                    bucket,
+                    key,
+                    params={"partNumber": str(number), "uploadId": upload_id},
+                    data=body,
+                    operation="UploadPart",
+                ) as part_response:
+                    etags[number] = part_response.headers["ETag"]
+            finally:
+                slots.release()
+
+        async def submit_part(body: bytes) -> None:
+            await slots.acquire()
+            # Surface a failed part before reading further
+            for task in tasks:
+                if task.done() and task.exception():
+                    slots.release()
+                    raise task.exception()
+            tasks.append(asyncio.create_task(upload_part(len(tasks) + 1, body)))
+
+        try:
+            while True:
+                while len(buffer) >= part_size:
+                    await submit_part(bytes(buffer[:part_size]))
+                    del buffer[:part_size]
+                chunk = await anext(iterator, None)
+                if chunk is None:
+                    break
+                buffer += chunk
+            if buffer or not tasks:
+                await submit_part(bytes(buffer))
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            with contextlib.suppress(Exception):
+                await asyncio.shield(self._abort(bucket, key, upload_id))
+            raise
+
+        body = "".join(
+            f"<Part><PartNumber>{number}</PartNumber><ETag>{etag}</ETag></Part>"
+            for number, etag in sorted(etags.items())
+        )
+        async with self.request(
+            "POST",
+            bucket,
+            key,
+            params={"uploadId": upload_id},
+            data=f"<CompleteMultipartUpload>{body}</CompleteMultipartUpload>".encode(),
+            operation="CompleteMultipartUpload",
+        ) as response:
+            # Errors after the 200 status line are reported in the body
+            root = ET.fromstring(await response.read())
+            if root.tag == "Error":
+                raise ClientError(
+                    {"Error": {"Code": root.findtext("Code"), "Message": root.findtext("Message")}},
+                    "CompleteMultipartUpload",
+                )
+
+    async def _abort(self, bucket: str, key: str, upload_id: str) -> None:
+        async with self.request(
+            "DELETE",
+            bucket,
+            key,
+            params={"uploadId": upload_id},
+            operation="AbortMultipartUpload",
+        ):
+            pass
@@ -37,8 +37,11 @@ from app.capabilities.retrieval.mongo_rag.ingestion.chunker import (
     DocumentChunk,
     create_chunker,
 )
+from app.capabilities.retrieval.mongo_rag.config import config as rag_config
 from app.capabilities.retrieval.mongo_rag.ingestion.embedder import create_embedder
 from app.capabilities.retrieval.mongo_rag.ingestion.pipeline import IngestionResult
+from app.capabilities.retrieval.mongo_rag.quantization import encode_embedding
+from app.capabilities.retrieval.mongo_rag.vector_index.service import notify_chunks_inserted
 from pymongo import AsyncMongoClient
 from app.workflows.ingestion.crawl4ai_rag.config import config
 
@@ -483,8 +486,15 @@ class CrawledContentIngester:
         for chunk in chunks:
             chunk_dict = {
                 "document_id": document_id,
+                # Denormalized so search results need no documents lookup
+                "document_title": title,
+                "document_source": source,
                 "content": chunk.content,
-                "embedding": chunk.embedding,  # Python list
+                **encode_embedding(
+                    chunk.embedding,
+                    rag_config.embedding_storage,
+                    rag_config.embedding_keep_full_precision,
+                ),
                 "chunk_index": chunk.index,
                 "metadata": chunk.metadata,
                 "token_count": chunk.token_count,
@@ -496,5 +506,6 @@ class CrawledContentIngester:
         if chunk_dicts:
             await chunks_collection.insert_many(chunk_dicts, ordered=False)
             logger.info(f"Inserted {len(chunk_dicts)} chunks")
+            notify_chunks_inserted(chunk_dicts)
 
         return str(document_id)
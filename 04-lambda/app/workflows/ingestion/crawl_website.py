@@ -12,6 +12,9 @@ import sys
 sys.path.insert(0, "/app")
 
 from pydantic_ai import RunContext
+from app.capabilities.retrieval.graphiti_rag.ingestion.queue import (
+    shutdown_graphiti_ingestion_queue,
+)
 from app.workflows.ingestion.crawl4ai_rag.ai.dependencies import Crawl4AIDependencies
 from app.workflows.ingestion.crawl4ai_rag.tools import crawl_and_ingest_deep
 
@@ -63,6 +66,8 @@ async def main():
                 print(f"     - {error}")
 
     finally:
+        # Pages are searchable already; wait for Graphiti enrichment before exiting
+        await shutdown_graphiti_ingestion_queue()
         await deps.cleanup()
 
 
@@ -10,19 +10,40 @@ logger = logging.getLogger(__name__)
 
 
 class OpenWebUIClient:
-    """Client for interacting with Open WebUI API."""
-
-    def __init__(self, api_url: str | None = None, api_key: str | None = None):
+    """
+    Client for interacting with Open WebUI API.
+
+    Requests share one pooled httpx.AsyncClient (created on first use), so
+    concurrent calls reuse connections instead of opening a client per call.
+    Call close() (or use ``async with``) when done.
+    """
+
+    def __init__(
+        self,
+        api_url: str | None = None,
+        api_key: str | None = None,
+        *,
+        max_connections: int | None = None,
+        timeout: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
         """
         Initialize Open WebUI client.
 
         Args:
             api_url: Open WebUI API URL (defaults to config)
             api_key: API key for authentication (optional)
+            max_connections: Connection pool size (defaults to OPENWEBUI_SYNC_CONCURRENCY)
+            timeout: Seconds per request
+            transport: httpx transport (e.g. FakeOpenWebUI.transport() in tests)
         """
-        self.api_url = api_url or config.openwebui_api_url
+        self.api_url = api_url or config.openwebui_url
         self.api_key = api_key or config.openwebui_api_key
         self.base_url = f"{self.api_url.rstrip('/')}/api/v1"
+        self.max_connections = max_connections or config.openwebui_sync_concurrency
+        self.timeout = timeout
+        self._transport = transport
+        self._http: httpx.AsyncClient | None = None
 
     def _get_headers(self) -> dict[str, str]:
         """Get request headers with authentication if available."""
@@ -31,6 +52,83 @@ class OpenWebUIClient:
             headers["Authorization"] = f"Bearer {self.api_key}"
         return headers
 
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """The shared HTTP client."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._get_headers(),
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self._transport,
+            )
+        return self._http
+
+    async def close(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def __aenter__(self) -> "OpenWebUIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def list_users(self, skip: int = 0, limit: int = 100) -> list[dict[str, Any]]:
+        """
+        Get a page of Open WebUI users (admin API key required).
+
+        Args:
+            skip: Users to skip
+            limit: Maximum number of users to return
+
+        Returns:
+            List of user dictionaries (id, name, email, role)
+        """
+        response = await self.http.get("/users/", params={"skip": skip, "limit": limit})
+        response.raise_for_status()
+        data = response.json()
+        return data if isinstance(data, list) else data.get("users", [])
+
+    async def list_user_chats(
+        self, user_id: str, skip: int = 0, limit: int = 50
+    ) -> list[dict[str, Any]]:
+        """
+        Get a page of a user's chats, most recently updated first (admin API key required).
+
+        Args:
+            user_id: Open WebUI user ID
+            skip: Chats to skip
+            limit: Maximum number of chats to return
+
+        Returns:
+            List of chat summaries (id, title, updated_at, created_at; epoch seconds)
+        """
+        response = await self.http.get(
+            f"/chats/list/user/{user_id}", params={"skip": skip, "limit": limit}
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def get_chat(self, chat_id: str) -> dict[str, Any]:
+        """
+        Get a chat with its messages.
+
+        Args:
+            chat_id: Chat ID
+
+        Returns:
+            Chat dictionary (id, user_id, title, chat: {messages, history}, updated_at)
+        """
+        response = await self.http.get(f"/chats/{chat_id}")
+        response.raise_for_status()
+        return response.json()
+
     async def get_conversations(
         self, user_id: str | None = None, limit: int = 100, offset: int = 0
     ) -> list[dict[str, Any]]:
@@ -46,17 +144,14 @@ class OpenWebUIClient:
             List of conversation dictionaries
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                params = {"limit": limit, "offset": offset}
-                if user_id:
-                    params["user_id"] = user_id
-
-                response = await client.get(
-                    f"{self.base_url}/conversations", headers=self._get_headers(), params=params
-                )
-                response.raise_for_status()
-                data = response.json()
-                return data.get("items", [])
+            params = {"limit": limit, "offset": offset}
+            if user_id:
+                params["user_id"] = user_id
+
+            response = await self.http.get("/conversations", params=params)
+            response.raise_for_status()
+            data = response.json()
+            return data.get("items", [])
         except Exception:
             logger.exception("Failed to get conversations")
             raise
@@ -72,14 +167,11 @@ class OpenWebUIClient:
             Conversation dictionary
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/conversations/{conversation_id}", headers=self._get_headers()
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self.http.get(f"/conversations/{conversation_id}")
+            response.raise_for_status()
+            return response.json()
         except Exception:
-            logger.exception("Failed to get conversation {conversation_id}")
+            logger.exception(f"Failed to get conversation {conversation_id}")
             raise
 
     async def update_conversation_topics(self, conversation_id: str, topics: list[str]) -> bool:
@@ -94,15 +186,12 @@ class OpenWebUIClient:
             True if successful
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # Note: This endpoint may need to be verified with Open WebUI API docs
-                response = await client.patch(
-                    f"{self.base_url}/conversations/{conversation_id}",
-                    headers=self._get_headers(),
-                    json={"topics": topics},
-                )
-                response.raise_for_status()
-                return True
+            # Note: This endpoint may need to be verified with Open WebUI API docs
+            response = await self.http.patch(
+                f"/conversations/{conversation_id}", json={"topics": topics}
+            )
+            response.raise_for_status()
+            return True
         except Exception:
             logger.exception("Failed to update conversation topics")
             return False
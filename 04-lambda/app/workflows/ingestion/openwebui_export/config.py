@@ -16,6 +16,25 @@ class OpenWebUIExportConfig(BaseSettings):
     mongodb_database: str = Field("local_ai", env="MONGODB_DATABASE")
     mongodb_collection_exports: str = Field("openwebui_exports", env="MONGODB_COLLECTION_EXPORTS")
 
+    # Incremental sync into the RAG chunks (services/sync.py)
+    # Seconds between background syncs of every user's chats (0: no background sync)
+    openwebui_sync_interval_seconds: float = Field(0.0, env="OPENWEBUI_SYNC_INTERVAL_SECONDS")
+    # Comma-separated Open WebUI user IDs to sync (unset: all users)
+    openwebui_sync_user_ids: str | None = Field(None, env="OPENWEBUI_SYNC_USER_IDS")
+    # Chats fetched, embedded and written at once (also the HTTP connection pool size)
+    openwebui_sync_concurrency: int = Field(8, env="OPENWEBUI_SYNC_CONCURRENCY")
+    # Users synced at once
+    openwebui_sync_user_concurrency: int = Field(4, env="OPENWEBUI_SYNC_USER_CONCURRENCY")
+    # Chats per list request
+    openwebui_sync_page_size: int = Field(50, env="OPENWEBUI_SYNC_PAGE_SIZE")
+    # Per-user watermarks and per-chat content hashes
+    openwebui_sync_users_collection: str = Field(
+        "openwebui_sync_users", env="OPENWEBUI_SYNC_USERS_COLLECTION"
+    )
+    openwebui_sync_chats_collection: str = Field(
+        "openwebui_sync_chats", env="OPENWEBUI_SYNC_CHATS_COLLECTION"
+    )
+
     class Config:
         env_prefix = ""
         extra = "ignore"
@@ -0,0 +1,184 @@
+"""In-memory stand-in for the Open WebUI API, for offline tests and benchmarks.
+
+FakeOpenWebUI serves the endpoints the sync uses as an httpx transport:
+GET /api/v1/users/, GET /api/v1/chats/list/user/{user_id} (most recently
+updated first, skip/limit paging) and GET /api/v1/chats/{id}, with messages
+stored the way Open WebUI does (a ``history`` tree with ``currentId``, plus
+the flat ``messages`` list). Every change bumps the chat's ``updated_at`` on a
+fake clock of whole seconds. Chats in ``unavailable`` answer HTTP 500.
+
+Usage:
+    api = FakeOpenWebUI()
+    user = api.add_user("alice@example.com")
+    chat_id = api.add_chat(user, "Title", [("user", "Hi"), ("assistant", "Hello")])
+    client = OpenWebUIClient("http://openwebui", transport=api.transport())
+"""
+
+import asyncio
+import itertools
+import re
+from typing import Any
+
+import httpx
+
+_LIST_CHATS = re.compile(r"^/api/v1/chats/list/user/([^/]+)$")
+_GET_CHAT = re.compile(r"^/api/v1/chats/([^/]+)$")
+
+
+class FakeOpenWebUI:
+    """Open WebUI users and chats, served through an httpx.MockTransport."""
+
+    def __init__(self, latency: float = 0.0, start_time: int = 1_700_000_000):
+        """
+        Args:
+            latency: Seconds each request takes (to observe concurrency)
+            start_time: First value of the fake clock (epoch seconds)
+        """
+        self.latency = latency
+        self.users: dict[str, dict[str, Any]] = {}
+        self.chats: dict[str, dict[str, Any]] = {}
+        self.unavailable: set[str] = set()
+        self.requests: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._clock = itertools.count(start_time)
+        self._ids = itertools.count(1)
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self._handle)
+
+    def requests_to(self, prefix: str) -> int:
+        """Number of requests whose path starts with ``prefix``."""
+        return sum(path.startswith(prefix) for path in self.requests)
+
+    # ========== Data ==========
+
+    def add_user(self, email: str, name: str | None = None) -> str:
+        user_id = f"user-{next(self._ids)}"
+        self.users[user_id] = {
+            "id": user_id,
+            "name": name or email.split("@", 1)[0],
+            "email": email,
+            "role": "user",
+        }
+        return user_id
+
+    def add_chat(
+        self, user_id: str, title: str, messages: list[tuple[str, str]] | None = None
+    ) -> str:
+        """Create a chat; ``messages`` are (role, content) pairs."""
+        chat_id = f"chat-{next(self._ids)}"
+        now = next(self._clock)
+        self.chats[chat_id] = {
+            "id": chat_id,
+            "user_id": user_id,
+            "title": title,
+            "chat": {"title": title, "history": {"messages": {}, "currentId": None}},
+            "created_at": now,
+            "updated_at": now,
+        }
+        for role, content in messages or []:
+            self.add_message(chat_id, role, content)
+        return chat_id
+
+    def add_message(self, chat_id: str, role: str, content: str) -> str:
+        """Append a message to the current branch of a chat."""
+        chat = self.chats[chat_id]
+        history = chat["chat"]["history"]
+        message_id = f"msg-{next(self._ids)}"
+        parent_id = history["currentId"]
+        history["messages"][message_id] = {
+            "id": message_id,
+            "parentId": parent_id,
+            "childrenIds": [],
+            "role": role,
+            "content": content,
+        }
+        if parent_id:
+            history["messages"][parent_id]["childrenIds"].append(message_id)
+        history["currentId"] = message_id
+        self._touch(chat)
+        return message_id
+
+    def edit_message(self, chat_id: str, index: int, content: str) -> str:
+        """
+        Edit the ``index``-th message of the current branch the way Open WebUI does:
+        a sibling message is added and becomes the end of the current branch.
+        """
+        chat = self.chats[chat_id]
+        history = chat["chat"]["history"]
+        original = self._branch(chat)[index]
+        history["currentId"] = original["parentId"]
+        return self.add_message(chat_id, original["role"], content)
+
+    def rename(self, chat_id: str, title: str) -> None:
+        chat = self.chats[chat_id]
+        chat["title"] = chat["chat"]["title"] = title
+        self._touch(chat)
+
+    def touch(self, chat_id: str) -> None:
+        """Bump updated_at without changing content (like pinning a chat)."""
+        self._touch(self.chats[chat_id])
+
+    def _touch(self, chat: dict[str, Any]) -> None:
+        chat["updated_at"] = next(self._clock)
+        chat["chat"]["messages"] = self._branch(chat)
+
+    def _branch(self, chat: dict[str, Any]) -> list[dict[str, Any]]:
+        history = chat["chat"]["history"]
+        branch = []
+        message_id = history["currentId"]
+        while message_id:
+            message = history["messages"][message_id]
+            branch.append(message)
+            message_id = message["parentId"]
+        return branch[::-1]
+
+    # ========== HTTP ==========
+
+    async def _handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.requests.append(path)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            return self._route(request, path)
+        finally:
+            self.in_flight -= 1
+
+    def _route(self, request: httpx.Request, path: str) -> httpx.Response:
+        if request.method != "GET":
+            return httpx.Response(405, json={"detail": "Method Not Allowed"})
+        skip = int(request.url.params.get("skip", 0))
+        limit = int(request.url.params.get("limit", 50))
+
+        if path == "/api/v1/users/":
+            users = sorted(self.users.values(), key=lambda u: u["id"])
+            return httpx.Response(200, json=users[skip : skip + limit])
+
+        if match := _LIST_CHATS.match(path):
+            chats = sorted(
+                (c for c in self.chats.values() if c["user_id"] == match.group(1)),
+                key=lambda c: c["updated_at"],
+                reverse=True,
+            )
+            page = [
+                {key: chat[key] for key in ("id", "title", "updated_at", "created_at")}
+                for chat in chats[skip : skip + limit]
+            ]
+            return httpx.Response(200, json=page)
+
+        if match := _GET_CHAT.match(path):
+            chat = self.chats.get(match.group(1))
+            if match.group(1) in self.unavailable:
+                return httpx.Response(500, json={"detail": "Internal Server Error"})
+            if chat is None:
+                return httpx.Response(404, json={"detail": "Not Found"})
+            return httpx.Response(200, json=chat)
+
+        return httpx.Response(404, json={"detail": "Not Found"})
+
+
+__all__ = ["FakeOpenWebUI"]
@@ -0,0 +1,600 @@
+"""Incremental sync of Open WebUI chats into the MongoDB RAG store.
+
+Keeps every user's chats searchable (search_conversations) without exporting
+them one by one:
+
+- Watermark: per user, chats are listed most recently updated first and paging
+  stops at the first chat older than the user's watermark (the newest
+  ``updated_at`` synced last time), so a run only lists what changed.
+- Concurrency: up to OPENWEBUI_SYNC_CONCURRENCY changed chats are fetched,
+  chunked, embedded and written at once (over the client's shared connection
+  pool), across at most OPENWEBUI_SYNC_USER_CONCURRENCY users.
+- Content hash: a chat whose turns and title hash the same as last time
+  (e.g. only pinned) is not re-embedded.
+- New turns only: a turn is a user message and the replies to it. Turns are
+  hashed one by one; turns matching the stored prefix keep their chunks, and
+  only the turns after it are chunked and embedded. An edited message drops the
+  chunks from its turn on.
+
+Each chat is one document (source_type "openwebui_conversation") whose chunks
+carry conversation_id, user_id, turn_index and ``source: "openwebui_conversation"``
+in their metadata, which is what the conversation search filters on. Sync state
+lives in OPENWEBUI_SYNC_USERS_COLLECTION (watermarks) and
+OPENWEBUI_SYNC_CHATS_COLLECTION (hashes and chunk counts per turn).
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from app.capabilities.retrieval.mongo_rag.config import config as rag_config
+from app.capabilities.retrieval.mongo_rag.ingestion.chunker import (
+    ChunkingConfig,
+    DocumentChunk,
+    create_chunker,
+)
+from app.capabilities.retrieval.mongo_rag.ingestion.embedder import create_embedder
+from app.capabilities.retrieval.mongo_rag.quantization import encode_embedding
+from app.capabilities.retrieval.mongo_rag.vector_index.service import (
+    notify_chunks_deleted,
+    notify_chunks_inserted,
+)
+from app.workflows.ingestion.openwebui_export.client import OpenWebUIClient
+from app.workflows.ingestion.openwebui_export.config import config
+from pymongo import ASCENDING, AsyncMongoClient
+
+logger = logging.getLogger(__name__)
+
+SOURCE_TYPE = "openwebui_conversation"
+ROLES = ("user", "assistant")
+
+
+# ========== Conversation content ==========
+
+
+def conversation_messages(chat: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    User and assistant messages of a chat's current branch, oldest first.
+
+    Open WebUI keeps every edit and regeneration in ``chat.history`` as a tree;
+    the branch shown to the user ends at ``history.currentId``. Chats without
+    a history fall back to the flat ``chat.messages`` list.
+    """
+    body = chat.get("chat") or {}
+    history = body.get("history") or {}
+    tree = history.get("messages") or {}
+    if history.get("currentId") in tree:
+        messages = []
+        message_id = history["currentId"]
+        while message_id in tree:
+            messages.append(tree[message_id])
+            message_id = tree[message_id].get("parentId")
+        messages.reverse()
+    else:
+        messages = body.get("messages") or []
+    return [
+        m
+        for m in messages
+        if m.get("role") in ROLES and isinstance(m.get("content"), str) and m["content"].strip()
+    ]
+
+
+def split_turns(messages: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """Group messages into turns, each starting at a user message."""
+    turns: list[list[dict[str, Any]]] = []
+    for message in messages:
+        if message["role"] == "user" or not turns:
+            turns.append([])
+        turns[-1].append(message)
+    return turns
+
+
+def render_turn(turn: list[dict[str, Any]]) -> str:
+    return "\n\n".join(f"**{m['role'].capitalize()}:** {m['content'].strip()}" for m in turn)
+
+
+def _hash(value: Any) -> str:
+    encoded = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def turn_hash(turn: list[dict[str, Any]]) -> str:
+    return _hash([[m["role"], m["content"]] for m in turn])
+
+
+def _common_prefix(old: list[str], new: list[str]) -> int:
+    count = 0
+    for a, b in zip(old, new, strict=False):
+        if a != b:
+            break
+        count += 1
+    return count
+
+
+@dataclass
+class SyncResult:
+    """Counts from a sync run."""
+
+    users: int = 0
+    chats_listed: int = 0
+    chats_fetched: int = 0
+    chats_unchanged: int = 0
+    chats_synced: int = 0
+    turns_embedded: int = 0
+    chunks_created: int = 0
+    chunks_deleted: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def merge(self, other: "SyncResult") -> None:
+        for name, value in vars(other).items():
+            if name == "errors":
+                self.errors.extend(value)
+            else:
+                setattr(self, name, getattr(self, name) + value)
+
+
+# ========== Sync service ==========
+
+
+class ConversationSyncService:
+    """
+    Syncs Open WebUI chats into the RAG documents and chunks collections.
+
+    Usage:
+        async with OpenWebUIClient() as client:
+            service = ConversationSyncService(db, client)
+            result = await service.sync_all()
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        client: OpenWebUIClient,
+        *,
+        chunker: Any | None = None,
+        embedder: Any | None = None,
+        concurrency: int | None = None,
+        user_concurrency: int | None = None,
+        page_size: int | None = None,
+        user_ids: list[str] | None = None,
+    ):
+        """
+        Initialize the sync service.
+
+        Args:
+            db: RAG database (documents, chunks and the sync state collections)
+            client: Open WebUI client (admin API key)
+            chunker: Chunker (defaults to the RAG chunker)
+            embedder: Embedder (defaults to the RAG embedder)
+            concurrency: Chats fetched and embedded at once
+                (defaults to OPENWEBUI_SYNC_CONCURRENCY)
+            user_concurrency: Users synced at once in sync_all
+                (defaults to OPENWEBUI_SYNC_USER_CONCURRENCY)
+            page_size: Chats per list request (defaults to OPENWEBUI_SYNC_PAGE_SIZE)
+            user_ids: Users to sync in sync_all (defaults to OPENWEBUI_SYNC_USER_IDS, else all)
+        """
+        self.db = db
+        self.client = client
+        self.chunker = chunker or create_chunker(ChunkingConfig())
+        self.embedder = embedder or create_embedder()
+        self.page_size = max(2, page_size or config.openwebui_sync_page_size)
+        if user_ids is None and config.openwebui_sync_user_ids:
+            user_ids = [u.strip() for u in config.openwebui_sync_user_ids.split(",") if u.strip()]
+        self.user_ids = user_ids
+        # Held from fetching a chat until its chunks are written, so a first sync of
+        # thousands of chats doesn't embed them all at once
+        self._chat_slots = asyncio.Semaphore(concurrency or config.openwebui_sync_concurrency)
+        self._user_slots = asyncio.Semaphore(
+            user_concurrency or config.openwebui_sync_user_concurrency
+        )
+
+        self.documents = db[rag_config.mongodb_collection_documents]
+        self.chunks = db[rag_config.mongodb_collection_chunks]
+        self.user_state = db[config.openwebui_sync_users_collection]
+        self.chat_state = db[config.openwebui_sync_chats_collection]
+
+    async def ensure_indexes(self) -> None:
+        """Indexes for looking up a chat's document and its chunks by turn."""
+        await self.documents.create_index(
+            [("metadata.conversation_id", ASCENDING)], name="conversation_id", sparse=True
+        )
+        await self.chunks.create_index(
+            [("document_id", ASCENDING), ("metadata.turn_index", ASCENDING)],
+            name="document_turn",
+        )
+        await self.chat_state.create_index("user_id", name="user_id")
+
+    async def sync_all(self) -> SyncResult:
+        """Sync every user's changed chats (OPENWEBUI_SYNC_USER_CONCURRENCY users at once)."""
+        users = await self._list_users()
+
+        async def sync_one(user: dict[str, Any]) -> SyncResult:
+            async with self._user_slots:
+                return await self.sync_user(user)
+
+        total = SyncResult()
+        for result in await asyncio.gather(*map(sync_one, users)):
+            total.merge(result)
+        logger.info(
+            f"Open WebUI sync: {total.users} users, {total.chats_listed} changed chats, "
+            f"{total.chats_synced} synced, {total.chats_unchanged} unchanged, "
+            f"{total.turns_embedded} turns embedded, {len(total.errors)} errors"
+        )
+        return total
+
+    async def sync_user(self, user: dict[str, Any]) -> SyncResult:
+        """
+        Sync the chats a user changed since their watermark.
+
+        Args:
+            user: Open WebUI user (id, email)
+
+        Returns:
+            SyncResult for this user
+        """
+        result = SyncResult(users=1)
+        user_id = user["id"]
+        state = await self.user_state.find_one({"_id": user_id})
+        watermark = state["watermark"] if state else 0
+
+        try:
+            summaries = await self._changed_chats(user_id, watermark)
+        except Exception as e:
+            logger.exception(f"Failed to list Open WebUI chats of user {user_id}")
+            result.errors.append(f"user {user_id}: {e}")
+            return result
+        result.chats_listed = len(summaries)
+        if not summaries:
+            return result
+
+        chat_ids = [summary["id"] for summary in summaries]
+        states = {
+            doc["_id"]: doc
+            for doc in await self.chat_state.find({"_id": {"$in": chat_ids}}).to_list()
+        }
+        synced = await asyncio.gather(
+            *(
+                self._sync_chat(user, summary, states.get(summary["id"]), result)
+                for summary in summaries
+            )
+        )
+
+        # A failed chat keeps the watermark at or below its updated_at so it is listed again
+        failed = [s["updated_at"] for s, ok in zip(summaries, synced, strict=True) if not ok]
+        new_watermark = min(failed) if failed else max(s["updated_at"] for s in summaries)
+        await self.user_state.update_one(
+            {"_id": user_id},
+            {
+                "$set": {
+                    "watermark": max(watermark, new_watermark),
+                    "email": user.get("email"),
+                    "synced_at": datetime.now(),
+                }
+            },
+            upsert=True,
+        )
+        return result
+
+    async def _list_users(self) -> list[dict[str, Any]]:
+        users: list[dict[str, Any]] = []
+        skip = 0
+        while True:
+            page = await self.client.list_users(skip=skip, limit=100)
+            users.extend(page)
+            if len(page) < 100:
+                break
+            skip += len(page)
+        if self.user_ids is not None:
+            wanted = set(self.user_ids)
+            users = [user for user in users if user["id"] in wanted]
+        return users
+
+    async def _changed_chats(self, user_id: str, watermark: int) -> list[dict[str, Any]]:
+        """Chat summaries updated at or after the watermark, newest first."""
+        chats: list[dict[str, Any]] = []
+        seen: set[str] = set()
+        skip = 0
+        while True:
+            page = await self.client.list_user_chats(user_id, skip=skip, limit=self.page_size)
+            for summary in page:
+                if summary["updated_at"] < watermark:
+                    return chats
+                if summary["id"] not in seen:
+                    seen.add(summary["id"])
+                    chats.append(summary)
+            if len(page) < self.page_size:
+                return chats
+            # Pages overlap by one: a chat updated while paging moves to the front
+            # and shifts the rest down, which would otherwise skip one of them
+            skip += len(page) - 1
+
+    async def _sync_chat(
+        self,
+        user: dict[str, Any],
+        summary: dict[str, Any],
+        state: dict[str, Any] | None,
+        result: SyncResult,
+    ) -> bool:
+        """Sync one chat; False if it failed (it is retried on the next run)."""
+        if state and state.get("updated_at") == summary["updated_at"]:
+            # Listed again because it sits on the watermark
+            result.chats_unchanged += 1
+            return True
+        try:
+            async with self._chat_slots:
+                chat = await self.client.get_chat(summary["id"])
+                result.chats_fetched += 1
+                await self._apply(user, chat, state, result)
+        except Exception as e:
+            logger.exception(f"Failed to sync Open WebUI chat {summary['id']}")
+            result.errors.append(f"chat {summary['id']}: {e}")
+            return False
+        return True
+
+    async def _apply(
+        self,
+        user: dict[str, Any],
+        chat: dict[str, Any],
+        state: dict[str, Any] | None,
+        result: SyncResult,
+    ) -> None:
+        """Bring a chat's document and chunks in line with the fetched chat."""
+        chat_id = chat["id"]
+        title = chat.get("title") or "Untitled"
+        turns = split_turns(conversation_messages(chat))
+        turn_hashes = [turn_hash(turn) for turn in turns]
+        content_hash = _hash([title, turn_hashes])
+        now = datetime.now()
+
+        if state and state.get("content_hash") == content_hash:
+            await self.chat_state.update_one(
+                {"_id": chat_id}, {"$set": {"updated_at": chat["updated_at"], "synced_at": now}}
+            )
+            result.chats_unchanged += 1
+            return
+
+        source = f"{self.client.api_url.rstrip('/')}/c/{chat_id}"
+        metadata = {
+            "source": SOURCE_TYPE,
+            "source_type": SOURCE_TYPE,
+            "conversation_id": chat_id,
+            "user_id": user["id"],
+        }
+        document_fields = {
+            "title": title,
+            "content": "\n\n".join(render_turn(turn) for turn in turns),
+            "updated_at": now,
+            **{f"metadata.{key}": value for key, value in metadata.items()},
+            "metadata.message_count": sum(len(turn) for turn in turns),
+            "metadata.openwebui_updated_at": chat["updated_at"],
+        }
+
+        document = await self._find_document(chat_id, state)
+        if document is None:
+            old_hashes, old_chunks, topics = [], [], None
+            inserted = await self.documents.insert_one(
+                {
+                    "title": title,
+                    "source": source,
+                    "source_type": SOURCE_TYPE,
+                    "content": document_fields["content"],
+                    "metadata": {
+                        **metadata,
+                        "message_count": document_fields["metadata.message_count"],
+                        "openwebui_updated_at": chat["updated_at"],
+                    },
+                    "created_at": now,
+                    "updated_at": now,
+                    # RLS: Open WebUI user IDs are not ours, the email is
+                    "user_id": None,
+                    "user_email": user.get("email"),
+                    "is_public": False,
+                    "shared_with": [],
+                    "group_ids": [],
+                }
+            )
+            document_id = inserted.inserted_id
+        else:
+            document_id = document["_id"]
+            # Without sync state (e.g. lost) the document's chunks are all rebuilt
+            old_hashes = state.get("turn_hashes", []) if state else []
+            old_chunks = state.get("turn_chunks", []) if state else []
+            topics = (document.get("metadata") or {}).get("topics")
+            await self.documents.update_one({"_id": document_id}, {"$set": document_fields})
+
+        keep = _common_prefix(old_hashes, turn_hashes)
+        if document is not None and (state is None or keep < len(old_hashes)):
+            result.chunks_deleted += await self._delete_chunks(document_id, keep)
+        if keep and state and state.get("title") != title:
+            await self.chunks.update_many(
+                {"document_id": document_id},
+                {"$set": {"document_title": title, "metadata.title": title}},
+            )
+
+        topics_metadata = {"topics": topics} if topics else {}
+        added = await self._add_turns(
+            document_id,
+            turns,
+            keep,
+            first_chunk_index=sum(old_chunks[:keep]),
+            title=title,
+            source=source,
+            metadata={**metadata, **topics_metadata},
+            user_email=user.get("email"),
+        )
+        turn_chunks = [*old_chunks[:keep], *added]
+
+        await self.chat_state.update_one(
+            {"_id": chat_id},
+            {
+                "$set": {
+                    "user_id": user["id"],
+                    "document_id": document_id,
+                    "title": title,
+                    "content_hash": content_hash,
+                    "turn_hashes": turn_hashes,
+                    "turn_chunks": turn_chunks,
+                    "updated_at": chat["updated_at"],
+                    "synced_at": now,
+                }
+            },
+            upsert=True,
+        )
+        result.chats_synced += 1
+        result.turns_embedded += len(turns) - keep
+        result.chunks_created += sum(added)
+
+    async def _add_turns(
+        self,
+        document_id: Any,
+        turns: list[list[dict[str, Any]]],
+        start: int,
+        *,
+        first_chunk_index: int,
+        title: str,
+        source: str,
+        metadata: dict[str, Any],
+        user_email: str | None,
+    ) -> list[int]:
+        """
+        Chunk, embed and store turns ``start`` onwards (one embedding batch).
+
+        Returns:
+            Number of chunks stored per turn
+        """
+        counts: list[int] = []
+        new_chunks: list[DocumentChunk] = []
+        for turn_index in range(start, len(turns)):
+            chunks = await self.chunker.chunk_document(
+                content=render_turn(turns[turn_index]),
+                title=title,
+                source=source,
+                metadata={**metadata, "turn_index": turn_index},
+            )
+            counts.append(len(chunks))
+            new_chunks.extend(chunks)
+        if not new_chunks:
+            return counts
+
+        for index, chunk in enumerate(new_chunks, start=first_chunk_index):
+            chunk.index = index
+        embedded = await self.embedder.embed_chunks(new_chunks)
+        now = datetime.now()
+        chunk_dicts = [
+            {
+                "document_id": document_id,
+                # Denormalized so search results need no documents lookup
+                "document_title": title,
+                "document_source": source,
+                "content": chunk.content,
+                **encode_embedding(
+                    chunk.embedding,
+                    rag_config.embedding_storage,
+                    rag_config.embedding_keep_full_precision,
+                ),
+                "chunk_index": chunk.index,
+                "metadata": chunk.metadata,
+                "token_count": chunk.token_count,
+                "created_at": now,
+                "user_id": None,
+                "user_email": user_email,
+            }
+            for chunk in embedded
+        ]
+        await self.chunks.insert_many(chunk_dicts, ordered=False)
+        notify_chunks_inserted(chunk_dicts)
+        return counts
+
+    async def _find_document(
+        self, chat_id: str, state: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        query = (
+            {"_id": state["document_id"]}
+            if state and state.get("document_id")
+            else {"source_type": SOURCE_TYPE, "metadata.conversation_id": chat_id}
+        )
+        return await self.documents.find_one(query, {"metadata.topics": 1})
+
+    async def _delete_chunks(self, document_id: Any, from_turn: int) -> int:
+        """Delete a document's chunks from turn ``from_turn`` on."""
+        query = {"document_id": document_id, "metadata.turn_index": {"$gte": from_turn}}
+        chunk_ids = [doc["_id"] for doc in await self.chunks.find(query, {"_id": 1}).to_list()]
+        if not chunk_ids:
+            return 0
+        await self.chunks.delete_many({"_id": {"$in": chunk_ids}})
+        notify_chunks_deleted(chunk_ids)
+        return len(chunk_ids)
+
+
+# ========== Background sync ==========
+
+_mongo_client: AsyncMongoClient | None = None
+_client: OpenWebUIClient | None = None
+_service: ConversationSyncService | None = None
+_task: asyncio.Task | None = None
+
+
+def get_conversation_sync() -> ConversationSyncService:
+    """Process-wide sync service over the RAG database and a shared Open WebUI client."""
+    global _mongo_client, _client, _service
+    if _service is None:
+        _mongo_client = AsyncMongoClient(rag_config.mongodb_uri)
+        _client = OpenWebUIClient()
+        _service = ConversationSyncService(_mongo_client[rag_config.mongodb_database], _client)
+    return _service
+
+
+async def _sync_loop(service: ConversationSyncService, interval: float) -> None:
+    while True:
+        try:
+            await service.sync_all()
+        except Exception:
+            logger.exception("Open WebUI sync failed")
+        await asyncio.sleep(interval)
+
+
+async def start_conversation_sync() -> None:
+    """Start the background sync if OPENWEBUI_SYNC_INTERVAL_SECONDS is set."""
+    global _task
+    interval = config.openwebui_sync_interval_seconds
+    if interval <= 0 or _task is not None:
+        return
+    service = get_conversation_sync()
+    try:
+        await service.ensure_indexes()
+    except Exception as e:
+        logger.warning(f"Failed to create Open WebUI sync indexes: {e}")
+    _task = asyncio.create_task(_sync_loop(service, interval), name="openwebui-sync")
+    logger.info(f"Open WebUI sync started (every {interval:g}s)")
+
+
+async def shutdown_conversation_sync() -> None:
+    """Stop the background sync and close its connections (called on application shutdown)."""
+    global _mongo_client, _client, _service, _task
+    if _task is not None:
+        _task.cancel()
+        await asyncio.gather(_task, return_exceptions=True)
+        _task = None
+    if _client is not None:
+        await _client.close()
+        _client = None
+    if _mongo_client is not None:
+        await _mongo_client.close()
+        _mongo_client = None
+    _service = None
+
+
+__all__ = [
+    "SOURCE_TYPE",
+    "ConversationSyncService",
+    "SyncResult",
+    "conversation_messages",
+    "get_conversation_sync",
+    "shutdown_conversation_sync",
+    "split_turns",
+    "start_conversation_sync",
+]
@@ -1,5 +1,7 @@
 """Shared pytest fixtures for RAG tests."""
 
+import asyncio
+import copy
 import os
 
 # Set minimal environment variables before any imports
@@ -11,6 +13,7 @@ os.environ.setdefault("LLM_API_KEY", "test-key")
 os.environ.setdefault("EMBEDDING_BASE_URL", "http://localhost:11434/v1")
 os.environ.setdefault("EMBEDDING_API_KEY", "test-key")
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -321,6 +324,246 @@ async def async_iter(items):
         yield item
 
 
+# In-memory MongoDB
+def _get_path(document, path):
+    for key in path.split("."):
+        if not isinstance(document, dict):
+            return None
+        document = document.get(key)
+    return document
+
+
+def _set_path(document, path, value):
+    *parents, last = path.split(".")
+    for key in parents:
+        document = document.setdefault(key, {})
+    document[last] = value
+
+
+def _unset_path(document, path):
+    *parents, last = path.split(".")
+    for key in parents:
+        document = document.get(key)
+        if not isinstance(document, dict):
+            return
+    document.pop(last, None)
+
+
+def _project(document, projection):
+    if not projection:
+        return dict(document)
+    if not any(projection.values()):
+        projected = copy.deepcopy(document)
+        for path in projection:
+            _unset_path(projected, path)
+        return projected
+    projected = {"_id": document["_id"]} if projection.get("_id", 1) and "_id" in document else {}
+    for path, included in projection.items():
+        *parents, last = path.split(".")
+        source = document
+        for key in parents:
+            source = source.get(key) if isinstance(source, dict) else None
+        if included and path != "_id" and isinstance(source, dict) and last in source:
+            _set_path(projected, path, source[last])
+    return projected
+
+
+def _sort_key(key):
+    # Missing and null values sort first, as in MongoDB
+    def value(document):
+        found = _get_path(document, key)
+        return (found is not None, found)
+
+    return value
+
+
+def bulk_operation(request):
+    """
+    Return (kind, filter, update, upsert) for a pymongo bulk write request.
+
+    pymongo has no public accessors on UpdateOne/DeleteOne and friends, so this
+    is the one place the fake reads their private attributes.
+    """
+    from pymongo import DeleteMany, DeleteOne, InsertOne, UpdateMany, UpdateOne
+
+    if isinstance(request, InsertOne):
+        return "insert", None, request._doc, False
+    if isinstance(request, UpdateOne | UpdateMany):
+        kind = "update_many" if isinstance(request, UpdateMany) else "update_one"
+        return kind, request._filter, request._doc, bool(request._upsert)
+    if isinstance(request, DeleteOne | DeleteMany):
+        kind = "delete_many" if isinstance(request, DeleteMany) else "delete_one"
+        return kind, request._filter, None, False
+    raise TypeError(f"Unsupported bulk write request: {request!r}")
+
+
+class MemoryCursor:
+    """Cursor over the documents a MemoryCollection.find() matched."""
+
+    def __init__(self, documents, query_filter=None, projection=None, delay=0.0, **options):
+        self.docs = documents
+        self.filter = query_filter
+        self.projection = projection
+        self.options = options
+        self.delay = delay
+        self._skip = 0
+        self._limit = 0
+
+    def sort(self, key, direction=None):
+        keys = key if isinstance(key, list) else [(key, direction)]
+        for path, order in reversed(keys):
+            self.docs.sort(key=_sort_key(path), reverse=order < 0)
+        return self
+
+    def skip(self, count):
+        self._skip = count
+        return self
+
+    def limit(self, count):
+        self._limit = count
+        return self
+
+    def results(self):
+        end = self._skip + self._limit if self._limit else None
+        return [_project(d, self.projection) for d in self.docs[self._skip : end]]
+
+    async def to_list(self, length=None):
+        await asyncio.sleep(self.delay)
+        return self.results()
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        await asyncio.sleep(self.delay)
+        for document in self.results():
+            yield document
+
+
+class MemoryCollection:
+    """
+    The subset of an async MongoDB collection the services under test use.
+
+    Filters are evaluated with the same matches_filter local vector search
+    uses. Every find() is recorded in ``finds``; ``delay`` slows cursor reads
+    down for timeout tests.
+    """
+
+    def __init__(self, docs=None, name="collection", delay=0.0):
+        self.docs: list[dict] = docs if docs is not None else []
+        self.name = name
+        self.delay = delay
+        self.finds: list[MemoryCursor] = []
+        self.bulk_writes = 0
+
+    def _matching(self, query_filter):
+        from app.capabilities.retrieval.mongo_rag.vector_index.filters import matches_filter
+
+        return [d for d in self.docs if matches_filter(d, query_filter or {})]
+
+    async def create_index(self, *args, **kwargs):
+        return kwargs.get("name")
+
+    def find(self, query_filter=None, projection=None, **options):
+        cursor = MemoryCursor(
+            self._matching(query_filter), query_filter, projection, self.delay, **options
+        )
+        self.finds.append(cursor)
+        return cursor
+
+    async def find_one(self, query_filter=None, projection=None, sort=None):
+        cursor = MemoryCursor(self._matching(query_filter), query_filter, projection)
+        if sort:
+            cursor.sort(sort)
+        found = cursor.limit(1).results()
+        return found[0] if found else None
+
+    async def count_documents(self, query_filter):
+        return len(self._matching(query_filter))
+
+    async def estimated_document_count(self):
+        return len(self.docs)
+
+    async def insert_one(self, document):
+        document.setdefault("_id", ObjectId())
+        self.docs.append(dict(document))
+        return SimpleNamespace(inserted_id=document["_id"])
+
+    async def insert_many(self, documents, ordered=True):
+        for document in documents:
+            await self.insert_one(document)
+
+    def _update(self, query_filter, update, upsert, many):
+        matched = self._matching(query_filter)
+        matched = matched if many else matched[:1]
+        upserted_id = None
+        if not matched and upsert:
+            document = {
+                k: v
+                for k, v in query_filter.items()
+                if not k.startswith("$")
+                and not (isinstance(v, dict) and any(op.startswith("$") for op in v))
+            }
+            document.setdefault("_id", ObjectId())
+            self.docs.append(document)
+            matched, upserted_id = [document], document["_id"]
+        for document in matched:
+            for path, value in update.get("$set", {}).items():
+                _set_path(document, path, value)
+            for path in update.get("$unset", {}):
+                _unset_path(document, path)
+        existing = len(matched) - (upserted_id is not None)
+        return SimpleNamespace(
+            matched_count=existing, modified_count=existing, upserted_id=upserted_id
+        )
+
+    async def update_one(self, query_filter, update, upsert=False):
+        return self._update(query_filter, update, upsert, many=False)
+
+    async def update_many(self, query_filter, update, upsert=False):
+        return self._update(query_filter, update, upsert, many=True)
+
+    def _delete(self, query_filter, many):
+        deleted = self._matching(query_filter)
+        deleted = deleted if many else deleted[:1]
+        self.docs[:] = [d for d in self.docs if all(d is not x for x in deleted)]
+        return SimpleNamespace(deleted_count=len(deleted))
+
+    async def delete_one(self, query_filter):
+        return self._delete(query_filter, many=False)
+
+    async def delete_many(self, query_filter):
+        return self._delete(query_filter, many=True)
+
+    async def bulk_write(self, requests, ordered=True):
+        self.bulk_writes += 1
+        modified = deleted = 0
+        for request in requests:
+            kind, query_filter, update, upsert = bulk_operation(request)
+            if kind == "insert":
+                await self.insert_one(update)
+            elif kind.startswith("update"):
+                result = self._update(query_filter, update, upsert, kind == "update_many")
+                modified += result.modified_count + (result.upserted_id is not None)
+            else:
+                deleted += self._delete(query_filter, kind == "delete_many").deleted_count
+        return SimpleNamespace(modified_count=modified, deleted_count=deleted)
+
+
+class MemoryDatabase(dict):
+    """Database handing out an empty MemoryCollection per new name."""
+
+    def __missing__(self, name):
+        self[name] = MemoryCollection(name=name)
+        return self[name]
+
+
+@pytest.fixture
+def memory_db():
+    """In-memory MongoDB database."""
+    return MemoryDatabase()
+
+
 @pytest.fixture
 def mock_run_context():
     """
@@ -0,0 +1,155 @@
+"""Tests for the incremental calendar sync engine against the fake Calendar API."""
+
+import pytest
+from app.capabilities.calendar.calendar_sync.services.sync_engine import (
+    CalendarSyncEngine,
+    EventChange,
+)
+from app.capabilities.calendar.calendar_sync.stores.mongodb_store import MongoDBCalendarStore
+from app.services.external.google_calendar import (
+    CalendarEventData,
+    GoogleCalendar,
+    GoogleCalendarService,
+)
+from app.services.external.google_calendar.fake import FakeCalendarAPI
+
+from tests.conftest import MemoryDatabase
+
+
+@pytest.fixture
+def api():
+    return FakeCalendarAPI()
+
+
+@pytest.fixture
+def engine(api):
+    service = GoogleCalendarService(client=GoogleCalendar(None, service=api))
+    yield CalendarSyncEngine(service, MongoDBCalendarStore(MemoryDatabase()), page_size=250)
+    service.close()
+
+
+def event_data(i, summary=None):
+    return CalendarEventData(
+        summary=summary or f"Event {i}",
+        start=f"2026-01-{i % 28 + 1:02d}T10:00:00",
+        end=f"2026-01-{i % 28 + 1:02d}T11:00:00",
+    )
+
+
+def seed(api, count):
+    events = api.events()
+    return [
+        events.insert(calendarId="primary", body={"summary": f"Remote {i}"}).execute()["id"]
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_pull_pages_full_sync_then_fetches_only_changes(api, engine):
+    ids = seed(api, 600)
+    api.http_requests = 0
+
+    first = await engine.pull("u1")
+
+    assert (first.full_sync, first.upserted, first.deleted) == (True, 600, 0)
+    # 600 events at 250 per page
+    assert api.http_requests == 3
+    assert await engine.store.get_sync_token("u1", "primary")
+
+    events = api.events()
+    events.patch(calendarId="primary", eventId=ids[0], body={"summary": "Moved"}).execute()
+    events.delete(calendarId="primary", eventId=ids[1]).execute()
+    api.http_requests = 0
+
+    second = await engine.pull("u1")
+
+    assert (second.full_sync, second.upserted, second.deleted) == (False, 1, 1)
+    assert api.http_requests == 1
+    mirrored = await engine.store.list_mirrored_events("u1", "primary", limit=1000)
+    assert len(mirrored) == 599
+    assert {"Moved"} <= {e["summary"] for e in mirrored}
+
+
+@pytest.mark.asyncio
+async def test_expired_sync_token_triggers_full_resync(api, engine):
+    ids = seed(api, 5)
+    await engine.pull("u1")
+
+    api.events().delete(calendarId="primary", eventId=ids[0]).execute()
+    api.expire_sync_tokens()
+    result = await engine.pull("u1")
+
+    assert (result.full_sync, result.upserted) == (True, 4)
+    mirrored = await engine.store.list_mirrored_events("u1", "primary")
+    assert sorted(e["id"] for e in mirrored) == sorted(ids[1:])
+
+
+@pytest.mark.asyncio
+async def test_push_batches_writes_and_skips_unchanged(api, engine):
+    changes = [EventChange(f"ext{i}", event_data(i)) for i in range(120)]
+    api.http_requests = 0
+
+    pushed = await engine.push("u1", "p1", changes)
+
+    assert pushed.count("created") == 120
+    # Batches of 50, 50 and 20 calls
+    assert (api.http_requests, api.batch_requests) == (3, 3)
+    assert len(api.live_events()) == 120
+    states = await engine.store.get_many_by_external_ids("u1", "p1", ["ext0", "ext119"])
+    assert set(states) == {"ext0", "ext119"}
+
+    api.http_requests = 0
+    again = await engine.push("u1", "p1", changes)
+
+    assert again.count("unchanged") == 120
+    assert api.http_requests == 0
+
+
+@pytest.mark.asyncio
+async def test_push_updates_deletes_and_recreates_remotely_deleted_events(api, engine):
+    created = await engine.push(
+        "u1", None, [EventChange(f"ext{i}", event_data(i)) for i in range(3)]
+    )
+    google_ids = {r["external_id"]: r["google_event_id"] for r in created.results}
+    # ext2 was deleted in Google Calendar behind our back
+    api.events().delete(calendarId="primary", eventId=google_ids["ext2"]).execute()
+
+    pushed = await engine.push(
+        "u1",
+        None,
+        [
+            EventChange("ext0", event_data(0, summary="Renamed")),
+            EventChange("ext1", None),
+            EventChange("ext2", event_data(2, summary="Back again")),
+            EventChange("missing", None),
+        ],
+    )
+
+    actions = {r["external_id"]: r["action"] for r in pushed.results}
+    assert actions == {
+        "ext0": "updated",
+        "ext1": "deleted",
+        "ext2": "created",
+        "missing": "not_found",
+    }
+    # Patch and delete in one batch, the recreation in a second
+    assert pushed.api_operations == 4
+    live = {e["summary"] for e in api.live_events()}
+    assert live == {"Renamed", "Back again"}
+    states = await engine.store.get_many_by_external_ids("u1", None, ["ext0", "ext1", "ext2"])
+    assert set(states) == {"ext0", "ext2"}
+    assert states["ext2"].google_event_id != google_ids["ext2"]
+
+
+@pytest.mark.asyncio
+async def test_remote_deletion_pulled_drops_sync_state(api, engine):
+    created = await engine.push("u1", None, [EventChange("ext0", event_data(0))])
+    google_id = created.results[0]["google_event_id"]
+    await engine.pull("u1")
+
+    api.events().delete(calendarId="primary", eventId=google_id).execute()
+    await engine.pull("u1")
+
+    # The event is created again instead of being reported unchanged
+    pushed = await engine.push("u1", None, [EventChange("ext0", event_data(0))])
+    assert pushed.results[0]["action"] == "created"
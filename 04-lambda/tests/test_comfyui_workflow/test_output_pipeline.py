@@ -0,0 +1,163 @@
+"""Tests for the parallel output stage of ComfyUI run completion."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from app.capabilities.legacy_projects.comfyui_workflow.client import ComfyUIClient
+from app.capabilities.legacy_projects.comfyui_workflow.config import ComfyUIConfig
+from app.capabilities.legacy_projects.comfyui_workflow.fake import FakeComfyUI, image_bytes
+from app.capabilities.legacy_projects.comfyui_workflow.service import ComfyUIWorkflowService
+
+
+class FakeMinIO:
+    """Consumes upload streams, tracking how many run at once."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.objects: dict[str, bytes] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def upload_stream(self, user_id, chunks, object_key, content_type=None, metadata=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            data = b""
+            async for chunk in chunks:
+                data += chunk
+                await asyncio.sleep(0.001)
+            if self.fail:
+                raise ConnectionError("MinIO unavailable")
+            full_key = f"user-{user_id}/{object_key}"
+            self.objects[full_key] = data
+            return full_key
+        finally:
+            self.in_flight -= 1
+
+
+class FakeImmich:
+    def __init__(self):
+        self.uploads: dict[str, bytes] = {}
+
+    async def upload_asset(self, user_api_key, file_data, filename, device_asset_id=None):
+        await asyncio.sleep(0.001)
+        self.uploads[filename] = file_data
+        return f"asset-{filename}"
+
+
+class FakeConnection:
+    def __init__(self):
+        self.executed: list[tuple] = []
+
+    async def execute(self, query, *args):
+        self.executed.append((" ".join(query.split()), args))
+
+    async def fetchrow(self, query, run_id):
+        return {
+            "id": run_id,
+            "user_id": uuid4(),
+            "status": "completed",
+            "started_at": datetime.now(),
+        }
+
+
+class FakePool:
+    def __init__(self):
+        self.conn = FakeConnection()
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+def completion_result(count: int) -> dict:
+    images = [
+        {"filename": f"out_{i:05d}_.png", "subfolder": "", "type": "output"} for i in range(count)
+    ]
+    return {"status": "completed", "outputs": {"9": {"images": images}}}
+
+
+@pytest.fixture
+async def comfyui():
+    async with FakeComfyUI(image_size=200_000) as server:
+        yield server
+
+
+def make_service(comfyui, minio, immich=None, concurrency=2):
+    config = ComfyUIConfig(
+        comfyui_url=comfyui.url,
+        use_websocket=False,
+        output_concurrency=concurrency,
+        view_chunk_size=16 * 1024,
+    )
+    return ComfyUIWorkflowService(FakePool(), minio, immich, client=ComfyUIClient(config))
+
+
+async def process(service, run_id, user_id, result, api_key="immich-key"):
+    run = await service._process_completion(
+        service.pool.conn, run_id, user_id, result, upload_to_immich=True, immich_api_key=api_key
+    )
+    assert run.id == run_id
+
+
+@pytest.mark.asyncio
+async def test_images_are_stored_in_parallel_with_one_run_update(comfyui):
+    minio, immich = FakeMinIO(), FakeImmich()
+    service = make_service(comfyui, minio, immich, concurrency=3)
+    run_id, user_id = uuid4(), uuid4()
+    try:
+        await process(service, run_id, user_id, completion_result(8))
+    finally:
+        await service.close()
+
+    assert len(minio.objects) == 8
+    assert minio.max_in_flight == 3
+    key = f"user-{user_id}/comfyui/{run_id}/out_00003_.png"
+    assert minio.objects[key] == image_bytes("out_00003_.png", 200_000)
+    assert immich.uploads["out_00003_.png"] == minio.objects[key]
+
+    # The uploading status, then everything else in the completion update
+    statements = service.pool.conn.executed
+    assert len(statements) == 2
+    query, args = statements[1]
+    assert "minio_paths" in query and "immich_asset_ids" in query
+    assert sorted(args[5]) == sorted(minio.objects)
+    assert len(args[6]) == 8
+    assert args[7] == 8
+
+
+@pytest.mark.asyncio
+async def test_upload_progress_is_published(comfyui):
+    service = make_service(comfyui, FakeMinIO())
+    run_id = uuid4()
+    queue = service.events.subscribe(run_id)
+    try:
+        await process(service, run_id, uuid4(), completion_result(3), api_key=None)
+    finally:
+        await service.close()
+
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait())
+    progress = [e["value"] for e in events if e["type"] == "progress"]
+    assert progress == [1, 2, 3]
+    # The completed run record, then the close from service.close()
+    assert events[-2:] == [{"type": "run"}, {"type": "closed"}]
+
+
+@pytest.mark.asyncio
+async def test_immich_upload_survives_minio_failure(comfyui):
+    immich = FakeImmich()
+    service = make_service(comfyui, FakeMinIO(fail=True), immich)
+    try:
+        await process(service, uuid4(), uuid4(), completion_result(2))
+    finally:
+        await service.close()
+
+    assert immich.uploads["out_00001_.png"] == image_bytes("out_00001_.png", 200_000)
+    _, args = service.pool.conn.executed[-1]
+    assert args[5] == []
+    assert len(args[6]) == 2
@@ -0,0 +1,191 @@
+"""Tests for websocket-based ComfyUI run tracking against FakeComfyUI."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from app.capabilities.legacy_projects.comfyui_workflow import tracker as tracker_module
+from app.capabilities.legacy_projects.comfyui_workflow.client import ComfyUIClient
+from app.capabilities.legacy_projects.comfyui_workflow.config import ComfyUIConfig
+from app.capabilities.legacy_projects.comfyui_workflow.fake import FakeComfyUI
+from app.capabilities.legacy_projects.comfyui_workflow.tracker import (
+    ComfyUIRunTracker,
+    TrackerStoppedError,
+)
+
+WORKFLOW = {
+    "4": {"class_type": "CheckpointLoaderSimple", "_meta": {"title": "Load Checkpoint"}},
+    "3": {"class_type": "KSampler", "_meta": {"title": "KSampler"}},
+    "9": {"class_type": "SaveImage", "_meta": {"title": "Save Image"}},
+}
+NODE_NAMES = {"4": "Load Checkpoint", "3": "KSampler", "9": "Save Image"}
+
+
+def make_tracker(comfyui: FakeComfyUI, **kwargs) -> ComfyUIRunTracker:
+    # A long poll interval: results must come from websocket events, not /history polling
+    config = ComfyUIConfig(comfyui_url=comfyui.url, poll_interval=30, progress_update_interval=0)
+    return ComfyUIRunTracker(ComfyUIClient(config), **kwargs)
+
+
+async def submit(tracker: ComfyUIRunTracker, run_id=None) -> str:
+    prompt_id = await tracker.client.submit_workflow(WORKFLOW, client_id=tracker.client_id)
+    tracker.track(prompt_id, run_id, NODE_NAMES)
+    return prompt_id
+
+
+@pytest.fixture
+async def comfyui():
+    async with FakeComfyUI(steps=4, step_delay=0.01, images_per_prompt=2) as server:
+        yield server
+
+
+@pytest.mark.asyncio
+async def test_result_arrives_without_history_polling(comfyui):
+    tracker = make_tracker(comfyui)
+    try:
+        assert await tracker.ensure_started(timeout=5)
+        prompt_id = await submit(tracker)
+
+        result = await tracker.wait_for_result(prompt_id, timeout=10)
+
+        assert result["status"] == "completed"
+        images = tracker.client.extract_output_images(result)
+        assert len(images) == 2
+        # One /history read for the outputs once the prompt finished
+        assert comfyui.history_requests == 1
+        assert not tracker.is_tracking(prompt_id)
+    finally:
+        await tracker.stop()
+        await tracker.client.close()
+
+
+@pytest.mark.asyncio
+async def test_progress_is_reported_and_published(comfyui):
+    messages = []
+
+    async def on_progress(run_id, message):
+        messages.append((run_id, message))
+
+    tracker = make_tracker(comfyui, on_progress=on_progress)
+    run_id = uuid4()
+    queue = tracker.events.subscribe(run_id)
+    try:
+        await tracker.ensure_started(timeout=5)
+        prompt_id = await submit(tracker, run_id)
+        await tracker.wait_for_result(prompt_id, run_id, timeout=10)
+    finally:
+        await tracker.stop()
+        await tracker.client.close()
+
+    assert (run_id, "Generating: KSampler (4/4)") in messages
+    assert (run_id, "Generating: Load Checkpoint") in messages
+
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait())
+    progress = [e for e in events if e["type"] == "progress" and e["value"] is not None]
+    assert [e["value"] for e in progress] == [1, 2, 3, 4]
+    assert progress[0]["node_name"] == "KSampler"
+    assert events[-1] == {"type": "generation_finished", "status": "completed"}
+
+
+@pytest.mark.asyncio
+async def test_execution_error_fails_the_prompt():
+    async with FakeComfyUI(fail=True) as comfyui:
+        tracker = make_tracker(comfyui)
+        try:
+            await tracker.ensure_started(timeout=5)
+            prompt_id = await submit(tracker)
+            result = await tracker.wait_for_result(prompt_id, timeout=10)
+        finally:
+            await tracker.stop()
+            await tracker.client.close()
+
+    assert result == {
+        "status": "failed",
+        "error": "RuntimeError: Fake ComfyUI failure (node 3)",
+    }
+
+
+@pytest.mark.asyncio
+async def test_prompts_finished_while_disconnected_are_resynced(comfyui):
+    tracker = make_tracker(comfyui)
+    try:
+        # Submitted and finished while no websocket was listening
+        prompt_id = await tracker.client.submit_workflow(WORKFLOW, client_id=tracker.client_id)
+        await comfyui.wait_idle()
+        tracker.track(prompt_id)
+
+        await tracker.ensure_started(timeout=5)
+        result = await tracker.wait_for_result(prompt_id, timeout=5)
+
+        assert result["status"] == "completed"
+    finally:
+        await tracker.stop()
+        await tracker.client.close()
+
+
+@pytest.mark.asyncio
+async def test_reconnects_after_connection_loss(comfyui, monkeypatch):
+    monkeypatch.setattr(tracker_module, "RECONNECT_MIN_DELAY", 0.01)
+    comfyui.step_delay = 0.05
+    tracker = make_tracker(comfyui)
+    try:
+        await tracker.ensure_started(timeout=5)
+        prompt_id = await submit(tracker)
+        await comfyui.disconnect_clients()
+
+        result = await tracker.wait_for_result(prompt_id, timeout=10)
+
+        assert result["status"] == "completed"
+        assert tracker.connections == 2
+    finally:
+        await tracker.stop()
+        await tracker.client.close()
+
+
+@pytest.mark.asyncio
+async def test_late_wait_gets_already_finished_result(comfyui):
+    tracker = make_tracker(comfyui)
+    try:
+        await tracker.ensure_started(timeout=5)
+        prompt_id = await tracker.client.submit_workflow(WORKFLOW, client_id=tracker.client_id)
+        await comfyui.wait_idle()
+        await asyncio.sleep(0.05)  # let the tracker read the finished prompt's history
+
+        history_requests = comfyui.history_requests
+        result = await tracker.wait_for_result(prompt_id, timeout=1)
+
+        assert result["status"] == "completed"
+        assert comfyui.history_requests == history_requests
+    finally:
+        await tracker.stop()
+        await tracker.client.close()
+
+
+@pytest.mark.asyncio
+async def test_stop_fails_pending_waiters_and_closes_subscribers(comfyui):
+    comfyui.step_delay = 5
+    tracker = make_tracker(comfyui)
+    run_id = uuid4()
+    queue = tracker.events.subscribe(run_id)
+    try:
+        await tracker.ensure_started(timeout=5)
+        prompt_id = await submit(tracker, run_id)
+        waiter = asyncio.create_task(tracker.wait_for_result(prompt_id, run_id, timeout=30))
+        await asyncio.sleep(0.05)
+
+        await tracker.stop()
+        tracker.events.close()
+
+        with pytest.raises(TrackerStoppedError):
+            await asyncio.wait_for(waiter, timeout=1)
+        assert not tracker.is_tracking(prompt_id)
+    finally:
+        await tracker.stop()
+        await tracker.client.close()
+
+    events = [queue.get_nowait() for _ in range(queue.qsize())]
+    assert events[-1] == {"type": "closed"}
+    # Streams opened after shutdown end straight away
+    assert tracker.events.subscribe(uuid4()).get_nowait() == {"type": "closed"}
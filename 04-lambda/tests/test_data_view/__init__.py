@@ -0,0 +1 @@
+"""Tests for the data view browsing layer."""
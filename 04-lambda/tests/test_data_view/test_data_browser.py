@@ -0,0 +1,229 @@
+"""Tests for cursor-based browsing of MinIO, MongoDB and Neo4j."""
+
+from uuid import uuid4
+
+import pytest
+from app.interfaces.http.data_browser import (
+    BrowseTimeoutError,
+    CursorError,
+    browse_collection,
+    browse_graph,
+    browse_storage,
+    decode_cursor,
+    encode_cursor,
+)
+from app.services.storage.minio.client import MinIOClient
+from app.services.storage.minio.config import MinIOConfig
+from app.services.storage.minio.fake import FakeS3
+from app.services.storage.minio.s3 import close_http_session
+from bson import ObjectId
+
+from tests.conftest import MemoryCollection
+
+# ========== Cursors ==========
+
+
+def test_cursor_round_trip_and_scope():
+    scope = {"store": "mongodb", "collection": "documents"}
+    cursor = encode_cursor(scope, {"last": "abc"})
+
+    assert decode_cursor(cursor, scope) == {"last": "abc"}
+    assert decode_cursor(None, scope) is None
+    with pytest.raises(CursorError):
+        decode_cursor(cursor, {**scope, "collection": "chunks"})
+    with pytest.raises(CursorError):
+        decode_cursor("not-a-cursor", scope)
+
+
+# ========== MinIO ==========
+
+
+@pytest.fixture
+async def minio():
+    async with FakeS3() as s3:
+        client = MinIOClient(
+            MinIOConfig(MINIO_ENDPOINT=s3.url, MINIO_ACCESS_KEY="minio", MINIO_SECRET_KEY="secret")
+        )
+        yield client
+    await close_http_session()
+
+
+async def browse_all_files(client, user_id, prefix=None, limit=10):
+    keys, cursor, pages = [], None, 0
+    while True:
+        files, cursor = await browse_storage(
+            client, user_id, prefix, limit=limit, cursor=cursor, timeout=5
+        )
+        keys.extend(f.key for f in files)
+        pages += 1
+        if cursor is None:
+            return keys, pages
+
+
+@pytest.mark.asyncio
+async def test_storage_pages_follow_continuation_tokens(minio):
+    alice, bob = uuid4(), uuid4()
+    await minio.provision_user(alice, "alice@example.com")
+    for i in range(23):
+        await minio.upload_file(alice, b"x", f"loras/{i:02d}.safetensors")
+    for i in range(4):
+        await minio.upload_file(bob, b"y", f"{i}.png")
+
+    keys, pages = await browse_all_files(minio, None)
+    assert len(keys) == 27 == len(set(keys))
+    assert pages == 3  # 28 objects with the .keep placeholder, 10 per page
+
+    keys, _ = await browse_all_files(minio, alice, prefix="loras/")
+    assert keys == [f"user-{alice}/loras/{i:02d}.safetensors" for i in range(23)]
+
+    # A cursor only continues the listing it came from
+    _, cursor = await browse_storage(minio, alice, "loras/", limit=5, cursor=None, timeout=5)
+    with pytest.raises(CursorError):
+        await browse_storage(minio, bob, "loras/", limit=5, cursor=cursor, timeout=5)
+
+
+# ========== MongoDB ==========
+
+
+@pytest.mark.asyncio
+async def test_collection_pages_by_id_keyset():
+    documents = [{"_id": ObjectId(), "user_id": "u1" if i % 3 else "u2", "n": i} for i in range(20)]
+    collection = MemoryCollection(documents, name="documents")
+    query_filter = {"$or": [{"user_id": "u1"}, {"user_email": "u1@example.com"}]}
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = await browse_collection(
+            collection, query_filter, limit=5, cursor=cursor, timeout=2
+        )
+        seen.extend(doc["n"] for doc in page)
+        if cursor is None:
+            break
+
+    expected = sorted((i for i in range(20) if i % 3), reverse=True)
+    assert seen == expected
+    # Later pages continue from the last _id instead of skipping
+    assert collection.finds[0].filter == query_filter
+    assert collection.finds[1].filter["$and"][0] == query_filter
+    assert "$lt" in collection.finds[1].filter["$and"][1]["_id"]
+    assert collection.finds[0].options["max_time_ms"] == 2000
+
+
+@pytest.mark.asyncio
+async def test_slow_query_times_out():
+    collection = MemoryCollection([{"_id": 1}], name="documents", delay=0.5)
+
+    with pytest.raises(BrowseTimeoutError):
+        await browse_collection(collection, {}, limit=5, cursor=None, timeout=0.05)
+
+
+# ========== Neo4j ==========
+
+
+class FakeEntity(dict):
+    def __init__(self, element_id, properties=None, **attributes):
+        super().__init__(properties or {})
+        self.element_id = element_id
+        self.__dict__.update(attributes)
+
+
+class FakeResult:
+    def __init__(self, records):
+        self._records = records
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for record in self._records:
+            yield record
+
+
+class FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def run(self, query, parameters):
+        self.driver.runs.append((query, parameters))
+        after, limit = parameters["after"], parameters["limit"]
+        records = [r for r in self.driver.records if after is None or r["n"].element_id > after]
+        return FakeResult(records[:limit])
+
+
+class FakeDriver:
+    def __init__(self, records):
+        self.records = records
+        self.runs = []
+
+    def session(self):
+        return FakeSession(self)
+
+
+def graph_records(count):
+    records = []
+    for i in range(count):
+        node = FakeEntity(f"4:db:{i:03d}", {"name": f"node {i}"}, labels={"Document"})
+        target = FakeEntity(f"4:db:{(i + 1) % count:03d}")
+        rel = FakeEntity(f"5:db:{i:03d}", {}, type="LINKS", start_node=node, end_node=target)
+        records.append({"n": node, "relationships": [rel], "out_degree": 120})
+    return records
+
+
+@pytest.mark.asyncio
+async def test_graph_pages_with_degree_cap():
+    driver = FakeDriver(graph_records(7))
+    pages, cursor = [], None
+    while True:
+        nodes, relationships, cursor = await browse_graph(
+            driver,
+            email="u@example.com",
+            label="Document",
+            limit=3,
+            cursor=cursor,
+            degree_cap=25,
+            timeout=2,
+        )
+        pages.append([n["id"] for n in nodes])
+        if cursor is None:
+            break
+
+    assert pages == [
+        ["4:db:000", "4:db:001", "4:db:002"],
+        ["4:db:003", "4:db:004", "4:db:005"],
+        ["4:db:006"],
+    ]
+    assert nodes[0]["out_degree"] == 120
+    assert relationships[0]["start_node_id"] == "4:db:006"
+
+    query, parameters = driver.runs[1]
+    assert query.timeout == 2
+    assert "MATCH (u:User {email: $email})" in query.text
+    assert parameters["after"] == "4:db:002"
+    assert parameters["limit"] == 4
+    assert parameters["degree_cap"] == 25
+
+
+@pytest.mark.asyncio
+async def test_admin_graph_query_and_label_validation():
+    driver = FakeDriver(graph_records(2))
+    await browse_graph(
+        driver, email=None, label="Document", limit=10, cursor=None, degree_cap=5, timeout=1
+    )
+    assert "MATCH (n:`Document`)" in driver.runs[0][0].text
+
+    with pytest.raises(ValueError):
+        await browse_graph(
+            driver,
+            email=None,
+            label="X) DETACH DELETE n //",
+            limit=1,
+            cursor=None,
+            degree_cap=5,
+            timeout=1,
+        )
@@ -0,0 +1 @@
+"""Tests for entity extraction."""
@@ -0,0 +1,148 @@
+"""Tests for batched, windowed NER and hybrid escalation."""
+
+import asyncio
+import re
+from itertools import pairwise
+from unittest.mock import patch
+
+import pytest
+from app.capabilities.extraction.entity_extraction import hybrid, ner
+from app.capabilities.extraction.entity_extraction.models import EntityExtractionResult
+from app.capabilities.extraction.entity_extraction.ner import (
+    NERExtractor,
+    merge_window_entities,
+    text_windows,
+)
+from app.core import model_registry
+from app.core.model_registry import ModelRegistry
+
+_WORD = re.compile(r"\S+")
+_NAME = re.compile(r"[A-Z][a-z]+(?: [A-Z][a-z]+)*")
+
+
+class WordTokenizer:
+    """Fast-tokenizer stand-in: one token per word, 2 special tokens."""
+
+    is_fast = True
+
+    def __init__(self, model_max_length=512):
+        self.model_max_length = model_max_length
+
+    def num_special_tokens_to_add(self, pair=False):
+        return 2
+
+    def __call__(self, text, add_special_tokens=True, return_offsets_mapping=False):
+        return {"offset_mapping": [m.span() for m in _WORD.finditer(text)]}
+
+
+class FakeNERPipeline:
+    """Tags capitalized words as people; records every batched call."""
+
+    def __init__(self, model_max_length=512):
+        self.tokenizer = WordTokenizer(model_max_length)
+        self.calls = []
+
+    def __call__(self, texts, batch_size=1):
+        self.calls.append(list(texts))
+        return [
+            [
+                {
+                    "entity_group": "PER",
+                    "word": m.group(0),
+                    "start": m.start(),
+                    "end": m.end(),
+                    "score": 0.9,
+                }
+                for m in _NAME.finditer(text)
+            ]
+            for text in texts
+        ]
+
+
+@pytest.fixture
+def pipeline():
+    fake = FakeNERPipeline(model_max_length=34)  # 32-word windows, 8 words overlap
+    registry = ModelRegistry(workers=2)
+    with (
+        patch.dict(model_registry.LOADERS, {"ner": lambda name: fake}),
+        patch.object(ner, "get_model_registry", return_value=registry),
+    ):
+        yield fake
+
+
+def test_windows_overlap_and_cover_text():
+    text = " ".join(f"w{i}" for i in range(100))
+
+    windows = text_windows(WordTokenizer(model_max_length=34), text)
+
+    assert windows[0][0] == 0 and windows[-1][1] == len(text)
+    for (_, end), (start, _) in pairwise(windows):
+        assert start < end  # consecutive windows overlap
+    assert text_windows(WordTokenizer(), "short text") == [(0, 10)]
+    assert text_windows(WordTokenizer(), "   ") == []
+
+
+def test_merge_keeps_longest_overlapping_span():
+    results = [
+        {"word": "Ada", "start": 10, "end": 13, "score": 0.8},
+        {"word": "Ada Lovelace", "start": 10, "end": 22, "score": 0.7},
+        {"word": "Ada Lovelace", "start": 10, "end": 22, "score": 0.9},
+        {"word": "Babbage", "start": 30, "end": 37, "score": 0.9},
+    ]
+
+    merged = merge_window_entities(results)
+
+    assert [(r["word"], r["score"]) for r in merged] == [("Ada Lovelace", 0.9), ("Babbage", 0.9)]
+
+
+@pytest.mark.asyncio
+async def test_extract_many_batches_windows_across_documents(pipeline):
+    filler = " ".join(["word"] * 40)
+    texts = ["Alice met Bob.", f"{filler} Grace Hopper {filler} Linus", "nothing here"]
+
+    results = await NERExtractor(model_name="fake").extract_many(texts)
+
+    # One pipeline call for every window of every document
+    assert len(pipeline.calls) == 1
+    assert len(pipeline.calls[0]) > len(texts)
+    assert [[e.name for e in r.entities] for r in results] == [
+        ["Alice", "Bob"],
+        ["Grace Hopper", "Linus"],
+        [],
+    ]
+    # Spans point into the original (unwindowed) text
+    grace = results[1].entities[0]
+    assert texts[1][grace.span[0] : grace.span[1]] == "Grace Hopper"
+
+
+class FakeLLM:
+    def __init__(self, fail_on=()):
+        self.active = 0
+        self.max_active = 0
+        self.texts = []
+        self.fail_on = fail_on
+
+    async def extract(self, text):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.texts.append(text)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if text in self.fail_on:
+            raise RuntimeError("llm down")
+        return EntityExtractionResult(extractor_type="llm")
+
+
+@pytest.mark.asyncio
+async def test_hybrid_escalates_only_complex_texts_concurrently(pipeline):
+    simple = [f"Person{i} works here." for i in range(3)]
+    complex_texts = [f"Note {i}: Alice, Bob, Carol, Dave, Erin, Frank" for i in range(6)]
+    llm = FakeLLM(fail_on={complex_texts[0]})
+    with patch.object(hybrid, "LLMExtractor", return_value=llm):
+        extractor = hybrid.HybridExtractor(ner_model="fake", llm_concurrency=2)
+
+    results = await extractor.extract_many(simple + complex_texts)
+
+    assert sorted(llm.texts) == sorted(complex_texts)
+    assert llm.max_active == 2
+    assert [r.extractor_type for r in results] == ["ner"] * 4 + ["hybrid"] * 5
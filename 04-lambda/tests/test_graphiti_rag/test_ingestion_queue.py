@@ -0,0 +1,130 @@
+"""Tests for the background Graphiti ingestion queue and episode creation."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from app.capabilities.retrieval.graphiti_rag.config import config as graphiti_config
+from app.capabilities.retrieval.graphiti_rag.ingestion.adapter import (
+    ChapterInfo,
+    GraphitiIngestionAdapter,
+    GraphitiIngestionOptions,
+)
+from app.capabilities.retrieval.graphiti_rag.ingestion.queue import GraphitiIngestionQueue
+from app.capabilities.retrieval.mongo_rag.ingestion.chunker import DocumentChunk
+
+
+def _chunks(text="hello world"):
+    return [DocumentChunk(content=text, index=0, start_char=0, end_char=len(text), metadata={})]
+
+
+class GatedAdapter:
+    """Adapter stand-in whose jobs block until released."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = asyncio.Event()
+
+    async def ingest_document(self, document_id, **_kwargs):
+        self.calls.append(document_id)
+        await self.release.wait()
+        return {"episodes_created": 1, "facts_added": 0, "errors": []}
+
+
+@pytest.mark.asyncio
+async def test_queue_skips_unchanged_content():
+    adapter = GatedAdapter()
+    adapter.release.set()
+    queue = GraphitiIngestionQueue(adapter, workers=1, max_size=4)
+    await queue.start()
+
+    first = await queue.submit("doc-1", _chunks(), {}, title="T", source="https://a")
+    await queue.drain()
+    second = await queue.submit("doc-2", _chunks(), {}, title="T", source="https://a")
+    changed = await queue.submit("doc-3", _chunks("edited"), {}, title="T", source="https://a")
+    await queue.stop()
+
+    assert (first["status"], second["status"], changed["status"]) == (
+        "queued",
+        "unchanged",
+        "queued",
+    )
+    assert adapter.calls == ["doc-1", "doc-3"]
+    assert queue.stats()["skipped_unchanged"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_drops_superseded_versions_and_reports_backpressure():
+    adapter = GatedAdapter()
+    queue = GraphitiIngestionQueue(adapter, workers=1, max_size=1)
+    await queue.start()
+
+    await queue.submit("busy", _chunks(), {}, source="https://busy")
+    await asyncio.sleep(0)  # worker picks up "busy" and blocks
+    await queue.submit("old", _chunks("v1"), {}, source="https://page")
+    blocked = asyncio.create_task(queue.submit("new", _chunks("v2"), {}, source="https://page"))
+    await asyncio.sleep(0)
+
+    stats = queue.stats()
+    assert stats["in_flight"] == 1
+    assert stats["depth"] == 1
+    assert stats["backpressure_waits"] == 1
+    assert not blocked.done()
+
+    adapter.release.set()
+    await blocked
+    await queue.stop()
+
+    assert adapter.calls == ["busy", "new"]
+    assert queue.stats()["superseded"] == 1
+    assert queue.stats()["completed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_episodes_of_a_document_are_added_in_order():
+    pytest.importorskip("graphiti_core")
+    active = 0
+    peak = 0
+    names = []
+
+    async def add_episode(name, **_kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        names.append(name)
+        active -= 1
+
+    graphiti = SimpleNamespace(add_episode=AsyncMock(side_effect=add_episode))
+    chapters = [ChapterInfo(title=f"c{i}", start_time=i * 60, content="text") for i in range(6)]
+    options = GraphitiIngestionOptions(episode_type="both", extract_facts=False, chapters=chapters)
+
+    with patch.object(graphiti_config, "graphiti_episode_concurrency", 3):
+        result = await GraphitiIngestionAdapter(graphiti).ingest_document(
+            "doc", _chunks(), {}, title="T", source="s", options=options
+        )
+
+    assert result["episodes_created"] == 7
+    # Graphiti needs one group's episodes one at a time, in time order
+    assert peak == 1
+    assert names == ["doc:doc:overview"] + [f"doc:doc:chapter:c{i}" for i in range(6)]
+
+
+@pytest.mark.asyncio
+async def test_chapter_episodes_use_bulk_submission_when_available():
+    pytest.importorskip("graphiti_core")
+    graphiti = SimpleNamespace(add_episode=AsyncMock(), add_episode_bulk=AsyncMock())
+    chapters = [ChapterInfo(title=f"c{i}", start_time=i * 60, content="text") for i in range(4)]
+    options = GraphitiIngestionOptions(
+        episode_type="chapters", extract_facts=False, chapters=chapters
+    )
+
+    result = await GraphitiIngestionAdapter(graphiti).ingest_document(
+        "doc", _chunks(), {}, title="T", source="s", options=options
+    )
+
+    assert result["episodes_created"] == 4
+    graphiti.add_episode.assert_not_awaited()
+    (episodes,) = graphiti.add_episode_bulk.await_args.args
+    assert [episode.name for episode in episodes] == [f"doc:doc:chapter:c{i}" for i in range(4)]
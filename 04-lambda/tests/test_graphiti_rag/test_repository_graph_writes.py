@@ -0,0 +1,160 @@
+"""Tests for batched Neo4j writes in the repository parser."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from app.capabilities.retrieval.graphiti_rag.config import config as graphiti_config
+from app.capabilities.retrieval.graphiti_rag.knowledge_graphs.repository_parser import (
+    DirectNeo4jExtractor,
+    build_graph_rows,
+    file_content_hash,
+)
+
+
+class RecordingSession:
+    """Fake Neo4j session that records statements instead of executing them."""
+
+    def __init__(self):
+        self.runs = []
+        self.writes = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def run(self, query, **params):
+        self.runs.append((query, params))
+
+    async def execute_write(self, func, *args):
+        tx = AsyncMock()
+        await func(tx, *args)
+        self.writes.append(tx.run.call_args)
+
+
+def _sample_modules_data(count=5):
+    return [
+        {
+            "module_name": f"pkg.mod{i}",
+            "file_path": f"pkg/mod{i}.py",
+            "line_count": 10,
+            "classes": [
+                {
+                    "name": "Widget",
+                    "full_name": f"pkg.mod{i}.Widget",
+                    "methods": [
+                        {
+                            "name": "render",
+                            "params": [{"name": "x", "type": "int"}],
+                            "params_detailed": ["x:int"],
+                            "return_type": "str",
+                            "args": ["x"],
+                        }
+                    ],
+                    "attributes": [{"name": "size", "type": "int"}],
+                }
+            ],
+            "functions": [
+                {
+                    "name": "helper",
+                    "full_name": f"pkg.mod{i}.helper",
+                    "params_list": [],
+                    "params_detailed": [],
+                    "return_type": "Any",
+                    "args": [],
+                }
+            ],
+            "imports": ["pkg.base"],
+        }
+        for i in range(count)
+    ]
+
+
+def test_build_graph_rows_flattens_modules():
+    """Test analyzed modules are flattened into one row list per UNWIND statement."""
+    rows = build_graph_rows(_sample_modules_data())
+
+    assert len(rows["files"]) == 5
+    assert len(rows["classes"]) == 5
+    assert rows["methods"][0]["method_id"] == "pkg.mod0.Widget::render"
+    assert rows["methods"][0]["params_list"] == ["x:int"]
+    assert rows["attributes"][0]["attr_id"] == "pkg.mod0.Widget::size"
+    assert rows["functions"][0]["func_id"] == "pkg/mod0.py::helper"
+    assert rows["imports"][0] == {"source_path": "pkg/mod0.py", "import_name": "pkg.base"}
+
+
+@pytest.mark.asyncio
+async def test_create_graph_batches_writes():
+    """Test _create_graph issues chunked UNWIND transactions instead of per-node runs."""
+    extractor = DirectNeo4jExtractor("bolt://localhost:7687", "neo4j", "password")
+    session = RecordingSession()
+    extractor.driver = Mock()
+    extractor.driver.session = Mock(return_value=session)
+
+    with patch.object(graphiti_config, "repo_parser_batch_size", 2):
+        await extractor._create_graph("repo", _sample_modules_data())
+
+    # Only the Repository node is created with a plain run
+    assert len(session.runs) == 1
+    # 6 statements x ceil(5 rows / 2) chunks
+    assert len(session.writes) == 18
+    for call in session.writes:
+        assert "UNWIND $rows AS row" in call.args[0]
+        assert len(call.kwargs["rows"]) <= 2
+
+
+@pytest.mark.asyncio
+async def test_parse_python_files_skips_unparseable(tmp_path):
+    """Test parsing off the event loop returns analyses only for valid files."""
+    (tmp_path / "good.py").write_text("class Widget:\n    def render(self, x: int) -> str: ...\n")
+    (tmp_path / "bad.py").write_text("def broken(:\n")
+    files = sorted(tmp_path.glob("*.py"))
+
+    extractor = DirectNeo4jExtractor("bolt://localhost:7687", "neo4j", "password")
+    with patch.object(graphiti_config, "repo_parser_workers", 1):
+        modules = await extractor.parse_python_files(
+            files, tmp_path, extractor.identify_project_modules(files, tmp_path)
+        )
+
+    assert [m["file_path"] for m in modules] == ["good.py"]
+    assert modules[0]["classes"][0]["methods"][0]["name"] == "render"
+
+
+@pytest.mark.asyncio
+async def test_incremental_reindex_only_touches_changed_files(tmp_path):
+    """Test incremental re-index re-parses changed files and deletes removed ones."""
+    (tmp_path / "same.py").write_text("def unchanged():\n    pass\n")
+    (tmp_path / "edited.py").write_text("def edited():\n    pass\n")
+    files = sorted(tmp_path.glob("*.py"))
+    stored_hashes = {
+        "same.py": file_content_hash(tmp_path / "same.py"),
+        "edited.py": "stale-hash",
+        "deleted.py": "old-hash",
+    }
+
+    extractor = DirectNeo4jExtractor("bolt://localhost:7687", "neo4j", "password")
+    session = RecordingSession()
+    extractor.driver = Mock()
+    extractor.driver.session = Mock(return_value=session)
+
+    with patch.object(graphiti_config, "repo_parser_workers", 1):
+        stats = await extractor._reindex_changed_files(
+            "repo", files, tmp_path, {"same", "edited"}, stored_hashes
+        )
+
+    assert stats["mode"] == "incremental"
+    assert stats["files_parsed"] == 1
+    assert stats["files_unchanged"] == 1
+    assert stats["files_removed"] == 1
+
+    delete_calls = [c for c in session.writes if "DELETE" in c.args[0]]
+    assert delete_calls
+    for call in delete_calls:
+        assert sorted(call.kwargs["rows"]) == ["deleted.py", "edited.py"]
+
+    file_writes = [c for c in session.writes if "CREATE (f:File" in c.args[0]]
+    assert [row["path"] for row in file_writes[0].kwargs["rows"]] == ["edited.py"]
+    assert file_writes[0].kwargs["rows"][0]["content_hash"] == file_content_hash(
+        tmp_path / "edited.py"
+    )
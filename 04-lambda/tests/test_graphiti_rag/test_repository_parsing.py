@@ -35,7 +35,7 @@ async def test_parse_github_repository(mock_graphiti_rag_deps):
             assert result["success"] is True
             assert "message" in result
             assert result["repo_url"] == repo_url
-            mock_extractor.analyze_repository.assert_called_once_with(repo_url)
+            mock_extractor.analyze_repository.assert_called_once_with(repo_url, incremental=False)
 
 
 @pytest.mark.asyncio
@@ -91,7 +91,7 @@ async def test_extract_code_structure(mock_graphiti_rag_deps):
             # Assert
             assert result["success"] is True
             # Verify structure extraction was called
-            mock_extractor.analyze_repository.assert_called_once_with(repo_url)
+            mock_extractor.analyze_repository.assert_called_once_with(repo_url, incremental=False)
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,161 @@
+"""Tests for the in-memory repository symbol index used by script validation."""
+
+import pytest
+from app.capabilities.retrieval.graphiti_rag.knowledge_graphs.ai_script_analyzer import (
+    AnalysisResult,
+    ImportInfo,
+)
+from app.capabilities.retrieval.graphiti_rag.knowledge_graphs.symbol_index import (
+    ClassSymbols,
+    RepositorySymbolIndex,
+    RepositorySymbols,
+    clear_symbol_cache,
+    load_symbol_index,
+)
+
+
+def _sample_index():
+    agent = ClassSymbols(
+        name="Agent",
+        full_name="pydantic_ai.agent.Agent",
+        methods={
+            "run": {"name": "run", "params_list": ["prompt:str"], "return_type": "Any", "args": []},
+            "run_sync": {"name": "run_sync", "params_list": [], "return_type": "Any", "args": []},
+        },
+        attributes={"model": {"name": "model", "type": "str"}},
+    )
+    repo = RepositorySymbols(
+        name="pydantic-ai",
+        version="1",
+        files=[
+            ("pydantic_ai/agent.py", "pydantic_ai.agent"),
+            ("pydantic_ai/tools.py", "pydantic_ai.tools"),
+        ],
+        classes=[agent],
+        functions=[
+            {"name": "tool", "full_name": "pydantic_ai.tools.tool", "params_list": [], "args": []}
+        ],
+    )
+    return RepositorySymbolIndex([repo])
+
+
+def test_module_lookup_matches_file_modules_and_repo_names():
+    """Test modules resolve by file module names and by normalized repository name."""
+    index = _sample_index()
+
+    assert index.repositories_for_module("pydantic_ai") == ["pydantic-ai"]
+    assert index.module_files("pydantic_ai.agent") == [
+        "pydantic_ai/agent.py",
+        "pydantic_ai/tools.py",
+    ]
+    assert index.module_contents("pydantic_ai") == (["Agent"], ["tool"])
+    assert index.repositories_for_module("requests") == []
+
+
+def test_class_method_and_attribute_lookup():
+    """Test short, full and module-qualified names resolve to the same class."""
+    index = _sample_index()
+
+    assert index.find_class("Agent")["full_name"] == "pydantic_ai.agent.Agent"
+    assert index.find_class("pydantic_ai.Agent")["name"] == "Agent"
+    assert index.find_method("pydantic_ai.Agent", "run")["params_list"] == ["prompt:str"]
+    assert index.find_method("pydantic_ai.Agent", "missing") is None
+    assert index.find_attribute("Agent", "model")["type"] == "str"
+    assert index.find_function("pydantic_ai.tool")["name"] == "tool"
+
+
+def test_similar_methods_include_fuzzy_matches():
+    """Test suggestions cover shared prefixes and close misspellings."""
+    index = _sample_index()
+
+    assert index.find_similar_methods("Agent", "run_async") == ["run", "run_sync"]
+    assert "run_sync" in index.find_similar_methods("Agent", "rn_sync")
+
+
+class _Record(dict):
+    def data(self):
+        return dict(self)
+
+
+class _Result:
+    def __init__(self, records):
+        self.records = [_Record(r) for r in records]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for record in self.records:
+            yield record
+
+
+class _FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def run(self, query, **_params):
+        self.driver.queries.append(query)
+        if "collect(DISTINCT split" in query:
+            return _Result(
+                [
+                    {"repo_name": "pydantic-ai", "version": "v1", "module_roots": ["pydantic_ai"]},
+                    {"repo_name": "other", "version": "v1", "module_roots": ["other"]},
+                ]
+            )
+        if "f.path AS path" in query:
+            return _Result(
+                [
+                    {
+                        "repo_name": "pydantic-ai",
+                        "path": "pydantic_ai/agent.py",
+                        "module_name": "pydantic_ai.agent",
+                    }
+                ]
+            )
+        if "HAS_METHOD" in query:
+            return _Result(
+                [
+                    {
+                        "repo_name": "pydantic-ai",
+                        "name": "Agent",
+                        "full_name": "pydantic_ai.agent.Agent",
+                        "methods": [{"name": "run", "params_detailed": ["prompt:str"]}],
+                        "attributes": [],
+                    }
+                ]
+            )
+        return _Result([])
+
+
+class _FakeDriver:
+    def __init__(self):
+        self.queries = []
+
+    def session(self):
+        return _FakeSession(self)
+
+
+@pytest.mark.asyncio
+async def test_load_symbol_index_loads_relevant_repos_once():
+    """Test only repositories the script imports are loaded, and reloads hit the cache."""
+    clear_symbol_cache()
+    analysis = AnalysisResult(
+        file_path="script.py",
+        imports=[ImportInfo(module="pydantic_ai", name="Agent", is_from_import=True)],
+    )
+    driver = _FakeDriver()
+
+    index = await load_symbol_index(driver, analysis)
+    assert list(index.repositories) == ["pydantic-ai"]
+    assert index.find_method("Agent", "run")["params_list"] == ["prompt:str"]
+    assert len(driver.queries) == 4
+
+    await load_symbol_index(driver, analysis)
+    # Second load only needs the catalog query
+    assert len(driver.queries) == 5
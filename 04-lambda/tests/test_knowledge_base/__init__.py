@@ -0,0 +1 @@
+"""Tests for the Knowledge Base article services."""
@@ -0,0 +1,230 @@
+"""Tests for separately stored article versions and keyset article listing."""
+
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import pytest
+from app.capabilities.knowledge_graph.knowledge_base.models import (
+    ArticleCount,
+    ArticleCreateRequest,
+    ArticleUpdateRequest,
+)
+from app.capabilities.knowledge_graph.knowledge_base.services.article_service import (
+    ArticleService,
+)
+from app.capabilities.knowledge_graph.knowledge_base.versions import (
+    apply_diff,
+    make_diff,
+    rebuild_contents,
+)
+
+from tests.conftest import MemoryCollection
+
+# ========== In-memory collections ==========
+
+
+class CountingCollection(MemoryCollection):
+    """Collection recording which kind of count a listing asked for."""
+
+    def __init__(self):
+        super().__init__()
+        self.counts = defaultdict(int)
+
+    async def count_documents(self, query_filter):
+        self.counts["exact"] += 1
+        return await super().count_documents(query_filter)
+
+    async def estimated_document_count(self):
+        self.counts["estimated"] += 1
+        return await super().estimated_document_count()
+
+
+class FakeMongoClient:
+    def __init__(self):
+        self.databases = defaultdict(lambda: defaultdict(CountingCollection))
+
+    def __getitem__(self, name):
+        return self.databases[name]
+
+
+@pytest.fixture
+def service():
+    service = ArticleService(FakeMongoClient())
+    service.versions.snapshot_interval = 5
+    return service
+
+
+# ========== Diffs ==========
+
+
+def test_diff_round_trip():
+    rng = random.Random(7)
+    lines = [f"line {i}\n" for i in range(60)]
+    old = "".join(lines)
+    for _ in range(50):
+        edited = list(lines)
+        for _ in range(rng.randint(1, 6)):
+            position = rng.randrange(len(edited))
+            action = rng.choice(["insert", "delete", "replace"])
+            if action == "insert":
+                edited.insert(position, f"new {rng.random()}\n")
+            elif action == "delete":
+                del edited[position]
+            else:
+                edited[position] = f"changed {rng.random()}"
+        new = "".join(edited)
+        assert apply_diff(old, make_diff(old, new)) == new
+
+    assert apply_diff("", make_diff("", "# Title\n")) == "# Title\n"
+    assert apply_diff("a\nb\n", make_diff("a\nb\n", "")) == ""
+    # Unchanged lines are copied by reference, not stored
+    assert make_diff(old, old + "tail\n") == [[0, 60], "tail\n"]
+
+
+def test_diff_before_snapshot_is_rejected():
+    with pytest.raises(ValueError):
+        rebuild_contents([{"article_id": "a", "version": 2, "diff": [[0, 1]]}])
+
+
+# ========== Version history ==========
+
+
+async def create(service, content="v1\n", title="Article"):
+    return await service.create_article(
+        ArticleCreateRequest(title=title, content=content), "owner@example.com"
+    )
+
+
+@pytest.mark.asyncio
+async def test_versions_are_diffs_between_snapshots(service):
+    article = await create(service)
+    contents = ["v1\n"]
+    for version in range(2, 13):
+        contents.append(contents[-1] + f"v{version}\n")
+        await service.update_article(
+            article.id,
+            ArticleUpdateRequest(content=contents[-1], change_reason=f"edit {version}"),
+            f"editor{version}@example.com",
+        )
+
+    stored = service.versions.collection.docs
+    assert [d["version"] for d in stored if "snapshot" in d] == [1, 6, 11]
+    assert all("content" not in d for d in stored)
+
+    history = await service.get_article_history(article.id)
+    assert [v.content for v in history] == contents
+    assert history[0].changed_by == "owner@example.com"
+    assert history[4].changed_by == "editor5@example.com"
+    assert history[4].change_reason == "edit 5"
+
+    version = await service.get_article_version(article.id, 9)
+    assert version.content == contents[8]
+    assert await service.get_article_version(article.id, 13) is None
+
+    # Articles no longer embed their history
+    current = await service.get_article(article.id)
+    assert current.version == 12
+    assert "version_history" not in service.collection.docs[0]
+
+    await service.delete_article(article.id)
+    assert service.versions.collection.docs == []
+
+
+@pytest.mark.asyncio
+async def test_unrecorded_article_gets_a_base_snapshot(service):
+    # An article written before versions were stored separately
+    await service.collection.insert_one(
+        {
+            "slug": "legacy",
+            "title": "Legacy",
+            "content": "old\n",
+            "author_email": "owner@example.com",
+            "version": 3,
+            "version_history": [{"version": 1, "content": "x"}, {"version": 2, "content": "y"}],
+            "created_at": datetime(2024, 1, 1),
+            "updated_at": datetime(2024, 2, 1),
+        }
+    )
+    article_id = str(service.collection.docs[0]["_id"])
+
+    await service.update_article(article_id, ArticleUpdateRequest(content="new\n"), "e@x.com")
+
+    history = await service.get_article_history(article_id)
+    assert [(v.version, v.content) for v in history] == [(3, "old\n"), (4, "new\n")]
+    assert "diff" in service.versions.collection.docs[1]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_edit_retries_on_top_of_the_winner(service):
+    article = await create(service)
+    get_article = service.get_article
+    interleaved = False
+
+    async def get_article_then_edit(article_id):
+        nonlocal interleaved
+        current = await get_article(article_id)
+        if not interleaved:
+            # Another editor saves between this edit's read and its write
+            interleaved = True
+            await service.update_article(
+                article_id, ArticleUpdateRequest(content="v1\nother\n"), "other@example.com"
+            )
+        return current
+
+    service.get_article = get_article_then_edit
+    updated = await service.update_article(
+        article.id, ArticleUpdateRequest(content="v1\nmine\n"), "me@example.com"
+    )
+
+    assert (updated.version, updated.content) == (3, "v1\nmine\n")
+    history = await service.get_article_history(article.id)
+    assert [(v.version, v.content, v.changed_by) for v in history] == [
+        (1, "v1\n", "owner@example.com"),
+        (2, "v1\nother\n", "other@example.com"),
+        (3, "v1\nmine\n", "me@example.com"),
+    ]
+
+
+# ========== Listing ==========
+
+
+@pytest.mark.asyncio
+async def test_list_pages_by_keyset_without_embeddings(service):
+    start = datetime(2024, 1, 1)
+    for i in range(23):
+        article = await create(service, title=f"Article {i}")
+        document = service.collection.docs[-1]
+        document["content_embedding"] = [0.1] * 8
+        # Pairs of articles share an updated_at, so _id breaks the ties
+        document["updated_at"] = start + timedelta(minutes=i // 2)
+        document["tags"] = ["even"] if i % 2 == 0 else ["odd"]
+        assert article.id == str(document["_id"])
+
+    titles, cursor, pages = [], None, 0
+    while True:
+        articles, cursor, total, _ = await service.list_articles(per_page=5, cursor=cursor)
+        titles.extend(a.title for a in articles)
+        pages += 1
+        assert all(a.content_embedding is None for a in articles)
+        assert total is None
+        if cursor is None:
+            break
+
+    assert pages == 5
+    assert titles == [f"Article {i}" for i in reversed(range(23))]
+    assert service.collection.counts == {}
+    assert all(
+        find.projection == {"version_history": 0, "content_embedding": 0}
+        for find in service.collection.finds
+    )
+
+    _, _, total, estimated = await service.list_articles(count=ArticleCount.ESTIMATED)
+    assert (total, estimated) == (23, True)
+    _, _, total, estimated = await service.list_articles(
+        tags=["even"], count=ArticleCount.ESTIMATED
+    )
+    assert (total, estimated) == (12, False)
+
+    with pytest.raises(ValueError):
+        await service.list_articles(cursor="not-a-cursor")
@@ -0,0 +1 @@
+"""Tests for the MinIO storage client."""
@@ -0,0 +1,146 @@
+"""Tests for MinIOClient against the local S3 stand-in."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from app.services.storage.minio.client import MinIOClient
+from app.services.storage.minio.config import MinIOConfig
+from app.services.storage.minio.fake import FakeS3
+from app.services.storage.minio.s3 import MIN_PART_SIZE, close_http_session
+from botocore.exceptions import ClientError
+
+BUCKET = "user-data"
+
+
+def payload(size: int) -> bytes:
+    return bytes(i % 251 for i in range(size))
+
+
+async def chunked(data: bytes, size: int = 64 * 1024):
+    for offset in range(0, len(data), size):
+        await asyncio.sleep(0)
+        yield data[offset : offset + size]
+
+
+@pytest.fixture
+async def s3():
+    async with FakeS3() as server:
+        yield server
+    await close_http_session()
+
+
+def make_client(s3, **overrides) -> MinIOClient:
+    settings = {
+        "MINIO_ENDPOINT": s3.url,
+        "MINIO_ACCESS_KEY": "minio",
+        "MINIO_SECRET_KEY": "minio-secret",
+        "MINIO_BUCKET_NAME": BUCKET,
+        "MINIO_MULTIPART_THRESHOLD": MIN_PART_SIZE,
+        "MINIO_PART_SIZE": MIN_PART_SIZE,
+        "MINIO_MAX_CONCURRENCY": 3,
+    }
+    settings.update(overrides)
+    return MinIOClient(MinIOConfig(**settings))
+
+
+@pytest.mark.asyncio
+async def test_small_file_is_a_single_put(s3):
+    client = make_client(s3)
+    user_id = uuid4()
+
+    key = await client.upload_file(
+        user_id, b"hello", "notes/a b.txt", "text/plain", {"source": "test"}
+    )
+
+    assert key == f"user-{user_id}/notes/a b.txt"
+    assert s3.operations("PutObject") == 1
+    assert s3.operations("CreateMultipartUpload") == 0
+    stored = s3.buckets[BUCKET][key]
+    assert stored.content_type == "text/plain"
+    assert stored.metadata == {"source": "test"}
+    assert await client.download_file(user_id, "notes/a b.txt") == b"hello"
+
+
+@pytest.mark.asyncio
+async def test_large_file_uploads_parts_in_parallel(s3):
+    s3.part_delay = 0.05
+    client = make_client(s3)
+    user_id = uuid4()
+    data = payload(3 * MIN_PART_SIZE + 1000)
+
+    key = await client.upload_file(user_id, data, "videos/clip.mp4", "video/mp4")
+
+    assert s3.operations("UploadPart") == 4
+    assert s3.max_parts_in_flight == 3
+    assert s3.operations("CompleteMultipartUpload") == 1
+    assert s3.buckets[BUCKET][key].data == data
+    assert s3.buckets[BUCKET][key].content_type == "video/mp4"
+    assert not s3.uploads
+
+
+@pytest.mark.asyncio
+async def test_stream_upload_and_streamed_download(s3):
+    client = make_client(s3, MINIO_DOWNLOAD_CHUNK_SIZE=128 * 1024)
+    user_id = uuid4()
+    data = payload(2 * MIN_PART_SIZE + 12345)
+
+    await client.upload_stream(user_id, chunked(data), "models/lora.safetensors")
+
+    assert s3.operations("UploadPart") == 3
+    stream = await client.open_file(user_id, "models/lora.safetensors")
+    assert stream.content_length == len(data)
+    received = [chunk async for chunk in stream]
+    assert b"".join(received) == data
+    assert max(len(chunk) for chunk in received) <= 128 * 1024
+
+
+@pytest.mark.asyncio
+async def test_ranged_download(s3):
+    client = make_client(s3)
+    user_id = uuid4()
+    data = payload(100_000)
+    await client.upload_file(user_id, data, "clip.bin")
+
+    stream = await client.open_file(user_id, "clip.bin", start=1000, end=1999)
+    assert stream.content_range == "bytes 1000-1999/100000"
+    assert stream.total_size == 100_000
+    assert await stream.read() == data[1000:2000]
+
+    stream = await client.open_file(user_id, "clip.bin", start=99_000)
+    assert await stream.read() == data[99_000:]
+
+
+@pytest.mark.asyncio
+async def test_failed_part_aborts_the_upload(s3):
+    s3.fail_part = 2
+    client = make_client(s3)
+
+    with pytest.raises(ClientError) as excinfo:
+        await client.upload_file(uuid4(), payload(3 * MIN_PART_SIZE), "broken.bin")
+
+    assert excinfo.value.response["Error"]["Code"] == "InternalError"
+    assert len(s3.aborted) == 1
+    assert not s3.uploads
+    assert not s3.buckets[BUCKET]
+
+
+@pytest.mark.asyncio
+async def test_list_exists_and_delete(s3):
+    client = make_client(s3)
+    user_id = uuid4()
+    await client.provision_user(user_id, "user@example.com")
+    for name in ("b.txt", "a.txt", "sub/c.txt"):
+        await client.upload_file(user_id, name.encode(), name)
+    await client.upload_file(uuid4(), b"other user", "a.txt")
+
+    files = await client.list_files(user_id)
+    assert [f.filename for f in files] == ["a.txt", "b.txt", "sub/c.txt"]
+    assert files[0].size == 5
+    assert [f.filename for f in await client.list_files(user_id, prefix="sub/")] == ["sub/c.txt"]
+
+    assert await client.file_exists(user_id, "a.txt")
+    assert await client.delete_file(user_id, "a.txt")
+    assert not await client.file_exists(user_id, "a.txt")
+    with pytest.raises(ClientError):
+        await client.download_file(user_id, "a.txt")
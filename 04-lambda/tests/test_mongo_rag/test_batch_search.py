@@ -0,0 +1,129 @@
+"""Tests for multi-query batch search."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from app.capabilities.retrieval.mongo_rag.config import config as rag_config
+from app.capabilities.retrieval.mongo_rag.models import BatchSearchRequest
+from app.capabilities.retrieval.mongo_rag.tools import BatchQuery, batch_search
+from pydantic import ValidationError
+
+from tests.conftest import MemoryCursor
+
+
+def _search_text(operator):
+    """First query string in an Atlas Search operator (planned queries are compound)."""
+    if isinstance(operator, dict):
+        if isinstance(operator.get("query"), str):
+            return operator["query"]
+        values = operator.values()
+    elif isinstance(operator, list):
+        values = operator
+    else:
+        return None
+    return next((q for q in map(_search_text, values) if q is not None), None)
+
+
+class FakeChunks:
+    """Chunk collection returning canned hits per query text."""
+
+    def __init__(self, hits: dict[str, list[str]]):
+        self.hits = hits
+        self.pipelines = []
+
+    async def aggregate(self, pipeline):
+        self.pipelines.append(pipeline)
+        stage = pipeline[0]
+        if "$vectorSearch" in stage:
+            query = stage["$vectorSearch"]["queryVector"][0]
+        else:
+            query = _search_text(stage["$search"])
+        return MemoryCursor(
+            [
+                {
+                    "chunk_id": chunk_id,
+                    "document_id": "doc",
+                    "content": chunk_id,
+                    "similarity": 1.0,
+                    "document_title": "T",
+                    "document_source": "s",
+                }
+                for chunk_id in self.hits.get(query, [])
+            ]
+        )
+
+
+def _ctx(hits):
+    chunks = FakeChunks(hits)
+    deps = SimpleNamespace(
+        settings=SimpleNamespace(
+            default_match_count=5,
+            max_match_count=50,
+            mongodb_vector_index="vector_index",
+            mongodb_text_index="text_index",
+            mongodb_collection_chunks="chunks",
+            mongodb_collection_documents="documents",
+        ),
+        db={"chunks": chunks},
+        current_user_id="u1",
+        current_user_email="u1@example.com",
+        user_groups=[],
+        is_admin=True,
+        graphiti_deps=None,
+        # The fake "embedding" is the query text, so vector searches can tell queries apart
+        get_embeddings=AsyncMock(side_effect=lambda texts: [[text] for text in texts]),
+        get_embedding=AsyncMock(side_effect=lambda text: [text]),
+    )
+    return SimpleNamespace(deps=deps), chunks
+
+
+@pytest.mark.asyncio
+async def test_batch_search_embeds_all_queries_in_one_call():
+    ctx, chunks = _ctx({"alpha": ["a1", "a2"], "beta": ["b1"], "gamma": ["g1"]})
+    queries = [
+        BatchQuery(query="alpha", filter_dict={"metadata.tags": {"$all": ["x"]}}),
+        BatchQuery(query="beta", search_type="semantic"),
+        BatchQuery(query="gamma", search_type="text"),
+    ]
+
+    with (
+        patch.object(rag_config, "use_reranking", False),
+        patch.object(rag_config, "text_search_fuzzy_fallback", False),
+    ):
+        results = await batch_search(ctx, queries)
+
+    ctx.deps.get_embeddings.assert_awaited_once_with(["alpha", "beta"])
+    ctx.deps.get_embedding.assert_not_awaited()
+    assert [[r.chunk_id for r in result] for result in results] == [["a1", "a2"], ["b1"], ["g1"]]
+    # Hybrid runs vector + text, semantic and text one each
+    assert len(chunks.pipelines) == 4
+    vector_stages = [p[0]["$vectorSearch"] for p in chunks.pipelines if "$vectorSearch" in p[0]]
+    alpha_vector = next(s for s in vector_stages if s["queryVector"] == ["alpha"])
+    assert alpha_vector["filter"] == {"metadata.tags": {"$all": ["x"]}}
+
+
+@pytest.mark.asyncio
+async def test_batch_search_dedupes_chunks_to_best_ranked_query():
+    ctx, _ = _ctx({"alpha": ["shared", "a1"], "beta": ["b1", "shared"], "gamma": ["shared"]})
+    queries = [BatchQuery(query=q, search_type="semantic") for q in ("alpha", "beta", "gamma")]
+
+    results = await batch_search(ctx, queries, dedupe=True)
+
+    assert [[r.chunk_id for r in result] for result in results] == [["shared", "a1"], ["b1"], []]
+
+
+@pytest.mark.asyncio
+async def test_batch_search_falls_back_to_per_query_embedding():
+    ctx, _ = _ctx({"alpha": ["a1"]})
+    ctx.deps.get_embeddings.side_effect = RuntimeError("provider down")
+
+    results = await batch_search(ctx, [BatchQuery(query="alpha", search_type="semantic")])
+
+    ctx.deps.get_embedding.assert_awaited_once_with("alpha")
+    assert [r.chunk_id for r in results[0]] == ["a1"]
+
+
+def test_batch_request_rejects_duplicate_queries():
+    with pytest.raises(ValidationError):
+        BatchSearchRequest(queries=[{"query": "same"}, {"query": "same", "tags": ["x"]}])
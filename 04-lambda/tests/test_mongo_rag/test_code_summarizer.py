@@ -0,0 +1,134 @@
+"""Tests for code example summarization: concurrency limit, cache and batching."""
+
+import asyncio
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+from app.capabilities.retrieval.mongo_rag.extraction.code_summarizer import (
+    FALLBACK_SUMMARY,
+    CodeSummarizer,
+    summary_cache_key,
+)
+
+from tests.conftest import MemoryCollection
+
+_EXAMPLE_ID = re.compile(
+    r'<example id="(\d+)">\n<context_before>\n.*?\n</context_before>\n\n'
+    r"<code_example>\n(.*?)\n</code_example>",
+    re.DOTALL,
+)
+_CODE = re.compile(r"<code_example>\n(.*?)\n</code_example>", re.DOTALL)
+
+
+class FakeCompletions:
+    """Answers single prompts with "summary of <code>" and batches with JSON."""
+
+    def __init__(self, drop_ids=(), fail=False):
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self.drop_ids = set(drop_ids)
+        self.fail = fail
+
+    async def create(self, model, messages, **kwargs):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            prompt = messages[-1]["content"]
+            self.calls.append(kwargs)
+            if self.fail:
+                raise RuntimeError("endpoint down")
+            if "response_format" in kwargs:
+                summaries = [
+                    {"id": int(n), "summary": f"summary of {code}"}
+                    for n, code in _EXAMPLE_ID.findall(prompt)
+                    if int(n) not in self.drop_ids
+                ]
+                content = json.dumps({"summaries": summaries})
+            else:
+                content = f"summary of {_CODE.search(prompt).group(1)}"
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+            )
+        finally:
+            self.active -= 1
+
+
+def fake_client(**kwargs):
+    return SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions(**kwargs)))
+
+
+def block(code):
+    return {"code": code, "context_before": "before", "context_after": "after"}
+
+
+@pytest.mark.asyncio
+async def test_llm_calls_are_bounded_and_summaries_cached():
+    client = fake_client()
+    cache = MemoryCollection()
+    blocks = [block(f"print({i})  " + "#" * 900) for i in range(10)]
+    summarizer = CodeSummarizer(
+        client=client, model="m", cache_collection=cache, concurrency=3, batch_size=1
+    )
+
+    summaries, stats = await summarizer.summarize(blocks)
+
+    assert summaries == [f"summary of {b['code']}" for b in blocks]
+    assert client.chat.completions.max_active == 3
+    assert (stats.llm_calls, stats.cache_hits, stats.llm_calls_saved) == (10, 0, 0)
+
+    # A re-crawl of the same page is served from the cache
+    summaries_again, stats = await summarizer.summarize(blocks)
+    assert summaries_again == summaries
+    assert (stats.llm_calls, stats.cache_hits, stats.llm_calls_saved) == (0, 10, 10)
+    cached = {doc["_id"] for doc in cache.docs}
+    assert summary_cache_key("m", **blocks[0]) in cached
+    assert summary_cache_key("other", **blocks[0]) not in cached
+
+
+@pytest.mark.asyncio
+async def test_small_blocks_are_batched_and_duplicates_summarized_once():
+    client = fake_client()
+    small = [block(f"x = {i}") for i in range(5)]
+    large = block("y = 1  " + "#" * 900)
+    blocks = [*small, large, small[0]]
+    summarizer = CodeSummarizer(client=client, model="m", batch_size=4, batch_max_chars=800)
+
+    summaries, stats = await summarizer.summarize(blocks)
+
+    assert summaries == [f"summary of {b['code']}" for b in blocks]
+    # One batch of 4, then the leftover small block and the large block alone
+    batched = [c for c in client.chat.completions.calls if "response_format" in c]
+    assert len(batched) == 1
+    assert (stats.llm_calls, stats.batched_blocks, stats.llm_calls_saved) == (3, 4, 4)
+
+
+@pytest.mark.asyncio
+async def test_blocks_missing_from_batch_answer_are_retried_alone():
+    client = fake_client(drop_ids={1})
+    blocks = [block(f"x = {i}") for i in range(3)]
+    summarizer = CodeSummarizer(client=client, model="m", batch_size=3)
+
+    summaries, stats = await summarizer.summarize(blocks)
+
+    assert summaries == [f"summary of {b['code']}" for b in blocks]
+    assert (stats.llm_calls, stats.batched_blocks) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_failures_fall_back_and_are_not_cached():
+    cache = MemoryCollection()
+    summarizer = CodeSummarizer(
+        client=fake_client(fail=True), model="m", cache_collection=cache, batch_size=2
+    )
+
+    summaries, stats = await summarizer.summarize([block("a = 1"), block("b = 2")])
+
+    assert summaries == [FALLBACK_SUMMARY, FALLBACK_SUMMARY]
+    assert stats.failures == 2
+    # The failed batch and both retries: more calls than blocks, but nothing "saved"
+    assert (stats.llm_calls, stats.llm_calls_saved) == (3, 0)
+    assert cache.docs == []
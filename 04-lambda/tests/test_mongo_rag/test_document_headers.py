@@ -0,0 +1,79 @@
+"""Tests for the document header cache used by search results."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from app.capabilities.retrieval.mongo_rag import document_headers
+from app.capabilities.retrieval.mongo_rag.document_headers import (
+    HEADER_PROJECTION,
+    DocumentHeaderCache,
+    attach_document_headers,
+)
+from app.capabilities.retrieval.mongo_rag.rls import build_access_filter
+from bson import ObjectId
+
+from tests.conftest import MemoryCollection
+
+
+def _documents():
+    own, public, private = ObjectId(), ObjectId(), ObjectId()
+    docs = [
+        {"_id": own, "title": "Own", "source": "own.md", "user_id": "u1", "content": "x" * 1000},
+        {"_id": public, "title": "Public", "source": "pub.md", "is_public": True, "content": "y"},
+        {"_id": private, "title": "Private", "source": "priv.md", "user_id": "u2", "content": "z"},
+    ]
+    return MemoryCollection(docs), own, public, private
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_repeat_lookups_and_expires(monkeypatch):
+    documents, own, public, _ = _documents()
+    cache = DocumentHeaderCache(max_size=1, ttl_seconds=30)
+    clock = [1000.0]
+    monkeypatch.setattr(document_headers.time, "monotonic", lambda: clock[0])
+
+    headers = await cache.get_many(documents, [own, own])
+    assert headers[own]["title"] == "Own"
+    assert "content" not in headers[own]
+    [find] = documents.finds
+    assert (find.filter, find.projection) == ({"_id": {"$in": [own]}}, HEADER_PROJECTION)
+
+    await cache.get_many(documents, [own])
+    assert len(documents.finds) == 1 and cache.hits == 1
+
+    # LRU of one: public evicts own
+    await cache.get_many(documents, [public])
+    await cache.get_many(documents, [own])
+    assert len(documents.finds) == 3
+
+    clock[0] += 31
+    await cache.get_many(documents, [own])
+    assert len(documents.finds) == 4
+
+
+@pytest.mark.asyncio
+async def test_attach_applies_rls_and_fills_legacy_chunks():
+    documents, own, public, private = _documents()
+    db = {"documents": documents}
+    settings = SimpleNamespace(mongodb_collection_documents="documents")
+    results = [
+        {"chunk_id": 1, "document_id": own, "document_title": "Own", "document_source": "own.md"},
+        {"chunk_id": 2, "document_id": private, "document_title": "Private"},
+        {"chunk_id": 3, "document_id": public},  # ingested before denormalization
+        {"chunk_id": 4, "document_id": ObjectId()},  # parent document deleted
+    ]
+
+    with patch.object(document_headers, "_header_cache", DocumentHeaderCache(100, 60)):
+        readable = await attach_document_headers(
+            db, settings, [dict(r) for r in results], build_access_filter("u1", "u1@example.com")
+        )
+        assert [r["chunk_id"] for r in readable] == [1, 3]
+        assert readable[1]["document_title"] == "Public"
+        assert readable[1]["document_source"] == "pub.md"
+
+        # Admins reading denormalized chunks need no document reads
+        documents.finds.clear()
+        admin = await attach_document_headers(db, settings, [dict(r) for r in results[:1]], {})
+        assert admin == results[:1]
+        assert documents.finds == []
@@ -0,0 +1,126 @@
+"""Tests for hybrid search fusion and per-source deadlines."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from app.capabilities.retrieval.mongo_rag.config import config as rag_config
+from app.capabilities.retrieval.mongo_rag.tools import (
+    SearchResult,
+    hybrid_search,
+    reciprocal_rank_fusion,
+    score_fusion,
+)
+
+TOOLS = "app.capabilities.retrieval.mongo_rag.tools"
+
+
+def _results(*hits: tuple[str, float]) -> list[SearchResult]:
+    return [
+        SearchResult(
+            chunk_id=chunk_id,
+            document_id="doc",
+            content=chunk_id,
+            similarity=score,
+            document_title="T",
+            document_source="s",
+        )
+        for chunk_id, score in hits
+    ]
+
+
+def test_weighted_rrf_honors_weights_and_keeps_inputs():
+    semantic = _results(("a", 0.9), ("b", 0.8))
+    text = _results(("b", 12.0), ("c", 9.0))
+
+    equal = reciprocal_rank_fusion([semantic, text])
+    assert [r.chunk_id for r in equal] == ["b", "a", "c"]
+    assert equal[0].similarity == pytest.approx(1 / 61 + 1 / 60)
+
+    text_heavy = reciprocal_rank_fusion([semantic, text], weights=[0.1, 0.9])
+    assert [r.chunk_id for r in text_heavy] == ["b", "c", "a"]
+    assert [r.chunk_id for r in reciprocal_rank_fusion([semantic, text], limit=1)] == ["b"]
+    # Source results are copied, not modified
+    assert semantic[1].similarity == 0.8
+
+
+def test_score_fusion_normalizes_each_source():
+    semantic = _results(("a", 0.90), ("b", 0.89), ("c", 0.80), ("d", 0.50))
+    text = _results(("c", 30.0), ("e", 3.0))
+
+    merged = score_fusion([semantic, text], weights=[0.5, 0.5])
+
+    # c is third semantically but far ahead in text; raw text scores would swamp a and b
+    assert [r.chunk_id for r in merged] == ["c", "a", "b", "d", "e"]
+    assert merged[0].similarity == pytest.approx(0.5 * 0.75 + 0.5)
+    assert merged[1].similarity == pytest.approx(0.5)
+    assert merged[-1].similarity == 0.0
+    assert score_fusion([_results(("x", 2.0))])[0].similarity == 1.0
+
+
+def _ctx():
+    deps = SimpleNamespace(
+        settings=SimpleNamespace(default_match_count=5, max_match_count=50),
+        graphiti_deps=None,
+    )
+    return SimpleNamespace(deps=deps)
+
+
+async def _semantic(*_args):
+    return _results(("a", 0.9), ("b", 0.8))
+
+
+async def _slow_text(*_args):
+    await asyncio.sleep(5)
+    return _results(("t", 10.0))
+
+
+async def _failing_text(*_args):
+    raise RuntimeError("index missing")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("text", "status"), [(_slow_text, "timeout"), (_failing_text, "error")])
+async def test_hybrid_search_returns_sources_that_finish_in_time(text, status):
+    stats = {}
+    with (
+        patch(f"{TOOLS}.semantic_search", _semantic),
+        patch(f"{TOOLS}.text_search", text),
+        patch.object(rag_config, "use_reranking", False),
+        patch.object(rag_config, "hybrid_search_timeout_ms", 50),
+    ):
+        results = await asyncio.wait_for(
+            hybrid_search(_ctx(), "q", match_count=1, stats=stats), timeout=2
+        )
+
+    assert [r.chunk_id for r in results] == ["a"]
+    sources = stats["sources"]
+    assert stats["fusion"] == rag_config.hybrid_fusion
+    assert sources["semantic"] == {
+        "status": "ok",
+        "latency_ms": sources["semantic"]["latency_ms"],
+        "results": 2,
+        "weight": pytest.approx(1 - rag_config.default_text_weight),
+        "contributed": 1,
+    }
+    assert sources["text"]["status"] == status
+    assert sources["text"]["latency_ms"] < 1000
+    assert sources["text"]["contributed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_text_weight_changes_ranking():
+    async def text(*_args):
+        return _results(("t1", 10.0), ("t2", 9.0))
+
+    with (
+        patch(f"{TOOLS}.semantic_search", _semantic),
+        patch(f"{TOOLS}.text_search", text),
+        patch.object(rag_config, "use_reranking", False),
+    ):
+        semantic_first = await hybrid_search(_ctx(), "q", match_count=4, text_weight=0.2)
+        text_first = await hybrid_search(_ctx(), "q", match_count=4, text_weight=0.8)
+
+    assert [r.chunk_id for r in semantic_first] == ["a", "b", "t1", "t2"]
+    assert [r.chunk_id for r in text_first] == ["t1", "t2", "a", "b"]
@@ -0,0 +1,158 @@
+"""Tests for the markdown structure-aware fallback chunker."""
+
+import re
+
+from app.capabilities.retrieval.mongo_rag.ingestion.markdown_chunker import (
+    MarkdownChunker,
+    parse_markdown_blocks,
+)
+
+_WORD = re.compile(r"\S+")
+
+
+class WordTokenizer:
+    """Fast-tokenizer stand-in: one token per whitespace-separated word, [CLS]/[SEP] added."""
+
+    is_fast = True
+
+    def __init__(self):
+        self.batch_calls = 0
+
+    def num_special_tokens_to_add(self, pair=False):
+        return 2
+
+    def __call__(self, texts, add_special_tokens=True, return_offsets_mapping=False):
+        single = isinstance(texts, str)
+        self.batch_calls += 1
+        input_ids, offsets = [], []
+        for text in [texts] if single else texts:
+            spans = [m.span() for m in _WORD.finditer(text)]
+            ids = list(range(len(spans)))
+            if add_special_tokens:
+                ids = [-1, *ids, -2]
+            input_ids.append(ids)
+            offsets.append(spans)
+        encoded = {"input_ids": input_ids[0] if single else input_ids}
+        if return_offsets_mapping:
+            encoded["offset_mapping"] = offsets[0] if single else offsets
+        return encoded
+
+    def encode(self, text):
+        return self(text)["input_ids"]
+
+
+DOC = """# Guide
+
+Intro paragraph one.
+
+## Install
+
+- step one
+- step two
+
+  continued item
+
+```python
+# not a heading
+def main():
+    pass
+```
+
+| a | b |
+|---|---|
+| 1 | 2 |
+
+## Usage
+
+Run it.
+"""
+
+
+def test_parse_tracks_heading_hierarchy_and_block_kinds():
+    blocks = parse_markdown_blocks(DOC)
+
+    assert [(b.kind, b.headings) for b in blocks] == [
+        ("paragraph", ("Guide",)),
+        ("list", ("Guide", "Install")),
+        ("code", ("Guide", "Install")),
+        ("table", ("Guide", "Install")),
+        ("paragraph", ("Guide", "Usage")),
+    ]
+    code = blocks[2]
+    assert DOC[code.start : code.end].startswith("```python")
+    assert DOC[code.start : code.end].endswith("```")
+    assert "continued item" in DOC[blocks[1].start : blocks[1].end]
+
+
+def test_sections_pack_with_heading_context():
+    tokenizer = WordTokenizer()
+
+    chunks = MarkdownChunker(tokenizer, max_tokens=512).chunk(DOC)
+
+    assert [c.headings for c in chunks] == [
+        ("Guide",),
+        ("Guide", "Install"),
+        ("Guide", "Usage"),
+    ]
+    assert chunks[1].text.startswith("Guide\nInstall\n- step one")
+    assert "def main():" in chunks[1].text and "| 1 | 2 |" in chunks[1].text
+    # Blocks, heading prefixes and final counts: one tokenizer call each
+    assert tokenizer.batch_calls == 3
+    for chunk in chunks:
+        assert chunk.token_count == len(tokenizer.encode(chunk.text))
+
+
+def test_chunks_respect_token_budget():
+    paragraph = " ".join(f"Sentence {i} has five words." for i in range(60))
+    content = f"# Title\n\n{paragraph}\n"
+    tokenizer = WordTokenizer()
+
+    chunks = MarkdownChunker(tokenizer, max_tokens=50).chunk(content)
+
+    assert len(chunks) > 1
+    assert all(c.token_count <= 50 for c in chunks)
+    assert all(c.text.startswith("Title\n") for c in chunks)
+    # Split on sentence boundaries and nothing is lost
+    assert all(c.text.endswith("words.") for c in chunks)
+    assert sum(c.text.count("Sentence") for c in chunks) == 60
+
+
+def test_oversized_code_block_keeps_fences_in_every_piece():
+    body = "\n".join(f"x_{i} = {i}  # value" for i in range(100))
+    content = f"## Code\n\n```python\n{body}\n```\n"
+
+    chunks = MarkdownChunker(WordTokenizer(), max_tokens=60).chunk(content)
+
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert chunk.text.startswith("Code\n```python\n")
+        assert chunk.text.endswith("\n```")
+        assert chunk.token_count <= 60
+    assert sum(c.text.count("x_") for c in chunks) == 100
+
+
+def test_oversized_table_repeats_header_rows():
+    rows = "\n".join(f"| row {i} | value {i} |" for i in range(80))
+    content = f"| name | value |\n|------|-------|\n{rows}\n"
+
+    chunks = MarkdownChunker(WordTokenizer(), max_tokens=80).chunk(content)
+
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert chunk.text.startswith("| name | value |\n|------|-------|\n| row")
+        assert chunk.token_count <= 80
+
+
+def test_single_long_line_is_split_by_token_offsets():
+    content = " ".join(f"w{i}" for i in range(300))
+
+    chunks = MarkdownChunker(WordTokenizer(), max_tokens=100).chunk(content)
+
+    # 98 words per piece plus [CLS]/[SEP]
+    assert [c.token_count for c in chunks] == [100, 100, 100, 8]
+    assert " ".join(c.text for c in chunks) == content
+
+
+def test_empty_and_heading_only_content_has_no_chunks():
+    assert MarkdownChunker(WordTokenizer()).chunk("   \n") == []
+    assert MarkdownChunker(WordTokenizer()).chunk("# Title\n## Section\n") == []
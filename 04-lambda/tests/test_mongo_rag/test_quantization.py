@@ -0,0 +1,128 @@
+"""Tests for quantized chunk embedding storage and rescoring."""
+
+import random
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from app.capabilities.retrieval.mongo_rag.config import config as rag_config
+from app.capabilities.retrieval.mongo_rag.quantization import (
+    FULL_PRECISION_FIELD,
+    cosine_score,
+    decode_vector,
+    encode_embedding,
+    encode_vector,
+    rescore,
+    storage_of,
+)
+from app.capabilities.retrieval.mongo_rag.tools import semantic_search
+from bson.binary import Binary
+
+
+def _vector(seed, dims=64):
+    rng = random.Random(seed)
+    return [rng.gauss(0, 1) for _ in range(dims)]
+
+
+@pytest.mark.parametrize("storage", ["float", "float32", "int8", "binary"])
+def test_storage_round_trips_encoding(storage):
+    embedding = _vector(1, dims=21)  # not a multiple of 8: exercises bit padding
+
+    encoded = encode_vector(embedding, storage)
+    decoded = decode_vector(encoded)
+
+    assert storage_of(encoded) == storage
+    assert len(decoded) == len(embedding)
+    assert cosine_score(decoded, embedding) > (0.85 if storage == "binary" else 0.999)
+
+
+def test_quantized_storage_keeps_full_precision_copy():
+    embedding = _vector(2)
+
+    fields = encode_embedding(embedding, "int8")
+    assert isinstance(fields["embedding"], Binary)
+    assert decode_vector(fields[FULL_PRECISION_FIELD]) == pytest.approx(embedding, rel=1e-6)
+
+    assert FULL_PRECISION_FIELD not in encode_embedding(embedding, "int8", False)
+    assert FULL_PRECISION_FIELD not in encode_embedding(embedding, "float32")
+    with pytest.raises(ValueError):
+        encode_embedding(embedding, "int4")
+
+
+def test_rescore_orders_by_full_precision_similarity():
+    query = _vector(3)
+    near = [x + 0.01 for x in query]
+    far = _vector(4)
+    docs = [
+        {
+            "chunk_id": "far",
+            "similarity": 0.99,
+            FULL_PRECISION_FIELD: encode_vector(far, "float32"),
+        },
+        {
+            "chunk_id": "near",
+            "similarity": 0.5,
+            FULL_PRECISION_FIELD: encode_vector(near, "float32"),
+        },
+    ]
+
+    rescored = rescore(query, docs)
+
+    assert [doc["chunk_id"] for doc in rescored] == ["near", "far"]
+    assert rescored[0]["similarity"] == pytest.approx(1.0, abs=1e-3)
+    assert all(FULL_PRECISION_FIELD not in doc for doc in rescored)
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_over_fetches_and_rescores_quantized_index():
+    query = _vector(5)
+    candidates = [_vector(10 + i) for i in range(7)] + [[x + 0.01 for x in query]]
+    aggregate = AsyncMock()
+
+    async def run(pipeline):
+        async def cursor():
+            for i, vector in enumerate(candidates):
+                yield {
+                    "chunk_id": f"c{i}",
+                    "document_id": "doc",
+                    "content": "text",
+                    "similarity": 1.0 - i / 100,  # index order: c0 first, best match last
+                    "document_title": "T",
+                    "document_source": "s",
+                    FULL_PRECISION_FIELD: encode_vector(vector, "float32"),
+                }
+
+        return cursor()
+
+    aggregate.side_effect = run
+    deps = SimpleNamespace(
+        settings=SimpleNamespace(
+            default_match_count=5,
+            max_match_count=50,
+            mongodb_vector_index="vector_index",
+            mongodb_collection_chunks="chunks",
+            mongodb_collection_documents="documents",
+        ),
+        db={"chunks": SimpleNamespace(aggregate=aggregate)},
+        current_user_id="u1",
+        current_user_email="u1@example.com",
+        user_groups=[],
+        is_admin=True,
+    )
+
+    with (
+        patch.object(rag_config, "embedding_storage", "int8"),
+        patch.object(rag_config, "embedding_keep_full_precision", True),
+        patch.object(rag_config, "embedding_rescore_factor", 4),
+    ):
+        results = await semantic_search(
+            SimpleNamespace(deps=deps), "q", match_count=2, query_embedding=query
+        )
+
+    (pipeline,) = aggregate.await_args.args
+    vector_stage = pipeline[0]["$vectorSearch"]
+    assert vector_stage["limit"] == 8
+    assert storage_of(vector_stage["queryVector"]) == "int8"
+    assert pipeline[-1]["$project"][FULL_PRECISION_FIELD] == 1
+    assert len(results) == 2
+    assert results[0].chunk_id == "c7"
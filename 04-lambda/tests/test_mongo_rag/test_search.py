@@ -137,7 +137,7 @@ async def test_text_search_with_filters(mock_agent_dependencies, sample_search_r
     assert call_args is not None
     pipeline = call_args[0][0]
     assert "$search" in pipeline[0]
-    assert "filter" in pipeline[0]["$search"]
+    assert pipeline[1] == {"$match": filter_dict}
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,143 @@
+"""Tests for text search query planning."""
+
+from types import SimpleNamespace
+
+import pytest
+from app.capabilities.retrieval.mongo_rag.config import config as rag_config
+from app.capabilities.retrieval.mongo_rag.text_query import (
+    CODE_PATH,
+    TITLE_PATH,
+    classify_tokens,
+    plan_text_query,
+)
+from app.capabilities.retrieval.mongo_rag.tools import text_search
+
+from tests.conftest import MemoryCursor
+
+
+class FakeChunks:
+    """Chunk collection returning canned hits for strict and fuzzy operators."""
+
+    def __init__(self, strict: list[str], fuzzy: list[str]):
+        self.strict = strict
+        self.fuzzy = fuzzy
+        self.pipelines = []
+
+    async def aggregate(self, pipeline):
+        self.pipelines.append(pipeline)
+        is_fuzzy = "fuzzy" in pipeline[0]["$search"].get("text", {})
+        return MemoryCursor(
+            [
+                {
+                    "chunk_id": chunk_id,
+                    "document_id": "doc",
+                    "content": chunk_id,
+                    "similarity": 1.0,
+                    "document_title": "T",
+                    "document_source": "s",
+                }
+                for chunk_id in (self.fuzzy if is_fuzzy else self.strict)
+            ]
+        )
+
+
+def _ctx(strict, fuzzy):
+    chunks = FakeChunks(strict, fuzzy)
+    deps = SimpleNamespace(
+        settings=SimpleNamespace(
+            default_match_count=5,
+            max_match_count=50,
+            mongodb_text_index="text_index",
+            mongodb_collection_chunks="chunks",
+            mongodb_collection_documents="documents",
+        ),
+        db={"chunks": chunks},
+        current_user_id="u1",
+        current_user_email="u1@example.com",
+        user_groups=[],
+        is_admin=True,
+    )
+    return SimpleNamespace(deps=deps), chunks
+
+
+def test_classify_tokens_separates_phrases_identifiers_and_words():
+    phrases, identifiers, words = classify_tokens(
+        'where is "row level security" applied in build_access_filter() or `config.use_reranking`?'
+    )
+
+    assert phrases == ["row level security"]
+    assert identifiers == ["build_access_filter()", "config.use_reranking"]
+    assert words == ["where", "is", "applied", "in", "or"]
+    assert classify_tokens("getUserId TextQueryPlan $vectorSearch --update-existing")[1] == [
+        "getUserId",
+        "TextQueryPlan",
+        "$vectorSearch",
+        "--update-existing",
+    ]
+    # Sentence punctuation and plain capitalised words are not identifiers
+    assert classify_tokens("Docker setup. Kubernetes!") == (
+        [],
+        [],
+        ["Docker", "setup", "Kubernetes"],
+    )
+
+
+@pytest.mark.parametrize(
+    ("query", "query_class"),
+    [
+        ('"vector search" limits', "phrase"),
+        ("semantic_search filters", "identifier"),
+        ("hybrid search", "short"),
+        ("how does the ingestion pipeline chunk markdown documents", "keywords"),
+    ],
+)
+def test_plan_routes_query_classes_without_fuzzy(query, query_class):
+    plan = plan_text_query(query)
+
+    assert plan.query_class == query_class
+    assert "fuzzy" not in str(plan.operator)
+    assert all(clauses for clauses in plan.operator["compound"].values())
+    assert plan.fuzzy_operator["text"]["fuzzy"] == {"maxEdits": 1, "prefixLength": 3}
+    assert plan_text_query(query, fuzzy_fallback=False).fuzzy_operator is None
+
+
+def test_plan_uses_code_field_and_title_operators():
+    identifier = plan_text_query("semantic_search filters").operator["compound"]
+    assert identifier["must"] == [{"text": {"query": "semantic_search", "path": CODE_PATH}}]
+    assert identifier["should"] == [{"text": {"query": "filters", "path": "content"}}]
+
+    short = plan_text_query("hybrid sea").operator["compound"]["should"]
+    assert {
+        "autocomplete": {
+            "query": "hybrid sea",
+            "path": TITLE_PATH,
+            "score": {"boost": {"value": 2.0}},
+        }
+    } in short
+    assert any(c.get("text", {}).get("path") == TITLE_PATH for c in short)
+
+
+@pytest.mark.asyncio
+async def test_text_search_only_runs_fuzzy_when_strict_plan_finds_too_few():
+    ctx, chunks = _ctx(strict=["a", "b", "c"], fuzzy=["x"])
+    results = await text_search(ctx, "hybrid search", match_count=4)
+    assert [r.chunk_id for r in results] == ["a", "b", "c"]
+    assert len(chunks.pipelines) == 1
+
+    ctx, chunks = _ctx(strict=["a"], fuzzy=["a", "x", "y"])
+    results = await text_search(ctx, "hybird search", match_count=4, filter_dict={"k": 1})
+    assert [r.chunk_id for r in results] == ["a", "x", "y"]
+    assert len(chunks.pipelines) == 2
+    assert all(pipeline[1] == {"$match": {"k": 1}} for pipeline in chunks.pipelines)
+
+
+@pytest.mark.asyncio
+async def test_text_search_planner_can_be_disabled(monkeypatch):
+    monkeypatch.setattr(rag_config, "text_search_planner", False)
+    ctx, chunks = _ctx(strict=[], fuzzy=["x"])
+
+    results = await text_search(ctx, "hybrid search", match_count=4)
+
+    assert [r.chunk_id for r in results] == ["x"]
+    assert chunks.pipelines[0][0]["$search"]["text"]["fuzzy"]["maxEdits"] == 2
+    assert len(chunks.pipelines) == 1
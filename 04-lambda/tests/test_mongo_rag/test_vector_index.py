@@ -0,0 +1,209 @@
+"""Tests for the in-process vector index backend."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+from app.capabilities.retrieval.mongo_rag.rls import build_access_filter
+from app.capabilities.retrieval.mongo_rag.tools import semantic_search
+from app.capabilities.retrieval.mongo_rag.vector_index import service as vector_service
+from app.capabilities.retrieval.mongo_rag.vector_index.exact import ExactVectorIndex
+from app.capabilities.retrieval.mongo_rag.vector_index.filters import matches_filter
+from app.capabilities.retrieval.mongo_rag.vector_index.hnsw import HNSWVectorIndex
+from app.capabilities.retrieval.mongo_rag.vector_index.service import LocalVectorSearch
+from bson import ObjectId
+
+from tests.conftest import MemoryCollection
+
+
+def _corpus(size=600, dims=32, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(12, dims))
+    return centers[rng.integers(0, 12, size)] + rng.normal(scale=0.8, size=(size, dims))
+
+
+def test_hnsw_matches_exact_search_with_and_without_filter(monkeypatch):
+    corpus = _corpus()
+    ids = [str(i) for i in range(len(corpus))]
+    exact = ExactVectorIndex(corpus.shape[1])
+    exact.add(ids, corpus)
+    hnsw = HNSWVectorIndex(corpus.shape[1], m=8, ef_construction=64, ef_search=64)
+    hnsw.add(ids, corpus)
+    monkeypatch.setattr(HNSWVectorIndex, "exact_threshold", 0)  # force graph search
+
+    mask = np.arange(len(corpus)) % 2 == 0
+    hits = total = 0
+    for query in corpus[:20] + 0.01:
+        for m in (None, mask):
+            truth = {slot for slot, _ in exact.search(query, 10, m)}
+            found = hnsw.search(query, 10, m)
+            assert m is None or all(m[slot] for slot, _ in found)
+            hits += len(truth & {slot for slot, _ in found})
+            total += len(truth)
+
+    assert hits / total >= 0.95
+    slot, score = exact.search(corpus[3], 1)[0]
+    assert slot == 3 and score == pytest.approx(1.0, abs=1e-5)
+
+
+@pytest.mark.parametrize("index_type", [ExactVectorIndex, HNSWVectorIndex])
+def test_index_round_trips_through_memory_mapped_files(index_type, tmp_path):
+    corpus = _corpus(size=200)
+    index = index_type(corpus.shape[1])
+    index.add([f"c{i}" for i in range(len(corpus))], corpus)
+    index.remove(["c0"])
+    index.save(tmp_path)
+
+    loaded = index_type.load(tmp_path)
+    assert isinstance(loaded.vectors, np.memmap)
+    assert len(loaded) == 199 and "c0" not in loaded
+    assert loaded.search(corpus[5], 3) == index.search(corpus[5], 3)
+
+    # Mutating a mapped index copies it into memory first
+    loaded.add(["new"], corpus[:1])
+    loaded.remove([f"c{i}" for i in range(1, 100)])
+    assert loaded.id_of(loaded.search(corpus[0], 1)[0][0]) == "new"
+    kept = loaded.compact()
+    assert len(kept) == loaded.size == 101
+    assert loaded.id_of(loaded.search(corpus[150], 1)[0][0]) == "c150"
+
+
+def test_matches_filter_follows_mongodb_semantics():
+    doc = {
+        "document_id": ObjectId("65a000000000000000000001"),
+        "metadata": {"tags": ["python", "rag"], "year": 2024, "source": "web"},
+        "chunk_index": 3,
+    }
+
+    assert matches_filter(doc, {"metadata.tags": "rag"})
+    assert matches_filter(doc, {"metadata.year": {"$gte": 2020, "$lt": 2025}})
+    assert matches_filter(doc, {"metadata.source": {"$in": ["web", "pdf"]}})
+    assert matches_filter(doc, {"$or": [{"chunk_index": 1}, {"metadata.tags": {"$all": ["rag"]}}]})
+    assert matches_filter(doc, {"metadata.author": None, "metadata.year": {"$exists": True}})
+    assert not matches_filter(doc, {"metadata.tags": {"$nin": ["python"]}})
+    assert not matches_filter(doc, {"document_id": ObjectId("65a000000000000000000002")})
+    with pytest.raises(ValueError):
+        matches_filter(doc, {"metadata.source": {"$regex": "w"}})
+
+
+def _local_fixture():
+    corpus = _corpus(size=60, dims=16)
+    own, public, private = (ObjectId() for _ in range(3))
+    documents = [
+        {"_id": own, "title": "Own", "source": "own.md", "user_id": "u1"},
+        {"_id": public, "title": "Public", "source": "pub.md", "is_public": True},
+        {"_id": private, "title": "Private", "source": "priv.md", "user_id": "u2"},
+    ]
+    chunks = [
+        {
+            "_id": ObjectId(),
+            "document_id": (own, public, private)[i % 3],
+            "content": f"chunk {i}",
+            "embedding": corpus[i].tolist(),
+            "metadata": {"lang": "en" if i % 2 else "de"},
+        }
+        for i in range(len(corpus))
+    ]
+    search = LocalVectorSearch(ExactVectorIndex(corpus.shape[1]))
+    search.add_chunks(chunks)
+    db = {"chunks": MemoryCollection(chunks), "documents": MemoryCollection(documents)}
+    settings = SimpleNamespace(
+        mongodb_collection_chunks="chunks", mongodb_collection_documents="documents"
+    )
+    return search, db, settings, corpus, chunks, private
+
+
+@pytest.mark.asyncio
+async def test_local_search_applies_rls_and_chunk_filters():
+    search, db, settings, corpus, chunks, private = _local_fixture()
+    access = build_access_filter("u1", "u1@example.com")
+
+    results = await search.search(
+        db,
+        settings,
+        corpus[2].tolist(),
+        10,
+        filter_dict={"metadata.lang": "en"},
+        access_filter=access,
+    )
+
+    assert len(results) == 10
+    assert all(r["document_id"] != private for r in results)
+    assert all(r["metadata"]["lang"] == "en" for r in results)
+    assert [r["similarity"] for r in results] == sorted(
+        (r["similarity"] for r in results), reverse=True
+    )
+
+    # Admins (empty access filter) see the private document's chunks
+    admin = await search.search(db, settings, corpus[2].tolist(), 1)
+    assert admin[0]["chunk_id"] == chunks[2]["_id"]
+    assert admin[0]["document_title"] == "Private"
+
+
+@pytest.mark.asyncio
+async def test_local_search_drops_chunks_deleted_behind_its_back():
+    search, db, settings, corpus, chunks, _ = _local_fixture()
+    deleted = chunks[4]
+    db["chunks"].docs = [c for c in chunks if c is not deleted]
+
+    results = await search.search(db, settings, corpus[4].tolist(), 3)
+
+    assert len(results) == 3
+    assert deleted["_id"] not in {r["chunk_id"] for r in results}
+    assert str(deleted["_id"]) not in search.index
+
+    search.remove_documents([chunks[0]["document_id"]])
+    results = await search.search(db, settings, corpus[0].tolist(), 5)
+    assert all(r["document_id"] != chunks[0]["document_id"] for r in results)
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_uses_local_index_when_configured():
+    search, db, settings, corpus, chunks, _ = _local_fixture()
+    aggregate = AsyncMock()
+    db["chunks"].aggregate = aggregate
+    deps = SimpleNamespace(
+        settings=SimpleNamespace(default_match_count=5, max_match_count=50, **vars(settings)),
+        db=db,
+        current_user_id="u1",
+        current_user_email="u1@example.com",
+        user_groups=[],
+        is_admin=False,
+    )
+
+    with patch(
+        "app.capabilities.retrieval.mongo_rag.tools.get_local_vector_search",
+        AsyncMock(return_value=search),
+    ):
+        results = await semantic_search(
+            SimpleNamespace(deps=deps), "q", match_count=3, query_embedding=corpus[0].tolist()
+        )
+
+    aggregate.assert_not_called()
+    assert results[0].chunk_id == str(chunks[0]["_id"])
+    assert results[0].document_title == "Own"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_startup_closes_the_mongo_client():
+    started = asyncio.Event()
+
+    async def sync(_collection):
+        started.set()
+        await asyncio.Event().wait()
+
+    client = MagicMock(close=AsyncMock())
+    with (
+        patch.object(vector_service, "AsyncMongoClient", return_value=client),
+        patch.object(LocalVectorSearch, "open", return_value=SimpleNamespace(sync=sync)),
+        patch.object(vector_service.config, "vector_search_backend", "exact"),
+    ):
+        task = asyncio.create_task(vector_service.get_local_vector_search())
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    client.close.assert_awaited_once()
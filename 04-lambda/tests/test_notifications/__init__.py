@@ -0,0 +1 @@
+"""Tests for the outbound notification dispatcher."""
@@ -0,0 +1,237 @@
+"""Tests for NotificationDispatcher against the local webhook sink."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from itertools import pairwise
+
+import httpx
+import pytest
+from app.services.notifications.dispatcher import FAILED, NotificationDispatcher
+from app.services.notifications.sink import WebhookSink
+from app.services.notifications.targets import NotificationTarget
+from bson import ObjectId
+
+from tests.conftest import MemoryCollection
+
+
+@pytest.fixture
+async def sink():
+    async with WebhookSink() as server:
+        yield server
+
+
+def make_target(name, url, kind="webhook", **options):
+    """Target without rate limiting or coalescing unless the test asks for it."""
+    return NotificationTarget(
+        name, url, kind, **{"rate_per_minute": 0, "coalesce_seconds": 0, **options}
+    )
+
+
+def make_dispatcher(outbox, *targets, **options):
+    options = {"retry_base_seconds": 0.05, "poll_seconds": 0.02, "workers": 2, **options}
+    return NotificationDispatcher(outbox, {t.name: t for t in targets}, **options)
+
+
+async def settled(outbox, timeout=5.0):
+    """Wait until the outbox holds nothing but failed notifications."""
+    deadline = time.monotonic() + timeout
+    while any(d["status"] != FAILED for d in outbox.docs):
+        assert time.monotonic() < deadline, outbox.docs
+        await asyncio.sleep(0.02)
+
+
+# ========== Tests ==========
+
+
+@pytest.mark.asyncio
+async def test_burst_is_sent_as_one_digest(sink):
+    outbox = MemoryCollection()
+    n8n = make_target("n8n", sink.url("/n8n"), coalesce_seconds=0.2)
+    discord = make_target("discord", sink.url("/discord"), "discord", coalesce_seconds=0.2)
+    dispatcher = make_dispatcher(outbox, n8n, discord)
+    await dispatcher.start()
+    try:
+        for i in range(5):
+            await dispatcher.enqueue("n8n", {"event": "proposal_submitted", "n": i})
+        for i in range(3):
+            await dispatcher.enqueue("discord", {"title": f"Proposal {i}"})
+        await settled(outbox)
+    finally:
+        await dispatcher.stop()
+
+    [digest] = sink.bodies("/n8n")
+    assert digest["event"] == "digest"
+    assert [e["n"] for e in digest["events"]] == [0, 1, 2, 3, 4]
+    [message] = sink.bodies("/discord")
+    assert message["content"] == "3 notifications"
+    assert [e["title"] for e in message["embeds"]] == ["Proposal 0", "Proposal 1", "Proposal 2"]
+    assert outbox.docs == []
+    assert dispatcher.stats()["digests"] == 2
+
+
+@pytest.mark.asyncio
+async def test_single_notification_is_sent_as_is(sink):
+    outbox = MemoryCollection()
+    dispatcher = make_dispatcher(outbox, make_target("n8n", sink.url()))
+    await dispatcher.start()
+    try:
+        await dispatcher.enqueue("n8n", {"event": "proposal_approve", "proposal_id": "p1"})
+        await sink.wait_for(1)
+    finally:
+        await dispatcher.stop()
+
+    assert sink.bodies() == [{"event": "proposal_approve", "proposal_id": "p1"}]
+    assert await dispatcher.enqueue("discord", {"title": "not configured"}) is None
+
+
+@pytest.mark.asyncio
+async def test_failures_are_retried_with_backoff(sink):
+    sink.fail(503, times=3)
+    outbox = MemoryCollection()
+    dispatcher = make_dispatcher(outbox, make_target("n8n", sink.url()))
+    await dispatcher.start()
+    try:
+        await dispatcher.enqueue("n8n", {"event": "retry-me"})
+        await sink.wait_for(1)
+        await settled(outbox)
+    finally:
+        await dispatcher.stop()
+
+    assert sink.bodies() == [{"event": "retry-me"}]
+    attempts = [*sink.failures, *sink.requests]
+    gaps = [later.received_at - earlier.received_at for earlier, later in pairwise(attempts)]
+    # 0.05s, 0.1s, 0.2s
+    assert gaps[0] >= 0.04
+    assert gaps[2] >= 0.18
+    assert gaps[2] > gaps[0]
+    assert dispatcher.stats()["retried"] == 3
+
+
+@pytest.mark.asyncio
+async def test_permanent_errors_and_exhausted_retries_fail(sink):
+    outbox = MemoryCollection()
+    dispatcher = make_dispatcher(outbox, make_target("n8n", sink.url()), max_attempts=2)
+    sink.fail(400)
+    await dispatcher.start()
+    try:
+        await dispatcher.enqueue("n8n", {"event": "bad"})
+        await settled(outbox)
+        sink.fail(500, times=2)
+        await dispatcher.enqueue("n8n", {"event": "down"})
+        await settled(outbox)
+    finally:
+        await dispatcher.stop()
+
+    assert sink.requests == []
+    bad, down = outbox.docs
+    assert (bad["status"], bad["attempts"]) == ("failed", 1)
+    assert bad["last_error"].startswith("HTTP 400")
+    assert (down["status"], down["attempts"]) == ("failed", 2)
+    assert dispatcher.stats()["failed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_spaces_requests_and_honours_retry_after(sink):
+    outbox = MemoryCollection()
+    n8n = make_target("n8n", sink.url(), rate_per_minute=600, max_batch=1)
+    dispatcher = make_dispatcher(outbox, n8n, workers=3)
+    sink.fail(429, headers={"Retry-After": "0.3"})
+    await dispatcher.start()
+    try:
+        for i in range(4):
+            await dispatcher.enqueue("n8n", {"n": i})
+        await sink.wait_for(4)
+    finally:
+        await dispatcher.stop()
+
+    times = [sink.failures[0].received_at] + [r.received_at for r in sink.requests]
+    assert times[1] - times[0] >= 0.28  # Retry-After
+    assert all(later - earlier >= 0.09 for earlier, later in pairwise(times))
+    assert sorted(body["n"] for body in sink.bodies()) == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_slow_target_does_not_hold_up_callers_or_other_targets():
+    async with WebhookSink(delay=0.5) as slow, WebhookSink() as fast:
+        outbox = MemoryCollection()
+        dispatcher = make_dispatcher(
+            outbox,
+            make_target("discord", slow.url(), "discord"),
+            make_target("n8n", fast.url()),
+        )
+        await dispatcher.start()
+        try:
+            start = time.monotonic()
+            await dispatcher.enqueue("discord", {"title": "slow"})
+            await asyncio.sleep(0.05)
+            await dispatcher.enqueue("n8n", {"event": "fast"})
+            assert time.monotonic() - start < 0.2
+
+            await fast.wait_for(1)
+            assert slow.requests == []
+            await slow.wait_for(1)
+        finally:
+            await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_abandoned_claims_are_picked_up_again(sink):
+    outbox = MemoryCollection()
+    now = datetime.now(timezone.utc)
+    # Claimed by a process that died before delivering it
+    outbox.docs.append(
+        {
+            "_id": ObjectId(),
+            "target": "n8n",
+            "payload": {"event": "orphaned"},
+            "status": "sending",
+            "attempts": 0,
+            "next_attempt_at": now - timedelta(minutes=2),
+            "lease_until": now - timedelta(seconds=1),
+            "claim": ObjectId(),
+            "created_at": now - timedelta(minutes=2),
+        }
+    )
+    dispatcher = make_dispatcher(outbox, make_target("n8n", sink.url()))
+    await dispatcher.start()
+    try:
+        await sink.wait_for(1)
+        await settled(outbox)
+    finally:
+        await dispatcher.stop()
+
+    assert sink.bodies() == [{"event": "orphaned"}]
+
+
+@pytest.mark.asyncio
+async def test_late_answers_leave_reclaimed_notifications_alone(sink):
+    outbox = MemoryCollection()
+    n8n = make_target("n8n", sink.url())
+    now = datetime.now(timezone.utc)
+    stale = {
+        "_id": ObjectId(),
+        "target": "n8n",
+        "payload": {"event": "slow"},
+        "status": "sending",
+        "attempts": 0,
+        "next_attempt_at": now,
+        "lease_until": now,
+        "claim": ObjectId(),
+        "created_at": now,
+    }
+    # The lease ran out mid-request and another worker claimed the notification
+    reclaimed = {**stale, "claim": ObjectId(), "lease_until": now + timedelta(minutes=1)}
+    outbox.docs.append(reclaimed)
+    async with httpx.AsyncClient() as client:
+        dispatcher = make_dispatcher(outbox, n8n, http_client=client)
+
+        sink.fail(500)
+        await dispatcher._send(n8n, [stale])
+        assert outbox.docs == [reclaimed]
+        assert (reclaimed["status"], reclaimed["attempts"]) == ("sending", 0)
+
+        await dispatcher._send(n8n, [stale])
+        assert outbox.docs == [reclaimed]
+
+    assert sink.bodies() == [{"event": "slow"}]
@@ -0,0 +1,272 @@
+"""Tests for the incremental Open WebUI sync against the fake Open WebUI API."""
+
+import asyncio
+
+import pytest
+from app.capabilities.retrieval.mongo_rag.ingestion.chunker import DocumentChunk
+from app.workflows.ingestion.openwebui_export.client import OpenWebUIClient
+from app.workflows.ingestion.openwebui_export.fake import FakeOpenWebUI
+from app.workflows.ingestion.openwebui_export.services.sync import (
+    SOURCE_TYPE,
+    ConversationSyncService,
+)
+
+from tests.conftest import MemoryDatabase
+
+# ========== Chunker and embedder ==========
+
+
+class ParagraphChunker:
+    """One chunk per message (paragraph), like a small max_tokens would give."""
+
+    async def chunk_document(self, content, title, source, metadata=None, docling_doc=None):
+        return [
+            DocumentChunk(
+                content=paragraph,
+                index=i,
+                start_char=0,
+                end_char=len(paragraph),
+                metadata={"title": title, "source": source, **(metadata or {})},
+                token_count=len(paragraph.split()),
+            )
+            for i, paragraph in enumerate(content.split("\n\n"))
+        ]
+
+
+class CountingEmbedder:
+    def __init__(self):
+        self.texts: list[str] = []
+
+    async def embed_chunks(self, chunks):
+        self.texts.extend(chunk.content for chunk in chunks)
+        for chunk in chunks:
+            chunk.embedding = [0.1, 0.2, 0.3]
+        return chunks
+
+
+class SlowEmbedder(CountingEmbedder):
+    """Takes a while per call and records how many calls overlap."""
+
+    def __init__(self):
+        super().__init__()
+        self.active = 0
+        self.max_active = 0
+
+    async def embed_chunks(self, chunks):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return await super().embed_chunks(chunks)
+
+
+# ========== Fixtures ==========
+
+
+@pytest.fixture
+def api():
+    return FakeOpenWebUI()
+
+
+@pytest.fixture
+async def sync(api):
+    client = OpenWebUIClient("http://openwebui:8080", "key", transport=api.transport())
+    service = ConversationSyncService(
+        MemoryDatabase(),
+        client,
+        chunker=ParagraphChunker(),
+        embedder=CountingEmbedder(),
+        concurrency=4,
+        page_size=3,
+    )
+    yield service
+    await client.close()
+
+
+def chunks_of(sync, chat_id):
+    return sorted(
+        (c for c in sync.chunks.docs if c["metadata"]["conversation_id"] == chat_id),
+        key=lambda c: c["chunk_index"],
+    )
+
+
+# ========== Tests ==========
+
+
+@pytest.mark.asyncio
+async def test_first_sync_stores_searchable_conversation_chunks(api, sync):
+    alice = api.add_user("alice@example.com")
+    bob = api.add_user("bob@example.com")
+    chat = api.add_chat(alice, "Auth setup", [("user", "How?"), ("assistant", "Like this.")])
+    for i in range(4):
+        api.add_chat(bob, f"Chat {i}", [("user", f"Question {i}"), ("assistant", "Answer")])
+
+    result = await sync.sync_all()
+
+    assert (result.users, result.chats_synced, result.errors) == (2, 5, [])
+    assert len(sync.documents.docs) == 5
+    chunks = chunks_of(sync, chat)
+    assert [c["content"] for c in chunks] == ["**User:** How?", "**Assistant:** Like this."]
+    assert [c["chunk_index"] for c in chunks] == [0, 1]
+    # The fields the conversation search filters on
+    metadata = chunks[0]["metadata"]
+    assert metadata["source"] == metadata["source_type"] == SOURCE_TYPE
+    assert (metadata["user_id"], metadata["turn_index"]) == (alice, 0)
+    assert chunks[0]["user_email"] == "alice@example.com"
+    assert chunks[0]["document_source"] == f"http://openwebui:8080/c/{chat}"
+
+
+@pytest.mark.asyncio
+async def test_unchanged_chats_are_not_fetched_or_embedded_again(api, sync):
+    user = api.add_user("alice@example.com")
+    chats = [api.add_chat(user, f"Chat {i}", [("user", f"Q{i}")]) for i in range(7)]
+    await sync.sync_all()
+    api.requests.clear()
+    embedded = len(sync.embedder.texts)
+
+    result = await sync.sync_all()
+    assert result.chats_synced == 0
+    assert api.requests_to("/api/v1/chats/list/") == 1
+    # Only the newest chat sits on the watermark; its updated_at is unchanged
+    assert api.requests_to(f"/api/v1/chats/{chats[-1]}") == 0
+    assert len(sync.embedder.texts) == embedded
+
+    # Pinning bumps updated_at without changing content: fetched, hash matches
+    api.touch(chats[0])
+    result = await sync.sync_all()
+    assert (result.chats_fetched, result.chats_unchanged, result.chats_synced) == (1, 2, 0)
+    assert len(sync.embedder.texts) == embedded
+
+
+@pytest.mark.asyncio
+async def test_only_new_turns_are_chunked_and_embedded(api, sync):
+    user = api.add_user("alice@example.com")
+    chat = api.add_chat(user, "Chat", [("user", "First"), ("assistant", "Reply one")])
+    await sync.sync_all()
+    first_ids = [c["_id"] for c in chunks_of(sync, chat)]
+    sync.embedder.texts.clear()
+
+    api.add_message(chat, "user", "Second")
+    api.add_message(chat, "assistant", "Reply two")
+    result = await sync.sync_all()
+
+    assert sync.embedder.texts == ["**User:** Second", "**Assistant:** Reply two"]
+    assert (result.turns_embedded, result.chunks_created, result.chunks_deleted) == (1, 2, 0)
+    chunks = chunks_of(sync, chat)
+    assert [c["_id"] for c in chunks[:2]] == first_ids
+    assert [c["chunk_index"] for c in chunks] == [0, 1, 2, 3]
+    assert [c["metadata"]["turn_index"] for c in chunks] == [0, 0, 1, 1]
+
+    # A reply added to the last turn re-embeds that turn only
+    sync.embedder.texts.clear()
+    api.add_message(chat, "assistant", "Reply two, continued")
+    result = await sync.sync_all()
+    assert sync.embedder.texts == [
+        "**User:** Second",
+        "**Assistant:** Reply two",
+        "**Assistant:** Reply two, continued",
+    ]
+    assert (result.chunks_deleted, len(chunks_of(sync, chat))) == (2, 5)
+
+
+@pytest.mark.asyncio
+async def test_edits_and_renames(api, sync):
+    user = api.add_user("alice@example.com")
+    chat = api.add_chat(
+        user, "Chat", [("user", "A"), ("assistant", "B"), ("user", "C"), ("assistant", "D")]
+    )
+    await sync.sync_all()
+    sync.embedder.texts.clear()
+
+    # Editing the second question replaces the branch from its turn on
+    api.edit_message(chat, 2, "C, rephrased")
+    result = await sync.sync_all()
+    assert sync.embedder.texts == ["**User:** C, rephrased"]
+    assert result.chunks_deleted == 2
+    assert [c["content"] for c in chunks_of(sync, chat)] == [
+        "**User:** A",
+        "**Assistant:** B",
+        "**User:** C, rephrased",
+    ]
+
+    # A rename only updates titles
+    sync.embedder.texts.clear()
+    api.rename(chat, "Renamed")
+    await sync.sync_all()
+    assert sync.embedder.texts == []
+    assert {c["document_title"] for c in chunks_of(sync, chat)} == {"Renamed"}
+    assert sync.documents.docs[0]["title"] == "Renamed"
+
+
+@pytest.mark.asyncio
+async def test_chats_are_fetched_concurrently_over_the_shared_pool(api, sync):
+    api.latency = 0.02
+    user = api.add_user("alice@example.com")
+    for i in range(12):
+        api.add_chat(user, f"Chat {i}", [("user", f"Q{i}")])
+
+    result = await sync.sync_all()
+
+    assert result.chats_synced == 12
+    # page_size 3 with one chat of overlap per page
+    assert result.chats_listed == 12
+    assert api.max_in_flight == 4
+
+
+@pytest.mark.asyncio
+async def test_embedding_and_users_are_bounded_on_a_first_sync(api):
+    api.latency = 0.005
+    for u in range(3):
+        user = api.add_user(f"user{u}@example.com")
+        for i in range(6):
+            api.add_chat(user, f"Chat {i}", [("user", f"Q{i}"), ("assistant", "A")])
+    client = OpenWebUIClient("http://openwebui:8080", "key", transport=api.transport())
+    embedder = SlowEmbedder()
+    service = ConversationSyncService(
+        MemoryDatabase(),
+        client,
+        chunker=ParagraphChunker(),
+        embedder=embedder,
+        concurrency=2,
+        user_concurrency=1,
+        page_size=50,
+    )
+
+    result = await service.sync_all()
+    await client.close()
+
+    assert result.chats_synced == 18
+    # Chats hold their slot through chunking, embedding and writing
+    assert embedder.max_active == 2
+    # One user at a time: at most two chat fetches in flight, never a second listing
+    assert api.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_chats_are_retried_on_the_next_run(api, sync):
+    user = api.add_user("alice@example.com")
+    broken = api.add_chat(user, "Broken", [("user", "Q1")])
+    api.add_chat(user, "Fine", [("user", "Q2")])
+    api.unavailable.add(broken)
+
+    result = await sync.sync_all()
+    assert result.chats_synced == 1
+    assert result.errors and broken in result.errors[0]
+
+    api.unavailable.clear()
+    result = await sync.sync_all()
+    assert (result.chats_synced, result.errors) == (1, [])
+    assert len(chunks_of(sync, broken)) == 1
+
+
+@pytest.mark.asyncio
+async def test_existing_topics_carry_over_to_new_chunks(api, sync):
+    user = api.add_user("alice@example.com")
+    chat = api.add_chat(user, "Chat", [("user", "Q1")])
+    await sync.sync_all()
+    sync.documents.docs[0]["metadata"]["topics"] = ["auth"]
+
+    api.add_message(chat, "user", "Q2")
+    await sync.sync_all()
+
+    assert chunks_of(sync, chat)[-1]["metadata"]["topics"] == ["auth"]
@@ -0,0 +1,210 @@
+"""Tests for batched, cached topic classification of conversations."""
+
+import json
+import re
+
+import httpx
+import pytest
+from app.capabilities.processing.ai.dependencies import ProcessingDeps
+from app.capabilities.processing.openwebui_topics.services.pipeline import (
+    CONVERSATION_SOURCE_TYPE,
+    TopicPipeline,
+)
+from app.capabilities.processing.schemas import TopicClassificationRequest
+from bson import ObjectId
+
+from tests.conftest import MemoryDatabase
+
+KEYWORDS = ("docker", "python", "recipe")
+
+# ========== Embedder and LLM ==========
+
+
+class KeywordEmbedder:
+    """Embeds a text as its keyword counts, so topics separate cleanly."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_embeddings_batch(self, texts):
+        self.calls += 1
+        return [[text.lower().count(word) for word in KEYWORDS] + [0.1] for text in texts]
+
+
+class FakeLLM:
+    """Chat completions endpoint labelling each conversation with its keywords."""
+
+    def __init__(self, drop_ids=(), fail=False):
+        self.drop_ids = set(drop_ids)
+        self.fail = fail
+        self.batches: list[int] = []
+
+    def deps(self):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(self._handle))
+        return ProcessingDeps(
+            http_client=client, llm_base_url="http://llm/v1", llm_model="m", max_topics=5
+        )
+
+    def _handle(self, request):
+        if self.fail:
+            return httpx.Response(500, json={"error": "overloaded"})
+        prompt = json.loads(request.content)["messages"][-1]["content"]
+        conversations = re.findall(
+            r'<conversation id="(\d+)">\n(.*?)</conversation>', prompt, re.DOTALL
+        )
+        self.batches.append(len(conversations))
+        results = []
+        for n, text in conversations:
+            if n in self.drop_ids and len(conversations) > 1:
+                continue
+            topics = [word for word in KEYWORDS if word in text.lower()] or ["general chat"]
+            results.append({"id": n, "topics": topics, "reasoning": "keywords"})
+        content = json.dumps({"results": results})
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+
+def make_pipeline(db, llm, embedder=None, **kwargs):
+    options = {"threshold": 0.8, "min_examples": 2, "batch_size": 4, "concurrency": 2}
+    options.update(kwargs)
+    return TopicPipeline(llm.deps(), db, embedder=embedder or KeywordEmbedder(), **options)
+
+
+def conversation(conversation_id, text, title=None):
+    return TopicClassificationRequest(
+        conversation_id=conversation_id,
+        title=title,
+        messages=[{"role": "user", "content": text}, {"role": "assistant", "content": "Sure."}],
+    )
+
+
+def add_conversation(db, text, topics=None, chunks=2):
+    doc = {
+        "_id": ObjectId(),
+        "title": "Chat",
+        "source_type": CONVERSATION_SOURCE_TYPE,
+        "content": text,
+        "metadata": {"conversation_id": f"chat-{len(db['documents'].docs)}"},
+    }
+    if topics:
+        doc["metadata"]["topics"] = topics
+    db["documents"].docs.append(doc)
+    for _ in range(chunks):
+        db["chunks"].docs.append({"_id": ObjectId(), "document_id": doc["_id"], "metadata": {}})
+    return doc
+
+
+# ========== Tests ==========
+
+
+@pytest.mark.asyncio
+async def test_ambiguous_conversations_are_batched_and_cached():
+    db, llm = MemoryDatabase(), FakeLLM()
+    pipeline = make_pipeline(db, llm)
+    requests = [conversation(f"c{i}", f"Docker question {i}") for i in range(5)]
+
+    results, stats = await pipeline.classify(requests)
+
+    assert [r.conversation_id for r in results] == [f"c{i}" for i in range(5)]
+    assert all(r.topics == ["docker"] for r in results)
+    # No vocabulary yet: all go to the LLM, four to a prompt
+    assert llm.batches == [4, 1]
+    assert (stats.llm_classified, stats.llm_calls, stats.llm_calls_saved) == (5, 2, 3)
+
+    results, stats = await make_pipeline(db, llm).classify(requests)
+    assert all(r.topics == ["docker"] for r in results)
+    assert (stats.cache_hits, stats.llm_calls) == (5, 0)
+    assert llm.batches == [4, 1]
+
+
+@pytest.mark.asyncio
+async def test_centroids_pre_assign_topics_without_the_llm():
+    db, llm = MemoryDatabase(), FakeLLM()
+    await make_pipeline(db, llm).classify(
+        [conversation("a", "Docker compose"), conversation("b", "Docker networks")]
+    )
+    llm.batches.clear()
+
+    # A new pipeline picks the centroids up from MongoDB
+    results, stats = await make_pipeline(db, llm).classify(
+        [
+            conversation("c", "Docker docker volumes"),
+            conversation("d", "A recipe for bread"),
+            conversation("e", "Docker and python together"),
+        ]
+    )
+
+    assert results[0].topics == ["docker"]
+    assert results[0].confidence > 0.8
+    # The recipe is far from every centroid, docker + python is between two
+    assert (results[1].topics, results[2].topics) == (["recipe"], ["docker", "python"])
+    assert (stats.centroid_assigned, stats.llm_classified, llm.batches) == (1, 2, [2])
+
+
+@pytest.mark.asyncio
+async def test_conversations_missing_from_a_batch_answer_are_retried_alone():
+    db, llm = MemoryDatabase(), FakeLLM(drop_ids={"1"})
+    requests = [conversation(f"c{i}", f"Python {i}") for i in range(3)]
+
+    results, stats = await make_pipeline(db, llm).classify(requests)
+
+    assert all(r.topics == ["python"] for r in results)
+    assert llm.batches == [3, 1]
+    assert (stats.llm_calls, stats.failures) == (2, 0)
+
+
+@pytest.mark.asyncio
+async def test_failed_classifications_fall_back_and_are_not_cached():
+    db, llm = MemoryDatabase(), FakeLLM(fail=True)
+
+    results, stats = await make_pipeline(db, llm).classify(
+        [conversation("a", "Docker"), conversation("b", "Python")]
+    )
+
+    assert all((r.topics, r.confidence) == (["general"], 0.0) for r in results)
+    assert stats.failures == 2
+    # The failed batch and both retries: more calls than conversations, nothing saved
+    assert (stats.llm_calls, stats.llm_calls_saved) == (3, 0)
+    assert db["topic_classifications"].docs == []
+
+
+@pytest.mark.asyncio
+async def test_backfill_writes_topics_in_bulk_and_skips_unchanged_conversations():
+    db, llm = MemoryDatabase(), FakeLLM()
+    docs = [add_conversation(db, f"**User:** Docker {i}") for i in range(3)]
+    labelled = add_conversation(db, "**User:** Sourdough recipe", topics=["baking"])
+
+    stats = await make_pipeline(db, llm).backfill(page_size=10)
+
+    assert (stats.conversations, stats.seeded, stats.llm_classified) == (4, 1, 3)
+    assert all(doc["metadata"]["topics"] == ["docker"] for doc in docs)
+    # Topics from elsewhere are kept and written to the chunks too
+    assert labelled["metadata"]["topics"] == ["baking"]
+    for chunk in db["chunks"].docs:
+        document = next(d for d in db["documents"].docs if d["_id"] == chunk["document_id"])
+        assert chunk["metadata"]["topics"] == document["metadata"]["topics"]
+    assert (db["documents"].bulk_writes, db["chunks"].bulk_writes) == (1, 1)
+    assert (stats.documents_updated, stats.chunks_updated) == (4, 8)
+
+    llm.batches.clear()
+    stats = await make_pipeline(db, llm).backfill()
+    assert (stats.unchanged, stats.documents_updated, llm.batches) == (4, 0, [])
+
+    # Only a conversation whose content changed is classified again
+    docs[0]["content"] += "\n\n**User:** And python?"
+    stats = await make_pipeline(db, llm).backfill()
+    assert (stats.unchanged, stats.documents_updated) == (3, 1)
+    assert docs[0]["metadata"]["topics"] == ["docker", "python"]
+
+
+@pytest.mark.asyncio
+async def test_backfill_pages_and_limit():
+    db, llm = MemoryDatabase(), FakeLLM()
+    for i in range(5):
+        add_conversation(db, f"**User:** Python {i}", chunks=1)
+
+    stats = await make_pipeline(db, llm).backfill(limit=3, page_size=2)
+    assert (stats.conversations, stats.documents_updated) == (3, 3)
+    assert db["documents"].bulk_writes == 2
+
+    stats = await make_pipeline(db, llm).backfill(page_size=2)
+    assert (stats.conversations, stats.unchanged, stats.documents_updated) == (5, 3, 2)
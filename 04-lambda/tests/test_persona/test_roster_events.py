@@ -0,0 +1,52 @@
+"""Tests for the Discord channel roster event feed."""
+
+import asyncio
+
+import pytest
+from app.capabilities.persona.discord_characters.events import RosterEventFeed
+
+
+@pytest.mark.asyncio
+async def test_new_client_is_reset_then_receives_events():
+    feed = RosterEventFeed()
+    feed.publish("c1", "add", "luna")
+
+    first = feed.events_since(0)
+    assert first["reset"] is True
+    assert first["version"] == 1
+
+    feed.publish("c1", "remove", "luna")
+    second = feed.events_since(first["version"], first["epoch"])
+    assert second["reset"] is False
+    assert [e["action"] for e in second["events"]] == ["remove"]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_events_wakes_on_publish():
+    feed = RosterEventFeed()
+    waiter = asyncio.create_task(feed.wait_for_events(0, feed.epoch, timeout=5))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    feed.publish("c1", "add", "luna", {"character_id": "luna", "name": "Luna"})
+    result = await asyncio.wait_for(waiter, timeout=1)
+
+    assert result["version"] == 1
+    assert result["events"][0]["character"]["name"] == "Luna"
+
+
+@pytest.mark.asyncio
+async def test_wait_for_events_times_out_empty():
+    feed = RosterEventFeed()
+    result = await feed.wait_for_events(0, feed.epoch, timeout=0.01)
+    assert result == {"epoch": feed.epoch, "version": 0, "events": [], "reset": False}
+
+
+def test_client_behind_retained_history_or_other_epoch_is_reset():
+    feed = RosterEventFeed(history_size=2)
+    for i in range(4):
+        feed.publish("c1", "add", f"char{i}")
+
+    assert feed.events_since(1, feed.epoch)["reset"] is True
+    assert feed.events_since(2, feed.epoch)["reset"] is False
+    assert feed.events_since(4, "previous-process")["reset"] is True
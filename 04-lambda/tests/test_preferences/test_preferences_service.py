@@ -0,0 +1,186 @@
+"""Tests for single-query preference resolution and the per-user cache."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from app.services.database.supabase.config import SupabaseConfig
+from app.services.preferences.cache import PreferenceCache
+from app.services.preferences.service import PreferencesService
+
+DEFINITIONS = {
+    "llm.temperature": ("llm", "0.7", True),
+    "llm.max_tokens": ("llm", "2048", True),
+    "ui.theme": ("ui", '"dark"', True),
+    "ui.internal": ("ui", '"x"', False),
+    "crawl.timeout": ("crawl", None, True),
+}
+
+
+class FakeConnection:
+    """Answers the resolution query from in-memory tables."""
+
+    def __init__(self):
+        self.user_prefs: dict[tuple[str, str], str] = {}
+        self.org_prefs: dict[tuple[str, str], str] = {}
+        self.queries = 0
+
+    async def fetch(self, query, user_id, organization_id, *filters):
+        self.queries += 1
+        rows = []
+        for key, (category, default, configurable) in DEFINITIONS.items():
+            if "d.key =" in query and key != filters[0]:
+                continue
+            if "d.category =" in query and category != filters[0]:
+                continue
+            user_value = self.user_prefs.get((str(user_id), key))
+            org_value = self.org_prefs.get((str(organization_id), key))
+            if user_value is not None:
+                value, source = user_value, "user"
+            elif org_value is not None:
+                value, source = org_value, "organization"
+            else:
+                value, source = default, "system"
+            rows.append(
+                {
+                    "key": key,
+                    "category": category,
+                    "is_user_configurable": configurable,
+                    "value": value,
+                    "source": source,
+                }
+            )
+        return rows
+
+    async def execute(self, query, *args):
+        if query.lstrip().startswith("INSERT"):
+            self.user_prefs[(str(args[0]), args[1])] = args[2]
+        elif query.lstrip().startswith("DELETE"):
+            self.user_prefs.pop((str(args[0]), args[1]), None)
+
+    async def fetchrow(self, query, key):
+        return {"key": key, "is_user_configurable": DEFINITIONS[key][2]}
+
+
+@pytest.fixture
+def conn():
+    return FakeConnection()
+
+
+def make_service(conn, ttl_seconds=300.0):
+    service = PreferencesService(
+        SupabaseConfig(SUPABASE_DB_URL="postgresql://test@localhost/test"),
+        cache=PreferenceCache(max_size=100, ttl_seconds=ttl_seconds),
+    )
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+    service.supabase._get_pool = AsyncMock(return_value=pool)
+    return service
+
+
+@pytest.fixture(autouse=True)
+def no_listener():
+    with patch("app.services.preferences.service.start_preference_listener", AsyncMock()):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_get_all_resolves_in_one_query_and_caches(conn):
+    service = make_service(conn)
+    user_id = uuid4()
+    conn.user_prefs[(str(user_id), "llm.temperature")] = "0.2"
+
+    prefs = await service.get_all(user_id)
+
+    assert conn.queries == 1
+    assert prefs == {
+        "llm.temperature": "0.2",
+        "llm.max_tokens": "2048",
+        "ui.theme": '"dark"',
+        "crawl.timeout": 30,  # no system default: FALLBACK_DEFAULTS
+    }
+    assert await service.get_all(user_id, category="llm") == {
+        "llm.temperature": "0.2",
+        "llm.max_tokens": "2048",
+    }
+    assert await service.get(user_id, "ui.internal") == '"x"'
+    assert await service.get_source(user_id, "llm.temperature") == "user"
+    assert await service.get(user_id, "unknown.key", default=5) == 5
+    assert conn.queries == 1
+
+
+@pytest.mark.asyncio
+async def test_set_and_delete_invalidate_the_users_entry(conn):
+    service = make_service(conn)
+    user_id, other_id = uuid4(), uuid4()
+    await service.get(user_id, "ui.theme")
+    await service.get(other_id, "ui.theme")
+
+    await service.set(user_id, "ui.theme", "light")
+    assert await service.get(user_id, "ui.theme") == '"light"'
+    assert await service.get_source(user_id, "ui.theme") == "user"
+    # The other user's entry was kept
+    assert conn.queries == 3
+
+    await service.delete(user_id, "ui.theme")
+    assert await service.get(user_id, "ui.theme") == '"dark"'
+    assert conn.queries == 4
+
+
+@pytest.mark.asyncio
+async def test_organization_values_and_notifications(conn):
+    service = make_service(conn)
+    user_id, org_id = uuid4(), uuid4()
+    conn.org_prefs[(str(org_id), "llm.max_tokens")] = "512"
+
+    assert await service.get(user_id, "llm.max_tokens", organization_id=org_id) == "512"
+    assert await service.get_source(user_id, "llm.max_tokens", organization_id=org_id) == (
+        "organization"
+    )
+    assert await service.get(user_id, "llm.max_tokens") == "2048"
+    assert conn.queries == 2
+
+    # Another worker changed the organization's value
+    conn.org_prefs[(str(org_id), "llm.max_tokens")] = "1024"
+    service.cache.handle_notification(f"organization:{org_id}")
+
+    assert await service.get(user_id, "llm.max_tokens", organization_id=org_id) == "1024"
+    assert await service.get(user_id, "llm.max_tokens") == "2048"
+    assert conn.queries == 3
+
+
+@pytest.mark.asyncio
+async def test_load_racing_an_invalidation_is_not_cached(conn):
+    service = make_service(conn)
+    user_id = uuid4()
+    fetch = conn.fetch
+
+    async def fetch_then_invalidate(*args):
+        rows = await fetch(*args)
+        service.cache.handle_notification(f"user:{user_id}")
+        return rows
+
+    conn.fetch = fetch_then_invalidate
+    await service.get(user_id, "ui.theme")
+
+    assert service.cache.get(user_id) is None
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_queries_only_the_requested_key(conn):
+    service = make_service(conn, ttl_seconds=0)
+    user_id = uuid4()
+    seen = []
+    fetch = conn.fetch
+
+    async def recording_fetch(query, *params):
+        seen.append(params[2:])
+        return await fetch(query, *params)
+
+    conn.fetch = recording_fetch
+
+    assert await service.get(user_id, "llm.temperature") == "0.7"
+    assert await service.get_all(user_id, category="ui") == {"ui.theme": '"dark"'}
+    assert seen == [("llm.temperature",), ("ui",)]
+    assert len(service.cache) == 0
@@ -0,0 +1,155 @@
+"""Tests for the process-wide model registry."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from app.core import model_registry
+from app.core.model_registry import ModelRegistry, model_key, warmup_keys
+
+
+class FakeModel:
+    def __init__(self, name):
+        self.name = name
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def predict(self, value):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+        return f"{self.name}:{value}"
+
+
+@pytest.fixture
+def loads():
+    """Register fake "reranker" and "tokenizer" loaders and count their loads."""
+    counts = {}
+
+    def loader(name):
+        counts[name] = counts.get(name, 0) + 1
+        return FakeModel(name)
+
+    with patch.dict(model_registry.LOADERS, {"reranker": loader, "tokenizer": loader}):
+        yield counts
+
+
+@pytest.mark.asyncio
+async def test_model_loads_once_and_is_shared(loads):
+    registry = ModelRegistry(workers=4)
+    key = model_key("reranker", "m1")
+
+    results = await asyncio.gather(
+        *(registry.run(key, lambda model, i=i: model.predict(i)) for i in range(8))
+    )
+
+    assert results == [f"m1:{i}" for i in range(8)]
+    assert loads == {"m1": 1}
+    assert registry.get(key) is registry.get(key)
+    # Calls on one model are serialized even with several pool workers
+    assert registry.get(key).max_active == 1
+    stats = registry.stats()["models"][key]
+    assert stats["loaded"] and stats["calls"] == 8 and stats["in_use"] == 0
+    await registry.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_idle_models_are_evicted_and_reloaded(loads):
+    registry = ModelRegistry(idle_evict_seconds=0.05)
+    reranker, tokenizer = model_key("reranker", "m1"), model_key("tokenizer", "t1")
+    registry.get(reranker)
+    registry.get(tokenizer)
+
+    time.sleep(0.1)
+
+    # Tokenizers are pinned: chunkers hold references to them
+    assert registry.evict_idle() == [reranker]
+    assert not registry.stats()["models"][reranker]["loaded"]
+    assert registry.stats()["models"][tokenizer]["loaded"]
+
+    registry.get(reranker)
+    assert loads == {"m1": 2, "t1": 1}
+    assert registry.stats()["evictions"] == 1
+    await registry.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_memory_budget_evicts_least_recently_used(loads):
+    registry = ModelRegistry(memory_budget_bytes=150)
+    with patch.object(model_registry, "_parameter_bytes", return_value=100):
+        registry.get(model_key("reranker", "old"))
+        registry.get(model_key("reranker", "new"))
+
+    models = registry.stats()["models"]
+    assert not models[model_key("reranker", "old")]["loaded"]
+    assert models[model_key("reranker", "new")]["loaded"]
+    await registry.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_models_in_use_are_not_evicted(loads):
+    registry = ModelRegistry(idle_evict_seconds=0.01)
+    key = model_key("reranker", "m1")
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow(model):
+        started.set()
+        release.wait(1)
+        return model.name
+
+    task = asyncio.create_task(registry.run(key, slow))
+    await asyncio.to_thread(started.wait, 1)
+    time.sleep(0.05)
+
+    assert registry.evict_idle() == []
+    release.set()
+    assert await task == "m1"
+    await registry.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_queued_calls_do_not_hold_pool_threads_from_other_models(loads):
+    registry = ModelRegistry(workers=2)
+    busy, other = model_key("reranker", "busy"), model_key("reranker", "other")
+    release = threading.Event()
+
+    def slow(model):
+        release.wait(2)
+        return model.name
+
+    queued = [asyncio.create_task(registry.run(busy, slow)) for _ in range(3)]
+    await asyncio.sleep(0.05)
+
+    # Only one "busy" call occupies a thread, the next pool thread is free
+    assert await asyncio.wait_for(registry.run(other, lambda model: model.name), 1) == "other"
+    release.set()
+    assert await asyncio.gather(*queued) == ["busy"] * 3
+    await registry.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_logs_failures(loads):
+    registry = ModelRegistry()
+
+    def broken(name):
+        raise OSError("no such model")
+
+    with patch.dict(model_registry.LOADERS, {"ner": broken}):
+        await registry.warm_up([model_key("ner", "missing"), model_key("reranker", "m1")])
+
+    assert loads == {"m1": 1}
+    await registry.shutdown()
+
+
+def test_warmup_keys_use_configured_defaults():
+    with patch.object(model_registry.settings, "reranker_model", "cross/encoder"):
+        keys = warmup_keys("reranker, ner:dslim/bert-base-NER,,bogus")
+
+    assert keys == ["reranker:cross/encoder", "ner:dslim/bert-base-NER"]
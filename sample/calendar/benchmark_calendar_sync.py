@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Calendar sync benchmark: per-event calls vs. batched push and incremental pull.
+
+Runs against FakeCalendarAPI (an in-memory stand-in for the Calendar v3 API),
+so no Google credentials are needed, and compares HTTP round trips and wall time:
+
+- per-event: GoogleCalendarSyncService.create_or_update_event() for each event
+             (one state lookup and one API call per event, the previous behaviour)
+- batched:   CalendarSyncEngine.push() for the same events (batch requests)
+- re-push:   the same events again (skipped as unchanged, no API calls)
+- full pull: CalendarSyncEngine.pull() with no sync token (every page)
+- pull:      a pull after --changed remote edits (only the changes)
+
+Sync states and the event mirror live in a scratch database, dropped afterwards
+unless --keep is given.
+
+Prerequisites:
+- MongoDB running (MONGODB_URI)
+
+Usage:
+    python sample/calendar/benchmark_calendar_sync.py
+    python sample/calendar/benchmark_calendar_sync.py --events 1000 --changed 25
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add lambda server to path so we can import from the project
+project_root = Path(__file__).parent.parent.parent
+lambda_path = project_root / "04-lambda"
+sys.path.insert(0, str(lambda_path))
+
+from app.capabilities.calendar.calendar_sync.services import (  # noqa: E402
+    CalendarSyncEngine,
+    EventChange,
+    GoogleCalendarSyncService,
+)
+from app.capabilities.calendar.calendar_sync.stores.mongodb_store import (  # noqa: E402
+    MongoDBCalendarStore,
+)
+from app.core.config import settings  # noqa: E402
+from app.services.external.google_calendar import (  # noqa: E402
+    CalendarEventData,
+    GoogleCalendar,
+    GoogleCalendarService,
+)
+from app.services.external.google_calendar.fake import FakeCalendarAPI  # noqa: E402
+from motor.motor_asyncio import AsyncIOMotorClient  # noqa: E402
+
+
+def event_data(i: int) -> CalendarEventData:
+    day = i % 28 + 1
+    return CalendarEventData(
+        summary=f"Benchmark event {i}",
+        start=f"2026-01-{day:02d}T10:00:00",
+        end=f"2026-01-{day:02d}T11:00:00",
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=300, help="Events to push")
+    parser.add_argument("--remote", type=int, default=2000, help="Extra events already in Google")
+    parser.add_argument("--changed", type=int, default=10, help="Remote edits before the pull")
+    parser.add_argument("--page-size", type=int, default=settings.google_calendar_sync_page_size)
+    parser.add_argument("--database", default="calendar_sync_benchmark")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch database")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("Calendar - Sync Benchmark")
+    print("=" * 80)
+
+    client = AsyncIOMotorClient(settings.mongodb_uri, serverSelectionTimeoutMS=5000)
+    await client.drop_database(args.database)
+    store = MongoDBCalendarStore(client[args.database])
+    await store.ensure_indexes()
+
+    api = FakeCalendarAPI()
+    remote = api.events()
+    remote_ids = [
+        remote.insert(calendarId="primary", body={"summary": f"Remote {i}"}).execute()["id"]
+        for i in range(args.remote)
+    ]
+    calendar_service = GoogleCalendarService(client=GoogleCalendar(None, service=api))
+    sync_service = GoogleCalendarSyncService(calendar_service, store)
+    engine = CalendarSyncEngine(calendar_service, store, page_size=args.page_size)
+
+    changes = [EventChange(f"ext{i}", event_data(i)) for i in range(args.events)]
+
+    async def per_event():
+        for change in changes:
+            await sync_service.create_or_update_event(
+                "bench", "per-event", change.external_id, change.event_data
+            )
+
+    async def remote_edits_then_pull():
+        for event_id in remote_ids[: args.changed]:
+            remote.patch(calendarId="primary", eventId=event_id, body={"summary": "Edited"}).run()
+        return await engine.pull("bench")
+
+    modes = [
+        ("per-event", per_event),
+        ("batched", lambda: engine.push("bench", "batched", changes)),
+        ("re-push", lambda: engine.push("bench", "batched", changes)),
+        ("full pull", lambda: engine.pull("bench")),
+        ("pull", remote_edits_then_pull),
+    ]
+
+    print(f"Events pushed: {args.events}, remote events: {args.remote}")
+    print()
+    print(f"{'Mode':<12}{'seconds':>10}{'HTTP requests':>15}{'batches':>9}{'events':>8}")
+    try:
+        for name, run in modes:
+            api.http_requests = api.batch_requests = 0
+            start = time.perf_counter()
+            result = await run()
+            seconds = time.perf_counter() - start
+            if result is None:
+                events = args.events
+            elif hasattr(result, "upserted"):
+                events = result.upserted + result.deleted
+            else:
+                events = len(result.results) - result.count("unchanged")
+            print(
+                f"{name:<12}{seconds:>10.2f}{api.http_requests:>15}"
+                f"{api.batch_requests:>9}{events:>8}"
+            )
+    finally:
+        calendar_service.close()
+        if not args.keep:
+            await client.drop_database(args.database)
+        client.close()
+
+    print()
+    print("events: events written (push) or applied to the mirror (pull).")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""ComfyUI output benchmark: time from "done rendering" to "stored" per strategy.
+
+Runs completion processing for one batch of output images against FakeComfyUI
+(a local ComfyUI stand-in serving /view) and in-process MinIO and Immich stand-ins
+that add a fixed latency per request plus transfer time, so no services are needed:
+
+- serial:    download each image whole, upload it to MinIO, then to Immich, with
+             three run record UPDATEs per image (the previous behaviour)
+- streamed:  ComfyUIWorkflowService._process_completion with one image at a time
+- parallel:  the same with --concurrency images at a time
+
+and reports wall time, run record statements and the largest buffer held for
+MinIO (the whole image when buffered, one chunk when streamed).
+
+Usage:
+    python sample/comfyui/benchmark_output_pipeline.py
+    python sample/comfyui/benchmark_output_pipeline.py --images 16 --concurrency 8 --image-mb 3
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+# Add lambda server to path so we can import from the project
+project_root = Path(__file__).parent.parent.parent
+lambda_path = project_root / "04-lambda"
+sys.path.insert(0, str(lambda_path))
+
+from app.capabilities.legacy_projects.comfyui_workflow.client import ComfyUIClient  # noqa: E402
+from app.capabilities.legacy_projects.comfyui_workflow.config import ComfyUIConfig  # noqa: E402
+from app.capabilities.legacy_projects.comfyui_workflow.fake import FakeComfyUI  # noqa: E402
+from app.capabilities.legacy_projects.comfyui_workflow.models import RunStatus  # noqa: E402
+from app.capabilities.legacy_projects.comfyui_workflow.service import (  # noqa: E402
+    ComfyUIWorkflowService,
+)
+
+
+class Transfer:
+    """Simulated network cost: a round trip per request plus bytes at a fixed rate."""
+
+    def __init__(self, latency_ms: float, mbps: float):
+        self.latency = latency_ms / 1000
+        self.bytes_per_second = mbps * 1024 * 1024
+
+    async def request(self) -> None:
+        await asyncio.sleep(self.latency)
+
+    async def send(self, size: int) -> None:
+        await asyncio.sleep(size / self.bytes_per_second)
+
+
+class StandInMinIO:
+    """MinIOClient stand-in: consumes uploads at the simulated transfer rate."""
+
+    def __init__(self, transfer: Transfer):
+        self.transfer = transfer
+        self.largest_buffer = 0
+
+    async def upload_file(self, user_id, file_data, object_key, content_type=None, metadata=None):
+        self.largest_buffer = max(self.largest_buffer, len(file_data))
+        await self.transfer.request()
+        await self.transfer.send(len(file_data))
+        return f"user-{user_id}/{object_key}"
+
+    async def upload_stream(self, user_id, chunks, object_key, content_type=None, metadata=None):
+        await self.transfer.request()
+        async for chunk in chunks:
+            self.largest_buffer = max(self.largest_buffer, len(chunk))
+            await self.transfer.send(len(chunk))
+        return f"user-{user_id}/{object_key}"
+
+
+class StandInImmich:
+    def __init__(self, transfer: Transfer):
+        self.transfer = transfer
+
+    async def upload_asset(self, user_api_key, file_data, filename, device_asset_id=None):
+        await self.transfer.request()
+        await self.transfer.send(len(file_data))
+        return f"asset-{filename}"
+
+
+class CountingConnection:
+    """Stands in for asyncpg: each statement costs one database round trip."""
+
+    def __init__(self, latency_ms: float):
+        self.latency = latency_ms / 1000
+        self.statements = 0
+
+    async def execute(self, query, *args):
+        self.statements += 1
+        await asyncio.sleep(self.latency)
+
+    async def fetchrow(self, query, run_id):
+        await asyncio.sleep(self.latency)
+        return {
+            "id": run_id,
+            "user_id": uuid4(),
+            "status": "completed",
+            "started_at": datetime.now(),
+        }
+
+
+class CountingPool:
+    def __init__(self, latency_ms: float):
+        self.conn = CountingConnection(latency_ms)
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+async def serial_completion(service: ComfyUIWorkflowService, run_id, user_id, result) -> None:
+    """The former completion: whole-image downloads, uploads and updates one at a time."""
+    conn = service.pool.conn
+    images = service.client.extract_output_images(result)
+    await conn.execute("UPDATE comfyui_workflow_runs SET status = ...", run_id)
+    for i, img in enumerate(images):
+        data = await service.client.get_image(img["filename"], img["subfolder"], img["type"])
+        path = await service.minio_client.upload_file(
+            user_id, data, f"comfyui/{run_id}/{img['filename']}"
+        )
+        await conn.execute("UPDATE ... SET minio_paths = array_append(...)", run_id, path)
+        asset_id = await service.immich_service.upload_asset("key", data, img["filename"])
+        await conn.execute("UPDATE ... SET immich_asset_ids = array_append(...)", run_id, asset_id)
+        await conn.execute("UPDATE ... SET images_completed = ...", run_id, i + 1)
+    await conn.execute("UPDATE ... SET status = ...", run_id, RunStatus.COMPLETED.value)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--images", type=int, default=8, help="Output images in the batch")
+    parser.add_argument("--image-mb", type=float, default=2.0, help="Size of each image in MB")
+    parser.add_argument("--concurrency", type=int, default=4, help="Images at once (parallel)")
+    parser.add_argument("--storage-latency-ms", type=float, default=30.0)
+    parser.add_argument("--storage-mbps", type=float, default=100.0, help="MinIO/Immich MB/s")
+    parser.add_argument("--db-latency-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("ComfyUI - Output Pipeline Benchmark")
+    print("=" * 80)
+
+    image_size = int(args.image_mb * 1024 * 1024)
+    result = {
+        "status": "completed",
+        "outputs": {
+            "9": {
+                "images": [
+                    {"filename": f"ComfyUI_{i:05d}_.png", "subfolder": "", "type": "output"}
+                    for i in range(args.images)
+                ]
+            }
+        },
+    }
+
+    async with FakeComfyUI(image_size=image_size) as comfyui:
+
+        def make_service(concurrency: int) -> ComfyUIWorkflowService:
+            transfer = Transfer(args.storage_latency_ms, args.storage_mbps)
+            config = ComfyUIConfig(
+                comfyui_url=comfyui.url, use_websocket=False, output_concurrency=concurrency
+            )
+            return ComfyUIWorkflowService(
+                CountingPool(args.db_latency_ms),
+                StandInMinIO(transfer),
+                StandInImmich(transfer),
+                client=ComfyUIClient(config),
+            )
+
+        async def serial(service, run_id, user_id):
+            await serial_completion(service, run_id, user_id, result)
+
+        async def pipeline(service, run_id, user_id):
+            await service._process_completion(
+                service.pool.conn, run_id, user_id, result, immich_api_key="key"
+            )
+
+        modes = [
+            ("serial", make_service(1), serial),
+            ("streamed", make_service(1), pipeline),
+            ("parallel", make_service(args.concurrency), pipeline),
+        ]
+
+        print(
+            f"Images: {args.images} x {args.image_mb} MB, concurrency: {args.concurrency}, "
+            f"storage: {args.storage_latency_ms:.0f} ms + {args.storage_mbps:.0f} MB/s"
+        )
+        print()
+        print(f"{'Mode':<10}{'seconds':>10}{'statements':>12}{'largest buffer KB':>19}")
+        for name, service, run in modes:
+            start = time.perf_counter()
+            try:
+                await run(service, uuid4(), uuid4())
+            finally:
+                await service.close()
+            seconds = time.perf_counter() - start
+            print(
+                f"{name:<10}{seconds:>10.2f}{service.pool.conn.statements:>12}"
+                f"{service.minio_client.largest_buffer / 1024:>19.0f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -138,11 +138,27 @@ def stream_generation_progress(
             with client.stream("GET", url, headers=headers) as response:
                 response.raise_for_status()
 
+                event = None
                 for line in response.iter_lines():
                     if not line:
+                        event = None
                         continue
 
-                    # SSE format: "data: {json}"
+                    if line.startswith("event: "):
+                        event = line[7:]
+                        continue
+
+                    # Named "progress" events carry ComfyUI node progress
+                    if event == "progress" and line.startswith("data: "):
+                        progress = json.loads(line[6:])
+                        if progress.get("value") is not None:
+                            print(
+                                f"     {progress['node_name']}: "
+                                f"{progress['value']}/{progress['max']}"
+                            )
+                        continue
+
+                    # SSE format: "data: {json}" (full run status)
                     if line.startswith("data: "):
                         data_str = line[6:]  # Remove "data: " prefix
 
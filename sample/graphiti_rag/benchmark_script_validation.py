@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Script validation benchmark: per-lookup Cypher vs. in-memory symbol index.
+
+Validates a set of Python scripts with both KnowledgeGraphValidator (one Neo4j
+query per import/class/method/attribute/function lookup) and
+IndexedKnowledgeGraphValidator (a few bulk queries, then in-memory lookups),
+and reports wall time and Neo4j round trips for each.
+
+Prerequisites:
+- Neo4j running with at least one repository parsed (use repository_parsing_example.py)
+- Environment variables configured (NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD)
+
+Usage:
+    python sample/graphiti_rag/benchmark_script_validation.py
+    python sample/graphiti_rag/benchmark_script_validation.py --scripts path/to/scripts --limit 50
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add lambda server to path so we can import from the project
+project_root = Path(__file__).parent.parent.parent
+lambda_path = project_root / "04-lambda"
+sys.path.insert(0, str(lambda_path))
+
+from app.capabilities.retrieval.graphiti_rag.config import config  # noqa: E402
+from app.capabilities.retrieval.graphiti_rag.knowledge_graphs.ai_script_analyzer import (  # noqa: E402
+    AIScriptAnalyzer,
+)
+from app.capabilities.retrieval.graphiti_rag.knowledge_graphs.hallucination_validator import (  # noqa: E402
+    KnowledgeGraphValidator,
+)
+from app.capabilities.retrieval.graphiti_rag.knowledge_graphs.symbol_index import (  # noqa: E402
+    IndexedKnowledgeGraphValidator,
+    clear_symbol_cache,
+)
+
+
+class CountingSession:
+    """Wraps a Neo4j session and counts queries."""
+
+    def __init__(self, session, counter: list[int]):
+        self.session = session
+        self.counter = counter
+
+    async def __aenter__(self):
+        await self.session.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc):
+        return await self.session.__aexit__(*exc)
+
+    async def run(self, query, **params):
+        self.counter[0] += 1
+        return await self.session.run(query, **params)
+
+
+class CountingDriver:
+    def __init__(self, driver):
+        self.driver = driver
+        self.counter = [0]
+
+    def session(self):
+        return CountingSession(self.driver.session(), self.counter)
+
+    async def close(self):
+        await self.driver.close()
+
+
+async def run_validator(validator_class, analyses) -> tuple[float, int, int]:
+    """Validate all analyses, returning (seconds, round trips, hallucinations)."""
+    validator = validator_class(config.neo4j_uri, config.neo4j_user, config.neo4j_password)
+    await validator.initialize()
+    validator.driver = CountingDriver(validator.driver)
+    hallucinations = 0
+    try:
+        start = time.perf_counter()
+        for analysis in analyses:
+            result = await validator.validate_script(analysis)
+            hallucinations += len(result.hallucinations_detected)
+        return time.perf_counter() - start, validator.driver.counter[0], hallucinations
+    finally:
+        await validator.close()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scripts", type=Path, default=project_root / "sample")
+    parser.add_argument("--limit", type=int, default=30)
+    args = parser.parse_args()
+
+    scripts = sorted(args.scripts.rglob("*.py"))[: args.limit]
+    analyses = [AIScriptAnalyzer().analyze_script(str(path)) for path in scripts]
+
+    print("=" * 80)
+    print("Script Validation Benchmark")
+    print("=" * 80)
+    print(f"Scripts: {len(analyses)} from {args.scripts}")
+    print()
+
+    cypher_time, cypher_trips, cypher_found = await run_validator(KnowledgeGraphValidator, analyses)
+    clear_symbol_cache()
+    cold_time, cold_trips, cold_found = await run_validator(
+        IndexedKnowledgeGraphValidator, analyses
+    )
+    warm_time, warm_trips, _ = await run_validator(IndexedKnowledgeGraphValidator, analyses)
+
+    print(f"{'mode':<24}{'seconds':>10}{'round trips':>14}{'hallucinations':>16}")
+    print(f"{'per-lookup Cypher':<24}{cypher_time:>10.2f}{cypher_trips:>14}{cypher_found:>16}")
+    print(f"{'symbol index (cold)':<24}{cold_time:>10.2f}{cold_trips:>14}{cold_found:>16}")
+    print(f"{'symbol index (warm)':<24}{warm_time:>10.2f}{warm_trips:>14}{'':>16}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Batch search benchmark: N single searches vs. one batch search.
+
+Runs the same set of queries as N separate searches (each paying request setup
+and its own embedding call, like N calls to POST /api/v1/rag/search) and as one
+batch_search (one setup, one embedding call, concurrent MongoDB searches, like
+POST /api/v1/rag/search/batch), and reports wall time and embedding API calls.
+
+By default MongoDB and the embedding API are simulated with fixed latencies, so
+no services are required. Use --live to run against the configured MongoDB and
+embedding provider instead.
+
+Prerequisites (--live only):
+- MongoDB running with vector and text search indexes configured
+- Documents ingested into MongoDB (use document_ingestion_example.py)
+- Environment variables configured (MONGODB_URI, EMBEDDING_BASE_URL, etc.)
+
+Usage:
+    python sample/mongo_rag/benchmark_batch_search.py
+    python sample/mongo_rag/benchmark_batch_search.py --queries 12 --embed-ms 80
+    python sample/mongo_rag/benchmark_batch_search.py --live
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add lambda server to path so we can import from the project
+project_root = Path(__file__).parent.parent.parent
+lambda_path = project_root / "04-lambda"
+sys.path.insert(0, str(lambda_path))
+
+from app.capabilities.retrieval.mongo_rag.config import config  # noqa: E402
+from app.capabilities.retrieval.mongo_rag.dependencies import AgentDependencies  # noqa: E402
+from app.capabilities.retrieval.mongo_rag.tools import (  # noqa: E402
+    BatchQuery,
+    batch_search,
+    hybrid_search,
+)
+
+QUERIES = [
+    "how to configure authentication",
+    "OAuth2 token refresh",
+    "rate limiting strategy",
+    "vector index setup",
+    "document sharing permissions",
+    "ingestion pipeline chunking",
+    "reranking search results",
+    "knowledge graph facts",
+    "conversation memory",
+    "deploying the lambda server",
+    "embedding model dimensions",
+    "hybrid search reciprocal rank fusion",
+]
+
+
+class SimulatedCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for doc in self.docs:
+            yield doc
+
+
+class SimulatedChunks:
+    """Chunk collection that answers every aggregation after a fixed latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def aggregate(self, pipeline):
+        await asyncio.sleep(self.latency)
+        stage = pipeline[0].get("$vectorSearch") or pipeline[0]["$search"]
+        limit = stage.get("limit", 10)
+        return SimulatedCursor(
+            [
+                {
+                    "chunk_id": f"chunk-{i}",
+                    "document_id": f"doc-{i // 3}",
+                    "content": "simulated chunk",
+                    "similarity": 1.0 / (i + 1),
+                    "document_title": "Simulated",
+                    "document_source": "benchmark",
+                }
+                for i in range(limit)
+            ]
+        )
+
+
+class SimulatedDeps:
+    """AgentDependencies stand-in with simulated setup, embedding and MongoDB latency."""
+
+    def __init__(self, args, counters: dict[str, int]):
+        self.args = args
+        self.counters = counters
+        self.settings = SimpleNamespace(
+            default_match_count=config.default_match_count,
+            max_match_count=config.max_match_count,
+            mongodb_vector_index="vector_index",
+            mongodb_text_index="text_index",
+            mongodb_collection_chunks="chunks",
+            mongodb_collection_documents="documents",
+        )
+        self.db = {"chunks": SimulatedChunks(args.search_ms / 1000)}
+        self.current_user_id = "benchmark"
+        self.current_user_email = "benchmark@example.com"
+        self.user_groups = []
+        self.is_admin = True
+        self.graphiti_deps = None
+
+    async def initialize(self):
+        # Auth + per-request dependency setup
+        await asyncio.sleep(self.args.setup_ms / 1000)
+
+    async def cleanup(self):
+        return None
+
+    async def get_embedding(self, text: str) -> list[float]:
+        self.counters["embedding_calls"] += 1
+        await asyncio.sleep(self.args.embed_ms / 1000)
+        return [0.0] * 8
+
+    async def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        self.counters["embedding_calls"] += 1
+        await asyncio.sleep(self.args.embed_ms / 1000)
+        return [[0.0] * 8 for _ in texts]
+
+
+def _make_deps(args, counters):
+    if not args.live:
+        return SimulatedDeps(args, counters)
+
+    deps = AgentDependencies.from_settings(is_admin=True)
+    get_embedding, get_embeddings = deps.get_embedding, deps.get_embeddings
+
+    async def counted_embedding(text):
+        counters["embedding_calls"] += 1
+        return await get_embedding(text)
+
+    async def counted_embeddings(texts):
+        counters["embedding_calls"] += 1
+        return await get_embeddings(texts)
+
+    deps.get_embedding = counted_embedding
+    deps.get_embeddings = counted_embeddings
+    return deps
+
+
+async def run_single(args, queries, counters) -> int:
+    """One request per query, sequentially (an agent issuing N tool calls)."""
+    results = 0
+    for query in queries:
+        deps = _make_deps(args, counters)
+        await deps.initialize()
+        try:
+            results += len(await hybrid_search(SimpleNamespace(deps=deps), query, args.match_count))
+        finally:
+            await deps.cleanup()
+    return results
+
+
+async def run_batch(args, queries, counters) -> int:
+    """One request for every query."""
+    deps = _make_deps(args, counters)
+    await deps.initialize()
+    try:
+        results_list = await batch_search(
+            SimpleNamespace(deps=deps),
+            [BatchQuery(query=query, match_count=args.match_count) for query in queries],
+            dedupe=args.dedupe,
+        )
+    finally:
+        await deps.cleanup()
+    return sum(len(results) for results in results_list)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=8, help="Number of queries (max 12)")
+    parser.add_argument("--match-count", type=int, default=5)
+    parser.add_argument("--dedupe", action="store_true", help="Deduplicate chunks in the batch")
+    parser.add_argument("--live", action="store_true", help="Use real MongoDB and embeddings")
+    parser.add_argument("--setup-ms", type=float, default=30.0, help="Simulated per-request setup")
+    parser.add_argument("--embed-ms", type=float, default=60.0, help="Simulated embedding call")
+    parser.add_argument("--search-ms", type=float, default=15.0, help="Simulated Mongo query")
+    args = parser.parse_args()
+
+    config.use_reranking = False
+    queries = QUERIES[: args.queries]
+
+    print("=" * 80)
+    print("MongoDB RAG - Batch Search Benchmark")
+    print("=" * 80)
+    print(f"Queries: {len(queries)}, match_count: {args.match_count}, dedupe: {args.dedupe}")
+    if args.live:
+        print("Mode: live (configured MongoDB and embedding provider)")
+    else:
+        print(
+            f"Mode: simulated (setup {args.setup_ms} ms, embedding {args.embed_ms} ms, "
+            f"Mongo query {args.search_ms} ms)"
+        )
+    print()
+
+    for label, runner in (("N single searches", run_single), ("One batch search", run_batch)):
+        counters = {"embedding_calls": 0}
+        start = time.perf_counter()
+        results = await runner(args, queries, counters)
+        elapsed = time.perf_counter() - start
+        print(f"{label}:")
+        print(f"  Wall time:        {elapsed * 1000:.0f} ms")
+        print(f"  Embedding calls:  {counters['embedding_calls']}")
+        print(f"  Results:          {results}")
+        print()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Fallback chunker benchmark: markdown structure-aware vs. simple sliding window.
+
+Chunks a corpus of markdown documents (crawled pages) with both chunkers used
+for content without a DoclingDocument (FALLBACK_CHUNKER=markdown|simple) and
+reports per chunker:
+
+- Throughput in characters per second (best of --repeat runs)
+- Number of chunks and mean/max tokens per chunk
+- Chunks over max_tokens (truncated by the embedding model)
+- Chunks that cut a code fence (odd number of ``` / ~~~ fence lines)
+- Chunks that carry heading context
+
+Corpus (one of):
+- --corpus: markdown files or directories (searched for *.md recursively);
+  defaults to the repository's own markdown docs
+- --from-mongo N: the N most recent crawled documents (http(s) sources) from
+  the documents collection
+
+Prerequisites:
+- transformers and docling installed (the tokenizer is downloaded on first use)
+- For --from-mongo: MongoDB with crawled documents (use crawl4ai_rag samples)
+
+Usage:
+    python sample/mongo_rag/benchmark_chunker.py
+    python sample/mongo_rag/benchmark_chunker.py --corpus ~/crawls --repeat 5
+    python sample/mongo_rag/benchmark_chunker.py --from-mongo 200 --max-tokens 256
+"""
+
+import argparse
+import asyncio
+import re
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add lambda server to path so we can import from the project
+project_root = Path(__file__).parent.parent.parent
+lambda_path = project_root / "04-lambda"
+sys.path.insert(0, str(lambda_path))
+
+from app.capabilities.retrieval.mongo_rag.config import config  # noqa: E402
+from app.capabilities.retrieval.mongo_rag.ingestion.chunker import (  # noqa: E402
+    ChunkingConfig,
+    DoclingHybridChunker,
+)
+
+_FENCE_LINE = re.compile(r"^ {0,3}(`{3,}|~{3,})", re.MULTILINE)
+
+
+def load_files(paths: list[str]) -> list[str]:
+    files: list[Path] = []
+    for raw in paths:
+        path = Path(raw).expanduser()
+        files.extend(sorted(path.rglob("*.md")) if path.is_dir() else [path])
+    return [
+        f.read_text(encoding="utf-8", errors="replace")
+        for f in files
+        if "node_modules" not in f.parts
+    ]
+
+
+async def load_mongo(limit: int) -> list[str]:
+    from pymongo import AsyncMongoClient
+
+    client = AsyncMongoClient(config.mongodb_uri)
+    try:
+        documents = client[config.mongodb_database][config.mongodb_collection_documents]
+        cursor = (
+            documents.find({"source": {"$regex": "^https?://"}}, {"content": 1})
+            .sort("_id", -1)
+            .limit(limit)
+        )
+        return [doc["content"] async for doc in cursor if doc.get("content")]
+    finally:
+        await client.close()
+
+
+def run(chunk_fn, corpus: list[str], repeat: int) -> tuple[float, list]:
+    best, chunks = float("inf"), []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        chunks = [chunk for content in corpus for chunk in chunk_fn(content, {})]
+        best = min(best, time.perf_counter() - start)
+    return best, chunks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", nargs="*", help="Markdown files or directories")
+    parser.add_argument("--from-mongo", type=int, default=0, help="Use N crawled documents")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per chunker (best is kept)")
+    parser.add_argument("--max-tokens", type=int, default=512)
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Simple chunker characters")
+    parser.add_argument("--chunk-overlap", type=int, default=200)
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("MongoDB RAG - Fallback Chunker Benchmark")
+    print("=" * 80)
+
+    if args.from_mongo:
+        corpus = asyncio.run(load_mongo(args.from_mongo))
+    else:
+        corpus = load_files(args.corpus or [str(project_root)])
+    corpus = [content for content in corpus if content.strip()]
+    if not corpus:
+        print("No documents found")
+        return
+    total_chars = sum(len(content) for content in corpus)
+    print(f"Documents: {len(corpus)}, characters: {total_chars:,}, repeat: {args.repeat}")
+
+    chunker = DoclingHybridChunker(
+        ChunkingConfig(
+            chunk_size=args.chunk_size,
+            chunk_overlap=args.chunk_overlap,
+            max_chunk_size=args.chunk_size * 2,
+            max_tokens=args.max_tokens,
+        )
+    )
+    # Warm up the tokenizer
+    chunker._markdown_chunk(corpus[0], {})
+
+    print()
+    print(
+        f"{'Chunker':<10}{'chars/s':>12}{'Chunks':>8}{'Mean tok':>10}{'Max tok':>9}"
+        f"{'Over max':>10}{'Cut fence':>11}{'Context':>9}"
+    )
+    for name, chunk_fn in (
+        ("simple", chunker._simple_fallback_chunk),
+        ("markdown", chunker._markdown_chunk),
+    ):
+        seconds, chunks = run(chunk_fn, corpus, args.repeat)
+        tokens = np.array([chunk.token_count for chunk in chunks])
+        over = int((tokens > args.max_tokens).sum())
+        cut = sum(len(_FENCE_LINE.findall(chunk.content)) % 2 for chunk in chunks)
+        context = sum(bool(chunk.metadata.get("has_context")) for chunk in chunks)
+        print(
+            f"{name:<10}{total_chars / seconds:>12,.0f}{len(chunks):>8}{tokens.mean():>10.1f}"
+            f"{tokens.max():>9}{over:>10}{cut:>11}{context:>9}"
+        )
+
+    print()
+    print(
+        "Over max: chunks the embedding model truncates. Cut fence: chunks splitting a code block."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Code summary benchmark: one LLM call per block vs. the bounded, cached, batched stage.
+
+Extracts code blocks from a corpus of markdown pages the way code example
+ingestion does (USE_AGENTIC_RAG) and summarizes each page's blocks:
+
+- naive:   all of a page's blocks at once, one generate_code_example_summary()
+           call per block (the previous behaviour)
+- stage:   CodeSummarizer with CODE_SUMMARY_CONCURRENCY calls in flight and small
+           blocks batched into JSON prompts, cold summary cache
+- recrawl: the same pages again, served from the summary cache
+
+and reports per mode the wall time, LLM calls made, calls saved, the peak
+number of calls in flight and fallback summaries. The summary cache lives in a
+scratch database, dropped afterwards unless --keep is given.
+
+Corpus:
+- --corpus: markdown files or directories (*.md, recursively); defaults to the
+  repository's own markdown docs
+
+Prerequisites:
+- An LLM endpoint configured (LLM_BASE_URL, LLM_MODEL; Ollama by default)
+- MongoDB running (MONGODB_URI) for the summary cache
+
+Usage:
+    python sample/mongo_rag/benchmark_code_summaries.py
+    python sample/mongo_rag/benchmark_code_summaries.py --pages 10 --concurrency 2
+    python sample/mongo_rag/benchmark_code_summaries.py --batch-size 1 --skip-naive
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add lambda server to path so we can import from the project
+project_root = Path(__file__).parent.parent.parent
+lambda_path = project_root / "04-lambda"
+sys.path.insert(0, str(lambda_path))
+
+from app.capabilities.retrieval.mongo_rag.config import config  # noqa: E402
+from app.capabilities.retrieval.mongo_rag.extraction.code_extractor import (  # noqa: E402
+    extract_code_blocks,
+)
+from app.capabilities.retrieval.mongo_rag.extraction.code_summarizer import (  # noqa: E402
+    FALLBACK_SUMMARY,
+    CodeSummarizer,
+    generate_code_example_summary,
+    get_llm_client,
+)
+from pymongo import AsyncMongoClient  # noqa: E402
+
+
+class InFlight:
+    """Wraps the shared client's chat.completions.create to count concurrent calls."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+        completions = get_llm_client().chat.completions
+        create = completions.create
+
+        async def counted(*args, **kwargs):
+            self.active += 1
+            self.calls += 1
+            self.peak = max(self.peak, self.active)
+            try:
+                return await create(*args, **kwargs)
+            finally:
+                self.active -= 1
+
+        completions.create = counted
+
+    def reset(self):
+        self.peak = 0
+        self.calls = 0
+
+
+def load_pages(paths: list[str], min_length: int) -> list[list[dict]]:
+    files: list[Path] = []
+    for raw in paths:
+        path = Path(raw).expanduser()
+        files.extend(sorted(path.rglob("*.md")) if path.is_dir() else [path])
+    pages = []
+    for f in files:
+        if "node_modules" in f.parts:
+            continue
+        blocks = extract_code_blocks(f.read_text(encoding="utf-8", errors="replace"), min_length)
+        if blocks:
+            pages.append(blocks)
+    return pages
+
+
+async def naive(pages: list[list[dict]]) -> list[str]:
+    summaries = []
+    for blocks in pages:
+        summaries.extend(
+            await asyncio.gather(
+                *(
+                    generate_code_example_summary(
+                        b["code"], b["context_before"], b["context_after"]
+                    )
+                    for b in blocks
+                )
+            )
+        )
+    return summaries
+
+
+async def staged(pages: list[list[dict]], make_summarizer) -> tuple[list[str], int]:
+    summaries, saved = [], 0
+    for blocks in pages:
+        page_summaries, stats = await make_summarizer().summarize(blocks)
+        summaries.extend(page_summaries)
+        saved += stats.llm_calls_saved
+    return summaries, saved
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", nargs="*", help="Markdown files or directories")
+    parser.add_argument("--pages", type=int, default=5, help="Pages with code blocks to use")
+    parser.add_argument("--min-length", type=int, default=300, help="Minimum code block length")
+    parser.add_argument("--concurrency", type=int, default=config.code_summary_concurrency)
+    parser.add_argument("--batch-size", type=int, default=config.code_summary_batch_size)
+    parser.add_argument("--skip-naive", action="store_true", help="Skip one call per block")
+    parser.add_argument("--database", default="code_summary_benchmark")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch database")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("MongoDB RAG - Code Summary Benchmark")
+    print("=" * 80)
+
+    pages = load_pages(args.corpus or [str(project_root)], args.min_length)[: args.pages]
+    blocks = sum(len(page) for page in pages)
+    if not blocks:
+        print("No code blocks found")
+        return
+    print(f"Pages: {len(pages)}, code blocks: {blocks}, model: {config.llm_model}")
+
+    client = AsyncMongoClient(config.mongodb_uri, serverSelectionTimeoutMS=5000)
+    await client.drop_database(args.database)
+    cache = client[args.database]["code_summaries"]
+    in_flight = InFlight()
+
+    def make_summarizer():
+        return CodeSummarizer(
+            cache_collection=cache, concurrency=args.concurrency, batch_size=args.batch_size
+        )
+
+    print()
+    print(f"{'Mode':<10}{'seconds':>10}{'LLM calls':>11}{'saved':>8}{'peak':>7}{'fallback':>10}")
+    try:
+        modes = [] if args.skip_naive else [("naive", lambda: naive(pages))]
+        modes += [
+            ("stage", lambda: staged(pages, make_summarizer)),
+            ("recrawl", lambda: staged(pages, make_summarizer)),
+        ]
+        for name, run in modes:
+            in_flight.reset()
+            start = time.perf_counter()
+            result = await run()
+            seconds = time.perf_counter() - start
+            summaries, saved = result if isinstance(result, tuple) else (result, 0)
+            fallback = sum(summary == FALLBACK_SUMMARY for summary in summaries)
+            print(
+                f"{name:<10}{seconds:>10.2f}{in_flight.calls:>11}{saved:>8}"
+                f"{in_flight.peak:>7}{fallback:>10}"
+            )
+    finally:
+        if not args.keep:
+            await client.drop_database(args.database)
+        await client.close()
+
+    print()
+    print("peak: LLM calls in flight. saved: calls avoided by batching and the summary cache.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
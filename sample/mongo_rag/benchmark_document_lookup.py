@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Document lookup benchmark: $lookup per hit vs. denormalized chunks + header cache.
+
+Seeds a scratch database with a synthetic corpus (documents with large
+``content`` and their chunks), then times the part of a search pipeline that
+follows $vectorSearch/$search, for random sets of hit chunks:
+
+- lookup:       $lookup of each hit's full parent document with the RLS match
+                and $unwind (the previous pipeline)
+- headers-cold: $project of the denormalized title/source, RLS from document
+                headers read with a projection (empty header cache)
+- headers-warm: the same with the process-level header cache populated
+
+Each is run as an admin (no RLS) and as a regular user. The scratch database is
+dropped afterwards unless --keep is given.
+
+Prerequisites:
+- MongoDB running (plain MongoDB is enough; no search indexes are used)
+- MONGODB_URI configured (see 04-lambda settings)
+
+Usage:
+    python sample/mongo_rag/benchmark_document_lookup.py
+    python sample/mongo_rag/benchmark_document_lookup.py --documents 20000 --content-kb 50
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+# Add lambda server to path so we can import from the project
+project_root = Path(__file__).parent.parent.parent
+lambda_path = project_root / "04-lambda"
+sys.path.insert(0, str(lambda_path))
+
+from app.capabilities.retrieval.mongo_rag.config import config  # noqa: E402
+from app.capabilities.retrieval.mongo_rag.document_headers import (  # noqa: E402
+    attach_document_headers,
+    get_document_header_cache,
+)
+from app.capabilities.retrieval.mongo_rag.rls import build_access_filter  # noqa: E402
+from bson import ObjectId  # noqa: E402
+from pymongo import AsyncMongoClient  # noqa: E402
+
+SETTINGS = SimpleNamespace(mongodb_collection_documents="documents")
+
+
+async def seed(db, args) -> list[ObjectId]:
+    """Insert documents and chunks; returns the chunk ids."""
+    rng = random.Random(args.seed)
+    filler = "lorem ipsum dolor sit amet " * (args.content_kb * 1024 // 27)
+    chunk_ids = []
+    for start in range(0, args.documents, 500):
+        documents, chunks = [], []
+        for i in range(start, min(start + 500, args.documents)):
+            document_id = ObjectId()
+            owner = f"user{rng.randrange(args.users)}"
+            documents.append(
+                {
+                    "_id": document_id,
+                    "title": f"Document {i}",
+                    "source": f"docs/{i}.md",
+                    "content": filler,
+                    "user_id": owner,
+                    "user_email": f"{owner}@example.com",
+                    "is_public": rng.random() < 0.2,
+                    "shared_with": [],
+                    "group_ids": [],
+                }
+            )
+            for index in range(args.chunks_per_document):
+                chunk_id = ObjectId()
+                chunk_ids.append(chunk_id)
+                chunks.append(
+                    {
+                        "_id": chunk_id,
+                        "document_id": document_id,
+                        "document_title": f"Document {i}",
+                        "document_source": f"docs/{i}.md",
+                        "content": filler[:2000],
+                        "chunk_index": index,
+                        "metadata": {},
+                    }
+                )
+        await db["documents"].insert_many(documents)
+        await db["chunks"].insert_many(chunks)
+    return chunk_ids
+
+
+def lookup_pipeline(hit_ids, access_filter):
+    return [
+        {"$match": {"_id": {"$in": hit_ids}}},  # stands in for $vectorSearch / $search
+        {
+            "$lookup": {
+                "from": "documents",
+                "localField": "document_id",
+                "foreignField": "_id",
+                "as": "document_info",
+                "pipeline": [{"$match": access_filter} if access_filter else {"$match": {}}],
+            }
+        },
+        {"$unwind": "$document_info"},
+        {"$match": {"document_info": {"$exists": True, "$ne": {}}}},
+        {
+            "$project": {
+                "chunk_id": "$_id",
+                "document_id": 1,
+                "content": 1,
+                "metadata": 1,
+                "document_title": "$document_info.title",
+                "document_source": "$document_info.source",
+            }
+        },
+    ]
+
+
+def projected_pipeline(hit_ids):
+    return [
+        {"$match": {"_id": {"$in": hit_ids}}},
+        {
+            "$project": {
+                "chunk_id": "$_id",
+                "document_id": 1,
+                "content": 1,
+                "metadata": 1,
+                "document_title": 1,
+                "document_source": 1,
+            }
+        },
+    ]
+
+
+async def run(db, mode, hit_sets, access_filter) -> tuple[np.ndarray, float]:
+    latencies, returned = [], 0
+    if mode == "headers-warm":
+        # Populate the cache with every document the hits can touch
+        for hit_ids in hit_sets:
+            results = [
+                doc async for doc in await db["chunks"].aggregate(projected_pipeline(hit_ids))
+            ]
+            await attach_document_headers(db, SETTINGS, results, access_filter)
+    for hit_ids in hit_sets:
+        if mode == "headers-cold":
+            get_document_header_cache().clear()
+        start = time.perf_counter()
+        if mode == "lookup":
+            cursor = await db["chunks"].aggregate(lookup_pipeline(hit_ids, access_filter))
+            results = [doc async for doc in cursor]
+        else:
+            cursor = await db["chunks"].aggregate(projected_pipeline(hit_ids))
+            results = [doc async for doc in cursor]
+            results = await attach_document_headers(db, SETTINGS, results, access_filter)
+        latencies.append(time.perf_counter() - start)
+        returned += len(results)
+    return np.array(latencies) * 1000, returned / len(hit_sets)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=5000)
+    parser.add_argument("--chunks-per-document", type=int, default=8)
+    parser.add_argument("--content-kb", type=int, default=20, help="Document content size")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=20, help="Hits per query")
+    parser.add_argument("--database", default="rag_lookup_benchmark")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch database")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    client = AsyncMongoClient(config.mongodb_uri, serverSelectionTimeoutMS=5000)
+    db = client[args.database]
+    # Large enough to hold every header for the warm runs
+    config.document_header_cache_size = max(config.document_header_cache_size, args.documents)
+    config.document_header_cache_ttl_seconds = 3600
+
+    print("=" * 80)
+    print("MongoDB RAG - Document Lookup Benchmark")
+    print("=" * 80)
+    try:
+        await client.drop_database(args.database)
+        start = time.perf_counter()
+        chunk_ids = await seed(db, args)
+        print(
+            f"Seeded {args.documents} documents ({args.content_kb} KB content) and "
+            f"{len(chunk_ids)} chunks in {time.perf_counter() - start:.1f} s"
+        )
+        rng = random.Random(args.seed + 1)
+        hit_sets = [rng.sample(chunk_ids, args.k) for _ in range(args.queries)]
+        print(f"{args.queries} queries of {args.k} hits")
+        print()
+        print(f"{'User':<8}{'Mode':<15}{'p50 ms':>9}{'p99 ms':>9}{'Results':>9}")
+
+        users = {
+            "admin": build_access_filter("", "", is_admin=True),
+            "user": build_access_filter("user0", "user0@example.com"),
+        }
+        for user, access_filter in users.items():
+            for mode in ("lookup", "headers-cold", "headers-warm"):
+                latencies, returned = await run(db, mode, hit_sets, access_filter)
+                print(
+                    f"{user:<8}{mode:<15}{np.percentile(latencies, 50):>9.2f}"
+                    f"{np.percentile(latencies, 99):>9.2f}{returned:>9.1f}"
+                )
+    finally:
+        if not args.keep:
+            await client.drop_database(args.database)
+        await client.close()
+
+    print()
+    print("Results should match between modes; admins on denormalized chunks read no documents.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
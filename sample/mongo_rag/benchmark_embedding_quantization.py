@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Embedding storage benchmark: recall, latency and storage of quantized embeddings.
+
+Builds a synthetic clustered corpus of embeddings and, for each EMBEDDING_STORAGE
+mode, reports:
+
+- Storage: BSON bytes per chunk for the embedding fields (as written by ingestion)
+- Recall@k: overlap with exact float cosine top-k, using the stored representation
+  for candidate search (a stand-in for the Atlas ANN index) and, for int8/binary,
+  with and without full-precision rescoring of k x rescore-factor candidates
+- Latency: per-query candidate scoring and rescoring time
+
+No MongoDB required; candidate search is brute force with numpy, and rescoring
+uses the same code path as semantic_search.
+
+Usage:
+    python sample/mongo_rag/benchmark_embedding_quantization.py
+    python sample/mongo_rag/benchmark_embedding_quantization.py --corpus 20000 --dims 2560
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import bson
+import numpy as np
+
+# Add lambda server to path so we can import from the project
+project_root = Path(__file__).parent.parent.parent
+lambda_path = project_root / "04-lambda"
+sys.path.insert(0, str(lambda_path))
+
+from app.capabilities.retrieval.mongo_rag.quantization import (  # noqa: E402
+    FULL_PRECISION_FIELD,
+    decode_vector,
+    encode_embedding,
+    encode_vector,
+    rescore,
+)
+
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint16)
+
+
+def synthetic_corpus(size: int, dims: int, clusters: int, seed: int) -> np.ndarray:
+    """Clustered, unit-normalized embeddings (real embeddings are far from uniform)."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dims))
+    assignment = rng.integers(0, clusters, size=size)
+    vectors = centers[assignment] + rng.normal(scale=1.5, size=(size, dims))
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def candidate_scores(storage: str, stored: np.ndarray, query: list[float]) -> np.ndarray:
+    """Score every stored vector against the query in the index's representation."""
+    encoded_query = np.array(decode_vector(encode_vector(query, storage)), dtype=np.float32)
+    if storage == "binary":
+        # Hamming distance on packed bits (Atlas uses euclidean similarity for int1)
+        query_bits = np.packbits(encoded_query > 0)
+        return -_POPCOUNT[np.bitwise_xor(stored, query_bits)].sum(axis=1).astype(np.float32)
+    return stored @ encoded_query / (np.linalg.norm(stored, axis=1) * np.linalg.norm(encoded_query))
+
+
+def store(storage: str, corpus: np.ndarray) -> np.ndarray:
+    """Decode the stored representation of every vector into a scoring matrix."""
+    if storage == "binary":
+        return np.packbits(corpus > 0, axis=1)
+    return np.array(
+        [decode_vector(encode_vector(v.tolist(), storage)) for v in corpus], dtype=np.float32
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=int, default=5000, help="Number of chunks")
+    parser.add_argument("--dims", type=int, default=768, help="Embedding dimensions")
+    parser.add_argument("--clusters", type=int, default=50)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--rescore-factor", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    corpus = synthetic_corpus(args.corpus, args.dims, args.clusters, args.seed)
+    rng = np.random.default_rng(args.seed + 1)
+    query_ids = rng.choice(args.corpus, size=args.queries, replace=False)
+    queries = corpus[query_ids] + rng.normal(scale=0.02, size=(args.queries, args.dims))
+    exact = [set(np.argsort(-(corpus @ q))[: args.k]) for q in queries]
+
+    print("=" * 80)
+    print("MongoDB RAG - Embedding Storage Benchmark")
+    print("=" * 80)
+    print(
+        f"Corpus: {args.corpus} x {args.dims} dims, {args.queries} queries, "
+        f"recall@{args.k}, rescore factor {args.rescore_factor}"
+    )
+    print()
+    print(f"{'Storage':<22}{'Bytes/chunk':>12}{'Recall':>10}{'Search ms':>11}{'Rescore ms':>12}")
+
+    sample = corpus[0].tolist()
+    for storage in ("float", "float32", "int8", "binary"):
+        stored = store(storage, corpus)
+        variants = [(storage, False)]
+        if storage in ("int8", "binary"):
+            variants = [(storage, False), (f"{storage} + rescore", True)]
+
+        for label, rescoring in variants:
+            fields = encode_embedding(sample, storage, keep_full_precision=rescoring)
+            size = len(bson.encode(fields))
+            fetch = args.k * args.rescore_factor if rescoring else args.k
+
+            hits = 0
+            search_seconds = rescore_seconds = 0.0
+            for query, truth in zip(queries, exact, strict=True):
+                query_list = query.tolist()
+                start = time.perf_counter()
+                top = np.argsort(-candidate_scores(storage, stored, query_list))[:fetch]
+                search_seconds += time.perf_counter() - start
+
+                if rescoring:
+                    docs = [
+                        {
+                            "id": int(i),
+                            "similarity": 0.0,
+                            FULL_PRECISION_FIELD: encode_vector(corpus[i].tolist(), "float32"),
+                        }
+                        for i in top
+                    ]
+                    start = time.perf_counter()
+                    top = [doc["id"] for doc in rescore(query_list, docs)[: args.k]]
+                    rescore_seconds += time.perf_counter() - start
+
+                hits += len(truth & {int(i) for i in top[: args.k]})
+
+            recall = hits / (args.k * args.queries)
+            search_ms = search_seconds * 1000 / args.queries
+            rescore_ms = rescore_seconds * 1000 / args.queries
+            print(f"{label:<22}{size:>12}{recall:>10.3f}{search_ms:>11.2f}{rescore_ms:>12.2f}")
+
+    print()
+    print(f"Bytes/chunk includes the {FULL_PRECISION_FIELD} float32 copy when rescoring.")
+    print("Search ms is brute force here; with Atlas it is the $vectorSearch stage.")
+
+
+if __name__ == "__main__":
+    main()
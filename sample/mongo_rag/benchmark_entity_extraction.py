@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Entity extraction benchmark: batched, windowed NER vs. one text at a time.
+
+Runs the NER extractor over a corpus of documents twice, once calling
+extract() per document (one small pipeline call per document, as ingestion did)
+and once with extract_many() (windows of all documents batched through the
+pipeline), and reports per mode:
+
+- Throughput in documents per second and characters per second
+- Entities found (both modes window long texts, so counts should match)
+
+With --hybrid, HybridExtractor.extract_many() is timed too, including the
+concurrent LLM escalation of texts with complex context.
+
+Corpus (one of):
+- --corpus: markdown/text files or directories (*.md and *.txt, recursively);
+  defaults to the repository's own markdown docs
+- --from-mongo N: the N most recent documents in the documents collection
+
+Prerequisites:
+- transformers installed (the NER model, NER_MODEL, is downloaded on first use)
+- For --hybrid: an LLM endpoint configured (LLM_BASE_URL, LLM_MODEL)
+- For --from-mongo: MongoDB with ingested documents
+
+Usage:
+    python sample/mongo_rag/benchmark_entity_extraction.py
+    python sample/mongo_rag/benchmark_entity_extraction.py --limit 100 --batch-size 32
+    python sample/mongo_rag/benchmark_entity_extraction.py --from-mongo 200 --hybrid
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add lambda server to path so we can import from the project
+project_root = Path(__file__).parent.parent.parent
+lambda_path = project_root / "04-lambda"
+sys.path.insert(0, str(lambda_path))
+
+from app.capabilities.extraction.entity_extraction import (  # noqa: E402
+    HybridExtractor,
+    NERExtractor,
+)
+from app.capabilities.retrieval.mongo_rag.config import config  # noqa: E402
+from app.core.model_registry import get_model_registry, model_key  # noqa: E402
+
+
+def load_files(paths: list[str]) -> list[str]:
+    files: list[Path] = []
+    for raw in paths:
+        path = Path(raw).expanduser()
+        if path.is_dir():
+            files.extend(sorted([*path.rglob("*.md"), *path.rglob("*.txt")]))
+        else:
+            files.append(path)
+    return [
+        f.read_text(encoding="utf-8", errors="replace")
+        for f in files
+        if "node_modules" not in f.parts
+    ]
+
+
+async def load_mongo(limit: int) -> list[str]:
+    from pymongo import AsyncMongoClient
+
+    client = AsyncMongoClient(config.mongodb_uri)
+    try:
+        documents = client[config.mongodb_database][config.mongodb_collection_documents]
+        cursor = documents.find({}, {"content": 1}).sort("_id", -1).limit(limit)
+        return [doc["content"] async for doc in cursor if doc.get("content")]
+    finally:
+        await client.close()
+
+
+async def timed(label: str, corpus: list[str], run) -> None:
+    start = time.perf_counter()
+    results = await run()
+    seconds = time.perf_counter() - start
+    chars = sum(len(text) for text in corpus)
+    entities = sum(len(result.entities) for result in results)
+    print(
+        f"{label:<22}{len(corpus) / seconds:>10.2f}{chars / seconds:>14,.0f}"
+        f"{seconds:>10.2f}{entities:>10}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", nargs="*", help="Text/markdown files or directories")
+    parser.add_argument("--from-mongo", type=int, default=0, help="Use N MongoDB documents")
+    parser.add_argument("--limit", type=int, default=50, help="Documents from --corpus")
+    parser.add_argument("--batch-size", type=int, default=16, help="Windows per forward pass")
+    parser.add_argument("--hybrid", action="store_true", help="Also time HybridExtractor")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("Entity Extraction - Batched NER Benchmark")
+    print("=" * 80)
+
+    if args.from_mongo:
+        corpus = await load_mongo(args.from_mongo)
+    else:
+        corpus = load_files(args.corpus or [str(project_root)])[: args.limit]
+    corpus = [text for text in corpus if text.strip()]
+    if not corpus:
+        print("No documents found")
+        return
+    print(f"Documents: {len(corpus)}, characters: {sum(map(len, corpus)):,}")
+
+    extractor = NERExtractor(batch_size=args.batch_size)
+    # Load the model outside the timings
+    registry = get_model_registry()
+    await registry.aget(model_key("ner"))
+    await extractor.extract("Warm up with Ada Lovelace in London.")
+
+    async def one_by_one():
+        return [await extractor.extract(text) for text in corpus]
+
+    print()
+    print(f"{'Mode':<22}{'docs/s':>10}{'chars/s':>14}{'seconds':>10}{'entities':>10}")
+    await timed("ner extract()", corpus, one_by_one)
+    await timed("ner extract_many()", corpus, lambda: extractor.extract_many(corpus))
+    if args.hybrid:
+        hybrid = HybridExtractor(ner_model=model_key("ner").split(":", 1)[1])
+        await timed("hybrid extract_many()", corpus, lambda: hybrid.extract_many(corpus))
+
+    await registry.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
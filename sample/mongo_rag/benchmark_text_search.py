@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Text search benchmark: query planner vs. fuzzy-on-everything.
+
+Runs sets of phrase, identifier, short keyword, long keyword and misspelled
+queries through text_search twice, once with the query planner
+(TEXT_SEARCH_PLANNER=true) and once with the legacy single fuzzy query
+(maxEdits=2 on every term), and reports per query class:
+
+- Latency (p50/p99) over --repeat runs of each query
+- Average number of hits
+- How often the planner fell back to fuzzy matching
+
+Prerequisites:
+- MongoDB Atlas (or Atlas Local) with the text_index from
+  01-data/mongodb/scripts/setup_search_indexes.py (re-run it with
+  --update-existing after upgrading so the code and title fields exist)
+- Documents ingested into MongoDB (use document_ingestion_example.py)
+- Environment variables configured (MONGODB_URI, etc.)
+
+Use --plan-only to print the operators chosen for each query without MongoDB.
+
+Usage:
+    python sample/mongo_rag/benchmark_text_search.py
+    python sample/mongo_rag/benchmark_text_search.py --repeat 20 --match-count 10
+    python sample/mongo_rag/benchmark_text_search.py --plan-only
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+# Add lambda server to path so we can import from the project
+project_root = Path(__file__).parent.parent.parent
+lambda_path = project_root / "04-lambda"
+sys.path.insert(0, str(lambda_path))
+
+from app.capabilities.retrieval.mongo_rag.config import config  # noqa: E402
+from app.capabilities.retrieval.mongo_rag.dependencies import AgentDependencies  # noqa: E402
+from app.capabilities.retrieval.mongo_rag.text_query import plan_text_query  # noqa: E402
+from app.capabilities.retrieval.mongo_rag.tools import text_search  # noqa: E402
+
+QUERY_SETS = {
+    "phrase": [
+        '"vector search index"',
+        '"row level security" documents',
+        '"reciprocal rank fusion"',
+        '"knowledge graph" facts',
+    ],
+    "identifier": [
+        "build_access_filter",
+        "semantic_search filter_dict",
+        "$vectorSearch numCandidates",
+        "config.use_reranking",
+    ],
+    "short": ["authentication", "hybrid search", "ingestion pipeline", "rerank"],
+    "keywords": [
+        "how do I configure authentication for the API",
+        "what happens when a document is shared with a group",
+        "how are markdown documents split into chunks",
+        "which embedding model dimensions are supported",
+    ],
+    "typo": ["authentcation", "hybird search", "ingestoin pipeline", "embeding dimensions"],
+}
+
+
+class CountingChunks:
+    """Chunk collection wrapper counting aggregations (2 per query = fuzzy fallback ran)."""
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.calls = 0
+
+    async def aggregate(self, pipeline):
+        self.calls += 1
+        return await self.collection.aggregate(pipeline)
+
+
+class CountingDb:
+    def __init__(self, db, chunks_name: str):
+        self.db = db
+        self.chunks = CountingChunks(db[chunks_name])
+        self.chunks_name = chunks_name
+
+    def __getitem__(self, name):
+        return self.chunks if name == self.chunks_name else self.db[name]
+
+
+def print_plans():
+    for query_class, queries in QUERY_SETS.items():
+        print(f"[{query_class}]")
+        for query in queries:
+            plan = plan_text_query(
+                query, config.text_search_fuzzy_fallback, config.text_search_fuzzy_max_edits
+            )
+            print(f"  {query!r} -> {plan.query_class}")
+            print(f"    {json.dumps(plan.operator)}")
+        print()
+
+
+async def run_class(ctx, db, queries, args) -> tuple[np.ndarray, float, int]:
+    latencies, hits, fallbacks = [], 0, 0
+    for query in queries:
+        for _ in range(args.repeat):
+            db.chunks.calls = 0
+            start = time.perf_counter()
+            results = await text_search(ctx, query, args.match_count)
+            latencies.append(time.perf_counter() - start)
+            hits += len(results)
+            fallbacks += db.chunks.calls > 1
+    runs = len(queries) * args.repeat
+    return np.array(latencies) * 1000, hits / runs, fallbacks
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="Runs of each query")
+    parser.add_argument("--match-count", type=int, default=5)
+    parser.add_argument("--plan-only", action="store_true", help="Print query plans and exit")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("MongoDB RAG - Text Search Benchmark")
+    print("=" * 80)
+    if args.plan_only:
+        print_plans()
+        return
+
+    deps = AgentDependencies.from_settings(is_admin=True)
+    await deps.initialize()
+    try:
+        db = CountingDb(deps.db, deps.settings.mongodb_collection_chunks)
+        deps.db = db
+        ctx = SimpleNamespace(deps=deps)
+
+        # Warm up the search index and connection pool
+        for queries in QUERY_SETS.values():
+            await text_search(ctx, queries[0], args.match_count)
+
+        print(f"Repeat: {args.repeat}, match_count: {args.match_count}")
+        print()
+        print(f"{'Class':<12}{'Mode':<10}{'p50 ms':>9}{'p99 ms':>9}{'Hits':>7}{'Fuzzy':>8}")
+        for query_class, queries in QUERY_SETS.items():
+            for mode, planner in (("planner", True), ("fuzzy", False)):
+                config.text_search_planner = planner
+                latencies, hits, fallbacks = await run_class(ctx, db, queries, args)
+                fuzzy = f"{fallbacks}/{len(latencies)}" if planner else "all"
+                print(
+                    f"{query_class:<12}{mode:<10}{np.percentile(latencies, 50):>9.1f}"
+                    f"{np.percentile(latencies, 99):>9.1f}{hits:>7.1f}{fuzzy:>8}"
+                )
+    finally:
+        await deps.cleanup()
+
+    print()
+    print("Fuzzy: runs where the planner fell back to a fuzzy query (too few strict hits).")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Preferences benchmark: get_all latency per resolution strategy.
+
+Resolves every user-configurable preference of one user, --iterations times per mode:
+
+- per-key:  one definitions query, then up to three queries (user, organization,
+            system) per preference (the previous behaviour)
+- one-query: PreferencesService with the cache disabled (one COALESCE join)
+- cached:   PreferencesService with the per-user cache (warmed by the first call)
+
+and reports the mean and p95 latency per get_all() call and the number of
+preferences resolved.
+
+Prerequisites:
+- Supabase Postgres running with migration 007_user_preferences applied
+  (SUPABASE_DB_URL or POSTGRES_PASSWORD)
+
+Usage:
+    python sample/preferences/benchmark_preferences.py
+    python sample/preferences/benchmark_preferences.py --user-id <uuid> --iterations 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from uuid import UUID
+
+# Add lambda server to path so we can import from the project
+project_root = Path(__file__).parent.parent.parent
+lambda_path = project_root / "04-lambda"
+sys.path.insert(0, str(lambda_path))
+
+from app.core.config import settings  # noqa: E402
+from app.services.database.supabase.config import SupabaseConfig  # noqa: E402
+from app.services.preferences import PreferenceCache, PreferencesService  # noqa: E402
+
+
+async def per_key_get_all(service: PreferencesService, user_id: UUID) -> dict:
+    """The former resolution: one query per level per preference."""
+    pool = await service.supabase._get_pool()
+    result = {}
+    async with pool.acquire() as conn:
+        definitions = await conn.fetch(
+            "SELECT * FROM preference_definitions WHERE is_user_configurable = true"
+        )
+        for defn in definitions:
+            key = defn["key"]
+            row = await conn.fetchrow(
+                "SELECT value FROM user_preferences WHERE user_id = $1 AND preference_key = $2",
+                user_id,
+                key,
+            )
+            if row is None:
+                row = await conn.fetchrow(
+                    "SELECT default_value AS value FROM preference_definitions WHERE key = $1",
+                    key,
+                )
+            result[key] = row["value"] if row else None
+    return result
+
+
+async def measure(run, iterations: int) -> tuple[float, float, int]:
+    timings = []
+    resolved = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        resolved = len(await run())
+        timings.append((time.perf_counter() - start) * 1000)
+    p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+    return statistics.mean(timings), p95, resolved
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--user-id", help="User UUID (default: first profile)")
+    parser.add_argument("--iterations", type=int, default=100, help="get_all() calls per mode")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("Preferences - get_all Benchmark")
+    print("=" * 80)
+
+    config = SupabaseConfig(SUPABASE_DB_URL=settings.effective_supabase_db_url)
+    uncached = PreferencesService(config, cache=PreferenceCache(max_size=0, ttl_seconds=0))
+    cached = PreferencesService(config, cache=PreferenceCache(max_size=10, ttl_seconds=3600))
+
+    pool = await uncached.supabase._get_pool()
+    if args.user_id:
+        user_id = UUID(args.user_id)
+    else:
+        async with pool.acquire() as conn:
+            user_id = await conn.fetchval("SELECT id FROM profiles ORDER BY created_at LIMIT 1")
+        if user_id is None:
+            print("No profiles found; pass --user-id")
+            return
+    print(f"User: {user_id}, iterations: {args.iterations}")
+
+    await cached.get_all(user_id)  # warm the cache
+
+    modes = [
+        ("per-key", lambda: per_key_get_all(uncached, user_id)),
+        ("one-query", lambda: uncached.get_all(user_id)),
+        ("cached", lambda: cached.get_all(user_id)),
+    ]
+    print()
+    print(f"{'Mode':<12}{'mean ms':>10}{'p95 ms':>10}{'preferences':>13}")
+    try:
+        for name, run in modes:
+            mean, p95, resolved = await measure(run, args.iterations)
+            print(f"{name:<12}{mean:>10.2f}{p95:>10.2f}{resolved:>13}")
+    finally:
+        await pool.close()
+        await (await cached.supabase._get_pool()).close()
+
+    print()
+    print(f"cached: {cached.cache.hits} hits, {cached.cache.misses} misses")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())